@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+"""
+Measure the overhead of calling ClientMeta methods, without any I/O.
+
+``_request`` is replaced by a function returning its parameters, so that only
+the binding and marshalling of the parameters is measured. Each call is timed
+with three marshallings of the same signature:
+
+* ``before``: the per-option statements generated before the marshalling was
+  reworked (``_args.append``, ``_params[...] =`` and ``if o_x is not None``
+  for every option, unconditional ``_params.update(kwargs)``),
+* ``after``: the generated ``ClientMeta`` method, with list and dict literals
+  for the arguments and the options always sent,
+* ``table``: the method passing a tuple of its option values to one shared
+  marshaller with a per-command table of option names.
+
+    python benchmarks/call_overhead.py --number 100000
+"""
+
+import argparse
+import inspect
+import itertools
+import operator
+import os
+import sys
+import timeit
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+)
+
+from python_freeipa import ClientMeta  # noqa: E402
+
+CALLS = [
+    ('ping', (), {}),
+    ('user_show', ('alice',), {}),
+    ('user_mod', ('alice',), {'o_title': 'Engineer'}),
+    ('user_find', (), {'o_uid': 'alice'}),
+    (
+        'user_find',
+        ('a',),
+        {
+            'o_uid': 'alice',
+            'o_mail': 'a@example.org',
+            'o_in_group': 'admins',
+            'o_nsaccountlock': False,
+            'o_sizelimit': 10,
+        },
+    ),
+]
+
+
+class Client(ClientMeta):
+    def _request(self, method, args=None, params=None):
+        return args, params
+
+
+def marshal(names, values, kwargs):
+    """
+    Shared marshaller of the ``table`` variant: the options that are not None.
+    """
+    params = dict(
+        itertools.compress(
+            zip(names, values),
+            map(operator.is_not, values, itertools.repeat(None)),
+        )
+    )
+    if kwargs:
+        params.update(kwargs)
+    return params
+
+
+def _signature(command):
+    parameters = inspect.signature(getattr(ClientMeta, command)).parameters
+    args = [parameter for name, parameter in parameters.items() if name[:2] == 'a_']
+    options = [parameter for name, parameter in parameters.items() if name[:2] == 'o_']
+    head = ', '.join(
+        ['self']
+        + [
+            parameter.name
+            if parameter.default is inspect.Parameter.empty
+            else '{0}={1!r}'.format(parameter.name, parameter.default)
+            for parameter in args + options
+        ]
+        + ['**kwargs']
+    )
+    return args, options, head
+
+
+def variants(command):
+    """
+    Returns the ``before`` and ``table`` variants of the method of a command,
+    compiled from its signature.
+    """
+    args, options, head = _signature(command)
+    before = [
+        'def {0}({1}):'.format(command, head),
+        "    method = '{0}'".format(command),
+        '    _args = list()',
+    ]
+    before.extend('    _args.append({0})'.format(arg.name) for arg in args)
+    before.append('    _params = dict()')
+    for option in options:
+        # Options without default or with a non-None one were always sent.
+        if option.default is None:
+            before.append('    if {0} is not None:'.format(option.name))
+            before.append(
+                "        _params['{0}'] = {1}".format(option.name[2:], option.name)
+            )
+        else:
+            before.append(
+                "    _params['{0}'] = {1}".format(option.name[2:], option.name)
+            )
+    before.append('    _params.update(kwargs)')
+    before.append('    return self._request(method, _args, _params)')
+
+    table = [
+        'def {0}({1}):'.format(command, head),
+        '    return self._request(',
+        "        '{0}',".format(command),
+        '        [{0}],'.format(', '.join(arg.name for arg in args)),
+        '        marshal(_NAMES, ({0}), kwargs),'.format(
+            ''.join(option.name + ', ' for option in options)
+        ),
+        '    )',
+    ]
+    namespace = {
+        'marshal': marshal,
+        '_NAMES': tuple(option.name[2:] for option in options),
+    }
+    exec('\n'.join(before), namespace)
+    before_method = namespace.pop(command)
+    exec('\n'.join(table), namespace)
+    return before_method, namespace.pop(command)
+
+
+def best(function, number, repeat):
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', type=int, default=100000, help='calls per run')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per call')
+    args = parser.parse_args()
+    client = Client('ipa.demo1.freeipa.org')
+    print('{0:<28} {1:>10} {2:>10} {3:>10}'.format('call', 'before', 'after', 'table'))
+    for command, call_args, call_kwargs in CALLS:
+        before, table = variants(command)
+        # Bound methods of clients of each variant, called the same way.
+        methods = [
+            getattr(
+                type('Before', (Client,), {command: before})(client._host), command
+            ),
+            getattr(client, command),
+            getattr(type('Table', (Client,), {command: table})(client._host), command),
+        ]
+        results = [method(*call_args, **call_kwargs) for method in methods]
+        if results[0] != results[1] or results[2] != results[1]:
+            raise AssertionError('{0} is marshalled differently'.format(command))
+        timings = [
+            best(lambda: method(*call_args, **call_kwargs), args.number, args.repeat)
+            for method in methods
+        ]
+        print(
+            '{0:<28} {1:7.3f} us {2:7.3f} us {3:7.3f} us'.format(
+                '{0} ({1} options)'.format(command, len(call_kwargs)), *timings
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,450 @@
+#!/usr/bin/env python
+"""
+Benchmark the hot paths of the client against the in-memory FakeIPA server.
+
+Results are written as JSON, one record per metric, so that runs of different
+releases can be compared. With ``--compare``, the change of each metric from
+an earlier run is printed, and the exit status is 1 if any got worse by more
+than ``--threshold`` percent.
+
+    python benchmarks/hot_paths.py --output before.json
+    python benchmarks/hot_paths.py --compare before.json
+
+Each benchmark can be run alone with ``--only``, e.g. ``--only throughput``.
+"""
+
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import timeit
+import tracemalloc
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARKS_DIR, '..', 'src'))
+sys.path.insert(0, BENCHMARKS_DIR)
+
+import import_time  # noqa: E402
+
+from python_freeipa import ClientMeta  # noqa: E402
+from python_freeipa.codec import get_codec  # noqa: E402
+from python_freeipa.records import to_records  # noqa: E402
+from python_freeipa.testing import FakeIPA  # noqa: E402
+
+HOST = 'ipa.example.test'
+CODECS = ('json', 'orjson', 'ujson')
+
+
+def fake_client(server, **kwargs):
+    client = ClientMeta(HOST, **kwargs)
+    server.install(client)
+    client.login('admin', 'Secret123')
+    return client
+
+
+def best(function, number, repeat):
+    """
+    Returns the best time of a call over repeat runs of number calls, in seconds.
+    """
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+def metric(name, value, unit, better='lower', **params):
+    return {
+        'name': name,
+        'params': params,
+        'value': value,
+        'unit': unit,
+        'better': better,
+    }
+
+
+def bench_request_build(options):
+    """Cost of building and encoding a JSON RPC request, as done by _request."""
+    client = ClientMeta(HOST)
+    client._current_host = HOST
+    params = {'all': True, 'raw': False, 'no_members': False}
+    number = options.number
+    return [
+        metric(
+            'request_build',
+            best(
+                lambda: client._build_call('user_show', ['alice'], dict(params)),
+                number,
+                options.repeat,
+            )
+            * 1e6,
+            'us',
+            step='build',
+        ),
+        metric(
+            'request_build',
+            best(
+                lambda: client._json_request('user_show', ['alice'], dict(params)),
+                number,
+                options.repeat,
+            )
+            * 1e6,
+            'us',
+            step='build+encode',
+        ),
+    ]
+
+
+def bench_codec(options):
+    """Cost of encoding a request and decoding a response of 100 users."""
+    server = FakeIPA(require_login=False)
+    server.add_users(100)
+    request = {
+        'method': 'user_find',
+        'params': [[], {'all': True, 'sizelimit': 0, 'version': '2.235'}],
+    }
+    _, _, response = server.handle(
+        HOST, '/ipa/session/json', {}, json.dumps(request).encode()
+    )
+    results = []
+    for name in CODECS:
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            continue
+        number = max(options.number // 100, 10)
+        results.append(
+            metric(
+                'codec_encode',
+                best(lambda: codec.dumps(request), options.number, options.repeat)
+                * 1e6,
+                'us',
+                codec=name,
+            )
+        )
+        results.append(
+            metric(
+                'codec_decode',
+                best(lambda: codec.loads(response), number, options.repeat) * 1e6,
+                'us',
+                codec=name,
+                size=len(response),
+            )
+        )
+    return results
+
+
+def bench_call_overhead(options):
+    """Time of a call spent in the client, rather than in the server."""
+    server = FakeIPA(require_login=False)
+    client = fake_client(server)
+    body = client._json_request('user_show', ['admin'], {'all': True})[2]
+    number = max(options.number // 10, 100)
+    call = best(lambda: client.user_show('admin'), number, options.repeat)
+    serve = best(
+        lambda: server.handle(HOST, '/ipa/session/json', {}, body),
+        number,
+        options.repeat,
+    )
+    return [
+        metric('call_latency', call * 1e6, 'us', command='user_show'),
+        metric('call_overhead', (call - serve) * 1e6, 'us', command='user_show'),
+    ]
+
+
+def run_threads(concurrency, calls, function):
+    """
+    Runs calls calls of function on concurrency threads, returns the calls per
+    second.
+    """
+    barrier = threading.Barrier(concurrency + 1)
+
+    def worker():
+        barrier.wait()
+        for _ in range(calls // concurrency):
+            function()
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return calls // concurrency * concurrency / (time.perf_counter() - start)
+
+
+def bench_throughput(options):
+    """Calls per second of a shared client, by number of threads."""
+    server = FakeIPA(latency=options.latency)
+    client = fake_client(server, pool_maxsize=max(options.concurrency))
+    results = []
+    for concurrency in options.concurrency:
+        rates = [
+            run_threads(concurrency, options.calls, lambda: client.user_show('admin'))
+            for _ in range(options.repeat)
+        ]
+        results.append(
+            metric(
+                'throughput',
+                statistics.median(rates),
+                'calls/s',
+                better='higher',
+                concurrency=concurrency,
+                latency=options.latency,
+            )
+        )
+    return results
+
+
+def bench_batch(options):
+    """Calls per second of single calls and of the same calls in batches."""
+    server = FakeIPA(latency=options.latency)
+    client = fake_client(server)
+
+    def single():
+        for _ in range(options.calls):
+            client.user_show('admin')
+
+    def batched():
+        with client.batched(max_size=options.batch_size) as batch:
+            for _ in range(options.calls):
+                batch.user_show('admin')
+
+    results = []
+    for mode, function in (('single', single), ('batch', batched)):
+        elapsed = best(function, 1, options.repeat)
+        results.append(
+            metric(
+                'batch_throughput',
+                options.calls / elapsed,
+                'calls/s',
+                better='higher',
+                mode=mode,
+                batch_size=options.batch_size,
+                latency=options.latency,
+            )
+        )
+    return results
+
+
+def peak_memory(function):
+    """
+    Returns the peak memory allocated while function runs, in bytes.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = function()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
+
+
+def retained_memory(function):
+    """
+    Returns the memory held by the result of function, in bytes.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = function()
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return retained
+
+
+def bench_find_memory(options):
+    """Memory of a large user_find, of iterating over it and of its records."""
+    server = FakeIPA(require_login=False)
+    server.add_users(options.entries)
+    client = fake_client(server)
+    body = client._json_request('user_find', [], {'all': True, 'sizelimit': 0})[2]
+    return [
+        metric(
+            'find_peak_memory',
+            peak_memory(lambda: server.handle(HOST, '/ipa/session/json', {}, body)),
+            'bytes',
+            mode='server only',
+            entries=options.entries,
+        ),
+        metric(
+            'find_peak_memory',
+            peak_memory(lambda: client.user_find(o_sizelimit=0)),
+            'bytes',
+            mode='user_find',
+            entries=options.entries,
+        ),
+        metric(
+            'find_peak_memory',
+            peak_memory(lambda: sum(1 for _ in client.iter_find('user'))),
+            'bytes',
+            mode='iter_find',
+            entries=options.entries,
+        ),
+        metric(
+            'find_retained_memory',
+            retained_memory(lambda: client.user_find(o_sizelimit=0)['result']),
+            'bytes',
+            mode='dicts',
+            entries=options.entries,
+        ),
+        metric(
+            'find_retained_memory',
+            retained_memory(
+                lambda: to_records(client.user_find(o_sizelimit=0), 'user')
+            ),
+            'bytes',
+            mode='records',
+            entries=options.entries,
+        ),
+    ]
+
+
+def bench_import(options):
+    """Time to import python_freeipa in a fresh interpreter."""
+    return [
+        metric(
+            'import_time',
+            import_time.measure(statement, options.runs) * 1000,
+            'ms',
+            scenario=name,
+        )
+        for name, statement in import_time.SCENARIOS[:3]
+    ]
+
+
+BENCHMARKS = [
+    ('request_build', bench_request_build),
+    ('codec', bench_codec),
+    ('call_overhead', bench_call_overhead),
+    ('throughput', bench_throughput),
+    ('batch', bench_batch),
+    ('find_memory', bench_find_memory),
+    ('import', bench_import),
+]
+
+
+def revision():
+    try:
+        return (
+            subprocess.check_output(
+                ['git', 'rev-parse', 'HEAD'],
+                cwd=BENCHMARKS_DIR,
+                stderr=subprocess.DEVNULL,
+            )
+            .decode()
+            .strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def key(result):
+    return result['name'], json.dumps(result['params'], sort_keys=True)
+
+
+def compare(results, baseline, threshold):
+    """
+    Prints the change of each metric from baseline, returns the number of
+    metrics that got worse by more than threshold percent.
+    """
+    previous = {key(result): result for result in baseline['results']}
+    regressions = 0
+    for result in results:
+        before = previous.get(key(result))
+        if before is None or not before['value']:
+            continue
+        change = (result['value'] - before['value']) / before['value'] * 100
+        worse = -change if result['better'] == 'higher' else change
+        flag = ''
+        if worse > threshold:
+            regressions += 1
+            flag = '  REGRESSION'
+        print(
+            '{0:<18} {1:<45} {2:+7.1f}%{3}'.format(
+                result['name'],
+                json.dumps(result['params'], sort_keys=True),
+                change,
+                flag,
+            )
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output', help='file to write the results to')
+    parser.add_argument('--compare', help='results of an earlier run to compare to')
+    parser.add_argument(
+        '--threshold', type=float, default=10.0, help='regression threshold in %%'
+    )
+    parser.add_argument(
+        '--only',
+        action='append',
+        choices=[name for name, _ in BENCHMARKS],
+        help='benchmark to run, all by default',
+    )
+    parser.add_argument('--number', type=int, default=10000, help='calls per timing')
+    parser.add_argument('--repeat', type=int, default=5, help='timings per metric')
+    parser.add_argument(
+        '--calls', type=int, default=400, help='calls per throughput run'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        nargs='+',
+        default=[1, 2, 4, 8, 16, 32],
+        help='thread counts of the throughput benchmark',
+    )
+    parser.add_argument(
+        '--latency', type=float, default=0.002, help='server latency in seconds'
+    )
+    parser.add_argument('--batch-size', type=int, default=100)
+    parser.add_argument(
+        '--entries', type=int, default=5000, help='users of the memory benchmark'
+    )
+    parser.add_argument('--runs', type=int, default=10, help='import time runs')
+    options = parser.parse_args()
+
+    results = []
+    for name, benchmark in BENCHMARKS:
+        if options.only and name not in options.only:
+            continue
+        print('Running {0}...'.format(name), file=sys.stderr)
+        results.extend(benchmark(options))
+
+    report = {
+        'version': 1,
+        'date': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'revision': revision(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'codec': get_codec().name,
+        'results': results,
+    }
+    output = json.dumps(report, indent=2)
+    if options.output:
+        with open(options.output, 'w') as output_file:
+            output_file.write(output + '\n')
+    elif not options.compare:
+        print(output)
+
+    if options.compare:
+        with open(options.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+        if compare(results, baseline, options.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
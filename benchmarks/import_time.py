@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+"""
+Measure the time to import python_freeipa and to get a ClientMeta ready to use.
+
+Each scenario runs in a fresh interpreter, and the median of the runs is reported.
+Importing ``requests``, which python_freeipa always needs, is the baseline.
+The ``eager`` scenario loads all the command methods, as importing the single
+generated module did before they were split by object family.
+
+    python benchmarks/import_time.py --runs 20
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+SCENARIOS = [
+    ('requests', 'import requests'),
+    ('import', 'import python_freeipa'),
+    (
+        'first command',
+        'import python_freeipa; python_freeipa.ClientMeta.user_show',
+    ),
+    (
+        'eager',
+        'import python_freeipa; ClientMeta = python_freeipa.ClientMeta\n'
+        'for name in dir(ClientMeta): getattr(ClientMeta, name)',
+    ),
+]
+
+TIMER = '''
+import time
+start = time.perf_counter()
+{0}
+print(time.perf_counter() - start)
+'''
+
+
+def measure(statement, runs):
+    env = dict(os.environ, PYTHONPATH=SRC, PYTHONDONTWRITEBYTECODE='')
+    timings = []
+    for _ in range(runs):
+        output = subprocess.check_output(
+            [sys.executable, '-c', TIMER.format(statement)], env=env
+        )
+        timings.append(float(output))
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10, help='runs per scenario')
+    args = parser.parse_args()
+    for name, statement in SCENARIOS:
+        print('{0:<15} {1:8.1f} ms'.format(name, measure(statement, args.runs) * 1000))
+
+
+if __name__ == '__main__':
+    main()
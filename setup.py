@@ -9,6 +9,7 @@ install_requires = [
 
 
 tests_requires = [
+    'orjson',
     'responses',
 ]
 
@@ -24,6 +25,11 @@ setup(
     install_requires=install_requires,
     extras_require={
         'tests': tests_requires,
+        'async': ['aiohttp'],
+        'fast': ['orjson'],
+        'opentelemetry': ['opentelemetry-api'],
+        'pandas': ['pandas'],
+        'arrow': ['pyarrow'],
     },
     package_dir={'': 'src'},
     packages=find_packages('src', exclude=['*.tests', '*.tests.*', 'tests.*', 'tests']),
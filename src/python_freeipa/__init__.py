@@ -1,5 +1,15 @@
 from python_freeipa.client import AuthenticatedSession, Client
+from python_freeipa.client_async import AsyncClient, AsyncClientMeta
+from python_freeipa.client_dynamic import ClientDynamic
 from python_freeipa.client_legacy import ClientLegacy
 from python_freeipa.client_meta import ClientMeta
 
-__all__ = ['AuthenticatedSession', 'Client', 'ClientLegacy', 'ClientMeta']
+__all__ = [
+    'AsyncClient',
+    'AsyncClientMeta',
+    'AuthenticatedSession',
+    'Client',
+    'ClientDynamic',
+    'ClientLegacy',
+    'ClientMeta',
+]
@@ -0,0 +1,247 @@
+"""Coalescing of JSON RPC calls into FreeIPA ``batch`` requests."""
+
+import functools
+
+from python_freeipa import projection
+from python_freeipa.exceptions import FreeIPAError, parse_error
+
+
+class BatchResult(object):
+    """
+    Future-like placeholder for the result of a call queued in a ``Batch``.
+    """
+
+    def __init__(self, batch, method, fields=None):
+        self._batch = batch
+        self._method = method
+        self._fields = fields
+        self._done = False
+        self._result = None
+        self._exception = None
+
+    def __repr__(self):
+        if not self._done:
+            state = 'pending'
+        elif self._exception is not None:
+            state = 'failed'
+        else:
+            state = 'done'
+        return '<BatchResult {0} {1}>'.format(self._method, state)
+
+    @property
+    def method(self):
+        return self._method
+
+    def done(self):
+        """
+        Returns True if and only if the call has been sent and its outcome is known.
+        """
+        return self._done
+
+    def result(self):
+        """
+        Returns the result of the call, sending the pending batch if necessary.
+
+        :raises FreeIPAError: the error returned by the server for this call.
+        """
+        if not self._done:
+            self._batch._resolve()
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def exception(self):
+        """
+        Returns the error of the call, if any, sending the pending batch if necessary.
+        """
+        if not self._done:
+            self._batch._resolve()
+        return self._exception
+
+    def _set_result(self, result):
+        if self._fields is not None:
+            result = projection.trim(result, self._fields)
+        self._result = result
+        self._done = True
+
+    def _set_exception(self, exception):
+        self._exception = exception
+        self._done = True
+
+
+class Batch(object):
+    """
+    Proxy of a client that queues calls and sends them as ``batch`` requests.
+
+    Instances are created through ``Client.batched`` and are not thread-safe.
+    """
+
+    # Whether calls are sent as soon as ``max_size`` of them are pending.
+    _auto_flush = True
+
+    def __init__(self, client, max_size=100):
+        """
+        :param client: the client used to send the ``batch`` requests
+        :type client: ``Client``
+        :param max_size: maximum number of calls per ``batch`` request, None for
+                         no limit
+        :type max_size: int or None
+        """
+        self._client = client
+        self._max_size = max_size
+        self._pending = []
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            return getattr(self._client, name)
+        attr = getattr(self._client, name)
+        if getattr(attr, '__self__', None) is not self._client:
+            return attr
+        # Bind the client method to this proxy, so that it calls our _request.
+        return functools.partial(attr.__func__, self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.flush()
+        else:
+            self.cancel()
+
+    def __len__(self):
+        return len(self._pending)
+
+    def _request(self, method, args=None, params=None):
+        """
+        Queue a call instead of sending it.
+
+        :return: placeholder of the result of the call
+        :rtype: ``BatchResult``
+        """
+        fields = None
+        if params and 'fields' in params:
+            fields = params['fields']
+            params = projection.project(method, params, fields)
+        elif self._client._profile is not None:
+            params = projection.apply_profile(method, params, self._client._profile)
+        future = BatchResult(self, method, fields)
+        self._pending.append((self._client._build_call(method, args, params), future))
+        if self._auto_flush and self._max_size and len(self._pending) >= self._max_size:
+            self.flush()
+        return future
+
+    def _resolve(self):
+        """
+        Sends the pending calls so that the result of one of them can be read.
+        """
+        self.flush()
+
+    def cancel(self):
+        """
+        Drops all pending calls without sending them.
+        """
+        pending, self._pending = self._pending, []
+        for _, future in pending:
+            future._set_exception(
+                FreeIPAError('Batch was cancelled before the call was sent')
+            )
+
+    def flush(self):
+        """
+        Sends all pending calls as one ``batch`` request.
+
+        Errors of individual calls are stored in their ``BatchResult``. If the
+        ``batch`` request itself fails, the error is stored in every pending result
+        and raised.
+        """
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        try:
+            response = self._client._request('batch', [call for call, _ in pending])
+        except Exception as err:
+            _set_exception(pending, err)
+            raise
+        _set_results(pending, response)
+
+
+class AsyncBatch(Batch):
+    """
+    Asynchronous version of ``Batch``, created through ``AsyncClient.batched``::
+
+        async with client.batched() as batch:
+            alice = batch.user_show('alice')
+            bob = batch.user_show('bob')
+        print(alice.result(), bob.result())
+
+    Calls are queued without being awaited, and only sent by ``flush`` and when
+    the context exits, in requests of at most ``max_size`` calls. Their results
+    can only be read once sent.
+    """
+
+    _auto_flush = False
+
+    def __enter__(self):
+        raise TypeError('Asynchronous batches are used with "async with"')
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            await self.flush()
+        else:
+            self.cancel()
+
+    def _resolve(self):
+        raise FreeIPAError('The call was not sent yet, await flush() first')
+
+    async def flush(self):
+        """
+        Sends all pending calls, in ``batch`` requests of at most ``max_size``
+        calls, see ``Batch.flush``.
+        """
+        pending, self._pending = self._pending, []
+        size = self._max_size or len(pending)
+        for start in range(0, len(pending), size or 1):
+            chunk = pending[start : start + size]
+            try:
+                response = await self._client._request(
+                    'batch', [call for call, _ in chunk]
+                )
+            except Exception as err:
+                _set_exception(pending[start:], err)
+                raise
+            _set_results(chunk, response)
+
+
+def _set_exception(pending, err):
+    for _, future in pending:
+        future._set_exception(err)
+
+
+def _set_results(pending, response):
+    results = response['results']
+    if len(results) < len(pending):
+        # Otherwise the futures of the calls without a result would never be done.
+        _set_exception(
+            pending[len(results) :],
+            FreeIPAError(
+                'batch returned {0} results for {1} calls'.format(
+                    len(results), len(pending)
+                )
+            ),
+        )
+    for result, (_, future) in zip(results, pending):
+        if result.get('error'):
+            try:
+                parse_error(
+                    {'message': result['error'], 'code': result.get('error_code')}
+                )
+            except FreeIPAError as err:
+                future._set_exception(err)
+        else:
+            for key in ('error', 'error_code', 'error_name', 'error_kw'):
+                result.pop(key, None)
+            future._set_result(result)
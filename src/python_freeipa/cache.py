@@ -0,0 +1,230 @@
+"""Read-through cache of the results of ``*_show`` and ``*_find`` commands."""
+
+import collections
+import json
+import sys
+import threading
+import time
+
+from python_freeipa.codec import wire_default
+from python_freeipa.commands import is_read_only
+
+CACHED_SUFFIXES = ('_show', '_find')
+
+# Writes to these commands change the membership of the objects named in their
+# parameters, besides their own object.
+MEMBER_SUFFIXES = ('_add_member', '_remove_member')
+
+# Object types named by the parameters of member commands. Their other
+# parameters, such as ``all`` or ``no_members``, are options.
+MEMBER_TYPES = frozenset(
+    [
+        'group',
+        'hbacsvc',
+        'host',
+        'hostgroup',
+        'idoverrideuser',
+        'netgroup',
+        'service',
+        'sudocmd',
+        'sysaccount',
+        'user',
+    ]
+)
+
+# Returned by ``ResultCache.get`` when there is no valid entry.
+MISSING = object()
+
+
+def object_type(method):
+    """
+    Returns the object type of a cached command, such as ``user`` for
+    ``user_show``, None if its results are not cached.
+    """
+    for suffix in CACHED_SUFFIXES:
+        if method.endswith(suffix):
+            return method[: -len(suffix)]
+    return None
+
+
+def approximate_size(value):
+    """
+    Returns an estimate of the memory used by a decoded result, in bytes.
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += sys.getsizeof(key) + approximate_size(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            size += approximate_size(item)
+    return size
+
+
+class ResultCache(object):
+    """
+    Cache of the results of ``*_show`` and ``*_find`` commands.
+
+    Entries expire after ``ttl`` seconds, and the least recently used ones are
+    evicted beyond ``max_entries`` entries or ``max_size`` bytes. Any other
+    command run through the client invalidates the entries of its object type:
+    ``group_mod`` invalidates ``group_show`` and ``group_find`` results. Member
+    commands also invalidate the types of their members, and ``*_del`` commands
+    invalidate everything, since deleting an object changes the membership of
+    others.
+
+    Cached results are shared between callers and must not be modified.
+    """
+
+    def __init__(self, ttl=60, max_entries=1024, max_size=64 * 1024 * 1024):
+        """
+        :param ttl: seconds a result is kept
+        :type ttl: float
+        :param max_entries: maximum number of results kept
+        :type max_entries: int
+        :param max_size: approximate maximum memory used by the results, in bytes
+        :type max_size: int
+        """
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._max_size = max_size
+        # key -> (expiry, object type, size, result), least recently used first.
+        self._entries = collections.OrderedDict()
+        self._size = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size(self):
+        """Approximate memory used by the cached results, in bytes."""
+        return self._size
+
+    @property
+    def generation(self):
+        """Counter of invalidations, to pass to ``set``."""
+        return self._generation
+
+    def stats(self):
+        """
+        Returns the counters of the cache.
+
+        :rtype: dict
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'size': self._size,
+            }
+
+    @staticmethod
+    def key(method, args=None, params=None):
+        """
+        Returns the cache key of a call, None if its result is not cached.
+        """
+        if object_type(method) is None:
+            return None
+        if args is None:
+            args = []
+        elif not isinstance(args, list):
+            args = [args]
+        params = dict(params or {})
+        params.pop('version', None)
+        return method + json.dumps([args, params], sort_keys=True, default=wire_default)
+
+    def get(self, key):
+        """
+        Returns the cached result of key, ``MISSING`` if there is no valid one.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.time():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[3]
+
+    def set(self, key, method, result, generation=None):
+        """
+        Caches the result of a call.
+
+        :param generation: value of ``generation`` when the call was sent, the
+                           result is dropped if entries were invalidated since
+        :type generation: int or None
+        """
+        size = approximate_size(result)
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            if size > self._max_size:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (
+                time.time() + self._ttl,
+                object_type(method),
+                size,
+                result,
+            )
+            self._size += size
+            while len(self._entries) > self._max_entries or self._size > self._max_size:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, method, args=None, params=None):
+        """
+        Invalidates the entries a command may have changed.
+
+        Read-only commands invalidate nothing, ``batch`` invalidates the entries
+        of each of its calls.
+        """
+        if method == 'batch':
+            for call in args or []:
+                self.invalidate(call['method'], *call['params'])
+            return
+        if is_read_only(method):
+            return
+        with self._lock:
+            self._generation += 1
+            if method.endswith('_del'):
+                self._clear()
+                return
+            types = set(
+                obj
+                for obj in set(entry[1] for entry in self._entries.values())
+                if method.startswith(obj + '_')
+            )
+            if method.endswith(MEMBER_SUFFIXES):
+                types.update(MEMBER_TYPES.intersection(params or ()))
+            for key, entry in list(self._entries.items()):
+                if entry[1] in types:
+                    self._remove(key)
+
+    def clear(self):
+        """
+        Forgets all the cached results.
+        """
+        with self._lock:
+            self._generation += 1
+            self._clear()
+
+    def _clear(self):
+        self._entries.clear()
+        self._size = 0
+
+    def _remove(self, key):
+        self._size -= self._entries.pop(key)[2]
@@ -1,11 +1,20 @@
 """Lightweight FreeIPA JSON RPC client."""
 
-import json
+import collections
+import itertools
 import logging
 import socket
+import threading
+import time
 
 import requests
 
+from python_freeipa import discovery, projection
+from python_freeipa.batch import Batch
+from python_freeipa.cache import MISSING, ResultCache
+from python_freeipa.codec import get_codec
+from python_freeipa.columns import Columns
+from python_freeipa.commands import is_read_only
 from python_freeipa.exceptions import (
     Denied,
     FreeIPAError,
@@ -18,18 +27,18 @@ from python_freeipa.exceptions import (
     UserLocked,
     parse_error,
 )
-
-try:
-    import requests_gssapi
-except ImportError as e:
-    # Will raise if the user tries to login via Kerberos.
-    requests_gssapi = e
-
-try:
-    import srvlookup
-except ImportError as e:
-    # Will raise if the user tires to do dns service discovery.
-    srvlookup = e
+from python_freeipa.fanout import fan_out
+from python_freeipa.hooks import Hooks
+from python_freeipa.hosts import HostPool
+from python_freeipa.paging import FindPager
+from python_freeipa.retry import (
+    RetryPolicy,
+    current_deadline,
+    is_connect_error,
+    time_left,
+)
+from python_freeipa.streaming import ResultStreamParser
+from python_freeipa.throttle import UNTHROTTLED
 
 
 class AuthenticatedSession(object):
@@ -107,10 +116,36 @@ class AuthenticatedSession(object):
 class Client(object):
     """Lightweight FreeIPA JSON RPC client."""
 
-    def __init__(self, host=None, verify_ssl=True, version=None, dns_discovery=True):
+    def __init__(
+        self,
+        host=None,
+        verify_ssl=True,
+        version=None,
+        dns_discovery=True,
+        pool_connections=10,
+        pool_maxsize=10,
+        pool_block=False,
+        max_retries=0,
+        keep_alive=True,
+        codec=None,
+        session_store=None,
+        reauthenticate=True,
+        load_balance=False,
+        timeout=None,
+        discovery_cache=None,
+        result_cache=None,
+        hooks=None,
+        retry_policy=None,
+        throttle=None,
+        profile='default',
+    ):
         """
         Initialize client with connection options.
 
+        A logged in client can be shared between threads: the HTTP session is only
+        mutated when logging in, and the host of each request is resolved once per
+        call. When sharing a client, set ``pool_maxsize`` to the number of threads.
+
         :param host: hostname to connect to, set None for dns service discovery
         :type host: str or None
         :param verify_ssl: verify SSL certificates for HTTPS requests
@@ -125,6 +160,57 @@ class Client(object):
                            until one is found that will respond to our login request.
                            if host param is set, host param will always win, and no dns discovery is performed.
         :type dns_discovery: str
+        :param pool_connections: number of hosts to keep connection pools for
+        :type pool_connections: int
+        :param pool_maxsize: maximum number of connections kept open per host
+        :type pool_maxsize: int
+        :param pool_block: if True, requests wait for a free connection instead of
+                           opening connections beyond ``pool_maxsize`` per host
+        :type pool_block: bool
+        :param max_retries: number of retries of failed connection attempts,
+                            or an ``urllib3.util.Retry`` instance
+        :type max_retries: int or ``urllib3.util.Retry``
+        :param keep_alive: if False, connections are closed after each request
+        :type keep_alive: bool
+        :param codec: JSON codec used for requests and responses, see
+                      ``python_freeipa.codec.get_codec``
+        :type codec: ``JSONCodec``, str or None
+        :param session_store: store to reuse the sessions of earlier clients from,
+                              and to save the sessions of this client to
+        :type session_store: ``python_freeipa.session_store.SessionStore`` or None
+        :param reauthenticate: if True, a request rejected because the session
+                               expired logs in again with the arguments of the last
+                               login and is sent once more
+        :type reauthenticate: bool
+        :param load_balance: if True and the servers are discovered through DNS,
+                             read-only commands are spread over the healthy servers
+                             according to their SRV priority, weight and latency.
+                             Discovered servers failing a request are ejected and
+                             the request fails over to another server either way.
+        :type load_balance: bool
+        :param timeout: timeout in seconds of HTTP requests, None to wait forever
+        :type timeout: float or None
+        :param discovery_cache: cache of the servers discovered through DNS,
+                                shared by all clients of the process by default
+        :type discovery_cache: ``python_freeipa.discovery.DiscoveryCache`` or None
+        :param result_cache: cache of the results of ``*_show`` and ``*_find``
+                             commands, True for a default one, None to disable
+        :type result_cache: ``python_freeipa.cache.ResultCache``, bool or None
+        :param hooks: subscribers to the events of the requests, possibly shared
+                      with other clients
+        :type hooks: ``python_freeipa.hooks.Hooks`` or None
+        :param retry_policy: policy retrying the requests that failed with a
+                             transient error, True for a default one, None to
+                             never retry
+        :type retry_policy: ``python_freeipa.retry.RetryPolicy``, bool or None
+        :param throttle: rate limits and concurrency caps of the requests to each
+                         server, possibly shared with other clients
+        :type throttle: ``python_freeipa.throttle.Throttle`` or None
+        :param profile: ``default``, or ``bulk`` to fetch the entries of
+                        ``*_show`` and ``*_find`` commands without their
+                        memberships and non-default attributes, unless
+                        ``fields`` are given
+        :type profile: str
         """
         self._dns_discovery = dns_discovery
         self._host = host
@@ -132,34 +218,137 @@ class Client(object):
         self._base_url = 'https://{0}/ipa'.format(self._host)
         self._verify_ssl = verify_ssl
         self._version = version
-        self._session = requests.Session()
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+        self._max_retries = max_retries
+        self._keep_alive = keep_alive
+        self._codec = get_codec(codec)
+        self._session_store = session_store
+        self._principal = None
+        self._reauthenticate = reauthenticate
+        self._authenticated_session = None
+        self._login_lock = threading.Lock()
+        self._relogins = collections.Counter()
+        self._generations = itertools.count(1)
+        self._session_generations = {}
+        self._load_balance = load_balance
+        self._timeout = timeout
+        self._host_pool = None
+        self._discovery_cache = discovery_cache or discovery.default_cache
+        if result_cache is True:
+            result_cache = ResultCache()
+        elif result_cache is False:
+            result_cache = None
+        self._result_cache = result_cache
+        self._hooks = Hooks() if hooks is None else hooks
+        if retry_policy is True:
+            retry_policy = RetryPolicy()
+        self._retry_policy = retry_policy or None
+        self._throttle = throttle
+        if profile not in projection.PROFILES:
+            raise ValueError('unknown profile {0!r}'.format(profile))
+        self._profile = projection.PROFILES[profile]
+        self._session = self._create_session()
         self._log = logging.getLogger(__name__)
 
+    def _create_session(self):
+        """
+        Create the HTTP session used for all requests of this client.
+        """
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self._pool_connections,
+            pool_maxsize=self._pool_maxsize,
+            max_retries=self._max_retries,
+            pool_block=self._pool_block,
+        )
+        session.mount('https://', adapter)
+        if not self._keep_alive:
+            session.headers['Connection'] = 'close'
+        return session
+
     @property
     def current_host(self):
         return self._current_host
 
     @property
-    def dns_discovered(self):
+    def relogins(self):
+        """Number of times the client logged in again after its session expired,
+        by host."""
+        return dict(self._relogins)
+
+    def pool_stats(self):
+        """
+        Returns the state of the connection pool of each host.
+
+        ``in_use`` connections are checked out by requests being sent, ``idle``
+        ones are kept open for the next requests.
+
+        :return: dicts with ``host``, ``maxsize``, ``in_use``, ``idle``,
+                 ``opened`` and ``requests`` keys
+        :rtype: list of dict
+        """
+        stats = []
+        for adapter in set(self._session.adapters.values()):
+            pools = getattr(getattr(adapter, 'poolmanager', None), 'pools', None)
+            if pools is None:
+                continue
+            for key in pools.keys():
+                pool = pools.get(key)
+                queue = getattr(pool, 'pool', None)
+                if queue is None:
+                    continue
+                with queue.mutex:
+                    free = len(queue.queue)
+                    idle = sum(1 for conn in queue.queue if conn is not None)
+                stats.append(
+                    {
+                        'host': pool.host,
+                        'maxsize': queue.maxsize,
+                        'in_use': max(queue.maxsize - free, 0),
+                        'idle': idle,
+                        'opened': pool.num_connections,
+                        'requests': pool.num_requests,
+                    }
+                )
+        return stats
+
+    def _discovery_domain(self):
         if isinstance(self._dns_discovery, str):
-            _domain = self._dns_discovery
+            return self._dns_discovery
         elif self._dns_discovery:
-            _domain = socket.getfqdn()
+            return socket.getfqdn()
         else:
             raise FreeIPAError('neither host specified, not dns_discovery enabled')
-        while True:
-            try:
-                return srvlookup.lookup('ldap', 'tcp', _domain)
-            except srvlookup.SRVQueryFailure:
-                try:
-                    _domain = _domain.split('.', 1)[1]
-                except IndexError:
-                    raise FreeIPAError('could not find any IPA Server using DNS lookup')
+
+    @property
+    def dns_discovered(self):
+        return self._discovery_cache.lookup(self._discovery_domain())
+
+    def refresh_discovery(self):
+        """
+        Discovers the IPA servers again on next use, ignoring cached results.
+        """
+        self._discovery_cache.refresh(self._discovery_domain())
+        self._host_pool = None
 
     @property
     def log(self):
         return self._log
 
+    def _candidate_hosts(self):
+        """
+        Returns the hostnames to try in order, the configured host if any,
+        otherwise the discovered IPA servers.
+        """
+        if self._host:
+            return [self._host]
+        servers = self.dns_discovered
+        if self._host_pool is None or self._host_pool.servers is not servers:
+            self._host_pool = HostPool(servers, probe=self._probe)
+        return self._host_pool.ordered()
+
     def _wrap_in_dns_discovery(self, function, *args, **kwargs):
         """
         Wrap a function in DNS discovery.
@@ -168,21 +357,27 @@ class Client(object):
         :type function: callable
         :param args: the function's arguments
         :type args: list
-        :param kwargs: the function's keyword arguments
+        :param kwargs: the function's keyword arguments, ``host`` is added to them
         :type kwargs: dict
         """
         if self._host:
+            result = function(*args, host=self._host, **kwargs)
             self._current_host = self._host
-            return function(*args, **kwargs)
+            return result
         else:
-            for host in self.dns_discovered:
+            for host in self._candidate_hosts():
                 try:
-                    self._current_host = host.hostname
-                    return function(*args, **kwargs)
+                    result = function(*args, host=host, **kwargs)
                 except requests.exceptions.ConnectionError as err:
+                    self._host_pool.report_failure(host)
                     self.log.warning(
                         "Could not connect discovered host: {0}".format(err)
                     )
+                else:
+                    # Only publish the host once it answered, so that concurrent
+                    # requests never see a host that is still being tried.
+                    self._current_host = host
+                    return result
             raise FreeIPAError("Could not connect to any host")
 
     def login(self, username, password):
@@ -197,39 +392,70 @@ class Client(object):
         """
         return self._wrap_in_dns_discovery(self._login, username, password)
 
-    def _login(self, username, password):
+    def _login(self, username, password, host=None):
         """
         private function, use login instead
         """
-        login_url = 'https://{0}/ipa/session/login_password'.format(self._current_host)
+        host = host or self._current_host
+        if not self._restore_session(host, username):
+            login_url, headers, data = self._login_request(username, password, host)
+            response = self._session.post(
+                login_url,
+                headers=headers,
+                data=data,
+                verify=self._verify_ssl,
+                timeout=self._timeout,
+            )
+
+            if not response.ok:
+                self._raise_login_error(response.headers, response.text)
+
+            self._save_session(host, username)
+            self.log.info('Successfully logged in as {0}'.format(username))
+
+        self._authenticated_session = AuthenticatedSession(
+            self, username, password, logged_in=True
+        )
+        return self._authenticated_session
+
+    def _login_request(self, username, password, host=None):
+        """
+        Build the URL, headers and form data of a password login request.
+        """
+        login_url = 'https://{0}/ipa/session/login_password'.format(
+            host or self._current_host
+        )
         headers = {
             'Referer': login_url,
             'Content-Type': 'application/x-www-form-urlencoded',
             'Accept': 'text/plain',
         }
         data = {'user': username, 'password': password}
-        response = self._session.post(
-            login_url, headers=headers, data=data, verify=self._verify_ssl
-        )
+        return login_url, headers, data
 
-        if not response.ok:
-            reason = response.headers.get('X-IPA-Rejection-Reason', None)
-            if reason:
-                if reason == 'password-expired':
-                    raise PasswordExpired()
-                elif reason == 'krbprincipal-expired':
-                    raise KrbPrincipalExpired()
-                elif reason == 'denied':
-                    raise Denied()
-                elif reason == 'invalid-password':
-                    raise InvalidSessionPassword()
-                elif reason == 'user-locked':
-                    raise UserLocked()
-            raise Unauthorized(response.text)
-
-        self.log.info('Successfully logged in as {0}'.format(username))
+    @staticmethod
+    def _raise_login_error(headers, text):
+        """
+        Raise the exception matching a rejected login request.
 
-        return AuthenticatedSession(self, username, password, logged_in=True)
+        :param headers: headers of the response
+        :type headers: dict
+        :param text: body of the response
+        :type text: str
+        """
+        reason = headers.get('X-IPA-Rejection-Reason', None)
+        if reason:
+            if reason == 'password-expired':
+                raise PasswordExpired()
+            elif reason == 'krbprincipal-expired':
+                raise KrbPrincipalExpired()
+            elif reason == 'denied':
+                raise Denied()
+            elif reason == 'invalid-password':
+                raise InvalidSessionPassword()
+            elif reason == 'user-locked':
+                raise UserLocked()
+        raise Unauthorized(text)
 
     def login_kerberos(self):
         """
@@ -246,60 +472,178 @@ class Client(object):
         """
         return self._wrap_in_dns_discovery(self._login_kerberos)
 
-    def _login_kerberos(self):
+    def _login_kerberos(self, host=None):
         """
         private function, use login_kerberos instead
         """
-        if isinstance(requests_gssapi, ImportError):
-            raise requests_gssapi
+        host = host or self._current_host
+        principal = None
+        if self._session_store is not None:
+            principal = self._kerberos_principal()
+            if self._restore_session(host, principal):
+                self._authenticated_session = AuthenticatedSession(self, logged_in=True)
+                return self._authenticated_session
+
+        # Imported on use, since it is slow to import and seldom needed.
+        import requests_gssapi
 
-        login_url = 'https://{0}/ipa/session/login_kerberos'.format(self._current_host)
-        headers = {'Referer': 'https://{0}/ipa'.format(self._current_host)}
+        login_url, headers = self._login_kerberos_request(host)
         response = self._session.post(
             login_url,
             headers=headers,
             verify=self._verify_ssl,
+            timeout=self._timeout,
             auth=requests_gssapi.HTTPSPNEGOAuth(),
         )
 
         if not response.ok:
             raise Unauthorized(response.text)
 
+        self._save_session(host, principal)
         self.log.info(
-            'Successfully logged to {0} using Kerberos credentials.'.format(
-                self._current_host
-            )
+            'Successfully logged to {0} using Kerberos credentials.'.format(host)
         )
 
-        return AuthenticatedSession(self, logged_in=True)
+        self._authenticated_session = AuthenticatedSession(self, logged_in=True)
+        return self._authenticated_session
+
+    @staticmethod
+    def _kerberos_principal():
+        """
+        Returns the principal of the default Kerberos credential cache, None if
+        it cannot be determined.
+        """
+        try:
+            import gssapi
+        except ImportError:
+            # Sessions of Kerberos logins are then not stored.
+            return None
+        try:
+            return str(gssapi.Credentials(usage='initiate').name)
+        except gssapi.exceptions.GSSError:
+            return None
+
+    def _restore_session(self, host, principal):
+        """
+        Reuse the stored session of principal on host, if any.
+
+        :return: True if a session was restored
+        :rtype: bool
+        """
+        if self._session_store is None or principal is None:
+            return False
+        value = self._session_store.get(host, principal)
+        if value is None:
+            return False
+        self._set_session_cookie(host, value)
+        self._principal = principal
+        self._session_generations[host] = next(self._generations)
+        self.log.info('Reusing stored session of {0} on {1}'.format(principal, host))
+        return True
+
+    def _save_session(self, host, principal):
+        """
+        Save the session obtained by principal on host to the session store.
+        """
+        self._principal = principal
+        self._session_generations[host] = next(self._generations)
+        if self._session_store is None or principal is None:
+            return
+        cookie = self._session_cookie(host)
+        if cookie is not None:
+            self._session_store.set(host, principal, cookie.value, cookie.expires)
+
+    def _set_session_cookie(self, host, value):
+        """
+        Set the session cookie of host.
+        """
+        self._session.cookies.set(
+            'ipa_session', value, domain=host, path='/ipa', secure=True
+        )
+
+    def _forget_session(self, host):
+        """
+        Delete the stored session of host after it was rejected as expired.
+        """
+        if self._session_store is not None and self._principal is not None:
+            # Keep the session if another process already stored a newer one.
+            cookie = self._session_cookie(host)
+            stored = self._session_store.get(host, self._principal)
+            if cookie is not None and stored == cookie.value:
+                self._session_store.delete(host, self._principal)
+
+    def _session_cookie(self, host):
+        """
+        Returns the session cookie of host, None if there is none.
+        """
+        for cookie in self._session.cookies:
+            if cookie.name == 'ipa_session' and cookie.domain.lstrip('.') == host:
+                return cookie
+        return None
+
+    def _relogin(self, host, generation):
+        """
+        Login again to host after a request was rejected because the session expired.
+
+        Concurrent callers only trigger one login: the ones whose request was sent
+        with an older session than the current one just replay their request.
+
+        :param host: host that rejected the request
+        :type host: str
+        :param generation: session generation the request was sent with
+        :type generation: int
+        :return: True if the rejected request should be sent again
+        :rtype: bool
+        """
+        with self._login_lock:
+            if generation != self._session_generations.get(host, 0):
+                return True
+
+            self._forget_session(host)
+
+            if not self._reauthenticate or self._authenticated_session is None:
+                return False
+
+            self.log.info('Session on {0} expired, logging in again'.format(host))
+            self._relogins[host] += 1
+            login_args = self._authenticated_session._login_args
+            if login_args:
+                self._login(*login_args, host=host)
+            else:
+                self._login_kerberos(host=host)
+            return True
+
+    def _login_kerberos_request(self, host=None):
+        """
+        Build the URL and headers of a Kerberos login request.
+        """
+        host = host or self._current_host
+        login_url = 'https://{0}/ipa/session/login_kerberos'.format(host)
+        headers = {'Referer': 'https://{0}/ipa'.format(host)}
+        return login_url, headers
 
     def logout(self):
         """
         Logs out of the FreeIPA session.
         """
+        self._authenticated_session = None
         self._request('session_logout')
+        if self._session_store is not None and self._principal is not None:
+            self._session_store.delete(self._current_host, self._principal)
 
-    def _request(self, method, args=None, params=None):
+    def _build_call(self, method, args=None, params=None):
         """
-        Make an HTTP request to FreeIPA JSON RPC server.
+        Build the JSON RPC payload of a single call.
 
-        :param method: RPC method name is required
+        :param method: RPC method name
         :type method: str
         :param args: optional positional argument or list of arguments
         :type args: list or string
         :param params: optional named parameters
         :type params: dict
-        :return: parsed response from the request
+        :return: payload with ``method`` and ``params`` keys
         :rtype: dict
-        :raises FreeIPAError: if the response code is not OK
         """
-        session_url = 'https://{0}/ipa/session/json'.format(self.current_host)
-        headers = {
-            'Referer': 'https://{0}/ipa'.format(self.current_host),
-            'Content-Type': 'application/json',
-            'Accept': 'application/json',
-        }
-
         if not args:
             args = []
         elif not isinstance(args, list):
@@ -311,25 +655,592 @@ class Client(object):
         if self._version:
             params.setdefault('version', self._version)
 
-        data = {'method': method, 'params': [args, params]}
+        return {'method': method, 'params': [args, params]}
+
+    def batched(self, max_size=100):
+        """
+        Create a context in which calls are coalesced into ``batch`` requests.
+
+        Calls made on the returned object are queued and return a ``BatchResult``
+        instead of the result itself. Queued calls are sent as a single ``batch``
+        request whenever ``max_size`` calls are pending, when a pending result is
+        read, and when the context exits.
+
+        Only methods that return the result of ``_request`` unchanged (such as the
+        ones of ``ClientMeta``) can be batched.
+
+        :param max_size: maximum number of calls sent in one ``batch`` request,
+                         None for no limit
+        :type max_size: int or None
+        :return: batching proxy of this client
+        :rtype: ``Batch``
+        """
+        return Batch(self, max_size=max_size)
+
+    def iter_find(self, obj, *args, criteria=None, page_size=100, pkey=None, **params):
+        """
+        Iterate over the entries of an ``<obj>_find`` command one by one.
+
+        The primary keys of the matching entries are enumerated first with
+        ``pkey_only``, then the entries are fetched with ``<obj>_show`` calls sent
+        in batches of ``page_size``, so that only one page of entries is held in
+        memory at a time. Entries deleted in between are skipped.
+
+        :param obj: object name, e.g. ``user`` or ``dnsrecord``
+        :type obj: str
+        :param args: primary keys of the parent objects, e.g. the DNS zone name
+        :param criteria: optional search criteria
+        :type criteria: str or None
+        :param page_size: number of entries fetched per ``batch`` request
+        :type page_size: int
+        :param pkey: name of the primary key attribute, guessed from the first
+                     enumerated entry if omitted
+        :type pkey: str or None
+        :param params: search filters of ``<obj>_find``, and the ``all``, ``raw``,
+                       ``rights``, ``no_members`` and ``fields`` options of
+                       ``<obj>_show``
+        :return: generator of entries
+        """
+        pager = FindPager(obj, args, criteria, page_size, pkey, params)
+        found = self._request(pager.find_method, pager.find_args, pager.find_params)
+        keys = pager.keys(found, self.log)
+        del found
+
+        for page in pager.pages(keys):
+            with self.batched(max_size=None) as batch:
+                results = [batch._request(*call) for call in page]
+            for entry in pager.entries(results):
+                yield entry
+
+    def map(
+        self,
+        method,
+        keys,
+        chunk_size=100,
+        concurrency=None,
+        ordered=True,
+        **params,
+    ):
+        """
+        Call method for each key, in ``batch`` requests sent concurrently by a
+        pool of threads sharing the session of the client::
+
+            for result in client.map('host_show', fqdns, all=True):
+                if result.exception() is None:
+                    print(result.key, result.result()['result']['fqdn'])
 
-        self.log.debug(
-            'Making {method} request to {url} with arguments {args} and params {params}'.format(
-                method=method, url=session_url, args=args, params=params
+        By default, the number of requests sent at once starts at two and
+        adapts to the latency of the server, up to ``pool_maxsize``: it grows
+        while the latency stays close to the lowest one observed, and halves
+        when the latency grows or the server is overloaded. Set the number of
+        requests with ``concurrency``, or tune the limits with an
+        ``AdaptiveConcurrency``.
+
+        :param method: RPC method name, e.g. ``host_show`` or ``user_status``
+        :type method: str
+        :param keys: first argument of each call, or list of its arguments
+        :type keys: iterable
+        :param chunk_size: number of calls per ``batch`` request
+        :type chunk_size: int
+        :param concurrency: number of requests sent at once, adaptive if None
+        :type concurrency: int, ``python_freeipa.fanout.AdaptiveConcurrency``
+                           or None
+        :param ordered: False to yield the results as their request completes
+                        rather than in the order of the keys
+        :type ordered: bool
+        :param params: named parameters of each call, including ``fields``
+        :return: generator of ``python_freeipa.fanout.MapResult``, holding the
+                 result or the error of the call for each key
+        """
+        return fan_out(
+            self,
+            method,
+            keys,
+            params,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+            ordered=ordered,
+        )
+
+    @property
+    def hooks(self):
+        """The ``Hooks`` emitting the events of the requests of the client."""
+        return self._hooks
+
+    @property
+    def result_cache(self):
+        """The ``ResultCache`` of the client, None if results are not cached."""
+        return self._result_cache
+
+    @property
+    def throttle(self):
+        """The ``Throttle`` of the requests of the client, None if unlimited."""
+        return self._throttle
+
+    def _request(self, method, args=None, params=None):
+        """
+        Make an HTTP request to FreeIPA JSON RPC server.
+
+        Results are read from and saved to the result cache, if enabled.
+
+        :param method: RPC method name is required
+        :type method: str
+        :param args: optional positional argument or list of arguments
+        :type args: list or string
+        :param params: optional named parameters. With ``fields``, the entries
+                       of ``*_show`` and ``*_find`` commands are fetched with
+                       the cheapest options returning these attributes, and
+                       trimmed to them.
+        :type params: dict
+        :return: parsed response from the request
+        :rtype: dict
+        :raises FreeIPAError: if the response code is not OK
+        """
+        if params and 'fields' in params:
+            fields = params['fields']
+            params = projection.project(method, params, fields)
+            return projection.trim(self._cached_request(method, args, params), fields)
+        if self._profile is not None:
+            params = projection.apply_profile(method, params, self._profile)
+        return self._cached_request(method, args, params)
+
+    def _cached_request(self, method, args=None, params=None):
+        """
+        Make an HTTP request to FreeIPA JSON RPC server, through the result cache
+        if enabled.
+        """
+        cache = self._result_cache
+        if cache is None:
+            return self._send_request(method, args, params)
+        key = cache.key(method, args, params)
+        if key is None:
+            try:
+                return self._send_request(method, args, params)
+            finally:
+                cache.invalidate(method, args, params)
+        result = cache.get(key)
+        if result is MISSING:
+            generation = cache.generation
+            result = self._send_request(method, args, params)
+            cache.set(key, method, result, generation)
+        return result
+
+    def _send_request(self, method, args=None, params=None):
+        """
+        Send a request to FreeIPA JSON RPC server, bypassing the result cache.
+        """
+        read_only = is_read_only(method, args if isinstance(args, list) else None)
+        host = self._select_host(read_only)
+        session_url, headers, data = self._json_request(method, args, params, host=host)
+        event = self._hooks.start(method, host, args, data) if self._hooks else None
+
+        kind = self._command_class(method, args)
+        policy = self._retry_policy
+        until = current_deadline() if policy is None else policy.deadline()
+        response = None
+        attempt = 1
+        try:
+            while True:
+                try:
+                    host, response = self._post_with_failover(
+                        host, session_url, headers, data, read_only, event, until, kind
+                    )
+                    self._raise_for_status(response.status_code, response.text)
+                    result = self._unwrap_result(self._codec.loads(response.content))
+                    break
+                except Exception as err:
+                    delay = self._retry_delay(err, method, args, attempt, until)
+                    if delay is None:
+                        raise
+                    self.log.warning(
+                        '{0} request failed, retrying in {1:.2f}s: {2!r}'.format(
+                            method, delay, err
+                        )
+                    )
+                time.sleep(delay)
+                attempt += 1
+                response = None
+                host = self._select_host(read_only)
+                session_url, headers = self._json_endpoint(host)
+                if event is not None:
+                    event.host = host
+                    event.retries += 1
+            if policy is not None:
+                policy.record_success()
+        except Exception as err:
+            if event is not None:
+                self._finish_event(event, response, err)
+            raise
+        if event is not None:
+            self._finish_event(event, response)
+        return result
+
+    def _post_with_failover(
+        self,
+        host,
+        session_url,
+        headers,
+        data,
+        read_only,
+        event=None,
+        until=None,
+        kind=None,
+    ):
+        """
+        Send a JSON RPC request, to other discovered servers if host cannot be
+        reached.
+
+        :param kind: class of the command, see ``_command_class``
+        :type kind: str or None
+        :return: the host that answered, and its response
+        :rtype: tuple of str and ``requests.Response``
+        """
+        tried = set()
+        while True:
+            start = time.time()
+            try:
+                with self._throttled(host, kind, until):
+                    response = self._post_json(
+                        host, session_url, headers, data, event=event, until=until
+                    )
+            except requests.exceptions.RequestException as err:
+                tried.add(host)
+                next_host = self._fail_over(host, err, read_only, tried)
+                if next_host is None:
+                    raise
+                host = next_host
+                session_url, headers = self._json_endpoint(host)
+                if event is not None:
+                    event.host = host
+                    event.retries += 1
+            else:
+                self._report_response(host, response.status_code, time.time() - start)
+                return host, response
+
+    def _command_class(self, method, args):
+        """
+        Returns the class of a command for the throttle, None without throttle.
+        """
+        if self._throttle is None:
+            return None
+        return self._throttle.classify(method, args if isinstance(args, list) else None)
+
+    def _throttled(self, host, kind, until=None):
+        """
+        Returns the context of a request to host, entered once the throttle lets
+        it be sent.
+        """
+        if self._throttle is None:
+            return UNTHROTTLED
+        return self._throttle.limit(host, kind, until)
+
+    def _retry_delay(self, err, method, args, attempt, until):
+        """
+        Returns the delay before sending a call again after attempt failed with
+        err, None if it must not be retried.
+        """
+        policy = self._retry_policy
+        if policy is None or not isinstance(err, self._retried_errors()):
+            return None
+        return policy.retry_delay(
+            err, method, args, attempt, until, sent=not self._is_connect_error(err)
+        )
+
+    @staticmethod
+    def _failover_errors():
+        """
+        Returns the exception classes of the requests sent to another server.
+        """
+        return (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+    @staticmethod
+    def _retried_errors():
+        """
+        Returns the exception classes the retry policy is asked about.
+        """
+        return (
+            FreeIPAError,
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+        )
+
+    def _finish_event(self, event, response, error=None):
+        if response is None:
+            self._hooks.finish(event, error=error)
+        else:
+            self._hooks.finish(event, response.status_code, response.content, error)
+
+    def _select_host(self, read_only):
+        """
+        Returns the host to send a request to.
+
+        Without discovered servers, this is always the current host. Otherwise,
+        read-only requests are load balanced if enabled, and the current host is
+        replaced by a healthy one if it was ejected.
+        """
+        pool = self._host_pool
+        host = self._current_host
+        if pool is None or host not in pool:
+            return host
+        if self._load_balance and read_only:
+            return pool.select() or host
+        if not pool.is_healthy(host):
+            selected = pool.select()
+            if selected is not None:
+                self._current_host = selected
+                return selected
+        return host
+
+    def _fail_over(self, host, err, read_only, tried):
+        """
+        Returns the host to send a request that failed on host to, None if it
+        must not be sent again.
+
+        Requests are only sent again if they failed to connect, or if they are
+        read-only and could not get a response.
+        """
+        pool = self._host_pool
+        if pool is None or host not in pool:
+            return None
+        if not isinstance(err, self._failover_errors()):
+            return None
+        pool.report_failure(host)
+        if not read_only and not self._is_connect_error(err):
+            return None
+        next_host = pool.select(exclude=tried)
+        if next_host is None:
+            return None
+        self.log.warning(
+            'Request to {0} failed, failing over to {1}: {2}'.format(
+                host, next_host, err
             )
         )
+        if host == self._current_host:
+            self._current_host = next_host
+        return next_host
+
+    @staticmethod
+    def _is_connect_error(err):
+        """
+        Returns True if the request failed before it was sent.
+        """
+        return is_connect_error(err)
+
+    def _report_response(self, host, status_code, latency):
+        """
+        Records the outcome of a request in the health of its host.
+        """
+        if self._host_pool is None:
+            return
+        if status_code >= 500:
+            self._host_pool.report_failure(host)
+        else:
+            self._host_pool.report_success(host, latency)
+
+    def _probe(self, host):
+        """
+        Health-probe host with a ``ping``, returns True if it answers.
+        """
+        session_url, headers = self._json_endpoint(host)
+        response = self._session.post(
+            session_url,
+            headers=headers,
+            data=self._codec.dumps(self._build_call('ping')),
+            verify=self._verify_ssl,
+            timeout=self._timeout or 5,
+        )
+        # Even a rejected session proves that the server is up.
+        return response.status_code < 500
+
+    def stream(self, method, args=None, params=None, chunk_size=65536):
+        """
+        Make an HTTP request to FreeIPA JSON RPC server and yield the entries of
+        its result as they are parsed.
+
+        The response body is read incrementally, so that only one entry of e.g. a
+        ``user_find`` with ``all=True`` is decoded at a time.
+
+        :param method: RPC method name is required
+        :type method: str
+        :param args: optional positional argument or list of arguments
+        :type args: list or string
+        :param params: optional named parameters
+        :type params: dict
+        :param chunk_size: number of bytes read from the body at a time
+        :type chunk_size: int
+        :return: generator of the entries of ``result['result']``
+        :raises FreeIPAError: if the response code is not OK
+        """
+        host = self._select_host(is_read_only(method))
+        session_url, headers, data = self._json_request(method, args, params, host=host)
+        event = self._hooks.start(method, host, args, data) if self._hooks else None
+
+        kind = self._command_class(method, args)
+        until = current_deadline()
+        response = None
+        received = 0
+        try:
+            # The request holds its slot until its body is read.
+            with self._throttled(host, kind, until):
+                response = self._post_json(
+                    host,
+                    session_url,
+                    headers,
+                    data,
+                    event=event,
+                    until=until,
+                    stream=True,
+                )
+                if not response.ok:
+                    self._raise_for_status(response.status_code, response.text)
+
+                parser = ResultStreamParser()
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    received += len(chunk)
+                    for entry in parser.feed(chunk):
+                        yield entry
+                for entry in parser.close():
+                    yield entry
+        except Exception as err:
+            if event is not None:
+                status = None if response is None else response.status_code
+                self._hooks.finish(event, status, error=err)
+                event = None
+            raise
+        finally:
+            if response is not None:
+                response.close()
+            if event is not None:
+                event.bytes_received = received
+                self._hooks.finish(event, response.status_code)
+
+    def to_columns(self, method, args=None, params=None, fields=None, types=None):
+        """
+        Make an HTTP request to FreeIPA JSON RPC server and build the columns of
+        the entries of its result as they are parsed, see
+        ``python_freeipa.columns.Columns``::
 
+            columns = client.to_columns('user_find', fields=['uid', 'uidnumber'])
+            frame = columns.to_dataframe()
+
+        :param method: RPC method name of a ``*_find`` command
+        :type method: str
+        :param args: optional positional argument or list of arguments
+        :type args: list or string
+        :param params: optional named parameters
+        :type params: dict
+        :param fields: names of the attributes exported, fetched with the
+                       cheapest options returning them. All the attributes
+                       returned with params if None.
+        :type fields: iterable of str or None
+        :param types: kinds of columns by attribute name, e.g.
+                      ``{'employeenumber': 'int'}``
+        :type types: dict or None
+        :rtype: ``python_freeipa.columns.Columns``
+        :raises FreeIPAError: if the response code is not OK
+        """
+        if fields is not None:
+            fields = (fields,) if isinstance(fields, str) else tuple(fields)
+            params = projection.project(method, params, fields)
+            if projection.ALL_FIELDS in fields:
+                fields = None
+        elif self._profile is not None:
+            params = projection.apply_profile(method, params, self._profile)
+        return Columns(self.stream(method, args, params), fields=fields, types=types)
+
+    def _post_json(
+        self, host, session_url, headers, data, event=None, until=None, **kwargs
+    ):
+        """
+        Send a JSON RPC request, once more after logging in again if the session
+        expired.
+
+        :param event: event of the request, whose retries are counted
+        :type event: ``python_freeipa.hooks.CallEvent`` or None
+        :param until: ``time.monotonic()`` deadline of the request
+        :type until: float or None
+        :return: the response
+        :rtype: ``requests.Response``
+        :raises DeadlineExceeded: if the deadline passed
+        """
+        generation = self._session_generations.get(host, 0)
         response = self._session.post(
-            session_url, headers=headers, data=json.dumps(data), verify=self._verify_ssl
+            session_url,
+            headers=headers,
+            data=data,
+            verify=self._verify_ssl,
+            timeout=time_left(until, self._timeout),
+            **kwargs,
         )
+        if response.status_code == 401 and self._relogin(host, generation):
+            response.close()
+            if event is not None:
+                event.retries += 1
+            response = self._session.post(
+                session_url,
+                headers=headers,
+                data=data,
+                verify=self._verify_ssl,
+                timeout=time_left(until, self._timeout),
+                **kwargs,
+            )
+        return response
+
+    @staticmethod
+    def _json_endpoint(host):
+        """
+        Returns the URL and headers of JSON RPC requests to host.
+        """
+        session_url = 'https://{0}/ipa/session/json'.format(host)
+        headers = {
+            'Referer': 'https://{0}/ipa'.format(host),
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+        }
+        return session_url, headers
+
+    def _json_request(self, method, args=None, params=None, host=None):
+        """
+        Build the URL, headers and serialized body of a JSON RPC request.
+        """
+        session_url, headers = self._json_endpoint(host or self._current_host)
+
+        data = self._build_call(method, args, params)
+        args, params = data['params']
+
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(
+                'Making {method} request to {url} with arguments {args} and params {params}'.format(
+                    method=method, url=session_url, args=args, params=params
+                )
+            )
+
+        return session_url, headers, self._codec.dumps(data)
+
+    @staticmethod
+    def _raise_for_status(status_code, text):
+        """
+        Raise the exception matching a failed HTTP response, if any.
 
-        if response.status_code == 401:
+        :param status_code: HTTP status code of the response
+        :type status_code: int
+        :param text: body of the response
+        :type text: str
+        """
+        if status_code == 401:
             raise Unauthorized()
 
-        if not response.ok:
-            raise FreeIPAError(message=response.text, code=response.status_code)
+        if status_code >= 400:
+            raise FreeIPAError(message=text, code=status_code)
+
+    @staticmethod
+    def _unwrap_result(result):
+        """
+        Returns the result of a decoded JSON RPC response, or raise its error.
 
-        result = response.json()
+        :param result: decoded JSON RPC response
+        :type result: dict
+        """
         error = result['error']
         if error:
             parse_error(error)
@@ -353,12 +1264,37 @@ class Client(object):
             self._change_password, username, new_password, old_password, otp
         )
 
-    def _change_password(self, username, new_password, old_password, otp=None):
+    def _change_password(
+        self, username, new_password, old_password, otp=None, host=None
+    ):
         """
         private function, use change_password instead
         """
+        password_url, headers, data = self._change_password_request(
+            username, new_password, old_password, otp, host
+        )
+
+        response = self._session.post(
+            password_url,
+            headers=headers,
+            data=data,
+            verify=self._verify_ssl,
+            timeout=self._timeout,
+        )
+
+        self._raise_change_password_error(
+            response.status_code, response.headers, response.text
+        )
+        return response
+
+    def _change_password_request(
+        self, username, new_password, old_password, otp=None, host=None
+    ):
+        """
+        Build the URL, headers and form data of a password change request.
+        """
         password_url = 'https://{0}/ipa/session/change_password'.format(
-            self.current_host
+            host or self._current_host
         )
         headers = {
             'Referer': password_url,
@@ -373,27 +1309,33 @@ class Client(object):
         }
         if otp:
             data['otp'] = otp
+        return password_url, headers, data
 
-        response = self._session.post(
-            password_url, headers=headers, data=data, verify=self._verify_ssl
-        )
+    @staticmethod
+    def _raise_change_password_error(status_code, headers, text):
+        """
+        Raise the exception matching a failed password change, if any.
 
-        if not response.ok:
-            raise FreeIPAError(message=response.text, code=response.status_code)
+        :param status_code: HTTP status code of the response
+        :type status_code: int
+        :param headers: headers of the response
+        :type headers: dict
+        :param text: body of the response
+        :type text: str
+        """
+        if status_code >= 400:
+            raise FreeIPAError(message=text, code=status_code)
 
-        pwchange_result = response.headers.get('X-IPA-Pwchange-Result', None)
+        pwchange_result = headers.get('X-IPA-Pwchange-Result', None)
         if pwchange_result != 'ok':
             if pwchange_result == 'invalid-password':
-                raise PWChangeInvalidPassword(
-                    message=response.text, code=response.status_code
-                )
+                raise PWChangeInvalidPassword(message=text, code=status_code)
             elif pwchange_result == 'policy-error':
-                policy_error = response.headers.get('X-IPA-Pwchange-Policy-Error', None)
+                policy_error = headers.get('X-IPA-Pwchange-Policy-Error', None)
                 raise PWChangePolicyError(
-                    message=response.text,
-                    code=response.status_code,
+                    message=text,
+                    code=status_code,
                     policy_error=policy_error,
                 )
             else:
-                raise FreeIPAError(message=response.text, code=response.status_code)
-        return response
+                raise FreeIPAError(message=text, code=status_code)
@@ -0,0 +1,666 @@
+"""Asynchronous FreeIPA JSON RPC client."""
+
+import asyncio
+import base64
+import collections
+import http.cookiejar
+import http.cookies
+import time
+
+from python_freeipa import projection
+from python_freeipa.batch import AsyncBatch
+from python_freeipa.cache import MISSING
+from python_freeipa.client import AuthenticatedSession, Client
+from python_freeipa.client_meta import ClientMeta
+from python_freeipa.commands import is_read_only
+from python_freeipa.exceptions import FreeIPAError, Unauthorized
+from python_freeipa.hosts import HostPool
+from python_freeipa.paging import FindPager
+from python_freeipa.retry import time_left
+from python_freeipa.throttle import UNTHROTTLED
+
+try:
+    import aiohttp
+except ImportError as e:
+    # Will raise if the user tries to create a session.
+    aiohttp = e
+
+
+# asyncio.get_running_loop is new in Python 3.7, get_event_loop returns the
+# running loop from within coroutines.
+_get_running_loop = getattr(asyncio, 'get_running_loop', asyncio.get_event_loop)
+
+# Session cookie of the aiohttp cookie jar, with the expiry as a POSIX timestamp.
+_SessionCookie = collections.namedtuple('_SessionCookie', ['value', 'expires'])
+
+
+class AsyncAuthenticatedSession(AuthenticatedSession):
+    """
+    Asynchronous context manager class that automatically logs out upon exit.
+    """
+
+    async def __aenter__(self):
+        """
+        Tries to perform a login, if necessary, using the login arguments specified at construction.
+
+        This method does not throw, but will store any occurring exception in ``login_exception``.
+        """
+        if not self.logged_in:
+            try:
+                if len(self._login_args) > 0:
+                    await self._client.login(*self._login_args)
+                else:
+                    await self._client.login_kerberos()
+                self._logged_in = True
+            except Exception as err:
+                self._login_exception = err
+                self._logged_in = False
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """
+        Logs out of the session, if necessary.
+        """
+        await self.logout()
+
+    async def logout(self):
+        """
+        Logs out of the current session, if any is active.
+        """
+        if self.logged_in:
+            await self._client.logout()
+            self._logged_in = False
+
+
+class AsyncClient(Client):
+    """
+    Lightweight asynchronous FreeIPA JSON RPC client.
+
+    Request building, error mapping and DNS service discovery are shared with
+    ``Client``, only the transport is different. In order to use this class, the
+    package `aiohttp <https://pypi.org/project/aiohttp/>`_ must be installed.
+    """
+
+    def __init__(
+        self,
+        host=None,
+        verify_ssl=True,
+        version=None,
+        dns_discovery=True,
+        session=None,
+        **kwargs,
+    ):
+        """
+        Initialize client with connection options.
+
+        See ``Client`` for the description of the common options. ``pool_maxsize``
+        limits the connections per host only if ``pool_block`` is set.
+
+        :param session: session to use instead of creating one on first request
+        :type session: ``aiohttp.ClientSession`` or None
+        """
+        super(AsyncClient, self).__init__(
+            host=host,
+            verify_ssl=verify_ssl,
+            version=version,
+            dns_discovery=dns_discovery,
+            **kwargs,
+        )
+        self._session = session
+        self._async_login_lock = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def _create_session(self):
+        # The aiohttp session must be created from within the event loop.
+        return None
+
+    def _get_session(self):
+        if self._session is None:
+            if isinstance(aiohttp, ImportError):
+                raise aiohttp
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self._pool_maxsize if self._pool_block else 0,
+                force_close=not self._keep_alive,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    def _timeout_kwargs(self, until=None):
+        """
+        Returns the ``timeout`` keyword argument of a request, if any.
+
+        :param until: ``time.monotonic()`` deadline of the request
+        :type until: float or None
+        """
+        timeout = time_left(until, self._timeout)
+        if timeout is None:
+            return {}
+        return {'timeout': aiohttp.ClientTimeout(total=timeout)}
+
+    def _set_session_cookie(self, host, value):
+        cookie = http.cookies.SimpleCookie()
+        cookie['ipa_session'] = value
+        cookie['ipa_session'].update({'domain': host, 'path': '/ipa', 'secure': True})
+        self._get_session().cookie_jar.update_cookies(cookie)
+
+    def _session_cookie(self, host):
+        for morsel in self._get_session().cookie_jar:
+            if morsel.key == 'ipa_session' and morsel['domain'].lstrip('.') == host:
+                expires = None
+                if morsel['max-age']:
+                    expires = int(time.time()) + int(morsel['max-age'])
+                elif morsel['expires']:
+                    expires = http.cookiejar.http2time(morsel['expires'])
+                return _SessionCookie(morsel.value, expires)
+        return None
+
+    @property
+    def _ssl(self):
+        # None lets aiohttp apply its default certificate verification.
+        return None if self._verify_ssl else False
+
+    @staticmethod
+    def _connection_errors():
+        if isinstance(aiohttp, ImportError):
+            return (OSError,)
+        return (aiohttp.ClientConnectionError, OSError)
+
+    def _failover_errors(self):
+        return (asyncio.TimeoutError,) + self._connection_errors()
+
+    def _retried_errors(self):
+        return (FreeIPAError, asyncio.TimeoutError) + self._connection_errors()
+
+    def _is_connect_error(self, err):
+        if isinstance(aiohttp, ImportError):
+            return False
+        return isinstance(err, aiohttp.ClientConnectorError)
+
+    def _throttled_async(self, host, kind, until=None):
+        if self._throttle is None:
+            return UNTHROTTLED
+        return self._throttle.limit_async(host, kind, until)
+
+    def _candidate_hosts(self):
+        if self._host:
+            return [self._host]
+        servers = self.dns_discovered
+        if self._host_pool is None or self._host_pool.servers is not servers:
+            # The health probe of Client is blocking, ejected servers are used
+            # again once their backoff expired.
+            self._host_pool = HostPool(servers)
+        return self._host_pool.ordered()
+
+    def pool_stats(self):
+        """
+        Returns an empty list, the connections of aiohttp are not tracked.
+        """
+        return []
+
+    async def close(self):
+        """
+        Closes the underlying HTTP session.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _wrap_in_dns_discovery(self, function, *args, **kwargs):
+        """
+        Wrap a coroutine function in DNS discovery.
+
+        :param function: the coroutine function to wrap
+        :type function: callable
+        :param args: the function's arguments
+        :type args: list
+        :param kwargs: the function's keyword arguments, ``host`` is added to them
+        :type kwargs: dict
+        """
+        if self._host:
+            result = await function(*args, host=self._host, **kwargs)
+            self._current_host = self._host
+            return result
+        else:
+            # DNS lookups are blocking, keep them out of the event loop.
+            loop = _get_running_loop()
+            hosts = await loop.run_in_executor(None, self._candidate_hosts)
+            for host in hosts:
+                try:
+                    result = await function(*args, host=host, **kwargs)
+                except self._connection_errors() as err:
+                    self._host_pool.report_failure(host)
+                    self.log.warning(
+                        "Could not connect discovered host: {0}".format(err)
+                    )
+                else:
+                    self._current_host = host
+                    return result
+            raise FreeIPAError("Could not connect to any host")
+
+    async def login(self, username, password):
+        """
+        Login to FreeIPA server using username and password.
+
+        :param username: user to connect
+        :type username: str
+        :param password: password of the user
+        :type password: str
+        :raises Unauthorized: raised if credentials are invalid.
+        """
+        return await self._wrap_in_dns_discovery(self._login, username, password)
+
+    async def _login(self, username, password, host=None):
+        """
+        private function, use login instead
+        """
+        host = host or self._current_host
+        if not self._restore_session(host, username):
+            login_url, headers, data = self._login_request(username, password, host)
+            async with self._get_session().post(
+                login_url,
+                headers=headers,
+                data=data,
+                ssl=self._ssl,
+                **self._timeout_kwargs(),
+            ) as response:
+                text = await response.text()
+                if response.status >= 400:
+                    self._raise_login_error(response.headers, text)
+
+            self._save_session(host, username)
+            self.log.info('Successfully logged in as {0}'.format(username))
+
+        self._authenticated_session = AsyncAuthenticatedSession(
+            self, username, password, logged_in=True
+        )
+        return self._authenticated_session
+
+    async def login_kerberos(self):
+        """
+        Login to FreeIPA server using existing Kerberos credentials.
+
+        In order to use this method, the package `gssapi <https://pypi.org/project/gssapi/>`_ must be installed and
+        a Kerberos Ticket-Granting Ticket (TGT) must be cached, see ``Client.login_kerberos``.
+
+        :raises Unauthorized: raised if credentials are invalid.
+        :raises ImportError: raised if the ``gssapi`` module is unavailable.
+        """
+        return await self._wrap_in_dns_discovery(self._login_kerberos)
+
+    def _negotiate_token(self, host):
+        """
+        Returns the SPNEGO token to authenticate against the HTTP service of host.
+        """
+        import gssapi
+
+        name = gssapi.Name('HTTP@{0}'.format(host), gssapi.NameType.hostbased_service)
+        context = gssapi.SecurityContext(name=name, usage='initiate')
+        return base64.b64encode(context.step()).decode('ascii')
+
+    async def _login_kerberos(self, host=None):
+        """
+        private function, use login_kerberos instead
+        """
+        host = host or self._current_host
+        # Reading the credential cache and obtaining a service ticket, which may
+        # contact the KDC, are blocking.
+        loop = _get_running_loop()
+        principal = None
+        if self._session_store is not None:
+            principal = await loop.run_in_executor(None, self._kerberos_principal)
+            if self._restore_session(host, principal):
+                self._authenticated_session = AsyncAuthenticatedSession(
+                    self, logged_in=True
+                )
+                return self._authenticated_session
+
+        login_url, headers = self._login_kerberos_request(host)
+        token = await loop.run_in_executor(None, self._negotiate_token, host)
+        headers['Authorization'] = 'Negotiate {0}'.format(token)
+        async with self._get_session().post(
+            login_url, headers=headers, ssl=self._ssl, **self._timeout_kwargs()
+        ) as response:
+            text = await response.text()
+            if response.status >= 400:
+                raise Unauthorized(text)
+
+        self._save_session(host, principal)
+        self.log.info(
+            'Successfully logged to {0} using Kerberos credentials.'.format(host)
+        )
+
+        self._authenticated_session = AsyncAuthenticatedSession(self, logged_in=True)
+        return self._authenticated_session
+
+    async def logout(self):
+        """
+        Logs out of the FreeIPA session.
+        """
+        self._authenticated_session = None
+        await self._request('session_logout')
+        if self._session_store is not None and self._principal is not None:
+            self._session_store.delete(self._current_host, self._principal)
+
+    async def _relogin(self, host, generation):
+        """
+        Login again to host after a request was rejected because the session expired.
+
+        See ``Client._relogin``.
+        """
+        # Created lazily, as it must belong to the running event loop.
+        if self._async_login_lock is None:
+            self._async_login_lock = asyncio.Lock()
+        async with self._async_login_lock:
+            if generation != self._session_generations.get(host, 0):
+                return True
+
+            self._forget_session(host)
+
+            if not self._reauthenticate or self._authenticated_session is None:
+                return False
+
+            self.log.info('Session on {0} expired, logging in again'.format(host))
+            self._relogins[host] += 1
+            login_args = self._authenticated_session._login_args
+            if login_args:
+                await self._login(*login_args, host=host)
+            else:
+                await self._login_kerberos(host=host)
+            return True
+
+    def batched(self, max_size=100):
+        """
+        Create a context in which calls are coalesced into ``batch`` requests.
+
+        See ``python_freeipa.batch.AsyncBatch``, calls are sent when the
+        context exits or when the batch is flushed.
+
+        :param max_size: maximum number of calls sent in one ``batch`` request,
+                         None for no limit
+        :type max_size: int or None
+        :rtype: ``AsyncBatch``
+        """
+        return AsyncBatch(self, max_size=max_size)
+
+    async def iter_find(
+        self, obj, *args, criteria=None, page_size=100, pkey=None, **params
+    ):
+        """
+        Asynchronous version of ``Client.iter_find``, to iterate over with
+        ``async for``.
+        """
+        pager = FindPager(obj, args, criteria, page_size, pkey, params)
+        found = await self._request(
+            pager.find_method, pager.find_args, pager.find_params
+        )
+        keys = pager.keys(found, self.log)
+        del found
+
+        for page in pager.pages(keys):
+            async with self.batched(max_size=None) as batch:
+                results = [batch._request(*call) for call in page]
+            for entry in pager.entries(results):
+                yield entry
+
+    def stream(self, method, args=None, params=None, chunk_size=65536):
+        """
+        Not supported by ``AsyncClient``, whose responses are read at once.
+
+        :raises TypeError: always
+        """
+        raise TypeError('stream() is not supported by AsyncClient')
+
+    def map(
+        self,
+        method,
+        keys,
+        chunk_size=100,
+        concurrency=None,
+        ordered=True,
+        **params,
+    ):
+        """
+        Not supported by ``AsyncClient``, whose fan-out runs in threads. Send
+        the calls with ``batched`` and ``asyncio.gather`` instead.
+
+        :raises TypeError: always
+        """
+        raise TypeError('map() is not supported by AsyncClient')
+
+    def to_columns(self, method, args=None, params=None, fields=None, types=None):
+        """
+        Not supported by ``AsyncClient``, see ``stream``.
+
+        :raises TypeError: always
+        """
+        raise TypeError('to_columns() is not supported by AsyncClient')
+
+    async def _request(self, method, args=None, params=None):
+        """
+        Make an HTTP request to FreeIPA JSON RPC server.
+
+        Results are read from and saved to the result cache, if enabled.
+
+        :param method: RPC method name is required
+        :type method: str
+        :param args: optional positional argument or list of arguments
+        :type args: list or string
+        :param params: optional named parameters, see ``Client._request`` for
+                       ``fields``
+        :type params: dict
+        :return: parsed response from the request
+        :rtype: dict
+        :raises FreeIPAError: if the response code is not OK
+        """
+        if params and 'fields' in params:
+            fields = params['fields']
+            params = projection.project(method, params, fields)
+            result = await self._cached_request(method, args, params)
+            return projection.trim(result, fields)
+        if self._profile is not None:
+            params = projection.apply_profile(method, params, self._profile)
+        return await self._cached_request(method, args, params)
+
+    async def _cached_request(self, method, args=None, params=None):
+        """
+        Make an HTTP request to FreeIPA JSON RPC server, through the result cache
+        if enabled.
+        """
+        cache = self._result_cache
+        if cache is None:
+            return await self._send_request(method, args, params)
+        key = cache.key(method, args, params)
+        if key is None:
+            try:
+                return await self._send_request(method, args, params)
+            finally:
+                cache.invalidate(method, args, params)
+        result = cache.get(key)
+        if result is MISSING:
+            generation = cache.generation
+            result = await self._send_request(method, args, params)
+            cache.set(key, method, result, generation)
+        return result
+
+    async def _send_request(self, method, args=None, params=None):
+        """
+        Send a request to FreeIPA JSON RPC server, bypassing the result cache.
+        """
+        read_only = is_read_only(method, args if isinstance(args, list) else None)
+        host = self._select_host(read_only)
+        session_url, headers, data = self._json_request(method, args, params, host=host)
+        event = self._hooks.start(method, host, args, data) if self._hooks else None
+
+        kind = self._command_class(method, args)
+        policy = self._retry_policy
+        # The ``deadline`` context is shared by the tasks of the thread, see
+        # ``await_deadline``.
+        until = None if policy is None else policy.deadline(enclosing=False)
+        status = text = None
+        attempt = 1
+        try:
+            while True:
+                try:
+                    host, status, text = await self._post_with_failover_async(
+                        host, session_url, headers, data, read_only, event, until, kind
+                    )
+                    self._raise_for_status(status, text)
+
+                    result = self._unwrap_result(self._codec.loads(text))
+                    break
+                except Exception as err:
+                    delay = self._retry_delay(err, method, args, attempt, until)
+                    if delay is None:
+                        raise
+                    self.log.warning(
+                        '{0} request failed, retrying in {1:.2f}s: {2!r}'.format(
+                            method, delay, err
+                        )
+                    )
+                await asyncio.sleep(delay)
+                attempt += 1
+                status = text = None
+                host = self._select_host(read_only)
+                session_url, headers = self._json_endpoint(host)
+                if event is not None:
+                    event.host = host
+                    event.retries += 1
+            if policy is not None:
+                policy.record_success()
+        except Exception as err:
+            if event is not None:
+                self._hooks.finish(event, status, text, err)
+            raise
+        if event is not None:
+            self._hooks.finish(event, status, text)
+        return result
+
+    async def _post_with_failover_async(
+        self,
+        host,
+        session_url,
+        headers,
+        data,
+        read_only,
+        event=None,
+        until=None,
+        kind=None,
+    ):
+        """
+        Asynchronous version of ``Client._post_with_failover``, logging in again
+        if the session expired.
+
+        :return: the host that answered, and the status code and body of its
+                 response
+        :rtype: tuple of str, int and str
+        """
+        tried = set()
+        while True:
+            start = time.time()
+            try:
+                async with self._throttled_async(host, kind, until):
+                    generation = self._session_generations.get(host, 0)
+                    status, text = await self._post_text(
+                        session_url, headers, data, until
+                    )
+                    if status == 401 and await self._relogin(host, generation):
+                        if event is not None:
+                            event.retries += 1
+                        status, text = await self._post_text(
+                            session_url, headers, data, until
+                        )
+            except self._failover_errors() as err:
+                tried.add(host)
+                next_host = self._fail_over(host, err, read_only, tried)
+                if next_host is None:
+                    raise
+                host = next_host
+                session_url, headers = self._json_endpoint(host)
+                if event is not None:
+                    event.host = host
+                    event.retries += 1
+            else:
+                self._report_response(host, status, time.time() - start)
+                return host, status, text
+
+    async def _post_text(self, url, headers, data, until=None):
+        """
+        Send a POST request and returns the status code and body of the response.
+
+        :param until: ``time.monotonic()`` deadline of the request
+        :type until: float or None
+        """
+        async with self._get_session().post(
+            url,
+            headers=headers,
+            data=data,
+            ssl=self._ssl,
+            **self._timeout_kwargs(until),
+        ) as response:
+            return response.status, await response.text()
+
+    async def change_password(self, username, new_password, old_password, otp=None):
+        """
+        Set the password of a user. (Does not expire)
+
+        :param username: User login (username)
+        :type username: str
+        :param new_password: New password for the user
+        :type new_password: str
+        :param old_password: Users old password
+        :type old_password: str
+        :param otp: User's OTP token if they have one
+        :type otp: str or None
+        """
+        return await self._wrap_in_dns_discovery(
+            self._change_password, username, new_password, old_password, otp
+        )
+
+    async def _change_password(
+        self, username, new_password, old_password, otp=None, host=None
+    ):
+        """
+        private function, use change_password instead
+        """
+        password_url, headers, data = self._change_password_request(
+            username, new_password, old_password, otp, host
+        )
+
+        async with self._get_session().post(
+            password_url,
+            headers=headers,
+            data=data,
+            ssl=self._ssl,
+            **self._timeout_kwargs(),
+        ) as response:
+            text = await response.text()
+            self._raise_change_password_error(response.status, response.headers, text)
+        return response
+
+
+class AsyncClientMeta(ClientMeta, AsyncClient):
+    """
+    Autogenerated client whose command methods return coroutines.
+
+    Every method of ``ClientMeta`` returns the result of ``_request``, which is
+    a coroutine here, so the calls have to be awaited:
+
+    .. code-block:: python
+
+        async with AsyncClientMeta('ipa.demo1.freeipa.org') as client:
+            await client.login('admin', 'Secret123')
+            user = await client.user_show('admin')
+    """
+
+    def __init__(
+        self, host=None, verify_ssl=True, dns_discovery=True, session=None, **kwargs
+    ):
+        super(AsyncClientMeta, self).__init__(
+            host=host, verify_ssl=verify_ssl, dns_discovery=dns_discovery, **kwargs
+        )
+        self._session = session
@@ -0,0 +1,267 @@
+"""FreeIPA client whose commands are built from the schema of the server."""
+
+import json
+import os
+import tempfile
+import threading
+import time
+import types
+
+from python_freeipa.client import Client
+from python_freeipa.exceptions import FreeIPAError
+from python_freeipa.specs import CommandSpec
+
+# Used when the server does not tell how long its schema may be cached.
+DEFAULT_SCHEMA_TTL = 3600
+
+
+def default_schema_path():
+    """
+    Returns the default directory of the schema cache, in the XDG cache directory.
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache'
+    )
+    return os.path.join(cache_home, 'python-freeipa', 'schema')
+
+
+class SchemaCache(object):
+    """
+    On-disk cache of the command specs of FreeIPA servers.
+
+    Specs are stored in one JSON file per schema, named after the API version
+    and the fingerprint of the schema. The fingerprint each server announced is
+    also stored, with the time until which it may be trusted without asking the
+    server again.
+    """
+
+    def __init__(self, path=None):
+        """
+        :param path: directory of the cache, created if needed
+        :type path: str or None
+        """
+        self._path = path or default_schema_path()
+        self._lock = threading.Lock()
+
+    def fingerprints(self):
+        """
+        Returns the fingerprints of the cached schemas.
+        """
+        return list(self._schema_files())
+
+    def get(self, fingerprint):
+        """
+        Returns the cached schema with fingerprint, None if it is not cached.
+
+        :rtype: dict with ``version`` and ``commands`` keys, or None
+        """
+        name = self._schema_files().get(fingerprint)
+        return None if name is None else self._load(name)
+
+    def set(self, fingerprint, version, commands):
+        """
+        Caches a schema.
+
+        :param commands: specs of the commands by name
+        :type commands: dict of ``CommandSpec``
+        """
+        self._dump(
+            '{0}-{1}.json'.format(version, fingerprint),
+            {
+                'version': version,
+                'fingerprint': fingerprint,
+                'commands': {name: spec.to_dict() for name, spec in commands.items()},
+            },
+        )
+
+    def server_fingerprint(self, host):
+        """
+        Returns the fingerprint host announced, None if it has to be asked again.
+        """
+        entry = (self._load('servers.json') or {}).get(host)
+        if entry is None or entry['expires'] <= time.time():
+            return None
+        return entry['fingerprint']
+
+    def set_server_fingerprint(self, host, fingerprint, ttl):
+        """
+        Records the fingerprint of the schema of host, valid for ttl seconds.
+        """
+        with self._lock:
+            servers = self._load('servers.json') or {}
+            servers[host] = {'fingerprint': fingerprint, 'expires': time.time() + ttl}
+            self._dump('servers.json', servers)
+
+    def _schema_files(self):
+        """
+        Returns the names of the schema files by fingerprint.
+        """
+        try:
+            names = os.listdir(self._path)
+        except OSError:
+            return {}
+        return {
+            name[:-5].split('-', 1)[1]: name
+            for name in names
+            if name.endswith('.json') and '-' in name
+        }
+
+    def _load(self, name):
+        try:
+            with open(os.path.join(self._path, name)) as cache_file:
+                return json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def _dump(self, name, value):
+        if not os.path.isdir(self._path):
+            os.makedirs(self._path, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self._path)
+        try:
+            with os.fdopen(fd, 'w') as cache_file:
+                json.dump(value, cache_file)
+            os.replace(temp_path, os.path.join(self._path, name))
+        except Exception:
+            os.unlink(temp_path)
+            raise
+
+
+def _command_method(spec):
+    def command(self, *args, **kwargs):
+        _args, _params = spec.marshal(args, kwargs)
+        return self._request(spec.name, _args, _params)
+
+    command.__name__ = spec.name
+    command.__doc__ = spec.doc
+    return command
+
+
+class ClientDynamic(Client):
+    """
+    Client whose command methods are built from the schema of the server.
+
+    Unlike ``ClientMeta``, the commands always match the server. They take the
+    same arguments as the methods of ``ClientMeta``, and are available once
+    logged in. The schema is fetched from the server once per schema change,
+    and cached on disk: a new client only asks the server whether its cached
+    schema is up to date, at most once per the TTL set by the server.
+    """
+
+    def __init__(
+        self,
+        host=None,
+        verify_ssl=True,
+        dns_discovery=True,
+        schema_cache=None,
+        **kwargs
+    ):
+        """
+        :param schema_cache: cache of the schemas, by default in
+                             ``$XDG_CACHE_HOME/python-freeipa/schema``
+        :type schema_cache: ``SchemaCache``, str (path of the cache) or None
+        """
+        if not isinstance(schema_cache, SchemaCache):
+            schema_cache = SchemaCache(schema_cache)
+        self._schema_cache = schema_cache
+        self._commands = None
+        self._methods = {}
+        self._schema_lock = threading.Lock()
+        super(ClientDynamic, self).__init__(
+            host=host, verify_ssl=verify_ssl, dns_discovery=dns_discovery, **kwargs
+        )
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        spec = self._load_commands().get(name)
+        if spec is None:
+            raise AttributeError(
+                "'{0}' object has no attribute '{1}'".format(type(self).__name__, name)
+            )
+        method = self._methods.get(name)
+        if method is None:
+            method = self._methods[name] = _command_method(spec)
+        return types.MethodType(method, self)
+
+    def __dir__(self):
+        commands = self._commands or {}
+        return sorted(set(super(ClientDynamic, self).__dir__()) | set(commands))
+
+    @property
+    def commands(self):
+        """
+        Specs of the commands of the server by name, loaded on first use.
+
+        :rtype: dict of ``python_freeipa.specs.CommandSpec``
+        """
+        return self._load_commands()
+
+    def _load_commands(self):
+        if self._commands is None:
+            with self._schema_lock:
+                if self._commands is None:
+                    self.load_schema()
+        return self._commands
+
+    def load_schema(self):
+        """
+        Loads the commands of the current server, from the cache if it is up to
+        date with the server.
+        """
+        host = self._current_host
+        cache = self._schema_cache
+        schema = None
+        fingerprint = cache.server_fingerprint(host)
+        if fingerprint is not None:
+            schema = cache.get(fingerprint)
+        commands = None
+        if schema is None:
+            fingerprint, ttl, commands = self._fetch_schema(cache.fingerprints())
+            cache.set_server_fingerprint(host, fingerprint, ttl)
+            if commands is None:
+                schema = cache.get(fingerprint)
+        if schema is None:
+            version = self._request('env', ['api_version'], {})['result']['api_version']
+            if commands is None:
+                # Servers without the commands in their schema response.
+                metadata = self._request('json_metadata', [], {'command': 'all'})
+                commands = {
+                    name: CommandSpec.from_metadata(name, command)
+                    for name, command in metadata['commands'].items()
+                }
+            cache.set(fingerprint, version, commands)
+        else:
+            version = schema['version']
+            commands = {
+                name: CommandSpec.from_dict(name, command)
+                for name, command in schema['commands'].items()
+            }
+        self._version = version
+        self._methods = {}
+        self._commands = commands
+
+    def _fetch_schema(self, known_fingerprints):
+        """
+        Returns the fingerprint of the schema of the server, how long it may be
+        cached, and the specs of its commands by name, None if the schema is
+        one of the known ones.
+        """
+        try:
+            result = self._request(
+                'schema', [], {'known_fingerprints': known_fingerprints}
+            )
+        except FreeIPAError as err:
+            if err.name != 'SchemaUpToDate' or not err.data:
+                raise
+            result = err.data
+        commands = None
+        if result.get('commands'):
+            commands = {}
+            for command in result['commands']:
+                spec = CommandSpec.from_schema(command)
+                commands[spec.name] = spec
+        return (
+            result['fingerprint'],
+            result.get('ttl') or DEFAULT_SCHEMA_TTL,
+            commands,
+        )
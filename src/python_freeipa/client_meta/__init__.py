@@ -0,0 +1,479 @@
+from python_freeipa.client import Client
+from python_freeipa.lazy import LazyCommands
+
+
+class ClientMeta(Client, LazyCommands):
+    version = '2.235'
+    _command_modules = {
+        'aci_add': '_aci',
+        'aci_del': '_aci',
+        'aci_find': '_aci',
+        'aci_mod': '_aci',
+        'aci_rename': '_aci',
+        'aci_show': '_aci',
+        'adtrust_is_enabled': '_adtrust',
+        'automember_add': '_automember',
+        'automember_add_condition': '_automember',
+        'automember_default_group_remove': '_automember',
+        'automember_default_group_set': '_automember',
+        'automember_default_group_show': '_automember',
+        'automember_del': '_automember',
+        'automember_find': '_automember',
+        'automember_find_orphans': '_automember',
+        'automember_mod': '_automember',
+        'automember_rebuild': '_automember',
+        'automember_remove_condition': '_automember',
+        'automember_show': '_automember',
+        'automountkey_add': '_automount',
+        'automountkey_del': '_automount',
+        'automountkey_find': '_automount',
+        'automountkey_mod': '_automount',
+        'automountkey_show': '_automount',
+        'automountlocation_add': '_automount',
+        'automountlocation_del': '_automount',
+        'automountlocation_find': '_automount',
+        'automountlocation_show': '_automount',
+        'automountlocation_tofiles': '_automount',
+        'automountmap_add': '_automount',
+        'automountmap_add_indirect': '_automount',
+        'automountmap_del': '_automount',
+        'automountmap_find': '_automount',
+        'automountmap_mod': '_automount',
+        'automountmap_show': '_automount',
+        'batch': '_batch',
+        'ca_add': '_ca',
+        'ca_del': '_ca',
+        'ca_disable': '_ca',
+        'ca_enable': '_ca',
+        'ca_find': '_ca',
+        'ca_is_enabled': '_ca',
+        'ca_mod': '_ca',
+        'ca_show': '_ca',
+        'caacl_add': '_ca',
+        'caacl_add_ca': '_ca',
+        'caacl_add_host': '_ca',
+        'caacl_add_profile': '_ca',
+        'caacl_add_service': '_ca',
+        'caacl_add_user': '_ca',
+        'caacl_del': '_ca',
+        'caacl_disable': '_ca',
+        'caacl_enable': '_ca',
+        'caacl_find': '_ca',
+        'caacl_mod': '_ca',
+        'caacl_remove_ca': '_ca',
+        'caacl_remove_host': '_ca',
+        'caacl_remove_profile': '_ca',
+        'caacl_remove_service': '_ca',
+        'caacl_remove_user': '_ca',
+        'caacl_show': '_ca',
+        'cert_find': '_cert',
+        'cert_remove_hold': '_cert',
+        'cert_request': '_cert',
+        'cert_revoke': '_cert',
+        'cert_show': '_cert',
+        'cert_status': '_cert',
+        'certmap_match': '_cert',
+        'certmapconfig_mod': '_cert',
+        'certmapconfig_show': '_cert',
+        'certmaprule_add': '_cert',
+        'certmaprule_del': '_cert',
+        'certmaprule_disable': '_cert',
+        'certmaprule_enable': '_cert',
+        'certmaprule_find': '_cert',
+        'certmaprule_mod': '_cert',
+        'certmaprule_show': '_cert',
+        'certprofile_del': '_cert',
+        'certprofile_find': '_cert',
+        'certprofile_import': '_cert',
+        'certprofile_mod': '_cert',
+        'certprofile_show': '_cert',
+        'class_find': '_class',
+        'class_show': '_class',
+        'command_defaults': '_command',
+        'command_find': '_command',
+        'command_show': '_command',
+        'compat_is_enabled': '_compat',
+        'config_mod': '_config',
+        'config_show': '_config',
+        'cosentry_add': '_cosentry',
+        'cosentry_del': '_cosentry',
+        'cosentry_find': '_cosentry',
+        'cosentry_mod': '_cosentry',
+        'cosentry_show': '_cosentry',
+        'delegation_add': '_delegation',
+        'delegation_del': '_delegation',
+        'delegation_find': '_delegation',
+        'delegation_mod': '_delegation',
+        'delegation_show': '_delegation',
+        'dns_is_enabled': '_dns',
+        'dns_resolve': '_dns',
+        'dns_update_system_records': '_dns',
+        'dnsconfig_mod': '_dns',
+        'dnsconfig_show': '_dns',
+        'dnsforwardzone_add': '_dns',
+        'dnsforwardzone_add_permission': '_dns',
+        'dnsforwardzone_del': '_dns',
+        'dnsforwardzone_disable': '_dns',
+        'dnsforwardzone_enable': '_dns',
+        'dnsforwardzone_find': '_dns',
+        'dnsforwardzone_mod': '_dns',
+        'dnsforwardzone_remove_permission': '_dns',
+        'dnsforwardzone_show': '_dns',
+        'dnsrecord_add': '_dns',
+        'dnsrecord_del': '_dns',
+        'dnsrecord_delentry': '_dns',
+        'dnsrecord_find': '_dns',
+        'dnsrecord_mod': '_dns',
+        'dnsrecord_show': '_dns',
+        'dnsrecord_split_parts': '_dns',
+        'dnsserver_find': '_dns',
+        'dnsserver_mod': '_dns',
+        'dnsserver_show': '_dns',
+        'dnszone_add': '_dns',
+        'dnszone_add_permission': '_dns',
+        'dnszone_del': '_dns',
+        'dnszone_disable': '_dns',
+        'dnszone_enable': '_dns',
+        'dnszone_find': '_dns',
+        'dnszone_mod': '_dns',
+        'dnszone_remove_permission': '_dns',
+        'dnszone_show': '_dns',
+        'domainlevel_get': '_domainlevel',
+        'domainlevel_set': '_domainlevel',
+        'env': '_env',
+        'group_add': '_group',
+        'group_add_member': '_group',
+        'group_add_member_manager': '_group',
+        'group_del': '_group',
+        'group_detach': '_group',
+        'group_find': '_group',
+        'group_mod': '_group',
+        'group_remove_member': '_group',
+        'group_remove_member_manager': '_group',
+        'group_show': '_group',
+        'hbacrule_add': '_hbac',
+        'hbacrule_add_host': '_hbac',
+        'hbacrule_add_service': '_hbac',
+        'hbacrule_add_sourcehost': '_hbac',
+        'hbacrule_add_user': '_hbac',
+        'hbacrule_del': '_hbac',
+        'hbacrule_disable': '_hbac',
+        'hbacrule_enable': '_hbac',
+        'hbacrule_find': '_hbac',
+        'hbacrule_mod': '_hbac',
+        'hbacrule_remove_host': '_hbac',
+        'hbacrule_remove_service': '_hbac',
+        'hbacrule_remove_sourcehost': '_hbac',
+        'hbacrule_remove_user': '_hbac',
+        'hbacrule_show': '_hbac',
+        'hbacsvc_add': '_hbac',
+        'hbacsvc_del': '_hbac',
+        'hbacsvc_find': '_hbac',
+        'hbacsvc_mod': '_hbac',
+        'hbacsvc_show': '_hbac',
+        'hbacsvcgroup_add': '_hbac',
+        'hbacsvcgroup_add_member': '_hbac',
+        'hbacsvcgroup_del': '_hbac',
+        'hbacsvcgroup_find': '_hbac',
+        'hbacsvcgroup_mod': '_hbac',
+        'hbacsvcgroup_remove_member': '_hbac',
+        'hbacsvcgroup_show': '_hbac',
+        'hbactest': '_hbac',
+        'host_add': '_host',
+        'host_add_cert': '_host',
+        'host_add_managedby': '_host',
+        'host_add_principal': '_host',
+        'host_allow_create_keytab': '_host',
+        'host_allow_retrieve_keytab': '_host',
+        'host_del': '_host',
+        'host_disable': '_host',
+        'host_disallow_create_keytab': '_host',
+        'host_disallow_retrieve_keytab': '_host',
+        'host_find': '_host',
+        'host_mod': '_host',
+        'host_remove_cert': '_host',
+        'host_remove_managedby': '_host',
+        'host_remove_principal': '_host',
+        'host_show': '_host',
+        'hostgroup_add': '_hostgroup',
+        'hostgroup_add_member': '_hostgroup',
+        'hostgroup_add_member_manager': '_hostgroup',
+        'hostgroup_del': '_hostgroup',
+        'hostgroup_find': '_hostgroup',
+        'hostgroup_mod': '_hostgroup',
+        'hostgroup_remove_member': '_hostgroup',
+        'hostgroup_remove_member_manager': '_hostgroup',
+        'hostgroup_show': '_hostgroup',
+        'i18n_messages': '_i18n',
+        'idoverridegroup_add': '_idoverride',
+        'idoverridegroup_del': '_idoverride',
+        'idoverridegroup_find': '_idoverride',
+        'idoverridegroup_mod': '_idoverride',
+        'idoverridegroup_show': '_idoverride',
+        'idoverrideuser_add': '_idoverride',
+        'idoverrideuser_add_cert': '_idoverride',
+        'idoverrideuser_del': '_idoverride',
+        'idoverrideuser_find': '_idoverride',
+        'idoverrideuser_mod': '_idoverride',
+        'idoverrideuser_remove_cert': '_idoverride',
+        'idoverrideuser_show': '_idoverride',
+        'idrange_add': '_idrange',
+        'idrange_del': '_idrange',
+        'idrange_find': '_idrange',
+        'idrange_mod': '_idrange',
+        'idrange_show': '_idrange',
+        'idview_add': '_idview',
+        'idview_apply': '_idview',
+        'idview_del': '_idview',
+        'idview_find': '_idview',
+        'idview_mod': '_idview',
+        'idview_show': '_idview',
+        'idview_unapply': '_idview',
+        'join': '_join',
+        'json_metadata': '_json',
+        'kra_is_enabled': '_kra',
+        'krbtpolicy_mod': '_krbtpolicy',
+        'krbtpolicy_reset': '_krbtpolicy',
+        'krbtpolicy_show': '_krbtpolicy',
+        'location_add': '_location',
+        'location_del': '_location',
+        'location_find': '_location',
+        'location_mod': '_location',
+        'location_show': '_location',
+        'migrate_ds': '_migrate',
+        'netgroup_add': '_netgroup',
+        'netgroup_add_member': '_netgroup',
+        'netgroup_del': '_netgroup',
+        'netgroup_find': '_netgroup',
+        'netgroup_mod': '_netgroup',
+        'netgroup_remove_member': '_netgroup',
+        'netgroup_show': '_netgroup',
+        'otpconfig_mod': '_otp',
+        'otpconfig_show': '_otp',
+        'otptoken_add': '_otp',
+        'otptoken_add_managedby': '_otp',
+        'otptoken_del': '_otp',
+        'otptoken_find': '_otp',
+        'otptoken_mod': '_otp',
+        'otptoken_remove_managedby': '_otp',
+        'otptoken_show': '_otp',
+        'output_find': '_output',
+        'output_show': '_output',
+        'param_find': '_param',
+        'param_show': '_param',
+        'passwd': '_passwd',
+        'permission_add': '_permission',
+        'permission_add_member': '_permission',
+        'permission_add_noaci': '_permission',
+        'permission_del': '_permission',
+        'permission_find': '_permission',
+        'permission_mod': '_permission',
+        'permission_remove_member': '_permission',
+        'permission_show': '_permission',
+        'ping': '_ping',
+        'pkinit_status': '_pkinit',
+        'plugins': '_plugins',
+        'privilege_add': '_privilege',
+        'privilege_add_member': '_privilege',
+        'privilege_add_permission': '_privilege',
+        'privilege_del': '_privilege',
+        'privilege_find': '_privilege',
+        'privilege_mod': '_privilege',
+        'privilege_remove_member': '_privilege',
+        'privilege_remove_permission': '_privilege',
+        'privilege_show': '_privilege',
+        'pwpolicy_add': '_pwpolicy',
+        'pwpolicy_del': '_pwpolicy',
+        'pwpolicy_find': '_pwpolicy',
+        'pwpolicy_mod': '_pwpolicy',
+        'pwpolicy_show': '_pwpolicy',
+        'radiusproxy_add': '_radiusproxy',
+        'radiusproxy_del': '_radiusproxy',
+        'radiusproxy_find': '_radiusproxy',
+        'radiusproxy_mod': '_radiusproxy',
+        'radiusproxy_show': '_radiusproxy',
+        'realmdomains_mod': '_realmdomains',
+        'realmdomains_show': '_realmdomains',
+        'role_add': '_role',
+        'role_add_member': '_role',
+        'role_add_privilege': '_role',
+        'role_del': '_role',
+        'role_find': '_role',
+        'role_mod': '_role',
+        'role_remove_member': '_role',
+        'role_remove_privilege': '_role',
+        'role_show': '_role',
+        'schema': '_schema',
+        'selfservice_add': '_selfservice',
+        'selfservice_del': '_selfservice',
+        'selfservice_find': '_selfservice',
+        'selfservice_mod': '_selfservice',
+        'selfservice_show': '_selfservice',
+        'selinuxusermap_add': '_selinuxusermap',
+        'selinuxusermap_add_host': '_selinuxusermap',
+        'selinuxusermap_add_user': '_selinuxusermap',
+        'selinuxusermap_del': '_selinuxusermap',
+        'selinuxusermap_disable': '_selinuxusermap',
+        'selinuxusermap_enable': '_selinuxusermap',
+        'selinuxusermap_find': '_selinuxusermap',
+        'selinuxusermap_mod': '_selinuxusermap',
+        'selinuxusermap_remove_host': '_selinuxusermap',
+        'selinuxusermap_remove_user': '_selinuxusermap',
+        'selinuxusermap_show': '_selinuxusermap',
+        'server_conncheck': '_server',
+        'server_del': '_server',
+        'server_find': '_server',
+        'server_mod': '_server',
+        'server_role_find': '_server',
+        'server_role_show': '_server',
+        'server_show': '_server',
+        'server_state': '_server',
+        'service_add': '_service',
+        'service_add_cert': '_service',
+        'service_add_host': '_service',
+        'service_add_principal': '_service',
+        'service_add_smb': '_service',
+        'service_allow_create_keytab': '_service',
+        'service_allow_retrieve_keytab': '_service',
+        'service_del': '_service',
+        'service_disable': '_service',
+        'service_disallow_create_keytab': '_service',
+        'service_disallow_retrieve_keytab': '_service',
+        'service_find': '_service',
+        'service_mod': '_service',
+        'service_remove_cert': '_service',
+        'service_remove_host': '_service',
+        'service_remove_principal': '_service',
+        'service_show': '_service',
+        'servicedelegationrule_add': '_servicedelegation',
+        'servicedelegationrule_add_member': '_servicedelegation',
+        'servicedelegationrule_add_target': '_servicedelegation',
+        'servicedelegationrule_del': '_servicedelegation',
+        'servicedelegationrule_find': '_servicedelegation',
+        'servicedelegationrule_remove_member': '_servicedelegation',
+        'servicedelegationrule_remove_target': '_servicedelegation',
+        'servicedelegationrule_show': '_servicedelegation',
+        'servicedelegationtarget_add': '_servicedelegation',
+        'servicedelegationtarget_add_member': '_servicedelegation',
+        'servicedelegationtarget_del': '_servicedelegation',
+        'servicedelegationtarget_find': '_servicedelegation',
+        'servicedelegationtarget_remove_member': '_servicedelegation',
+        'servicedelegationtarget_show': '_servicedelegation',
+        'session_logout': '_session',
+        'sidgen_was_run': '_sidgen',
+        'stageuser_activate': '_stageuser',
+        'stageuser_add': '_stageuser',
+        'stageuser_add_cert': '_stageuser',
+        'stageuser_add_certmapdata': '_stageuser',
+        'stageuser_add_manager': '_stageuser',
+        'stageuser_add_principal': '_stageuser',
+        'stageuser_del': '_stageuser',
+        'stageuser_find': '_stageuser',
+        'stageuser_mod': '_stageuser',
+        'stageuser_remove_cert': '_stageuser',
+        'stageuser_remove_certmapdata': '_stageuser',
+        'stageuser_remove_manager': '_stageuser',
+        'stageuser_remove_principal': '_stageuser',
+        'stageuser_show': '_stageuser',
+        'sudocmd_add': '_sudo',
+        'sudocmd_del': '_sudo',
+        'sudocmd_find': '_sudo',
+        'sudocmd_mod': '_sudo',
+        'sudocmd_show': '_sudo',
+        'sudocmdgroup_add': '_sudo',
+        'sudocmdgroup_add_member': '_sudo',
+        'sudocmdgroup_del': '_sudo',
+        'sudocmdgroup_find': '_sudo',
+        'sudocmdgroup_mod': '_sudo',
+        'sudocmdgroup_remove_member': '_sudo',
+        'sudocmdgroup_show': '_sudo',
+        'sudorule_add': '_sudo',
+        'sudorule_add_allow_command': '_sudo',
+        'sudorule_add_deny_command': '_sudo',
+        'sudorule_add_host': '_sudo',
+        'sudorule_add_option': '_sudo',
+        'sudorule_add_runasgroup': '_sudo',
+        'sudorule_add_runasuser': '_sudo',
+        'sudorule_add_user': '_sudo',
+        'sudorule_del': '_sudo',
+        'sudorule_disable': '_sudo',
+        'sudorule_enable': '_sudo',
+        'sudorule_find': '_sudo',
+        'sudorule_mod': '_sudo',
+        'sudorule_remove_allow_command': '_sudo',
+        'sudorule_remove_deny_command': '_sudo',
+        'sudorule_remove_host': '_sudo',
+        'sudorule_remove_option': '_sudo',
+        'sudorule_remove_runasgroup': '_sudo',
+        'sudorule_remove_runasuser': '_sudo',
+        'sudorule_remove_user': '_sudo',
+        'sudorule_show': '_sudo',
+        'topic_find': '_topic',
+        'topic_show': '_topic',
+        'topologysegment_add': '_topology',
+        'topologysegment_del': '_topology',
+        'topologysegment_find': '_topology',
+        'topologysegment_mod': '_topology',
+        'topologysegment_reinitialize': '_topology',
+        'topologysegment_show': '_topology',
+        'topologysuffix_add': '_topology',
+        'topologysuffix_del': '_topology',
+        'topologysuffix_find': '_topology',
+        'topologysuffix_mod': '_topology',
+        'topologysuffix_show': '_topology',
+        'topologysuffix_verify': '_topology',
+        'trust_add': '_trust',
+        'trust_del': '_trust',
+        'trust_fetch_domains': '_trust',
+        'trust_find': '_trust',
+        'trust_mod': '_trust',
+        'trust_resolve': '_trust',
+        'trust_show': '_trust',
+        'trustconfig_mod': '_trust',
+        'trustconfig_show': '_trust',
+        'trustdomain_add': '_trust',
+        'trustdomain_del': '_trust',
+        'trustdomain_disable': '_trust',
+        'trustdomain_enable': '_trust',
+        'trustdomain_find': '_trust',
+        'trustdomain_mod': '_trust',
+        'user_add': '_user',
+        'user_add_cert': '_user',
+        'user_add_certmapdata': '_user',
+        'user_add_manager': '_user',
+        'user_add_principal': '_user',
+        'user_del': '_user',
+        'user_disable': '_user',
+        'user_enable': '_user',
+        'user_find': '_user',
+        'user_mod': '_user',
+        'user_remove_cert': '_user',
+        'user_remove_certmapdata': '_user',
+        'user_remove_manager': '_user',
+        'user_remove_principal': '_user',
+        'user_show': '_user',
+        'user_stage': '_user',
+        'user_status': '_user',
+        'user_undel': '_user',
+        'user_unlock': '_user',
+        'vault_add_internal': '_vault',
+        'vault_add_member': '_vault',
+        'vault_add_owner': '_vault',
+        'vault_archive_internal': '_vault',
+        'vault_del': '_vault',
+        'vault_find': '_vault',
+        'vault_mod_internal': '_vault',
+        'vault_remove_member': '_vault',
+        'vault_remove_owner': '_vault',
+        'vault_retrieve_internal': '_vault',
+        'vault_show': '_vault',
+        'vaultconfig_show': '_vault',
+        'vaultcontainer_add_owner': '_vault',
+        'vaultcontainer_del': '_vault',
+        'vaultcontainer_remove_owner': '_vault',
+        'vaultcontainer_show': '_vault',
+        'whoami': '_whoami',
+    }
+
+    def __init__(self, host=None, verify_ssl=True, dns_discovery=True, **kwargs):
+        super(ClientMeta, self).__init__(host=host, verify_ssl=verify_ssl, version=self.version, dns_discovery=dns_discovery, **kwargs)
@@ -0,0 +1,437 @@
+class Commands(object):
+
+    def aci_add(
+        self,
+        a_aciname,
+        o_permissions,
+        o_aciprefix,
+        o_permission=None,
+        o_group=None,
+        o_attrs=None,
+        o_type=None,
+        o_memberof=None,
+        o_filter=None,
+        o_subtree=None,
+        o_targetgroup=None,
+        o_selfaci=False,
+        o_test=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Create new ACI.
+
+
+        :param a_aciname: ACI name
+        :type  a_aciname: str
+        :param o_permission: Permission ACI grants access to
+        :type  o_permission: str
+        :param o_group: User group ACI grants access to
+        :type  o_group: str
+        :param o_permissions: Permissions to grant(read, write, add, delete,
+            all)
+        :type  o_permissions: str
+        :param o_attrs: Attributes
+        :type  o_attrs: str
+        :param o_type: type of IPA object (user, group, host, hostgroup,
+            service, netgroup)
+        :type  o_type: str, valid values ['user', 'group', 'host', 'service', 'hostgroup', 'netgroup', 'dnsrecord']
+        :param o_memberof: Member of a group
+        :type  o_memberof: str
+        :param o_filter: Legal LDAP filter (e.g. ou=Engineering)
+        :type  o_filter: str
+        :param o_subtree: Subtree to apply ACI to
+        :type  o_subtree: str
+        :param o_targetgroup: Group to apply ACI to
+        :type  o_targetgroup: str
+        :param o_selfaci: Apply ACI to your own entry (self)
+        :type  o_selfaci: bool
+        :param o_aciprefix: Prefix used to distinguish ACI types (permission,
+            delegation, selfservice, none)
+        :type  o_aciprefix: str, valid values ['permission', 'delegation', 'selfservice', 'none']
+        :param o_test: Test the ACI syntax but don't write anything
+        :type  o_test: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_aciname]
+        _params = {
+            'permissions': o_permissions,
+            'aciprefix': o_aciprefix,
+            'all': o_all,
+            'raw': o_raw,
+        }
+        if o_permission is not None:
+            _params['permission'] = o_permission
+        if o_group is not None:
+            _params['group'] = o_group
+        if o_attrs is not None:
+            _params['attrs'] = o_attrs
+        if o_type is not None:
+            _params['type'] = o_type
+        if o_memberof is not None:
+            _params['memberof'] = o_memberof
+        if o_filter is not None:
+            _params['filter'] = o_filter
+        if o_subtree is not None:
+            _params['subtree'] = o_subtree
+        if o_targetgroup is not None:
+            _params['targetgroup'] = o_targetgroup
+        if o_selfaci is not None:
+            _params['selfaci'] = o_selfaci
+        if o_test is not None:
+            _params['test'] = o_test
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('aci_add', _args, _params)
+
+    def aci_del(
+        self,
+        a_aciname,
+        o_aciprefix,
+        **kwargs
+    ):
+        """
+        Delete ACI.
+
+
+        :param a_aciname: ACI name
+        :type  a_aciname: str
+        :param o_aciprefix: Prefix used to distinguish ACI types (permission,
+            delegation, selfservice, none)
+        :type  o_aciprefix: str, valid values ['permission', 'delegation', 'selfservice', 'none']
+        """
+        _args = [a_aciname]
+        _params = {'aciprefix': o_aciprefix}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('aci_del', _args, _params)
+
+    def aci_find(
+        self,
+        a_criteria=None,
+        o_aciname=None,
+        o_permission=None,
+        o_group=None,
+        o_permissions=None,
+        o_attrs=None,
+        o_type=None,
+        o_memberof=None,
+        o_filter=None,
+        o_subtree=None,
+        o_targetgroup=None,
+        o_selfaci=None,
+        o_aciprefix=None,
+        o_pkey_only=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Search for ACIs.
+
+            Returns a list of ACIs
+
+            EXAMPLES:
+
+             To find all ACIs that apply directly to members of the group ipausers:
+               ipa aci-find --memberof=ipausers
+
+             To find all ACIs that grant add access:
+               ipa aci-find --permissions=add
+
+            Note that the find command only looks for the given text in the set of
+            ACIs, it does not evaluate the ACIs to see if something would apply.
+            For example, searching on memberof=ipausers will find all ACIs that
+            have ipausers as a memberof. There may be other ACIs that apply to
+            members of that group indirectly.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_aciname: ACI name
+        :type  o_aciname: str
+        :param o_permission: Permission ACI grants access to
+        :type  o_permission: str
+        :param o_group: User group ACI grants access to
+        :type  o_group: str
+        :param o_permissions: Permissions to grant(read, write, add, delete,
+            all)
+        :type  o_permissions: str
+        :param o_attrs: Attributes
+        :type  o_attrs: str
+        :param o_type: type of IPA object (user, group, host, hostgroup,
+            service, netgroup)
+        :type  o_type: str, valid values ['user', 'group', 'host', 'service', 'hostgroup', 'netgroup', 'dnsrecord']
+        :param o_memberof: Member of a group
+        :type  o_memberof: str
+        :param o_filter: Legal LDAP filter (e.g. ou=Engineering)
+        :type  o_filter: str
+        :param o_subtree: Subtree to apply ACI to
+        :type  o_subtree: str
+        :param o_targetgroup: Group to apply ACI to
+        :type  o_targetgroup: str
+        :param o_selfaci: Apply ACI to your own entry (self)
+        :type  o_selfaci: Bool
+        :param o_aciprefix: Prefix used to distinguish ACI types (permission,
+            delegation, selfservice, none)
+        :type  o_aciprefix: str, valid values ['permission', 'delegation', 'selfservice', 'none']
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("name")
+        :type  o_pkey_only: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_aciname is not None:
+            _params['aciname'] = o_aciname
+        if o_permission is not None:
+            _params['permission'] = o_permission
+        if o_group is not None:
+            _params['group'] = o_group
+        if o_permissions is not None:
+            _params['permissions'] = o_permissions
+        if o_attrs is not None:
+            _params['attrs'] = o_attrs
+        if o_type is not None:
+            _params['type'] = o_type
+        if o_memberof is not None:
+            _params['memberof'] = o_memberof
+        if o_filter is not None:
+            _params['filter'] = o_filter
+        if o_subtree is not None:
+            _params['subtree'] = o_subtree
+        if o_targetgroup is not None:
+            _params['targetgroup'] = o_targetgroup
+        if o_selfaci is not None:
+            _params['selfaci'] = o_selfaci
+        if o_aciprefix is not None:
+            _params['aciprefix'] = o_aciprefix
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('aci_find', _args, _params)
+
+    def aci_mod(
+        self,
+        a_aciname,
+        o_aciprefix,
+        o_permission=None,
+        o_group=None,
+        o_permissions=None,
+        o_attrs=None,
+        o_type=None,
+        o_memberof=None,
+        o_filter=None,
+        o_subtree=None,
+        o_targetgroup=None,
+        o_selfaci=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Modify ACI.
+
+
+        :param a_aciname: ACI name
+        :type  a_aciname: str
+        :param o_permission: Permission ACI grants access to
+        :type  o_permission: str
+        :param o_group: User group ACI grants access to
+        :type  o_group: str
+        :param o_permissions: Permissions to grant(read, write, add, delete,
+            all)
+        :type  o_permissions: str
+        :param o_attrs: Attributes
+        :type  o_attrs: str
+        :param o_type: type of IPA object (user, group, host, hostgroup,
+            service, netgroup)
+        :type  o_type: str, valid values ['user', 'group', 'host', 'service', 'hostgroup', 'netgroup', 'dnsrecord']
+        :param o_memberof: Member of a group
+        :type  o_memberof: str
+        :param o_filter: Legal LDAP filter (e.g. ou=Engineering)
+        :type  o_filter: str
+        :param o_subtree: Subtree to apply ACI to
+        :type  o_subtree: str
+        :param o_targetgroup: Group to apply ACI to
+        :type  o_targetgroup: str
+        :param o_selfaci: Apply ACI to your own entry (self)
+        :type  o_selfaci: bool
+        :param o_aciprefix: Prefix used to distinguish ACI types (permission,
+            delegation, selfservice, none)
+        :type  o_aciprefix: str, valid values ['permission', 'delegation', 'selfservice', 'none']
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_aciname]
+        _params = {'aciprefix': o_aciprefix, 'all': o_all, 'raw': o_raw}
+        if o_permission is not None:
+            _params['permission'] = o_permission
+        if o_group is not None:
+            _params['group'] = o_group
+        if o_permissions is not None:
+            _params['permissions'] = o_permissions
+        if o_attrs is not None:
+            _params['attrs'] = o_attrs
+        if o_type is not None:
+            _params['type'] = o_type
+        if o_memberof is not None:
+            _params['memberof'] = o_memberof
+        if o_filter is not None:
+            _params['filter'] = o_filter
+        if o_subtree is not None:
+            _params['subtree'] = o_subtree
+        if o_targetgroup is not None:
+            _params['targetgroup'] = o_targetgroup
+        if o_selfaci is not None:
+            _params['selfaci'] = o_selfaci
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('aci_mod', _args, _params)
+
+    def aci_rename(
+        self,
+        a_aciname,
+        o_aciprefix,
+        o_newname,
+        o_permission=None,
+        o_group=None,
+        o_permissions=None,
+        o_attrs=None,
+        o_type=None,
+        o_memberof=None,
+        o_filter=None,
+        o_subtree=None,
+        o_targetgroup=None,
+        o_selfaci=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Rename an ACI.
+
+
+        :param a_aciname: ACI name
+        :type  a_aciname: str
+        :param o_permission: Permission ACI grants access to
+        :type  o_permission: str
+        :param o_group: User group ACI grants access to
+        :type  o_group: str
+        :param o_permissions: Permissions to grant(read, write, add, delete,
+            all)
+        :type  o_permissions: str
+        :param o_attrs: Attributes
+        :type  o_attrs: str
+        :param o_type: type of IPA object (user, group, host, hostgroup,
+            service, netgroup)
+        :type  o_type: str, valid values ['user', 'group', 'host', 'service', 'hostgroup', 'netgroup', 'dnsrecord']
+        :param o_memberof: Member of a group
+        :type  o_memberof: str
+        :param o_filter: Legal LDAP filter (e.g. ou=Engineering)
+        :type  o_filter: str
+        :param o_subtree: Subtree to apply ACI to
+        :type  o_subtree: str
+        :param o_targetgroup: Group to apply ACI to
+        :type  o_targetgroup: str
+        :param o_selfaci: Apply ACI to your own entry (self)
+        :type  o_selfaci: bool
+        :param o_aciprefix: Prefix used to distinguish ACI types (permission,
+            delegation, selfservice, none)
+        :type  o_aciprefix: str, valid values ['permission', 'delegation', 'selfservice', 'none']
+        :param o_newname: New ACI name
+        :type  o_newname: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_aciname]
+        _params = {
+            'aciprefix': o_aciprefix,
+            'newname': o_newname,
+            'all': o_all,
+            'raw': o_raw,
+        }
+        if o_permission is not None:
+            _params['permission'] = o_permission
+        if o_group is not None:
+            _params['group'] = o_group
+        if o_permissions is not None:
+            _params['permissions'] = o_permissions
+        if o_attrs is not None:
+            _params['attrs'] = o_attrs
+        if o_type is not None:
+            _params['type'] = o_type
+        if o_memberof is not None:
+            _params['memberof'] = o_memberof
+        if o_filter is not None:
+            _params['filter'] = o_filter
+        if o_subtree is not None:
+            _params['subtree'] = o_subtree
+        if o_targetgroup is not None:
+            _params['targetgroup'] = o_targetgroup
+        if o_selfaci is not None:
+            _params['selfaci'] = o_selfaci
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('aci_rename', _args, _params)
+
+    def aci_show(
+        self,
+        a_aciname,
+        o_aciprefix,
+        o_location=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display a single ACI given an ACI name.
+
+
+        :param a_aciname: ACI name
+        :type  a_aciname: str
+        :param o_aciprefix: Prefix used to distinguish ACI types (permission,
+            delegation, selfservice, none)
+        :type  o_aciprefix: str, valid values ['permission', 'delegation', 'selfservice', 'none']
+        :param o_location: Location of the ACI
+        :type  o_location: DNParam
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_aciname]
+        _params = {'aciprefix': o_aciprefix, 'all': o_all, 'raw': o_raw}
+        if o_location is not None:
+            _params['location'] = o_location
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('aci_show', _args, _params)
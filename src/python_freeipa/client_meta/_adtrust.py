@@ -0,0 +1,17 @@
+class Commands(object):
+
+    def adtrust_is_enabled(
+        self,
+        **kwargs
+    ):
+        """
+        Determine whether ipa-adtrust-install has been run on this system
+
+
+        """
+        _args = []
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('adtrust_is_enabled', _args, _params)
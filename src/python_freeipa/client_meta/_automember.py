@@ -0,0 +1,489 @@
+class Commands(object):
+
+    def automember_add(
+        self,
+        a_cn,
+        o_type,
+        o_description=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Add an automember rule.
+
+
+        :param a_cn: Automember Rule
+        :type  a_cn: str
+        :param o_description: A description of this auto member rule
+        :type  o_description: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_type: Grouping to which the rule applies
+        :type  o_type: str, valid values ['group', 'hostgroup']
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'type': o_type, 'all': o_all, 'raw': o_raw}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automember_add', _args, _params)
+
+    def automember_add_condition(
+        self,
+        a_cn,
+        o_key,
+        o_type,
+        o_description=None,
+        o_automemberinclusiveregex=None,
+        o_automemberexclusiveregex=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Add conditions to an automember rule.
+
+
+        :param a_cn: Automember Rule
+        :type  a_cn: str
+        :param o_description: A description of this auto member rule
+        :type  o_description: str
+        :param o_automemberinclusiveregex: Inclusive Regex
+        :type  o_automemberinclusiveregex: str
+        :param o_automemberexclusiveregex: Exclusive Regex
+        :type  o_automemberexclusiveregex: str
+        :param o_key: Attribute to filter via regex. For example fqdn for a
+            host, or manager for a user
+        :type  o_key: str
+        :param o_type: Grouping to which the rule applies
+        :type  o_type: str, valid values ['group', 'hostgroup']
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'key': o_key, 'type': o_type, 'all': o_all, 'raw': o_raw}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_automemberinclusiveregex is not None:
+            _params['automemberinclusiveregex'] = o_automemberinclusiveregex
+        if o_automemberexclusiveregex is not None:
+            _params['automemberexclusiveregex'] = o_automemberexclusiveregex
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automember_add_condition', _args, _params)
+
+    def automember_default_group_remove(
+        self,
+        o_type,
+        o_description=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Remove default (fallback) group for all unmatched entries.
+
+
+        :param o_description: A description of this auto member rule
+        :type  o_description: str
+        :param o_type: Grouping to which the rule applies
+        :type  o_type: str, valid values ['group', 'hostgroup']
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = []
+        _params = {'type': o_type, 'all': o_all, 'raw': o_raw}
+        if o_description is not None:
+            _params['description'] = o_description
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automember_default_group_remove', _args, _params)
+
+    def automember_default_group_set(
+        self,
+        o_automemberdefaultgroup,
+        o_type,
+        o_description=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Set default (fallback) group for all unmatched entries.
+
+
+        :param o_description: A description of this auto member rule
+        :type  o_description: str
+        :param o_automemberdefaultgroup: Default (fallback) group for entries
+            to land
+        :type  o_automemberdefaultgroup: str
+        :param o_type: Grouping to which the rule applies
+        :type  o_type: str, valid values ['group', 'hostgroup']
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = []
+        _params = {
+            'automemberdefaultgroup': o_automemberdefaultgroup,
+            'type': o_type,
+            'all': o_all,
+            'raw': o_raw,
+        }
+        if o_description is not None:
+            _params['description'] = o_description
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automember_default_group_set', _args, _params)
+
+    def automember_default_group_show(
+        self,
+        o_type,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display information about the default (fallback) automember groups.
+
+
+        :param o_type: Grouping to which the rule applies
+        :type  o_type: str, valid values ['group', 'hostgroup']
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = []
+        _params = {'type': o_type, 'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automember_default_group_show', _args, _params)
+
+    def automember_del(
+        self,
+        a_cn,
+        o_type,
+        **kwargs
+    ):
+        """
+        Delete an automember rule.
+
+
+        :param a_cn: Automember Rule
+        :type  a_cn: str
+        :param o_type: Grouping to which the rule applies
+        :type  o_type: str, valid values ['group', 'hostgroup']
+        """
+        _args = [a_cn]
+        _params = {'type': o_type}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automember_del', _args, _params)
+
+    def automember_find(
+        self,
+        o_type,
+        a_criteria=None,
+        o_description=None,
+        o_all=True,
+        o_raw=False,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for automember rules.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_description: A description of this auto member rule
+        :type  o_description: str
+        :param o_type: Grouping to which the rule applies
+        :type  o_type: str, valid values ['group', 'hostgroup']
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("automember-rule")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'type': o_type, 'all': o_all, 'raw': o_raw}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automember_find', _args, _params)
+
+    def automember_find_orphans(
+        self,
+        o_type,
+        a_criteria=None,
+        o_description=None,
+        o_remove=False,
+        o_all=True,
+        o_raw=False,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for orphan automember rules. The command might need to be run as
+        a privileged user user to get all orphan rules.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_description: A description of this auto member rule
+        :type  o_description: str
+        :param o_type: Grouping to which the rule applies
+        :type  o_type: str, valid values ['group', 'hostgroup']
+        :param o_remove: Remove orphan automember rules
+        :type  o_remove: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("automember-rule")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'type': o_type, 'all': o_all, 'raw': o_raw}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_remove is not None:
+            _params['remove'] = o_remove
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automember_find_orphans', _args, _params)
+
+    def automember_mod(
+        self,
+        a_cn,
+        o_type,
+        o_description=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Modify an automember rule.
+
+
+        :param a_cn: Automember Rule
+        :type  a_cn: str
+        :param o_description: A description of this auto member rule
+        :type  o_description: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_type: Grouping to which the rule applies
+        :type  o_type: str, valid values ['group', 'hostgroup']
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'rights': o_rights, 'type': o_type, 'all': o_all, 'raw': o_raw}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automember_mod', _args, _params)
+
+    def automember_rebuild(
+        self,
+        o_type=None,
+        o_users=None,
+        o_hosts=None,
+        o_no_wait=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Rebuild auto membership.
+
+
+        :param o_type: Grouping to which the rule applies
+        :type  o_type: str, valid values ['group', 'hostgroup']
+        :param o_users: Rebuild membership for specified users
+        :type  o_users: str
+        :param o_hosts: Rebuild membership for specified hosts
+        :type  o_hosts: str
+        :param o_no_wait: Don't wait for rebuilding membership
+        :type  o_no_wait: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = []
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_type is not None:
+            _params['type'] = o_type
+        if o_users is not None:
+            _params['users'] = o_users
+        if o_hosts is not None:
+            _params['hosts'] = o_hosts
+        if o_no_wait is not None:
+            _params['no_wait'] = o_no_wait
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automember_rebuild', _args, _params)
+
+    def automember_remove_condition(
+        self,
+        a_cn,
+        o_key,
+        o_type,
+        o_description=None,
+        o_automemberinclusiveregex=None,
+        o_automemberexclusiveregex=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Remove conditions from an automember rule.
+
+
+        :param a_cn: Automember Rule
+        :type  a_cn: str
+        :param o_description: A description of this auto member rule
+        :type  o_description: str
+        :param o_automemberinclusiveregex: Inclusive Regex
+        :type  o_automemberinclusiveregex: str
+        :param o_automemberexclusiveregex: Exclusive Regex
+        :type  o_automemberexclusiveregex: str
+        :param o_key: Attribute to filter via regex. For example fqdn for a
+            host, or manager for a user
+        :type  o_key: str
+        :param o_type: Grouping to which the rule applies
+        :type  o_type: str, valid values ['group', 'hostgroup']
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'key': o_key, 'type': o_type, 'all': o_all, 'raw': o_raw}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_automemberinclusiveregex is not None:
+            _params['automemberinclusiveregex'] = o_automemberinclusiveregex
+        if o_automemberexclusiveregex is not None:
+            _params['automemberexclusiveregex'] = o_automemberexclusiveregex
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automember_remove_condition', _args, _params)
+
+    def automember_show(
+        self,
+        a_cn,
+        o_type,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display information about an automember rule.
+
+
+        :param a_cn: Automember Rule
+        :type  a_cn: str
+        :param o_type: Grouping to which the rule applies
+        :type  o_type: str, valid values ['group', 'hostgroup']
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'type': o_type, 'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automember_show', _args, _params)
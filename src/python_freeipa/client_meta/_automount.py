@@ -0,0 +1,705 @@
+class Commands(object):
+
+    def automountkey_add(
+        self,
+        a_automountlocationcn,
+        a_automountmapautomountmapname,
+        o_automountkey,
+        o_automountinformation,
+        o_setattr=None,
+        o_addattr=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Create a new automount key.
+
+
+        :param a_automountlocationcn: Automount location name.
+        :type  a_automountlocationcn: str
+        :param a_automountmapautomountmapname: Automount map name.
+        :type  a_automountmapautomountmapname: IA5Str
+        :param o_automountkey: Automount key name.
+        :type  o_automountkey: IA5Str
+        :param o_automountinformation: Mount information
+        :type  o_automountinformation: IA5Str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_automountlocationcn, a_automountmapautomountmapname]
+        _params = {
+            'automountkey': o_automountkey,
+            'automountinformation': o_automountinformation,
+            'all': o_all,
+            'raw': o_raw,
+        }
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automountkey_add', _args, _params)
+
+    def automountkey_del(
+        self,
+        a_automountlocationcn,
+        a_automountmapautomountmapname,
+        o_automountkey,
+        o_continue=False,
+        o_automountinformation=None,
+        **kwargs
+    ):
+        """
+        Delete an automount key.
+
+
+        :param a_automountlocationcn: Automount location name.
+        :type  a_automountlocationcn: str
+        :param a_automountmapautomountmapname: Automount map name.
+        :type  a_automountmapautomountmapname: IA5Str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        :param o_automountkey: Automount key name.
+        :type  o_automountkey: IA5Str
+        :param o_automountinformation: Mount information
+        :type  o_automountinformation: IA5Str
+        """
+        _args = [a_automountlocationcn, a_automountmapautomountmapname]
+        _params = {'continue': o_continue, 'automountkey': o_automountkey}
+        if o_automountinformation is not None:
+            _params['automountinformation'] = o_automountinformation
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automountkey_del', _args, _params)
+
+    def automountkey_find(
+        self,
+        a_automountlocationcn,
+        a_automountmapautomountmapname,
+        a_criteria=None,
+        o_automountkey=None,
+        o_automountinformation=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Search for an automount key.
+
+
+        :param a_automountlocationcn: Automount location name.
+        :type  a_automountlocationcn: str
+        :param a_automountmapautomountmapname: Automount map name.
+        :type  a_automountmapautomountmapname: IA5Str
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_automountkey: Automount key name.
+        :type  o_automountkey: IA5Str
+        :param o_automountinformation: Mount information
+        :type  o_automountinformation: IA5Str
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_automountlocationcn, a_automountmapautomountmapname, a_criteria]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_automountkey is not None:
+            _params['automountkey'] = o_automountkey
+        if o_automountinformation is not None:
+            _params['automountinformation'] = o_automountinformation
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automountkey_find', _args, _params)
+
+    def automountkey_mod(
+        self,
+        a_automountlocationcn,
+        a_automountmapautomountmapname,
+        o_automountkey,
+        o_automountinformation=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_newautomountinformation=None,
+        o_all=True,
+        o_raw=False,
+        o_rename=None,
+        **kwargs
+    ):
+        """
+        Modify an automount key.
+
+
+        :param a_automountlocationcn: Automount location name.
+        :type  a_automountlocationcn: str
+        :param a_automountmapautomountmapname: Automount map name.
+        :type  a_automountmapautomountmapname: IA5Str
+        :param o_automountkey: Automount key name.
+        :type  o_automountkey: IA5Str
+        :param o_automountinformation: Mount information
+        :type  o_automountinformation: IA5Str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_newautomountinformation: New mount information
+        :type  o_newautomountinformation: IA5Str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_rename: Rename the automount key object
+        :type  o_rename: str
+        """
+        _args = [a_automountlocationcn, a_automountmapautomountmapname]
+        _params = {
+            'automountkey': o_automountkey,
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+        }
+        if o_automountinformation is not None:
+            _params['automountinformation'] = o_automountinformation
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if o_newautomountinformation is not None:
+            _params['newautomountinformation'] = o_newautomountinformation
+        if o_rename is not None:
+            _params['rename'] = o_rename
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automountkey_mod', _args, _params)
+
+    def automountkey_show(
+        self,
+        a_automountlocationcn,
+        a_automountmapautomountmapname,
+        o_automountkey,
+        o_rights=False,
+        o_automountinformation=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display an automount key.
+
+
+        :param a_automountlocationcn: Automount location name.
+        :type  a_automountlocationcn: str
+        :param a_automountmapautomountmapname: Automount map name.
+        :type  a_automountmapautomountmapname: IA5Str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_automountkey: Automount key name.
+        :type  o_automountkey: IA5Str
+        :param o_automountinformation: Mount information
+        :type  o_automountinformation: IA5Str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_automountlocationcn, a_automountmapautomountmapname]
+        _params = {
+            'rights': o_rights,
+            'automountkey': o_automountkey,
+            'all': o_all,
+            'raw': o_raw,
+        }
+        if o_automountinformation is not None:
+            _params['automountinformation'] = o_automountinformation
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automountkey_show', _args, _params)
+
+    def automountlocation_add(
+        self,
+        a_cn,
+        o_setattr=None,
+        o_addattr=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Create a new automount location.
+
+
+        :param a_cn: Automount location name.
+        :type  a_cn: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automountlocation_add', _args, _params)
+
+    def automountlocation_del(
+        self,
+        a_cn,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete an automount location.
+
+
+        :param a_cn: Automount location name.
+        :type  a_cn: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_cn]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automountlocation_del', _args, _params)
+
+    def automountlocation_find(
+        self,
+        a_criteria=None,
+        o_cn=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for an automount location.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_cn: Automount location name.
+        :type  o_cn: str
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("location")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automountlocation_find', _args, _params)
+
+    def automountlocation_show(
+        self,
+        a_cn,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display an automount location.
+
+
+        :param a_cn: Automount location name.
+        :type  a_cn: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automountlocation_show', _args, _params)
+
+    def automountlocation_tofiles(
+        self,
+        a_cn,
+        **kwargs
+    ):
+        """
+        Generate automount files for a specific location.
+
+
+        :param a_cn: Automount location name.
+        :type  a_cn: str
+        """
+        _args = [a_cn]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automountlocation_tofiles', _args, _params)
+
+    def automountmap_add(
+        self,
+        a_automountlocationcn,
+        a_automountmapname,
+        o_description=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Create a new automount map.
+
+
+        :param a_automountlocationcn: Automount location name.
+        :type  a_automountlocationcn: str
+        :param a_automountmapname: Automount map name.
+        :type  a_automountmapname: IA5Str
+        :param o_description: Description
+        :type  o_description: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_automountlocationcn, a_automountmapname]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automountmap_add', _args, _params)
+
+    def automountmap_add_indirect(
+        self,
+        a_automountlocationcn,
+        a_automountmapname,
+        o_key,
+        o_description=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_parentmap='auto.master',
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Create a new indirect mount point.
+
+
+        :param a_automountlocationcn: Automount location name.
+        :type  a_automountlocationcn: str
+        :param a_automountmapname: Automount map name.
+        :type  a_automountmapname: IA5Str
+        :param o_description: Description
+        :type  o_description: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_key: Mount point
+        :type  o_key: str
+        :param o_parentmap: Name of parent automount map (default:
+            auto.master).
+        :type  o_parentmap: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_automountlocationcn, a_automountmapname]
+        _params = {'key': o_key, 'all': o_all, 'raw': o_raw}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_parentmap is not None:
+            _params['parentmap'] = o_parentmap
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automountmap_add_indirect', _args, _params)
+
+    def automountmap_del(
+        self,
+        a_automountlocationcn,
+        a_automountmapname,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete an automount map.
+
+
+        :param a_automountlocationcn: Automount location name.
+        :type  a_automountlocationcn: str
+        :param a_automountmapname: Automount map name.
+        :type  a_automountmapname: IA5Str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_automountlocationcn, a_automountmapname]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automountmap_del', _args, _params)
+
+    def automountmap_find(
+        self,
+        a_automountlocationcn,
+        a_criteria=None,
+        o_automountmapname=None,
+        o_description=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for an automount map.
+
+
+        :param a_automountlocationcn: Automount location name.
+        :type  a_automountlocationcn: str
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_automountmapname: Automount map name.
+        :type  o_automountmapname: IA5Str
+        :param o_description: Description
+        :type  o_description: str
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("map")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_automountlocationcn, a_criteria]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_automountmapname is not None:
+            _params['automountmapname'] = o_automountmapname
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automountmap_find', _args, _params)
+
+    def automountmap_mod(
+        self,
+        a_automountlocationcn,
+        a_automountmapname,
+        o_description=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Modify an automount map.
+
+
+        :param a_automountlocationcn: Automount location name.
+        :type  a_automountlocationcn: str
+        :param a_automountmapname: Automount map name.
+        :type  a_automountmapname: IA5Str
+        :param o_description: Description
+        :type  o_description: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_automountlocationcn, a_automountmapname]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automountmap_mod', _args, _params)
+
+    def automountmap_show(
+        self,
+        a_automountlocationcn,
+        a_automountmapname,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display an automount map.
+
+
+        :param a_automountlocationcn: Automount location name.
+        :type  a_automountlocationcn: str
+        :param a_automountmapname: Automount map name.
+        :type  a_automountmapname: IA5Str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_automountlocationcn, a_automountmapname]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('automountmap_show', _args, _params)
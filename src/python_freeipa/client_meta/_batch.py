@@ -0,0 +1,20 @@
+class Commands(object):
+
+    def batch(
+        self,
+        a_methods=None,
+        **kwargs
+    ):
+        """
+        Make multiple ipa calls via one remote procedure call
+
+
+        :param a_methods: Nested Methods to execute
+        :type  a_methods: dict
+        """
+        _args = [a_methods]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('batch', _args, _params)
@@ -0,0 +1,1023 @@
+class Commands(object):
+
+    def ca_add(
+        self,
+        a_cn,
+        o_ipacasubjectdn,
+        o_description=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_chain=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Create a CA.
+
+
+        :param a_cn: Name for referencing the CA
+        :type  a_cn: str
+        :param o_description: Description of the purpose of the CA
+        :type  o_description: str
+        :param o_ipacasubjectdn: Subject Distinguished Name
+        :type  o_ipacasubjectdn: DNParam
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_chain: Include certificate chain in output
+        :type  o_chain: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'ipacasubjectdn': o_ipacasubjectdn,
+            'chain': o_chain,
+            'all': o_all,
+            'raw': o_raw,
+        }
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('ca_add', _args, _params)
+
+    def ca_del(
+        self,
+        a_cn,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete a CA.
+
+
+        :param a_cn: Name for referencing the CA
+        :type  a_cn: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_cn]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('ca_del', _args, _params)
+
+    def ca_disable(
+        self,
+        a_cn,
+        **kwargs
+    ):
+        """
+        Disable a CA.
+
+
+        :param a_cn: Name for referencing the CA
+        :type  a_cn: str
+        """
+        _args = [a_cn]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('ca_disable', _args, _params)
+
+    def ca_enable(
+        self,
+        a_cn,
+        **kwargs
+    ):
+        """
+        Enable a CA.
+
+
+        :param a_cn: Name for referencing the CA
+        :type  a_cn: str
+        """
+        _args = [a_cn]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('ca_enable', _args, _params)
+
+    def ca_find(
+        self,
+        a_criteria=None,
+        o_cn=None,
+        o_description=None,
+        o_ipacaid=None,
+        o_ipacasubjectdn=None,
+        o_ipacaissuerdn=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for CAs.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_cn: Name for referencing the CA
+        :type  o_cn: str
+        :param o_description: Description of the purpose of the CA
+        :type  o_description: str
+        :param o_ipacaid: Dogtag Authority ID
+        :type  o_ipacaid: str
+        :param o_ipacasubjectdn: Subject Distinguished Name
+        :type  o_ipacasubjectdn: DNParam
+        :param o_ipacaissuerdn: Issuer Distinguished Name
+        :type  o_ipacaissuerdn: DNParam
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("name")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipacaid is not None:
+            _params['ipacaid'] = o_ipacaid
+        if o_ipacasubjectdn is not None:
+            _params['ipacasubjectdn'] = o_ipacasubjectdn
+        if o_ipacaissuerdn is not None:
+            _params['ipacaissuerdn'] = o_ipacaissuerdn
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('ca_find', _args, _params)
+
+    def ca_is_enabled(
+        self,
+        **kwargs
+    ):
+        """
+        Checks if any of the servers has the CA service enabled.
+
+
+        """
+        _args = []
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('ca_is_enabled', _args, _params)
+
+    def ca_mod(
+        self,
+        a_cn,
+        o_description=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_rename=None,
+        **kwargs
+    ):
+        """
+        Modify CA configuration.
+
+
+        :param a_cn: Name for referencing the CA
+        :type  a_cn: str
+        :param o_description: Description of the purpose of the CA
+        :type  o_description: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_rename: Rename the Certificate Authority object
+        :type  o_rename: str
+        """
+        _args = [a_cn]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if o_rename is not None:
+            _params['rename'] = o_rename
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('ca_mod', _args, _params)
+
+    def ca_show(
+        self,
+        a_cn,
+        o_rights=False,
+        o_chain=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display the properties of a CA.
+
+
+        :param a_cn: Name for referencing the CA
+        :type  a_cn: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_chain: Include certificate chain in output
+        :type  o_chain: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'rights': o_rights, 'chain': o_chain, 'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('ca_show', _args, _params)
+
+    def caacl_add(
+        self,
+        a_cn,
+        o_description=None,
+        o_ipaenabledflag=None,
+        o_ipacacategory=None,
+        o_ipacertprofilecategory=None,
+        o_usercategory=None,
+        o_hostcategory=None,
+        o_servicecategory=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Create a new CA ACL.
+
+
+        :param a_cn: ACL name
+        :type  a_cn: str
+        :param o_description: Description
+        :type  o_description: str
+        :param o_ipaenabledflag: Enabled
+        :type  o_ipaenabledflag: Bool
+        :param o_ipacacategory: CA category the ACL applies to
+        :type  o_ipacacategory: str, valid values ['all']
+        :param o_ipacertprofilecategory: Profile category the ACL applies to
+        :type  o_ipacertprofilecategory: str, valid values ['all']
+        :param o_usercategory: User category the ACL applies to
+        :type  o_usercategory: str, valid values ['all']
+        :param o_hostcategory: Host category the ACL applies to
+        :type  o_hostcategory: str, valid values ['all']
+        :param o_servicecategory: Service category the ACL applies to
+        :type  o_servicecategory: str, valid values ['all']
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipaenabledflag is not None:
+            _params['ipaenabledflag'] = o_ipaenabledflag
+        if o_ipacacategory is not None:
+            _params['ipacacategory'] = o_ipacacategory
+        if o_ipacertprofilecategory is not None:
+            _params['ipacertprofilecategory'] = o_ipacertprofilecategory
+        if o_usercategory is not None:
+            _params['usercategory'] = o_usercategory
+        if o_hostcategory is not None:
+            _params['hostcategory'] = o_hostcategory
+        if o_servicecategory is not None:
+            _params['servicecategory'] = o_servicecategory
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('caacl_add', _args, _params)
+
+    def caacl_add_ca(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_ca=None,
+        **kwargs
+    ):
+        """
+        Add CAs to a CA ACL.
+
+
+        :param a_cn: ACL name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_ca: Certificate Authorities to add
+        :type  o_ca: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_ca is not None:
+            _params['ca'] = o_ca
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('caacl_add_ca', _args, _params)
+
+    def caacl_add_host(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_host=None,
+        o_hostgroup=None,
+        **kwargs
+    ):
+        """
+        Add target hosts and hostgroups to a CA ACL.
+
+
+        :param a_cn: ACL name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_host: hosts to add
+        :type  o_host: str
+        :param o_hostgroup: host groups to add
+        :type  o_hostgroup: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_host is not None:
+            _params['host'] = o_host
+        if o_hostgroup is not None:
+            _params['hostgroup'] = o_hostgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('caacl_add_host', _args, _params)
+
+    def caacl_add_profile(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_certprofile=None,
+        **kwargs
+    ):
+        """
+        Add profiles to a CA ACL.
+
+
+        :param a_cn: ACL name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_certprofile: Certificate Profiles to add
+        :type  o_certprofile: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_certprofile is not None:
+            _params['certprofile'] = o_certprofile
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('caacl_add_profile', _args, _params)
+
+    def caacl_add_service(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_service=None,
+        **kwargs
+    ):
+        """
+        Add services to a CA ACL.
+
+
+        :param a_cn: ACL name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_service: services to add
+        :type  o_service: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_service is not None:
+            _params['service'] = o_service
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('caacl_add_service', _args, _params)
+
+    def caacl_add_user(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        **kwargs
+    ):
+        """
+        Add users and groups to a CA ACL.
+
+
+        :param a_cn: ACL name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to add
+        :type  o_user: str
+        :param o_group: groups to add
+        :type  o_group: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('caacl_add_user', _args, _params)
+
+    def caacl_del(
+        self,
+        a_cn,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete a CA ACL.
+
+
+        :param a_cn: ACL name
+        :type  a_cn: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_cn]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('caacl_del', _args, _params)
+
+    def caacl_disable(
+        self,
+        a_cn,
+        **kwargs
+    ):
+        """
+        Disable a CA ACL.
+
+
+        :param a_cn: ACL name
+        :type  a_cn: str
+        """
+        _args = [a_cn]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('caacl_disable', _args, _params)
+
+    def caacl_enable(
+        self,
+        a_cn,
+        **kwargs
+    ):
+        """
+        Enable a CA ACL.
+
+
+        :param a_cn: ACL name
+        :type  a_cn: str
+        """
+        _args = [a_cn]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('caacl_enable', _args, _params)
+
+    def caacl_find(
+        self,
+        a_criteria=None,
+        o_cn=None,
+        o_description=None,
+        o_ipaenabledflag=None,
+        o_ipacacategory=None,
+        o_ipacertprofilecategory=None,
+        o_usercategory=None,
+        o_hostcategory=None,
+        o_servicecategory=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=True,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for CA ACLs.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_cn: ACL name
+        :type  o_cn: str
+        :param o_description: Description
+        :type  o_description: str
+        :param o_ipaenabledflag: Enabled
+        :type  o_ipaenabledflag: Bool
+        :param o_ipacacategory: CA category the ACL applies to
+        :type  o_ipacacategory: str, valid values ['all']
+        :param o_ipacertprofilecategory: Profile category the ACL applies to
+        :type  o_ipacertprofilecategory: str, valid values ['all']
+        :param o_usercategory: User category the ACL applies to
+        :type  o_usercategory: str, valid values ['all']
+        :param o_hostcategory: Host category the ACL applies to
+        :type  o_hostcategory: str, valid values ['all']
+        :param o_servicecategory: Service category the ACL applies to
+        :type  o_servicecategory: str, valid values ['all']
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("name")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipaenabledflag is not None:
+            _params['ipaenabledflag'] = o_ipaenabledflag
+        if o_ipacacategory is not None:
+            _params['ipacacategory'] = o_ipacacategory
+        if o_ipacertprofilecategory is not None:
+            _params['ipacertprofilecategory'] = o_ipacertprofilecategory
+        if o_usercategory is not None:
+            _params['usercategory'] = o_usercategory
+        if o_hostcategory is not None:
+            _params['hostcategory'] = o_hostcategory
+        if o_servicecategory is not None:
+            _params['servicecategory'] = o_servicecategory
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('caacl_find', _args, _params)
+
+    def caacl_mod(
+        self,
+        a_cn,
+        o_description=None,
+        o_ipaenabledflag=None,
+        o_ipacacategory=None,
+        o_ipacertprofilecategory=None,
+        o_usercategory=None,
+        o_hostcategory=None,
+        o_servicecategory=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Modify a CA ACL.
+
+
+        :param a_cn: ACL name
+        :type  a_cn: str
+        :param o_description: Description
+        :type  o_description: str
+        :param o_ipaenabledflag: Enabled
+        :type  o_ipaenabledflag: Bool
+        :param o_ipacacategory: CA category the ACL applies to
+        :type  o_ipacacategory: str, valid values ['all']
+        :param o_ipacertprofilecategory: Profile category the ACL applies to
+        :type  o_ipacertprofilecategory: str, valid values ['all']
+        :param o_usercategory: User category the ACL applies to
+        :type  o_usercategory: str, valid values ['all']
+        :param o_hostcategory: Host category the ACL applies to
+        :type  o_hostcategory: str, valid values ['all']
+        :param o_servicecategory: Service category the ACL applies to
+        :type  o_servicecategory: str, valid values ['all']
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipaenabledflag is not None:
+            _params['ipaenabledflag'] = o_ipaenabledflag
+        if o_ipacacategory is not None:
+            _params['ipacacategory'] = o_ipacacategory
+        if o_ipacertprofilecategory is not None:
+            _params['ipacertprofilecategory'] = o_ipacertprofilecategory
+        if o_usercategory is not None:
+            _params['usercategory'] = o_usercategory
+        if o_hostcategory is not None:
+            _params['hostcategory'] = o_hostcategory
+        if o_servicecategory is not None:
+            _params['servicecategory'] = o_servicecategory
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('caacl_mod', _args, _params)
+
+    def caacl_remove_ca(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_ca=None,
+        **kwargs
+    ):
+        """
+        Remove CAs from a CA ACL.
+
+
+        :param a_cn: ACL name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_ca: Certificate Authorities to remove
+        :type  o_ca: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_ca is not None:
+            _params['ca'] = o_ca
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('caacl_remove_ca', _args, _params)
+
+    def caacl_remove_host(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_host=None,
+        o_hostgroup=None,
+        **kwargs
+    ):
+        """
+        Remove target hosts and hostgroups from a CA ACL.
+
+
+        :param a_cn: ACL name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_host: hosts to remove
+        :type  o_host: str
+        :param o_hostgroup: host groups to remove
+        :type  o_hostgroup: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_host is not None:
+            _params['host'] = o_host
+        if o_hostgroup is not None:
+            _params['hostgroup'] = o_hostgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('caacl_remove_host', _args, _params)
+
+    def caacl_remove_profile(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_certprofile=None,
+        **kwargs
+    ):
+        """
+        Remove profiles from a CA ACL.
+
+
+        :param a_cn: ACL name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_certprofile: Certificate Profiles to remove
+        :type  o_certprofile: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_certprofile is not None:
+            _params['certprofile'] = o_certprofile
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('caacl_remove_profile', _args, _params)
+
+    def caacl_remove_service(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_service=None,
+        **kwargs
+    ):
+        """
+        Remove services from a CA ACL.
+
+
+        :param a_cn: ACL name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_service: services to remove
+        :type  o_service: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_service is not None:
+            _params['service'] = o_service
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('caacl_remove_service', _args, _params)
+
+    def caacl_remove_user(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        **kwargs
+    ):
+        """
+        Remove users and groups from a CA ACL.
+
+
+        :param a_cn: ACL name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to remove
+        :type  o_user: str
+        :param o_group: groups to remove
+        :type  o_group: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('caacl_remove_user', _args, _params)
+
+    def caacl_show(
+        self,
+        a_cn,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Display the properties of a CA ACL.
+
+
+        :param a_cn: ACL name
+        :type  a_cn: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('caacl_show', _args, _params)
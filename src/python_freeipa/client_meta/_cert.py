@@ -0,0 +1,1027 @@
+class Commands(object):
+
+    def cert_find(
+        self,
+        a_criteria=None,
+        o_certificate=None,
+        o_issuer=None,
+        o_revocation_reason=None,
+        o_cacn=None,
+        o_subject=None,
+        o_min_serial_number=None,
+        o_max_serial_number=None,
+        o_exactly=False,
+        o_validnotafter_from=None,
+        o_validnotafter_to=None,
+        o_validnotbefore_from=None,
+        o_validnotbefore_to=None,
+        o_issuedon_from=None,
+        o_issuedon_to=None,
+        o_revokedon_from=None,
+        o_revokedon_to=None,
+        o_pkey_only=False,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=True,
+        o_user=None,
+        o_no_user=None,
+        o_host=None,
+        o_no_host=None,
+        o_service=None,
+        o_no_service=None,
+        **kwargs
+    ):
+        """
+        Search for existing certificates.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_certificate: Base-64 encoded certificate.
+        :type  o_certificate: Certificate
+        :param o_issuer: Issuer DN
+        :type  o_issuer: DNParam
+        :param o_revocation_reason: Reason for revoking the certificate
+            (0-10). Type "ipa help cert" for revocation reason details.
+        :type  o_revocation_reason: int, min value 0, max value 10
+        :param o_cacn: Name of issuing CA
+        :type  o_cacn: str
+        :param o_subject: Match cn attribute in subject
+        :type  o_subject: str
+        :param o_min_serial_number: minimum serial number
+        :type  o_min_serial_number: int, min value 0, max value 2147483647
+        :param o_max_serial_number: maximum serial number
+        :type  o_max_serial_number: int, min value 0, max value 2147483647
+        :param o_exactly: match the common name exactly
+        :type  o_exactly: bool
+        :param o_validnotafter_from: Valid not after from this date (YYYY-mm-
+            dd)
+        :type  o_validnotafter_from: DateTime
+        :param o_validnotafter_to: Valid not after to this date (YYYY-mm-dd)
+        :type  o_validnotafter_to: DateTime
+        :param o_validnotbefore_from: Valid not before from this date (YYYY-
+            mm-dd)
+        :type  o_validnotbefore_from: DateTime
+        :param o_validnotbefore_to: Valid not before to this date (YYYY-mm-dd)
+        :type  o_validnotbefore_to: DateTime
+        :param o_issuedon_from: Issued on from this date (YYYY-mm-dd)
+        :type  o_issuedon_from: DateTime
+        :param o_issuedon_to: Issued on to this date (YYYY-mm-dd)
+        :type  o_issuedon_to: DateTime
+        :param o_revokedon_from: Revoked on from this date (YYYY-mm-dd)
+        :type  o_revokedon_from: DateTime
+        :param o_revokedon_to: Revoked on to this date (YYYY-mm-dd)
+        :type  o_revokedon_to: DateTime
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("certificate")
+        :type  o_pkey_only: bool
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: Search for certificates with these owner users.
+        :type  o_user: str
+        :param o_no_user: Search for certificates without these owner users.
+        :type  o_no_user: str
+        :param o_host: Search for certificates with these owner hosts.
+        :type  o_host: str
+        :param o_no_host: Search for certificates without these owner hosts.
+        :type  o_no_host: str
+        :param o_service: Search for certificates with these owner services.
+        :type  o_service: Principal
+        :param o_no_service: Search for certificates without these owner
+            services.
+        :type  o_no_service: Principal
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_certificate is not None:
+            _params['certificate'] = o_certificate
+        if o_issuer is not None:
+            _params['issuer'] = o_issuer
+        if o_revocation_reason is not None:
+            _params['revocation_reason'] = o_revocation_reason
+        if o_cacn is not None:
+            _params['cacn'] = o_cacn
+        if o_subject is not None:
+            _params['subject'] = o_subject
+        if o_min_serial_number is not None:
+            _params['min_serial_number'] = o_min_serial_number
+        if o_max_serial_number is not None:
+            _params['max_serial_number'] = o_max_serial_number
+        if o_exactly is not None:
+            _params['exactly'] = o_exactly
+        if o_validnotafter_from is not None:
+            _params['validnotafter_from'] = o_validnotafter_from
+        if o_validnotafter_to is not None:
+            _params['validnotafter_to'] = o_validnotafter_to
+        if o_validnotbefore_from is not None:
+            _params['validnotbefore_from'] = o_validnotbefore_from
+        if o_validnotbefore_to is not None:
+            _params['validnotbefore_to'] = o_validnotbefore_to
+        if o_issuedon_from is not None:
+            _params['issuedon_from'] = o_issuedon_from
+        if o_issuedon_to is not None:
+            _params['issuedon_to'] = o_issuedon_to
+        if o_revokedon_from is not None:
+            _params['revokedon_from'] = o_revokedon_from
+        if o_revokedon_to is not None:
+            _params['revokedon_to'] = o_revokedon_to
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_no_user is not None:
+            _params['no_user'] = o_no_user
+        if o_host is not None:
+            _params['host'] = o_host
+        if o_no_host is not None:
+            _params['no_host'] = o_no_host
+        if o_service is not None:
+            _params['service'] = o_service
+        if o_no_service is not None:
+            _params['no_service'] = o_no_service
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('cert_find', _args, _params)
+
+    def cert_remove_hold(
+        self,
+        a_serial_number,
+        o_cacn='ipa',
+        **kwargs
+    ):
+        """
+        Take a revoked certificate off hold.
+
+
+        :param a_serial_number: Serial number in decimal or if prefixed with
+            0x in hexadecimal
+        :type  a_serial_number: int, min value -2147483648, max value 2147483647
+        :param o_cacn: Name of issuing CA
+        :type  o_cacn: str
+        """
+        _args = [a_serial_number]
+        _params = {}
+        if o_cacn is not None:
+            _params['cacn'] = o_cacn
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('cert_remove_hold', _args, _params)
+
+    def cert_request(
+        self,
+        a_csr,
+        o_principal,
+        o_request_type='pkcs10',
+        o_profile_id=None,
+        o_cacn='ipa',
+        o_add=False,
+        o_chain=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Submit a certificate signing request.
+
+
+        :param a_csr: CSR
+        :type  a_csr: CertificateSigningRequest
+        :param o_request_type: <request_type>
+        :type  o_request_type: str
+        :param o_profile_id: Certificate Profile to use
+        :type  o_profile_id: str
+        :param o_cacn: Name of issuing CA
+        :type  o_cacn: str
+        :param o_principal: Principal for this certificate (e.g.
+            HTTP/test.example.com)
+        :type  o_principal: Principal
+        :param o_add: automatically add the principal if it doesn't exist
+            (service principals only)
+        :type  o_add: bool
+        :param o_chain: Include certificate chain in output
+        :type  o_chain: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_csr]
+        _params = {
+            'request_type': o_request_type,
+            'principal': o_principal,
+            'add': o_add,
+            'chain': o_chain,
+            'all': o_all,
+            'raw': o_raw,
+        }
+        if o_profile_id is not None:
+            _params['profile_id'] = o_profile_id
+        if o_cacn is not None:
+            _params['cacn'] = o_cacn
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('cert_request', _args, _params)
+
+    def cert_revoke(
+        self,
+        a_serial_number,
+        o_revocation_reason=0,
+        o_cacn='ipa',
+        **kwargs
+    ):
+        """
+        Revoke a certificate.
+
+
+        :param a_serial_number: Serial number in decimal or if prefixed with
+            0x in hexadecimal
+        :type  a_serial_number: int, min value -2147483648, max value 2147483647
+        :param o_revocation_reason: Reason for revoking the certificate
+            (0-10). Type "ipa help cert" for revocation reason details.
+        :type  o_revocation_reason: int, min value 0, max value 10
+        :param o_cacn: Name of issuing CA
+        :type  o_cacn: str
+        """
+        _args = [a_serial_number]
+        _params = {'revocation_reason': o_revocation_reason}
+        if o_cacn is not None:
+            _params['cacn'] = o_cacn
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('cert_revoke', _args, _params)
+
+    def cert_show(
+        self,
+        a_serial_number,
+        o_cacn='ipa',
+        o_out=None,
+        o_chain=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Retrieve an existing certificate.
+
+
+        :param a_serial_number: Serial number in decimal or if prefixed with
+            0x in hexadecimal
+        :type  a_serial_number: int, min value -2147483648, max value 2147483647
+        :param o_cacn: Name of issuing CA
+        :type  o_cacn: str
+        :param o_out: File to store the certificate in.
+        :type  o_out: str
+        :param o_chain: Include certificate chain in output
+        :type  o_chain: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_serial_number]
+        _params = {
+            'chain': o_chain,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_cacn is not None:
+            _params['cacn'] = o_cacn
+        if o_out is not None:
+            _params['out'] = o_out
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('cert_show', _args, _params)
+
+    def cert_status(
+        self,
+        a_request_id,
+        o_cacn='ipa',
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Check the status of a certificate signing request.
+
+
+        :param a_request_id: Request id
+        :type  a_request_id: int, min value -2147483648, max value 2147483647
+        :param o_cacn: Name of issuing CA
+        :type  o_cacn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_request_id]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_cacn is not None:
+            _params['cacn'] = o_cacn
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('cert_status', _args, _params)
+
+    def certmap_match(
+        self,
+        a_certificate,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Search for users matching the provided certificate.
+
+        This command relies on SSSD to retrieve the list of matching users and
+        may return cached data. For more information on purging SSSD cache,
+        please refer to sss_cache documentation.
+
+
+        :param a_certificate: Base-64 encoded user certificate
+        :type  a_certificate: Certificate
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_certificate]
+        _params = {'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('certmap_match', _args, _params)
+
+    def certmapconfig_mod(
+        self,
+        o_ipacertmappromptusername=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Modify Certificate Identity Mapping configuration.
+
+
+        :param o_ipacertmappromptusername: Prompt for the username when
+            multiple identities are mapped to a certificate
+        :type  o_ipacertmappromptusername: Bool
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = []
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if o_ipacertmappromptusername is not None:
+            _params['ipacertmappromptusername'] = o_ipacertmappromptusername
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('certmapconfig_mod', _args, _params)
+
+    def certmapconfig_show(
+        self,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Show the current Certificate Identity Mapping configuration.
+
+
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = []
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('certmapconfig_show', _args, _params)
+
+    def certmaprule_add(
+        self,
+        a_cn,
+        o_description=None,
+        o_ipacertmapmaprule=None,
+        o_ipacertmapmatchrule=None,
+        o_associateddomain=None,
+        o_ipacertmappriority=None,
+        o_ipaenabledflag=True,
+        o_setattr=None,
+        o_addattr=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Create a new Certificate Identity Mapping Rule.
+
+
+        :param a_cn: Certificate Identity Mapping Rule name
+        :type  a_cn: str
+        :param o_description: Certificate Identity Mapping Rule description
+        :type  o_description: str
+        :param o_ipacertmapmaprule: Rule used to map the certificate with a
+            user entry
+        :type  o_ipacertmapmaprule: str
+        :param o_ipacertmapmatchrule: Rule used to check if a certificate can
+            be used for authentication
+        :type  o_ipacertmapmatchrule: str
+        :param o_associateddomain: Domain where the user entry will be
+            searched
+        :type  o_associateddomain: DNSNameParam
+        :param o_ipacertmappriority: Priority of the rule (higher number means
+            lower priority
+        :type  o_ipacertmappriority: int, min value 0, max value 2147483647
+        :param o_ipaenabledflag: Enabled
+        :type  o_ipaenabledflag: bool
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipacertmapmaprule is not None:
+            _params['ipacertmapmaprule'] = o_ipacertmapmaprule
+        if o_ipacertmapmatchrule is not None:
+            _params['ipacertmapmatchrule'] = o_ipacertmapmatchrule
+        if o_associateddomain is not None:
+            _params['associateddomain'] = o_associateddomain
+        if o_ipacertmappriority is not None:
+            _params['ipacertmappriority'] = o_ipacertmappriority
+        if o_ipaenabledflag is not None:
+            _params['ipaenabledflag'] = o_ipaenabledflag
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('certmaprule_add', _args, _params)
+
+    def certmaprule_del(
+        self,
+        a_cn,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete a Certificate Identity Mapping Rule.
+
+
+        :param a_cn: Certificate Identity Mapping Rule name
+        :type  a_cn: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_cn]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('certmaprule_del', _args, _params)
+
+    def certmaprule_disable(
+        self,
+        a_cn,
+        **kwargs
+    ):
+        """
+        Disable a Certificate Identity Mapping Rule.
+
+
+        :param a_cn: Certificate Identity Mapping Rule name
+        :type  a_cn: str
+        """
+        _args = [a_cn]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('certmaprule_disable', _args, _params)
+
+    def certmaprule_enable(
+        self,
+        a_cn,
+        **kwargs
+    ):
+        """
+        Enable a Certificate Identity Mapping Rule.
+
+
+        :param a_cn: Certificate Identity Mapping Rule name
+        :type  a_cn: str
+        """
+        _args = [a_cn]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('certmaprule_enable', _args, _params)
+
+    def certmaprule_find(
+        self,
+        a_criteria=None,
+        o_cn=None,
+        o_description=None,
+        o_ipacertmapmaprule=None,
+        o_ipacertmapmatchrule=None,
+        o_associateddomain=None,
+        o_ipacertmappriority=None,
+        o_ipaenabledflag=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for Certificate Identity Mapping Rules.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_cn: Certificate Identity Mapping Rule name
+        :type  o_cn: str
+        :param o_description: Certificate Identity Mapping Rule description
+        :type  o_description: str
+        :param o_ipacertmapmaprule: Rule used to map the certificate with a
+            user entry
+        :type  o_ipacertmapmaprule: str
+        :param o_ipacertmapmatchrule: Rule used to check if a certificate can
+            be used for authentication
+        :type  o_ipacertmapmatchrule: str
+        :param o_associateddomain: Domain where the user entry will be
+            searched
+        :type  o_associateddomain: DNSNameParam
+        :param o_ipacertmappriority: Priority of the rule (higher number means
+            lower priority
+        :type  o_ipacertmappriority: int, min value 0, max value 2147483647
+        :param o_ipaenabledflag: Enabled
+        :type  o_ipaenabledflag: Bool
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("rulename")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipacertmapmaprule is not None:
+            _params['ipacertmapmaprule'] = o_ipacertmapmaprule
+        if o_ipacertmapmatchrule is not None:
+            _params['ipacertmapmatchrule'] = o_ipacertmapmatchrule
+        if o_associateddomain is not None:
+            _params['associateddomain'] = o_associateddomain
+        if o_ipacertmappriority is not None:
+            _params['ipacertmappriority'] = o_ipacertmappriority
+        if o_ipaenabledflag is not None:
+            _params['ipaenabledflag'] = o_ipaenabledflag
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('certmaprule_find', _args, _params)
+
+    def certmaprule_mod(
+        self,
+        a_cn,
+        o_description=None,
+        o_ipacertmapmaprule=None,
+        o_ipacertmapmatchrule=None,
+        o_associateddomain=None,
+        o_ipacertmappriority=None,
+        o_ipaenabledflag=True,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Modify a Certificate Identity Mapping Rule.
+
+
+        :param a_cn: Certificate Identity Mapping Rule name
+        :type  a_cn: str
+        :param o_description: Certificate Identity Mapping Rule description
+        :type  o_description: str
+        :param o_ipacertmapmaprule: Rule used to map the certificate with a
+            user entry
+        :type  o_ipacertmapmaprule: str
+        :param o_ipacertmapmatchrule: Rule used to check if a certificate can
+            be used for authentication
+        :type  o_ipacertmapmatchrule: str
+        :param o_associateddomain: Domain where the user entry will be
+            searched
+        :type  o_associateddomain: DNSNameParam
+        :param o_ipacertmappriority: Priority of the rule (higher number means
+            lower priority
+        :type  o_ipacertmappriority: int, min value 0, max value 2147483647
+        :param o_ipaenabledflag: Enabled
+        :type  o_ipaenabledflag: bool
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipacertmapmaprule is not None:
+            _params['ipacertmapmaprule'] = o_ipacertmapmaprule
+        if o_ipacertmapmatchrule is not None:
+            _params['ipacertmapmatchrule'] = o_ipacertmapmatchrule
+        if o_associateddomain is not None:
+            _params['associateddomain'] = o_associateddomain
+        if o_ipacertmappriority is not None:
+            _params['ipacertmappriority'] = o_ipacertmappriority
+        if o_ipaenabledflag is not None:
+            _params['ipaenabledflag'] = o_ipaenabledflag
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('certmaprule_mod', _args, _params)
+
+    def certmaprule_show(
+        self,
+        a_cn,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display information about a Certificate Identity Mapping Rule.
+
+
+        :param a_cn: Certificate Identity Mapping Rule name
+        :type  a_cn: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('certmaprule_show', _args, _params)
+
+    def certprofile_del(
+        self,
+        a_cn,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete a Certificate Profile.
+
+
+        :param a_cn: Profile ID for referring to this profile
+        :type  a_cn: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_cn]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('certprofile_del', _args, _params)
+
+    def certprofile_find(
+        self,
+        a_criteria=None,
+        o_cn=None,
+        o_description=None,
+        o_ipacertprofilestoreissued=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for Certificate Profiles.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_cn: Profile ID for referring to this profile
+        :type  o_cn: str
+        :param o_description: Brief description of this profile
+        :type  o_description: str
+        :param o_ipacertprofilestoreissued: Whether to store certs issued
+            using this profile
+        :type  o_ipacertprofilestoreissued: Bool
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("id")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipacertprofilestoreissued is not None:
+            _params['ipacertprofilestoreissued'] = o_ipacertprofilestoreissued
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('certprofile_find', _args, _params)
+
+    def certprofile_import(
+        self,
+        a_cn,
+        o_description,
+        o_file,
+        o_ipacertprofilestoreissued=True,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Import a Certificate Profile.
+
+
+        :param a_cn: Profile ID for referring to this profile
+        :type  a_cn: str
+        :param o_description: Brief description of this profile
+        :type  o_description: str
+        :param o_ipacertprofilestoreissued: Whether to store certs issued
+            using this profile
+        :type  o_ipacertprofilestoreissued: Bool
+        :param o_file: Filename of a raw profile. The XML format is not
+            supported.
+        :type  o_file: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'description': o_description,
+            'ipacertprofilestoreissued': o_ipacertprofilestoreissued,
+            'file': o_file,
+            'all': o_all,
+            'raw': o_raw,
+        }
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('certprofile_import', _args, _params)
+
+    def certprofile_mod(
+        self,
+        a_cn,
+        o_description=None,
+        o_ipacertprofilestoreissued=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_file=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Modify Certificate Profile configuration.
+
+
+        :param a_cn: Profile ID for referring to this profile
+        :type  a_cn: str
+        :param o_description: Brief description of this profile
+        :type  o_description: str
+        :param o_ipacertprofilestoreissued: Whether to store certs issued
+            using this profile
+        :type  o_ipacertprofilestoreissued: Bool
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_file: File containing profile configuration
+        :type  o_file: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipacertprofilestoreissued is not None:
+            _params['ipacertprofilestoreissued'] = o_ipacertprofilestoreissued
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if o_file is not None:
+            _params['file'] = o_file
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('certprofile_mod', _args, _params)
+
+    def certprofile_show(
+        self,
+        a_cn,
+        o_rights=False,
+        o_out=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display the properties of a Certificate Profile.
+
+
+        :param a_cn: Profile ID for referring to this profile
+        :type  a_cn: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_out: Write profile configuration to file
+        :type  o_out: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if o_out is not None:
+            _params['out'] = o_out
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('certprofile_show', _args, _params)
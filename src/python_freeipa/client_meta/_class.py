@@ -0,0 +1,61 @@
+class Commands(object):
+
+    def class_find(
+        self,
+        a_criteria=None,
+        o_all=True,
+        o_raw=False,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for classes.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("name")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('class_find', _args, _params)
+
+    def class_show(
+        self,
+        a_full_name,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display information about a class.
+
+
+        :param a_full_name: Full name
+        :type  a_full_name: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_full_name]
+        _params = {'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('class_show', _args, _params)
@@ -0,0 +1,90 @@
+class Commands(object):
+
+    def command_defaults(
+        self,
+        a_full_name,
+        o_params=None,
+        o_kw=None,
+        **kwargs
+    ):
+        """
+        Return command defaults
+
+
+        :param a_full_name: Full name
+        :type  a_full_name: str
+        :param o_params: <params>
+        :type  o_params: str
+        :param o_kw: <kw>
+        :type  o_kw: dict
+        """
+        _args = [a_full_name]
+        _params = {}
+        if o_params is not None:
+            _params['params'] = o_params
+        if o_kw is not None:
+            _params['kw'] = o_kw
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('command_defaults', _args, _params)
+
+    def command_find(
+        self,
+        a_criteria=None,
+        o_all=True,
+        o_raw=False,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for commands.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("name")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('command_find', _args, _params)
+
+    def command_show(
+        self,
+        a_full_name,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display information about a command.
+
+
+        :param a_full_name: Full name
+        :type  a_full_name: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_full_name]
+        _params = {'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('command_show', _args, _params)
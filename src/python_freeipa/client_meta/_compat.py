@@ -0,0 +1,17 @@
+class Commands(object):
+
+    def compat_is_enabled(
+        self,
+        **kwargs
+    ):
+        """
+        Determine whether Schema Compatibility plugin is configured to serve trusted domain users and groups
+
+
+        """
+        _args = []
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('compat_is_enabled', _args, _params)
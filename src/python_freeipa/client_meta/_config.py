@@ -0,0 +1,193 @@
+class Commands(object):
+
+    def config_mod(
+        self,
+        o_ipamaxusernamelength=None,
+        o_ipamaxhostnamelength=None,
+        o_ipahomesrootdir=None,
+        o_ipadefaultloginshell=None,
+        o_ipadefaultprimarygroup=None,
+        o_ipadefaultemaildomain=None,
+        o_ipasearchtimelimit=None,
+        o_ipasearchrecordslimit=None,
+        o_ipausersearchfields=None,
+        o_ipagroupsearchfields=None,
+        o_ipamigrationenabled=None,
+        o_ipagroupobjectclasses=None,
+        o_ipauserobjectclasses=None,
+        o_ipapwdexpadvnotify=None,
+        o_ipaconfigstring=None,
+        o_ipaselinuxusermaporder=None,
+        o_ipaselinuxusermapdefault=None,
+        o_ipakrbauthzdata=None,
+        o_ipauserauthtype=None,
+        o_ca_renewal_master_server=None,
+        o_ipadomainresolutionorder=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Modify configuration options.
+
+
+        :param o_ipamaxusernamelength: Maximum username length
+        :type  o_ipamaxusernamelength: int, min value 1, max value 255
+        :param o_ipamaxhostnamelength: Maximum hostname length
+        :type  o_ipamaxhostnamelength: int, min value 64, max value 255
+        :param o_ipahomesrootdir: Default location of home directories
+        :type  o_ipahomesrootdir: IA5Str
+        :param o_ipadefaultloginshell: Default shell for new users
+        :type  o_ipadefaultloginshell: str
+        :param o_ipadefaultprimarygroup: Default group for new users
+        :type  o_ipadefaultprimarygroup: str
+        :param o_ipadefaultemaildomain: Default e-mail domain
+        :type  o_ipadefaultemaildomain: str
+        :param o_ipasearchtimelimit: Maximum amount of time (seconds) for a
+            search (-1 or 0 is unlimited)
+        :type  o_ipasearchtimelimit: int, min value -1, max value 2147483647
+        :param o_ipasearchrecordslimit: Maximum number of records to search
+            (-1 or 0 is unlimited)
+        :type  o_ipasearchrecordslimit: int, min value -2147483648, max value 2147483647
+        :param o_ipausersearchfields: A comma-separated list of fields to
+            search in when searching for users
+        :type  o_ipausersearchfields: IA5Str
+        :param o_ipagroupsearchfields: A comma-separated list of fields to
+            search in when searching for groups
+        :type  o_ipagroupsearchfields: IA5Str
+        :param o_ipamigrationenabled: Enable migration mode
+        :type  o_ipamigrationenabled: Bool
+        :param o_ipagroupobjectclasses: Default group objectclasses (comma-
+            separated list)
+        :type  o_ipagroupobjectclasses: str
+        :param o_ipauserobjectclasses: Default user objectclasses (comma-
+            separated list)
+        :type  o_ipauserobjectclasses: str
+        :param o_ipapwdexpadvnotify: Number of days's notice of impending
+            password expiration
+        :type  o_ipapwdexpadvnotify: int, min value 0, max value 2147483647
+        :param o_ipaconfigstring: Extra hashes to generate in password plug-in
+        :type  o_ipaconfigstring: list of str, valid values ['AllowNThash', 'KDC:Disable Last Success', 'KDC:Disable Lockout', 'KDC:Disable Default Preauth for SPNs']
+        :param o_ipaselinuxusermaporder: Order in increasing priority of
+            SELinux users, delimited by $
+        :type  o_ipaselinuxusermaporder: str
+        :param o_ipaselinuxusermapdefault: Default SELinux user when no match
+            is found in SELinux map rule
+        :type  o_ipaselinuxusermapdefault: str
+        :param o_ipakrbauthzdata: Default types of PAC supported for services
+        :type  o_ipakrbauthzdata: list of str, valid values ['MS-PAC', 'PAD', 'nfs:NONE']
+        :param o_ipauserauthtype: Default types of supported user
+            authentication
+        :type  o_ipauserauthtype: list of str, valid values ['password', 'radius', 'otp', 'pkinit', 'hardened', 'disabled']
+        :param o_ca_renewal_master_server: Renewal master for IPA certificate
+            authority
+        :type  o_ca_renewal_master_server: str
+        :param o_ipadomainresolutionorder: colon-separated list of domains
+            used for short name qualification
+        :type  o_ipadomainresolutionorder: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = []
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if o_ipamaxusernamelength is not None:
+            _params['ipamaxusernamelength'] = o_ipamaxusernamelength
+        if o_ipamaxhostnamelength is not None:
+            _params['ipamaxhostnamelength'] = o_ipamaxhostnamelength
+        if o_ipahomesrootdir is not None:
+            _params['ipahomesrootdir'] = o_ipahomesrootdir
+        if o_ipadefaultloginshell is not None:
+            _params['ipadefaultloginshell'] = o_ipadefaultloginshell
+        if o_ipadefaultprimarygroup is not None:
+            _params['ipadefaultprimarygroup'] = o_ipadefaultprimarygroup
+        if o_ipadefaultemaildomain is not None:
+            _params['ipadefaultemaildomain'] = o_ipadefaultemaildomain
+        if o_ipasearchtimelimit is not None:
+            _params['ipasearchtimelimit'] = o_ipasearchtimelimit
+        if o_ipasearchrecordslimit is not None:
+            _params['ipasearchrecordslimit'] = o_ipasearchrecordslimit
+        if o_ipausersearchfields is not None:
+            _params['ipausersearchfields'] = o_ipausersearchfields
+        if o_ipagroupsearchfields is not None:
+            _params['ipagroupsearchfields'] = o_ipagroupsearchfields
+        if o_ipamigrationenabled is not None:
+            _params['ipamigrationenabled'] = o_ipamigrationenabled
+        if o_ipagroupobjectclasses is not None:
+            _params['ipagroupobjectclasses'] = o_ipagroupobjectclasses
+        if o_ipauserobjectclasses is not None:
+            _params['ipauserobjectclasses'] = o_ipauserobjectclasses
+        if o_ipapwdexpadvnotify is not None:
+            _params['ipapwdexpadvnotify'] = o_ipapwdexpadvnotify
+        if o_ipaconfigstring is not None:
+            _params['ipaconfigstring'] = o_ipaconfigstring
+        if o_ipaselinuxusermaporder is not None:
+            _params['ipaselinuxusermaporder'] = o_ipaselinuxusermaporder
+        if o_ipaselinuxusermapdefault is not None:
+            _params['ipaselinuxusermapdefault'] = o_ipaselinuxusermapdefault
+        if o_ipakrbauthzdata is not None:
+            _params['ipakrbauthzdata'] = o_ipakrbauthzdata
+        if o_ipauserauthtype is not None:
+            _params['ipauserauthtype'] = o_ipauserauthtype
+        if o_ca_renewal_master_server is not None:
+            _params['ca_renewal_master_server'] = o_ca_renewal_master_server
+        if o_ipadomainresolutionorder is not None:
+            _params['ipadomainresolutionorder'] = o_ipadomainresolutionorder
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('config_mod', _args, _params)
+
+    def config_show(
+        self,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Show the current configuration.
+
+
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = []
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('config_show', _args, _params)
@@ -0,0 +1,224 @@
+class Commands(object):
+
+    def cosentry_add(
+        self,
+        a_cn,
+        o_krbpwdpolicyreference,
+        o_cospriority,
+        o_setattr=None,
+        o_addattr=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Add Class of Service entry
+
+
+        :param a_cn: <cn>
+        :type  a_cn: str
+        :param o_krbpwdpolicyreference: <krbpwdpolicyreference>
+        :type  o_krbpwdpolicyreference: DNParam
+        :param o_cospriority: <cospriority>
+        :type  o_cospriority: int, min value 0, max value 2147483647
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'krbpwdpolicyreference': o_krbpwdpolicyreference,
+            'cospriority': o_cospriority,
+            'all': o_all,
+            'raw': o_raw,
+        }
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('cosentry_add', _args, _params)
+
+    def cosentry_del(
+        self,
+        a_cn,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete Class of Service entry
+
+
+        :param a_cn: <cn>
+        :type  a_cn: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_cn]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('cosentry_del', _args, _params)
+
+    def cosentry_find(
+        self,
+        a_criteria=None,
+        o_cn=None,
+        o_krbpwdpolicyreference=None,
+        o_cospriority=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for Class of Service entry
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_cn: <cn>
+        :type  o_cn: str
+        :param o_krbpwdpolicyreference: <krbpwdpolicyreference>
+        :type  o_krbpwdpolicyreference: DNParam
+        :param o_cospriority: <cospriority>
+        :type  o_cospriority: int, min value 0, max value 2147483647
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("cn")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_krbpwdpolicyreference is not None:
+            _params['krbpwdpolicyreference'] = o_krbpwdpolicyreference
+        if o_cospriority is not None:
+            _params['cospriority'] = o_cospriority
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('cosentry_find', _args, _params)
+
+    def cosentry_mod(
+        self,
+        a_cn,
+        o_krbpwdpolicyreference=None,
+        o_cospriority=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Modify Class of Service entry
+
+
+        :param a_cn: <cn>
+        :type  a_cn: str
+        :param o_krbpwdpolicyreference: <krbpwdpolicyreference>
+        :type  o_krbpwdpolicyreference: DNParam
+        :param o_cospriority: <cospriority>
+        :type  o_cospriority: int, min value 0, max value 2147483647
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if o_krbpwdpolicyreference is not None:
+            _params['krbpwdpolicyreference'] = o_krbpwdpolicyreference
+        if o_cospriority is not None:
+            _params['cospriority'] = o_cospriority
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('cosentry_mod', _args, _params)
+
+    def cosentry_show(
+        self,
+        a_cn,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display Class of Service entry
+
+
+        :param a_cn: <cn>
+        :type  a_cn: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('cosentry_show', _args, _params)
@@ -0,0 +1,202 @@
+class Commands(object):
+
+    def delegation_add(
+        self,
+        a_aciname,
+        o_attrs,
+        o_memberof,
+        o_group,
+        o_permissions=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Add a new delegation.
+
+
+        :param a_aciname: Delegation name
+        :type  a_aciname: str
+        :param o_permissions: Permissions to grant (read, write). Default is
+            write.
+        :type  o_permissions: str
+        :param o_attrs: Attributes to which the delegation applies
+        :type  o_attrs: str
+        :param o_memberof: User group to apply delegation to
+        :type  o_memberof: str
+        :param o_group: User group ACI grants access to
+        :type  o_group: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_aciname]
+        _params = {
+            'attrs': o_attrs,
+            'memberof': o_memberof,
+            'group': o_group,
+            'all': o_all,
+            'raw': o_raw,
+        }
+        if o_permissions is not None:
+            _params['permissions'] = o_permissions
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('delegation_add', _args, _params)
+
+    def delegation_del(
+        self,
+        a_aciname,
+        **kwargs
+    ):
+        """
+        Delete a delegation.
+
+
+        :param a_aciname: Delegation name
+        :type  a_aciname: str
+        """
+        _args = [a_aciname]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('delegation_del', _args, _params)
+
+    def delegation_find(
+        self,
+        a_criteria=None,
+        o_aciname=None,
+        o_permissions=None,
+        o_attrs=None,
+        o_memberof=None,
+        o_group=None,
+        o_pkey_only=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Search for delegations.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_aciname: Delegation name
+        :type  o_aciname: str
+        :param o_permissions: Permissions to grant (read, write). Default is
+            write.
+        :type  o_permissions: str
+        :param o_attrs: Attributes to which the delegation applies
+        :type  o_attrs: str
+        :param o_memberof: User group to apply delegation to
+        :type  o_memberof: str
+        :param o_group: User group ACI grants access to
+        :type  o_group: str
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("name")
+        :type  o_pkey_only: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_aciname is not None:
+            _params['aciname'] = o_aciname
+        if o_permissions is not None:
+            _params['permissions'] = o_permissions
+        if o_attrs is not None:
+            _params['attrs'] = o_attrs
+        if o_memberof is not None:
+            _params['memberof'] = o_memberof
+        if o_group is not None:
+            _params['group'] = o_group
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('delegation_find', _args, _params)
+
+    def delegation_mod(
+        self,
+        a_aciname,
+        o_permissions=None,
+        o_attrs=None,
+        o_memberof=None,
+        o_group=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Modify a delegation.
+
+
+        :param a_aciname: Delegation name
+        :type  a_aciname: str
+        :param o_permissions: Permissions to grant (read, write). Default is
+            write.
+        :type  o_permissions: str
+        :param o_attrs: Attributes to which the delegation applies
+        :type  o_attrs: str
+        :param o_memberof: User group to apply delegation to
+        :type  o_memberof: str
+        :param o_group: User group ACI grants access to
+        :type  o_group: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_aciname]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_permissions is not None:
+            _params['permissions'] = o_permissions
+        if o_attrs is not None:
+            _params['attrs'] = o_attrs
+        if o_memberof is not None:
+            _params['memberof'] = o_memberof
+        if o_group is not None:
+            _params['group'] = o_group
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('delegation_mod', _args, _params)
+
+    def delegation_show(
+        self,
+        a_aciname,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display information about a delegation.
+
+
+        :param a_aciname: Delegation name
+        :type  a_aciname: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_aciname]
+        _params = {'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('delegation_show', _args, _params)
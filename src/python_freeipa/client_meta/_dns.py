@@ -0,0 +1,2857 @@
+class Commands(object):
+
+    def dns_is_enabled(
+        self,
+        **kwargs
+    ):
+        """
+        Checks if any of the servers has the DNS service enabled.
+
+
+        """
+        _args = []
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dns_is_enabled', _args, _params)
+
+    def dns_resolve(
+        self,
+        a_hostname,
+        **kwargs
+    ):
+        """
+        Resolve a host name in DNS. (Deprecated)
+
+
+        :param a_hostname: Hostname (FQDN)
+        :type  a_hostname: str
+        """
+        _args = [a_hostname]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dns_resolve', _args, _params)
+
+    def dns_update_system_records(
+        self,
+        o_dry_run=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Update location and IPA server DNS records
+
+
+        :param o_dry_run: Do not update records only return expected records
+        :type  o_dry_run: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = []
+        _params = {'dry_run': o_dry_run, 'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dns_update_system_records', _args, _params)
+
+    def dnsconfig_mod(
+        self,
+        o_idnsforwarders=None,
+        o_idnsforwardpolicy=None,
+        o_idnsallowsyncptr=None,
+        o_idnszonerefresh=None,
+        o_ipadnsversion=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Modify global DNS configuration.
+
+
+        :param o_idnsforwarders: Global forwarders. A custom port can be
+            specified for each forwarder using a standard format "IP_ADDRESS port
+            PORT"
+        :type  o_idnsforwarders: str
+        :param o_idnsforwardpolicy: Global forwarding policy. Set to "none" to
+            disable any configured global forwarders.
+        :type  o_idnsforwardpolicy: str, valid values ['only', 'first', 'none']
+        :param o_idnsallowsyncptr: Allow synchronization of forward (A, AAAA)
+            and reverse (PTR) records
+        :type  o_idnsallowsyncptr: Bool
+        :param o_idnszonerefresh: An interval between regular polls of the
+            name server for new DNS zones
+        :type  o_idnszonerefresh: int, min value 0, max value 2147483647
+        :param o_ipadnsversion: IPA DNS version
+        :type  o_ipadnsversion: int, min value -2147483648, max value 2147483647
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = []
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if o_idnsforwarders is not None:
+            _params['idnsforwarders'] = o_idnsforwarders
+        if o_idnsforwardpolicy is not None:
+            _params['idnsforwardpolicy'] = o_idnsforwardpolicy
+        if o_idnsallowsyncptr is not None:
+            _params['idnsallowsyncptr'] = o_idnsallowsyncptr
+        if o_idnszonerefresh is not None:
+            _params['idnszonerefresh'] = o_idnszonerefresh
+        if o_ipadnsversion is not None:
+            _params['ipadnsversion'] = o_ipadnsversion
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnsconfig_mod', _args, _params)
+
+    def dnsconfig_show(
+        self,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Show the current global DNS configuration.
+
+
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = []
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnsconfig_show', _args, _params)
+
+    def dnsforwardzone_add(
+        self,
+        a_idnsname,
+        o_name_from_ip=None,
+        o_idnsforwarders=None,
+        o_idnsforwardpolicy=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_skip_overlap_check=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Create new DNS forward zone.
+
+
+        :param a_idnsname: Zone name (FQDN)
+        :type  a_idnsname: DNSNameParam
+        :param o_name_from_ip: IP network to create reverse zone name from
+        :type  o_name_from_ip: str
+        :param o_idnsforwarders: Per-zone forwarders. A custom port can be
+            specified for each forwarder using a standard format "IP_ADDRESS port
+            PORT"
+        :type  o_idnsforwarders: str
+        :param o_idnsforwardpolicy: Per-zone conditional forwarding policy.
+            Set to "none" to disable forwarding to global forwarder for this zone.
+            In that case, conditional zone forwarders are disregarded.
+        :type  o_idnsforwardpolicy: str, valid values ['only', 'first', 'none']
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_skip_overlap_check: Force DNS zone creation even if it will
+            overlap with an existing zone.
+        :type  o_skip_overlap_check: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_idnsname]
+        _params = {
+            'skip_overlap_check': o_skip_overlap_check,
+            'all': o_all,
+            'raw': o_raw,
+        }
+        if o_name_from_ip is not None:
+            _params['name_from_ip'] = o_name_from_ip
+        if o_idnsforwarders is not None:
+            _params['idnsforwarders'] = o_idnsforwarders
+        if o_idnsforwardpolicy is not None:
+            _params['idnsforwardpolicy'] = o_idnsforwardpolicy
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnsforwardzone_add', _args, _params)
+
+    def dnsforwardzone_add_permission(
+        self,
+        a_idnsname,
+        **kwargs
+    ):
+        """
+        Add a permission for per-forward zone access delegation.
+
+
+        :param a_idnsname: Zone name (FQDN)
+        :type  a_idnsname: DNSNameParam
+        """
+        _args = [a_idnsname]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnsforwardzone_add_permission', _args, _params)
+
+    def dnsforwardzone_del(
+        self,
+        a_idnsname,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete DNS forward zone.
+
+
+        :param a_idnsname: Zone name (FQDN)
+        :type  a_idnsname: DNSNameParam
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_idnsname]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnsforwardzone_del', _args, _params)
+
+    def dnsforwardzone_disable(
+        self,
+        a_idnsname,
+        **kwargs
+    ):
+        """
+        Disable DNS Forward Zone.
+
+
+        :param a_idnsname: Zone name (FQDN)
+        :type  a_idnsname: DNSNameParam
+        """
+        _args = [a_idnsname]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnsforwardzone_disable', _args, _params)
+
+    def dnsforwardzone_enable(
+        self,
+        a_idnsname,
+        **kwargs
+    ):
+        """
+        Enable DNS Forward Zone.
+
+
+        :param a_idnsname: Zone name (FQDN)
+        :type  a_idnsname: DNSNameParam
+        """
+        _args = [a_idnsname]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnsforwardzone_enable', _args, _params)
+
+    def dnsforwardzone_find(
+        self,
+        a_criteria=None,
+        o_idnsname=None,
+        o_name_from_ip=None,
+        o_idnszoneactive=None,
+        o_idnsforwarders=None,
+        o_idnsforwardpolicy=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for DNS forward zones.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_idnsname: Zone name (FQDN)
+        :type  o_idnsname: DNSNameParam
+        :param o_name_from_ip: IP network to create reverse zone name from
+        :type  o_name_from_ip: str
+        :param o_idnszoneactive: Is zone active?
+        :type  o_idnszoneactive: Bool
+        :param o_idnsforwarders: Per-zone forwarders. A custom port can be
+            specified for each forwarder using a standard format "IP_ADDRESS port
+            PORT"
+        :type  o_idnsforwarders: str
+        :param o_idnsforwardpolicy: Per-zone conditional forwarding policy.
+            Set to "none" to disable forwarding to global forwarder for this zone.
+            In that case, conditional zone forwarders are disregarded.
+        :type  o_idnsforwardpolicy: str, valid values ['only', 'first', 'none']
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("name")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_idnsname is not None:
+            _params['idnsname'] = o_idnsname
+        if o_name_from_ip is not None:
+            _params['name_from_ip'] = o_name_from_ip
+        if o_idnszoneactive is not None:
+            _params['idnszoneactive'] = o_idnszoneactive
+        if o_idnsforwarders is not None:
+            _params['idnsforwarders'] = o_idnsforwarders
+        if o_idnsforwardpolicy is not None:
+            _params['idnsforwardpolicy'] = o_idnsforwardpolicy
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnsforwardzone_find', _args, _params)
+
+    def dnsforwardzone_mod(
+        self,
+        a_idnsname,
+        o_name_from_ip=None,
+        o_idnsforwarders=None,
+        o_idnsforwardpolicy=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Modify DNS forward zone.
+
+
+        :param a_idnsname: Zone name (FQDN)
+        :type  a_idnsname: DNSNameParam
+        :param o_name_from_ip: IP network to create reverse zone name from
+        :type  o_name_from_ip: str
+        :param o_idnsforwarders: Per-zone forwarders. A custom port can be
+            specified for each forwarder using a standard format "IP_ADDRESS port
+            PORT"
+        :type  o_idnsforwarders: str
+        :param o_idnsforwardpolicy: Per-zone conditional forwarding policy.
+            Set to "none" to disable forwarding to global forwarder for this zone.
+            In that case, conditional zone forwarders are disregarded.
+        :type  o_idnsforwardpolicy: str, valid values ['only', 'first', 'none']
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_idnsname]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if o_name_from_ip is not None:
+            _params['name_from_ip'] = o_name_from_ip
+        if o_idnsforwarders is not None:
+            _params['idnsforwarders'] = o_idnsforwarders
+        if o_idnsforwardpolicy is not None:
+            _params['idnsforwardpolicy'] = o_idnsforwardpolicy
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnsforwardzone_mod', _args, _params)
+
+    def dnsforwardzone_remove_permission(
+        self,
+        a_idnsname,
+        **kwargs
+    ):
+        """
+        Remove a permission for per-forward zone access delegation.
+
+
+        :param a_idnsname: Zone name (FQDN)
+        :type  a_idnsname: DNSNameParam
+        """
+        _args = [a_idnsname]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnsforwardzone_remove_permission', _args, _params)
+
+    def dnsforwardzone_show(
+        self,
+        a_idnsname,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display information about a DNS forward zone.
+
+
+        :param a_idnsname: Zone name (FQDN)
+        :type  a_idnsname: DNSNameParam
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_idnsname]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnsforwardzone_show', _args, _params)
+
+    def dnsrecord_add(
+        self,
+        a_dnszoneidnsname,
+        a_idnsname,
+        o_dnsttl=None,
+        o_dnsclass=None,
+        o_arecord=None,
+        o_a_part_ip_address=None,
+        o_a_extra_create_reverse=False,
+        o_aaaarecord=None,
+        o_aaaa_part_ip_address=None,
+        o_aaaa_extra_create_reverse=False,
+        o_a6record=None,
+        o_a6_part_data=None,
+        o_afsdbrecord=None,
+        o_afsdb_part_subtype=None,
+        o_afsdb_part_hostname=None,
+        o_aplrecord=None,
+        o_certrecord=None,
+        o_cert_part_type=None,
+        o_cert_part_key_tag=None,
+        o_cert_part_algorithm=None,
+        o_cert_part_certificate_or_crl=None,
+        o_cnamerecord=None,
+        o_cname_part_hostname=None,
+        o_dhcidrecord=None,
+        o_dlvrecord=None,
+        o_dlv_part_key_tag=None,
+        o_dlv_part_algorithm=None,
+        o_dlv_part_digest_type=None,
+        o_dlv_part_digest=None,
+        o_dnamerecord=None,
+        o_dname_part_target=None,
+        o_dsrecord=None,
+        o_ds_part_key_tag=None,
+        o_ds_part_algorithm=None,
+        o_ds_part_digest_type=None,
+        o_ds_part_digest=None,
+        o_hiprecord=None,
+        o_ipseckeyrecord=None,
+        o_keyrecord=None,
+        o_kxrecord=None,
+        o_kx_part_preference=None,
+        o_kx_part_exchanger=None,
+        o_locrecord=None,
+        o_loc_part_lat_deg=None,
+        o_loc_part_lat_min=None,
+        o_loc_part_lat_sec=None,
+        o_loc_part_lat_dir=None,
+        o_loc_part_lon_deg=None,
+        o_loc_part_lon_min=None,
+        o_loc_part_lon_sec=None,
+        o_loc_part_lon_dir=None,
+        o_loc_part_altitude=None,
+        o_loc_part_size=None,
+        o_loc_part_h_precision=None,
+        o_loc_part_v_precision=None,
+        o_mxrecord=None,
+        o_mx_part_preference=None,
+        o_mx_part_exchanger=None,
+        o_naptrrecord=None,
+        o_naptr_part_order=None,
+        o_naptr_part_preference=None,
+        o_naptr_part_flags=None,
+        o_naptr_part_service=None,
+        o_naptr_part_regexp=None,
+        o_naptr_part_replacement=None,
+        o_nsrecord=None,
+        o_ns_part_hostname=None,
+        o_nsecrecord=None,
+        o_ptrrecord=None,
+        o_ptr_part_hostname=None,
+        o_rrsigrecord=None,
+        o_rprecord=None,
+        o_sigrecord=None,
+        o_spfrecord=None,
+        o_srvrecord=None,
+        o_srv_part_priority=None,
+        o_srv_part_weight=None,
+        o_srv_part_port=None,
+        o_srv_part_target=None,
+        o_sshfprecord=None,
+        o_sshfp_part_algorithm=None,
+        o_sshfp_part_fp_type=None,
+        o_sshfp_part_fingerprint=None,
+        o_tlsarecord=None,
+        o_tlsa_part_cert_usage=None,
+        o_tlsa_part_selector=None,
+        o_tlsa_part_matching_type=None,
+        o_tlsa_part_cert_association_data=None,
+        o_txtrecord=None,
+        o_txt_part_data=None,
+        o_urirecord=None,
+        o_uri_part_priority=None,
+        o_uri_part_weight=None,
+        o_uri_part_target=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_force=False,
+        o_structured=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Add new DNS resource record.
+
+
+        :param a_dnszoneidnsname: Zone name (FQDN)
+        :type  a_dnszoneidnsname: DNSNameParam
+        :param a_idnsname: Record name
+        :type  a_idnsname: DNSNameParam
+        :param o_dnsttl: Time to live
+        :type  o_dnsttl: int, min value -2147483648, max value 2147483647
+        :param o_dnsclass: <dnsclass>
+        :type  o_dnsclass: str, valid values ['IN', 'CS', 'CH', 'HS']
+        :param o_arecord: Raw A records
+        :type  o_arecord: ARecord
+        :param o_a_part_ip_address: A IP Address
+        :type  o_a_part_ip_address: str
+        :param o_a_extra_create_reverse: Create reverse record for this IP
+            Address
+        :type  o_a_extra_create_reverse: bool
+        :param o_aaaarecord: Raw AAAA records
+        :type  o_aaaarecord: AAAARecord
+        :param o_aaaa_part_ip_address: AAAA IP Address
+        :type  o_aaaa_part_ip_address: str
+        :param o_aaaa_extra_create_reverse: Create reverse record for this IP
+            Address
+        :type  o_aaaa_extra_create_reverse: bool
+        :param o_a6record: Raw A6 records
+        :type  o_a6record: A6Record
+        :param o_a6_part_data: A6 Record data
+        :type  o_a6_part_data: str
+        :param o_afsdbrecord: Raw AFSDB records
+        :type  o_afsdbrecord: AFSDBRecord
+        :param o_afsdb_part_subtype: AFSDB Subtype
+        :type  o_afsdb_part_subtype: int, min value 0, max value 65535
+        :param o_afsdb_part_hostname: AFSDB Hostname
+        :type  o_afsdb_part_hostname: DNSNameParam
+        :param o_aplrecord: Raw APL records
+        :type  o_aplrecord: APLRecord
+        :param o_certrecord: Raw CERT records
+        :type  o_certrecord: CERTRecord
+        :param o_cert_part_type: CERT Certificate Type
+        :type  o_cert_part_type: int, min value 0, max value 65535
+        :param o_cert_part_key_tag: CERT Key Tag
+        :type  o_cert_part_key_tag: int, min value 0, max value 65535
+        :param o_cert_part_algorithm: CERT Algorithm
+        :type  o_cert_part_algorithm: int, min value 0, max value 255
+        :param o_cert_part_certificate_or_crl: CERT Certificate/CRL
+        :type  o_cert_part_certificate_or_crl: str
+        :param o_cnamerecord: Raw CNAME records
+        :type  o_cnamerecord: CNAMERecord
+        :param o_cname_part_hostname: A hostname which this alias hostname
+            points to
+        :type  o_cname_part_hostname: DNSNameParam
+        :param o_dhcidrecord: Raw DHCID records
+        :type  o_dhcidrecord: DHCIDRecord
+        :param o_dlvrecord: Raw DLV records
+        :type  o_dlvrecord: DLVRecord
+        :param o_dlv_part_key_tag: DLV Key Tag
+        :type  o_dlv_part_key_tag: int, min value 0, max value 65535
+        :param o_dlv_part_algorithm: DLV Algorithm
+        :type  o_dlv_part_algorithm: int, min value 0, max value 255
+        :param o_dlv_part_digest_type: DLV Digest Type
+        :type  o_dlv_part_digest_type: int, min value 0, max value 255
+        :param o_dlv_part_digest: DLV Digest
+        :type  o_dlv_part_digest: str
+        :param o_dnamerecord: Raw DNAME records
+        :type  o_dnamerecord: DNAMERecord
+        :param o_dname_part_target: DNAME Target
+        :type  o_dname_part_target: DNSNameParam
+        :param o_dsrecord: Raw DS records
+        :type  o_dsrecord: DSRecord
+        :param o_ds_part_key_tag: DS Key Tag
+        :type  o_ds_part_key_tag: int, min value 0, max value 65535
+        :param o_ds_part_algorithm: DS Algorithm
+        :type  o_ds_part_algorithm: int, min value 0, max value 255
+        :param o_ds_part_digest_type: DS Digest Type
+        :type  o_ds_part_digest_type: int, min value 0, max value 255
+        :param o_ds_part_digest: DS Digest
+        :type  o_ds_part_digest: str
+        :param o_hiprecord: Raw HIP records
+        :type  o_hiprecord: HIPRecord
+        :param o_ipseckeyrecord: Raw IPSECKEY records
+        :type  o_ipseckeyrecord: IPSECKEYRecord
+        :param o_keyrecord: Raw KEY records
+        :type  o_keyrecord: KEYRecord
+        :param o_kxrecord: Raw KX records
+        :type  o_kxrecord: KXRecord
+        :param o_kx_part_preference: Preference given to this exchanger. Lower
+            values are more preferred
+        :type  o_kx_part_preference: int, min value 0, max value 65535
+        :param o_kx_part_exchanger: A host willing to act as a key exchanger
+        :type  o_kx_part_exchanger: DNSNameParam
+        :param o_locrecord: Raw LOC records
+        :type  o_locrecord: LOCRecord
+        :param o_loc_part_lat_deg: LOC Degrees Latitude
+        :type  o_loc_part_lat_deg: int, min value 0, max value 90
+        :param o_loc_part_lat_min: LOC Minutes Latitude
+        :type  o_loc_part_lat_min: int, min value 0, max value 59
+        :param o_loc_part_lat_sec: LOC Seconds Latitude
+        :type  o_loc_part_lat_sec: Decimal
+        :param o_loc_part_lat_dir: LOC Direction Latitude
+        :type  o_loc_part_lat_dir: str, valid values ['N', 'S']
+        :param o_loc_part_lon_deg: LOC Degrees Longitude
+        :type  o_loc_part_lon_deg: int, min value 0, max value 180
+        :param o_loc_part_lon_min: LOC Minutes Longitude
+        :type  o_loc_part_lon_min: int, min value 0, max value 59
+        :param o_loc_part_lon_sec: LOC Seconds Longitude
+        :type  o_loc_part_lon_sec: Decimal
+        :param o_loc_part_lon_dir: LOC Direction Longitude
+        :type  o_loc_part_lon_dir: str, valid values ['E', 'W']
+        :param o_loc_part_altitude: LOC Altitude
+        :type  o_loc_part_altitude: Decimal
+        :param o_loc_part_size: LOC Size
+        :type  o_loc_part_size: Decimal
+        :param o_loc_part_h_precision: LOC Horizontal Precision
+        :type  o_loc_part_h_precision: Decimal
+        :param o_loc_part_v_precision: LOC Vertical Precision
+        :type  o_loc_part_v_precision: Decimal
+        :param o_mxrecord: Raw MX records
+        :type  o_mxrecord: MXRecord
+        :param o_mx_part_preference: Preference given to this exchanger. Lower
+            values are more preferred
+        :type  o_mx_part_preference: int, min value 0, max value 65535
+        :param o_mx_part_exchanger: A host willing to act as a mail exchanger
+        :type  o_mx_part_exchanger: DNSNameParam
+        :param o_naptrrecord: Raw NAPTR records
+        :type  o_naptrrecord: NAPTRRecord
+        :param o_naptr_part_order: NAPTR Order
+        :type  o_naptr_part_order: int, min value 0, max value 65535
+        :param o_naptr_part_preference: NAPTR Preference
+        :type  o_naptr_part_preference: int, min value 0, max value 65535
+        :param o_naptr_part_flags: NAPTR Flags
+        :type  o_naptr_part_flags: str
+        :param o_naptr_part_service: NAPTR Service
+        :type  o_naptr_part_service: str
+        :param o_naptr_part_regexp: NAPTR Regular Expression
+        :type  o_naptr_part_regexp: str
+        :param o_naptr_part_replacement: NAPTR Replacement
+        :type  o_naptr_part_replacement: str
+        :param o_nsrecord: Raw NS records
+        :type  o_nsrecord: NSRecord
+        :param o_ns_part_hostname: NS Hostname
+        :type  o_ns_part_hostname: DNSNameParam
+        :param o_nsecrecord: Raw NSEC records
+        :type  o_nsecrecord: NSECRecord
+        :param o_ptrrecord: Raw PTR records
+        :type  o_ptrrecord: PTRRecord
+        :param o_ptr_part_hostname: The hostname this reverse record points to
+        :type  o_ptr_part_hostname: DNSNameParam
+        :param o_rrsigrecord: Raw RRSIG records
+        :type  o_rrsigrecord: RRSIGRecord
+        :param o_rprecord: Raw RP records
+        :type  o_rprecord: RPRecord
+        :param o_sigrecord: Raw SIG records
+        :type  o_sigrecord: SIGRecord
+        :param o_spfrecord: Raw SPF records
+        :type  o_spfrecord: SPFRecord
+        :param o_srvrecord: Raw SRV records
+        :type  o_srvrecord: SRVRecord
+        :param o_srv_part_priority: Lower number means higher priority.
+            Clients will attempt to contact the server with the lowest-numbered
+            priority they can reach.
+        :type  o_srv_part_priority: int, min value 0, max value 65535
+        :param o_srv_part_weight: Relative weight for entries with the same
+            priority.
+        :type  o_srv_part_weight: int, min value 0, max value 65535
+        :param o_srv_part_port: SRV Port
+        :type  o_srv_part_port: int, min value 0, max value 65535
+        :param o_srv_part_target: The domain name of the target host or '.' if
+            the service is decidedly not available at this domain
+        :type  o_srv_part_target: DNSNameParam
+        :param o_sshfprecord: Raw SSHFP records
+        :type  o_sshfprecord: SSHFPRecord
+        :param o_sshfp_part_algorithm: SSHFP Algorithm
+        :type  o_sshfp_part_algorithm: int, min value 0, max value 255
+        :param o_sshfp_part_fp_type: SSHFP Fingerprint Type
+        :type  o_sshfp_part_fp_type: int, min value 0, max value 255
+        :param o_sshfp_part_fingerprint: SSHFP Fingerprint
+        :type  o_sshfp_part_fingerprint: str
+        :param o_tlsarecord: Raw TLSA records
+        :type  o_tlsarecord: TLSARecord
+        :param o_tlsa_part_cert_usage: TLSA Certificate Usage
+        :type  o_tlsa_part_cert_usage: int, min value 0, max value 255
+        :param o_tlsa_part_selector: TLSA Selector
+        :type  o_tlsa_part_selector: int, min value 0, max value 255
+        :param o_tlsa_part_matching_type: TLSA Matching Type
+        :type  o_tlsa_part_matching_type: int, min value 0, max value 255
+        :param o_tlsa_part_cert_association_data: TLSA Certificate Association
+            Data
+        :type  o_tlsa_part_cert_association_data: str
+        :param o_txtrecord: Raw TXT records
+        :type  o_txtrecord: TXTRecord
+        :param o_txt_part_data: TXT Text Data
+        :type  o_txt_part_data: str
+        :param o_urirecord: Raw URI records
+        :type  o_urirecord: URIRecord
+        :param o_uri_part_priority: Lower number means higher priority.
+            Clients will attempt to contact the URI with the lowest-numbered
+            priority they can reach.
+        :type  o_uri_part_priority: int, min value 0, max value 65535
+        :param o_uri_part_weight: Relative weight for entries with the same
+            priority.
+        :type  o_uri_part_weight: int, min value 0, max value 65535
+        :param o_uri_part_target: Target Uniform Resource Identifier according
+            to RFC 3986
+        :type  o_uri_part_target: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_force: force NS record creation even if its hostname is not
+            in DNS
+        :type  o_force: bool
+        :param o_structured: Parse all raw DNS records and return them in a
+            structured way
+        :type  o_structured: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_dnszoneidnsname, a_idnsname]
+        _params = {
+            'force': o_force,
+            'structured': o_structured,
+            'all': o_all,
+            'raw': o_raw,
+        }
+        if o_dnsttl is not None:
+            _params['dnsttl'] = o_dnsttl
+        if o_dnsclass is not None:
+            _params['dnsclass'] = o_dnsclass
+        if o_arecord is not None:
+            _params['arecord'] = o_arecord
+        if o_a_part_ip_address is not None:
+            _params['a_part_ip_address'] = o_a_part_ip_address
+        if o_a_extra_create_reverse is not None:
+            _params['a_extra_create_reverse'] = o_a_extra_create_reverse
+        if o_aaaarecord is not None:
+            _params['aaaarecord'] = o_aaaarecord
+        if o_aaaa_part_ip_address is not None:
+            _params['aaaa_part_ip_address'] = o_aaaa_part_ip_address
+        if o_aaaa_extra_create_reverse is not None:
+            _params['aaaa_extra_create_reverse'] = o_aaaa_extra_create_reverse
+        if o_a6record is not None:
+            _params['a6record'] = o_a6record
+        if o_a6_part_data is not None:
+            _params['a6_part_data'] = o_a6_part_data
+        if o_afsdbrecord is not None:
+            _params['afsdbrecord'] = o_afsdbrecord
+        if o_afsdb_part_subtype is not None:
+            _params['afsdb_part_subtype'] = o_afsdb_part_subtype
+        if o_afsdb_part_hostname is not None:
+            _params['afsdb_part_hostname'] = o_afsdb_part_hostname
+        if o_aplrecord is not None:
+            _params['aplrecord'] = o_aplrecord
+        if o_certrecord is not None:
+            _params['certrecord'] = o_certrecord
+        if o_cert_part_type is not None:
+            _params['cert_part_type'] = o_cert_part_type
+        if o_cert_part_key_tag is not None:
+            _params['cert_part_key_tag'] = o_cert_part_key_tag
+        if o_cert_part_algorithm is not None:
+            _params['cert_part_algorithm'] = o_cert_part_algorithm
+        if o_cert_part_certificate_or_crl is not None:
+            _params['cert_part_certificate_or_crl'] = o_cert_part_certificate_or_crl
+        if o_cnamerecord is not None:
+            _params['cnamerecord'] = o_cnamerecord
+        if o_cname_part_hostname is not None:
+            _params['cname_part_hostname'] = o_cname_part_hostname
+        if o_dhcidrecord is not None:
+            _params['dhcidrecord'] = o_dhcidrecord
+        if o_dlvrecord is not None:
+            _params['dlvrecord'] = o_dlvrecord
+        if o_dlv_part_key_tag is not None:
+            _params['dlv_part_key_tag'] = o_dlv_part_key_tag
+        if o_dlv_part_algorithm is not None:
+            _params['dlv_part_algorithm'] = o_dlv_part_algorithm
+        if o_dlv_part_digest_type is not None:
+            _params['dlv_part_digest_type'] = o_dlv_part_digest_type
+        if o_dlv_part_digest is not None:
+            _params['dlv_part_digest'] = o_dlv_part_digest
+        if o_dnamerecord is not None:
+            _params['dnamerecord'] = o_dnamerecord
+        if o_dname_part_target is not None:
+            _params['dname_part_target'] = o_dname_part_target
+        if o_dsrecord is not None:
+            _params['dsrecord'] = o_dsrecord
+        if o_ds_part_key_tag is not None:
+            _params['ds_part_key_tag'] = o_ds_part_key_tag
+        if o_ds_part_algorithm is not None:
+            _params['ds_part_algorithm'] = o_ds_part_algorithm
+        if o_ds_part_digest_type is not None:
+            _params['ds_part_digest_type'] = o_ds_part_digest_type
+        if o_ds_part_digest is not None:
+            _params['ds_part_digest'] = o_ds_part_digest
+        if o_hiprecord is not None:
+            _params['hiprecord'] = o_hiprecord
+        if o_ipseckeyrecord is not None:
+            _params['ipseckeyrecord'] = o_ipseckeyrecord
+        if o_keyrecord is not None:
+            _params['keyrecord'] = o_keyrecord
+        if o_kxrecord is not None:
+            _params['kxrecord'] = o_kxrecord
+        if o_kx_part_preference is not None:
+            _params['kx_part_preference'] = o_kx_part_preference
+        if o_kx_part_exchanger is not None:
+            _params['kx_part_exchanger'] = o_kx_part_exchanger
+        if o_locrecord is not None:
+            _params['locrecord'] = o_locrecord
+        if o_loc_part_lat_deg is not None:
+            _params['loc_part_lat_deg'] = o_loc_part_lat_deg
+        if o_loc_part_lat_min is not None:
+            _params['loc_part_lat_min'] = o_loc_part_lat_min
+        if o_loc_part_lat_sec is not None:
+            _params['loc_part_lat_sec'] = o_loc_part_lat_sec
+        if o_loc_part_lat_dir is not None:
+            _params['loc_part_lat_dir'] = o_loc_part_lat_dir
+        if o_loc_part_lon_deg is not None:
+            _params['loc_part_lon_deg'] = o_loc_part_lon_deg
+        if o_loc_part_lon_min is not None:
+            _params['loc_part_lon_min'] = o_loc_part_lon_min
+        if o_loc_part_lon_sec is not None:
+            _params['loc_part_lon_sec'] = o_loc_part_lon_sec
+        if o_loc_part_lon_dir is not None:
+            _params['loc_part_lon_dir'] = o_loc_part_lon_dir
+        if o_loc_part_altitude is not None:
+            _params['loc_part_altitude'] = o_loc_part_altitude
+        if o_loc_part_size is not None:
+            _params['loc_part_size'] = o_loc_part_size
+        if o_loc_part_h_precision is not None:
+            _params['loc_part_h_precision'] = o_loc_part_h_precision
+        if o_loc_part_v_precision is not None:
+            _params['loc_part_v_precision'] = o_loc_part_v_precision
+        if o_mxrecord is not None:
+            _params['mxrecord'] = o_mxrecord
+        if o_mx_part_preference is not None:
+            _params['mx_part_preference'] = o_mx_part_preference
+        if o_mx_part_exchanger is not None:
+            _params['mx_part_exchanger'] = o_mx_part_exchanger
+        if o_naptrrecord is not None:
+            _params['naptrrecord'] = o_naptrrecord
+        if o_naptr_part_order is not None:
+            _params['naptr_part_order'] = o_naptr_part_order
+        if o_naptr_part_preference is not None:
+            _params['naptr_part_preference'] = o_naptr_part_preference
+        if o_naptr_part_flags is not None:
+            _params['naptr_part_flags'] = o_naptr_part_flags
+        if o_naptr_part_service is not None:
+            _params['naptr_part_service'] = o_naptr_part_service
+        if o_naptr_part_regexp is not None:
+            _params['naptr_part_regexp'] = o_naptr_part_regexp
+        if o_naptr_part_replacement is not None:
+            _params['naptr_part_replacement'] = o_naptr_part_replacement
+        if o_nsrecord is not None:
+            _params['nsrecord'] = o_nsrecord
+        if o_ns_part_hostname is not None:
+            _params['ns_part_hostname'] = o_ns_part_hostname
+        if o_nsecrecord is not None:
+            _params['nsecrecord'] = o_nsecrecord
+        if o_ptrrecord is not None:
+            _params['ptrrecord'] = o_ptrrecord
+        if o_ptr_part_hostname is not None:
+            _params['ptr_part_hostname'] = o_ptr_part_hostname
+        if o_rrsigrecord is not None:
+            _params['rrsigrecord'] = o_rrsigrecord
+        if o_rprecord is not None:
+            _params['rprecord'] = o_rprecord
+        if o_sigrecord is not None:
+            _params['sigrecord'] = o_sigrecord
+        if o_spfrecord is not None:
+            _params['spfrecord'] = o_spfrecord
+        if o_srvrecord is not None:
+            _params['srvrecord'] = o_srvrecord
+        if o_srv_part_priority is not None:
+            _params['srv_part_priority'] = o_srv_part_priority
+        if o_srv_part_weight is not None:
+            _params['srv_part_weight'] = o_srv_part_weight
+        if o_srv_part_port is not None:
+            _params['srv_part_port'] = o_srv_part_port
+        if o_srv_part_target is not None:
+            _params['srv_part_target'] = o_srv_part_target
+        if o_sshfprecord is not None:
+            _params['sshfprecord'] = o_sshfprecord
+        if o_sshfp_part_algorithm is not None:
+            _params['sshfp_part_algorithm'] = o_sshfp_part_algorithm
+        if o_sshfp_part_fp_type is not None:
+            _params['sshfp_part_fp_type'] = o_sshfp_part_fp_type
+        if o_sshfp_part_fingerprint is not None:
+            _params['sshfp_part_fingerprint'] = o_sshfp_part_fingerprint
+        if o_tlsarecord is not None:
+            _params['tlsarecord'] = o_tlsarecord
+        if o_tlsa_part_cert_usage is not None:
+            _params['tlsa_part_cert_usage'] = o_tlsa_part_cert_usage
+        if o_tlsa_part_selector is not None:
+            _params['tlsa_part_selector'] = o_tlsa_part_selector
+        if o_tlsa_part_matching_type is not None:
+            _params['tlsa_part_matching_type'] = o_tlsa_part_matching_type
+        if o_tlsa_part_cert_association_data is not None:
+            _params['tlsa_part_cert_association_data'] = o_tlsa_part_cert_association_data
+        if o_txtrecord is not None:
+            _params['txtrecord'] = o_txtrecord
+        if o_txt_part_data is not None:
+            _params['txt_part_data'] = o_txt_part_data
+        if o_urirecord is not None:
+            _params['urirecord'] = o_urirecord
+        if o_uri_part_priority is not None:
+            _params['uri_part_priority'] = o_uri_part_priority
+        if o_uri_part_weight is not None:
+            _params['uri_part_weight'] = o_uri_part_weight
+        if o_uri_part_target is not None:
+            _params['uri_part_target'] = o_uri_part_target
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnsrecord_add', _args, _params)
+
+    def dnsrecord_del(
+        self,
+        a_dnszoneidnsname,
+        a_idnsname,
+        o_dnsttl=None,
+        o_dnsclass=None,
+        o_arecord=None,
+        o_aaaarecord=None,
+        o_a6record=None,
+        o_afsdbrecord=None,
+        o_aplrecord=None,
+        o_certrecord=None,
+        o_cnamerecord=None,
+        o_dhcidrecord=None,
+        o_dlvrecord=None,
+        o_dnamerecord=None,
+        o_dsrecord=None,
+        o_hiprecord=None,
+        o_ipseckeyrecord=None,
+        o_keyrecord=None,
+        o_kxrecord=None,
+        o_locrecord=None,
+        o_mxrecord=None,
+        o_naptrrecord=None,
+        o_nsrecord=None,
+        o_nsecrecord=None,
+        o_ptrrecord=None,
+        o_rrsigrecord=None,
+        o_rprecord=None,
+        o_sigrecord=None,
+        o_spfrecord=None,
+        o_srvrecord=None,
+        o_sshfprecord=None,
+        o_tlsarecord=None,
+        o_txtrecord=None,
+        o_urirecord=None,
+        o_del_all=False,
+        o_structured=False,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Delete DNS resource record.
+
+
+        :param a_dnszoneidnsname: Zone name (FQDN)
+        :type  a_dnszoneidnsname: DNSNameParam
+        :param a_idnsname: Record name
+        :type  a_idnsname: DNSNameParam
+        :param o_dnsttl: Time to live
+        :type  o_dnsttl: int, min value -2147483648, max value 2147483647
+        :param o_dnsclass: <dnsclass>
+        :type  o_dnsclass: str, valid values ['IN', 'CS', 'CH', 'HS']
+        :param o_arecord: Raw A records
+        :type  o_arecord: ARecord
+        :param o_aaaarecord: Raw AAAA records
+        :type  o_aaaarecord: AAAARecord
+        :param o_a6record: Raw A6 records
+        :type  o_a6record: A6Record
+        :param o_afsdbrecord: Raw AFSDB records
+        :type  o_afsdbrecord: AFSDBRecord
+        :param o_aplrecord: Raw APL records
+        :type  o_aplrecord: APLRecord
+        :param o_certrecord: Raw CERT records
+        :type  o_certrecord: CERTRecord
+        :param o_cnamerecord: Raw CNAME records
+        :type  o_cnamerecord: CNAMERecord
+        :param o_dhcidrecord: Raw DHCID records
+        :type  o_dhcidrecord: DHCIDRecord
+        :param o_dlvrecord: Raw DLV records
+        :type  o_dlvrecord: DLVRecord
+        :param o_dnamerecord: Raw DNAME records
+        :type  o_dnamerecord: DNAMERecord
+        :param o_dsrecord: Raw DS records
+        :type  o_dsrecord: DSRecord
+        :param o_hiprecord: Raw HIP records
+        :type  o_hiprecord: HIPRecord
+        :param o_ipseckeyrecord: Raw IPSECKEY records
+        :type  o_ipseckeyrecord: IPSECKEYRecord
+        :param o_keyrecord: Raw KEY records
+        :type  o_keyrecord: KEYRecord
+        :param o_kxrecord: Raw KX records
+        :type  o_kxrecord: KXRecord
+        :param o_locrecord: Raw LOC records
+        :type  o_locrecord: LOCRecord
+        :param o_mxrecord: Raw MX records
+        :type  o_mxrecord: MXRecord
+        :param o_naptrrecord: Raw NAPTR records
+        :type  o_naptrrecord: NAPTRRecord
+        :param o_nsrecord: Raw NS records
+        :type  o_nsrecord: NSRecord
+        :param o_nsecrecord: Raw NSEC records
+        :type  o_nsecrecord: NSECRecord
+        :param o_ptrrecord: Raw PTR records
+        :type  o_ptrrecord: PTRRecord
+        :param o_rrsigrecord: Raw RRSIG records
+        :type  o_rrsigrecord: RRSIGRecord
+        :param o_rprecord: Raw RP records
+        :type  o_rprecord: RPRecord
+        :param o_sigrecord: Raw SIG records
+        :type  o_sigrecord: SIGRecord
+        :param o_spfrecord: Raw SPF records
+        :type  o_spfrecord: SPFRecord
+        :param o_srvrecord: Raw SRV records
+        :type  o_srvrecord: SRVRecord
+        :param o_sshfprecord: Raw SSHFP records
+        :type  o_sshfprecord: SSHFPRecord
+        :param o_tlsarecord: Raw TLSA records
+        :type  o_tlsarecord: TLSARecord
+        :param o_txtrecord: Raw TXT records
+        :type  o_txtrecord: TXTRecord
+        :param o_urirecord: Raw URI records
+        :type  o_urirecord: URIRecord
+        :param o_del_all: Delete all associated records
+        :type  o_del_all: bool
+        :param o_structured: Parse all raw DNS records and return them in a
+            structured way
+        :type  o_structured: bool
+        :param o_raw: <raw>
+        :type  o_raw: bool
+        """
+        _args = [a_dnszoneidnsname, a_idnsname]
+        _params = {'del_all': o_del_all, 'structured': o_structured, 'raw': o_raw}
+        if o_dnsttl is not None:
+            _params['dnsttl'] = o_dnsttl
+        if o_dnsclass is not None:
+            _params['dnsclass'] = o_dnsclass
+        if o_arecord is not None:
+            _params['arecord'] = o_arecord
+        if o_aaaarecord is not None:
+            _params['aaaarecord'] = o_aaaarecord
+        if o_a6record is not None:
+            _params['a6record'] = o_a6record
+        if o_afsdbrecord is not None:
+            _params['afsdbrecord'] = o_afsdbrecord
+        if o_aplrecord is not None:
+            _params['aplrecord'] = o_aplrecord
+        if o_certrecord is not None:
+            _params['certrecord'] = o_certrecord
+        if o_cnamerecord is not None:
+            _params['cnamerecord'] = o_cnamerecord
+        if o_dhcidrecord is not None:
+            _params['dhcidrecord'] = o_dhcidrecord
+        if o_dlvrecord is not None:
+            _params['dlvrecord'] = o_dlvrecord
+        if o_dnamerecord is not None:
+            _params['dnamerecord'] = o_dnamerecord
+        if o_dsrecord is not None:
+            _params['dsrecord'] = o_dsrecord
+        if o_hiprecord is not None:
+            _params['hiprecord'] = o_hiprecord
+        if o_ipseckeyrecord is not None:
+            _params['ipseckeyrecord'] = o_ipseckeyrecord
+        if o_keyrecord is not None:
+            _params['keyrecord'] = o_keyrecord
+        if o_kxrecord is not None:
+            _params['kxrecord'] = o_kxrecord
+        if o_locrecord is not None:
+            _params['locrecord'] = o_locrecord
+        if o_mxrecord is not None:
+            _params['mxrecord'] = o_mxrecord
+        if o_naptrrecord is not None:
+            _params['naptrrecord'] = o_naptrrecord
+        if o_nsrecord is not None:
+            _params['nsrecord'] = o_nsrecord
+        if o_nsecrecord is not None:
+            _params['nsecrecord'] = o_nsecrecord
+        if o_ptrrecord is not None:
+            _params['ptrrecord'] = o_ptrrecord
+        if o_rrsigrecord is not None:
+            _params['rrsigrecord'] = o_rrsigrecord
+        if o_rprecord is not None:
+            _params['rprecord'] = o_rprecord
+        if o_sigrecord is not None:
+            _params['sigrecord'] = o_sigrecord
+        if o_spfrecord is not None:
+            _params['spfrecord'] = o_spfrecord
+        if o_srvrecord is not None:
+            _params['srvrecord'] = o_srvrecord
+        if o_sshfprecord is not None:
+            _params['sshfprecord'] = o_sshfprecord
+        if o_tlsarecord is not None:
+            _params['tlsarecord'] = o_tlsarecord
+        if o_txtrecord is not None:
+            _params['txtrecord'] = o_txtrecord
+        if o_urirecord is not None:
+            _params['urirecord'] = o_urirecord
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnsrecord_del', _args, _params)
+
+    def dnsrecord_delentry(
+        self,
+        a_dnszoneidnsname,
+        a_idnsname,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete DNS record entry.
+
+
+        :param a_dnszoneidnsname: Zone name (FQDN)
+        :type  a_dnszoneidnsname: DNSNameParam
+        :param a_idnsname: Record name
+        :type  a_idnsname: DNSNameParam
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_dnszoneidnsname, a_idnsname]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnsrecord_delentry', _args, _params)
+
+    def dnsrecord_find(
+        self,
+        a_dnszoneidnsname,
+        a_criteria=None,
+        o_idnsname=None,
+        o_dnsttl=None,
+        o_dnsclass=None,
+        o_arecord=None,
+        o_aaaarecord=None,
+        o_a6record=None,
+        o_afsdbrecord=None,
+        o_aplrecord=None,
+        o_certrecord=None,
+        o_cnamerecord=None,
+        o_dhcidrecord=None,
+        o_dlvrecord=None,
+        o_dnamerecord=None,
+        o_dsrecord=None,
+        o_hiprecord=None,
+        o_ipseckeyrecord=None,
+        o_keyrecord=None,
+        o_kxrecord=None,
+        o_locrecord=None,
+        o_mxrecord=None,
+        o_naptrrecord=None,
+        o_nsrecord=None,
+        o_nsecrecord=None,
+        o_ptrrecord=None,
+        o_rrsigrecord=None,
+        o_rprecord=None,
+        o_sigrecord=None,
+        o_spfrecord=None,
+        o_srvrecord=None,
+        o_sshfprecord=None,
+        o_tlsarecord=None,
+        o_txtrecord=None,
+        o_urirecord=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_structured=False,
+        o_all=True,
+        o_raw=False,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for DNS resources.
+
+
+        :param a_dnszoneidnsname: Zone name (FQDN)
+        :type  a_dnszoneidnsname: DNSNameParam
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_idnsname: Record name
+        :type  o_idnsname: DNSNameParam
+        :param o_dnsttl: Time to live
+        :type  o_dnsttl: int, min value -2147483648, max value 2147483647
+        :param o_dnsclass: <dnsclass>
+        :type  o_dnsclass: str, valid values ['IN', 'CS', 'CH', 'HS']
+        :param o_arecord: Raw A records
+        :type  o_arecord: ARecord
+        :param o_aaaarecord: Raw AAAA records
+        :type  o_aaaarecord: AAAARecord
+        :param o_a6record: Raw A6 records
+        :type  o_a6record: A6Record
+        :param o_afsdbrecord: Raw AFSDB records
+        :type  o_afsdbrecord: AFSDBRecord
+        :param o_aplrecord: Raw APL records
+        :type  o_aplrecord: APLRecord
+        :param o_certrecord: Raw CERT records
+        :type  o_certrecord: CERTRecord
+        :param o_cnamerecord: Raw CNAME records
+        :type  o_cnamerecord: CNAMERecord
+        :param o_dhcidrecord: Raw DHCID records
+        :type  o_dhcidrecord: DHCIDRecord
+        :param o_dlvrecord: Raw DLV records
+        :type  o_dlvrecord: DLVRecord
+        :param o_dnamerecord: Raw DNAME records
+        :type  o_dnamerecord: DNAMERecord
+        :param o_dsrecord: Raw DS records
+        :type  o_dsrecord: DSRecord
+        :param o_hiprecord: Raw HIP records
+        :type  o_hiprecord: HIPRecord
+        :param o_ipseckeyrecord: Raw IPSECKEY records
+        :type  o_ipseckeyrecord: IPSECKEYRecord
+        :param o_keyrecord: Raw KEY records
+        :type  o_keyrecord: KEYRecord
+        :param o_kxrecord: Raw KX records
+        :type  o_kxrecord: KXRecord
+        :param o_locrecord: Raw LOC records
+        :type  o_locrecord: LOCRecord
+        :param o_mxrecord: Raw MX records
+        :type  o_mxrecord: MXRecord
+        :param o_naptrrecord: Raw NAPTR records
+        :type  o_naptrrecord: NAPTRRecord
+        :param o_nsrecord: Raw NS records
+        :type  o_nsrecord: NSRecord
+        :param o_nsecrecord: Raw NSEC records
+        :type  o_nsecrecord: NSECRecord
+        :param o_ptrrecord: Raw PTR records
+        :type  o_ptrrecord: PTRRecord
+        :param o_rrsigrecord: Raw RRSIG records
+        :type  o_rrsigrecord: RRSIGRecord
+        :param o_rprecord: Raw RP records
+        :type  o_rprecord: RPRecord
+        :param o_sigrecord: Raw SIG records
+        :type  o_sigrecord: SIGRecord
+        :param o_spfrecord: Raw SPF records
+        :type  o_spfrecord: SPFRecord
+        :param o_srvrecord: Raw SRV records
+        :type  o_srvrecord: SRVRecord
+        :param o_sshfprecord: Raw SSHFP records
+        :type  o_sshfprecord: SSHFPRecord
+        :param o_tlsarecord: Raw TLSA records
+        :type  o_tlsarecord: TLSARecord
+        :param o_txtrecord: Raw TXT records
+        :type  o_txtrecord: TXTRecord
+        :param o_urirecord: Raw URI records
+        :type  o_urirecord: URIRecord
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_structured: Parse all raw DNS records and return them in a
+            structured way
+        :type  o_structured: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("name")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_dnszoneidnsname, a_criteria]
+        _params = {'structured': o_structured, 'all': o_all, 'raw': o_raw}
+        if o_idnsname is not None:
+            _params['idnsname'] = o_idnsname
+        if o_dnsttl is not None:
+            _params['dnsttl'] = o_dnsttl
+        if o_dnsclass is not None:
+            _params['dnsclass'] = o_dnsclass
+        if o_arecord is not None:
+            _params['arecord'] = o_arecord
+        if o_aaaarecord is not None:
+            _params['aaaarecord'] = o_aaaarecord
+        if o_a6record is not None:
+            _params['a6record'] = o_a6record
+        if o_afsdbrecord is not None:
+            _params['afsdbrecord'] = o_afsdbrecord
+        if o_aplrecord is not None:
+            _params['aplrecord'] = o_aplrecord
+        if o_certrecord is not None:
+            _params['certrecord'] = o_certrecord
+        if o_cnamerecord is not None:
+            _params['cnamerecord'] = o_cnamerecord
+        if o_dhcidrecord is not None:
+            _params['dhcidrecord'] = o_dhcidrecord
+        if o_dlvrecord is not None:
+            _params['dlvrecord'] = o_dlvrecord
+        if o_dnamerecord is not None:
+            _params['dnamerecord'] = o_dnamerecord
+        if o_dsrecord is not None:
+            _params['dsrecord'] = o_dsrecord
+        if o_hiprecord is not None:
+            _params['hiprecord'] = o_hiprecord
+        if o_ipseckeyrecord is not None:
+            _params['ipseckeyrecord'] = o_ipseckeyrecord
+        if o_keyrecord is not None:
+            _params['keyrecord'] = o_keyrecord
+        if o_kxrecord is not None:
+            _params['kxrecord'] = o_kxrecord
+        if o_locrecord is not None:
+            _params['locrecord'] = o_locrecord
+        if o_mxrecord is not None:
+            _params['mxrecord'] = o_mxrecord
+        if o_naptrrecord is not None:
+            _params['naptrrecord'] = o_naptrrecord
+        if o_nsrecord is not None:
+            _params['nsrecord'] = o_nsrecord
+        if o_nsecrecord is not None:
+            _params['nsecrecord'] = o_nsecrecord
+        if o_ptrrecord is not None:
+            _params['ptrrecord'] = o_ptrrecord
+        if o_rrsigrecord is not None:
+            _params['rrsigrecord'] = o_rrsigrecord
+        if o_rprecord is not None:
+            _params['rprecord'] = o_rprecord
+        if o_sigrecord is not None:
+            _params['sigrecord'] = o_sigrecord
+        if o_spfrecord is not None:
+            _params['spfrecord'] = o_spfrecord
+        if o_srvrecord is not None:
+            _params['srvrecord'] = o_srvrecord
+        if o_sshfprecord is not None:
+            _params['sshfprecord'] = o_sshfprecord
+        if o_tlsarecord is not None:
+            _params['tlsarecord'] = o_tlsarecord
+        if o_txtrecord is not None:
+            _params['txtrecord'] = o_txtrecord
+        if o_urirecord is not None:
+            _params['urirecord'] = o_urirecord
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnsrecord_find', _args, _params)
+
+    def dnsrecord_mod(
+        self,
+        a_dnszoneidnsname,
+        a_idnsname,
+        o_dnsttl=None,
+        o_dnsclass=None,
+        o_arecord=None,
+        o_a_part_ip_address=None,
+        o_aaaarecord=None,
+        o_aaaa_part_ip_address=None,
+        o_a6record=None,
+        o_a6_part_data=None,
+        o_afsdbrecord=None,
+        o_afsdb_part_subtype=None,
+        o_afsdb_part_hostname=None,
+        o_aplrecord=None,
+        o_certrecord=None,
+        o_cert_part_type=None,
+        o_cert_part_key_tag=None,
+        o_cert_part_algorithm=None,
+        o_cert_part_certificate_or_crl=None,
+        o_cnamerecord=None,
+        o_cname_part_hostname=None,
+        o_dhcidrecord=None,
+        o_dlvrecord=None,
+        o_dlv_part_key_tag=None,
+        o_dlv_part_algorithm=None,
+        o_dlv_part_digest_type=None,
+        o_dlv_part_digest=None,
+        o_dnamerecord=None,
+        o_dname_part_target=None,
+        o_dsrecord=None,
+        o_ds_part_key_tag=None,
+        o_ds_part_algorithm=None,
+        o_ds_part_digest_type=None,
+        o_ds_part_digest=None,
+        o_hiprecord=None,
+        o_ipseckeyrecord=None,
+        o_keyrecord=None,
+        o_kxrecord=None,
+        o_kx_part_preference=None,
+        o_kx_part_exchanger=None,
+        o_locrecord=None,
+        o_loc_part_lat_deg=None,
+        o_loc_part_lat_min=None,
+        o_loc_part_lat_sec=None,
+        o_loc_part_lat_dir=None,
+        o_loc_part_lon_deg=None,
+        o_loc_part_lon_min=None,
+        o_loc_part_lon_sec=None,
+        o_loc_part_lon_dir=None,
+        o_loc_part_altitude=None,
+        o_loc_part_size=None,
+        o_loc_part_h_precision=None,
+        o_loc_part_v_precision=None,
+        o_mxrecord=None,
+        o_mx_part_preference=None,
+        o_mx_part_exchanger=None,
+        o_naptrrecord=None,
+        o_naptr_part_order=None,
+        o_naptr_part_preference=None,
+        o_naptr_part_flags=None,
+        o_naptr_part_service=None,
+        o_naptr_part_regexp=None,
+        o_naptr_part_replacement=None,
+        o_nsrecord=None,
+        o_ns_part_hostname=None,
+        o_nsecrecord=None,
+        o_ptrrecord=None,
+        o_ptr_part_hostname=None,
+        o_rrsigrecord=None,
+        o_rprecord=None,
+        o_sigrecord=None,
+        o_spfrecord=None,
+        o_srvrecord=None,
+        o_srv_part_priority=None,
+        o_srv_part_weight=None,
+        o_srv_part_port=None,
+        o_srv_part_target=None,
+        o_sshfprecord=None,
+        o_sshfp_part_algorithm=None,
+        o_sshfp_part_fp_type=None,
+        o_sshfp_part_fingerprint=None,
+        o_tlsarecord=None,
+        o_tlsa_part_cert_usage=None,
+        o_tlsa_part_selector=None,
+        o_tlsa_part_matching_type=None,
+        o_tlsa_part_cert_association_data=None,
+        o_txtrecord=None,
+        o_txt_part_data=None,
+        o_urirecord=None,
+        o_uri_part_priority=None,
+        o_uri_part_weight=None,
+        o_uri_part_target=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_structured=False,
+        o_all=True,
+        o_raw=False,
+        o_rename=None,
+        **kwargs
+    ):
+        """
+        Modify a DNS resource record.
+
+
+        :param a_dnszoneidnsname: Zone name (FQDN)
+        :type  a_dnszoneidnsname: DNSNameParam
+        :param a_idnsname: Record name
+        :type  a_idnsname: DNSNameParam
+        :param o_dnsttl: Time to live
+        :type  o_dnsttl: int, min value -2147483648, max value 2147483647
+        :param o_dnsclass: <dnsclass>
+        :type  o_dnsclass: str, valid values ['IN', 'CS', 'CH', 'HS']
+        :param o_arecord: Raw A records
+        :type  o_arecord: ARecord
+        :param o_a_part_ip_address: A IP Address
+        :type  o_a_part_ip_address: str
+        :param o_aaaarecord: Raw AAAA records
+        :type  o_aaaarecord: AAAARecord
+        :param o_aaaa_part_ip_address: AAAA IP Address
+        :type  o_aaaa_part_ip_address: str
+        :param o_a6record: Raw A6 records
+        :type  o_a6record: A6Record
+        :param o_a6_part_data: A6 Record data
+        :type  o_a6_part_data: str
+        :param o_afsdbrecord: Raw AFSDB records
+        :type  o_afsdbrecord: AFSDBRecord
+        :param o_afsdb_part_subtype: AFSDB Subtype
+        :type  o_afsdb_part_subtype: int, min value 0, max value 65535
+        :param o_afsdb_part_hostname: AFSDB Hostname
+        :type  o_afsdb_part_hostname: DNSNameParam
+        :param o_aplrecord: Raw APL records
+        :type  o_aplrecord: APLRecord
+        :param o_certrecord: Raw CERT records
+        :type  o_certrecord: CERTRecord
+        :param o_cert_part_type: CERT Certificate Type
+        :type  o_cert_part_type: int, min value 0, max value 65535
+        :param o_cert_part_key_tag: CERT Key Tag
+        :type  o_cert_part_key_tag: int, min value 0, max value 65535
+        :param o_cert_part_algorithm: CERT Algorithm
+        :type  o_cert_part_algorithm: int, min value 0, max value 255
+        :param o_cert_part_certificate_or_crl: CERT Certificate/CRL
+        :type  o_cert_part_certificate_or_crl: str
+        :param o_cnamerecord: Raw CNAME records
+        :type  o_cnamerecord: CNAMERecord
+        :param o_cname_part_hostname: A hostname which this alias hostname
+            points to
+        :type  o_cname_part_hostname: DNSNameParam
+        :param o_dhcidrecord: Raw DHCID records
+        :type  o_dhcidrecord: DHCIDRecord
+        :param o_dlvrecord: Raw DLV records
+        :type  o_dlvrecord: DLVRecord
+        :param o_dlv_part_key_tag: DLV Key Tag
+        :type  o_dlv_part_key_tag: int, min value 0, max value 65535
+        :param o_dlv_part_algorithm: DLV Algorithm
+        :type  o_dlv_part_algorithm: int, min value 0, max value 255
+        :param o_dlv_part_digest_type: DLV Digest Type
+        :type  o_dlv_part_digest_type: int, min value 0, max value 255
+        :param o_dlv_part_digest: DLV Digest
+        :type  o_dlv_part_digest: str
+        :param o_dnamerecord: Raw DNAME records
+        :type  o_dnamerecord: DNAMERecord
+        :param o_dname_part_target: DNAME Target
+        :type  o_dname_part_target: DNSNameParam
+        :param o_dsrecord: Raw DS records
+        :type  o_dsrecord: DSRecord
+        :param o_ds_part_key_tag: DS Key Tag
+        :type  o_ds_part_key_tag: int, min value 0, max value 65535
+        :param o_ds_part_algorithm: DS Algorithm
+        :type  o_ds_part_algorithm: int, min value 0, max value 255
+        :param o_ds_part_digest_type: DS Digest Type
+        :type  o_ds_part_digest_type: int, min value 0, max value 255
+        :param o_ds_part_digest: DS Digest
+        :type  o_ds_part_digest: str
+        :param o_hiprecord: Raw HIP records
+        :type  o_hiprecord: HIPRecord
+        :param o_ipseckeyrecord: Raw IPSECKEY records
+        :type  o_ipseckeyrecord: IPSECKEYRecord
+        :param o_keyrecord: Raw KEY records
+        :type  o_keyrecord: KEYRecord
+        :param o_kxrecord: Raw KX records
+        :type  o_kxrecord: KXRecord
+        :param o_kx_part_preference: Preference given to this exchanger. Lower
+            values are more preferred
+        :type  o_kx_part_preference: int, min value 0, max value 65535
+        :param o_kx_part_exchanger: A host willing to act as a key exchanger
+        :type  o_kx_part_exchanger: DNSNameParam
+        :param o_locrecord: Raw LOC records
+        :type  o_locrecord: LOCRecord
+        :param o_loc_part_lat_deg: LOC Degrees Latitude
+        :type  o_loc_part_lat_deg: int, min value 0, max value 90
+        :param o_loc_part_lat_min: LOC Minutes Latitude
+        :type  o_loc_part_lat_min: int, min value 0, max value 59
+        :param o_loc_part_lat_sec: LOC Seconds Latitude
+        :type  o_loc_part_lat_sec: Decimal
+        :param o_loc_part_lat_dir: LOC Direction Latitude
+        :type  o_loc_part_lat_dir: str, valid values ['N', 'S']
+        :param o_loc_part_lon_deg: LOC Degrees Longitude
+        :type  o_loc_part_lon_deg: int, min value 0, max value 180
+        :param o_loc_part_lon_min: LOC Minutes Longitude
+        :type  o_loc_part_lon_min: int, min value 0, max value 59
+        :param o_loc_part_lon_sec: LOC Seconds Longitude
+        :type  o_loc_part_lon_sec: Decimal
+        :param o_loc_part_lon_dir: LOC Direction Longitude
+        :type  o_loc_part_lon_dir: str, valid values ['E', 'W']
+        :param o_loc_part_altitude: LOC Altitude
+        :type  o_loc_part_altitude: Decimal
+        :param o_loc_part_size: LOC Size
+        :type  o_loc_part_size: Decimal
+        :param o_loc_part_h_precision: LOC Horizontal Precision
+        :type  o_loc_part_h_precision: Decimal
+        :param o_loc_part_v_precision: LOC Vertical Precision
+        :type  o_loc_part_v_precision: Decimal
+        :param o_mxrecord: Raw MX records
+        :type  o_mxrecord: MXRecord
+        :param o_mx_part_preference: Preference given to this exchanger. Lower
+            values are more preferred
+        :type  o_mx_part_preference: int, min value 0, max value 65535
+        :param o_mx_part_exchanger: A host willing to act as a mail exchanger
+        :type  o_mx_part_exchanger: DNSNameParam
+        :param o_naptrrecord: Raw NAPTR records
+        :type  o_naptrrecord: NAPTRRecord
+        :param o_naptr_part_order: NAPTR Order
+        :type  o_naptr_part_order: int, min value 0, max value 65535
+        :param o_naptr_part_preference: NAPTR Preference
+        :type  o_naptr_part_preference: int, min value 0, max value 65535
+        :param o_naptr_part_flags: NAPTR Flags
+        :type  o_naptr_part_flags: str
+        :param o_naptr_part_service: NAPTR Service
+        :type  o_naptr_part_service: str
+        :param o_naptr_part_regexp: NAPTR Regular Expression
+        :type  o_naptr_part_regexp: str
+        :param o_naptr_part_replacement: NAPTR Replacement
+        :type  o_naptr_part_replacement: str
+        :param o_nsrecord: Raw NS records
+        :type  o_nsrecord: NSRecord
+        :param o_ns_part_hostname: NS Hostname
+        :type  o_ns_part_hostname: DNSNameParam
+        :param o_nsecrecord: Raw NSEC records
+        :type  o_nsecrecord: NSECRecord
+        :param o_ptrrecord: Raw PTR records
+        :type  o_ptrrecord: PTRRecord
+        :param o_ptr_part_hostname: The hostname this reverse record points to
+        :type  o_ptr_part_hostname: DNSNameParam
+        :param o_rrsigrecord: Raw RRSIG records
+        :type  o_rrsigrecord: RRSIGRecord
+        :param o_rprecord: Raw RP records
+        :type  o_rprecord: RPRecord
+        :param o_sigrecord: Raw SIG records
+        :type  o_sigrecord: SIGRecord
+        :param o_spfrecord: Raw SPF records
+        :type  o_spfrecord: SPFRecord
+        :param o_srvrecord: Raw SRV records
+        :type  o_srvrecord: SRVRecord
+        :param o_srv_part_priority: Lower number means higher priority.
+            Clients will attempt to contact the server with the lowest-numbered
+            priority they can reach.
+        :type  o_srv_part_priority: int, min value 0, max value 65535
+        :param o_srv_part_weight: Relative weight for entries with the same
+            priority.
+        :type  o_srv_part_weight: int, min value 0, max value 65535
+        :param o_srv_part_port: SRV Port
+        :type  o_srv_part_port: int, min value 0, max value 65535
+        :param o_srv_part_target: The domain name of the target host or '.' if
+            the service is decidedly not available at this domain
+        :type  o_srv_part_target: DNSNameParam
+        :param o_sshfprecord: Raw SSHFP records
+        :type  o_sshfprecord: SSHFPRecord
+        :param o_sshfp_part_algorithm: SSHFP Algorithm
+        :type  o_sshfp_part_algorithm: int, min value 0, max value 255
+        :param o_sshfp_part_fp_type: SSHFP Fingerprint Type
+        :type  o_sshfp_part_fp_type: int, min value 0, max value 255
+        :param o_sshfp_part_fingerprint: SSHFP Fingerprint
+        :type  o_sshfp_part_fingerprint: str
+        :param o_tlsarecord: Raw TLSA records
+        :type  o_tlsarecord: TLSARecord
+        :param o_tlsa_part_cert_usage: TLSA Certificate Usage
+        :type  o_tlsa_part_cert_usage: int, min value 0, max value 255
+        :param o_tlsa_part_selector: TLSA Selector
+        :type  o_tlsa_part_selector: int, min value 0, max value 255
+        :param o_tlsa_part_matching_type: TLSA Matching Type
+        :type  o_tlsa_part_matching_type: int, min value 0, max value 255
+        :param o_tlsa_part_cert_association_data: TLSA Certificate Association
+            Data
+        :type  o_tlsa_part_cert_association_data: str
+        :param o_txtrecord: Raw TXT records
+        :type  o_txtrecord: TXTRecord
+        :param o_txt_part_data: TXT Text Data
+        :type  o_txt_part_data: str
+        :param o_urirecord: Raw URI records
+        :type  o_urirecord: URIRecord
+        :param o_uri_part_priority: Lower number means higher priority.
+            Clients will attempt to contact the URI with the lowest-numbered
+            priority they can reach.
+        :type  o_uri_part_priority: int, min value 0, max value 65535
+        :param o_uri_part_weight: Relative weight for entries with the same
+            priority.
+        :type  o_uri_part_weight: int, min value 0, max value 65535
+        :param o_uri_part_target: Target Uniform Resource Identifier according
+            to RFC 3986
+        :type  o_uri_part_target: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_structured: Parse all raw DNS records and return them in a
+            structured way
+        :type  o_structured: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_rename: Rename the DNS resource record object
+        :type  o_rename: DNSNameParam
+        """
+        _args = [a_dnszoneidnsname, a_idnsname]
+        _params = {
+            'rights': o_rights,
+            'structured': o_structured,
+            'all': o_all,
+            'raw': o_raw,
+        }
+        if o_dnsttl is not None:
+            _params['dnsttl'] = o_dnsttl
+        if o_dnsclass is not None:
+            _params['dnsclass'] = o_dnsclass
+        if o_arecord is not None:
+            _params['arecord'] = o_arecord
+        if o_a_part_ip_address is not None:
+            _params['a_part_ip_address'] = o_a_part_ip_address
+        if o_aaaarecord is not None:
+            _params['aaaarecord'] = o_aaaarecord
+        if o_aaaa_part_ip_address is not None:
+            _params['aaaa_part_ip_address'] = o_aaaa_part_ip_address
+        if o_a6record is not None:
+            _params['a6record'] = o_a6record
+        if o_a6_part_data is not None:
+            _params['a6_part_data'] = o_a6_part_data
+        if o_afsdbrecord is not None:
+            _params['afsdbrecord'] = o_afsdbrecord
+        if o_afsdb_part_subtype is not None:
+            _params['afsdb_part_subtype'] = o_afsdb_part_subtype
+        if o_afsdb_part_hostname is not None:
+            _params['afsdb_part_hostname'] = o_afsdb_part_hostname
+        if o_aplrecord is not None:
+            _params['aplrecord'] = o_aplrecord
+        if o_certrecord is not None:
+            _params['certrecord'] = o_certrecord
+        if o_cert_part_type is not None:
+            _params['cert_part_type'] = o_cert_part_type
+        if o_cert_part_key_tag is not None:
+            _params['cert_part_key_tag'] = o_cert_part_key_tag
+        if o_cert_part_algorithm is not None:
+            _params['cert_part_algorithm'] = o_cert_part_algorithm
+        if o_cert_part_certificate_or_crl is not None:
+            _params['cert_part_certificate_or_crl'] = o_cert_part_certificate_or_crl
+        if o_cnamerecord is not None:
+            _params['cnamerecord'] = o_cnamerecord
+        if o_cname_part_hostname is not None:
+            _params['cname_part_hostname'] = o_cname_part_hostname
+        if o_dhcidrecord is not None:
+            _params['dhcidrecord'] = o_dhcidrecord
+        if o_dlvrecord is not None:
+            _params['dlvrecord'] = o_dlvrecord
+        if o_dlv_part_key_tag is not None:
+            _params['dlv_part_key_tag'] = o_dlv_part_key_tag
+        if o_dlv_part_algorithm is not None:
+            _params['dlv_part_algorithm'] = o_dlv_part_algorithm
+        if o_dlv_part_digest_type is not None:
+            _params['dlv_part_digest_type'] = o_dlv_part_digest_type
+        if o_dlv_part_digest is not None:
+            _params['dlv_part_digest'] = o_dlv_part_digest
+        if o_dnamerecord is not None:
+            _params['dnamerecord'] = o_dnamerecord
+        if o_dname_part_target is not None:
+            _params['dname_part_target'] = o_dname_part_target
+        if o_dsrecord is not None:
+            _params['dsrecord'] = o_dsrecord
+        if o_ds_part_key_tag is not None:
+            _params['ds_part_key_tag'] = o_ds_part_key_tag
+        if o_ds_part_algorithm is not None:
+            _params['ds_part_algorithm'] = o_ds_part_algorithm
+        if o_ds_part_digest_type is not None:
+            _params['ds_part_digest_type'] = o_ds_part_digest_type
+        if o_ds_part_digest is not None:
+            _params['ds_part_digest'] = o_ds_part_digest
+        if o_hiprecord is not None:
+            _params['hiprecord'] = o_hiprecord
+        if o_ipseckeyrecord is not None:
+            _params['ipseckeyrecord'] = o_ipseckeyrecord
+        if o_keyrecord is not None:
+            _params['keyrecord'] = o_keyrecord
+        if o_kxrecord is not None:
+            _params['kxrecord'] = o_kxrecord
+        if o_kx_part_preference is not None:
+            _params['kx_part_preference'] = o_kx_part_preference
+        if o_kx_part_exchanger is not None:
+            _params['kx_part_exchanger'] = o_kx_part_exchanger
+        if o_locrecord is not None:
+            _params['locrecord'] = o_locrecord
+        if o_loc_part_lat_deg is not None:
+            _params['loc_part_lat_deg'] = o_loc_part_lat_deg
+        if o_loc_part_lat_min is not None:
+            _params['loc_part_lat_min'] = o_loc_part_lat_min
+        if o_loc_part_lat_sec is not None:
+            _params['loc_part_lat_sec'] = o_loc_part_lat_sec
+        if o_loc_part_lat_dir is not None:
+            _params['loc_part_lat_dir'] = o_loc_part_lat_dir
+        if o_loc_part_lon_deg is not None:
+            _params['loc_part_lon_deg'] = o_loc_part_lon_deg
+        if o_loc_part_lon_min is not None:
+            _params['loc_part_lon_min'] = o_loc_part_lon_min
+        if o_loc_part_lon_sec is not None:
+            _params['loc_part_lon_sec'] = o_loc_part_lon_sec
+        if o_loc_part_lon_dir is not None:
+            _params['loc_part_lon_dir'] = o_loc_part_lon_dir
+        if o_loc_part_altitude is not None:
+            _params['loc_part_altitude'] = o_loc_part_altitude
+        if o_loc_part_size is not None:
+            _params['loc_part_size'] = o_loc_part_size
+        if o_loc_part_h_precision is not None:
+            _params['loc_part_h_precision'] = o_loc_part_h_precision
+        if o_loc_part_v_precision is not None:
+            _params['loc_part_v_precision'] = o_loc_part_v_precision
+        if o_mxrecord is not None:
+            _params['mxrecord'] = o_mxrecord
+        if o_mx_part_preference is not None:
+            _params['mx_part_preference'] = o_mx_part_preference
+        if o_mx_part_exchanger is not None:
+            _params['mx_part_exchanger'] = o_mx_part_exchanger
+        if o_naptrrecord is not None:
+            _params['naptrrecord'] = o_naptrrecord
+        if o_naptr_part_order is not None:
+            _params['naptr_part_order'] = o_naptr_part_order
+        if o_naptr_part_preference is not None:
+            _params['naptr_part_preference'] = o_naptr_part_preference
+        if o_naptr_part_flags is not None:
+            _params['naptr_part_flags'] = o_naptr_part_flags
+        if o_naptr_part_service is not None:
+            _params['naptr_part_service'] = o_naptr_part_service
+        if o_naptr_part_regexp is not None:
+            _params['naptr_part_regexp'] = o_naptr_part_regexp
+        if o_naptr_part_replacement is not None:
+            _params['naptr_part_replacement'] = o_naptr_part_replacement
+        if o_nsrecord is not None:
+            _params['nsrecord'] = o_nsrecord
+        if o_ns_part_hostname is not None:
+            _params['ns_part_hostname'] = o_ns_part_hostname
+        if o_nsecrecord is not None:
+            _params['nsecrecord'] = o_nsecrecord
+        if o_ptrrecord is not None:
+            _params['ptrrecord'] = o_ptrrecord
+        if o_ptr_part_hostname is not None:
+            _params['ptr_part_hostname'] = o_ptr_part_hostname
+        if o_rrsigrecord is not None:
+            _params['rrsigrecord'] = o_rrsigrecord
+        if o_rprecord is not None:
+            _params['rprecord'] = o_rprecord
+        if o_sigrecord is not None:
+            _params['sigrecord'] = o_sigrecord
+        if o_spfrecord is not None:
+            _params['spfrecord'] = o_spfrecord
+        if o_srvrecord is not None:
+            _params['srvrecord'] = o_srvrecord
+        if o_srv_part_priority is not None:
+            _params['srv_part_priority'] = o_srv_part_priority
+        if o_srv_part_weight is not None:
+            _params['srv_part_weight'] = o_srv_part_weight
+        if o_srv_part_port is not None:
+            _params['srv_part_port'] = o_srv_part_port
+        if o_srv_part_target is not None:
+            _params['srv_part_target'] = o_srv_part_target
+        if o_sshfprecord is not None:
+            _params['sshfprecord'] = o_sshfprecord
+        if o_sshfp_part_algorithm is not None:
+            _params['sshfp_part_algorithm'] = o_sshfp_part_algorithm
+        if o_sshfp_part_fp_type is not None:
+            _params['sshfp_part_fp_type'] = o_sshfp_part_fp_type
+        if o_sshfp_part_fingerprint is not None:
+            _params['sshfp_part_fingerprint'] = o_sshfp_part_fingerprint
+        if o_tlsarecord is not None:
+            _params['tlsarecord'] = o_tlsarecord
+        if o_tlsa_part_cert_usage is not None:
+            _params['tlsa_part_cert_usage'] = o_tlsa_part_cert_usage
+        if o_tlsa_part_selector is not None:
+            _params['tlsa_part_selector'] = o_tlsa_part_selector
+        if o_tlsa_part_matching_type is not None:
+            _params['tlsa_part_matching_type'] = o_tlsa_part_matching_type
+        if o_tlsa_part_cert_association_data is not None:
+            _params['tlsa_part_cert_association_data'] = o_tlsa_part_cert_association_data
+        if o_txtrecord is not None:
+            _params['txtrecord'] = o_txtrecord
+        if o_txt_part_data is not None:
+            _params['txt_part_data'] = o_txt_part_data
+        if o_urirecord is not None:
+            _params['urirecord'] = o_urirecord
+        if o_uri_part_priority is not None:
+            _params['uri_part_priority'] = o_uri_part_priority
+        if o_uri_part_weight is not None:
+            _params['uri_part_weight'] = o_uri_part_weight
+        if o_uri_part_target is not None:
+            _params['uri_part_target'] = o_uri_part_target
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if o_rename is not None:
+            _params['rename'] = o_rename
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnsrecord_mod', _args, _params)
+
+    def dnsrecord_show(
+        self,
+        a_dnszoneidnsname,
+        a_idnsname,
+        o_rights=False,
+        o_structured=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display DNS resource.
+
+
+        :param a_dnszoneidnsname: Zone name (FQDN)
+        :type  a_dnszoneidnsname: DNSNameParam
+        :param a_idnsname: Record name
+        :type  a_idnsname: DNSNameParam
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_structured: Parse all raw DNS records and return them in a
+            structured way
+        :type  o_structured: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_dnszoneidnsname, a_idnsname]
+        _params = {
+            'rights': o_rights,
+            'structured': o_structured,
+            'all': o_all,
+            'raw': o_raw,
+        }
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnsrecord_show', _args, _params)
+
+    def dnsrecord_split_parts(
+        self,
+        a_name,
+        a_value,
+        **kwargs
+    ):
+        """
+        Split DNS record to parts
+
+
+        :param a_name: <name>
+        :type  a_name: str
+        :param a_value: <value>
+        :type  a_value: str
+        """
+        _args = [a_name, a_value]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnsrecord_split_parts', _args, _params)
+
+    def dnsserver_find(
+        self,
+        a_criteria=None,
+        o_idnsserverid=None,
+        o_idnssoamname=None,
+        o_idnsforwarders=None,
+        o_idnsforwardpolicy=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for DNS servers.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_idnsserverid: DNS Server name
+        :type  o_idnsserverid: str
+        :param o_idnssoamname: SOA mname (authoritative server) override
+        :type  o_idnssoamname: DNSNameParam
+        :param o_idnsforwarders: Per-server forwarders. A custom port can be
+            specified for each forwarder using a standard format "IP_ADDRESS port
+            PORT"
+        :type  o_idnsforwarders: str
+        :param o_idnsforwardpolicy: Per-server conditional forwarding policy.
+            Set to "none" to disable forwarding to global forwarder for this zone.
+            In that case, conditional zone forwarders are disregarded.
+        :type  o_idnsforwardpolicy: str, valid values ['only', 'first', 'none']
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("hostname")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_idnsserverid is not None:
+            _params['idnsserverid'] = o_idnsserverid
+        if o_idnssoamname is not None:
+            _params['idnssoamname'] = o_idnssoamname
+        if o_idnsforwarders is not None:
+            _params['idnsforwarders'] = o_idnsforwarders
+        if o_idnsforwardpolicy is not None:
+            _params['idnsforwardpolicy'] = o_idnsforwardpolicy
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnsserver_find', _args, _params)
+
+    def dnsserver_mod(
+        self,
+        a_idnsserverid,
+        o_idnssoamname=None,
+        o_idnsforwarders=None,
+        o_idnsforwardpolicy=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Modify DNS server configuration
+
+
+        :param a_idnsserverid: DNS Server name
+        :type  a_idnsserverid: str
+        :param o_idnssoamname: SOA mname (authoritative server) override
+        :type  o_idnssoamname: DNSNameParam
+        :param o_idnsforwarders: Per-server forwarders. A custom port can be
+            specified for each forwarder using a standard format "IP_ADDRESS port
+            PORT"
+        :type  o_idnsforwarders: str
+        :param o_idnsforwardpolicy: Per-server conditional forwarding policy.
+            Set to "none" to disable forwarding to global forwarder for this zone.
+            In that case, conditional zone forwarders are disregarded.
+        :type  o_idnsforwardpolicy: str, valid values ['only', 'first', 'none']
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_idnsserverid]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if o_idnssoamname is not None:
+            _params['idnssoamname'] = o_idnssoamname
+        if o_idnsforwarders is not None:
+            _params['idnsforwarders'] = o_idnsforwarders
+        if o_idnsforwardpolicy is not None:
+            _params['idnsforwardpolicy'] = o_idnsforwardpolicy
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnsserver_mod', _args, _params)
+
+    def dnsserver_show(
+        self,
+        a_idnsserverid,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display configuration of a DNS server.
+
+
+        :param a_idnsserverid: DNS Server name
+        :type  a_idnsserverid: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_idnsserverid]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnsserver_show', _args, _params)
+
+    def dnszone_add(
+        self,
+        a_idnsname,
+        o_idnssoaserial,
+        o_name_from_ip=None,
+        o_idnsforwarders=None,
+        o_idnsforwardpolicy=None,
+        o_idnssoamname=None,
+        o_idnssoarname='',
+        o_idnssoarefresh=3600,
+        o_idnssoaretry=900,
+        o_idnssoaexpire=1209600,
+        o_idnssoaminimum=3600,
+        o_dnsttl=None,
+        o_dnsdefaultttl=None,
+        o_dnsclass=None,
+        o_idnsupdatepolicy=None,
+        o_idnsallowdynupdate=False,
+        o_idnsallowquery='any;',
+        o_idnsallowtransfer='none;',
+        o_idnsallowsyncptr=None,
+        o_idnssecinlinesigning=None,
+        o_nsec3paramrecord=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_skip_overlap_check=False,
+        o_force=False,
+        o_skip_nameserver_check=False,
+        o_ip_address=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Create new DNS zone (SOA record).
+
+
+        :param a_idnsname: Zone name (FQDN)
+        :type  a_idnsname: DNSNameParam
+        :param o_name_from_ip: IP network to create reverse zone name from
+        :type  o_name_from_ip: str
+        :param o_idnsforwarders: Per-zone forwarders. A custom port can be
+            specified for each forwarder using a standard format "IP_ADDRESS port
+            PORT"
+        :type  o_idnsforwarders: str
+        :param o_idnsforwardpolicy: Per-zone conditional forwarding policy.
+            Set to "none" to disable forwarding to global forwarder for this zone.
+            In that case, conditional zone forwarders are disregarded.
+        :type  o_idnsforwardpolicy: str, valid values ['only', 'first', 'none']
+        :param o_idnssoamname: Authoritative nameserver domain name
+        :type  o_idnssoamname: DNSNameParam
+        :param o_idnssoarname: Administrator e-mail address
+        :type  o_idnssoarname: DNSNameParam
+        :param o_idnssoaserial: SOA record serial number
+        :type  o_idnssoaserial: int, min value 1, max value 4294967295
+        :param o_idnssoarefresh: SOA record refresh time
+        :type  o_idnssoarefresh: int, min value 0, max value 2147483647
+        :param o_idnssoaretry: SOA record retry time
+        :type  o_idnssoaretry: int, min value 0, max value 2147483647
+        :param o_idnssoaexpire: SOA record expire time
+        :type  o_idnssoaexpire: int, min value 0, max value 2147483647
+        :param o_idnssoaminimum: How long should negative responses be cached
+        :type  o_idnssoaminimum: int, min value 0, max value 2147483647
+        :param o_dnsttl: Time to live for records at zone apex
+        :type  o_dnsttl: int, min value 0, max value 2147483647
+        :param o_dnsdefaultttl: Time to live for records without explicit TTL
+            definition
+        :type  o_dnsdefaultttl: int, min value 0, max value 2147483647
+        :param o_dnsclass: <dnsclass>
+        :type  o_dnsclass: str, valid values ['IN', 'CS', 'CH', 'HS']
+        :param o_idnsupdatepolicy: BIND update policy
+        :type  o_idnsupdatepolicy: str
+        :param o_idnsallowdynupdate: Allow dynamic updates.
+        :type  o_idnsallowdynupdate: Bool
+        :param o_idnsallowquery: Semicolon separated list of IP addresses or
+            networks which are allowed to issue queries
+        :type  o_idnsallowquery: str
+        :param o_idnsallowtransfer: Semicolon separated list of IP addresses
+            or networks which are allowed to transfer the zone
+        :type  o_idnsallowtransfer: str
+        :param o_idnsallowsyncptr: Allow synchronization of forward (A, AAAA)
+            and reverse (PTR) records in the zone
+        :type  o_idnsallowsyncptr: Bool
+        :param o_idnssecinlinesigning: Allow inline DNSSEC signing of records
+            in the zone
+        :type  o_idnssecinlinesigning: Bool
+        :param o_nsec3paramrecord: NSEC3PARAM record for zone in format:
+            hash_algorithm flags iterations salt
+        :type  o_nsec3paramrecord: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_skip_overlap_check: Force DNS zone creation even if it will
+            overlap with an existing zone.
+        :type  o_skip_overlap_check: bool
+        :param o_force: Force DNS zone creation even if nameserver is not
+            resolvable. (Deprecated)
+        :type  o_force: bool
+        :param o_skip_nameserver_check: Force DNS zone creation even if
+            nameserver is not resolvable.
+        :type  o_skip_nameserver_check: bool
+        :param o_ip_address: <ip_address>
+        :type  o_ip_address: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_idnsname]
+        _params = {
+            'idnssoarname': o_idnssoarname,
+            'idnssoaserial': o_idnssoaserial,
+            'idnssoarefresh': o_idnssoarefresh,
+            'idnssoaretry': o_idnssoaretry,
+            'idnssoaexpire': o_idnssoaexpire,
+            'idnssoaminimum': o_idnssoaminimum,
+            'skip_overlap_check': o_skip_overlap_check,
+            'force': o_force,
+            'skip_nameserver_check': o_skip_nameserver_check,
+            'all': o_all,
+            'raw': o_raw,
+        }
+        if o_name_from_ip is not None:
+            _params['name_from_ip'] = o_name_from_ip
+        if o_idnsforwarders is not None:
+            _params['idnsforwarders'] = o_idnsforwarders
+        if o_idnsforwardpolicy is not None:
+            _params['idnsforwardpolicy'] = o_idnsforwardpolicy
+        if o_idnssoamname is not None:
+            _params['idnssoamname'] = o_idnssoamname
+        if o_dnsttl is not None:
+            _params['dnsttl'] = o_dnsttl
+        if o_dnsdefaultttl is not None:
+            _params['dnsdefaultttl'] = o_dnsdefaultttl
+        if o_dnsclass is not None:
+            _params['dnsclass'] = o_dnsclass
+        if o_idnsupdatepolicy is not None:
+            _params['idnsupdatepolicy'] = o_idnsupdatepolicy
+        if o_idnsallowdynupdate is not None:
+            _params['idnsallowdynupdate'] = o_idnsallowdynupdate
+        if o_idnsallowquery is not None:
+            _params['idnsallowquery'] = o_idnsallowquery
+        if o_idnsallowtransfer is not None:
+            _params['idnsallowtransfer'] = o_idnsallowtransfer
+        if o_idnsallowsyncptr is not None:
+            _params['idnsallowsyncptr'] = o_idnsallowsyncptr
+        if o_idnssecinlinesigning is not None:
+            _params['idnssecinlinesigning'] = o_idnssecinlinesigning
+        if o_nsec3paramrecord is not None:
+            _params['nsec3paramrecord'] = o_nsec3paramrecord
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_ip_address is not None:
+            _params['ip_address'] = o_ip_address
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnszone_add', _args, _params)
+
+    def dnszone_add_permission(
+        self,
+        a_idnsname,
+        **kwargs
+    ):
+        """
+        Add a permission for per-zone access delegation.
+
+
+        :param a_idnsname: Zone name (FQDN)
+        :type  a_idnsname: DNSNameParam
+        """
+        _args = [a_idnsname]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnszone_add_permission', _args, _params)
+
+    def dnszone_del(
+        self,
+        a_idnsname,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete DNS zone (SOA record).
+
+
+        :param a_idnsname: Zone name (FQDN)
+        :type  a_idnsname: DNSNameParam
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_idnsname]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnszone_del', _args, _params)
+
+    def dnszone_disable(
+        self,
+        a_idnsname,
+        **kwargs
+    ):
+        """
+        Disable DNS Zone.
+
+
+        :param a_idnsname: Zone name (FQDN)
+        :type  a_idnsname: DNSNameParam
+        """
+        _args = [a_idnsname]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnszone_disable', _args, _params)
+
+    def dnszone_enable(
+        self,
+        a_idnsname,
+        **kwargs
+    ):
+        """
+        Enable DNS Zone.
+
+
+        :param a_idnsname: Zone name (FQDN)
+        :type  a_idnsname: DNSNameParam
+        """
+        _args = [a_idnsname]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnszone_enable', _args, _params)
+
+    def dnszone_find(
+        self,
+        a_criteria=None,
+        o_idnsname=None,
+        o_name_from_ip=None,
+        o_idnszoneactive=None,
+        o_idnsforwarders=None,
+        o_idnsforwardpolicy=None,
+        o_idnssoamname=None,
+        o_idnssoarname=None,
+        o_idnssoaserial=None,
+        o_idnssoarefresh=None,
+        o_idnssoaretry=None,
+        o_idnssoaexpire=None,
+        o_idnssoaminimum=None,
+        o_dnsttl=None,
+        o_dnsdefaultttl=None,
+        o_dnsclass=None,
+        o_idnsupdatepolicy=None,
+        o_idnsallowdynupdate=None,
+        o_idnsallowquery=None,
+        o_idnsallowtransfer=None,
+        o_idnsallowsyncptr=None,
+        o_idnssecinlinesigning=None,
+        o_nsec3paramrecord=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_forward_only=False,
+        o_all=True,
+        o_raw=False,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for DNS zones (SOA records).
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_idnsname: Zone name (FQDN)
+        :type  o_idnsname: DNSNameParam
+        :param o_name_from_ip: IP network to create reverse zone name from
+        :type  o_name_from_ip: str
+        :param o_idnszoneactive: Is zone active?
+        :type  o_idnszoneactive: Bool
+        :param o_idnsforwarders: Per-zone forwarders. A custom port can be
+            specified for each forwarder using a standard format "IP_ADDRESS port
+            PORT"
+        :type  o_idnsforwarders: str
+        :param o_idnsforwardpolicy: Per-zone conditional forwarding policy.
+            Set to "none" to disable forwarding to global forwarder for this zone.
+            In that case, conditional zone forwarders are disregarded.
+        :type  o_idnsforwardpolicy: str, valid values ['only', 'first', 'none']
+        :param o_idnssoamname: Authoritative nameserver domain name
+        :type  o_idnssoamname: DNSNameParam
+        :param o_idnssoarname: Administrator e-mail address
+        :type  o_idnssoarname: DNSNameParam
+        :param o_idnssoaserial: SOA record serial number
+        :type  o_idnssoaserial: int, min value 1, max value 4294967295
+        :param o_idnssoarefresh: SOA record refresh time
+        :type  o_idnssoarefresh: int, min value 0, max value 2147483647
+        :param o_idnssoaretry: SOA record retry time
+        :type  o_idnssoaretry: int, min value 0, max value 2147483647
+        :param o_idnssoaexpire: SOA record expire time
+        :type  o_idnssoaexpire: int, min value 0, max value 2147483647
+        :param o_idnssoaminimum: How long should negative responses be cached
+        :type  o_idnssoaminimum: int, min value 0, max value 2147483647
+        :param o_dnsttl: Time to live for records at zone apex
+        :type  o_dnsttl: int, min value 0, max value 2147483647
+        :param o_dnsdefaultttl: Time to live for records without explicit TTL
+            definition
+        :type  o_dnsdefaultttl: int, min value 0, max value 2147483647
+        :param o_dnsclass: <dnsclass>
+        :type  o_dnsclass: str, valid values ['IN', 'CS', 'CH', 'HS']
+        :param o_idnsupdatepolicy: BIND update policy
+        :type  o_idnsupdatepolicy: str
+        :param o_idnsallowdynupdate: Allow dynamic updates.
+        :type  o_idnsallowdynupdate: Bool
+        :param o_idnsallowquery: Semicolon separated list of IP addresses or
+            networks which are allowed to issue queries
+        :type  o_idnsallowquery: str
+        :param o_idnsallowtransfer: Semicolon separated list of IP addresses
+            or networks which are allowed to transfer the zone
+        :type  o_idnsallowtransfer: str
+        :param o_idnsallowsyncptr: Allow synchronization of forward (A, AAAA)
+            and reverse (PTR) records in the zone
+        :type  o_idnsallowsyncptr: Bool
+        :param o_idnssecinlinesigning: Allow inline DNSSEC signing of records
+            in the zone
+        :type  o_idnssecinlinesigning: Bool
+        :param o_nsec3paramrecord: NSEC3PARAM record for zone in format:
+            hash_algorithm flags iterations salt
+        :type  o_nsec3paramrecord: str
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_forward_only: Search for forward zones only
+        :type  o_forward_only: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("name")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'forward_only': o_forward_only, 'all': o_all, 'raw': o_raw}
+        if o_idnsname is not None:
+            _params['idnsname'] = o_idnsname
+        if o_name_from_ip is not None:
+            _params['name_from_ip'] = o_name_from_ip
+        if o_idnszoneactive is not None:
+            _params['idnszoneactive'] = o_idnszoneactive
+        if o_idnsforwarders is not None:
+            _params['idnsforwarders'] = o_idnsforwarders
+        if o_idnsforwardpolicy is not None:
+            _params['idnsforwardpolicy'] = o_idnsforwardpolicy
+        if o_idnssoamname is not None:
+            _params['idnssoamname'] = o_idnssoamname
+        if o_idnssoarname is not None:
+            _params['idnssoarname'] = o_idnssoarname
+        if o_idnssoaserial is not None:
+            _params['idnssoaserial'] = o_idnssoaserial
+        if o_idnssoarefresh is not None:
+            _params['idnssoarefresh'] = o_idnssoarefresh
+        if o_idnssoaretry is not None:
+            _params['idnssoaretry'] = o_idnssoaretry
+        if o_idnssoaexpire is not None:
+            _params['idnssoaexpire'] = o_idnssoaexpire
+        if o_idnssoaminimum is not None:
+            _params['idnssoaminimum'] = o_idnssoaminimum
+        if o_dnsttl is not None:
+            _params['dnsttl'] = o_dnsttl
+        if o_dnsdefaultttl is not None:
+            _params['dnsdefaultttl'] = o_dnsdefaultttl
+        if o_dnsclass is not None:
+            _params['dnsclass'] = o_dnsclass
+        if o_idnsupdatepolicy is not None:
+            _params['idnsupdatepolicy'] = o_idnsupdatepolicy
+        if o_idnsallowdynupdate is not None:
+            _params['idnsallowdynupdate'] = o_idnsallowdynupdate
+        if o_idnsallowquery is not None:
+            _params['idnsallowquery'] = o_idnsallowquery
+        if o_idnsallowtransfer is not None:
+            _params['idnsallowtransfer'] = o_idnsallowtransfer
+        if o_idnsallowsyncptr is not None:
+            _params['idnsallowsyncptr'] = o_idnsallowsyncptr
+        if o_idnssecinlinesigning is not None:
+            _params['idnssecinlinesigning'] = o_idnssecinlinesigning
+        if o_nsec3paramrecord is not None:
+            _params['nsec3paramrecord'] = o_nsec3paramrecord
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnszone_find', _args, _params)
+
+    def dnszone_mod(
+        self,
+        a_idnsname,
+        o_name_from_ip=None,
+        o_idnsforwarders=None,
+        o_idnsforwardpolicy=None,
+        o_idnssoamname=None,
+        o_idnssoarname=None,
+        o_idnssoaserial=None,
+        o_idnssoarefresh=None,
+        o_idnssoaretry=None,
+        o_idnssoaexpire=None,
+        o_idnssoaminimum=None,
+        o_dnsttl=None,
+        o_dnsdefaultttl=None,
+        o_dnsclass=None,
+        o_idnsupdatepolicy=None,
+        o_idnsallowdynupdate=None,
+        o_idnsallowquery=None,
+        o_idnsallowtransfer=None,
+        o_idnsallowsyncptr=None,
+        o_idnssecinlinesigning=None,
+        o_nsec3paramrecord=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_force=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Modify DNS zone (SOA record).
+
+
+        :param a_idnsname: Zone name (FQDN)
+        :type  a_idnsname: DNSNameParam
+        :param o_name_from_ip: IP network to create reverse zone name from
+        :type  o_name_from_ip: str
+        :param o_idnsforwarders: Per-zone forwarders. A custom port can be
+            specified for each forwarder using a standard format "IP_ADDRESS port
+            PORT"
+        :type  o_idnsforwarders: str
+        :param o_idnsforwardpolicy: Per-zone conditional forwarding policy.
+            Set to "none" to disable forwarding to global forwarder for this zone.
+            In that case, conditional zone forwarders are disregarded.
+        :type  o_idnsforwardpolicy: str, valid values ['only', 'first', 'none']
+        :param o_idnssoamname: Authoritative nameserver domain name
+        :type  o_idnssoamname: DNSNameParam
+        :param o_idnssoarname: Administrator e-mail address
+        :type  o_idnssoarname: DNSNameParam
+        :param o_idnssoaserial: SOA record serial number
+        :type  o_idnssoaserial: int, min value 1, max value 4294967295
+        :param o_idnssoarefresh: SOA record refresh time
+        :type  o_idnssoarefresh: int, min value 0, max value 2147483647
+        :param o_idnssoaretry: SOA record retry time
+        :type  o_idnssoaretry: int, min value 0, max value 2147483647
+        :param o_idnssoaexpire: SOA record expire time
+        :type  o_idnssoaexpire: int, min value 0, max value 2147483647
+        :param o_idnssoaminimum: How long should negative responses be cached
+        :type  o_idnssoaminimum: int, min value 0, max value 2147483647
+        :param o_dnsttl: Time to live for records at zone apex
+        :type  o_dnsttl: int, min value 0, max value 2147483647
+        :param o_dnsdefaultttl: Time to live for records without explicit TTL
+            definition
+        :type  o_dnsdefaultttl: int, min value 0, max value 2147483647
+        :param o_dnsclass: <dnsclass>
+        :type  o_dnsclass: str, valid values ['IN', 'CS', 'CH', 'HS']
+        :param o_idnsupdatepolicy: BIND update policy
+        :type  o_idnsupdatepolicy: str
+        :param o_idnsallowdynupdate: Allow dynamic updates.
+        :type  o_idnsallowdynupdate: Bool
+        :param o_idnsallowquery: Semicolon separated list of IP addresses or
+            networks which are allowed to issue queries
+        :type  o_idnsallowquery: str
+        :param o_idnsallowtransfer: Semicolon separated list of IP addresses
+            or networks which are allowed to transfer the zone
+        :type  o_idnsallowtransfer: str
+        :param o_idnsallowsyncptr: Allow synchronization of forward (A, AAAA)
+            and reverse (PTR) records in the zone
+        :type  o_idnsallowsyncptr: Bool
+        :param o_idnssecinlinesigning: Allow inline DNSSEC signing of records
+            in the zone
+        :type  o_idnssecinlinesigning: Bool
+        :param o_nsec3paramrecord: NSEC3PARAM record for zone in format:
+            hash_algorithm flags iterations salt
+        :type  o_nsec3paramrecord: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_force: Force nameserver change even if nameserver not in DNS
+        :type  o_force: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_idnsname]
+        _params = {'rights': o_rights, 'force': o_force, 'all': o_all, 'raw': o_raw}
+        if o_name_from_ip is not None:
+            _params['name_from_ip'] = o_name_from_ip
+        if o_idnsforwarders is not None:
+            _params['idnsforwarders'] = o_idnsforwarders
+        if o_idnsforwardpolicy is not None:
+            _params['idnsforwardpolicy'] = o_idnsforwardpolicy
+        if o_idnssoamname is not None:
+            _params['idnssoamname'] = o_idnssoamname
+        if o_idnssoarname is not None:
+            _params['idnssoarname'] = o_idnssoarname
+        if o_idnssoaserial is not None:
+            _params['idnssoaserial'] = o_idnssoaserial
+        if o_idnssoarefresh is not None:
+            _params['idnssoarefresh'] = o_idnssoarefresh
+        if o_idnssoaretry is not None:
+            _params['idnssoaretry'] = o_idnssoaretry
+        if o_idnssoaexpire is not None:
+            _params['idnssoaexpire'] = o_idnssoaexpire
+        if o_idnssoaminimum is not None:
+            _params['idnssoaminimum'] = o_idnssoaminimum
+        if o_dnsttl is not None:
+            _params['dnsttl'] = o_dnsttl
+        if o_dnsdefaultttl is not None:
+            _params['dnsdefaultttl'] = o_dnsdefaultttl
+        if o_dnsclass is not None:
+            _params['dnsclass'] = o_dnsclass
+        if o_idnsupdatepolicy is not None:
+            _params['idnsupdatepolicy'] = o_idnsupdatepolicy
+        if o_idnsallowdynupdate is not None:
+            _params['idnsallowdynupdate'] = o_idnsallowdynupdate
+        if o_idnsallowquery is not None:
+            _params['idnsallowquery'] = o_idnsallowquery
+        if o_idnsallowtransfer is not None:
+            _params['idnsallowtransfer'] = o_idnsallowtransfer
+        if o_idnsallowsyncptr is not None:
+            _params['idnsallowsyncptr'] = o_idnsallowsyncptr
+        if o_idnssecinlinesigning is not None:
+            _params['idnssecinlinesigning'] = o_idnssecinlinesigning
+        if o_nsec3paramrecord is not None:
+            _params['nsec3paramrecord'] = o_nsec3paramrecord
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnszone_mod', _args, _params)
+
+    def dnszone_remove_permission(
+        self,
+        a_idnsname,
+        **kwargs
+    ):
+        """
+        Remove a permission for per-zone access delegation.
+
+
+        :param a_idnsname: Zone name (FQDN)
+        :type  a_idnsname: DNSNameParam
+        """
+        _args = [a_idnsname]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnszone_remove_permission', _args, _params)
+
+    def dnszone_show(
+        self,
+        a_idnsname,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display information about a DNS zone (SOA record).
+
+
+        :param a_idnsname: Zone name (FQDN)
+        :type  a_idnsname: DNSNameParam
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_idnsname]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('dnszone_show', _args, _params)
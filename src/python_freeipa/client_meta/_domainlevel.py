@@ -0,0 +1,36 @@
+class Commands(object):
+
+    def domainlevel_get(
+        self,
+        **kwargs
+    ):
+        """
+        Query current Domain Level.
+
+
+        """
+        _args = []
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('domainlevel_get', _args, _params)
+
+    def domainlevel_set(
+        self,
+        a_ipadomainlevel,
+        **kwargs
+    ):
+        """
+        Change current Domain Level.
+
+
+        :param a_ipadomainlevel: Domain Level
+        :type  a_ipadomainlevel: int, min value 1, max value 2147483647
+        """
+        _args = [a_ipadomainlevel]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('domainlevel_set', _args, _params)
@@ -0,0 +1,605 @@
+class Commands(object):
+
+    def group_add(
+        self,
+        a_cn,
+        o_description=None,
+        o_gidnumber=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_nonposix=False,
+        o_external=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Create a new group.
+
+
+        :param a_cn: Group name
+        :type  a_cn: str
+        :param o_description: Group description
+        :type  o_description: str
+        :param o_gidnumber: GID (use this option to set it manually)
+        :type  o_gidnumber: int, min value 1, max value 2147483647
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_nonposix: Create as a non-POSIX group
+        :type  o_nonposix: bool
+        :param o_external: Allow adding external non-IPA members from trusted
+            domains
+        :type  o_external: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'nonposix': o_nonposix,
+            'external': o_external,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_gidnumber is not None:
+            _params['gidnumber'] = o_gidnumber
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('group_add', _args, _params)
+
+    def group_add_member(
+        self,
+        a_cn,
+        o_ipaexternalmember=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        o_service=None,
+        **kwargs
+    ):
+        """
+        Add members to a group.
+
+
+        :param a_cn: Group name
+        :type  a_cn: str
+        :param o_ipaexternalmember: Members of a trusted domain in DOM\\name
+            or name@domain form
+        :type  o_ipaexternalmember: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to add
+        :type  o_user: str
+        :param o_group: groups to add
+        :type  o_group: str
+        :param o_service: services to add
+        :type  o_service: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_ipaexternalmember is not None:
+            _params['ipaexternalmember'] = o_ipaexternalmember
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if o_service is not None:
+            _params['service'] = o_service
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('group_add_member', _args, _params)
+
+    def group_add_member_manager(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        **kwargs
+    ):
+        """
+        Add users that can manage members of this group.
+
+
+        :param a_cn: Group name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to add
+        :type  o_user: str
+        :param o_group: groups to add
+        :type  o_group: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('group_add_member_manager', _args, _params)
+
+    def group_del(
+        self,
+        a_cn,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete group.
+
+
+        :param a_cn: Group name
+        :type  a_cn: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_cn]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('group_del', _args, _params)
+
+    def group_detach(
+        self,
+        a_cn,
+        **kwargs
+    ):
+        """
+        Detach a managed group from a user.
+
+
+        :param a_cn: Group name
+        :type  a_cn: str
+        """
+        _args = [a_cn]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('group_detach', _args, _params)
+
+    def group_find(
+        self,
+        a_criteria=None,
+        o_cn=None,
+        o_description=None,
+        o_gidnumber=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_private=False,
+        o_posix=False,
+        o_external=False,
+        o_nonposix=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=True,
+        o_pkey_only=False,
+        o_user=None,
+        o_no_user=None,
+        o_group=None,
+        o_no_group=None,
+        o_service=None,
+        o_no_service=None,
+        o_in_group=None,
+        o_not_in_group=None,
+        o_in_netgroup=None,
+        o_not_in_netgroup=None,
+        o_in_role=None,
+        o_not_in_role=None,
+        o_in_hbacrule=None,
+        o_not_in_hbacrule=None,
+        o_in_sudorule=None,
+        o_not_in_sudorule=None,
+        o_membermanager_user=None,
+        o_not_membermanager_user=None,
+        o_membermanager_group=None,
+        o_not_membermanager_group=None,
+        **kwargs
+    ):
+        """
+        Search for groups.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_cn: Group name
+        :type  o_cn: str
+        :param o_description: Group description
+        :type  o_description: str
+        :param o_gidnumber: GID (use this option to set it manually)
+        :type  o_gidnumber: int, min value 1, max value 2147483647
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_private: search for private groups
+        :type  o_private: bool
+        :param o_posix: search for POSIX groups
+        :type  o_posix: bool
+        :param o_external: search for groups with support of external non-IPA
+            members from trusted domains
+        :type  o_external: bool
+        :param o_nonposix: search for non-POSIX groups
+        :type  o_nonposix: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("group-name")
+        :type  o_pkey_only: bool
+        :param o_user: Search for groups with these member users.
+        :type  o_user: str
+        :param o_no_user: Search for groups without these member users.
+        :type  o_no_user: str
+        :param o_group: Search for groups with these member groups.
+        :type  o_group: str
+        :param o_no_group: Search for groups without these member groups.
+        :type  o_no_group: str
+        :param o_service: Search for groups with these member services.
+        :type  o_service: Principal
+        :param o_no_service: Search for groups without these member services.
+        :type  o_no_service: Principal
+        :param o_in_group: Search for groups with these member of groups.
+        :type  o_in_group: str
+        :param o_not_in_group: Search for groups without these member of
+            groups.
+        :type  o_not_in_group: str
+        :param o_in_netgroup: Search for groups with these member of
+            netgroups.
+        :type  o_in_netgroup: str
+        :param o_not_in_netgroup: Search for groups without these member of
+            netgroups.
+        :type  o_not_in_netgroup: str
+        :param o_in_role: Search for groups with these member of roles.
+        :type  o_in_role: str
+        :param o_not_in_role: Search for groups without these member of roles.
+        :type  o_not_in_role: str
+        :param o_in_hbacrule: Search for groups with these member of HBAC
+            rules.
+        :type  o_in_hbacrule: str
+        :param o_not_in_hbacrule: Search for groups without these member of
+            HBAC rules.
+        :type  o_not_in_hbacrule: str
+        :param o_in_sudorule: Search for groups with these member of sudo
+            rules.
+        :type  o_in_sudorule: str
+        :param o_not_in_sudorule: Search for groups without these member of
+            sudo rules.
+        :type  o_not_in_sudorule: str
+        :param o_membermanager_user: Search for groups with these group
+            membership managed by users.
+        :type  o_membermanager_user: str
+        :param o_not_membermanager_user: Search for groups without these group
+            membership managed by users.
+        :type  o_not_membermanager_user: str
+        :param o_membermanager_group: Search for groups with these group
+            membership managed by groups.
+        :type  o_membermanager_group: str
+        :param o_not_membermanager_group: Search for groups without these
+            group membership managed by groups.
+        :type  o_not_membermanager_group: str
+        """
+        _args = [a_criteria]
+        _params = {
+            'private': o_private,
+            'posix': o_posix,
+            'external': o_external,
+            'nonposix': o_nonposix,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_gidnumber is not None:
+            _params['gidnumber'] = o_gidnumber
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_no_user is not None:
+            _params['no_user'] = o_no_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if o_no_group is not None:
+            _params['no_group'] = o_no_group
+        if o_service is not None:
+            _params['service'] = o_service
+        if o_no_service is not None:
+            _params['no_service'] = o_no_service
+        if o_in_group is not None:
+            _params['in_group'] = o_in_group
+        if o_not_in_group is not None:
+            _params['not_in_group'] = o_not_in_group
+        if o_in_netgroup is not None:
+            _params['in_netgroup'] = o_in_netgroup
+        if o_not_in_netgroup is not None:
+            _params['not_in_netgroup'] = o_not_in_netgroup
+        if o_in_role is not None:
+            _params['in_role'] = o_in_role
+        if o_not_in_role is not None:
+            _params['not_in_role'] = o_not_in_role
+        if o_in_hbacrule is not None:
+            _params['in_hbacrule'] = o_in_hbacrule
+        if o_not_in_hbacrule is not None:
+            _params['not_in_hbacrule'] = o_not_in_hbacrule
+        if o_in_sudorule is not None:
+            _params['in_sudorule'] = o_in_sudorule
+        if o_not_in_sudorule is not None:
+            _params['not_in_sudorule'] = o_not_in_sudorule
+        if o_membermanager_user is not None:
+            _params['membermanager_user'] = o_membermanager_user
+        if o_not_membermanager_user is not None:
+            _params['not_membermanager_user'] = o_not_membermanager_user
+        if o_membermanager_group is not None:
+            _params['membermanager_group'] = o_membermanager_group
+        if o_not_membermanager_group is not None:
+            _params['not_membermanager_group'] = o_not_membermanager_group
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('group_find', _args, _params)
+
+    def group_mod(
+        self,
+        a_cn,
+        o_description=None,
+        o_gidnumber=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_posix=False,
+        o_external=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_rename=None,
+        **kwargs
+    ):
+        """
+        Modify a group.
+
+
+        :param a_cn: Group name
+        :type  a_cn: str
+        :param o_description: Group description
+        :type  o_description: str
+        :param o_gidnumber: GID (use this option to set it manually)
+        :type  o_gidnumber: int, min value 1, max value 2147483647
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_posix: change to a POSIX group
+        :type  o_posix: bool
+        :param o_external: change to support external non-IPA members from
+            trusted domains
+        :type  o_external: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_rename: Rename the group object
+        :type  o_rename: str
+        """
+        _args = [a_cn]
+        _params = {
+            'rights': o_rights,
+            'posix': o_posix,
+            'external': o_external,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_gidnumber is not None:
+            _params['gidnumber'] = o_gidnumber
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if o_rename is not None:
+            _params['rename'] = o_rename
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('group_mod', _args, _params)
+
+    def group_remove_member(
+        self,
+        a_cn,
+        o_ipaexternalmember=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        o_service=None,
+        **kwargs
+    ):
+        """
+        Remove members from a group.
+
+
+        :param a_cn: Group name
+        :type  a_cn: str
+        :param o_ipaexternalmember: Members of a trusted domain in DOM\\name
+            or name@domain form
+        :type  o_ipaexternalmember: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to remove
+        :type  o_user: str
+        :param o_group: groups to remove
+        :type  o_group: str
+        :param o_service: services to remove
+        :type  o_service: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_ipaexternalmember is not None:
+            _params['ipaexternalmember'] = o_ipaexternalmember
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if o_service is not None:
+            _params['service'] = o_service
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('group_remove_member', _args, _params)
+
+    def group_remove_member_manager(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        **kwargs
+    ):
+        """
+        Remove users that can manage members of this group.
+
+
+        :param a_cn: Group name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to remove
+        :type  o_user: str
+        :param o_group: groups to remove
+        :type  o_group: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('group_remove_member_manager', _args, _params)
+
+    def group_show(
+        self,
+        a_cn,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Display information about a named group.
+
+
+        :param a_cn: Group name
+        :type  a_cn: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('group_show', _args, _params)
@@ -0,0 +1,1286 @@
+class Commands(object):
+
+    def hbacrule_add(
+        self,
+        a_cn,
+        o_accessruletype='allow',
+        o_usercategory=None,
+        o_hostcategory=None,
+        o_sourcehostcategory=None,
+        o_servicecategory=None,
+        o_description=None,
+        o_ipaenabledflag=None,
+        o_externalhost=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Create a new HBAC rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_accessruletype: Rule type (allow)
+        :type  o_accessruletype: str, valid values ['allow', 'deny']
+        :param o_usercategory: User category the rule applies to
+        :type  o_usercategory: str, valid values ['all']
+        :param o_hostcategory: Host category the rule applies to
+        :type  o_hostcategory: str, valid values ['all']
+        :param o_sourcehostcategory: Source host category the rule applies to
+        :type  o_sourcehostcategory: str, valid values ['all']
+        :param o_servicecategory: Service category the rule applies to
+        :type  o_servicecategory: str, valid values ['all']
+        :param o_description: Description
+        :type  o_description: str
+        :param o_ipaenabledflag: Enabled
+        :type  o_ipaenabledflag: Bool
+        :param o_externalhost: External host
+        :type  o_externalhost: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'accessruletype': o_accessruletype,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_usercategory is not None:
+            _params['usercategory'] = o_usercategory
+        if o_hostcategory is not None:
+            _params['hostcategory'] = o_hostcategory
+        if o_sourcehostcategory is not None:
+            _params['sourcehostcategory'] = o_sourcehostcategory
+        if o_servicecategory is not None:
+            _params['servicecategory'] = o_servicecategory
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipaenabledflag is not None:
+            _params['ipaenabledflag'] = o_ipaenabledflag
+        if o_externalhost is not None:
+            _params['externalhost'] = o_externalhost
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbacrule_add', _args, _params)
+
+    def hbacrule_add_host(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_host=None,
+        o_hostgroup=None,
+        **kwargs
+    ):
+        """
+        Add target hosts and hostgroups to an HBAC rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_host: hosts to add
+        :type  o_host: str
+        :param o_hostgroup: host groups to add
+        :type  o_hostgroup: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_host is not None:
+            _params['host'] = o_host
+        if o_hostgroup is not None:
+            _params['hostgroup'] = o_hostgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbacrule_add_host', _args, _params)
+
+    def hbacrule_add_service(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_hbacsvc=None,
+        o_hbacsvcgroup=None,
+        **kwargs
+    ):
+        """
+        Add services to an HBAC rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_hbacsvc: HBAC services to add
+        :type  o_hbacsvc: str
+        :param o_hbacsvcgroup: HBAC service groups to add
+        :type  o_hbacsvcgroup: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_hbacsvc is not None:
+            _params['hbacsvc'] = o_hbacsvc
+        if o_hbacsvcgroup is not None:
+            _params['hbacsvcgroup'] = o_hbacsvcgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbacrule_add_service', _args, _params)
+
+    def hbacrule_add_sourcehost(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_host=None,
+        o_hostgroup=None,
+        **kwargs
+    ):
+        """
+        Add source hosts and hostgroups to an HBAC rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_host: hosts to add
+        :type  o_host: str
+        :param o_hostgroup: host groups to add
+        :type  o_hostgroup: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_host is not None:
+            _params['host'] = o_host
+        if o_hostgroup is not None:
+            _params['hostgroup'] = o_hostgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbacrule_add_sourcehost', _args, _params)
+
+    def hbacrule_add_user(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        **kwargs
+    ):
+        """
+        Add users and groups to an HBAC rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to add
+        :type  o_user: str
+        :param o_group: groups to add
+        :type  o_group: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbacrule_add_user', _args, _params)
+
+    def hbacrule_del(
+        self,
+        a_cn,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete an HBAC rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_cn]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbacrule_del', _args, _params)
+
+    def hbacrule_disable(
+        self,
+        a_cn,
+        **kwargs
+    ):
+        """
+        Disable an HBAC rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        """
+        _args = [a_cn]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbacrule_disable', _args, _params)
+
+    def hbacrule_enable(
+        self,
+        a_cn,
+        **kwargs
+    ):
+        """
+        Enable an HBAC rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        """
+        _args = [a_cn]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbacrule_enable', _args, _params)
+
+    def hbacrule_find(
+        self,
+        a_criteria=None,
+        o_cn=None,
+        o_accessruletype=None,
+        o_usercategory=None,
+        o_hostcategory=None,
+        o_sourcehostcategory=None,
+        o_servicecategory=None,
+        o_description=None,
+        o_ipaenabledflag=None,
+        o_externalhost=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=True,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for HBAC rules.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_cn: Rule name
+        :type  o_cn: str
+        :param o_accessruletype: Rule type (allow)
+        :type  o_accessruletype: str, valid values ['allow', 'deny']
+        :param o_usercategory: User category the rule applies to
+        :type  o_usercategory: str, valid values ['all']
+        :param o_hostcategory: Host category the rule applies to
+        :type  o_hostcategory: str, valid values ['all']
+        :param o_sourcehostcategory: Source host category the rule applies to
+        :type  o_sourcehostcategory: str, valid values ['all']
+        :param o_servicecategory: Service category the rule applies to
+        :type  o_servicecategory: str, valid values ['all']
+        :param o_description: Description
+        :type  o_description: str
+        :param o_ipaenabledflag: Enabled
+        :type  o_ipaenabledflag: Bool
+        :param o_externalhost: External host
+        :type  o_externalhost: str
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("name")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_accessruletype is not None:
+            _params['accessruletype'] = o_accessruletype
+        if o_usercategory is not None:
+            _params['usercategory'] = o_usercategory
+        if o_hostcategory is not None:
+            _params['hostcategory'] = o_hostcategory
+        if o_sourcehostcategory is not None:
+            _params['sourcehostcategory'] = o_sourcehostcategory
+        if o_servicecategory is not None:
+            _params['servicecategory'] = o_servicecategory
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipaenabledflag is not None:
+            _params['ipaenabledflag'] = o_ipaenabledflag
+        if o_externalhost is not None:
+            _params['externalhost'] = o_externalhost
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbacrule_find', _args, _params)
+
+    def hbacrule_mod(
+        self,
+        a_cn,
+        o_accessruletype=None,
+        o_usercategory=None,
+        o_hostcategory=None,
+        o_sourcehostcategory=None,
+        o_servicecategory=None,
+        o_description=None,
+        o_ipaenabledflag=None,
+        o_externalhost=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_rename=None,
+        **kwargs
+    ):
+        """
+        Modify an HBAC rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_accessruletype: Rule type (allow)
+        :type  o_accessruletype: str, valid values ['allow', 'deny']
+        :param o_usercategory: User category the rule applies to
+        :type  o_usercategory: str, valid values ['all']
+        :param o_hostcategory: Host category the rule applies to
+        :type  o_hostcategory: str, valid values ['all']
+        :param o_sourcehostcategory: Source host category the rule applies to
+        :type  o_sourcehostcategory: str, valid values ['all']
+        :param o_servicecategory: Service category the rule applies to
+        :type  o_servicecategory: str, valid values ['all']
+        :param o_description: Description
+        :type  o_description: str
+        :param o_ipaenabledflag: Enabled
+        :type  o_ipaenabledflag: Bool
+        :param o_externalhost: External host
+        :type  o_externalhost: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_rename: Rename the HBAC rule object
+        :type  o_rename: str
+        """
+        _args = [a_cn]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_accessruletype is not None:
+            _params['accessruletype'] = o_accessruletype
+        if o_usercategory is not None:
+            _params['usercategory'] = o_usercategory
+        if o_hostcategory is not None:
+            _params['hostcategory'] = o_hostcategory
+        if o_sourcehostcategory is not None:
+            _params['sourcehostcategory'] = o_sourcehostcategory
+        if o_servicecategory is not None:
+            _params['servicecategory'] = o_servicecategory
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipaenabledflag is not None:
+            _params['ipaenabledflag'] = o_ipaenabledflag
+        if o_externalhost is not None:
+            _params['externalhost'] = o_externalhost
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if o_rename is not None:
+            _params['rename'] = o_rename
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbacrule_mod', _args, _params)
+
+    def hbacrule_remove_host(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_host=None,
+        o_hostgroup=None,
+        **kwargs
+    ):
+        """
+        Remove target hosts and hostgroups from an HBAC rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_host: hosts to remove
+        :type  o_host: str
+        :param o_hostgroup: host groups to remove
+        :type  o_hostgroup: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_host is not None:
+            _params['host'] = o_host
+        if o_hostgroup is not None:
+            _params['hostgroup'] = o_hostgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbacrule_remove_host', _args, _params)
+
+    def hbacrule_remove_service(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_hbacsvc=None,
+        o_hbacsvcgroup=None,
+        **kwargs
+    ):
+        """
+        Remove service and service groups from an HBAC rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_hbacsvc: HBAC services to remove
+        :type  o_hbacsvc: str
+        :param o_hbacsvcgroup: HBAC service groups to remove
+        :type  o_hbacsvcgroup: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_hbacsvc is not None:
+            _params['hbacsvc'] = o_hbacsvc
+        if o_hbacsvcgroup is not None:
+            _params['hbacsvcgroup'] = o_hbacsvcgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbacrule_remove_service', _args, _params)
+
+    def hbacrule_remove_sourcehost(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_host=None,
+        o_hostgroup=None,
+        **kwargs
+    ):
+        """
+        Remove source hosts and hostgroups from an HBAC rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_host: hosts to remove
+        :type  o_host: str
+        :param o_hostgroup: host groups to remove
+        :type  o_hostgroup: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_host is not None:
+            _params['host'] = o_host
+        if o_hostgroup is not None:
+            _params['hostgroup'] = o_hostgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbacrule_remove_sourcehost', _args, _params)
+
+    def hbacrule_remove_user(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        **kwargs
+    ):
+        """
+        Remove users and groups from an HBAC rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to remove
+        :type  o_user: str
+        :param o_group: groups to remove
+        :type  o_group: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbacrule_remove_user', _args, _params)
+
+    def hbacrule_show(
+        self,
+        a_cn,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Display the properties of an HBAC rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbacrule_show', _args, _params)
+
+    def hbacsvc_add(
+        self,
+        a_cn,
+        o_description=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Add a new HBAC service.
+
+
+        :param a_cn: HBAC service
+        :type  a_cn: str
+        :param o_description: HBAC service description
+        :type  o_description: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbacsvc_add', _args, _params)
+
+    def hbacsvc_del(
+        self,
+        a_cn,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete an existing HBAC service.
+
+
+        :param a_cn: HBAC service
+        :type  a_cn: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_cn]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbacsvc_del', _args, _params)
+
+    def hbacsvc_find(
+        self,
+        a_criteria=None,
+        o_cn=None,
+        o_description=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=True,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for HBAC services.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_cn: HBAC service
+        :type  o_cn: str
+        :param o_description: HBAC service description
+        :type  o_description: str
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("service")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbacsvc_find', _args, _params)
+
+    def hbacsvc_mod(
+        self,
+        a_cn,
+        o_description=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Modify an HBAC service.
+
+
+        :param a_cn: HBAC service
+        :type  a_cn: str
+        :param o_description: HBAC service description
+        :type  o_description: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbacsvc_mod', _args, _params)
+
+    def hbacsvc_show(
+        self,
+        a_cn,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Display information about an HBAC service.
+
+
+        :param a_cn: HBAC service
+        :type  a_cn: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbacsvc_show', _args, _params)
+
+    def hbacsvcgroup_add(
+        self,
+        a_cn,
+        o_description=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Add a new HBAC service group.
+
+
+        :param a_cn: Service group name
+        :type  a_cn: str
+        :param o_description: HBAC service group description
+        :type  o_description: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbacsvcgroup_add', _args, _params)
+
+    def hbacsvcgroup_add_member(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_hbacsvc=None,
+        **kwargs
+    ):
+        """
+        Add members to an HBAC service group.
+
+
+        :param a_cn: Service group name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_hbacsvc: HBAC services to add
+        :type  o_hbacsvc: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_hbacsvc is not None:
+            _params['hbacsvc'] = o_hbacsvc
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbacsvcgroup_add_member', _args, _params)
+
+    def hbacsvcgroup_del(
+        self,
+        a_cn,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete an HBAC service group.
+
+
+        :param a_cn: Service group name
+        :type  a_cn: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_cn]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbacsvcgroup_del', _args, _params)
+
+    def hbacsvcgroup_find(
+        self,
+        a_criteria=None,
+        o_cn=None,
+        o_description=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=True,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for an HBAC service group.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_cn: Service group name
+        :type  o_cn: str
+        :param o_description: HBAC service group description
+        :type  o_description: str
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("name")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbacsvcgroup_find', _args, _params)
+
+    def hbacsvcgroup_mod(
+        self,
+        a_cn,
+        o_description=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Modify an HBAC service group.
+
+
+        :param a_cn: Service group name
+        :type  a_cn: str
+        :param o_description: HBAC service group description
+        :type  o_description: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbacsvcgroup_mod', _args, _params)
+
+    def hbacsvcgroup_remove_member(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_hbacsvc=None,
+        **kwargs
+    ):
+        """
+        Remove members from an HBAC service group.
+
+
+        :param a_cn: Service group name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_hbacsvc: HBAC services to remove
+        :type  o_hbacsvc: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_hbacsvc is not None:
+            _params['hbacsvc'] = o_hbacsvc
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbacsvcgroup_remove_member', _args, _params)
+
+    def hbacsvcgroup_show(
+        self,
+        a_cn,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Display information about an HBAC service group.
+
+
+        :param a_cn: Service group name
+        :type  a_cn: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbacsvcgroup_show', _args, _params)
+
+    def hbactest(
+        self,
+        o_user,
+        o_targethost,
+        o_service,
+        o_sourcehost=None,
+        o_rules=None,
+        o_nodetail=False,
+        o_enabled=False,
+        o_disabled=False,
+        o_sizelimit=None,
+        **kwargs
+    ):
+        """
+        Simulate use of Host-based access controls
+
+
+        :param o_user: User name
+        :type  o_user: str
+        :param o_sourcehost: Source host
+        :type  o_sourcehost: str
+        :param o_targethost: Target host
+        :type  o_targethost: str
+        :param o_service: Service
+        :type  o_service: str
+        :param o_rules: Rules to test. If not specified, --enabled is assumed
+        :type  o_rules: str
+        :param o_nodetail: Hide details which rules are matched, not matched,
+            or invalid
+        :type  o_nodetail: bool
+        :param o_enabled: Include all enabled IPA rules into test [default]
+        :type  o_enabled: bool
+        :param o_disabled: Include all disabled IPA rules into test
+        :type  o_disabled: bool
+        :param o_sizelimit: Maximum number of rules to process when no --rules
+            is specified
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        """
+        _args = []
+        _params = {'user': o_user, 'targethost': o_targethost, 'service': o_service}
+        if o_sourcehost is not None:
+            _params['sourcehost'] = o_sourcehost
+        if o_rules is not None:
+            _params['rules'] = o_rules
+        if o_nodetail is not None:
+            _params['nodetail'] = o_nodetail
+        if o_enabled is not None:
+            _params['enabled'] = o_enabled
+        if o_disabled is not None:
+            _params['disabled'] = o_disabled
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hbactest', _args, _params)
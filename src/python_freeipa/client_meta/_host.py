@@ -0,0 +1,1016 @@
+class Commands(object):
+
+    def host_add(
+        self,
+        a_fqdn,
+        o_description=None,
+        o_l=None,
+        o_nshostlocation=None,
+        o_nshardwareplatform=None,
+        o_nsosversion=None,
+        o_userpassword=None,
+        o_random=False,
+        o_usercertificate=None,
+        o_macaddress=None,
+        o_ipasshpubkey=None,
+        o_userclass=None,
+        o_ipaassignedidview=None,
+        o_krbprincipalauthind=None,
+        o_ipakrbrequirespreauth=None,
+        o_ipakrbokasdelegate=None,
+        o_ipakrboktoauthasdelegate=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_force=False,
+        o_no_reverse=False,
+        o_ip_address=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Add a new host.
+
+
+        :param a_fqdn: Host name
+        :type  a_fqdn: str
+        :param o_description: A description of this host
+        :type  o_description: str
+        :param o_l: Host locality (e.g. "Baltimore, MD")
+        :type  o_l: str
+        :param o_nshostlocation: Host location (e.g. "Lab 2")
+        :type  o_nshostlocation: str
+        :param o_nshardwareplatform: Host hardware platform (e.g. "Lenovo
+            T61")
+        :type  o_nshardwareplatform: str
+        :param o_nsosversion: Host operating system and version (e.g. "Fedora
+            9")
+        :type  o_nsosversion: str
+        :param o_userpassword: Password used in bulk enrollment
+        :type  o_userpassword: HostPassword
+        :param o_random: Generate a random password to be used in bulk
+            enrollment
+        :type  o_random: bool
+        :param o_usercertificate: Base-64 encoded host certificate
+        :type  o_usercertificate: Certificate
+        :param o_macaddress: Hardware MAC address(es) on this host
+        :type  o_macaddress: str
+        :param o_ipasshpubkey: SSH public key
+        :type  o_ipasshpubkey: str
+        :param o_userclass: Host category (semantics placed on this attribute
+            are for local interpretation)
+        :type  o_userclass: str
+        :param o_ipaassignedidview: Assigned ID View
+        :type  o_ipaassignedidview: str
+        :param o_krbprincipalauthind: Defines a whitelist for Authentication
+            Indicators. Use 'otp' to allow OTP-based 2FA authentications. Use
+            'radius' to allow RADIUS-based 2FA authentications. Use 'pkinit' to
+            allow PKINIT-based 2FA authentications. Use 'hardened' to allow brute-
+            force hardened password authentication by SPAKE or FAST. With no
+            indicator specified, all authentication mechanisms are allowed.
+        :type  o_krbprincipalauthind: list of str, valid values ['radius', 'otp', 'pkinit', 'hardened']
+        :param o_ipakrbrequirespreauth: Pre-authentication is required for the
+            service
+        :type  o_ipakrbrequirespreauth: Bool
+        :param o_ipakrbokasdelegate: Client credentials may be delegated to
+            the service
+        :type  o_ipakrbokasdelegate: Bool
+        :param o_ipakrboktoauthasdelegate: The service is allowed to
+            authenticate on behalf of a client
+        :type  o_ipakrboktoauthasdelegate: Bool
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_force: force host name even if not in DNS
+        :type  o_force: bool
+        :param o_no_reverse: skip reverse DNS detection
+        :type  o_no_reverse: bool
+        :param o_ip_address: Add the host to DNS with this IP address
+        :type  o_ip_address: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_fqdn]
+        _params = {
+            'force': o_force,
+            'no_reverse': o_no_reverse,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_l is not None:
+            _params['l'] = o_l
+        if o_nshostlocation is not None:
+            _params['nshostlocation'] = o_nshostlocation
+        if o_nshardwareplatform is not None:
+            _params['nshardwareplatform'] = o_nshardwareplatform
+        if o_nsosversion is not None:
+            _params['nsosversion'] = o_nsosversion
+        if o_userpassword is not None:
+            _params['userpassword'] = o_userpassword
+        if o_random is not None:
+            _params['random'] = o_random
+        if o_usercertificate is not None:
+            _params['usercertificate'] = o_usercertificate
+        if o_macaddress is not None:
+            _params['macaddress'] = o_macaddress
+        if o_ipasshpubkey is not None:
+            _params['ipasshpubkey'] = o_ipasshpubkey
+        if o_userclass is not None:
+            _params['userclass'] = o_userclass
+        if o_ipaassignedidview is not None:
+            _params['ipaassignedidview'] = o_ipaassignedidview
+        if o_krbprincipalauthind is not None:
+            _params['krbprincipalauthind'] = o_krbprincipalauthind
+        if o_ipakrbrequirespreauth is not None:
+            _params['ipakrbrequirespreauth'] = o_ipakrbrequirespreauth
+        if o_ipakrbokasdelegate is not None:
+            _params['ipakrbokasdelegate'] = o_ipakrbokasdelegate
+        if o_ipakrboktoauthasdelegate is not None:
+            _params['ipakrboktoauthasdelegate'] = o_ipakrboktoauthasdelegate
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_ip_address is not None:
+            _params['ip_address'] = o_ip_address
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('host_add', _args, _params)
+
+    def host_add_cert(
+        self,
+        a_fqdn,
+        o_usercertificate,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Add certificates to host entry
+
+
+        :param a_fqdn: Host name
+        :type  a_fqdn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_usercertificate: Base-64 encoded host certificate
+        :type  o_usercertificate: Certificate
+        """
+        _args = [a_fqdn]
+        _params = {
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+            'usercertificate': o_usercertificate,
+        }
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('host_add_cert', _args, _params)
+
+    def host_add_managedby(
+        self,
+        a_fqdn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_host=None,
+        **kwargs
+    ):
+        """
+        Add hosts that can manage this host.
+
+
+        :param a_fqdn: Host name
+        :type  a_fqdn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_host: hosts to add
+        :type  o_host: str
+        """
+        _args = [a_fqdn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_host is not None:
+            _params['host'] = o_host
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('host_add_managedby', _args, _params)
+
+    def host_add_principal(
+        self,
+        a_fqdn,
+        a_krbprincipalname,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Add new principal alias to host entry
+
+
+        :param a_fqdn: Host name
+        :type  a_fqdn: str
+        :param a_krbprincipalname: Principal alias
+        :type  a_krbprincipalname: Principal
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_fqdn, a_krbprincipalname]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('host_add_principal', _args, _params)
+
+    def host_allow_create_keytab(
+        self,
+        a_fqdn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        o_host=None,
+        o_hostgroup=None,
+        **kwargs
+    ):
+        """
+        Allow users, groups, hosts or host groups to create a keytab of this host.
+
+
+        :param a_fqdn: Host name
+        :type  a_fqdn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to add
+        :type  o_user: str
+        :param o_group: groups to add
+        :type  o_group: str
+        :param o_host: hosts to add
+        :type  o_host: str
+        :param o_hostgroup: host groups to add
+        :type  o_hostgroup: str
+        """
+        _args = [a_fqdn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if o_host is not None:
+            _params['host'] = o_host
+        if o_hostgroup is not None:
+            _params['hostgroup'] = o_hostgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('host_allow_create_keytab', _args, _params)
+
+    def host_allow_retrieve_keytab(
+        self,
+        a_fqdn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        o_host=None,
+        o_hostgroup=None,
+        **kwargs
+    ):
+        """
+        Allow users, groups, hosts or host groups to retrieve a keytab of this host.
+
+
+        :param a_fqdn: Host name
+        :type  a_fqdn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to add
+        :type  o_user: str
+        :param o_group: groups to add
+        :type  o_group: str
+        :param o_host: hosts to add
+        :type  o_host: str
+        :param o_hostgroup: host groups to add
+        :type  o_hostgroup: str
+        """
+        _args = [a_fqdn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if o_host is not None:
+            _params['host'] = o_host
+        if o_hostgroup is not None:
+            _params['hostgroup'] = o_hostgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('host_allow_retrieve_keytab', _args, _params)
+
+    def host_del(
+        self,
+        a_fqdn,
+        o_continue=False,
+        o_updatedns=False,
+        **kwargs
+    ):
+        """
+        Delete a host.
+
+
+        :param a_fqdn: Host name
+        :type  a_fqdn: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        :param o_updatedns: Remove A, AAAA, SSHFP and PTR records of the
+            host(s) managed by IPA DNS
+        :type  o_updatedns: bool
+        """
+        _args = [a_fqdn]
+        _params = {'continue': o_continue}
+        if o_updatedns is not None:
+            _params['updatedns'] = o_updatedns
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('host_del', _args, _params)
+
+    def host_disable(
+        self,
+        a_fqdn,
+        **kwargs
+    ):
+        """
+        Disable the Kerberos key, SSL certificate and all services of a host.
+
+
+        :param a_fqdn: Host name
+        :type  a_fqdn: str
+        """
+        _args = [a_fqdn]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('host_disable', _args, _params)
+
+    def host_disallow_create_keytab(
+        self,
+        a_fqdn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        o_host=None,
+        o_hostgroup=None,
+        **kwargs
+    ):
+        """
+        Disallow users, groups, hosts or host groups to create a keytab of this host.
+
+
+        :param a_fqdn: Host name
+        :type  a_fqdn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to remove
+        :type  o_user: str
+        :param o_group: groups to remove
+        :type  o_group: str
+        :param o_host: hosts to remove
+        :type  o_host: str
+        :param o_hostgroup: host groups to remove
+        :type  o_hostgroup: str
+        """
+        _args = [a_fqdn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if o_host is not None:
+            _params['host'] = o_host
+        if o_hostgroup is not None:
+            _params['hostgroup'] = o_hostgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('host_disallow_create_keytab', _args, _params)
+
+    def host_disallow_retrieve_keytab(
+        self,
+        a_fqdn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        o_host=None,
+        o_hostgroup=None,
+        **kwargs
+    ):
+        """
+        Disallow users, groups, hosts or host groups to retrieve a keytab of this host.
+
+
+        :param a_fqdn: Host name
+        :type  a_fqdn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to remove
+        :type  o_user: str
+        :param o_group: groups to remove
+        :type  o_group: str
+        :param o_host: hosts to remove
+        :type  o_host: str
+        :param o_hostgroup: host groups to remove
+        :type  o_hostgroup: str
+        """
+        _args = [a_fqdn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if o_host is not None:
+            _params['host'] = o_host
+        if o_hostgroup is not None:
+            _params['hostgroup'] = o_hostgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('host_disallow_retrieve_keytab', _args, _params)
+
+    def host_find(
+        self,
+        a_criteria=None,
+        o_fqdn=None,
+        o_description=None,
+        o_l=None,
+        o_nshostlocation=None,
+        o_nshardwareplatform=None,
+        o_nsosversion=None,
+        o_usercertificate=None,
+        o_macaddress=None,
+        o_userclass=None,
+        o_ipaassignedidview=None,
+        o_krbprincipalauthind=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=True,
+        o_pkey_only=False,
+        o_in_hostgroup=None,
+        o_not_in_hostgroup=None,
+        o_in_netgroup=None,
+        o_not_in_netgroup=None,
+        o_in_role=None,
+        o_not_in_role=None,
+        o_in_hbacrule=None,
+        o_not_in_hbacrule=None,
+        o_in_sudorule=None,
+        o_not_in_sudorule=None,
+        o_enroll_by_user=None,
+        o_not_enroll_by_user=None,
+        o_man_by_host=None,
+        o_not_man_by_host=None,
+        o_man_host=None,
+        o_not_man_host=None,
+        **kwargs
+    ):
+        """
+        Search for hosts.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_fqdn: Host name
+        :type  o_fqdn: str
+        :param o_description: A description of this host
+        :type  o_description: str
+        :param o_l: Host locality (e.g. "Baltimore, MD")
+        :type  o_l: str
+        :param o_nshostlocation: Host location (e.g. "Lab 2")
+        :type  o_nshostlocation: str
+        :param o_nshardwareplatform: Host hardware platform (e.g. "Lenovo
+            T61")
+        :type  o_nshardwareplatform: str
+        :param o_nsosversion: Host operating system and version (e.g. "Fedora
+            9")
+        :type  o_nsosversion: str
+        :param o_usercertificate: Base-64 encoded host certificate
+        :type  o_usercertificate: Certificate
+        :param o_macaddress: Hardware MAC address(es) on this host
+        :type  o_macaddress: str
+        :param o_userclass: Host category (semantics placed on this attribute
+            are for local interpretation)
+        :type  o_userclass: str
+        :param o_ipaassignedidview: Assigned ID View
+        :type  o_ipaassignedidview: str
+        :param o_krbprincipalauthind: Defines a whitelist for Authentication
+            Indicators. Use 'otp' to allow OTP-based 2FA authentications. Use
+            'radius' to allow RADIUS-based 2FA authentications. Use 'pkinit' to
+            allow PKINIT-based 2FA authentications. Use 'hardened' to allow brute-
+            force hardened password authentication by SPAKE or FAST. With no
+            indicator specified, all authentication mechanisms are allowed.
+        :type  o_krbprincipalauthind: list of str, valid values ['radius', 'otp', 'pkinit', 'hardened']
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("hostname")
+        :type  o_pkey_only: bool
+        :param o_in_hostgroup: Search for hosts with these member of host
+            groups.
+        :type  o_in_hostgroup: str
+        :param o_not_in_hostgroup: Search for hosts without these member of
+            host groups.
+        :type  o_not_in_hostgroup: str
+        :param o_in_netgroup: Search for hosts with these member of netgroups.
+        :type  o_in_netgroup: str
+        :param o_not_in_netgroup: Search for hosts without these member of
+            netgroups.
+        :type  o_not_in_netgroup: str
+        :param o_in_role: Search for hosts with these member of roles.
+        :type  o_in_role: str
+        :param o_not_in_role: Search for hosts without these member of roles.
+        :type  o_not_in_role: str
+        :param o_in_hbacrule: Search for hosts with these member of HBAC
+            rules.
+        :type  o_in_hbacrule: str
+        :param o_not_in_hbacrule: Search for hosts without these member of
+            HBAC rules.
+        :type  o_not_in_hbacrule: str
+        :param o_in_sudorule: Search for hosts with these member of sudo
+            rules.
+        :type  o_in_sudorule: str
+        :param o_not_in_sudorule: Search for hosts without these member of
+            sudo rules.
+        :type  o_not_in_sudorule: str
+        :param o_enroll_by_user: Search for hosts with these enrolled by
+            users.
+        :type  o_enroll_by_user: str
+        :param o_not_enroll_by_user: Search for hosts without these enrolled
+            by users.
+        :type  o_not_enroll_by_user: str
+        :param o_man_by_host: Search for hosts with these managed by hosts.
+        :type  o_man_by_host: str
+        :param o_not_man_by_host: Search for hosts without these managed by
+            hosts.
+        :type  o_not_man_by_host: str
+        :param o_man_host: Search for hosts with these managing hosts.
+        :type  o_man_host: str
+        :param o_not_man_host: Search for hosts without these managing hosts.
+        :type  o_not_man_host: str
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_fqdn is not None:
+            _params['fqdn'] = o_fqdn
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_l is not None:
+            _params['l'] = o_l
+        if o_nshostlocation is not None:
+            _params['nshostlocation'] = o_nshostlocation
+        if o_nshardwareplatform is not None:
+            _params['nshardwareplatform'] = o_nshardwareplatform
+        if o_nsosversion is not None:
+            _params['nsosversion'] = o_nsosversion
+        if o_usercertificate is not None:
+            _params['usercertificate'] = o_usercertificate
+        if o_macaddress is not None:
+            _params['macaddress'] = o_macaddress
+        if o_userclass is not None:
+            _params['userclass'] = o_userclass
+        if o_ipaassignedidview is not None:
+            _params['ipaassignedidview'] = o_ipaassignedidview
+        if o_krbprincipalauthind is not None:
+            _params['krbprincipalauthind'] = o_krbprincipalauthind
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if o_in_hostgroup is not None:
+            _params['in_hostgroup'] = o_in_hostgroup
+        if o_not_in_hostgroup is not None:
+            _params['not_in_hostgroup'] = o_not_in_hostgroup
+        if o_in_netgroup is not None:
+            _params['in_netgroup'] = o_in_netgroup
+        if o_not_in_netgroup is not None:
+            _params['not_in_netgroup'] = o_not_in_netgroup
+        if o_in_role is not None:
+            _params['in_role'] = o_in_role
+        if o_not_in_role is not None:
+            _params['not_in_role'] = o_not_in_role
+        if o_in_hbacrule is not None:
+            _params['in_hbacrule'] = o_in_hbacrule
+        if o_not_in_hbacrule is not None:
+            _params['not_in_hbacrule'] = o_not_in_hbacrule
+        if o_in_sudorule is not None:
+            _params['in_sudorule'] = o_in_sudorule
+        if o_not_in_sudorule is not None:
+            _params['not_in_sudorule'] = o_not_in_sudorule
+        if o_enroll_by_user is not None:
+            _params['enroll_by_user'] = o_enroll_by_user
+        if o_not_enroll_by_user is not None:
+            _params['not_enroll_by_user'] = o_not_enroll_by_user
+        if o_man_by_host is not None:
+            _params['man_by_host'] = o_man_by_host
+        if o_not_man_by_host is not None:
+            _params['not_man_by_host'] = o_not_man_by_host
+        if o_man_host is not None:
+            _params['man_host'] = o_man_host
+        if o_not_man_host is not None:
+            _params['not_man_host'] = o_not_man_host
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('host_find', _args, _params)
+
+    def host_mod(
+        self,
+        a_fqdn,
+        o_description=None,
+        o_l=None,
+        o_nshostlocation=None,
+        o_nshardwareplatform=None,
+        o_nsosversion=None,
+        o_userpassword=None,
+        o_random=False,
+        o_usercertificate=None,
+        o_krbprincipalname=None,
+        o_macaddress=None,
+        o_ipasshpubkey=None,
+        o_userclass=None,
+        o_ipaassignedidview=None,
+        o_krbprincipalauthind=None,
+        o_ipakrbrequirespreauth=None,
+        o_ipakrbokasdelegate=None,
+        o_ipakrboktoauthasdelegate=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_updatedns=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Modify information about a host.
+
+
+        :param a_fqdn: Host name
+        :type  a_fqdn: str
+        :param o_description: A description of this host
+        :type  o_description: str
+        :param o_l: Host locality (e.g. "Baltimore, MD")
+        :type  o_l: str
+        :param o_nshostlocation: Host location (e.g. "Lab 2")
+        :type  o_nshostlocation: str
+        :param o_nshardwareplatform: Host hardware platform (e.g. "Lenovo
+            T61")
+        :type  o_nshardwareplatform: str
+        :param o_nsosversion: Host operating system and version (e.g. "Fedora
+            9")
+        :type  o_nsosversion: str
+        :param o_userpassword: Password used in bulk enrollment
+        :type  o_userpassword: HostPassword
+        :param o_random: Generate a random password to be used in bulk
+            enrollment
+        :type  o_random: bool
+        :param o_usercertificate: Base-64 encoded host certificate
+        :type  o_usercertificate: Certificate
+        :param o_krbprincipalname: Principal alias
+        :type  o_krbprincipalname: Principal
+        :param o_macaddress: Hardware MAC address(es) on this host
+        :type  o_macaddress: str
+        :param o_ipasshpubkey: SSH public key
+        :type  o_ipasshpubkey: str
+        :param o_userclass: Host category (semantics placed on this attribute
+            are for local interpretation)
+        :type  o_userclass: str
+        :param o_ipaassignedidview: Assigned ID View
+        :type  o_ipaassignedidview: str
+        :param o_krbprincipalauthind: Defines a whitelist for Authentication
+            Indicators. Use 'otp' to allow OTP-based 2FA authentications. Use
+            'radius' to allow RADIUS-based 2FA authentications. Use 'pkinit' to
+            allow PKINIT-based 2FA authentications. Use 'hardened' to allow brute-
+            force hardened password authentication by SPAKE or FAST. With no
+            indicator specified, all authentication mechanisms are allowed.
+        :type  o_krbprincipalauthind: list of str, valid values ['radius', 'otp', 'pkinit', 'hardened']
+        :param o_ipakrbrequirespreauth: Pre-authentication is required for the
+            service
+        :type  o_ipakrbrequirespreauth: Bool
+        :param o_ipakrbokasdelegate: Client credentials may be delegated to
+            the service
+        :type  o_ipakrbokasdelegate: Bool
+        :param o_ipakrboktoauthasdelegate: The service is allowed to
+            authenticate on behalf of a client
+        :type  o_ipakrboktoauthasdelegate: Bool
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_updatedns: Update DNS entries
+        :type  o_updatedns: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_fqdn]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_l is not None:
+            _params['l'] = o_l
+        if o_nshostlocation is not None:
+            _params['nshostlocation'] = o_nshostlocation
+        if o_nshardwareplatform is not None:
+            _params['nshardwareplatform'] = o_nshardwareplatform
+        if o_nsosversion is not None:
+            _params['nsosversion'] = o_nsosversion
+        if o_userpassword is not None:
+            _params['userpassword'] = o_userpassword
+        if o_random is not None:
+            _params['random'] = o_random
+        if o_usercertificate is not None:
+            _params['usercertificate'] = o_usercertificate
+        if o_krbprincipalname is not None:
+            _params['krbprincipalname'] = o_krbprincipalname
+        if o_macaddress is not None:
+            _params['macaddress'] = o_macaddress
+        if o_ipasshpubkey is not None:
+            _params['ipasshpubkey'] = o_ipasshpubkey
+        if o_userclass is not None:
+            _params['userclass'] = o_userclass
+        if o_ipaassignedidview is not None:
+            _params['ipaassignedidview'] = o_ipaassignedidview
+        if o_krbprincipalauthind is not None:
+            _params['krbprincipalauthind'] = o_krbprincipalauthind
+        if o_ipakrbrequirespreauth is not None:
+            _params['ipakrbrequirespreauth'] = o_ipakrbrequirespreauth
+        if o_ipakrbokasdelegate is not None:
+            _params['ipakrbokasdelegate'] = o_ipakrbokasdelegate
+        if o_ipakrboktoauthasdelegate is not None:
+            _params['ipakrboktoauthasdelegate'] = o_ipakrboktoauthasdelegate
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if o_updatedns is not None:
+            _params['updatedns'] = o_updatedns
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('host_mod', _args, _params)
+
+    def host_remove_cert(
+        self,
+        a_fqdn,
+        o_usercertificate,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Remove certificates from host entry
+
+
+        :param a_fqdn: Host name
+        :type  a_fqdn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_usercertificate: Base-64 encoded host certificate
+        :type  o_usercertificate: Certificate
+        """
+        _args = [a_fqdn]
+        _params = {
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+            'usercertificate': o_usercertificate,
+        }
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('host_remove_cert', _args, _params)
+
+    def host_remove_managedby(
+        self,
+        a_fqdn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_host=None,
+        **kwargs
+    ):
+        """
+        Remove hosts that can manage this host.
+
+
+        :param a_fqdn: Host name
+        :type  a_fqdn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_host: hosts to remove
+        :type  o_host: str
+        """
+        _args = [a_fqdn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_host is not None:
+            _params['host'] = o_host
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('host_remove_managedby', _args, _params)
+
+    def host_remove_principal(
+        self,
+        a_fqdn,
+        a_krbprincipalname,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Remove principal alias from a host entry
+
+
+        :param a_fqdn: Host name
+        :type  a_fqdn: str
+        :param a_krbprincipalname: Principal alias
+        :type  a_krbprincipalname: Principal
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_fqdn, a_krbprincipalname]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('host_remove_principal', _args, _params)
+
+    def host_show(
+        self,
+        a_fqdn,
+        o_rights=False,
+        o_out=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Display information about a host.
+
+
+        :param a_fqdn: Host name
+        :type  a_fqdn: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_out: file to store certificate in
+        :type  o_out: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_fqdn]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_out is not None:
+            _params['out'] = o_out
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('host_show', _args, _params)
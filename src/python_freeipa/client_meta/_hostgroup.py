@@ -0,0 +1,484 @@
+class Commands(object):
+
+    def hostgroup_add(
+        self,
+        a_cn,
+        o_description=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Add a new hostgroup.
+
+
+        :param a_cn: Name of host-group
+        :type  a_cn: str
+        :param o_description: A description of this host-group
+        :type  o_description: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hostgroup_add', _args, _params)
+
+    def hostgroup_add_member(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_host=None,
+        o_hostgroup=None,
+        **kwargs
+    ):
+        """
+        Add members to a hostgroup.
+
+
+        :param a_cn: Name of host-group
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_host: hosts to add
+        :type  o_host: str
+        :param o_hostgroup: host groups to add
+        :type  o_hostgroup: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_host is not None:
+            _params['host'] = o_host
+        if o_hostgroup is not None:
+            _params['hostgroup'] = o_hostgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hostgroup_add_member', _args, _params)
+
+    def hostgroup_add_member_manager(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        **kwargs
+    ):
+        """
+        Add users that can manage members of this hostgroup.
+
+
+        :param a_cn: Name of host-group
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to add
+        :type  o_user: str
+        :param o_group: groups to add
+        :type  o_group: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hostgroup_add_member_manager', _args, _params)
+
+    def hostgroup_del(
+        self,
+        a_cn,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete a hostgroup.
+
+
+        :param a_cn: Name of host-group
+        :type  a_cn: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_cn]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hostgroup_del', _args, _params)
+
+    def hostgroup_find(
+        self,
+        a_criteria=None,
+        o_cn=None,
+        o_description=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=True,
+        o_pkey_only=False,
+        o_host=None,
+        o_no_host=None,
+        o_hostgroup=None,
+        o_no_hostgroup=None,
+        o_in_hostgroup=None,
+        o_not_in_hostgroup=None,
+        o_in_netgroup=None,
+        o_not_in_netgroup=None,
+        o_in_hbacrule=None,
+        o_not_in_hbacrule=None,
+        o_in_sudorule=None,
+        o_not_in_sudorule=None,
+        o_membermanager_user=None,
+        o_not_membermanager_user=None,
+        o_membermanager_group=None,
+        o_not_membermanager_group=None,
+        **kwargs
+    ):
+        """
+        Search for hostgroups.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_cn: Name of host-group
+        :type  o_cn: str
+        :param o_description: A description of this host-group
+        :type  o_description: str
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("hostgroup-name")
+        :type  o_pkey_only: bool
+        :param o_host: Search for host groups with these member hosts.
+        :type  o_host: str
+        :param o_no_host: Search for host groups without these member hosts.
+        :type  o_no_host: str
+        :param o_hostgroup: Search for host groups with these member host
+            groups.
+        :type  o_hostgroup: str
+        :param o_no_hostgroup: Search for host groups without these member
+            host groups.
+        :type  o_no_hostgroup: str
+        :param o_in_hostgroup: Search for host groups with these member of
+            host groups.
+        :type  o_in_hostgroup: str
+        :param o_not_in_hostgroup: Search for host groups without these member
+            of host groups.
+        :type  o_not_in_hostgroup: str
+        :param o_in_netgroup: Search for host groups with these member of
+            netgroups.
+        :type  o_in_netgroup: str
+        :param o_not_in_netgroup: Search for host groups without these member
+            of netgroups.
+        :type  o_not_in_netgroup: str
+        :param o_in_hbacrule: Search for host groups with these member of HBAC
+            rules.
+        :type  o_in_hbacrule: str
+        :param o_not_in_hbacrule: Search for host groups without these member
+            of HBAC rules.
+        :type  o_not_in_hbacrule: str
+        :param o_in_sudorule: Search for host groups with these member of sudo
+            rules.
+        :type  o_in_sudorule: str
+        :param o_not_in_sudorule: Search for host groups without these member
+            of sudo rules.
+        :type  o_not_in_sudorule: str
+        :param o_membermanager_user: Search for host groups with these group
+            membership managed by users.
+        :type  o_membermanager_user: str
+        :param o_not_membermanager_user: Search for host groups without these
+            group membership managed by users.
+        :type  o_not_membermanager_user: str
+        :param o_membermanager_group: Search for host groups with these group
+            membership managed by groups.
+        :type  o_membermanager_group: str
+        :param o_not_membermanager_group: Search for host groups without these
+            group membership managed by groups.
+        :type  o_not_membermanager_group: str
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if o_host is not None:
+            _params['host'] = o_host
+        if o_no_host is not None:
+            _params['no_host'] = o_no_host
+        if o_hostgroup is not None:
+            _params['hostgroup'] = o_hostgroup
+        if o_no_hostgroup is not None:
+            _params['no_hostgroup'] = o_no_hostgroup
+        if o_in_hostgroup is not None:
+            _params['in_hostgroup'] = o_in_hostgroup
+        if o_not_in_hostgroup is not None:
+            _params['not_in_hostgroup'] = o_not_in_hostgroup
+        if o_in_netgroup is not None:
+            _params['in_netgroup'] = o_in_netgroup
+        if o_not_in_netgroup is not None:
+            _params['not_in_netgroup'] = o_not_in_netgroup
+        if o_in_hbacrule is not None:
+            _params['in_hbacrule'] = o_in_hbacrule
+        if o_not_in_hbacrule is not None:
+            _params['not_in_hbacrule'] = o_not_in_hbacrule
+        if o_in_sudorule is not None:
+            _params['in_sudorule'] = o_in_sudorule
+        if o_not_in_sudorule is not None:
+            _params['not_in_sudorule'] = o_not_in_sudorule
+        if o_membermanager_user is not None:
+            _params['membermanager_user'] = o_membermanager_user
+        if o_not_membermanager_user is not None:
+            _params['not_membermanager_user'] = o_not_membermanager_user
+        if o_membermanager_group is not None:
+            _params['membermanager_group'] = o_membermanager_group
+        if o_not_membermanager_group is not None:
+            _params['not_membermanager_group'] = o_not_membermanager_group
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hostgroup_find', _args, _params)
+
+    def hostgroup_mod(
+        self,
+        a_cn,
+        o_description=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Modify a hostgroup.
+
+
+        :param a_cn: Name of host-group
+        :type  a_cn: str
+        :param o_description: A description of this host-group
+        :type  o_description: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hostgroup_mod', _args, _params)
+
+    def hostgroup_remove_member(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_host=None,
+        o_hostgroup=None,
+        **kwargs
+    ):
+        """
+        Remove members from a hostgroup.
+
+
+        :param a_cn: Name of host-group
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_host: hosts to remove
+        :type  o_host: str
+        :param o_hostgroup: host groups to remove
+        :type  o_hostgroup: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_host is not None:
+            _params['host'] = o_host
+        if o_hostgroup is not None:
+            _params['hostgroup'] = o_hostgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hostgroup_remove_member', _args, _params)
+
+    def hostgroup_remove_member_manager(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        **kwargs
+    ):
+        """
+        Remove users that can manage members of this hostgroup.
+
+
+        :param a_cn: Name of host-group
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to remove
+        :type  o_user: str
+        :param o_group: groups to remove
+        :type  o_group: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hostgroup_remove_member_manager', _args, _params)
+
+    def hostgroup_show(
+        self,
+        a_cn,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Display information about a hostgroup.
+
+
+        :param a_cn: Name of host-group
+        :type  a_cn: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('hostgroup_show', _args, _params)
@@ -0,0 +1,17 @@
+class Commands(object):
+
+    def i18n_messages(
+        self,
+        **kwargs
+    ):
+        """
+        Internationalization messages
+
+
+        """
+        _args = []
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('i18n_messages', _args, _params)
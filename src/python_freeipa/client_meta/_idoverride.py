@@ -0,0 +1,748 @@
+class Commands(object):
+
+    def idoverridegroup_add(
+        self,
+        a_idviewcn,
+        a_ipaanchoruuid,
+        o_description=None,
+        o_cn=None,
+        o_gidnumber=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_fallback_to_ldap=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Add a new Group ID override.
+
+
+        :param a_idviewcn: ID View Name
+        :type  a_idviewcn: str
+        :param a_ipaanchoruuid: Anchor to override
+        :type  a_ipaanchoruuid: str
+        :param o_description: Description
+        :type  o_description: str
+        :param o_cn: Group name
+        :type  o_cn: str
+        :param o_gidnumber: Group ID Number
+        :type  o_gidnumber: int, min value 1, max value 2147483647
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_fallback_to_ldap: Allow falling back to AD DC LDAP when
+            resolving AD trusted objects. For two-way trusts only.
+        :type  o_fallback_to_ldap: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_idviewcn, a_ipaanchoruuid]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_gidnumber is not None:
+            _params['gidnumber'] = o_gidnumber
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_fallback_to_ldap is not None:
+            _params['fallback_to_ldap'] = o_fallback_to_ldap
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('idoverridegroup_add', _args, _params)
+
+    def idoverridegroup_del(
+        self,
+        a_idviewcn,
+        a_ipaanchoruuid,
+        o_continue=False,
+        o_fallback_to_ldap=False,
+        **kwargs
+    ):
+        """
+        Delete an Group ID override.
+
+
+        :param a_idviewcn: ID View Name
+        :type  a_idviewcn: str
+        :param a_ipaanchoruuid: Anchor to override
+        :type  a_ipaanchoruuid: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        :param o_fallback_to_ldap: Allow falling back to AD DC LDAP when
+            resolving AD trusted objects. For two-way trusts only.
+        :type  o_fallback_to_ldap: bool
+        """
+        _args = [a_idviewcn, a_ipaanchoruuid]
+        _params = {'continue': o_continue}
+        if o_fallback_to_ldap is not None:
+            _params['fallback_to_ldap'] = o_fallback_to_ldap
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('idoverridegroup_del', _args, _params)
+
+    def idoverridegroup_find(
+        self,
+        a_idviewcn,
+        a_criteria=None,
+        o_ipaanchoruuid=None,
+        o_description=None,
+        o_cn=None,
+        o_gidnumber=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_fallback_to_ldap=False,
+        o_all=True,
+        o_raw=False,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for an Group ID override.
+
+
+        :param a_idviewcn: ID View Name
+        :type  a_idviewcn: str
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_ipaanchoruuid: Anchor to override
+        :type  o_ipaanchoruuid: str
+        :param o_description: Description
+        :type  o_description: str
+        :param o_cn: Group name
+        :type  o_cn: str
+        :param o_gidnumber: Group ID Number
+        :type  o_gidnumber: int, min value 1, max value 2147483647
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_fallback_to_ldap: Allow falling back to AD DC LDAP when
+            resolving AD trusted objects. For two-way trusts only.
+        :type  o_fallback_to_ldap: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("anchor")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_idviewcn, a_criteria]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_ipaanchoruuid is not None:
+            _params['ipaanchoruuid'] = o_ipaanchoruuid
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_gidnumber is not None:
+            _params['gidnumber'] = o_gidnumber
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_fallback_to_ldap is not None:
+            _params['fallback_to_ldap'] = o_fallback_to_ldap
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('idoverridegroup_find', _args, _params)
+
+    def idoverridegroup_mod(
+        self,
+        a_idviewcn,
+        a_ipaanchoruuid,
+        o_description=None,
+        o_cn=None,
+        o_gidnumber=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_fallback_to_ldap=False,
+        o_all=True,
+        o_raw=False,
+        o_rename=None,
+        **kwargs
+    ):
+        """
+        Modify an Group ID override.
+
+
+        :param a_idviewcn: ID View Name
+        :type  a_idviewcn: str
+        :param a_ipaanchoruuid: Anchor to override
+        :type  a_ipaanchoruuid: str
+        :param o_description: Description
+        :type  o_description: str
+        :param o_cn: Group name
+        :type  o_cn: str
+        :param o_gidnumber: Group ID Number
+        :type  o_gidnumber: int, min value 1, max value 2147483647
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_fallback_to_ldap: Allow falling back to AD DC LDAP when
+            resolving AD trusted objects. For two-way trusts only.
+        :type  o_fallback_to_ldap: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_rename: Rename the Group ID override object
+        :type  o_rename: str
+        """
+        _args = [a_idviewcn, a_ipaanchoruuid]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_gidnumber is not None:
+            _params['gidnumber'] = o_gidnumber
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if o_fallback_to_ldap is not None:
+            _params['fallback_to_ldap'] = o_fallback_to_ldap
+        if o_rename is not None:
+            _params['rename'] = o_rename
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('idoverridegroup_mod', _args, _params)
+
+    def idoverridegroup_show(
+        self,
+        a_idviewcn,
+        a_ipaanchoruuid,
+        o_rights=False,
+        o_fallback_to_ldap=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display information about an Group ID override.
+
+
+        :param a_idviewcn: ID View Name
+        :type  a_idviewcn: str
+        :param a_ipaanchoruuid: Anchor to override
+        :type  a_ipaanchoruuid: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_fallback_to_ldap: Allow falling back to AD DC LDAP when
+            resolving AD trusted objects. For two-way trusts only.
+        :type  o_fallback_to_ldap: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_idviewcn, a_ipaanchoruuid]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if o_fallback_to_ldap is not None:
+            _params['fallback_to_ldap'] = o_fallback_to_ldap
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('idoverridegroup_show', _args, _params)
+
+    def idoverrideuser_add(
+        self,
+        a_idviewcn,
+        a_ipaanchoruuid,
+        o_description=None,
+        o_uid=None,
+        o_uidnumber=None,
+        o_gecos=None,
+        o_gidnumber=None,
+        o_homedirectory=None,
+        o_loginshell=None,
+        o_ipaoriginaluid=None,
+        o_ipasshpubkey=None,
+        o_usercertificate=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_fallback_to_ldap=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Add a new User ID override.
+
+
+        :param a_idviewcn: ID View Name
+        :type  a_idviewcn: str
+        :param a_ipaanchoruuid: Anchor to override
+        :type  a_ipaanchoruuid: str
+        :param o_description: Description
+        :type  o_description: str
+        :param o_uid: User login
+        :type  o_uid: str
+        :param o_uidnumber: User ID Number
+        :type  o_uidnumber: int, min value 1, max value 2147483647
+        :param o_gecos: GECOS
+        :type  o_gecos: str
+        :param o_gidnumber: Group ID Number
+        :type  o_gidnumber: int, min value 1, max value 2147483647
+        :param o_homedirectory: Home directory
+        :type  o_homedirectory: str
+        :param o_loginshell: Login shell
+        :type  o_loginshell: str
+        :param o_ipaoriginaluid: <ipaoriginaluid>
+        :type  o_ipaoriginaluid: str
+        :param o_ipasshpubkey: SSH public key
+        :type  o_ipasshpubkey: str
+        :param o_usercertificate: Base-64 encoded user certificate
+        :type  o_usercertificate: Certificate
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_fallback_to_ldap: Allow falling back to AD DC LDAP when
+            resolving AD trusted objects. For two-way trusts only.
+        :type  o_fallback_to_ldap: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_idviewcn, a_ipaanchoruuid]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_uid is not None:
+            _params['uid'] = o_uid
+        if o_uidnumber is not None:
+            _params['uidnumber'] = o_uidnumber
+        if o_gecos is not None:
+            _params['gecos'] = o_gecos
+        if o_gidnumber is not None:
+            _params['gidnumber'] = o_gidnumber
+        if o_homedirectory is not None:
+            _params['homedirectory'] = o_homedirectory
+        if o_loginshell is not None:
+            _params['loginshell'] = o_loginshell
+        if o_ipaoriginaluid is not None:
+            _params['ipaoriginaluid'] = o_ipaoriginaluid
+        if o_ipasshpubkey is not None:
+            _params['ipasshpubkey'] = o_ipasshpubkey
+        if o_usercertificate is not None:
+            _params['usercertificate'] = o_usercertificate
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_fallback_to_ldap is not None:
+            _params['fallback_to_ldap'] = o_fallback_to_ldap
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('idoverrideuser_add', _args, _params)
+
+    def idoverrideuser_add_cert(
+        self,
+        a_idviewcn,
+        a_ipaanchoruuid,
+        o_usercertificate,
+        o_fallback_to_ldap=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Add one or more certificates to the idoverrideuser entry
+
+
+        :param a_idviewcn: ID View Name
+        :type  a_idviewcn: str
+        :param a_ipaanchoruuid: Anchor to override
+        :type  a_ipaanchoruuid: str
+        :param o_fallback_to_ldap: Allow falling back to AD DC LDAP when
+            resolving AD trusted objects. For two-way trusts only.
+        :type  o_fallback_to_ldap: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_usercertificate: Base-64 encoded user certificate
+        :type  o_usercertificate: Certificate
+        """
+        _args = [a_idviewcn, a_ipaanchoruuid]
+        _params = {'all': o_all, 'raw': o_raw, 'usercertificate': o_usercertificate}
+        if o_fallback_to_ldap is not None:
+            _params['fallback_to_ldap'] = o_fallback_to_ldap
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('idoverrideuser_add_cert', _args, _params)
+
+    def idoverrideuser_del(
+        self,
+        a_idviewcn,
+        a_ipaanchoruuid,
+        o_continue=False,
+        o_fallback_to_ldap=False,
+        **kwargs
+    ):
+        """
+        Delete an User ID override.
+
+
+        :param a_idviewcn: ID View Name
+        :type  a_idviewcn: str
+        :param a_ipaanchoruuid: Anchor to override
+        :type  a_ipaanchoruuid: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        :param o_fallback_to_ldap: Allow falling back to AD DC LDAP when
+            resolving AD trusted objects. For two-way trusts only.
+        :type  o_fallback_to_ldap: bool
+        """
+        _args = [a_idviewcn, a_ipaanchoruuid]
+        _params = {'continue': o_continue}
+        if o_fallback_to_ldap is not None:
+            _params['fallback_to_ldap'] = o_fallback_to_ldap
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('idoverrideuser_del', _args, _params)
+
+    def idoverrideuser_find(
+        self,
+        a_idviewcn,
+        a_criteria=None,
+        o_ipaanchoruuid=None,
+        o_description=None,
+        o_uid=None,
+        o_uidnumber=None,
+        o_gecos=None,
+        o_gidnumber=None,
+        o_homedirectory=None,
+        o_loginshell=None,
+        o_ipaoriginaluid=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_fallback_to_ldap=False,
+        o_all=True,
+        o_raw=False,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for an User ID override.
+
+
+        :param a_idviewcn: ID View Name
+        :type  a_idviewcn: str
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_ipaanchoruuid: Anchor to override
+        :type  o_ipaanchoruuid: str
+        :param o_description: Description
+        :type  o_description: str
+        :param o_uid: User login
+        :type  o_uid: str
+        :param o_uidnumber: User ID Number
+        :type  o_uidnumber: int, min value 1, max value 2147483647
+        :param o_gecos: GECOS
+        :type  o_gecos: str
+        :param o_gidnumber: Group ID Number
+        :type  o_gidnumber: int, min value 1, max value 2147483647
+        :param o_homedirectory: Home directory
+        :type  o_homedirectory: str
+        :param o_loginshell: Login shell
+        :type  o_loginshell: str
+        :param o_ipaoriginaluid: <ipaoriginaluid>
+        :type  o_ipaoriginaluid: str
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_fallback_to_ldap: Allow falling back to AD DC LDAP when
+            resolving AD trusted objects. For two-way trusts only.
+        :type  o_fallback_to_ldap: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("anchor")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_idviewcn, a_criteria]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_ipaanchoruuid is not None:
+            _params['ipaanchoruuid'] = o_ipaanchoruuid
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_uid is not None:
+            _params['uid'] = o_uid
+        if o_uidnumber is not None:
+            _params['uidnumber'] = o_uidnumber
+        if o_gecos is not None:
+            _params['gecos'] = o_gecos
+        if o_gidnumber is not None:
+            _params['gidnumber'] = o_gidnumber
+        if o_homedirectory is not None:
+            _params['homedirectory'] = o_homedirectory
+        if o_loginshell is not None:
+            _params['loginshell'] = o_loginshell
+        if o_ipaoriginaluid is not None:
+            _params['ipaoriginaluid'] = o_ipaoriginaluid
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_fallback_to_ldap is not None:
+            _params['fallback_to_ldap'] = o_fallback_to_ldap
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('idoverrideuser_find', _args, _params)
+
+    def idoverrideuser_mod(
+        self,
+        a_idviewcn,
+        a_ipaanchoruuid,
+        o_description=None,
+        o_uid=None,
+        o_uidnumber=None,
+        o_gecos=None,
+        o_gidnumber=None,
+        o_homedirectory=None,
+        o_loginshell=None,
+        o_ipaoriginaluid=None,
+        o_ipasshpubkey=None,
+        o_usercertificate=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_fallback_to_ldap=False,
+        o_all=True,
+        o_raw=False,
+        o_rename=None,
+        **kwargs
+    ):
+        """
+        Modify an User ID override.
+
+
+        :param a_idviewcn: ID View Name
+        :type  a_idviewcn: str
+        :param a_ipaanchoruuid: Anchor to override
+        :type  a_ipaanchoruuid: str
+        :param o_description: Description
+        :type  o_description: str
+        :param o_uid: User login
+        :type  o_uid: str
+        :param o_uidnumber: User ID Number
+        :type  o_uidnumber: int, min value 1, max value 2147483647
+        :param o_gecos: GECOS
+        :type  o_gecos: str
+        :param o_gidnumber: Group ID Number
+        :type  o_gidnumber: int, min value 1, max value 2147483647
+        :param o_homedirectory: Home directory
+        :type  o_homedirectory: str
+        :param o_loginshell: Login shell
+        :type  o_loginshell: str
+        :param o_ipaoriginaluid: <ipaoriginaluid>
+        :type  o_ipaoriginaluid: str
+        :param o_ipasshpubkey: SSH public key
+        :type  o_ipasshpubkey: str
+        :param o_usercertificate: Base-64 encoded user certificate
+        :type  o_usercertificate: Certificate
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_fallback_to_ldap: Allow falling back to AD DC LDAP when
+            resolving AD trusted objects. For two-way trusts only.
+        :type  o_fallback_to_ldap: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_rename: Rename the User ID override object
+        :type  o_rename: str
+        """
+        _args = [a_idviewcn, a_ipaanchoruuid]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_uid is not None:
+            _params['uid'] = o_uid
+        if o_uidnumber is not None:
+            _params['uidnumber'] = o_uidnumber
+        if o_gecos is not None:
+            _params['gecos'] = o_gecos
+        if o_gidnumber is not None:
+            _params['gidnumber'] = o_gidnumber
+        if o_homedirectory is not None:
+            _params['homedirectory'] = o_homedirectory
+        if o_loginshell is not None:
+            _params['loginshell'] = o_loginshell
+        if o_ipaoriginaluid is not None:
+            _params['ipaoriginaluid'] = o_ipaoriginaluid
+        if o_ipasshpubkey is not None:
+            _params['ipasshpubkey'] = o_ipasshpubkey
+        if o_usercertificate is not None:
+            _params['usercertificate'] = o_usercertificate
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if o_fallback_to_ldap is not None:
+            _params['fallback_to_ldap'] = o_fallback_to_ldap
+        if o_rename is not None:
+            _params['rename'] = o_rename
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('idoverrideuser_mod', _args, _params)
+
+    def idoverrideuser_remove_cert(
+        self,
+        a_idviewcn,
+        a_ipaanchoruuid,
+        o_usercertificate,
+        o_fallback_to_ldap=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Remove one or more certificates to the idoverrideuser entry
+
+
+        :param a_idviewcn: ID View Name
+        :type  a_idviewcn: str
+        :param a_ipaanchoruuid: Anchor to override
+        :type  a_ipaanchoruuid: str
+        :param o_fallback_to_ldap: Allow falling back to AD DC LDAP when
+            resolving AD trusted objects. For two-way trusts only.
+        :type  o_fallback_to_ldap: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_usercertificate: Base-64 encoded user certificate
+        :type  o_usercertificate: Certificate
+        """
+        _args = [a_idviewcn, a_ipaanchoruuid]
+        _params = {'all': o_all, 'raw': o_raw, 'usercertificate': o_usercertificate}
+        if o_fallback_to_ldap is not None:
+            _params['fallback_to_ldap'] = o_fallback_to_ldap
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('idoverrideuser_remove_cert', _args, _params)
+
+    def idoverrideuser_show(
+        self,
+        a_idviewcn,
+        a_ipaanchoruuid,
+        o_rights=False,
+        o_fallback_to_ldap=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display information about an User ID override.
+
+
+        :param a_idviewcn: ID View Name
+        :type  a_idviewcn: str
+        :param a_ipaanchoruuid: Anchor to override
+        :type  a_ipaanchoruuid: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_fallback_to_ldap: Allow falling back to AD DC LDAP when
+            resolving AD trusted objects. For two-way trusts only.
+        :type  o_fallback_to_ldap: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_idviewcn, a_ipaanchoruuid]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if o_fallback_to_ldap is not None:
+            _params['fallback_to_ldap'] = o_fallback_to_ldap
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('idoverrideuser_show', _args, _params)
@@ -0,0 +1,332 @@
+class Commands(object):
+
+    def idrange_add(
+        self,
+        a_cn,
+        o_ipabaseid,
+        o_ipaidrangesize,
+        o_ipabaserid=None,
+        o_ipasecondarybaserid=None,
+        o_ipanttrusteddomainsid=None,
+        o_ipanttrusteddomainname=None,
+        o_iparangetype=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+            Add new ID range.
+
+            To add a new ID range you always have to specify
+
+                --base-id
+                --range-size
+
+            Additionally
+
+                --rid-base
+                --secondary-rid-base
+
+            may be given for a new ID range for the local domain while
+
+                --rid-base
+                --dom-sid
+
+            must be given to add a new range for a trusted AD domain.
+
+        =======
+        WARNING:
+
+        DNA plugin in 389-ds will allocate IDs based on the ranges configured for the
+        local domain. Currently the DNA plugin *cannot* be reconfigured itself based
+        on the local ranges set via this family of commands.
+
+        Manual configuration change has to be done in the DNA plugin configuration for
+        the new local range. Specifically, The dnaNextRange attribute of 'cn=Posix
+        IDs,cn=Distributed Numeric Assignment Plugin,cn=plugins,cn=config' has to be
+        modified to match the new range.
+        =======
+
+
+        :param a_cn: Range name
+        :type  a_cn: str
+        :param o_ipabaseid: First Posix ID of the range
+        :type  o_ipabaseid: int, min value -2147483648, max value 2147483647
+        :param o_ipaidrangesize: Number of IDs in the range
+        :type  o_ipaidrangesize: int, min value -2147483648, max value 2147483647
+        :param o_ipabaserid: First RID of the corresponding RID range
+        :type  o_ipabaserid: int, min value -2147483648, max value 2147483647
+        :param o_ipasecondarybaserid: First RID of the secondary RID range
+        :type  o_ipasecondarybaserid: int, min value -2147483648, max value 2147483647
+        :param o_ipanttrusteddomainsid: Domain SID of the trusted domain
+        :type  o_ipanttrusteddomainsid: str
+        :param o_ipanttrusteddomainname: Name of the trusted domain
+        :type  o_ipanttrusteddomainname: str
+        :param o_iparangetype: ID range type, one of allowed values
+        :type  o_iparangetype: str, valid values ['ipa-ad-trust', 'ipa-ad-trust-posix', 'ipa-local']
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'ipabaseid': o_ipabaseid,
+            'ipaidrangesize': o_ipaidrangesize,
+            'all': o_all,
+            'raw': o_raw,
+        }
+        if o_ipabaserid is not None:
+            _params['ipabaserid'] = o_ipabaserid
+        if o_ipasecondarybaserid is not None:
+            _params['ipasecondarybaserid'] = o_ipasecondarybaserid
+        if o_ipanttrusteddomainsid is not None:
+            _params['ipanttrusteddomainsid'] = o_ipanttrusteddomainsid
+        if o_ipanttrusteddomainname is not None:
+            _params['ipanttrusteddomainname'] = o_ipanttrusteddomainname
+        if o_iparangetype is not None:
+            _params['iparangetype'] = o_iparangetype
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('idrange_add', _args, _params)
+
+    def idrange_del(
+        self,
+        a_cn,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete an ID range.
+
+
+        :param a_cn: Range name
+        :type  a_cn: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_cn]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('idrange_del', _args, _params)
+
+    def idrange_find(
+        self,
+        a_criteria=None,
+        o_cn=None,
+        o_ipabaseid=None,
+        o_ipaidrangesize=None,
+        o_ipabaserid=None,
+        o_ipasecondarybaserid=None,
+        o_ipanttrusteddomainsid=None,
+        o_iparangetype=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for ranges.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_cn: Range name
+        :type  o_cn: str
+        :param o_ipabaseid: First Posix ID of the range
+        :type  o_ipabaseid: int, min value -2147483648, max value 2147483647
+        :param o_ipaidrangesize: Number of IDs in the range
+        :type  o_ipaidrangesize: int, min value -2147483648, max value 2147483647
+        :param o_ipabaserid: First RID of the corresponding RID range
+        :type  o_ipabaserid: int, min value -2147483648, max value 2147483647
+        :param o_ipasecondarybaserid: First RID of the secondary RID range
+        :type  o_ipasecondarybaserid: int, min value -2147483648, max value 2147483647
+        :param o_ipanttrusteddomainsid: Domain SID of the trusted domain
+        :type  o_ipanttrusteddomainsid: str
+        :param o_iparangetype: ID range type, one of allowed values
+        :type  o_iparangetype: str, valid values ['ipa-ad-trust', 'ipa-ad-trust-posix', 'ipa-local']
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("name")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_ipabaseid is not None:
+            _params['ipabaseid'] = o_ipabaseid
+        if o_ipaidrangesize is not None:
+            _params['ipaidrangesize'] = o_ipaidrangesize
+        if o_ipabaserid is not None:
+            _params['ipabaserid'] = o_ipabaserid
+        if o_ipasecondarybaserid is not None:
+            _params['ipasecondarybaserid'] = o_ipasecondarybaserid
+        if o_ipanttrusteddomainsid is not None:
+            _params['ipanttrusteddomainsid'] = o_ipanttrusteddomainsid
+        if o_iparangetype is not None:
+            _params['iparangetype'] = o_iparangetype
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('idrange_find', _args, _params)
+
+    def idrange_mod(
+        self,
+        a_cn,
+        o_ipabaseid=None,
+        o_ipaidrangesize=None,
+        o_ipabaserid=None,
+        o_ipasecondarybaserid=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_ipanttrusteddomainsid=None,
+        o_ipanttrusteddomainname=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Modify ID range.
+
+        =======
+        WARNING:
+
+        DNA plugin in 389-ds will allocate IDs based on the ranges configured for the
+        local domain. Currently the DNA plugin *cannot* be reconfigured itself based
+        on the local ranges set via this family of commands.
+
+        Manual configuration change has to be done in the DNA plugin configuration for
+        the new local range. Specifically, The dnaNextRange attribute of 'cn=Posix
+        IDs,cn=Distributed Numeric Assignment Plugin,cn=plugins,cn=config' has to be
+        modified to match the new range.
+        =======
+
+
+        :param a_cn: Range name
+        :type  a_cn: str
+        :param o_ipabaseid: First Posix ID of the range
+        :type  o_ipabaseid: int, min value -2147483648, max value 2147483647
+        :param o_ipaidrangesize: Number of IDs in the range
+        :type  o_ipaidrangesize: int, min value -2147483648, max value 2147483647
+        :param o_ipabaserid: First RID of the corresponding RID range
+        :type  o_ipabaserid: int, min value -2147483648, max value 2147483647
+        :param o_ipasecondarybaserid: First RID of the secondary RID range
+        :type  o_ipasecondarybaserid: int, min value -2147483648, max value 2147483647
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_ipanttrusteddomainsid: Domain SID of the trusted domain
+        :type  o_ipanttrusteddomainsid: str
+        :param o_ipanttrusteddomainname: Name of the trusted domain
+        :type  o_ipanttrusteddomainname: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if o_ipabaseid is not None:
+            _params['ipabaseid'] = o_ipabaseid
+        if o_ipaidrangesize is not None:
+            _params['ipaidrangesize'] = o_ipaidrangesize
+        if o_ipabaserid is not None:
+            _params['ipabaserid'] = o_ipabaserid
+        if o_ipasecondarybaserid is not None:
+            _params['ipasecondarybaserid'] = o_ipasecondarybaserid
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if o_ipanttrusteddomainsid is not None:
+            _params['ipanttrusteddomainsid'] = o_ipanttrusteddomainsid
+        if o_ipanttrusteddomainname is not None:
+            _params['ipanttrusteddomainname'] = o_ipanttrusteddomainname
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('idrange_mod', _args, _params)
+
+    def idrange_show(
+        self,
+        a_cn,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display information about a range.
+
+
+        :param a_cn: Range name
+        :type  a_cn: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('idrange_show', _args, _params)
@@ -0,0 +1,289 @@
+class Commands(object):
+
+    def idview_add(
+        self,
+        a_cn,
+        o_description=None,
+        o_ipadomainresolutionorder=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Add a new ID View.
+
+
+        :param a_cn: ID View Name
+        :type  a_cn: str
+        :param o_description: Description
+        :type  o_description: str
+        :param o_ipadomainresolutionorder: colon-separated list of domains
+            used for short name qualification
+        :type  o_ipadomainresolutionorder: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipadomainresolutionorder is not None:
+            _params['ipadomainresolutionorder'] = o_ipadomainresolutionorder
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('idview_add', _args, _params)
+
+    def idview_apply(
+        self,
+        a_cn,
+        o_host=None,
+        o_hostgroup=None,
+        **kwargs
+    ):
+        """
+        Applies ID View to specified hosts or current members of specified hostgroups. If any other ID View is applied to the host, it is overridden.
+
+
+        :param a_cn: ID View Name
+        :type  a_cn: str
+        :param o_host: Hosts to apply the ID View to
+        :type  o_host: str
+        :param o_hostgroup: Hostgroups to whose hosts apply the ID View to.
+            Please note that view is not applied automatically to any hosts added
+            to the hostgroup after running the idview-apply command.
+        :type  o_hostgroup: str
+        """
+        _args = [a_cn]
+        _params = {}
+        if o_host is not None:
+            _params['host'] = o_host
+        if o_hostgroup is not None:
+            _params['hostgroup'] = o_hostgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('idview_apply', _args, _params)
+
+    def idview_del(
+        self,
+        a_cn,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete an ID View.
+
+
+        :param a_cn: ID View Name
+        :type  a_cn: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_cn]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('idview_del', _args, _params)
+
+    def idview_find(
+        self,
+        a_criteria=None,
+        o_cn=None,
+        o_description=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for an ID View.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_cn: ID View Name
+        :type  o_cn: str
+        :param o_description: Description
+        :type  o_description: str
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("name")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('idview_find', _args, _params)
+
+    def idview_mod(
+        self,
+        a_cn,
+        o_description=None,
+        o_ipadomainresolutionorder=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_rename=None,
+        **kwargs
+    ):
+        """
+        Modify an ID View.
+
+
+        :param a_cn: ID View Name
+        :type  a_cn: str
+        :param o_description: Description
+        :type  o_description: str
+        :param o_ipadomainresolutionorder: colon-separated list of domains
+            used for short name qualification
+        :type  o_ipadomainresolutionorder: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_rename: Rename the ID View object
+        :type  o_rename: str
+        """
+        _args = [a_cn]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipadomainresolutionorder is not None:
+            _params['ipadomainresolutionorder'] = o_ipadomainresolutionorder
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if o_rename is not None:
+            _params['rename'] = o_rename
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('idview_mod', _args, _params)
+
+    def idview_show(
+        self,
+        a_cn,
+        o_rights=False,
+        o_show_hosts=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display information about an ID View.
+
+
+        :param a_cn: ID View Name
+        :type  a_cn: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_show_hosts: Enumerate all the hosts the view applies to.
+        :type  o_show_hosts: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if o_show_hosts is not None:
+            _params['show_hosts'] = o_show_hosts
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('idview_show', _args, _params)
+
+    def idview_unapply(
+        self,
+        o_host=None,
+        o_hostgroup=None,
+        **kwargs
+    ):
+        """
+        Clears ID View from specified hosts or current members of specified hostgroups.
+
+
+        :param o_host: Hosts to clear (any) ID View from.
+        :type  o_host: str
+        :param o_hostgroup: Hostgroups whose hosts should have ID Views
+            cleared. Note that view is not cleared automatically from any host
+            added to the hostgroup after running idview-unapply command.
+        :type  o_hostgroup: str
+        """
+        _args = []
+        _params = {}
+        if o_host is not None:
+            _params['host'] = o_host
+        if o_hostgroup is not None:
+            _params['hostgroup'] = o_hostgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('idview_unapply', _args, _params)
@@ -0,0 +1,35 @@
+class Commands(object):
+
+    def join(
+        self,
+        a_cn,
+        o_realm,
+        o_nshardwareplatform=None,
+        o_nsosversion=None,
+        **kwargs
+    ):
+        """
+        Join an IPA domain
+
+
+        :param a_cn: The hostname to register as
+        :type  a_cn: str
+        :param o_realm: The IPA realm
+        :type  o_realm: str
+        :param o_nshardwareplatform: Hardware platform of the host (e.g.
+            Lenovo T61)
+        :type  o_nshardwareplatform: str
+        :param o_nsosversion: Operating System and version of the host (e.g.
+            Fedora 9)
+        :type  o_nsosversion: str
+        """
+        _args = [a_cn]
+        _params = {'realm': o_realm}
+        if o_nshardwareplatform is not None:
+            _params['nshardwareplatform'] = o_nshardwareplatform
+        if o_nsosversion is not None:
+            _params['nsosversion'] = o_nsosversion
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('join', _args, _params)
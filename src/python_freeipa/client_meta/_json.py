@@ -0,0 +1,38 @@
+class Commands(object):
+
+    def json_metadata(
+        self,
+        a_objname=None,
+        a_methodname=None,
+        o_object=None,
+        o_method=None,
+        o_command=None,
+        **kwargs
+    ):
+        """
+        Export plugin meta-data for the webUI.
+
+
+        :param a_objname: Name of object to export
+        :type  a_objname: str
+        :param a_methodname: Name of method to export
+        :type  a_methodname: str
+        :param o_object: Name of object to export
+        :type  o_object: str
+        :param o_method: Name of method to export
+        :type  o_method: str
+        :param o_command: Name of command to export
+        :type  o_command: str
+        """
+        _args = [a_objname, a_methodname]
+        _params = {}
+        if o_object is not None:
+            _params['object'] = o_object
+        if o_method is not None:
+            _params['method'] = o_method
+        if o_command is not None:
+            _params['command'] = o_command
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('json_metadata', _args, _params)
@@ -0,0 +1,17 @@
+class Commands(object):
+
+    def kra_is_enabled(
+        self,
+        **kwargs
+    ):
+        """
+        Checks if any of the servers has the KRA service enabled
+
+
+        """
+        _args = []
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('kra_is_enabled', _args, _params)
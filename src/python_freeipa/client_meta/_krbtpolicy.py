@@ -0,0 +1,167 @@
+class Commands(object):
+
+    def krbtpolicy_mod(
+        self,
+        a_uid=None,
+        o_krbmaxticketlife=None,
+        o_krbmaxrenewableage=None,
+        o_krbauthindmaxticketlife_otp=None,
+        o_krbauthindmaxrenewableage_otp=None,
+        o_krbauthindmaxticketlife_radius=None,
+        o_krbauthindmaxrenewableage_radius=None,
+        o_krbauthindmaxticketlife_pkinit=None,
+        o_krbauthindmaxrenewableage_pkinit=None,
+        o_krbauthindmaxticketlife_hardened=None,
+        o_krbauthindmaxrenewableage_hardened=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Modify Kerberos ticket policy.
+
+
+        :param a_uid: Manage ticket policy for specific user
+        :type  a_uid: str
+        :param o_krbmaxticketlife: Maximum ticket life (seconds)
+        :type  o_krbmaxticketlife: int, min value 1, max value 2147483647
+        :param o_krbmaxrenewableage: Maximum renewable age (seconds)
+        :type  o_krbmaxrenewableage: int, min value 1, max value 2147483647
+        :param o_krbauthindmaxticketlife_otp: OTP token maximum ticket life
+            (seconds)
+        :type  o_krbauthindmaxticketlife_otp: int, min value 1, max value 2147483647
+        :param o_krbauthindmaxrenewableage_otp: OTP token ticket maximum
+            renewable age (seconds)
+        :type  o_krbauthindmaxrenewableage_otp: int, min value 1, max value 2147483647
+        :param o_krbauthindmaxticketlife_radius: RADIUS maximum ticket life
+            (seconds)
+        :type  o_krbauthindmaxticketlife_radius: int, min value 1, max value 2147483647
+        :param o_krbauthindmaxrenewableage_radius: RADIUS ticket maximum
+            renewable age (seconds)
+        :type  o_krbauthindmaxrenewableage_radius: int, min value 1, max value 2147483647
+        :param o_krbauthindmaxticketlife_pkinit: PKINIT maximum ticket life
+            (seconds)
+        :type  o_krbauthindmaxticketlife_pkinit: int, min value 1, max value 2147483647
+        :param o_krbauthindmaxrenewableage_pkinit: PKINIT ticket maximum
+            renewable age (seconds)
+        :type  o_krbauthindmaxrenewableage_pkinit: int, min value 1, max value 2147483647
+        :param o_krbauthindmaxticketlife_hardened: Hardened ticket maximum
+            ticket life (seconds)
+        :type  o_krbauthindmaxticketlife_hardened: int, min value 1, max value 2147483647
+        :param o_krbauthindmaxrenewableage_hardened: Hardened ticket maximum
+            renewable age (seconds)
+        :type  o_krbauthindmaxrenewableage_hardened: int, min value 1, max value 2147483647
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_uid]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if o_krbmaxticketlife is not None:
+            _params['krbmaxticketlife'] = o_krbmaxticketlife
+        if o_krbmaxrenewableage is not None:
+            _params['krbmaxrenewableage'] = o_krbmaxrenewableage
+        if o_krbauthindmaxticketlife_otp is not None:
+            _params['krbauthindmaxticketlife_otp'] = o_krbauthindmaxticketlife_otp
+        if o_krbauthindmaxrenewableage_otp is not None:
+            _params['krbauthindmaxrenewableage_otp'] = o_krbauthindmaxrenewableage_otp
+        if o_krbauthindmaxticketlife_radius is not None:
+            _params['krbauthindmaxticketlife_radius'] = o_krbauthindmaxticketlife_radius
+        if o_krbauthindmaxrenewableage_radius is not None:
+            _params['krbauthindmaxrenewableage_radius'] = o_krbauthindmaxrenewableage_radius
+        if o_krbauthindmaxticketlife_pkinit is not None:
+            _params['krbauthindmaxticketlife_pkinit'] = o_krbauthindmaxticketlife_pkinit
+        if o_krbauthindmaxrenewableage_pkinit is not None:
+            _params['krbauthindmaxrenewableage_pkinit'] = o_krbauthindmaxrenewableage_pkinit
+        if o_krbauthindmaxticketlife_hardened is not None:
+            _params['krbauthindmaxticketlife_hardened'] = o_krbauthindmaxticketlife_hardened
+        if o_krbauthindmaxrenewableage_hardened is not None:
+            _params['krbauthindmaxrenewableage_hardened'] = o_krbauthindmaxrenewableage_hardened
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('krbtpolicy_mod', _args, _params)
+
+    def krbtpolicy_reset(
+        self,
+        a_uid=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Reset Kerberos ticket policy to the default values.
+
+
+        :param a_uid: Manage ticket policy for specific user
+        :type  a_uid: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_uid]
+        _params = {'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('krbtpolicy_reset', _args, _params)
+
+    def krbtpolicy_show(
+        self,
+        a_uid=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display the current Kerberos ticket policy.
+
+
+        :param a_uid: Manage ticket policy for specific user
+        :type  a_uid: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_uid]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('krbtpolicy_show', _args, _params)
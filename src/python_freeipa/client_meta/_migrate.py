@@ -0,0 +1,126 @@
+class Commands(object):
+
+    def migrate_ds(
+        self,
+        a_ldapuri,
+        a_bindpw,
+        o_binddn='cn=directory manager',
+        o_usercontainer='ou=people',
+        o_groupcontainer='ou=groups',
+        o_userobjectclass=None,
+        o_groupobjectclass=None,
+        o_userignoreobjectclass=None,
+        o_userignoreattribute=None,
+        o_groupignoreobjectclass=None,
+        o_groupignoreattribute=None,
+        o_groupoverwritegid=False,
+        o_schema='RFC2307bis',
+        o_continue=False,
+        o_basedn=None,
+        o_compat=False,
+        o_cacertfile=None,
+        o_use_def_group=True,
+        o_scope='onelevel',
+        o_exclude_users=None,
+        o_exclude_groups=None,
+        **kwargs
+    ):
+        """
+        Migrate users and groups from DS to IPA.
+
+
+        :param a_ldapuri: LDAP URI of DS server to migrate from
+        :type  a_ldapuri: str
+        :param a_bindpw: bind password
+        :type  a_bindpw: Password
+        :param o_binddn: Bind DN
+        :type  o_binddn: DNParam
+        :param o_usercontainer: DN of container for users in DS relative to
+            base DN
+        :type  o_usercontainer: DNParam
+        :param o_groupcontainer: DN of container for groups in DS relative to
+            base DN
+        :type  o_groupcontainer: DNParam
+        :param o_userobjectclass: Objectclasses used to search for user
+            entries in DS
+        :type  o_userobjectclass: str
+        :param o_groupobjectclass: Objectclasses used to search for group
+            entries in DS
+        :type  o_groupobjectclass: str
+        :param o_userignoreobjectclass: Objectclasses to be ignored for user
+            entries in DS
+        :type  o_userignoreobjectclass: str
+        :param o_userignoreattribute: Attributes to be ignored for user
+            entries in DS
+        :type  o_userignoreattribute: str
+        :param o_groupignoreobjectclass: Objectclasses to be ignored for group
+            entries in DS
+        :type  o_groupignoreobjectclass: str
+        :param o_groupignoreattribute: Attributes to be ignored for group
+            entries in DS
+        :type  o_groupignoreattribute: str
+        :param o_groupoverwritegid: When migrating a group already existing in
+            IPA domain overwrite the group GID and report as success
+        :type  o_groupoverwritegid: bool
+        :param o_schema: The schema used on the LDAP server. Supported values
+            are RFC2307 and RFC2307bis. The default is RFC2307bis
+        :type  o_schema: str, valid values ['RFC2307bis', 'RFC2307']
+        :param o_continue: Continuous operation mode. Errors are reported but
+            the process continues
+        :type  o_continue: bool
+        :param o_basedn: Base DN on remote LDAP server
+        :type  o_basedn: DNParam
+        :param o_compat: Allows migration despite the usage of compat plugin
+        :type  o_compat: bool
+        :param o_cacertfile: Load CA certificate of LDAP server from FILE
+        :type  o_cacertfile: str
+        :param o_use_def_group: Add migrated users without a group to a
+            default group (default: true)
+        :type  o_use_def_group: Bool
+        :param o_scope: LDAP search scope for users and groups: base,
+            onelevel, or subtree. Defaults to onelevel
+        :type  o_scope: str, valid values ['base', 'onelevel', 'subtree']
+        :param o_exclude_users: users to exclude from migration
+        :type  o_exclude_users: str
+        :param o_exclude_groups: groups to exclude from migration
+        :type  o_exclude_groups: str
+        """
+        _args = [a_ldapuri, a_bindpw]
+        _params = {
+            'usercontainer': o_usercontainer,
+            'groupcontainer': o_groupcontainer,
+            'userobjectclass': o_userobjectclass,
+            'groupobjectclass': o_groupobjectclass,
+            'groupoverwritegid': o_groupoverwritegid,
+            'scope': o_scope,
+        }
+        if o_binddn is not None:
+            _params['binddn'] = o_binddn
+        if o_userignoreobjectclass is not None:
+            _params['userignoreobjectclass'] = o_userignoreobjectclass
+        if o_userignoreattribute is not None:
+            _params['userignoreattribute'] = o_userignoreattribute
+        if o_groupignoreobjectclass is not None:
+            _params['groupignoreobjectclass'] = o_groupignoreobjectclass
+        if o_groupignoreattribute is not None:
+            _params['groupignoreattribute'] = o_groupignoreattribute
+        if o_schema is not None:
+            _params['schema'] = o_schema
+        if o_continue is not None:
+            _params['continue'] = o_continue
+        if o_basedn is not None:
+            _params['basedn'] = o_basedn
+        if o_compat is not None:
+            _params['compat'] = o_compat
+        if o_cacertfile is not None:
+            _params['cacertfile'] = o_cacertfile
+        if o_use_def_group is not None:
+            _params['use_def_group'] = o_use_def_group
+        if o_exclude_users is not None:
+            _params['exclude_users'] = o_exclude_users
+        if o_exclude_groups is not None:
+            _params['exclude_groups'] = o_exclude_groups
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('migrate_ds', _args, _params)
@@ -0,0 +1,482 @@
+class Commands(object):
+
+    def netgroup_add(
+        self,
+        a_cn,
+        o_description=None,
+        o_nisdomainname=None,
+        o_usercategory=None,
+        o_hostcategory=None,
+        o_externalhost=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Add a new netgroup.
+
+
+        :param a_cn: Netgroup name
+        :type  a_cn: str
+        :param o_description: Netgroup description
+        :type  o_description: str
+        :param o_nisdomainname: NIS domain name
+        :type  o_nisdomainname: str
+        :param o_usercategory: User category the rule applies to
+        :type  o_usercategory: str, valid values ['all']
+        :param o_hostcategory: Host category the rule applies to
+        :type  o_hostcategory: str, valid values ['all']
+        :param o_externalhost: External host
+        :type  o_externalhost: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_nisdomainname is not None:
+            _params['nisdomainname'] = o_nisdomainname
+        if o_usercategory is not None:
+            _params['usercategory'] = o_usercategory
+        if o_hostcategory is not None:
+            _params['hostcategory'] = o_hostcategory
+        if o_externalhost is not None:
+            _params['externalhost'] = o_externalhost
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('netgroup_add', _args, _params)
+
+    def netgroup_add_member(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        o_host=None,
+        o_hostgroup=None,
+        o_netgroup=None,
+        **kwargs
+    ):
+        """
+        Add members to a netgroup.
+
+
+        :param a_cn: Netgroup name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to add
+        :type  o_user: str
+        :param o_group: groups to add
+        :type  o_group: str
+        :param o_host: hosts to add
+        :type  o_host: str
+        :param o_hostgroup: host groups to add
+        :type  o_hostgroup: str
+        :param o_netgroup: netgroups to add
+        :type  o_netgroup: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if o_host is not None:
+            _params['host'] = o_host
+        if o_hostgroup is not None:
+            _params['hostgroup'] = o_hostgroup
+        if o_netgroup is not None:
+            _params['netgroup'] = o_netgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('netgroup_add_member', _args, _params)
+
+    def netgroup_del(
+        self,
+        a_cn,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete a netgroup.
+
+
+        :param a_cn: Netgroup name
+        :type  a_cn: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_cn]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('netgroup_del', _args, _params)
+
+    def netgroup_find(
+        self,
+        a_criteria=None,
+        o_cn=None,
+        o_description=None,
+        o_nisdomainname=None,
+        o_ipauniqueid=None,
+        o_usercategory=None,
+        o_hostcategory=None,
+        o_externalhost=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_private=False,
+        o_managed=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=True,
+        o_pkey_only=False,
+        o_netgroup=None,
+        o_no_netgroup=None,
+        o_user=None,
+        o_no_user=None,
+        o_group=None,
+        o_no_group=None,
+        o_host=None,
+        o_no_host=None,
+        o_hostgroup=None,
+        o_no_hostgroup=None,
+        o_in_netgroup=None,
+        o_not_in_netgroup=None,
+        **kwargs
+    ):
+        """
+        Search for a netgroup.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_cn: Netgroup name
+        :type  o_cn: str
+        :param o_description: Netgroup description
+        :type  o_description: str
+        :param o_nisdomainname: NIS domain name
+        :type  o_nisdomainname: str
+        :param o_ipauniqueid: IPA unique ID
+        :type  o_ipauniqueid: str
+        :param o_usercategory: User category the rule applies to
+        :type  o_usercategory: str, valid values ['all']
+        :param o_hostcategory: Host category the rule applies to
+        :type  o_hostcategory: str, valid values ['all']
+        :param o_externalhost: External host
+        :type  o_externalhost: str
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_private: <private>
+        :type  o_private: bool
+        :param o_managed: search for managed groups
+        :type  o_managed: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("name")
+        :type  o_pkey_only: bool
+        :param o_netgroup: Search for netgroups with these member netgroups.
+        :type  o_netgroup: str
+        :param o_no_netgroup: Search for netgroups without these member
+            netgroups.
+        :type  o_no_netgroup: str
+        :param o_user: Search for netgroups with these member users.
+        :type  o_user: str
+        :param o_no_user: Search for netgroups without these member users.
+        :type  o_no_user: str
+        :param o_group: Search for netgroups with these member groups.
+        :type  o_group: str
+        :param o_no_group: Search for netgroups without these member groups.
+        :type  o_no_group: str
+        :param o_host: Search for netgroups with these member hosts.
+        :type  o_host: str
+        :param o_no_host: Search for netgroups without these member hosts.
+        :type  o_no_host: str
+        :param o_hostgroup: Search for netgroups with these member host
+            groups.
+        :type  o_hostgroup: str
+        :param o_no_hostgroup: Search for netgroups without these member host
+            groups.
+        :type  o_no_hostgroup: str
+        :param o_in_netgroup: Search for netgroups with these member of
+            netgroups.
+        :type  o_in_netgroup: str
+        :param o_not_in_netgroup: Search for netgroups without these member of
+            netgroups.
+        :type  o_not_in_netgroup: str
+        """
+        _args = [a_criteria]
+        _params = {
+            'private': o_private,
+            'managed': o_managed,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_nisdomainname is not None:
+            _params['nisdomainname'] = o_nisdomainname
+        if o_ipauniqueid is not None:
+            _params['ipauniqueid'] = o_ipauniqueid
+        if o_usercategory is not None:
+            _params['usercategory'] = o_usercategory
+        if o_hostcategory is not None:
+            _params['hostcategory'] = o_hostcategory
+        if o_externalhost is not None:
+            _params['externalhost'] = o_externalhost
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if o_netgroup is not None:
+            _params['netgroup'] = o_netgroup
+        if o_no_netgroup is not None:
+            _params['no_netgroup'] = o_no_netgroup
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_no_user is not None:
+            _params['no_user'] = o_no_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if o_no_group is not None:
+            _params['no_group'] = o_no_group
+        if o_host is not None:
+            _params['host'] = o_host
+        if o_no_host is not None:
+            _params['no_host'] = o_no_host
+        if o_hostgroup is not None:
+            _params['hostgroup'] = o_hostgroup
+        if o_no_hostgroup is not None:
+            _params['no_hostgroup'] = o_no_hostgroup
+        if o_in_netgroup is not None:
+            _params['in_netgroup'] = o_in_netgroup
+        if o_not_in_netgroup is not None:
+            _params['not_in_netgroup'] = o_not_in_netgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('netgroup_find', _args, _params)
+
+    def netgroup_mod(
+        self,
+        a_cn,
+        o_description=None,
+        o_nisdomainname=None,
+        o_usercategory=None,
+        o_hostcategory=None,
+        o_externalhost=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Modify a netgroup.
+
+
+        :param a_cn: Netgroup name
+        :type  a_cn: str
+        :param o_description: Netgroup description
+        :type  o_description: str
+        :param o_nisdomainname: NIS domain name
+        :type  o_nisdomainname: str
+        :param o_usercategory: User category the rule applies to
+        :type  o_usercategory: str, valid values ['all']
+        :param o_hostcategory: Host category the rule applies to
+        :type  o_hostcategory: str, valid values ['all']
+        :param o_externalhost: External host
+        :type  o_externalhost: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_nisdomainname is not None:
+            _params['nisdomainname'] = o_nisdomainname
+        if o_usercategory is not None:
+            _params['usercategory'] = o_usercategory
+        if o_hostcategory is not None:
+            _params['hostcategory'] = o_hostcategory
+        if o_externalhost is not None:
+            _params['externalhost'] = o_externalhost
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('netgroup_mod', _args, _params)
+
+    def netgroup_remove_member(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        o_host=None,
+        o_hostgroup=None,
+        o_netgroup=None,
+        **kwargs
+    ):
+        """
+        Remove members from a netgroup.
+
+
+        :param a_cn: Netgroup name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to remove
+        :type  o_user: str
+        :param o_group: groups to remove
+        :type  o_group: str
+        :param o_host: hosts to remove
+        :type  o_host: str
+        :param o_hostgroup: host groups to remove
+        :type  o_hostgroup: str
+        :param o_netgroup: netgroups to remove
+        :type  o_netgroup: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if o_host is not None:
+            _params['host'] = o_host
+        if o_hostgroup is not None:
+            _params['hostgroup'] = o_hostgroup
+        if o_netgroup is not None:
+            _params['netgroup'] = o_netgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('netgroup_remove_member', _args, _params)
+
+    def netgroup_show(
+        self,
+        a_cn,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Display information about a netgroup.
+
+
+        :param a_cn: Netgroup name
+        :type  a_cn: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('netgroup_show', _args, _params)
@@ -0,0 +1,587 @@
+class Commands(object):
+
+    def otpconfig_mod(
+        self,
+        o_ipatokentotpauthwindow=None,
+        o_ipatokentotpsyncwindow=None,
+        o_ipatokenhotpauthwindow=None,
+        o_ipatokenhotpsyncwindow=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Modify OTP configuration options.
+
+
+        :param o_ipatokentotpauthwindow: TOTP authentication time variance
+            (seconds)
+        :type  o_ipatokentotpauthwindow: int, min value 5, max value 2147483647
+        :param o_ipatokentotpsyncwindow: TOTP synchronization time variance
+            (seconds)
+        :type  o_ipatokentotpsyncwindow: int, min value 5, max value 2147483647
+        :param o_ipatokenhotpauthwindow: HOTP authentication skip-ahead
+        :type  o_ipatokenhotpauthwindow: int, min value 1, max value 2147483647
+        :param o_ipatokenhotpsyncwindow: HOTP synchronization skip-ahead
+        :type  o_ipatokenhotpsyncwindow: int, min value 1, max value 2147483647
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = []
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if o_ipatokentotpauthwindow is not None:
+            _params['ipatokentotpauthwindow'] = o_ipatokentotpauthwindow
+        if o_ipatokentotpsyncwindow is not None:
+            _params['ipatokentotpsyncwindow'] = o_ipatokentotpsyncwindow
+        if o_ipatokenhotpauthwindow is not None:
+            _params['ipatokenhotpauthwindow'] = o_ipatokenhotpauthwindow
+        if o_ipatokenhotpsyncwindow is not None:
+            _params['ipatokenhotpsyncwindow'] = o_ipatokenhotpsyncwindow
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('otpconfig_mod', _args, _params)
+
+    def otpconfig_show(
+        self,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Show the current OTP configuration.
+
+
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = []
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('otpconfig_show', _args, _params)
+
+    def otptoken_add(
+        self,
+        a_ipatokenuniqueid=None,
+        o_type='totp',
+        o_description=None,
+        o_ipatokenowner=None,
+        o_ipatokendisabled=None,
+        o_ipatokennotbefore=None,
+        o_ipatokennotafter=None,
+        o_ipatokenvendor=None,
+        o_ipatokenmodel=None,
+        o_ipatokenserial=None,
+        o_ipatokenotpkey=None,
+        o_ipatokenotpalgorithm='sha1',
+        o_ipatokenotpdigits=6,
+        o_ipatokentotpclockoffset=0,
+        o_ipatokentotptimestep=30,
+        o_ipatokenhotpcounter=0,
+        o_setattr=None,
+        o_addattr=None,
+        o_qrcode=False,
+        o_no_qrcode=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Add a new OTP token.
+
+
+        :param a_ipatokenuniqueid: Unique ID
+        :type  a_ipatokenuniqueid: str
+        :param o_type: Type of the token
+        :type  o_type: str, valid values ['totp', 'hotp', 'TOTP', 'HOTP']
+        :param o_description: Token description (informational only)
+        :type  o_description: str
+        :param o_ipatokenowner: Assigned user of the token (default: self)
+        :type  o_ipatokenowner: str
+        :param o_ipatokendisabled: Mark the token as disabled (default: false)
+        :type  o_ipatokendisabled: Bool
+        :param o_ipatokennotbefore: First date/time the token can be used
+        :type  o_ipatokennotbefore: DateTime
+        :param o_ipatokennotafter: Last date/time the token can be used
+        :type  o_ipatokennotafter: DateTime
+        :param o_ipatokenvendor: Token vendor name (informational only)
+        :type  o_ipatokenvendor: str
+        :param o_ipatokenmodel: Token model (informational only)
+        :type  o_ipatokenmodel: str
+        :param o_ipatokenserial: Token serial (informational only)
+        :type  o_ipatokenserial: str
+        :param o_ipatokenotpkey: Token secret (Base32; default: random)
+        :type  o_ipatokenotpkey: OTPTokenKey
+        :param o_ipatokenotpalgorithm: Token hash algorithm
+        :type  o_ipatokenotpalgorithm: str, valid values ['sha1', 'sha256', 'sha384', 'sha512']
+        :param o_ipatokenotpdigits: Number of digits each token code will have
+        :type  o_ipatokenotpdigits: int, valid values ['6', '8']
+        :param o_ipatokentotpclockoffset: TOTP token / FreeIPA server time
+            difference
+        :type  o_ipatokentotpclockoffset: int, min value -2147483648, max value 2147483647
+        :param o_ipatokentotptimestep: Length of TOTP token code validity
+        :type  o_ipatokentotptimestep: int, min value 5, max value 2147483647
+        :param o_ipatokenhotpcounter: Initial counter for the HOTP token
+        :type  o_ipatokenhotpcounter: int, min value 0, max value 2147483647
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_qrcode: (deprecated)
+        :type  o_qrcode: bool
+        :param o_no_qrcode: Do not display QR code
+        :type  o_no_qrcode: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_ipatokenuniqueid]
+        _params = {
+            'no_qrcode': o_no_qrcode,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_type is not None:
+            _params['type'] = o_type
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipatokenowner is not None:
+            _params['ipatokenowner'] = o_ipatokenowner
+        if o_ipatokendisabled is not None:
+            _params['ipatokendisabled'] = o_ipatokendisabled
+        if o_ipatokennotbefore is not None:
+            _params['ipatokennotbefore'] = o_ipatokennotbefore
+        if o_ipatokennotafter is not None:
+            _params['ipatokennotafter'] = o_ipatokennotafter
+        if o_ipatokenvendor is not None:
+            _params['ipatokenvendor'] = o_ipatokenvendor
+        if o_ipatokenmodel is not None:
+            _params['ipatokenmodel'] = o_ipatokenmodel
+        if o_ipatokenserial is not None:
+            _params['ipatokenserial'] = o_ipatokenserial
+        if o_ipatokenotpkey is not None:
+            _params['ipatokenotpkey'] = o_ipatokenotpkey
+        if o_ipatokenotpalgorithm is not None:
+            _params['ipatokenotpalgorithm'] = o_ipatokenotpalgorithm
+        if o_ipatokenotpdigits is not None:
+            _params['ipatokenotpdigits'] = o_ipatokenotpdigits
+        if o_ipatokentotpclockoffset is not None:
+            _params['ipatokentotpclockoffset'] = o_ipatokentotpclockoffset
+        if o_ipatokentotptimestep is not None:
+            _params['ipatokentotptimestep'] = o_ipatokentotptimestep
+        if o_ipatokenhotpcounter is not None:
+            _params['ipatokenhotpcounter'] = o_ipatokenhotpcounter
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_qrcode is not None:
+            _params['qrcode'] = o_qrcode
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('otptoken_add', _args, _params)
+
+    def otptoken_add_managedby(
+        self,
+        a_ipatokenuniqueid,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        **kwargs
+    ):
+        """
+        Add users that can manage this token.
+
+
+        :param a_ipatokenuniqueid: Unique ID
+        :type  a_ipatokenuniqueid: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to add
+        :type  o_user: str
+        """
+        _args = [a_ipatokenuniqueid]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('otptoken_add_managedby', _args, _params)
+
+    def otptoken_del(
+        self,
+        a_ipatokenuniqueid,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete an OTP token.
+
+
+        :param a_ipatokenuniqueid: Unique ID
+        :type  a_ipatokenuniqueid: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_ipatokenuniqueid]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('otptoken_del', _args, _params)
+
+    def otptoken_find(
+        self,
+        a_criteria=None,
+        o_ipatokenuniqueid=None,
+        o_type=None,
+        o_description=None,
+        o_ipatokenowner=None,
+        o_ipatokendisabled=None,
+        o_ipatokennotbefore=None,
+        o_ipatokennotafter=None,
+        o_ipatokenvendor=None,
+        o_ipatokenmodel=None,
+        o_ipatokenserial=None,
+        o_ipatokenotpalgorithm=None,
+        o_ipatokenotpdigits=None,
+        o_ipatokentotpclockoffset=None,
+        o_ipatokentotptimestep=None,
+        o_ipatokenhotpcounter=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=True,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for OTP token.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_ipatokenuniqueid: Unique ID
+        :type  o_ipatokenuniqueid: str
+        :param o_type: Type of the token
+        :type  o_type: str, valid values ['totp', 'hotp', 'TOTP', 'HOTP']
+        :param o_description: Token description (informational only)
+        :type  o_description: str
+        :param o_ipatokenowner: Assigned user of the token (default: self)
+        :type  o_ipatokenowner: str
+        :param o_ipatokendisabled: Mark the token as disabled (default: false)
+        :type  o_ipatokendisabled: Bool
+        :param o_ipatokennotbefore: First date/time the token can be used
+        :type  o_ipatokennotbefore: DateTime
+        :param o_ipatokennotafter: Last date/time the token can be used
+        :type  o_ipatokennotafter: DateTime
+        :param o_ipatokenvendor: Token vendor name (informational only)
+        :type  o_ipatokenvendor: str
+        :param o_ipatokenmodel: Token model (informational only)
+        :type  o_ipatokenmodel: str
+        :param o_ipatokenserial: Token serial (informational only)
+        :type  o_ipatokenserial: str
+        :param o_ipatokenotpalgorithm: Token hash algorithm
+        :type  o_ipatokenotpalgorithm: str, valid values ['sha1', 'sha256', 'sha384', 'sha512']
+        :param o_ipatokenotpdigits: Number of digits each token code will have
+        :type  o_ipatokenotpdigits: int, valid values ['6', '8']
+        :param o_ipatokentotpclockoffset: TOTP token / FreeIPA server time
+            difference
+        :type  o_ipatokentotpclockoffset: int, min value -2147483648, max value 2147483647
+        :param o_ipatokentotptimestep: Length of TOTP token code validity
+        :type  o_ipatokentotptimestep: int, min value 5, max value 2147483647
+        :param o_ipatokenhotpcounter: Initial counter for the HOTP token
+        :type  o_ipatokenhotpcounter: int, min value 0, max value 2147483647
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("id")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_ipatokenuniqueid is not None:
+            _params['ipatokenuniqueid'] = o_ipatokenuniqueid
+        if o_type is not None:
+            _params['type'] = o_type
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipatokenowner is not None:
+            _params['ipatokenowner'] = o_ipatokenowner
+        if o_ipatokendisabled is not None:
+            _params['ipatokendisabled'] = o_ipatokendisabled
+        if o_ipatokennotbefore is not None:
+            _params['ipatokennotbefore'] = o_ipatokennotbefore
+        if o_ipatokennotafter is not None:
+            _params['ipatokennotafter'] = o_ipatokennotafter
+        if o_ipatokenvendor is not None:
+            _params['ipatokenvendor'] = o_ipatokenvendor
+        if o_ipatokenmodel is not None:
+            _params['ipatokenmodel'] = o_ipatokenmodel
+        if o_ipatokenserial is not None:
+            _params['ipatokenserial'] = o_ipatokenserial
+        if o_ipatokenotpalgorithm is not None:
+            _params['ipatokenotpalgorithm'] = o_ipatokenotpalgorithm
+        if o_ipatokenotpdigits is not None:
+            _params['ipatokenotpdigits'] = o_ipatokenotpdigits
+        if o_ipatokentotpclockoffset is not None:
+            _params['ipatokentotpclockoffset'] = o_ipatokentotpclockoffset
+        if o_ipatokentotptimestep is not None:
+            _params['ipatokentotptimestep'] = o_ipatokentotptimestep
+        if o_ipatokenhotpcounter is not None:
+            _params['ipatokenhotpcounter'] = o_ipatokenhotpcounter
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('otptoken_find', _args, _params)
+
+    def otptoken_mod(
+        self,
+        a_ipatokenuniqueid,
+        o_description=None,
+        o_ipatokenowner=None,
+        o_ipatokendisabled=None,
+        o_ipatokennotbefore=None,
+        o_ipatokennotafter=None,
+        o_ipatokenvendor=None,
+        o_ipatokenmodel=None,
+        o_ipatokenserial=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_rename=None,
+        **kwargs
+    ):
+        """
+        Modify a OTP token.
+
+
+        :param a_ipatokenuniqueid: Unique ID
+        :type  a_ipatokenuniqueid: str
+        :param o_description: Token description (informational only)
+        :type  o_description: str
+        :param o_ipatokenowner: Assigned user of the token (default: self)
+        :type  o_ipatokenowner: str
+        :param o_ipatokendisabled: Mark the token as disabled (default: false)
+        :type  o_ipatokendisabled: Bool
+        :param o_ipatokennotbefore: First date/time the token can be used
+        :type  o_ipatokennotbefore: DateTime
+        :param o_ipatokennotafter: Last date/time the token can be used
+        :type  o_ipatokennotafter: DateTime
+        :param o_ipatokenvendor: Token vendor name (informational only)
+        :type  o_ipatokenvendor: str
+        :param o_ipatokenmodel: Token model (informational only)
+        :type  o_ipatokenmodel: str
+        :param o_ipatokenserial: Token serial (informational only)
+        :type  o_ipatokenserial: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_rename: Rename the OTP token object
+        :type  o_rename: str
+        """
+        _args = [a_ipatokenuniqueid]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipatokenowner is not None:
+            _params['ipatokenowner'] = o_ipatokenowner
+        if o_ipatokendisabled is not None:
+            _params['ipatokendisabled'] = o_ipatokendisabled
+        if o_ipatokennotbefore is not None:
+            _params['ipatokennotbefore'] = o_ipatokennotbefore
+        if o_ipatokennotafter is not None:
+            _params['ipatokennotafter'] = o_ipatokennotafter
+        if o_ipatokenvendor is not None:
+            _params['ipatokenvendor'] = o_ipatokenvendor
+        if o_ipatokenmodel is not None:
+            _params['ipatokenmodel'] = o_ipatokenmodel
+        if o_ipatokenserial is not None:
+            _params['ipatokenserial'] = o_ipatokenserial
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if o_rename is not None:
+            _params['rename'] = o_rename
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('otptoken_mod', _args, _params)
+
+    def otptoken_remove_managedby(
+        self,
+        a_ipatokenuniqueid,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        **kwargs
+    ):
+        """
+        Remove users that can manage this token.
+
+
+        :param a_ipatokenuniqueid: Unique ID
+        :type  a_ipatokenuniqueid: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to remove
+        :type  o_user: str
+        """
+        _args = [a_ipatokenuniqueid]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('otptoken_remove_managedby', _args, _params)
+
+    def otptoken_show(
+        self,
+        a_ipatokenuniqueid,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Display information about an OTP token.
+
+
+        :param a_ipatokenuniqueid: Unique ID
+        :type  a_ipatokenuniqueid: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_ipatokenuniqueid]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('otptoken_show', _args, _params)
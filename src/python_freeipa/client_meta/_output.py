@@ -0,0 +1,67 @@
+class Commands(object):
+
+    def output_find(
+        self,
+        a_commandfull_name,
+        a_criteria=None,
+        o_all=True,
+        o_raw=False,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for command outputs.
+
+
+        :param a_commandfull_name: Full name
+        :type  a_commandfull_name: str
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("name")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_commandfull_name, a_criteria]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('output_find', _args, _params)
+
+    def output_show(
+        self,
+        a_commandfull_name,
+        a_name,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display information about a command output.
+
+
+        :param a_commandfull_name: Full name
+        :type  a_commandfull_name: str
+        :param a_name: Name
+        :type  a_name: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_commandfull_name, a_name]
+        _params = {'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('output_show', _args, _params)
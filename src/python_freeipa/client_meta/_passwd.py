@@ -0,0 +1,31 @@
+class Commands(object):
+
+    def passwd(
+        self,
+        a_principal,
+        a_password,
+        a_current_password,
+        o_otp=None,
+        **kwargs
+    ):
+        """
+        Set a user's password.
+
+
+        :param a_principal: User name
+        :type  a_principal: Principal
+        :param a_password: New Password
+        :type  a_password: Password
+        :param a_current_password: Current Password
+        :type  a_current_password: Password
+        :param o_otp: One Time Password
+        :type  o_otp: Password
+        """
+        _args = [a_principal, a_password, a_current_password]
+        _params = {}
+        if o_otp is not None:
+            _params['otp'] = o_otp
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('passwd', _args, _params)
@@ -0,0 +1,610 @@
+class Commands(object):
+
+    def permission_add(
+        self,
+        a_cn,
+        o_ipapermright=None,
+        o_attrs=None,
+        o_ipapermbindruletype='permission',
+        o_ipapermlocation=None,
+        o_extratargetfilter=None,
+        o_ipapermtargetfilter=None,
+        o_ipapermtarget=None,
+        o_ipapermtargetto=None,
+        o_ipapermtargetfrom=None,
+        o_memberof=None,
+        o_targetgroup=None,
+        o_type=None,
+        o_permissions=None,
+        o_filter=None,
+        o_subtree=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Add a new permission.
+
+
+        :param a_cn: Permission name
+        :type  a_cn: str
+        :param o_ipapermright: Rights to grant (read, search, compare, write,
+            add, delete, all)
+        :type  o_ipapermright: list of str, valid values ['read', 'search', 'compare', 'write', 'add', 'delete', 'all']
+        :param o_attrs: All attributes to which the permission applies
+        :type  o_attrs: str
+        :param o_ipapermbindruletype: Bind rule type
+        :type  o_ipapermbindruletype: str, valid values ['permission', 'all', 'anonymous']
+        :param o_ipapermlocation: Subtree to apply permissions to
+        :type  o_ipapermlocation: DNOrURL
+        :param o_extratargetfilter: Extra target filter
+        :type  o_extratargetfilter: str
+        :param o_ipapermtargetfilter: All target filters, including those
+            implied by type and memberof
+        :type  o_ipapermtargetfilter: str
+        :param o_ipapermtarget: Optional DN to apply the permission to (must
+            be in the subtree, but may not yet exist)
+        :type  o_ipapermtarget: DNParam
+        :param o_ipapermtargetto: Optional DN subtree where an entry can be
+            moved to (must be in the subtree, but may not yet exist)
+        :type  o_ipapermtargetto: DNParam
+        :param o_ipapermtargetfrom: Optional DN subtree from where an entry
+            can be moved (must be in the subtree, but may not yet exist)
+        :type  o_ipapermtargetfrom: DNParam
+        :param o_memberof: Target members of a group (sets memberOf
+            targetfilter)
+        :type  o_memberof: str
+        :param o_targetgroup: User group to apply permissions to (sets target)
+        :type  o_targetgroup: str
+        :param o_type: Type of IPA object (sets subtree and objectClass
+            targetfilter)
+        :type  o_type: str
+        :param o_permissions: Deprecated; use ipapermright
+        :type  o_permissions: str
+        :param o_filter: Deprecated; use extratargetfilter
+        :type  o_filter: str
+        :param o_subtree: Deprecated; use ipapermlocation
+        :type  o_subtree: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'ipapermbindruletype': o_ipapermbindruletype,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_ipapermright is not None:
+            _params['ipapermright'] = o_ipapermright
+        if o_attrs is not None:
+            _params['attrs'] = o_attrs
+        if o_ipapermlocation is not None:
+            _params['ipapermlocation'] = o_ipapermlocation
+        if o_extratargetfilter is not None:
+            _params['extratargetfilter'] = o_extratargetfilter
+        if o_ipapermtargetfilter is not None:
+            _params['ipapermtargetfilter'] = o_ipapermtargetfilter
+        if o_ipapermtarget is not None:
+            _params['ipapermtarget'] = o_ipapermtarget
+        if o_ipapermtargetto is not None:
+            _params['ipapermtargetto'] = o_ipapermtargetto
+        if o_ipapermtargetfrom is not None:
+            _params['ipapermtargetfrom'] = o_ipapermtargetfrom
+        if o_memberof is not None:
+            _params['memberof'] = o_memberof
+        if o_targetgroup is not None:
+            _params['targetgroup'] = o_targetgroup
+        if o_type is not None:
+            _params['type'] = o_type
+        if o_permissions is not None:
+            _params['permissions'] = o_permissions
+        if o_filter is not None:
+            _params['filter'] = o_filter
+        if o_subtree is not None:
+            _params['subtree'] = o_subtree
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('permission_add', _args, _params)
+
+    def permission_add_member(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_privilege=None,
+        **kwargs
+    ):
+        """
+        Add members to a permission.
+
+
+        :param a_cn: Permission name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_privilege: privileges to add
+        :type  o_privilege: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_privilege is not None:
+            _params['privilege'] = o_privilege
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('permission_add_member', _args, _params)
+
+    def permission_add_noaci(
+        self,
+        a_cn,
+        o_ipapermissiontype,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Add a system permission without an ACI (internal command)
+
+
+        :param a_cn: Permission name
+        :type  a_cn: str
+        :param o_ipapermissiontype: Permission flags
+        :type  o_ipapermissiontype: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'ipapermissiontype': o_ipapermissiontype,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('permission_add_noaci', _args, _params)
+
+    def permission_del(
+        self,
+        a_cn,
+        o_continue=False,
+        o_force=False,
+        **kwargs
+    ):
+        """
+        Delete a permission.
+
+
+        :param a_cn: Permission name
+        :type  a_cn: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        :param o_force: force delete of SYSTEM permissions
+        :type  o_force: bool
+        """
+        _args = [a_cn]
+        _params = {'continue': o_continue, 'force': o_force}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('permission_del', _args, _params)
+
+    def permission_find(
+        self,
+        a_criteria=None,
+        o_cn=None,
+        o_ipapermright=None,
+        o_attrs=None,
+        o_ipapermincludedattr=None,
+        o_ipapermexcludedattr=None,
+        o_ipapermdefaultattr=None,
+        o_ipapermbindruletype=None,
+        o_ipapermlocation=None,
+        o_extratargetfilter=None,
+        o_ipapermtargetfilter=None,
+        o_ipapermtarget=None,
+        o_ipapermtargetto=None,
+        o_ipapermtargetfrom=None,
+        o_memberof=None,
+        o_targetgroup=None,
+        o_type=None,
+        o_permissions=None,
+        o_filter=None,
+        o_subtree=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=True,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for permissions.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_cn: Permission name
+        :type  o_cn: str
+        :param o_ipapermright: Rights to grant (read, search, compare, write,
+            add, delete, all)
+        :type  o_ipapermright: list of str, valid values ['read', 'search', 'compare', 'write', 'add', 'delete', 'all']
+        :param o_attrs: All attributes to which the permission applies
+        :type  o_attrs: str
+        :param o_ipapermincludedattr: User-specified attributes to which the
+            permission applies
+        :type  o_ipapermincludedattr: str
+        :param o_ipapermexcludedattr: User-specified attributes to which the
+            permission explicitly does not apply
+        :type  o_ipapermexcludedattr: str
+        :param o_ipapermdefaultattr: Attributes to which the permission
+            applies by default
+        :type  o_ipapermdefaultattr: str
+        :param o_ipapermbindruletype: Bind rule type
+        :type  o_ipapermbindruletype: str, valid values ['permission', 'all', 'anonymous']
+        :param o_ipapermlocation: Subtree to apply permissions to
+        :type  o_ipapermlocation: DNOrURL
+        :param o_extratargetfilter: Extra target filter
+        :type  o_extratargetfilter: str
+        :param o_ipapermtargetfilter: All target filters, including those
+            implied by type and memberof
+        :type  o_ipapermtargetfilter: str
+        :param o_ipapermtarget: Optional DN to apply the permission to (must
+            be in the subtree, but may not yet exist)
+        :type  o_ipapermtarget: DNParam
+        :param o_ipapermtargetto: Optional DN subtree where an entry can be
+            moved to (must be in the subtree, but may not yet exist)
+        :type  o_ipapermtargetto: DNParam
+        :param o_ipapermtargetfrom: Optional DN subtree from where an entry
+            can be moved (must be in the subtree, but may not yet exist)
+        :type  o_ipapermtargetfrom: DNParam
+        :param o_memberof: Target members of a group (sets memberOf
+            targetfilter)
+        :type  o_memberof: str
+        :param o_targetgroup: User group to apply permissions to (sets target)
+        :type  o_targetgroup: str
+        :param o_type: Type of IPA object (sets subtree and objectClass
+            targetfilter)
+        :type  o_type: str
+        :param o_permissions: Deprecated; use ipapermright
+        :type  o_permissions: str
+        :param o_filter: Deprecated; use extratargetfilter
+        :type  o_filter: str
+        :param o_subtree: Deprecated; use ipapermlocation
+        :type  o_subtree: str
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("name")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_ipapermright is not None:
+            _params['ipapermright'] = o_ipapermright
+        if o_attrs is not None:
+            _params['attrs'] = o_attrs
+        if o_ipapermincludedattr is not None:
+            _params['ipapermincludedattr'] = o_ipapermincludedattr
+        if o_ipapermexcludedattr is not None:
+            _params['ipapermexcludedattr'] = o_ipapermexcludedattr
+        if o_ipapermdefaultattr is not None:
+            _params['ipapermdefaultattr'] = o_ipapermdefaultattr
+        if o_ipapermbindruletype is not None:
+            _params['ipapermbindruletype'] = o_ipapermbindruletype
+        if o_ipapermlocation is not None:
+            _params['ipapermlocation'] = o_ipapermlocation
+        if o_extratargetfilter is not None:
+            _params['extratargetfilter'] = o_extratargetfilter
+        if o_ipapermtargetfilter is not None:
+            _params['ipapermtargetfilter'] = o_ipapermtargetfilter
+        if o_ipapermtarget is not None:
+            _params['ipapermtarget'] = o_ipapermtarget
+        if o_ipapermtargetto is not None:
+            _params['ipapermtargetto'] = o_ipapermtargetto
+        if o_ipapermtargetfrom is not None:
+            _params['ipapermtargetfrom'] = o_ipapermtargetfrom
+        if o_memberof is not None:
+            _params['memberof'] = o_memberof
+        if o_targetgroup is not None:
+            _params['targetgroup'] = o_targetgroup
+        if o_type is not None:
+            _params['type'] = o_type
+        if o_permissions is not None:
+            _params['permissions'] = o_permissions
+        if o_filter is not None:
+            _params['filter'] = o_filter
+        if o_subtree is not None:
+            _params['subtree'] = o_subtree
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('permission_find', _args, _params)
+
+    def permission_mod(
+        self,
+        a_cn,
+        o_ipapermright=None,
+        o_attrs=None,
+        o_ipapermincludedattr=None,
+        o_ipapermexcludedattr=None,
+        o_ipapermbindruletype=None,
+        o_ipapermlocation=None,
+        o_extratargetfilter=None,
+        o_ipapermtargetfilter=None,
+        o_ipapermtarget=None,
+        o_ipapermtargetto=None,
+        o_ipapermtargetfrom=None,
+        o_memberof=None,
+        o_targetgroup=None,
+        o_type=None,
+        o_permissions=None,
+        o_filter=None,
+        o_subtree=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_rename=None,
+        **kwargs
+    ):
+        """
+        Modify a permission.
+
+
+        :param a_cn: Permission name
+        :type  a_cn: str
+        :param o_ipapermright: Rights to grant (read, search, compare, write,
+            add, delete, all)
+        :type  o_ipapermright: list of str, valid values ['read', 'search', 'compare', 'write', 'add', 'delete', 'all']
+        :param o_attrs: All attributes to which the permission applies
+        :type  o_attrs: str
+        :param o_ipapermincludedattr: User-specified attributes to which the
+            permission applies
+        :type  o_ipapermincludedattr: str
+        :param o_ipapermexcludedattr: User-specified attributes to which the
+            permission explicitly does not apply
+        :type  o_ipapermexcludedattr: str
+        :param o_ipapermbindruletype: Bind rule type
+        :type  o_ipapermbindruletype: str, valid values ['permission', 'all', 'anonymous']
+        :param o_ipapermlocation: Subtree to apply permissions to
+        :type  o_ipapermlocation: DNOrURL
+        :param o_extratargetfilter: Extra target filter
+        :type  o_extratargetfilter: str
+        :param o_ipapermtargetfilter: All target filters, including those
+            implied by type and memberof
+        :type  o_ipapermtargetfilter: str
+        :param o_ipapermtarget: Optional DN to apply the permission to (must
+            be in the subtree, but may not yet exist)
+        :type  o_ipapermtarget: DNParam
+        :param o_ipapermtargetto: Optional DN subtree where an entry can be
+            moved to (must be in the subtree, but may not yet exist)
+        :type  o_ipapermtargetto: DNParam
+        :param o_ipapermtargetfrom: Optional DN subtree from where an entry
+            can be moved (must be in the subtree, but may not yet exist)
+        :type  o_ipapermtargetfrom: DNParam
+        :param o_memberof: Target members of a group (sets memberOf
+            targetfilter)
+        :type  o_memberof: str
+        :param o_targetgroup: User group to apply permissions to (sets target)
+        :type  o_targetgroup: str
+        :param o_type: Type of IPA object (sets subtree and objectClass
+            targetfilter)
+        :type  o_type: str
+        :param o_permissions: Deprecated; use ipapermright
+        :type  o_permissions: str
+        :param o_filter: Deprecated; use extratargetfilter
+        :type  o_filter: str
+        :param o_subtree: Deprecated; use ipapermlocation
+        :type  o_subtree: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_rename: Rename the permission object
+        :type  o_rename: str
+        """
+        _args = [a_cn]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_ipapermright is not None:
+            _params['ipapermright'] = o_ipapermright
+        if o_attrs is not None:
+            _params['attrs'] = o_attrs
+        if o_ipapermincludedattr is not None:
+            _params['ipapermincludedattr'] = o_ipapermincludedattr
+        if o_ipapermexcludedattr is not None:
+            _params['ipapermexcludedattr'] = o_ipapermexcludedattr
+        if o_ipapermbindruletype is not None:
+            _params['ipapermbindruletype'] = o_ipapermbindruletype
+        if o_ipapermlocation is not None:
+            _params['ipapermlocation'] = o_ipapermlocation
+        if o_extratargetfilter is not None:
+            _params['extratargetfilter'] = o_extratargetfilter
+        if o_ipapermtargetfilter is not None:
+            _params['ipapermtargetfilter'] = o_ipapermtargetfilter
+        if o_ipapermtarget is not None:
+            _params['ipapermtarget'] = o_ipapermtarget
+        if o_ipapermtargetto is not None:
+            _params['ipapermtargetto'] = o_ipapermtargetto
+        if o_ipapermtargetfrom is not None:
+            _params['ipapermtargetfrom'] = o_ipapermtargetfrom
+        if o_memberof is not None:
+            _params['memberof'] = o_memberof
+        if o_targetgroup is not None:
+            _params['targetgroup'] = o_targetgroup
+        if o_type is not None:
+            _params['type'] = o_type
+        if o_permissions is not None:
+            _params['permissions'] = o_permissions
+        if o_filter is not None:
+            _params['filter'] = o_filter
+        if o_subtree is not None:
+            _params['subtree'] = o_subtree
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if o_rename is not None:
+            _params['rename'] = o_rename
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('permission_mod', _args, _params)
+
+    def permission_remove_member(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_privilege=None,
+        **kwargs
+    ):
+        """
+        Remove members from a permission.
+
+
+        :param a_cn: Permission name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_privilege: privileges to remove
+        :type  o_privilege: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_privilege is not None:
+            _params['privilege'] = o_privilege
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('permission_remove_member', _args, _params)
+
+    def permission_show(
+        self,
+        a_cn,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Display information about a permission.
+
+
+        :param a_cn: Permission name
+        :type  a_cn: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('permission_show', _args, _params)
@@ -0,0 +1,17 @@
+class Commands(object):
+
+    def ping(
+        self,
+        **kwargs
+    ):
+        """
+        Ping a remote server.
+
+
+        """
+        _args = []
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('ping', _args, _params)
@@ -0,0 +1,49 @@
+class Commands(object):
+
+    def pkinit_status(
+        self,
+        a_criteria=None,
+        o_server_server=None,
+        o_status=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Report PKINIT status on the IPA masters
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_server_server: IPA server hostname
+        :type  o_server_server: str
+        :param o_status: Whether PKINIT is enabled or disabled
+        :type  o_status: str, valid values ['enabled', 'disabled']
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_server_server is not None:
+            _params['server_server'] = o_server_server
+        if o_status is not None:
+            _params['status'] = o_status
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('pkinit_status', _args, _params)
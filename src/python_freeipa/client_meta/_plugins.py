@@ -0,0 +1,26 @@
+class Commands(object):
+
+    def plugins(
+        self,
+        o_server=False,
+        o_all=True,
+        **kwargs
+    ):
+        """
+        Show all loaded plugins.
+
+
+        :param o_server: Forward to server instead of running locally
+        :type  o_server: bool
+        :param o_all: retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        """
+        _args = []
+        _params = {'all': o_all}
+        if o_server is not None:
+            _params['server'] = o_server
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('plugins', _args, _params)
@@ -0,0 +1,340 @@
+class Commands(object):
+
+    def pwpolicy_add(
+        self,
+        a_cn,
+        o_cospriority,
+        o_krbmaxpwdlife=None,
+        o_krbminpwdlife=None,
+        o_krbpwdhistorylength=None,
+        o_krbpwdmindiffchars=None,
+        o_krbpwdminlength=None,
+        o_krbpwdmaxfailure=None,
+        o_krbpwdfailurecountinterval=None,
+        o_krbpwdlockoutduration=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Add a new group password policy.
+
+
+        :param a_cn: Manage password policy for specific group
+        :type  a_cn: str
+        :param o_krbmaxpwdlife: Maximum password lifetime (in days)
+        :type  o_krbmaxpwdlife: int, min value 0, max value 20000
+        :param o_krbminpwdlife: Minimum password lifetime (in hours)
+        :type  o_krbminpwdlife: int, min value 0, max value 2147483647
+        :param o_krbpwdhistorylength: Password history size
+        :type  o_krbpwdhistorylength: int, min value 0, max value 2147483647
+        :param o_krbpwdmindiffchars: Minimum number of character classes
+        :type  o_krbpwdmindiffchars: int, min value 0, max value 5
+        :param o_krbpwdminlength: Minimum length of password
+        :type  o_krbpwdminlength: int, min value 0, max value 2147483647
+        :param o_cospriority: Priority of the policy (higher number means
+            lower priority
+        :type  o_cospriority: int, min value 0, max value 2147483647
+        :param o_krbpwdmaxfailure: Consecutive failures before lockout
+        :type  o_krbpwdmaxfailure: int, min value 0, max value 2147483647
+        :param o_krbpwdfailurecountinterval: Period after which failure count
+            will be reset (seconds)
+        :type  o_krbpwdfailurecountinterval: int, min value 0, max value 2147483647
+        :param o_krbpwdlockoutduration: Period for which lockout is enforced
+            (seconds)
+        :type  o_krbpwdlockoutduration: int, min value 0, max value 2147483647
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'cospriority': o_cospriority, 'all': o_all, 'raw': o_raw}
+        if o_krbmaxpwdlife is not None:
+            _params['krbmaxpwdlife'] = o_krbmaxpwdlife
+        if o_krbminpwdlife is not None:
+            _params['krbminpwdlife'] = o_krbminpwdlife
+        if o_krbpwdhistorylength is not None:
+            _params['krbpwdhistorylength'] = o_krbpwdhistorylength
+        if o_krbpwdmindiffchars is not None:
+            _params['krbpwdmindiffchars'] = o_krbpwdmindiffchars
+        if o_krbpwdminlength is not None:
+            _params['krbpwdminlength'] = o_krbpwdminlength
+        if o_krbpwdmaxfailure is not None:
+            _params['krbpwdmaxfailure'] = o_krbpwdmaxfailure
+        if o_krbpwdfailurecountinterval is not None:
+            _params['krbpwdfailurecountinterval'] = o_krbpwdfailurecountinterval
+        if o_krbpwdlockoutduration is not None:
+            _params['krbpwdlockoutduration'] = o_krbpwdlockoutduration
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('pwpolicy_add', _args, _params)
+
+    def pwpolicy_del(
+        self,
+        a_cn,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete a group password policy.
+
+
+        :param a_cn: Manage password policy for specific group
+        :type  a_cn: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_cn]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('pwpolicy_del', _args, _params)
+
+    def pwpolicy_find(
+        self,
+        a_criteria=None,
+        o_cn=None,
+        o_krbmaxpwdlife=None,
+        o_krbminpwdlife=None,
+        o_krbpwdhistorylength=None,
+        o_krbpwdmindiffchars=None,
+        o_krbpwdminlength=None,
+        o_cospriority=None,
+        o_krbpwdmaxfailure=None,
+        o_krbpwdfailurecountinterval=None,
+        o_krbpwdlockoutduration=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for group password policies.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_cn: Manage password policy for specific group
+        :type  o_cn: str
+        :param o_krbmaxpwdlife: Maximum password lifetime (in days)
+        :type  o_krbmaxpwdlife: int, min value 0, max value 20000
+        :param o_krbminpwdlife: Minimum password lifetime (in hours)
+        :type  o_krbminpwdlife: int, min value 0, max value 2147483647
+        :param o_krbpwdhistorylength: Password history size
+        :type  o_krbpwdhistorylength: int, min value 0, max value 2147483647
+        :param o_krbpwdmindiffchars: Minimum number of character classes
+        :type  o_krbpwdmindiffchars: int, min value 0, max value 5
+        :param o_krbpwdminlength: Minimum length of password
+        :type  o_krbpwdminlength: int, min value 0, max value 2147483647
+        :param o_cospriority: Priority of the policy (higher number means
+            lower priority
+        :type  o_cospriority: int, min value 0, max value 2147483647
+        :param o_krbpwdmaxfailure: Consecutive failures before lockout
+        :type  o_krbpwdmaxfailure: int, min value 0, max value 2147483647
+        :param o_krbpwdfailurecountinterval: Period after which failure count
+            will be reset (seconds)
+        :type  o_krbpwdfailurecountinterval: int, min value 0, max value 2147483647
+        :param o_krbpwdlockoutduration: Period for which lockout is enforced
+            (seconds)
+        :type  o_krbpwdlockoutduration: int, min value 0, max value 2147483647
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("group")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_krbmaxpwdlife is not None:
+            _params['krbmaxpwdlife'] = o_krbmaxpwdlife
+        if o_krbminpwdlife is not None:
+            _params['krbminpwdlife'] = o_krbminpwdlife
+        if o_krbpwdhistorylength is not None:
+            _params['krbpwdhistorylength'] = o_krbpwdhistorylength
+        if o_krbpwdmindiffchars is not None:
+            _params['krbpwdmindiffchars'] = o_krbpwdmindiffchars
+        if o_krbpwdminlength is not None:
+            _params['krbpwdminlength'] = o_krbpwdminlength
+        if o_cospriority is not None:
+            _params['cospriority'] = o_cospriority
+        if o_krbpwdmaxfailure is not None:
+            _params['krbpwdmaxfailure'] = o_krbpwdmaxfailure
+        if o_krbpwdfailurecountinterval is not None:
+            _params['krbpwdfailurecountinterval'] = o_krbpwdfailurecountinterval
+        if o_krbpwdlockoutduration is not None:
+            _params['krbpwdlockoutduration'] = o_krbpwdlockoutduration
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('pwpolicy_find', _args, _params)
+
+    def pwpolicy_mod(
+        self,
+        a_cn=None,
+        o_krbmaxpwdlife=None,
+        o_krbminpwdlife=None,
+        o_krbpwdhistorylength=None,
+        o_krbpwdmindiffchars=None,
+        o_krbpwdminlength=None,
+        o_cospriority=None,
+        o_krbpwdmaxfailure=None,
+        o_krbpwdfailurecountinterval=None,
+        o_krbpwdlockoutduration=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Modify a group password policy.
+
+
+        :param a_cn: Manage password policy for specific group
+        :type  a_cn: str
+        :param o_krbmaxpwdlife: Maximum password lifetime (in days)
+        :type  o_krbmaxpwdlife: int, min value 0, max value 20000
+        :param o_krbminpwdlife: Minimum password lifetime (in hours)
+        :type  o_krbminpwdlife: int, min value 0, max value 2147483647
+        :param o_krbpwdhistorylength: Password history size
+        :type  o_krbpwdhistorylength: int, min value 0, max value 2147483647
+        :param o_krbpwdmindiffchars: Minimum number of character classes
+        :type  o_krbpwdmindiffchars: int, min value 0, max value 5
+        :param o_krbpwdminlength: Minimum length of password
+        :type  o_krbpwdminlength: int, min value 0, max value 2147483647
+        :param o_cospriority: Priority of the policy (higher number means
+            lower priority
+        :type  o_cospriority: int, min value 0, max value 2147483647
+        :param o_krbpwdmaxfailure: Consecutive failures before lockout
+        :type  o_krbpwdmaxfailure: int, min value 0, max value 2147483647
+        :param o_krbpwdfailurecountinterval: Period after which failure count
+            will be reset (seconds)
+        :type  o_krbpwdfailurecountinterval: int, min value 0, max value 2147483647
+        :param o_krbpwdlockoutduration: Period for which lockout is enforced
+            (seconds)
+        :type  o_krbpwdlockoutduration: int, min value 0, max value 2147483647
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if o_krbmaxpwdlife is not None:
+            _params['krbmaxpwdlife'] = o_krbmaxpwdlife
+        if o_krbminpwdlife is not None:
+            _params['krbminpwdlife'] = o_krbminpwdlife
+        if o_krbpwdhistorylength is not None:
+            _params['krbpwdhistorylength'] = o_krbpwdhistorylength
+        if o_krbpwdmindiffchars is not None:
+            _params['krbpwdmindiffchars'] = o_krbpwdmindiffchars
+        if o_krbpwdminlength is not None:
+            _params['krbpwdminlength'] = o_krbpwdminlength
+        if o_cospriority is not None:
+            _params['cospriority'] = o_cospriority
+        if o_krbpwdmaxfailure is not None:
+            _params['krbpwdmaxfailure'] = o_krbpwdmaxfailure
+        if o_krbpwdfailurecountinterval is not None:
+            _params['krbpwdfailurecountinterval'] = o_krbpwdfailurecountinterval
+        if o_krbpwdlockoutduration is not None:
+            _params['krbpwdlockoutduration'] = o_krbpwdlockoutduration
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('pwpolicy_mod', _args, _params)
+
+    def pwpolicy_show(
+        self,
+        a_cn=None,
+        o_rights=False,
+        o_user=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display information about password policy.
+
+
+        :param a_cn: Manage password policy for specific group
+        :type  a_cn: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_user: Display effective policy for a specific user
+        :type  o_user: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if o_user is not None:
+            _params['user'] = o_user
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('pwpolicy_show', _args, _params)
@@ -0,0 +1,301 @@
+class Commands(object):
+
+    def radiusproxy_add(
+        self,
+        a_cn,
+        o_ipatokenradiusserver,
+        o_ipatokenradiussecret,
+        o_description=None,
+        o_ipatokenradiustimeout=None,
+        o_ipatokenradiusretries=None,
+        o_ipatokenusermapattribute=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Add a new RADIUS proxy server.
+
+
+        :param a_cn: RADIUS proxy server name
+        :type  a_cn: str
+        :param o_description: A description of this RADIUS proxy server
+        :type  o_description: str
+        :param o_ipatokenradiusserver: The hostname or IP (with or without
+            port)
+        :type  o_ipatokenradiusserver: str
+        :param o_ipatokenradiussecret: The secret used to encrypt data
+        :type  o_ipatokenradiussecret: Password
+        :param o_ipatokenradiustimeout: The total timeout across all retries
+            (in seconds)
+        :type  o_ipatokenradiustimeout: int, min value 1, max value 2147483647
+        :param o_ipatokenradiusretries: The number of times to retry
+            authentication
+        :type  o_ipatokenradiusretries: int, min value 0, max value 10
+        :param o_ipatokenusermapattribute: The username attribute on the user
+            object
+        :type  o_ipatokenusermapattribute: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'ipatokenradiusserver': o_ipatokenradiusserver,
+            'ipatokenradiussecret': o_ipatokenradiussecret,
+            'all': o_all,
+            'raw': o_raw,
+        }
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipatokenradiustimeout is not None:
+            _params['ipatokenradiustimeout'] = o_ipatokenradiustimeout
+        if o_ipatokenradiusretries is not None:
+            _params['ipatokenradiusretries'] = o_ipatokenradiusretries
+        if o_ipatokenusermapattribute is not None:
+            _params['ipatokenusermapattribute'] = o_ipatokenusermapattribute
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('radiusproxy_add', _args, _params)
+
+    def radiusproxy_del(
+        self,
+        a_cn,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete a RADIUS proxy server.
+
+
+        :param a_cn: RADIUS proxy server name
+        :type  a_cn: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_cn]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('radiusproxy_del', _args, _params)
+
+    def radiusproxy_find(
+        self,
+        a_criteria=None,
+        o_cn=None,
+        o_description=None,
+        o_ipatokenradiusserver=None,
+        o_ipatokenradiussecret=None,
+        o_ipatokenradiustimeout=None,
+        o_ipatokenradiusretries=None,
+        o_ipatokenusermapattribute=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for RADIUS proxy servers.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_cn: RADIUS proxy server name
+        :type  o_cn: str
+        :param o_description: A description of this RADIUS proxy server
+        :type  o_description: str
+        :param o_ipatokenradiusserver: The hostname or IP (with or without
+            port)
+        :type  o_ipatokenradiusserver: str
+        :param o_ipatokenradiussecret: The secret used to encrypt data
+        :type  o_ipatokenradiussecret: Password
+        :param o_ipatokenradiustimeout: The total timeout across all retries
+            (in seconds)
+        :type  o_ipatokenradiustimeout: int, min value 1, max value 2147483647
+        :param o_ipatokenradiusretries: The number of times to retry
+            authentication
+        :type  o_ipatokenradiusretries: int, min value 0, max value 10
+        :param o_ipatokenusermapattribute: The username attribute on the user
+            object
+        :type  o_ipatokenusermapattribute: str
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("name")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipatokenradiusserver is not None:
+            _params['ipatokenradiusserver'] = o_ipatokenradiusserver
+        if o_ipatokenradiussecret is not None:
+            _params['ipatokenradiussecret'] = o_ipatokenradiussecret
+        if o_ipatokenradiustimeout is not None:
+            _params['ipatokenradiustimeout'] = o_ipatokenradiustimeout
+        if o_ipatokenradiusretries is not None:
+            _params['ipatokenradiusretries'] = o_ipatokenradiusretries
+        if o_ipatokenusermapattribute is not None:
+            _params['ipatokenusermapattribute'] = o_ipatokenusermapattribute
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('radiusproxy_find', _args, _params)
+
+    def radiusproxy_mod(
+        self,
+        a_cn,
+        o_description=None,
+        o_ipatokenradiusserver=None,
+        o_ipatokenradiussecret=None,
+        o_ipatokenradiustimeout=None,
+        o_ipatokenradiusretries=None,
+        o_ipatokenusermapattribute=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_rename=None,
+        **kwargs
+    ):
+        """
+        Modify a RADIUS proxy server.
+
+
+        :param a_cn: RADIUS proxy server name
+        :type  a_cn: str
+        :param o_description: A description of this RADIUS proxy server
+        :type  o_description: str
+        :param o_ipatokenradiusserver: The hostname or IP (with or without
+            port)
+        :type  o_ipatokenradiusserver: str
+        :param o_ipatokenradiussecret: The secret used to encrypt data
+        :type  o_ipatokenradiussecret: Password
+        :param o_ipatokenradiustimeout: The total timeout across all retries
+            (in seconds)
+        :type  o_ipatokenradiustimeout: int, min value 1, max value 2147483647
+        :param o_ipatokenradiusretries: The number of times to retry
+            authentication
+        :type  o_ipatokenradiusretries: int, min value 0, max value 10
+        :param o_ipatokenusermapattribute: The username attribute on the user
+            object
+        :type  o_ipatokenusermapattribute: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_rename: Rename the RADIUS proxy server object
+        :type  o_rename: str
+        """
+        _args = [a_cn]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipatokenradiusserver is not None:
+            _params['ipatokenradiusserver'] = o_ipatokenradiusserver
+        if o_ipatokenradiussecret is not None:
+            _params['ipatokenradiussecret'] = o_ipatokenradiussecret
+        if o_ipatokenradiustimeout is not None:
+            _params['ipatokenradiustimeout'] = o_ipatokenradiustimeout
+        if o_ipatokenradiusretries is not None:
+            _params['ipatokenradiusretries'] = o_ipatokenradiusretries
+        if o_ipatokenusermapattribute is not None:
+            _params['ipatokenusermapattribute'] = o_ipatokenusermapattribute
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if o_rename is not None:
+            _params['rename'] = o_rename
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('radiusproxy_mod', _args, _params)
+
+    def radiusproxy_show(
+        self,
+        a_cn,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display information about a RADIUS proxy server.
+
+
+        :param a_cn: RADIUS proxy server name
+        :type  a_cn: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('radiusproxy_show', _args, _params)
@@ -0,0 +1,105 @@
+class Commands(object):
+
+    def realmdomains_mod(
+        self,
+        o_associateddomain=None,
+        o_add_domain=None,
+        o_del_domain=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_force=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Modify realm domains
+
+        DNS check: When manually adding a domain to the list, a DNS check is
+        performed by default. It ensures that the domain is associated with
+        the IPA realm, by checking whether the domain has a _kerberos TXT record
+        containing the IPA realm name. This check can be skipped by specifying
+        --force option.
+
+        Removal: when a realm domain which has a matching DNS zone managed by
+        IPA is being removed, a corresponding _kerberos TXT record in the zone is
+        removed automatically as well. Other records in the zone or the zone
+        itself are not affected.
+
+
+        :param o_associateddomain: Domain
+        :type  o_associateddomain: str
+        :param o_add_domain: Add domain
+        :type  o_add_domain: str
+        :param o_del_domain: Delete domain
+        :type  o_del_domain: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_force: Force adding domain even if not in DNS
+        :type  o_force: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = []
+        _params = {'rights': o_rights, 'force': o_force, 'all': o_all, 'raw': o_raw}
+        if o_associateddomain is not None:
+            _params['associateddomain'] = o_associateddomain
+        if o_add_domain is not None:
+            _params['add_domain'] = o_add_domain
+        if o_del_domain is not None:
+            _params['del_domain'] = o_del_domain
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('realmdomains_mod', _args, _params)
+
+    def realmdomains_show(
+        self,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display the list of realm domains.
+
+
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = []
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('realmdomains_show', _args, _params)
@@ -0,0 +1,967 @@
+from python_freeipa.records import record_class
+
+AciRecord = record_class(
+    'AciRecord',
+    'aci',
+    attributes=(
+        'aciname', 'permission', 'group', 'permissions', 'attrs', 'type', 'memberof',
+        'filter', 'subtree', 'targetgroup', 'selfaci', 'aciprefix',
+    ),
+    single=(
+        'aciname', 'permission', 'group', 'type', 'filter', 'subtree', 'targetgroup',
+        'selfaci', 'aciprefix',
+    ),
+    interned=(
+        'type', 'selfaci', 'aciprefix',
+    ),
+)
+
+AutomemberRecord = record_class(
+    'AutomemberRecord',
+    'automember',
+    attributes=(
+        'cn', 'type', 'description',
+    ),
+    single=(
+        'cn', 'type', 'description',
+    ),
+    interned=(
+        'type',
+    ),
+)
+
+AutomountkeyRecord = record_class(
+    'AutomountkeyRecord',
+    'automountkey',
+    attributes=(
+        'automountmapautomountmapname', 'automountkey', 'automountinformation',
+    ),
+    single=(
+        'automountmapautomountmapname', 'automountkey', 'automountinformation',
+    ),
+    interned=(
+    ),
+)
+
+AutomountlocationRecord = record_class(
+    'AutomountlocationRecord',
+    'automountlocation',
+    attributes=(
+        'cn',
+    ),
+    single=(
+        'cn',
+    ),
+    interned=(
+    ),
+)
+
+AutomountmapRecord = record_class(
+    'AutomountmapRecord',
+    'automountmap',
+    attributes=(
+        'automountmapname', 'description',
+    ),
+    single=(
+        'automountmapname', 'description',
+    ),
+    interned=(
+    ),
+)
+
+CaRecord = record_class(
+    'CaRecord',
+    'ca',
+    attributes=(
+        'cn', 'description', 'ipacaid', 'ipacasubjectdn', 'ipacaissuerdn',
+    ),
+    single=(
+        'cn', 'description', 'ipacaid', 'ipacasubjectdn', 'ipacaissuerdn',
+    ),
+    interned=(
+    ),
+)
+
+CaaclRecord = record_class(
+    'CaaclRecord',
+    'caacl',
+    attributes=(
+        'cn', 'description', 'ipaenabledflag', 'ipacacategory',
+        'ipacertprofilecategory', 'usercategory', 'hostcategory', 'servicecategory',
+    ),
+    single=(
+        'cn', 'description', 'ipaenabledflag', 'ipacacategory',
+        'ipacertprofilecategory', 'usercategory', 'hostcategory', 'servicecategory',
+    ),
+    interned=(
+        'ipaenabledflag', 'ipacacategory', 'ipacertprofilecategory', 'usercategory',
+        'hostcategory', 'servicecategory',
+    ),
+)
+
+CertRecord = record_class(
+    'CertRecord',
+    'cert',
+    attributes=(
+        'serial_number', 'certificate', 'issuer', 'revocation_reason', 'cacn',
+        'subject', 'min_serial_number', 'max_serial_number', 'validnotafter_from',
+        'validnotafter_to', 'validnotbefore_from', 'validnotbefore_to', 'issuedon_from',
+        'issuedon_to', 'revokedon_from', 'revokedon_to', 'member_host',
+        'memberindirect_host', 'member_service', 'memberindirect_service',
+        'member_user', 'memberindirect_user',
+    ),
+    single=(
+        'serial_number', 'certificate', 'issuer', 'revocation_reason', 'cacn',
+        'subject', 'min_serial_number', 'max_serial_number', 'validnotafter_from',
+        'validnotafter_to', 'validnotbefore_from', 'validnotbefore_to', 'issuedon_from',
+        'issuedon_to', 'revokedon_from', 'revokedon_to',
+    ),
+    interned=(
+        'member_host', 'memberindirect_host', 'member_service',
+        'memberindirect_service', 'member_user', 'memberindirect_user',
+    ),
+)
+
+CertmapruleRecord = record_class(
+    'CertmapruleRecord',
+    'certmaprule',
+    attributes=(
+        'cn', 'description', 'ipacertmapmaprule', 'ipacertmapmatchrule',
+        'associateddomain', 'ipacertmappriority', 'ipaenabledflag',
+    ),
+    single=(
+        'cn', 'description', 'ipacertmapmaprule', 'ipacertmapmatchrule',
+        'ipacertmappriority', 'ipaenabledflag',
+    ),
+    interned=(
+        'ipaenabledflag',
+    ),
+)
+
+CertprofileRecord = record_class(
+    'CertprofileRecord',
+    'certprofile',
+    attributes=(
+        'cn', 'description', 'ipacertprofilestoreissued',
+    ),
+    single=(
+        'cn', 'description', 'ipacertprofilestoreissued',
+    ),
+    interned=(
+        'ipacertprofilestoreissued',
+    ),
+)
+
+ClassRecord = record_class(
+    'ClassRecord',
+    'class',
+    attributes=(
+        'full_name',
+    ),
+    single=(
+        'full_name',
+    ),
+    interned=(
+    ),
+)
+
+CommandRecord = record_class(
+    'CommandRecord',
+    'command',
+    attributes=(
+        'full_name',
+    ),
+    single=(
+        'full_name',
+    ),
+    interned=(
+    ),
+)
+
+CosentryRecord = record_class(
+    'CosentryRecord',
+    'cosentry',
+    attributes=(
+        'cn', 'krbpwdpolicyreference', 'cospriority',
+    ),
+    single=(
+        'cn', 'krbpwdpolicyreference', 'cospriority',
+    ),
+    interned=(
+    ),
+)
+
+DelegationRecord = record_class(
+    'DelegationRecord',
+    'delegation',
+    attributes=(
+        'aciname', 'permissions', 'attrs', 'memberof', 'group',
+    ),
+    single=(
+        'aciname', 'group',
+    ),
+    interned=(
+    ),
+)
+
+DnsforwardzoneRecord = record_class(
+    'DnsforwardzoneRecord',
+    'dnsforwardzone',
+    attributes=(
+        'idnsname', 'name_from_ip', 'idnszoneactive', 'idnsforwarders',
+        'idnsforwardpolicy',
+    ),
+    single=(
+        'idnsname', 'name_from_ip', 'idnszoneactive', 'idnsforwardpolicy',
+    ),
+    interned=(
+        'idnszoneactive', 'idnsforwardpolicy',
+    ),
+)
+
+DnsrecordRecord = record_class(
+    'DnsrecordRecord',
+    'dnsrecord',
+    attributes=(
+        'idnsname', 'dnsttl', 'dnsclass', 'arecord', 'aaaarecord', 'a6record',
+        'afsdbrecord', 'aplrecord', 'certrecord', 'cnamerecord', 'dhcidrecord',
+        'dlvrecord', 'dnamerecord', 'dsrecord', 'hiprecord', 'ipseckeyrecord',
+        'keyrecord', 'kxrecord', 'locrecord', 'mxrecord', 'naptrrecord', 'nsrecord',
+        'nsecrecord', 'ptrrecord', 'rrsigrecord', 'rprecord', 'sigrecord', 'spfrecord',
+        'srvrecord', 'sshfprecord', 'tlsarecord', 'txtrecord', 'urirecord',
+    ),
+    single=(
+        'idnsname', 'dnsttl', 'dnsclass',
+    ),
+    interned=(
+        'dnsclass',
+    ),
+)
+
+DnsserverRecord = record_class(
+    'DnsserverRecord',
+    'dnsserver',
+    attributes=(
+        'idnsserverid', 'idnssoamname', 'idnsforwarders', 'idnsforwardpolicy',
+    ),
+    single=(
+        'idnsserverid', 'idnssoamname', 'idnsforwardpolicy',
+    ),
+    interned=(
+        'idnsforwardpolicy',
+    ),
+)
+
+DnszoneRecord = record_class(
+    'DnszoneRecord',
+    'dnszone',
+    attributes=(
+        'idnsname', 'name_from_ip', 'idnszoneactive', 'idnsforwarders',
+        'idnsforwardpolicy', 'idnssoamname', 'idnssoarname', 'idnssoaserial',
+        'idnssoarefresh', 'idnssoaretry', 'idnssoaexpire', 'idnssoaminimum', 'dnsttl',
+        'dnsdefaultttl', 'dnsclass', 'idnsupdatepolicy', 'idnsallowdynupdate',
+        'idnsallowquery', 'idnsallowtransfer', 'idnsallowsyncptr',
+        'idnssecinlinesigning', 'nsec3paramrecord',
+    ),
+    single=(
+        'idnsname', 'name_from_ip', 'idnszoneactive', 'idnsforwardpolicy',
+        'idnssoamname', 'idnssoarname', 'idnssoaserial', 'idnssoarefresh',
+        'idnssoaretry', 'idnssoaexpire', 'idnssoaminimum', 'dnsttl', 'dnsdefaultttl',
+        'dnsclass', 'idnsupdatepolicy', 'idnsallowdynupdate', 'idnsallowquery',
+        'idnsallowtransfer', 'idnsallowsyncptr', 'idnssecinlinesigning',
+        'nsec3paramrecord',
+    ),
+    interned=(
+        'idnszoneactive', 'idnsforwardpolicy', 'dnsclass', 'idnsallowdynupdate',
+        'idnsallowsyncptr', 'idnssecinlinesigning',
+    ),
+)
+
+GroupRecord = record_class(
+    'GroupRecord',
+    'group',
+    attributes=(
+        'cn', 'description', 'gidnumber', 'member_group', 'memberindirect_group',
+        'member_service', 'memberindirect_service', 'member_user',
+        'memberindirect_user', 'memberof_group', 'memberofindirect_group',
+        'memberof_hbacrule', 'memberofindirect_hbacrule', 'memberof_netgroup',
+        'memberofindirect_netgroup', 'memberof_role', 'memberofindirect_role',
+        'memberof_sudorule', 'memberofindirect_sudorule',
+    ),
+    single=(
+        'cn', 'description', 'gidnumber',
+    ),
+    interned=(
+        'member_group', 'memberindirect_group', 'member_service',
+        'memberindirect_service', 'member_user', 'memberindirect_user',
+        'memberof_group', 'memberofindirect_group', 'memberof_hbacrule',
+        'memberofindirect_hbacrule', 'memberof_netgroup', 'memberofindirect_netgroup',
+        'memberof_role', 'memberofindirect_role', 'memberof_sudorule',
+        'memberofindirect_sudorule',
+    ),
+)
+
+HbacruleRecord = record_class(
+    'HbacruleRecord',
+    'hbacrule',
+    attributes=(
+        'cn', 'accessruletype', 'usercategory', 'hostcategory', 'sourcehostcategory',
+        'servicecategory', 'description', 'ipaenabledflag', 'externalhost',
+    ),
+    single=(
+        'cn', 'accessruletype', 'usercategory', 'hostcategory', 'sourcehostcategory',
+        'servicecategory', 'description', 'ipaenabledflag',
+    ),
+    interned=(
+        'accessruletype', 'usercategory', 'hostcategory', 'sourcehostcategory',
+        'servicecategory', 'ipaenabledflag',
+    ),
+)
+
+HbacsvcRecord = record_class(
+    'HbacsvcRecord',
+    'hbacsvc',
+    attributes=(
+        'cn', 'description',
+    ),
+    single=(
+        'cn', 'description',
+    ),
+    interned=(
+    ),
+)
+
+HbacsvcgroupRecord = record_class(
+    'HbacsvcgroupRecord',
+    'hbacsvcgroup',
+    attributes=(
+        'cn', 'description',
+    ),
+    single=(
+        'cn', 'description',
+    ),
+    interned=(
+    ),
+)
+
+HostRecord = record_class(
+    'HostRecord',
+    'host',
+    attributes=(
+        'fqdn', 'description', 'l', 'nshostlocation', 'nshardwareplatform',
+        'nsosversion', 'usercertificate', 'macaddress', 'userclass',
+        'ipaassignedidview', 'krbprincipalauthind', 'memberof_hbacrule',
+        'memberofindirect_hbacrule', 'memberof_hostgroup', 'memberofindirect_hostgroup',
+        'memberof_netgroup', 'memberofindirect_netgroup', 'memberof_role',
+        'memberofindirect_role', 'memberof_sudorule', 'memberofindirect_sudorule',
+    ),
+    single=(
+        'fqdn', 'description', 'l', 'nshostlocation', 'nshardwareplatform',
+        'nsosversion', 'ipaassignedidview',
+    ),
+    interned=(
+        'krbprincipalauthind', 'memberof_hbacrule', 'memberofindirect_hbacrule',
+        'memberof_hostgroup', 'memberofindirect_hostgroup', 'memberof_netgroup',
+        'memberofindirect_netgroup', 'memberof_role', 'memberofindirect_role',
+        'memberof_sudorule', 'memberofindirect_sudorule',
+    ),
+)
+
+HostgroupRecord = record_class(
+    'HostgroupRecord',
+    'hostgroup',
+    attributes=(
+        'cn', 'description', 'member_host', 'memberindirect_host', 'member_hostgroup',
+        'memberindirect_hostgroup', 'memberof_hbacrule', 'memberofindirect_hbacrule',
+        'memberof_hostgroup', 'memberofindirect_hostgroup', 'memberof_netgroup',
+        'memberofindirect_netgroup', 'memberof_sudorule', 'memberofindirect_sudorule',
+    ),
+    single=(
+        'cn', 'description',
+    ),
+    interned=(
+        'member_host', 'memberindirect_host', 'member_hostgroup',
+        'memberindirect_hostgroup', 'memberof_hbacrule', 'memberofindirect_hbacrule',
+        'memberof_hostgroup', 'memberofindirect_hostgroup', 'memberof_netgroup',
+        'memberofindirect_netgroup', 'memberof_sudorule', 'memberofindirect_sudorule',
+    ),
+)
+
+IdoverridegroupRecord = record_class(
+    'IdoverridegroupRecord',
+    'idoverridegroup',
+    attributes=(
+        'ipaanchoruuid', 'description', 'cn', 'gidnumber',
+    ),
+    single=(
+        'ipaanchoruuid', 'description', 'cn', 'gidnumber',
+    ),
+    interned=(
+    ),
+)
+
+IdoverrideuserRecord = record_class(
+    'IdoverrideuserRecord',
+    'idoverrideuser',
+    attributes=(
+        'ipaanchoruuid', 'description', 'uid', 'uidnumber', 'gecos', 'gidnumber',
+        'homedirectory', 'loginshell', 'ipaoriginaluid',
+    ),
+    single=(
+        'ipaanchoruuid', 'description', 'uid', 'uidnumber', 'gecos', 'gidnumber',
+        'homedirectory', 'loginshell', 'ipaoriginaluid',
+    ),
+    interned=(
+    ),
+)
+
+IdrangeRecord = record_class(
+    'IdrangeRecord',
+    'idrange',
+    attributes=(
+        'cn', 'ipabaseid', 'ipaidrangesize', 'ipabaserid', 'ipasecondarybaserid',
+        'ipanttrusteddomainsid', 'iparangetype',
+    ),
+    single=(
+        'cn', 'ipabaseid', 'ipaidrangesize', 'ipabaserid', 'ipasecondarybaserid',
+        'ipanttrusteddomainsid', 'iparangetype',
+    ),
+    interned=(
+        'iparangetype',
+    ),
+)
+
+IdviewRecord = record_class(
+    'IdviewRecord',
+    'idview',
+    attributes=(
+        'cn', 'description',
+    ),
+    single=(
+        'cn', 'description',
+    ),
+    interned=(
+    ),
+)
+
+LocationRecord = record_class(
+    'LocationRecord',
+    'location',
+    attributes=(
+        'idnsname', 'description',
+    ),
+    single=(
+        'idnsname', 'description',
+    ),
+    interned=(
+    ),
+)
+
+NetgroupRecord = record_class(
+    'NetgroupRecord',
+    'netgroup',
+    attributes=(
+        'cn', 'description', 'nisdomainname', 'ipauniqueid', 'usercategory',
+        'hostcategory', 'externalhost', 'member_group', 'memberindirect_group',
+        'member_host', 'memberindirect_host', 'member_hostgroup',
+        'memberindirect_hostgroup', 'member_netgroup', 'memberindirect_netgroup',
+        'member_user', 'memberindirect_user', 'memberof_netgroup',
+        'memberofindirect_netgroup',
+    ),
+    single=(
+        'cn', 'description', 'nisdomainname', 'ipauniqueid', 'usercategory',
+        'hostcategory',
+    ),
+    interned=(
+        'usercategory', 'hostcategory', 'member_group', 'memberindirect_group',
+        'member_host', 'memberindirect_host', 'member_hostgroup',
+        'memberindirect_hostgroup', 'member_netgroup', 'memberindirect_netgroup',
+        'member_user', 'memberindirect_user', 'memberof_netgroup',
+        'memberofindirect_netgroup',
+    ),
+)
+
+OtptokenRecord = record_class(
+    'OtptokenRecord',
+    'otptoken',
+    attributes=(
+        'ipatokenuniqueid', 'type', 'description', 'ipatokenowner', 'ipatokendisabled',
+        'ipatokennotbefore', 'ipatokennotafter', 'ipatokenvendor', 'ipatokenmodel',
+        'ipatokenserial', 'ipatokenotpalgorithm', 'ipatokenotpdigits',
+        'ipatokentotpclockoffset', 'ipatokentotptimestep', 'ipatokenhotpcounter',
+    ),
+    single=(
+        'ipatokenuniqueid', 'type', 'description', 'ipatokenowner', 'ipatokendisabled',
+        'ipatokennotbefore', 'ipatokennotafter', 'ipatokenvendor', 'ipatokenmodel',
+        'ipatokenserial', 'ipatokenotpalgorithm', 'ipatokenotpdigits',
+        'ipatokentotpclockoffset', 'ipatokentotptimestep', 'ipatokenhotpcounter',
+    ),
+    interned=(
+        'type', 'ipatokendisabled', 'ipatokenotpalgorithm', 'ipatokenotpdigits',
+    ),
+)
+
+OutputRecord = record_class(
+    'OutputRecord',
+    'output',
+    attributes=(
+        'name',
+    ),
+    single=(
+        'name',
+    ),
+    interned=(
+    ),
+)
+
+ParamRecord = record_class(
+    'ParamRecord',
+    'param',
+    attributes=(
+        'name',
+    ),
+    single=(
+        'name',
+    ),
+    interned=(
+    ),
+)
+
+PermissionRecord = record_class(
+    'PermissionRecord',
+    'permission',
+    attributes=(
+        'cn', 'ipapermright', 'attrs', 'ipapermincludedattr', 'ipapermexcludedattr',
+        'ipapermdefaultattr', 'ipapermbindruletype', 'ipapermlocation',
+        'extratargetfilter', 'ipapermtargetfilter', 'ipapermtarget', 'ipapermtargetto',
+        'ipapermtargetfrom', 'memberof', 'targetgroup', 'type', 'permissions', 'filter',
+        'subtree',
+    ),
+    single=(
+        'cn', 'ipapermbindruletype', 'ipapermlocation', 'ipapermtarget',
+        'ipapermtargetto', 'ipapermtargetfrom', 'targetgroup', 'type', 'subtree',
+    ),
+    interned=(
+        'ipapermright', 'ipapermbindruletype',
+    ),
+)
+
+PrivilegeRecord = record_class(
+    'PrivilegeRecord',
+    'privilege',
+    attributes=(
+        'cn', 'description',
+    ),
+    single=(
+        'cn', 'description',
+    ),
+    interned=(
+    ),
+)
+
+PwpolicyRecord = record_class(
+    'PwpolicyRecord',
+    'pwpolicy',
+    attributes=(
+        'cn', 'krbmaxpwdlife', 'krbminpwdlife', 'krbpwdhistorylength',
+        'krbpwdmindiffchars', 'krbpwdminlength', 'cospriority', 'krbpwdmaxfailure',
+        'krbpwdfailurecountinterval', 'krbpwdlockoutduration',
+    ),
+    single=(
+        'cn', 'krbmaxpwdlife', 'krbminpwdlife', 'krbpwdhistorylength',
+        'krbpwdmindiffchars', 'krbpwdminlength', 'cospriority', 'krbpwdmaxfailure',
+        'krbpwdfailurecountinterval', 'krbpwdlockoutduration',
+    ),
+    interned=(
+    ),
+)
+
+RadiusproxyRecord = record_class(
+    'RadiusproxyRecord',
+    'radiusproxy',
+    attributes=(
+        'cn', 'description', 'ipatokenradiusserver', 'ipatokenradiussecret',
+        'ipatokenradiustimeout', 'ipatokenradiusretries', 'ipatokenusermapattribute',
+    ),
+    single=(
+        'cn', 'description', 'ipatokenradiussecret', 'ipatokenradiustimeout',
+        'ipatokenradiusretries', 'ipatokenusermapattribute',
+    ),
+    interned=(
+    ),
+)
+
+RoleRecord = record_class(
+    'RoleRecord',
+    'role',
+    attributes=(
+        'cn', 'description',
+    ),
+    single=(
+        'cn', 'description',
+    ),
+    interned=(
+    ),
+)
+
+SelfserviceRecord = record_class(
+    'SelfserviceRecord',
+    'selfservice',
+    attributes=(
+        'aciname', 'permissions', 'attrs',
+    ),
+    single=(
+        'aciname',
+    ),
+    interned=(
+    ),
+)
+
+SelinuxusermapRecord = record_class(
+    'SelinuxusermapRecord',
+    'selinuxusermap',
+    attributes=(
+        'cn', 'ipaselinuxuser', 'seealso', 'usercategory', 'hostcategory',
+        'description', 'ipaenabledflag',
+    ),
+    single=(
+        'cn', 'ipaselinuxuser', 'seealso', 'usercategory', 'hostcategory',
+        'description', 'ipaenabledflag',
+    ),
+    interned=(
+        'usercategory', 'hostcategory', 'ipaenabledflag',
+    ),
+)
+
+ServerRecord = record_class(
+    'ServerRecord',
+    'server',
+    attributes=(
+        'cn', 'ipamindomainlevel', 'ipamaxdomainlevel', 'servrole',
+        'member_topologysuffix', 'memberindirect_topologysuffix', 'memberof_location',
+        'memberofindirect_location',
+    ),
+    single=(
+        'cn', 'ipamindomainlevel', 'ipamaxdomainlevel',
+    ),
+    interned=(
+        'member_topologysuffix', 'memberindirect_topologysuffix', 'memberof_location',
+        'memberofindirect_location',
+    ),
+)
+
+ServerRoleRecord = record_class(
+    'ServerRoleRecord',
+    'server_role',
+    attributes=(
+        'role_servrole', 'server_server', 'status',
+    ),
+    single=(
+        'role_servrole', 'server_server', 'status',
+    ),
+    interned=(
+        'status',
+    ),
+)
+
+ServiceRecord = record_class(
+    'ServiceRecord',
+    'service',
+    attributes=(
+        'krbcanonicalname', 'krbprincipalname', 'ipakrbauthzdata',
+        'krbprincipalauthind',
+    ),
+    single=(
+        'krbcanonicalname',
+    ),
+    interned=(
+        'ipakrbauthzdata', 'krbprincipalauthind',
+    ),
+)
+
+ServicedelegationruleRecord = record_class(
+    'ServicedelegationruleRecord',
+    'servicedelegationrule',
+    attributes=(
+        'cn',
+    ),
+    single=(
+        'cn',
+    ),
+    interned=(
+    ),
+)
+
+ServicedelegationtargetRecord = record_class(
+    'ServicedelegationtargetRecord',
+    'servicedelegationtarget',
+    attributes=(
+        'cn',
+    ),
+    single=(
+        'cn',
+    ),
+    interned=(
+    ),
+)
+
+StageuserRecord = record_class(
+    'StageuserRecord',
+    'stageuser',
+    attributes=(
+        'uid', 'givenname', 'sn', 'cn', 'displayname', 'initials', 'homedirectory',
+        'gecos', 'loginshell', 'krbprincipalname', 'krbprincipalexpiration',
+        'krbpasswordexpiration', 'mail', 'userpassword', 'uidnumber', 'gidnumber',
+        'street', 'l', 'st', 'postalcode', 'telephonenumber', 'mobile', 'pager',
+        'facsimiletelephonenumber', 'ou', 'title', 'manager', 'carlicense',
+        'ipauserauthtype', 'userclass', 'ipatokenradiusconfiglink',
+        'ipatokenradiususername', 'departmentnumber', 'employeenumber', 'employeetype',
+        'preferredlanguage', 'usercertificate', 'ipantlogonscript', 'ipantprofilepath',
+        'ipanthomedirectory', 'ipanthomedirectoryrive', 'memberof_group',
+        'memberofindirect_group', 'memberof_hbacrule', 'memberofindirect_hbacrule',
+        'memberof_netgroup', 'memberofindirect_netgroup', 'memberof_role',
+        'memberofindirect_role', 'memberof_sudorule', 'memberofindirect_sudorule',
+    ),
+    single=(
+        'uid', 'givenname', 'sn', 'cn', 'displayname', 'initials', 'homedirectory',
+        'gecos', 'loginshell', 'krbprincipalexpiration', 'krbpasswordexpiration',
+        'userpassword', 'uidnumber', 'gidnumber', 'street', 'l', 'st', 'postalcode',
+        'ou', 'title', 'ipatokenradiusconfiglink', 'ipatokenradiususername',
+        'employeenumber', 'employeetype', 'preferredlanguage', 'ipantlogonscript',
+        'ipantprofilepath', 'ipanthomedirectory', 'ipanthomedirectoryrive',
+    ),
+    interned=(
+        'ipauserauthtype', 'ipanthomedirectoryrive', 'memberof_group',
+        'memberofindirect_group', 'memberof_hbacrule', 'memberofindirect_hbacrule',
+        'memberof_netgroup', 'memberofindirect_netgroup', 'memberof_role',
+        'memberofindirect_role', 'memberof_sudorule', 'memberofindirect_sudorule',
+    ),
+)
+
+SudocmdRecord = record_class(
+    'SudocmdRecord',
+    'sudocmd',
+    attributes=(
+        'sudocmd', 'description',
+    ),
+    single=(
+        'sudocmd', 'description',
+    ),
+    interned=(
+    ),
+)
+
+SudocmdgroupRecord = record_class(
+    'SudocmdgroupRecord',
+    'sudocmdgroup',
+    attributes=(
+        'cn', 'description',
+    ),
+    single=(
+        'cn', 'description',
+    ),
+    interned=(
+    ),
+)
+
+SudoruleRecord = record_class(
+    'SudoruleRecord',
+    'sudorule',
+    attributes=(
+        'cn', 'description', 'ipaenabledflag', 'usercategory', 'hostcategory',
+        'cmdcategory', 'ipasudorunasusercategory', 'ipasudorunasgroupcategory',
+        'sudoorder', 'externaluser', 'externalhost', 'ipasudorunasextuser',
+        'ipasudorunasextgroup',
+    ),
+    single=(
+        'cn', 'description', 'ipaenabledflag', 'usercategory', 'hostcategory',
+        'cmdcategory', 'ipasudorunasusercategory', 'ipasudorunasgroupcategory',
+        'sudoorder',
+    ),
+    interned=(
+        'ipaenabledflag', 'usercategory', 'hostcategory', 'cmdcategory',
+        'ipasudorunasusercategory', 'ipasudorunasgroupcategory',
+    ),
+)
+
+TopicRecord = record_class(
+    'TopicRecord',
+    'topic',
+    attributes=(
+        'full_name',
+    ),
+    single=(
+        'full_name',
+    ),
+    interned=(
+    ),
+)
+
+TopologysegmentRecord = record_class(
+    'TopologysegmentRecord',
+    'topologysegment',
+    attributes=(
+        'cn', 'iparepltoposegmentleftnode', 'iparepltoposegmentrightnode',
+        'iparepltoposegmentdirection', 'nsds5replicastripattrs',
+        'nsds5replicatedattributelist', 'nsds5replicatedattributelisttotal',
+        'nsds5replicatimeout', 'nsds5replicaenabled',
+    ),
+    single=(
+        'cn', 'iparepltoposegmentleftnode', 'iparepltoposegmentrightnode',
+        'iparepltoposegmentdirection', 'nsds5replicastripattrs',
+        'nsds5replicatedattributelist', 'nsds5replicatedattributelisttotal',
+        'nsds5replicatimeout', 'nsds5replicaenabled',
+    ),
+    interned=(
+        'iparepltoposegmentdirection', 'nsds5replicaenabled',
+    ),
+)
+
+TopologysuffixRecord = record_class(
+    'TopologysuffixRecord',
+    'topologysuffix',
+    attributes=(
+        'cn', 'iparepltopoconfroot',
+    ),
+    single=(
+        'cn', 'iparepltopoconfroot',
+    ),
+    interned=(
+    ),
+)
+
+TrustRecord = record_class(
+    'TrustRecord',
+    'trust',
+    attributes=(
+        'cn', 'ipantflatname', 'ipanttrusteddomainsid', 'ipantsidblacklistincoming',
+        'ipantsidblacklistoutgoing',
+    ),
+    single=(
+        'cn', 'ipantflatname', 'ipanttrusteddomainsid',
+    ),
+    interned=(
+    ),
+)
+
+TrustdomainRecord = record_class(
+    'TrustdomainRecord',
+    'trustdomain',
+    attributes=(
+        'cn', 'ipantflatname', 'ipanttrusteddomainsid',
+    ),
+    single=(
+        'cn', 'ipantflatname', 'ipanttrusteddomainsid',
+    ),
+    interned=(
+    ),
+)
+
+UserRecord = record_class(
+    'UserRecord',
+    'user',
+    attributes=(
+        'uid', 'givenname', 'sn', 'cn', 'displayname', 'initials', 'homedirectory',
+        'gecos', 'loginshell', 'krbprincipalname', 'krbprincipalexpiration',
+        'krbpasswordexpiration', 'mail', 'userpassword', 'uidnumber', 'gidnumber',
+        'street', 'l', 'st', 'postalcode', 'telephonenumber', 'mobile', 'pager',
+        'facsimiletelephonenumber', 'ou', 'title', 'manager', 'carlicense',
+        'ipauserauthtype', 'userclass', 'ipatokenradiusconfiglink',
+        'ipatokenradiususername', 'departmentnumber', 'employeenumber', 'employeetype',
+        'preferredlanguage', 'usercertificate', 'ipantlogonscript', 'ipantprofilepath',
+        'ipanthomedirectory', 'ipanthomedirectoryrive', 'nsaccountlock', 'preserved',
+        'memberof_group', 'memberofindirect_group', 'memberof_hbacrule',
+        'memberofindirect_hbacrule', 'memberof_netgroup', 'memberofindirect_netgroup',
+        'memberof_role', 'memberofindirect_role', 'memberof_sudorule',
+        'memberofindirect_sudorule',
+    ),
+    single=(
+        'uid', 'givenname', 'sn', 'cn', 'displayname', 'initials', 'homedirectory',
+        'gecos', 'loginshell', 'krbprincipalexpiration', 'krbpasswordexpiration',
+        'userpassword', 'uidnumber', 'gidnumber', 'street', 'l', 'st', 'postalcode',
+        'ou', 'title', 'ipatokenradiusconfiglink', 'ipatokenradiususername',
+        'employeenumber', 'employeetype', 'preferredlanguage', 'ipantlogonscript',
+        'ipantprofilepath', 'ipanthomedirectory', 'ipanthomedirectoryrive',
+        'nsaccountlock', 'preserved',
+    ),
+    interned=(
+        'ipauserauthtype', 'ipanthomedirectoryrive', 'nsaccountlock', 'preserved',
+        'memberof_group', 'memberofindirect_group', 'memberof_hbacrule',
+        'memberofindirect_hbacrule', 'memberof_netgroup', 'memberofindirect_netgroup',
+        'memberof_role', 'memberofindirect_role', 'memberof_sudorule',
+        'memberofindirect_sudorule',
+    ),
+)
+
+VaultRecord = record_class(
+    'VaultRecord',
+    'vault',
+    attributes=(
+        'cn', 'description', 'ipavaulttype', 'service', 'username',
+    ),
+    single=(
+        'cn', 'description', 'ipavaulttype', 'service', 'username',
+    ),
+    interned=(
+        'ipavaulttype',
+    ),
+)
+
+RECORDS = {
+    'aci': AciRecord,
+    'automember': AutomemberRecord,
+    'automountkey': AutomountkeyRecord,
+    'automountlocation': AutomountlocationRecord,
+    'automountmap': AutomountmapRecord,
+    'ca': CaRecord,
+    'caacl': CaaclRecord,
+    'cert': CertRecord,
+    'certmaprule': CertmapruleRecord,
+    'certprofile': CertprofileRecord,
+    'class': ClassRecord,
+    'command': CommandRecord,
+    'cosentry': CosentryRecord,
+    'delegation': DelegationRecord,
+    'dnsforwardzone': DnsforwardzoneRecord,
+    'dnsrecord': DnsrecordRecord,
+    'dnsserver': DnsserverRecord,
+    'dnszone': DnszoneRecord,
+    'group': GroupRecord,
+    'hbacrule': HbacruleRecord,
+    'hbacsvc': HbacsvcRecord,
+    'hbacsvcgroup': HbacsvcgroupRecord,
+    'host': HostRecord,
+    'hostgroup': HostgroupRecord,
+    'idoverridegroup': IdoverridegroupRecord,
+    'idoverrideuser': IdoverrideuserRecord,
+    'idrange': IdrangeRecord,
+    'idview': IdviewRecord,
+    'location': LocationRecord,
+    'netgroup': NetgroupRecord,
+    'otptoken': OtptokenRecord,
+    'output': OutputRecord,
+    'param': ParamRecord,
+    'permission': PermissionRecord,
+    'privilege': PrivilegeRecord,
+    'pwpolicy': PwpolicyRecord,
+    'radiusproxy': RadiusproxyRecord,
+    'role': RoleRecord,
+    'selfservice': SelfserviceRecord,
+    'selinuxusermap': SelinuxusermapRecord,
+    'server': ServerRecord,
+    'server_role': ServerRoleRecord,
+    'service': ServiceRecord,
+    'servicedelegationrule': ServicedelegationruleRecord,
+    'servicedelegationtarget': ServicedelegationtargetRecord,
+    'stageuser': StageuserRecord,
+    'sudocmd': SudocmdRecord,
+    'sudocmdgroup': SudocmdgroupRecord,
+    'sudorule': SudoruleRecord,
+    'topic': TopicRecord,
+    'topologysegment': TopologysegmentRecord,
+    'topologysuffix': TopologysuffixRecord,
+    'trust': TrustRecord,
+    'trustdomain': TrustdomainRecord,
+    'user': UserRecord,
+    'vault': VaultRecord,
+}
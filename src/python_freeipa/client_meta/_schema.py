@@ -0,0 +1,22 @@
+class Commands(object):
+
+    def schema(
+        self,
+        o_known_fingerprints=None,
+        **kwargs
+    ):
+        """
+        Store and provide schema for commands and topics
+
+
+        :param o_known_fingerprints: Fingerprint of schema cached by client
+        :type  o_known_fingerprints: str
+        """
+        _args = []
+        _params = {}
+        if o_known_fingerprints is not None:
+            _params['known_fingerprints'] = o_known_fingerprints
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('schema', _args, _params)
@@ -0,0 +1,509 @@
+class Commands(object):
+
+    def selinuxusermap_add(
+        self,
+        a_cn,
+        o_ipaselinuxuser,
+        o_seealso=None,
+        o_usercategory=None,
+        o_hostcategory=None,
+        o_description=None,
+        o_ipaenabledflag=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Create a new SELinux User Map.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_ipaselinuxuser: SELinux User
+        :type  o_ipaselinuxuser: str
+        :param o_seealso: HBAC Rule that defines the users, groups and
+            hostgroups
+        :type  o_seealso: str
+        :param o_usercategory: User category the rule applies to
+        :type  o_usercategory: str, valid values ['all']
+        :param o_hostcategory: Host category the rule applies to
+        :type  o_hostcategory: str, valid values ['all']
+        :param o_description: Description
+        :type  o_description: str
+        :param o_ipaenabledflag: Enabled
+        :type  o_ipaenabledflag: Bool
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'ipaselinuxuser': o_ipaselinuxuser,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_seealso is not None:
+            _params['seealso'] = o_seealso
+        if o_usercategory is not None:
+            _params['usercategory'] = o_usercategory
+        if o_hostcategory is not None:
+            _params['hostcategory'] = o_hostcategory
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipaenabledflag is not None:
+            _params['ipaenabledflag'] = o_ipaenabledflag
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('selinuxusermap_add', _args, _params)
+
+    def selinuxusermap_add_host(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_host=None,
+        o_hostgroup=None,
+        **kwargs
+    ):
+        """
+        Add target hosts and hostgroups to an SELinux User Map rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_host: hosts to add
+        :type  o_host: str
+        :param o_hostgroup: host groups to add
+        :type  o_hostgroup: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_host is not None:
+            _params['host'] = o_host
+        if o_hostgroup is not None:
+            _params['hostgroup'] = o_hostgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('selinuxusermap_add_host', _args, _params)
+
+    def selinuxusermap_add_user(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        **kwargs
+    ):
+        """
+        Add users and groups to an SELinux User Map rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to add
+        :type  o_user: str
+        :param o_group: groups to add
+        :type  o_group: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('selinuxusermap_add_user', _args, _params)
+
+    def selinuxusermap_del(
+        self,
+        a_cn,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete a SELinux User Map.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_cn]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('selinuxusermap_del', _args, _params)
+
+    def selinuxusermap_disable(
+        self,
+        a_cn,
+        **kwargs
+    ):
+        """
+        Disable an SELinux User Map rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        """
+        _args = [a_cn]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('selinuxusermap_disable', _args, _params)
+
+    def selinuxusermap_enable(
+        self,
+        a_cn,
+        **kwargs
+    ):
+        """
+        Enable an SELinux User Map rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        """
+        _args = [a_cn]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('selinuxusermap_enable', _args, _params)
+
+    def selinuxusermap_find(
+        self,
+        a_criteria=None,
+        o_cn=None,
+        o_ipaselinuxuser=None,
+        o_seealso=None,
+        o_usercategory=None,
+        o_hostcategory=None,
+        o_description=None,
+        o_ipaenabledflag=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=True,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for SELinux User Maps.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_cn: Rule name
+        :type  o_cn: str
+        :param o_ipaselinuxuser: SELinux User
+        :type  o_ipaselinuxuser: str
+        :param o_seealso: HBAC Rule that defines the users, groups and
+            hostgroups
+        :type  o_seealso: str
+        :param o_usercategory: User category the rule applies to
+        :type  o_usercategory: str, valid values ['all']
+        :param o_hostcategory: Host category the rule applies to
+        :type  o_hostcategory: str, valid values ['all']
+        :param o_description: Description
+        :type  o_description: str
+        :param o_ipaenabledflag: Enabled
+        :type  o_ipaenabledflag: Bool
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("name")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_ipaselinuxuser is not None:
+            _params['ipaselinuxuser'] = o_ipaselinuxuser
+        if o_seealso is not None:
+            _params['seealso'] = o_seealso
+        if o_usercategory is not None:
+            _params['usercategory'] = o_usercategory
+        if o_hostcategory is not None:
+            _params['hostcategory'] = o_hostcategory
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipaenabledflag is not None:
+            _params['ipaenabledflag'] = o_ipaenabledflag
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('selinuxusermap_find', _args, _params)
+
+    def selinuxusermap_mod(
+        self,
+        a_cn,
+        o_ipaselinuxuser=None,
+        o_seealso=None,
+        o_usercategory=None,
+        o_hostcategory=None,
+        o_description=None,
+        o_ipaenabledflag=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Modify a SELinux User Map.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_ipaselinuxuser: SELinux User
+        :type  o_ipaselinuxuser: str
+        :param o_seealso: HBAC Rule that defines the users, groups and
+            hostgroups
+        :type  o_seealso: str
+        :param o_usercategory: User category the rule applies to
+        :type  o_usercategory: str, valid values ['all']
+        :param o_hostcategory: Host category the rule applies to
+        :type  o_hostcategory: str, valid values ['all']
+        :param o_description: Description
+        :type  o_description: str
+        :param o_ipaenabledflag: Enabled
+        :type  o_ipaenabledflag: Bool
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_ipaselinuxuser is not None:
+            _params['ipaselinuxuser'] = o_ipaselinuxuser
+        if o_seealso is not None:
+            _params['seealso'] = o_seealso
+        if o_usercategory is not None:
+            _params['usercategory'] = o_usercategory
+        if o_hostcategory is not None:
+            _params['hostcategory'] = o_hostcategory
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipaenabledflag is not None:
+            _params['ipaenabledflag'] = o_ipaenabledflag
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('selinuxusermap_mod', _args, _params)
+
+    def selinuxusermap_remove_host(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_host=None,
+        o_hostgroup=None,
+        **kwargs
+    ):
+        """
+        Remove target hosts and hostgroups from an SELinux User Map rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_host: hosts to remove
+        :type  o_host: str
+        :param o_hostgroup: host groups to remove
+        :type  o_hostgroup: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_host is not None:
+            _params['host'] = o_host
+        if o_hostgroup is not None:
+            _params['hostgroup'] = o_hostgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('selinuxusermap_remove_host', _args, _params)
+
+    def selinuxusermap_remove_user(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        **kwargs
+    ):
+        """
+        Remove users and groups from an SELinux User Map rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to remove
+        :type  o_user: str
+        :param o_group: groups to remove
+        :type  o_group: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('selinuxusermap_remove_user', _args, _params)
+
+    def selinuxusermap_show(
+        self,
+        a_cn,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Display the properties of a SELinux User Map rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('selinuxusermap_show', _args, _params)
@@ -0,0 +1,367 @@
+class Commands(object):
+
+    def server_conncheck(
+        self,
+        a_cn,
+        a_remote_cn,
+        **kwargs
+    ):
+        """
+        Check connection to remote IPA server.
+
+
+        :param a_cn: IPA server hostname
+        :type  a_cn: str
+        :param a_remote_cn: Remote IPA server hostname
+        :type  a_remote_cn: str
+        """
+        _args = [a_cn, a_remote_cn]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('server_conncheck', _args, _params)
+
+    def server_del(
+        self,
+        a_cn,
+        o_continue=False,
+        o_ignore_topology_disconnect=False,
+        o_ignore_last_of_role=False,
+        o_force=False,
+        **kwargs
+    ):
+        """
+        Delete IPA server.
+
+
+        :param a_cn: IPA server hostname
+        :type  a_cn: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        :param o_ignore_topology_disconnect: Ignore topology connectivity
+            problems after removal
+        :type  o_ignore_topology_disconnect: bool
+        :param o_ignore_last_of_role: Skip a check whether the last CA master
+            or DNS server is removed
+        :type  o_ignore_last_of_role: bool
+        :param o_force: Force server removal even if it does not exist
+        :type  o_force: bool
+        """
+        _args = [a_cn]
+        _params = {'continue': o_continue}
+        if o_ignore_topology_disconnect is not None:
+            _params['ignore_topology_disconnect'] = o_ignore_topology_disconnect
+        if o_ignore_last_of_role is not None:
+            _params['ignore_last_of_role'] = o_ignore_last_of_role
+        if o_force is not None:
+            _params['force'] = o_force
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('server_del', _args, _params)
+
+    def server_find(
+        self,
+        a_criteria=None,
+        o_cn=None,
+        o_ipamindomainlevel=None,
+        o_ipamaxdomainlevel=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=True,
+        o_pkey_only=False,
+        o_topologysuffix=None,
+        o_no_topologysuffix=None,
+        o_in_location=None,
+        o_not_in_location=None,
+        o_servrole=None,
+        **kwargs
+    ):
+        """
+        Search for IPA servers.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_cn: IPA server hostname
+        :type  o_cn: str
+        :param o_ipamindomainlevel: Minimum domain level
+        :type  o_ipamindomainlevel: int, min value -2147483648, max value 2147483647
+        :param o_ipamaxdomainlevel: Maximum domain level
+        :type  o_ipamaxdomainlevel: int, min value -2147483648, max value 2147483647
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("name")
+        :type  o_pkey_only: bool
+        :param o_topologysuffix: Search for servers with these managed
+            suffixes.
+        :type  o_topologysuffix: str
+        :param o_no_topologysuffix: Search for servers without these managed
+            suffixes.
+        :type  o_no_topologysuffix: str
+        :param o_in_location: Search for servers with these ipa locations.
+        :type  o_in_location: DNSNameParam
+        :param o_not_in_location: Search for servers without these ipa
+            locations.
+        :type  o_not_in_location: DNSNameParam
+        :param o_servrole: Search for servers with these enabled roles.
+        :type  o_servrole: str
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_ipamindomainlevel is not None:
+            _params['ipamindomainlevel'] = o_ipamindomainlevel
+        if o_ipamaxdomainlevel is not None:
+            _params['ipamaxdomainlevel'] = o_ipamaxdomainlevel
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if o_topologysuffix is not None:
+            _params['topologysuffix'] = o_topologysuffix
+        if o_no_topologysuffix is not None:
+            _params['no_topologysuffix'] = o_no_topologysuffix
+        if o_in_location is not None:
+            _params['in_location'] = o_in_location
+        if o_not_in_location is not None:
+            _params['not_in_location'] = o_not_in_location
+        if o_servrole is not None:
+            _params['servrole'] = o_servrole
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('server_find', _args, _params)
+
+    def server_mod(
+        self,
+        a_cn,
+        o_ipalocation_location=None,
+        o_ipaserviceweight=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Modify information about an IPA server.
+
+
+        :param a_cn: IPA server hostname
+        :type  a_cn: str
+        :param o_ipalocation_location: Server location
+        :type  o_ipalocation_location: DNSNameParam
+        :param o_ipaserviceweight: Weight for server services
+        :type  o_ipaserviceweight: int, min value 0, max value 65535
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_ipalocation_location is not None:
+            _params['ipalocation_location'] = o_ipalocation_location
+        if o_ipaserviceweight is not None:
+            _params['ipaserviceweight'] = o_ipaserviceweight
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('server_mod', _args, _params)
+
+    def server_role_find(
+        self,
+        a_criteria=None,
+        o_server_server=None,
+        o_role_servrole=None,
+        o_status=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_include_master=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Find a server role on a server(s)
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_server_server: IPA server hostname
+        :type  o_server_server: str
+        :param o_role_servrole: IPA server role name
+        :type  o_role_servrole: str
+        :param o_status: Status of the role
+        :type  o_status: str, valid values ['enabled', 'configured', 'hidden', 'absent']
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_include_master: Include IPA master entries
+        :type  o_include_master: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_criteria]
+        _params = {'include_master': o_include_master, 'all': o_all, 'raw': o_raw}
+        if o_server_server is not None:
+            _params['server_server'] = o_server_server
+        if o_role_servrole is not None:
+            _params['role_servrole'] = o_role_servrole
+        if o_status is not None:
+            _params['status'] = o_status
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('server_role_find', _args, _params)
+
+    def server_role_show(
+        self,
+        a_server_server,
+        a_role_servrole,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Show role status on a server
+
+
+        :param a_server_server: IPA server hostname
+        :type  a_server_server: str
+        :param a_role_servrole: IPA server role name
+        :type  a_role_servrole: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_server_server, a_role_servrole]
+        _params = {'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('server_role_show', _args, _params)
+
+    def server_show(
+        self,
+        a_cn,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Show IPA server.
+
+
+        :param a_cn: IPA server hostname
+        :type  a_cn: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('server_show', _args, _params)
+
+    def server_state(
+        self,
+        a_cn,
+        o_state,
+        **kwargs
+    ):
+        """
+        Set enabled/hidden state of a server.
+
+
+        :param a_cn: IPA server hostname
+        :type  a_cn: str
+        :param o_state: Server state
+        :type  o_state: str, valid values ['enabled', 'hidden']
+        """
+        _args = [a_cn]
+        _params = {'state': o_state}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('server_state', _args, _params)
@@ -0,0 +1,845 @@
+class Commands(object):
+
+    def service_add(
+        self,
+        a_krbcanonicalname,
+        o_usercertificate=None,
+        o_ipakrbauthzdata=None,
+        o_krbprincipalauthind=None,
+        o_ipakrbrequirespreauth=None,
+        o_ipakrbokasdelegate=None,
+        o_ipakrboktoauthasdelegate=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_force=False,
+        o_skip_host_check=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Add a new IPA service.
+
+
+        :param a_krbcanonicalname: Service principal
+        :type  a_krbcanonicalname: Principal
+        :param o_usercertificate: Base-64 encoded service certificate
+        :type  o_usercertificate: Certificate
+        :param o_ipakrbauthzdata: Override default list of supported PAC
+            types. Use 'NONE' to disable PAC support for this service, e.g. this
+            might be necessary for NFS services.
+        :type  o_ipakrbauthzdata: list of str, valid values ['MS-PAC', 'PAD', 'NONE']
+        :param o_krbprincipalauthind: Defines a whitelist for Authentication
+            Indicators. Use 'otp' to allow OTP-based 2FA authentications. Use
+            'radius' to allow RADIUS-based 2FA authentications. Use 'pkinit' to
+            allow PKINIT-based 2FA authentications. Use 'hardened' to allow brute-
+            force hardened password authentication by SPAKE or FAST. With no
+            indicator specified, all authentication mechanisms are allowed.
+        :type  o_krbprincipalauthind: list of str, valid values ['radius', 'otp', 'pkinit', 'hardened']
+        :param o_ipakrbrequirespreauth: Pre-authentication is required for the
+            service
+        :type  o_ipakrbrequirespreauth: Bool
+        :param o_ipakrbokasdelegate: Client credentials may be delegated to
+            the service
+        :type  o_ipakrbokasdelegate: Bool
+        :param o_ipakrboktoauthasdelegate: The service is allowed to
+            authenticate on behalf of a client
+        :type  o_ipakrboktoauthasdelegate: Bool
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_force: force principal name even if host not in DNS
+        :type  o_force: bool
+        :param o_skip_host_check: force service to be created even when host
+            object does not exist to manage it
+        :type  o_skip_host_check: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_krbcanonicalname]
+        _params = {
+            'force': o_force,
+            'skip_host_check': o_skip_host_check,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_usercertificate is not None:
+            _params['usercertificate'] = o_usercertificate
+        if o_ipakrbauthzdata is not None:
+            _params['ipakrbauthzdata'] = o_ipakrbauthzdata
+        if o_krbprincipalauthind is not None:
+            _params['krbprincipalauthind'] = o_krbprincipalauthind
+        if o_ipakrbrequirespreauth is not None:
+            _params['ipakrbrequirespreauth'] = o_ipakrbrequirespreauth
+        if o_ipakrbokasdelegate is not None:
+            _params['ipakrbokasdelegate'] = o_ipakrbokasdelegate
+        if o_ipakrboktoauthasdelegate is not None:
+            _params['ipakrboktoauthasdelegate'] = o_ipakrboktoauthasdelegate
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('service_add', _args, _params)
+
+    def service_add_cert(
+        self,
+        a_krbcanonicalname,
+        o_usercertificate,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Add new certificates to a service
+
+
+        :param a_krbcanonicalname: Service principal
+        :type  a_krbcanonicalname: Principal
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_usercertificate: Base-64 encoded service certificate
+        :type  o_usercertificate: Certificate
+        """
+        _args = [a_krbcanonicalname]
+        _params = {
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+            'usercertificate': o_usercertificate,
+        }
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('service_add_cert', _args, _params)
+
+    def service_add_host(
+        self,
+        a_krbcanonicalname,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_host=None,
+        **kwargs
+    ):
+        """
+        Add hosts that can manage this service.
+
+
+        :param a_krbcanonicalname: Service principal
+        :type  a_krbcanonicalname: Principal
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_host: hosts to add
+        :type  o_host: str
+        """
+        _args = [a_krbcanonicalname]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_host is not None:
+            _params['host'] = o_host
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('service_add_host', _args, _params)
+
+    def service_add_principal(
+        self,
+        a_krbcanonicalname,
+        a_krbprincipalname,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Add new principal alias to a service
+
+
+        :param a_krbcanonicalname: Service principal
+        :type  a_krbcanonicalname: Principal
+        :param a_krbprincipalname: Service principal alias
+        :type  a_krbprincipalname: Principal
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_krbcanonicalname, a_krbprincipalname]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('service_add_principal', _args, _params)
+
+    def service_add_smb(
+        self,
+        a_fqdn,
+        a_ipantflatname=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_usercertificate=None,
+        o_ipakrbokasdelegate=None,
+        o_ipakrboktoauthasdelegate=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Add a new SMB service.
+
+
+        :param a_fqdn: Host name
+        :type  a_fqdn: str
+        :param a_ipantflatname: SMB service NetBIOS name
+        :type  a_ipantflatname: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_usercertificate: Base-64 encoded service certificate
+        :type  o_usercertificate: Certificate
+        :param o_ipakrbokasdelegate: Client credentials may be delegated to
+            the service
+        :type  o_ipakrbokasdelegate: Bool
+        :param o_ipakrboktoauthasdelegate: The service is allowed to
+            authenticate on behalf of a client
+        :type  o_ipakrboktoauthasdelegate: Bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_fqdn, a_ipantflatname]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_usercertificate is not None:
+            _params['usercertificate'] = o_usercertificate
+        if o_ipakrbokasdelegate is not None:
+            _params['ipakrbokasdelegate'] = o_ipakrbokasdelegate
+        if o_ipakrboktoauthasdelegate is not None:
+            _params['ipakrboktoauthasdelegate'] = o_ipakrboktoauthasdelegate
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('service_add_smb', _args, _params)
+
+    def service_allow_create_keytab(
+        self,
+        a_krbcanonicalname,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        o_host=None,
+        o_hostgroup=None,
+        **kwargs
+    ):
+        """
+        Allow users, groups, hosts or host groups to create a keytab of this service.
+
+
+        :param a_krbcanonicalname: Service principal
+        :type  a_krbcanonicalname: Principal
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to add
+        :type  o_user: str
+        :param o_group: groups to add
+        :type  o_group: str
+        :param o_host: hosts to add
+        :type  o_host: str
+        :param o_hostgroup: host groups to add
+        :type  o_hostgroup: str
+        """
+        _args = [a_krbcanonicalname]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if o_host is not None:
+            _params['host'] = o_host
+        if o_hostgroup is not None:
+            _params['hostgroup'] = o_hostgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('service_allow_create_keytab', _args, _params)
+
+    def service_allow_retrieve_keytab(
+        self,
+        a_krbcanonicalname,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        o_host=None,
+        o_hostgroup=None,
+        **kwargs
+    ):
+        """
+        Allow users, groups, hosts or host groups to retrieve a keytab of this service.
+
+
+        :param a_krbcanonicalname: Service principal
+        :type  a_krbcanonicalname: Principal
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to add
+        :type  o_user: str
+        :param o_group: groups to add
+        :type  o_group: str
+        :param o_host: hosts to add
+        :type  o_host: str
+        :param o_hostgroup: host groups to add
+        :type  o_hostgroup: str
+        """
+        _args = [a_krbcanonicalname]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if o_host is not None:
+            _params['host'] = o_host
+        if o_hostgroup is not None:
+            _params['hostgroup'] = o_hostgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('service_allow_retrieve_keytab', _args, _params)
+
+    def service_del(
+        self,
+        a_krbcanonicalname,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete an IPA service.
+
+
+        :param a_krbcanonicalname: Service principal
+        :type  a_krbcanonicalname: Principal
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_krbcanonicalname]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('service_del', _args, _params)
+
+    def service_disable(
+        self,
+        a_krbcanonicalname,
+        **kwargs
+    ):
+        """
+        Disable the Kerberos key and SSL certificate of a service.
+
+
+        :param a_krbcanonicalname: Service principal
+        :type  a_krbcanonicalname: Principal
+        """
+        _args = [a_krbcanonicalname]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('service_disable', _args, _params)
+
+    def service_disallow_create_keytab(
+        self,
+        a_krbcanonicalname,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        o_host=None,
+        o_hostgroup=None,
+        **kwargs
+    ):
+        """
+        Disallow users, groups, hosts or host groups to create a keytab of this service.
+
+
+        :param a_krbcanonicalname: Service principal
+        :type  a_krbcanonicalname: Principal
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to remove
+        :type  o_user: str
+        :param o_group: groups to remove
+        :type  o_group: str
+        :param o_host: hosts to remove
+        :type  o_host: str
+        :param o_hostgroup: host groups to remove
+        :type  o_hostgroup: str
+        """
+        _args = [a_krbcanonicalname]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if o_host is not None:
+            _params['host'] = o_host
+        if o_hostgroup is not None:
+            _params['hostgroup'] = o_hostgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('service_disallow_create_keytab', _args, _params)
+
+    def service_disallow_retrieve_keytab(
+        self,
+        a_krbcanonicalname,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        o_host=None,
+        o_hostgroup=None,
+        **kwargs
+    ):
+        """
+        Disallow users, groups, hosts or host groups to retrieve a keytab of this service.
+
+
+        :param a_krbcanonicalname: Service principal
+        :type  a_krbcanonicalname: Principal
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to remove
+        :type  o_user: str
+        :param o_group: groups to remove
+        :type  o_group: str
+        :param o_host: hosts to remove
+        :type  o_host: str
+        :param o_hostgroup: host groups to remove
+        :type  o_hostgroup: str
+        """
+        _args = [a_krbcanonicalname]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if o_host is not None:
+            _params['host'] = o_host
+        if o_hostgroup is not None:
+            _params['hostgroup'] = o_hostgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('service_disallow_retrieve_keytab', _args, _params)
+
+    def service_find(
+        self,
+        a_criteria=None,
+        o_krbcanonicalname=None,
+        o_krbprincipalname=None,
+        o_ipakrbauthzdata=None,
+        o_krbprincipalauthind=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=True,
+        o_pkey_only=False,
+        o_man_by_host=None,
+        o_not_man_by_host=None,
+        **kwargs
+    ):
+        """
+        Search for IPA services.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_krbcanonicalname: Service principal
+        :type  o_krbcanonicalname: Principal
+        :param o_krbprincipalname: Service principal alias
+        :type  o_krbprincipalname: Principal
+        :param o_ipakrbauthzdata: Override default list of supported PAC
+            types. Use 'NONE' to disable PAC support for this service, e.g. this
+            might be necessary for NFS services.
+        :type  o_ipakrbauthzdata: list of str, valid values ['MS-PAC', 'PAD', 'NONE']
+        :param o_krbprincipalauthind: Defines a whitelist for Authentication
+            Indicators. Use 'otp' to allow OTP-based 2FA authentications. Use
+            'radius' to allow RADIUS-based 2FA authentications. Use 'pkinit' to
+            allow PKINIT-based 2FA authentications. Use 'hardened' to allow brute-
+            force hardened password authentication by SPAKE or FAST. With no
+            indicator specified, all authentication mechanisms are allowed.
+        :type  o_krbprincipalauthind: list of str, valid values ['radius', 'otp', 'pkinit', 'hardened']
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("canonical-principal")
+        :type  o_pkey_only: bool
+        :param o_man_by_host: Search for services with these managed by hosts.
+        :type  o_man_by_host: str
+        :param o_not_man_by_host: Search for services without these managed by
+            hosts.
+        :type  o_not_man_by_host: str
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_krbcanonicalname is not None:
+            _params['krbcanonicalname'] = o_krbcanonicalname
+        if o_krbprincipalname is not None:
+            _params['krbprincipalname'] = o_krbprincipalname
+        if o_ipakrbauthzdata is not None:
+            _params['ipakrbauthzdata'] = o_ipakrbauthzdata
+        if o_krbprincipalauthind is not None:
+            _params['krbprincipalauthind'] = o_krbprincipalauthind
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if o_man_by_host is not None:
+            _params['man_by_host'] = o_man_by_host
+        if o_not_man_by_host is not None:
+            _params['not_man_by_host'] = o_not_man_by_host
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('service_find', _args, _params)
+
+    def service_mod(
+        self,
+        a_krbcanonicalname,
+        o_krbprincipalname=None,
+        o_usercertificate=None,
+        o_ipakrbauthzdata=None,
+        o_krbprincipalauthind=None,
+        o_ipakrbrequirespreauth=None,
+        o_ipakrbokasdelegate=None,
+        o_ipakrboktoauthasdelegate=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Modify an existing IPA service.
+
+
+        :param a_krbcanonicalname: Service principal
+        :type  a_krbcanonicalname: Principal
+        :param o_krbprincipalname: Service principal alias
+        :type  o_krbprincipalname: Principal
+        :param o_usercertificate: Base-64 encoded service certificate
+        :type  o_usercertificate: Certificate
+        :param o_ipakrbauthzdata: Override default list of supported PAC
+            types. Use 'NONE' to disable PAC support for this service, e.g. this
+            might be necessary for NFS services.
+        :type  o_ipakrbauthzdata: list of str, valid values ['MS-PAC', 'PAD', 'NONE']
+        :param o_krbprincipalauthind: Defines a whitelist for Authentication
+            Indicators. Use 'otp' to allow OTP-based 2FA authentications. Use
+            'radius' to allow RADIUS-based 2FA authentications. Use 'pkinit' to
+            allow PKINIT-based 2FA authentications. Use 'hardened' to allow brute-
+            force hardened password authentication by SPAKE or FAST. With no
+            indicator specified, all authentication mechanisms are allowed.
+        :type  o_krbprincipalauthind: list of str, valid values ['radius', 'otp', 'pkinit', 'hardened']
+        :param o_ipakrbrequirespreauth: Pre-authentication is required for the
+            service
+        :type  o_ipakrbrequirespreauth: Bool
+        :param o_ipakrbokasdelegate: Client credentials may be delegated to
+            the service
+        :type  o_ipakrbokasdelegate: Bool
+        :param o_ipakrboktoauthasdelegate: The service is allowed to
+            authenticate on behalf of a client
+        :type  o_ipakrboktoauthasdelegate: Bool
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_krbcanonicalname]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_krbprincipalname is not None:
+            _params['krbprincipalname'] = o_krbprincipalname
+        if o_usercertificate is not None:
+            _params['usercertificate'] = o_usercertificate
+        if o_ipakrbauthzdata is not None:
+            _params['ipakrbauthzdata'] = o_ipakrbauthzdata
+        if o_krbprincipalauthind is not None:
+            _params['krbprincipalauthind'] = o_krbprincipalauthind
+        if o_ipakrbrequirespreauth is not None:
+            _params['ipakrbrequirespreauth'] = o_ipakrbrequirespreauth
+        if o_ipakrbokasdelegate is not None:
+            _params['ipakrbokasdelegate'] = o_ipakrbokasdelegate
+        if o_ipakrboktoauthasdelegate is not None:
+            _params['ipakrboktoauthasdelegate'] = o_ipakrboktoauthasdelegate
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('service_mod', _args, _params)
+
+    def service_remove_cert(
+        self,
+        a_krbcanonicalname,
+        o_usercertificate,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Remove certificates from a service
+
+
+        :param a_krbcanonicalname: Service principal
+        :type  a_krbcanonicalname: Principal
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_usercertificate: Base-64 encoded service certificate
+        :type  o_usercertificate: Certificate
+        """
+        _args = [a_krbcanonicalname]
+        _params = {
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+            'usercertificate': o_usercertificate,
+        }
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('service_remove_cert', _args, _params)
+
+    def service_remove_host(
+        self,
+        a_krbcanonicalname,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_host=None,
+        **kwargs
+    ):
+        """
+        Remove hosts that can manage this service.
+
+
+        :param a_krbcanonicalname: Service principal
+        :type  a_krbcanonicalname: Principal
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_host: hosts to remove
+        :type  o_host: str
+        """
+        _args = [a_krbcanonicalname]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_host is not None:
+            _params['host'] = o_host
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('service_remove_host', _args, _params)
+
+    def service_remove_principal(
+        self,
+        a_krbcanonicalname,
+        a_krbprincipalname,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Remove principal alias from a service
+
+
+        :param a_krbcanonicalname: Service principal
+        :type  a_krbcanonicalname: Principal
+        :param a_krbprincipalname: Service principal alias
+        :type  a_krbprincipalname: Principal
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_krbcanonicalname, a_krbprincipalname]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('service_remove_principal', _args, _params)
+
+    def service_show(
+        self,
+        a_krbcanonicalname,
+        o_rights=False,
+        o_out=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Display information about an IPA service.
+
+
+        :param a_krbcanonicalname: Service principal
+        :type  a_krbcanonicalname: Principal
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_out: file to store certificate in
+        :type  o_out: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_krbcanonicalname]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_out is not None:
+            _params['out'] = o_out
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('service_show', _args, _params)
@@ -0,0 +1,17 @@
+class Commands(object):
+
+    def session_logout(
+        self,
+        **kwargs
+    ):
+        """
+        RPC command used to log the current user out of their session.
+
+
+        """
+        _args = []
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('session_logout', _args, _params)
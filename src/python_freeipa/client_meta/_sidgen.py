@@ -0,0 +1,17 @@
+class Commands(object):
+
+    def sidgen_was_run(
+        self,
+        **kwargs
+    ):
+        """
+        Determine whether ipa-adtrust-install has been run with sidgen task
+
+
+        """
+        _args = []
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sidgen_was_run', _args, _params)
@@ -0,0 +1,1228 @@
+class Commands(object):
+
+    def stageuser_activate(
+        self,
+        a_uid,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Activate a stage user.
+
+
+        :param a_uid: User login
+        :type  a_uid: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_uid]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('stageuser_activate', _args, _params)
+
+    def stageuser_add(
+        self,
+        a_uid,
+        o_givenname,
+        o_sn,
+        o_cn,
+        o_displayname=None,
+        o_initials=None,
+        o_homedirectory=None,
+        o_gecos=None,
+        o_loginshell=None,
+        o_krbprincipalname=None,
+        o_krbprincipalexpiration=None,
+        o_krbpasswordexpiration=None,
+        o_mail=None,
+        o_userpassword=None,
+        o_random=False,
+        o_uidnumber=None,
+        o_gidnumber=None,
+        o_street=None,
+        o_l=None,
+        o_st=None,
+        o_postalcode=None,
+        o_telephonenumber=None,
+        o_mobile=None,
+        o_pager=None,
+        o_facsimiletelephonenumber=None,
+        o_ou=None,
+        o_title=None,
+        o_manager=None,
+        o_carlicense=None,
+        o_ipasshpubkey=None,
+        o_ipauserauthtype=None,
+        o_userclass=None,
+        o_ipatokenradiusconfiglink=None,
+        o_ipatokenradiususername=None,
+        o_departmentnumber=None,
+        o_employeenumber=None,
+        o_employeetype=None,
+        o_preferredlanguage=None,
+        o_usercertificate=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_from_delete=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Add a new stage user.
+
+
+        :param a_uid: User login
+        :type  a_uid: str
+        :param o_givenname: First name
+        :type  o_givenname: str
+        :param o_sn: Last name
+        :type  o_sn: str
+        :param o_cn: Full name
+        :type  o_cn: str
+        :param o_displayname: Display name
+        :type  o_displayname: str
+        :param o_initials: Initials
+        :type  o_initials: str
+        :param o_homedirectory: Home directory
+        :type  o_homedirectory: str
+        :param o_gecos: GECOS
+        :type  o_gecos: str
+        :param o_loginshell: Login shell
+        :type  o_loginshell: str
+        :param o_krbprincipalname: Principal alias
+        :type  o_krbprincipalname: Principal
+        :param o_krbprincipalexpiration: Kerberos principal expiration
+        :type  o_krbprincipalexpiration: DateTime
+        :param o_krbpasswordexpiration: User password expiration
+        :type  o_krbpasswordexpiration: DateTime
+        :param o_mail: Email address
+        :type  o_mail: str
+        :param o_userpassword: Prompt to set the user password
+        :type  o_userpassword: Password
+        :param o_random: Generate a random user password
+        :type  o_random: bool
+        :param o_uidnumber: User ID Number (system will assign one if not
+            provided)
+        :type  o_uidnumber: int, min value 1, max value 2147483647
+        :param o_gidnumber: Group ID Number
+        :type  o_gidnumber: int, min value 1, max value 2147483647
+        :param o_street: Street address
+        :type  o_street: str
+        :param o_l: City
+        :type  o_l: str
+        :param o_st: State/Province
+        :type  o_st: str
+        :param o_postalcode: ZIP
+        :type  o_postalcode: str
+        :param o_telephonenumber: Telephone Number
+        :type  o_telephonenumber: str
+        :param o_mobile: Mobile Telephone Number
+        :type  o_mobile: str
+        :param o_pager: Pager Number
+        :type  o_pager: str
+        :param o_facsimiletelephonenumber: Fax Number
+        :type  o_facsimiletelephonenumber: str
+        :param o_ou: Org. Unit
+        :type  o_ou: str
+        :param o_title: Job Title
+        :type  o_title: str
+        :param o_manager: Manager
+        :type  o_manager: str
+        :param o_carlicense: Car License
+        :type  o_carlicense: str
+        :param o_ipasshpubkey: SSH public key
+        :type  o_ipasshpubkey: str
+        :param o_ipauserauthtype: Types of supported user authentication
+        :type  o_ipauserauthtype: list of str, valid values ['password', 'radius', 'otp', 'pkinit', 'hardened']
+        :param o_userclass: User category (semantics placed on this attribute
+            are for local interpretation)
+        :type  o_userclass: str
+        :param o_ipatokenradiusconfiglink: RADIUS proxy configuration
+        :type  o_ipatokenradiusconfiglink: str
+        :param o_ipatokenradiususername: RADIUS proxy username
+        :type  o_ipatokenradiususername: str
+        :param o_departmentnumber: Department Number
+        :type  o_departmentnumber: str
+        :param o_employeenumber: Employee Number
+        :type  o_employeenumber: str
+        :param o_employeetype: Employee Type
+        :type  o_employeetype: str
+        :param o_preferredlanguage: Preferred Language
+        :type  o_preferredlanguage: str
+        :param o_usercertificate: Base-64 encoded user certificate
+        :type  o_usercertificate: Certificate
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_from_delete: Create Stage user in from a delete user
+        :type  o_from_delete: Bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_uid]
+        _params = {
+            'givenname': o_givenname,
+            'sn': o_sn,
+            'cn': o_cn,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_displayname is not None:
+            _params['displayname'] = o_displayname
+        if o_initials is not None:
+            _params['initials'] = o_initials
+        if o_homedirectory is not None:
+            _params['homedirectory'] = o_homedirectory
+        if o_gecos is not None:
+            _params['gecos'] = o_gecos
+        if o_loginshell is not None:
+            _params['loginshell'] = o_loginshell
+        if o_krbprincipalname is not None:
+            _params['krbprincipalname'] = o_krbprincipalname
+        if o_krbprincipalexpiration is not None:
+            _params['krbprincipalexpiration'] = o_krbprincipalexpiration
+        if o_krbpasswordexpiration is not None:
+            _params['krbpasswordexpiration'] = o_krbpasswordexpiration
+        if o_mail is not None:
+            _params['mail'] = o_mail
+        if o_userpassword is not None:
+            _params['userpassword'] = o_userpassword
+        if o_random is not None:
+            _params['random'] = o_random
+        if o_uidnumber is not None:
+            _params['uidnumber'] = o_uidnumber
+        if o_gidnumber is not None:
+            _params['gidnumber'] = o_gidnumber
+        if o_street is not None:
+            _params['street'] = o_street
+        if o_l is not None:
+            _params['l'] = o_l
+        if o_st is not None:
+            _params['st'] = o_st
+        if o_postalcode is not None:
+            _params['postalcode'] = o_postalcode
+        if o_telephonenumber is not None:
+            _params['telephonenumber'] = o_telephonenumber
+        if o_mobile is not None:
+            _params['mobile'] = o_mobile
+        if o_pager is not None:
+            _params['pager'] = o_pager
+        if o_facsimiletelephonenumber is not None:
+            _params['facsimiletelephonenumber'] = o_facsimiletelephonenumber
+        if o_ou is not None:
+            _params['ou'] = o_ou
+        if o_title is not None:
+            _params['title'] = o_title
+        if o_manager is not None:
+            _params['manager'] = o_manager
+        if o_carlicense is not None:
+            _params['carlicense'] = o_carlicense
+        if o_ipasshpubkey is not None:
+            _params['ipasshpubkey'] = o_ipasshpubkey
+        if o_ipauserauthtype is not None:
+            _params['ipauserauthtype'] = o_ipauserauthtype
+        if o_userclass is not None:
+            _params['userclass'] = o_userclass
+        if o_ipatokenradiusconfiglink is not None:
+            _params['ipatokenradiusconfiglink'] = o_ipatokenradiusconfiglink
+        if o_ipatokenradiususername is not None:
+            _params['ipatokenradiususername'] = o_ipatokenradiususername
+        if o_departmentnumber is not None:
+            _params['departmentnumber'] = o_departmentnumber
+        if o_employeenumber is not None:
+            _params['employeenumber'] = o_employeenumber
+        if o_employeetype is not None:
+            _params['employeetype'] = o_employeetype
+        if o_preferredlanguage is not None:
+            _params['preferredlanguage'] = o_preferredlanguage
+        if o_usercertificate is not None:
+            _params['usercertificate'] = o_usercertificate
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_from_delete is not None:
+            _params['from_delete'] = o_from_delete
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('stageuser_add', _args, _params)
+
+    def stageuser_add_cert(
+        self,
+        a_uid,
+        o_usercertificate,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Add one or more certificates to the stageuser entry
+
+
+        :param a_uid: User login
+        :type  a_uid: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_usercertificate: Base-64 encoded user certificate
+        :type  o_usercertificate: Certificate
+        """
+        _args = [a_uid]
+        _params = {
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+            'usercertificate': o_usercertificate,
+        }
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('stageuser_add_cert', _args, _params)
+
+    def stageuser_add_certmapdata(
+        self,
+        a_uid,
+        a_ipacertmapdata=None,
+        o_issuer=None,
+        o_subject=None,
+        o_certificate=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Add one or more certificate mappings to the stage user entry.
+
+
+        :param a_uid: User login
+        :type  a_uid: str
+        :param a_ipacertmapdata: Certificate mapping data
+        :type  a_ipacertmapdata: str
+        :param o_issuer: Issuer of the certificate
+        :type  o_issuer: DNParam
+        :param o_subject: Subject of the certificate
+        :type  o_subject: DNParam
+        :param o_certificate: Base-64 encoded user certificate
+        :type  o_certificate: Certificate
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_uid, a_ipacertmapdata]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_issuer is not None:
+            _params['issuer'] = o_issuer
+        if o_subject is not None:
+            _params['subject'] = o_subject
+        if o_certificate is not None:
+            _params['certificate'] = o_certificate
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('stageuser_add_certmapdata', _args, _params)
+
+    def stageuser_add_manager(
+        self,
+        a_uid,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        **kwargs
+    ):
+        """
+        Add a manager to the stage user entry
+
+
+        :param a_uid: User login
+        :type  a_uid: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to add
+        :type  o_user: str
+        """
+        _args = [a_uid]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('stageuser_add_manager', _args, _params)
+
+    def stageuser_add_principal(
+        self,
+        a_uid,
+        a_krbprincipalname,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Add new principal alias to the stageuser entry
+
+
+        :param a_uid: User login
+        :type  a_uid: str
+        :param a_krbprincipalname: Principal alias
+        :type  a_krbprincipalname: Principal
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_uid, a_krbprincipalname]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('stageuser_add_principal', _args, _params)
+
+    def stageuser_del(
+        self,
+        a_uid,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete a stage user.
+
+
+        :param a_uid: User login
+        :type  a_uid: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_uid]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('stageuser_del', _args, _params)
+
+    def stageuser_find(
+        self,
+        a_criteria=None,
+        o_uid=None,
+        o_givenname=None,
+        o_sn=None,
+        o_cn=None,
+        o_displayname=None,
+        o_initials=None,
+        o_homedirectory=None,
+        o_gecos=None,
+        o_loginshell=None,
+        o_krbprincipalname=None,
+        o_krbprincipalexpiration=None,
+        o_krbpasswordexpiration=None,
+        o_mail=None,
+        o_userpassword=None,
+        o_uidnumber=None,
+        o_gidnumber=None,
+        o_street=None,
+        o_l=None,
+        o_st=None,
+        o_postalcode=None,
+        o_telephonenumber=None,
+        o_mobile=None,
+        o_pager=None,
+        o_facsimiletelephonenumber=None,
+        o_ou=None,
+        o_title=None,
+        o_manager=None,
+        o_carlicense=None,
+        o_ipauserauthtype=None,
+        o_userclass=None,
+        o_ipatokenradiusconfiglink=None,
+        o_ipatokenradiususername=None,
+        o_departmentnumber=None,
+        o_employeenumber=None,
+        o_employeetype=None,
+        o_preferredlanguage=None,
+        o_usercertificate=None,
+        o_ipantlogonscript=None,
+        o_ipantprofilepath=None,
+        o_ipanthomedirectory=None,
+        o_ipanthomedirectoryrive=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=True,
+        o_pkey_only=False,
+        o_in_group=None,
+        o_not_in_group=None,
+        o_in_netgroup=None,
+        o_not_in_netgroup=None,
+        o_in_role=None,
+        o_not_in_role=None,
+        o_in_hbacrule=None,
+        o_not_in_hbacrule=None,
+        o_in_sudorule=None,
+        o_not_in_sudorule=None,
+        **kwargs
+    ):
+        """
+        Search for stage users.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_uid: User login
+        :type  o_uid: str
+        :param o_givenname: First name
+        :type  o_givenname: str
+        :param o_sn: Last name
+        :type  o_sn: str
+        :param o_cn: Full name
+        :type  o_cn: str
+        :param o_displayname: Display name
+        :type  o_displayname: str
+        :param o_initials: Initials
+        :type  o_initials: str
+        :param o_homedirectory: Home directory
+        :type  o_homedirectory: str
+        :param o_gecos: GECOS
+        :type  o_gecos: str
+        :param o_loginshell: Login shell
+        :type  o_loginshell: str
+        :param o_krbprincipalname: Principal alias
+        :type  o_krbprincipalname: Principal
+        :param o_krbprincipalexpiration: Kerberos principal expiration
+        :type  o_krbprincipalexpiration: DateTime
+        :param o_krbpasswordexpiration: User password expiration
+        :type  o_krbpasswordexpiration: DateTime
+        :param o_mail: Email address
+        :type  o_mail: str
+        :param o_userpassword: Prompt to set the user password
+        :type  o_userpassword: Password
+        :param o_uidnumber: User ID Number (system will assign one if not
+            provided)
+        :type  o_uidnumber: int, min value 1, max value 2147483647
+        :param o_gidnumber: Group ID Number
+        :type  o_gidnumber: int, min value 1, max value 2147483647
+        :param o_street: Street address
+        :type  o_street: str
+        :param o_l: City
+        :type  o_l: str
+        :param o_st: State/Province
+        :type  o_st: str
+        :param o_postalcode: ZIP
+        :type  o_postalcode: str
+        :param o_telephonenumber: Telephone Number
+        :type  o_telephonenumber: str
+        :param o_mobile: Mobile Telephone Number
+        :type  o_mobile: str
+        :param o_pager: Pager Number
+        :type  o_pager: str
+        :param o_facsimiletelephonenumber: Fax Number
+        :type  o_facsimiletelephonenumber: str
+        :param o_ou: Org. Unit
+        :type  o_ou: str
+        :param o_title: Job Title
+        :type  o_title: str
+        :param o_manager: Manager
+        :type  o_manager: str
+        :param o_carlicense: Car License
+        :type  o_carlicense: str
+        :param o_ipauserauthtype: Types of supported user authentication
+        :type  o_ipauserauthtype: list of str, valid values ['password', 'radius', 'otp', 'pkinit', 'hardened']
+        :param o_userclass: User category (semantics placed on this attribute
+            are for local interpretation)
+        :type  o_userclass: str
+        :param o_ipatokenradiusconfiglink: RADIUS proxy configuration
+        :type  o_ipatokenradiusconfiglink: str
+        :param o_ipatokenradiususername: RADIUS proxy username
+        :type  o_ipatokenradiususername: str
+        :param o_departmentnumber: Department Number
+        :type  o_departmentnumber: str
+        :param o_employeenumber: Employee Number
+        :type  o_employeenumber: str
+        :param o_employeetype: Employee Type
+        :type  o_employeetype: str
+        :param o_preferredlanguage: Preferred Language
+        :type  o_preferredlanguage: str
+        :param o_usercertificate: Base-64 encoded user certificate
+        :type  o_usercertificate: Certificate
+        :param o_ipantlogonscript: SMB logon script path
+        :type  o_ipantlogonscript: str
+        :param o_ipantprofilepath: SMB profile path
+        :type  o_ipantprofilepath: str
+        :param o_ipanthomedirectory: SMB Home Directory
+        :type  o_ipanthomedirectory: str
+        :param o_ipanthomedirectoryrive: SMB Home Directory Drive
+        :type  o_ipanthomedirectoryrive: str, valid values ['A:', 'B:', 'C:', 'D:', 'E:', 'F:', 'G:', 'H:', 'I:', 'J:', 'K:', 'L:', 'M:', 'N:', 'O:', 'P:', 'Q:', 'R:', 'S:', 'T:', 'U:', 'V:', 'W:', 'X:', 'Y:', 'Z:']
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("login")
+        :type  o_pkey_only: bool
+        :param o_in_group: Search for stage users with these member of groups.
+        :type  o_in_group: str
+        :param o_not_in_group: Search for stage users without these member of
+            groups.
+        :type  o_not_in_group: str
+        :param o_in_netgroup: Search for stage users with these member of
+            netgroups.
+        :type  o_in_netgroup: str
+        :param o_not_in_netgroup: Search for stage users without these member
+            of netgroups.
+        :type  o_not_in_netgroup: str
+        :param o_in_role: Search for stage users with these member of roles.
+        :type  o_in_role: str
+        :param o_not_in_role: Search for stage users without these member of
+            roles.
+        :type  o_not_in_role: str
+        :param o_in_hbacrule: Search for stage users with these member of HBAC
+            rules.
+        :type  o_in_hbacrule: str
+        :param o_not_in_hbacrule: Search for stage users without these member
+            of HBAC rules.
+        :type  o_not_in_hbacrule: str
+        :param o_in_sudorule: Search for stage users with these member of sudo
+            rules.
+        :type  o_in_sudorule: str
+        :param o_not_in_sudorule: Search for stage users without these member
+            of sudo rules.
+        :type  o_not_in_sudorule: str
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_uid is not None:
+            _params['uid'] = o_uid
+        if o_givenname is not None:
+            _params['givenname'] = o_givenname
+        if o_sn is not None:
+            _params['sn'] = o_sn
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_displayname is not None:
+            _params['displayname'] = o_displayname
+        if o_initials is not None:
+            _params['initials'] = o_initials
+        if o_homedirectory is not None:
+            _params['homedirectory'] = o_homedirectory
+        if o_gecos is not None:
+            _params['gecos'] = o_gecos
+        if o_loginshell is not None:
+            _params['loginshell'] = o_loginshell
+        if o_krbprincipalname is not None:
+            _params['krbprincipalname'] = o_krbprincipalname
+        if o_krbprincipalexpiration is not None:
+            _params['krbprincipalexpiration'] = o_krbprincipalexpiration
+        if o_krbpasswordexpiration is not None:
+            _params['krbpasswordexpiration'] = o_krbpasswordexpiration
+        if o_mail is not None:
+            _params['mail'] = o_mail
+        if o_userpassword is not None:
+            _params['userpassword'] = o_userpassword
+        if o_uidnumber is not None:
+            _params['uidnumber'] = o_uidnumber
+        if o_gidnumber is not None:
+            _params['gidnumber'] = o_gidnumber
+        if o_street is not None:
+            _params['street'] = o_street
+        if o_l is not None:
+            _params['l'] = o_l
+        if o_st is not None:
+            _params['st'] = o_st
+        if o_postalcode is not None:
+            _params['postalcode'] = o_postalcode
+        if o_telephonenumber is not None:
+            _params['telephonenumber'] = o_telephonenumber
+        if o_mobile is not None:
+            _params['mobile'] = o_mobile
+        if o_pager is not None:
+            _params['pager'] = o_pager
+        if o_facsimiletelephonenumber is not None:
+            _params['facsimiletelephonenumber'] = o_facsimiletelephonenumber
+        if o_ou is not None:
+            _params['ou'] = o_ou
+        if o_title is not None:
+            _params['title'] = o_title
+        if o_manager is not None:
+            _params['manager'] = o_manager
+        if o_carlicense is not None:
+            _params['carlicense'] = o_carlicense
+        if o_ipauserauthtype is not None:
+            _params['ipauserauthtype'] = o_ipauserauthtype
+        if o_userclass is not None:
+            _params['userclass'] = o_userclass
+        if o_ipatokenradiusconfiglink is not None:
+            _params['ipatokenradiusconfiglink'] = o_ipatokenradiusconfiglink
+        if o_ipatokenradiususername is not None:
+            _params['ipatokenradiususername'] = o_ipatokenradiususername
+        if o_departmentnumber is not None:
+            _params['departmentnumber'] = o_departmentnumber
+        if o_employeenumber is not None:
+            _params['employeenumber'] = o_employeenumber
+        if o_employeetype is not None:
+            _params['employeetype'] = o_employeetype
+        if o_preferredlanguage is not None:
+            _params['preferredlanguage'] = o_preferredlanguage
+        if o_usercertificate is not None:
+            _params['usercertificate'] = o_usercertificate
+        if o_ipantlogonscript is not None:
+            _params['ipantlogonscript'] = o_ipantlogonscript
+        if o_ipantprofilepath is not None:
+            _params['ipantprofilepath'] = o_ipantprofilepath
+        if o_ipanthomedirectory is not None:
+            _params['ipanthomedirectory'] = o_ipanthomedirectory
+        if o_ipanthomedirectoryrive is not None:
+            _params['ipanthomedirectoryrive'] = o_ipanthomedirectoryrive
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if o_in_group is not None:
+            _params['in_group'] = o_in_group
+        if o_not_in_group is not None:
+            _params['not_in_group'] = o_not_in_group
+        if o_in_netgroup is not None:
+            _params['in_netgroup'] = o_in_netgroup
+        if o_not_in_netgroup is not None:
+            _params['not_in_netgroup'] = o_not_in_netgroup
+        if o_in_role is not None:
+            _params['in_role'] = o_in_role
+        if o_not_in_role is not None:
+            _params['not_in_role'] = o_not_in_role
+        if o_in_hbacrule is not None:
+            _params['in_hbacrule'] = o_in_hbacrule
+        if o_not_in_hbacrule is not None:
+            _params['not_in_hbacrule'] = o_not_in_hbacrule
+        if o_in_sudorule is not None:
+            _params['in_sudorule'] = o_in_sudorule
+        if o_not_in_sudorule is not None:
+            _params['not_in_sudorule'] = o_not_in_sudorule
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('stageuser_find', _args, _params)
+
+    def stageuser_mod(
+        self,
+        a_uid,
+        o_givenname=None,
+        o_sn=None,
+        o_cn=None,
+        o_displayname=None,
+        o_initials=None,
+        o_homedirectory=None,
+        o_gecos=None,
+        o_loginshell=None,
+        o_krbprincipalname=None,
+        o_krbprincipalexpiration=None,
+        o_krbpasswordexpiration=None,
+        o_mail=None,
+        o_userpassword=None,
+        o_random=False,
+        o_uidnumber=None,
+        o_gidnumber=None,
+        o_street=None,
+        o_l=None,
+        o_st=None,
+        o_postalcode=None,
+        o_telephonenumber=None,
+        o_mobile=None,
+        o_pager=None,
+        o_facsimiletelephonenumber=None,
+        o_ou=None,
+        o_title=None,
+        o_manager=None,
+        o_carlicense=None,
+        o_ipasshpubkey=None,
+        o_ipauserauthtype=None,
+        o_userclass=None,
+        o_ipatokenradiusconfiglink=None,
+        o_ipatokenradiususername=None,
+        o_departmentnumber=None,
+        o_employeenumber=None,
+        o_employeetype=None,
+        o_preferredlanguage=None,
+        o_usercertificate=None,
+        o_ipantlogonscript=None,
+        o_ipantprofilepath=None,
+        o_ipanthomedirectory=None,
+        o_ipanthomedirectoryrive=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_rename=None,
+        **kwargs
+    ):
+        """
+        Modify a stage user.
+
+
+        :param a_uid: User login
+        :type  a_uid: str
+        :param o_givenname: First name
+        :type  o_givenname: str
+        :param o_sn: Last name
+        :type  o_sn: str
+        :param o_cn: Full name
+        :type  o_cn: str
+        :param o_displayname: Display name
+        :type  o_displayname: str
+        :param o_initials: Initials
+        :type  o_initials: str
+        :param o_homedirectory: Home directory
+        :type  o_homedirectory: str
+        :param o_gecos: GECOS
+        :type  o_gecos: str
+        :param o_loginshell: Login shell
+        :type  o_loginshell: str
+        :param o_krbprincipalname: Principal alias
+        :type  o_krbprincipalname: Principal
+        :param o_krbprincipalexpiration: Kerberos principal expiration
+        :type  o_krbprincipalexpiration: DateTime
+        :param o_krbpasswordexpiration: User password expiration
+        :type  o_krbpasswordexpiration: DateTime
+        :param o_mail: Email address
+        :type  o_mail: str
+        :param o_userpassword: Prompt to set the user password
+        :type  o_userpassword: Password
+        :param o_random: Generate a random user password
+        :type  o_random: bool
+        :param o_uidnumber: User ID Number (system will assign one if not
+            provided)
+        :type  o_uidnumber: int, min value 1, max value 2147483647
+        :param o_gidnumber: Group ID Number
+        :type  o_gidnumber: int, min value 1, max value 2147483647
+        :param o_street: Street address
+        :type  o_street: str
+        :param o_l: City
+        :type  o_l: str
+        :param o_st: State/Province
+        :type  o_st: str
+        :param o_postalcode: ZIP
+        :type  o_postalcode: str
+        :param o_telephonenumber: Telephone Number
+        :type  o_telephonenumber: str
+        :param o_mobile: Mobile Telephone Number
+        :type  o_mobile: str
+        :param o_pager: Pager Number
+        :type  o_pager: str
+        :param o_facsimiletelephonenumber: Fax Number
+        :type  o_facsimiletelephonenumber: str
+        :param o_ou: Org. Unit
+        :type  o_ou: str
+        :param o_title: Job Title
+        :type  o_title: str
+        :param o_manager: Manager
+        :type  o_manager: str
+        :param o_carlicense: Car License
+        :type  o_carlicense: str
+        :param o_ipasshpubkey: SSH public key
+        :type  o_ipasshpubkey: str
+        :param o_ipauserauthtype: Types of supported user authentication
+        :type  o_ipauserauthtype: list of str, valid values ['password', 'radius', 'otp', 'pkinit', 'hardened']
+        :param o_userclass: User category (semantics placed on this attribute
+            are for local interpretation)
+        :type  o_userclass: str
+        :param o_ipatokenradiusconfiglink: RADIUS proxy configuration
+        :type  o_ipatokenradiusconfiglink: str
+        :param o_ipatokenradiususername: RADIUS proxy username
+        :type  o_ipatokenradiususername: str
+        :param o_departmentnumber: Department Number
+        :type  o_departmentnumber: str
+        :param o_employeenumber: Employee Number
+        :type  o_employeenumber: str
+        :param o_employeetype: Employee Type
+        :type  o_employeetype: str
+        :param o_preferredlanguage: Preferred Language
+        :type  o_preferredlanguage: str
+        :param o_usercertificate: Base-64 encoded user certificate
+        :type  o_usercertificate: Certificate
+        :param o_ipantlogonscript: SMB logon script path
+        :type  o_ipantlogonscript: str
+        :param o_ipantprofilepath: SMB profile path
+        :type  o_ipantprofilepath: str
+        :param o_ipanthomedirectory: SMB Home Directory
+        :type  o_ipanthomedirectory: str
+        :param o_ipanthomedirectoryrive: SMB Home Directory Drive
+        :type  o_ipanthomedirectoryrive: str, valid values ['A:', 'B:', 'C:', 'D:', 'E:', 'F:', 'G:', 'H:', 'I:', 'J:', 'K:', 'L:', 'M:', 'N:', 'O:', 'P:', 'Q:', 'R:', 'S:', 'T:', 'U:', 'V:', 'W:', 'X:', 'Y:', 'Z:']
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_rename: Rename the stage user object
+        :type  o_rename: str
+        """
+        _args = [a_uid]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_givenname is not None:
+            _params['givenname'] = o_givenname
+        if o_sn is not None:
+            _params['sn'] = o_sn
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_displayname is not None:
+            _params['displayname'] = o_displayname
+        if o_initials is not None:
+            _params['initials'] = o_initials
+        if o_homedirectory is not None:
+            _params['homedirectory'] = o_homedirectory
+        if o_gecos is not None:
+            _params['gecos'] = o_gecos
+        if o_loginshell is not None:
+            _params['loginshell'] = o_loginshell
+        if o_krbprincipalname is not None:
+            _params['krbprincipalname'] = o_krbprincipalname
+        if o_krbprincipalexpiration is not None:
+            _params['krbprincipalexpiration'] = o_krbprincipalexpiration
+        if o_krbpasswordexpiration is not None:
+            _params['krbpasswordexpiration'] = o_krbpasswordexpiration
+        if o_mail is not None:
+            _params['mail'] = o_mail
+        if o_userpassword is not None:
+            _params['userpassword'] = o_userpassword
+        if o_random is not None:
+            _params['random'] = o_random
+        if o_uidnumber is not None:
+            _params['uidnumber'] = o_uidnumber
+        if o_gidnumber is not None:
+            _params['gidnumber'] = o_gidnumber
+        if o_street is not None:
+            _params['street'] = o_street
+        if o_l is not None:
+            _params['l'] = o_l
+        if o_st is not None:
+            _params['st'] = o_st
+        if o_postalcode is not None:
+            _params['postalcode'] = o_postalcode
+        if o_telephonenumber is not None:
+            _params['telephonenumber'] = o_telephonenumber
+        if o_mobile is not None:
+            _params['mobile'] = o_mobile
+        if o_pager is not None:
+            _params['pager'] = o_pager
+        if o_facsimiletelephonenumber is not None:
+            _params['facsimiletelephonenumber'] = o_facsimiletelephonenumber
+        if o_ou is not None:
+            _params['ou'] = o_ou
+        if o_title is not None:
+            _params['title'] = o_title
+        if o_manager is not None:
+            _params['manager'] = o_manager
+        if o_carlicense is not None:
+            _params['carlicense'] = o_carlicense
+        if o_ipasshpubkey is not None:
+            _params['ipasshpubkey'] = o_ipasshpubkey
+        if o_ipauserauthtype is not None:
+            _params['ipauserauthtype'] = o_ipauserauthtype
+        if o_userclass is not None:
+            _params['userclass'] = o_userclass
+        if o_ipatokenradiusconfiglink is not None:
+            _params['ipatokenradiusconfiglink'] = o_ipatokenradiusconfiglink
+        if o_ipatokenradiususername is not None:
+            _params['ipatokenradiususername'] = o_ipatokenradiususername
+        if o_departmentnumber is not None:
+            _params['departmentnumber'] = o_departmentnumber
+        if o_employeenumber is not None:
+            _params['employeenumber'] = o_employeenumber
+        if o_employeetype is not None:
+            _params['employeetype'] = o_employeetype
+        if o_preferredlanguage is not None:
+            _params['preferredlanguage'] = o_preferredlanguage
+        if o_usercertificate is not None:
+            _params['usercertificate'] = o_usercertificate
+        if o_ipantlogonscript is not None:
+            _params['ipantlogonscript'] = o_ipantlogonscript
+        if o_ipantprofilepath is not None:
+            _params['ipantprofilepath'] = o_ipantprofilepath
+        if o_ipanthomedirectory is not None:
+            _params['ipanthomedirectory'] = o_ipanthomedirectory
+        if o_ipanthomedirectoryrive is not None:
+            _params['ipanthomedirectoryrive'] = o_ipanthomedirectoryrive
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if o_rename is not None:
+            _params['rename'] = o_rename
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('stageuser_mod', _args, _params)
+
+    def stageuser_remove_cert(
+        self,
+        a_uid,
+        o_usercertificate,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Remove one or more certificates to the stageuser entry
+
+
+        :param a_uid: User login
+        :type  a_uid: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_usercertificate: Base-64 encoded user certificate
+        :type  o_usercertificate: Certificate
+        """
+        _args = [a_uid]
+        _params = {
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+            'usercertificate': o_usercertificate,
+        }
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('stageuser_remove_cert', _args, _params)
+
+    def stageuser_remove_certmapdata(
+        self,
+        a_uid,
+        a_ipacertmapdata=None,
+        o_issuer=None,
+        o_subject=None,
+        o_certificate=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Remove one or more certificate mappings from the stage user entry.
+
+
+        :param a_uid: User login
+        :type  a_uid: str
+        :param a_ipacertmapdata: Certificate mapping data
+        :type  a_ipacertmapdata: str
+        :param o_issuer: Issuer of the certificate
+        :type  o_issuer: DNParam
+        :param o_subject: Subject of the certificate
+        :type  o_subject: DNParam
+        :param o_certificate: Base-64 encoded user certificate
+        :type  o_certificate: Certificate
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_uid, a_ipacertmapdata]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_issuer is not None:
+            _params['issuer'] = o_issuer
+        if o_subject is not None:
+            _params['subject'] = o_subject
+        if o_certificate is not None:
+            _params['certificate'] = o_certificate
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('stageuser_remove_certmapdata', _args, _params)
+
+    def stageuser_remove_manager(
+        self,
+        a_uid,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        **kwargs
+    ):
+        """
+        Remove a manager to the stage user entry
+
+
+        :param a_uid: User login
+        :type  a_uid: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to remove
+        :type  o_user: str
+        """
+        _args = [a_uid]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('stageuser_remove_manager', _args, _params)
+
+    def stageuser_remove_principal(
+        self,
+        a_uid,
+        a_krbprincipalname,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Remove principal alias from the stageuser entry
+
+
+        :param a_uid: User login
+        :type  a_uid: str
+        :param a_krbprincipalname: Principal alias
+        :type  a_krbprincipalname: Principal
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_uid, a_krbprincipalname]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('stageuser_remove_principal', _args, _params)
+
+    def stageuser_show(
+        self,
+        a_uid,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Display information about a stage user.
+
+
+        :param a_uid: User login
+        :type  a_uid: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_uid]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('stageuser_show', _args, _params)
@@ -0,0 +1,1537 @@
+class Commands(object):
+
+    def sudocmd_add(
+        self,
+        a_sudocmd,
+        o_description=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Create new Sudo Command.
+
+
+        :param a_sudocmd: Sudo Command
+        :type  a_sudocmd: str
+        :param o_description: A description of this command
+        :type  o_description: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_sudocmd]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudocmd_add', _args, _params)
+
+    def sudocmd_del(
+        self,
+        a_sudocmd,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete Sudo Command.
+
+
+        :param a_sudocmd: Sudo Command
+        :type  a_sudocmd: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_sudocmd]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudocmd_del', _args, _params)
+
+    def sudocmd_find(
+        self,
+        a_criteria=None,
+        o_sudocmd=None,
+        o_description=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=True,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for Sudo Commands.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_sudocmd: Sudo Command
+        :type  o_sudocmd: str
+        :param o_description: A description of this command
+        :type  o_description: str
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("command")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_sudocmd is not None:
+            _params['sudocmd'] = o_sudocmd
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudocmd_find', _args, _params)
+
+    def sudocmd_mod(
+        self,
+        a_sudocmd,
+        o_description=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Modify Sudo Command.
+
+
+        :param a_sudocmd: Sudo Command
+        :type  a_sudocmd: str
+        :param o_description: A description of this command
+        :type  o_description: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_sudocmd]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudocmd_mod', _args, _params)
+
+    def sudocmd_show(
+        self,
+        a_sudocmd,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Display Sudo Command.
+
+
+        :param a_sudocmd: Sudo Command
+        :type  a_sudocmd: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_sudocmd]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudocmd_show', _args, _params)
+
+    def sudocmdgroup_add(
+        self,
+        a_cn,
+        o_description=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Create new Sudo Command Group.
+
+
+        :param a_cn: Sudo Command Group
+        :type  a_cn: str
+        :param o_description: Group description
+        :type  o_description: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudocmdgroup_add', _args, _params)
+
+    def sudocmdgroup_add_member(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_sudocmd=None,
+        **kwargs
+    ):
+        """
+        Add members to Sudo Command Group.
+
+
+        :param a_cn: Sudo Command Group
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_sudocmd: sudo commands to add
+        :type  o_sudocmd: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_sudocmd is not None:
+            _params['sudocmd'] = o_sudocmd
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudocmdgroup_add_member', _args, _params)
+
+    def sudocmdgroup_del(
+        self,
+        a_cn,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete Sudo Command Group.
+
+
+        :param a_cn: Sudo Command Group
+        :type  a_cn: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_cn]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudocmdgroup_del', _args, _params)
+
+    def sudocmdgroup_find(
+        self,
+        a_criteria=None,
+        o_cn=None,
+        o_description=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=True,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for Sudo Command Groups.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_cn: Sudo Command Group
+        :type  o_cn: str
+        :param o_description: Group description
+        :type  o_description: str
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("sudocmdgroup-name")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudocmdgroup_find', _args, _params)
+
+    def sudocmdgroup_mod(
+        self,
+        a_cn,
+        o_description=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Modify Sudo Command Group.
+
+
+        :param a_cn: Sudo Command Group
+        :type  a_cn: str
+        :param o_description: Group description
+        :type  o_description: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudocmdgroup_mod', _args, _params)
+
+    def sudocmdgroup_remove_member(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_sudocmd=None,
+        **kwargs
+    ):
+        """
+        Remove members from Sudo Command Group.
+
+
+        :param a_cn: Sudo Command Group
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_sudocmd: sudo commands to remove
+        :type  o_sudocmd: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_sudocmd is not None:
+            _params['sudocmd'] = o_sudocmd
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudocmdgroup_remove_member', _args, _params)
+
+    def sudocmdgroup_show(
+        self,
+        a_cn,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Display Sudo Command Group.
+
+
+        :param a_cn: Sudo Command Group
+        :type  a_cn: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudocmdgroup_show', _args, _params)
+
+    def sudorule_add(
+        self,
+        a_cn,
+        o_description=None,
+        o_ipaenabledflag=None,
+        o_usercategory=None,
+        o_hostcategory=None,
+        o_cmdcategory=None,
+        o_ipasudorunasusercategory=None,
+        o_ipasudorunasgroupcategory=None,
+        o_sudoorder=None,
+        o_externaluser=None,
+        o_externalhost=None,
+        o_ipasudorunasextuser=None,
+        o_ipasudorunasextgroup=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Create new Sudo Rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_description: Description
+        :type  o_description: str
+        :param o_ipaenabledflag: Enabled
+        :type  o_ipaenabledflag: Bool
+        :param o_usercategory: User category the rule applies to
+        :type  o_usercategory: str, valid values ['all']
+        :param o_hostcategory: Host category the rule applies to
+        :type  o_hostcategory: str, valid values ['all']
+        :param o_cmdcategory: Command category the rule applies to
+        :type  o_cmdcategory: str, valid values ['all']
+        :param o_ipasudorunasusercategory: RunAs User category the rule
+            applies to
+        :type  o_ipasudorunasusercategory: str, valid values ['all']
+        :param o_ipasudorunasgroupcategory: RunAs Group category the rule
+            applies to
+        :type  o_ipasudorunasgroupcategory: str, valid values ['all']
+        :param o_sudoorder: integer to order the Sudo rules
+        :type  o_sudoorder: int, min value 0, max value 2147483647
+        :param o_externaluser: External User the rule applies to (sudorule-
+            find only)
+        :type  o_externaluser: str
+        :param o_externalhost: External host
+        :type  o_externalhost: str
+        :param o_ipasudorunasextuser: External User the commands can run as
+            (sudorule-find only)
+        :type  o_ipasudorunasextuser: str
+        :param o_ipasudorunasextgroup: External Group the commands can run as
+            (sudorule-find only)
+        :type  o_ipasudorunasextgroup: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipaenabledflag is not None:
+            _params['ipaenabledflag'] = o_ipaenabledflag
+        if o_usercategory is not None:
+            _params['usercategory'] = o_usercategory
+        if o_hostcategory is not None:
+            _params['hostcategory'] = o_hostcategory
+        if o_cmdcategory is not None:
+            _params['cmdcategory'] = o_cmdcategory
+        if o_ipasudorunasusercategory is not None:
+            _params['ipasudorunasusercategory'] = o_ipasudorunasusercategory
+        if o_ipasudorunasgroupcategory is not None:
+            _params['ipasudorunasgroupcategory'] = o_ipasudorunasgroupcategory
+        if o_sudoorder is not None:
+            _params['sudoorder'] = o_sudoorder
+        if o_externaluser is not None:
+            _params['externaluser'] = o_externaluser
+        if o_externalhost is not None:
+            _params['externalhost'] = o_externalhost
+        if o_ipasudorunasextuser is not None:
+            _params['ipasudorunasextuser'] = o_ipasudorunasextuser
+        if o_ipasudorunasextgroup is not None:
+            _params['ipasudorunasextgroup'] = o_ipasudorunasextgroup
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudorule_add', _args, _params)
+
+    def sudorule_add_allow_command(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_sudocmd=None,
+        o_sudocmdgroup=None,
+        **kwargs
+    ):
+        """
+        Add commands and sudo command groups affected by Sudo Rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_sudocmd: sudo commands to add
+        :type  o_sudocmd: str
+        :param o_sudocmdgroup: sudo command groups to add
+        :type  o_sudocmdgroup: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_sudocmd is not None:
+            _params['sudocmd'] = o_sudocmd
+        if o_sudocmdgroup is not None:
+            _params['sudocmdgroup'] = o_sudocmdgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudorule_add_allow_command', _args, _params)
+
+    def sudorule_add_deny_command(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_sudocmd=None,
+        o_sudocmdgroup=None,
+        **kwargs
+    ):
+        """
+        Add commands and sudo command groups affected by Sudo Rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_sudocmd: sudo commands to add
+        :type  o_sudocmd: str
+        :param o_sudocmdgroup: sudo command groups to add
+        :type  o_sudocmdgroup: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_sudocmd is not None:
+            _params['sudocmd'] = o_sudocmd
+        if o_sudocmdgroup is not None:
+            _params['sudocmdgroup'] = o_sudocmdgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudorule_add_deny_command', _args, _params)
+
+    def sudorule_add_host(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_host=None,
+        o_hostgroup=None,
+        o_hostmask=None,
+        **kwargs
+    ):
+        """
+        Add hosts and hostgroups affected by Sudo Rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_host: hosts to add
+        :type  o_host: str
+        :param o_hostgroup: host groups to add
+        :type  o_hostgroup: str
+        :param o_hostmask: host masks of allowed hosts
+        :type  o_hostmask: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_host is not None:
+            _params['host'] = o_host
+        if o_hostgroup is not None:
+            _params['hostgroup'] = o_hostgroup
+        if o_hostmask is not None:
+            _params['hostmask'] = o_hostmask
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudorule_add_host', _args, _params)
+
+    def sudorule_add_option(
+        self,
+        a_cn,
+        o_ipasudoopt,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Add an option to the Sudo Rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_ipasudoopt: Sudo Option
+        :type  o_ipasudoopt: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'ipasudoopt': o_ipasudoopt,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudorule_add_option', _args, _params)
+
+    def sudorule_add_runasgroup(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_group=None,
+        **kwargs
+    ):
+        """
+        Add group for Sudo to execute as.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_group: groups to add
+        :type  o_group: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_group is not None:
+            _params['group'] = o_group
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudorule_add_runasgroup', _args, _params)
+
+    def sudorule_add_runasuser(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        **kwargs
+    ):
+        """
+        Add users and groups for Sudo to execute as.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to add
+        :type  o_user: str
+        :param o_group: groups to add
+        :type  o_group: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudorule_add_runasuser', _args, _params)
+
+    def sudorule_add_user(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        **kwargs
+    ):
+        """
+        Add users and groups affected by Sudo Rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to add
+        :type  o_user: str
+        :param o_group: groups to add
+        :type  o_group: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudorule_add_user', _args, _params)
+
+    def sudorule_del(
+        self,
+        a_cn,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete Sudo Rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_cn]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudorule_del', _args, _params)
+
+    def sudorule_disable(
+        self,
+        a_cn,
+        **kwargs
+    ):
+        """
+        Disable a Sudo Rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        """
+        _args = [a_cn]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudorule_disable', _args, _params)
+
+    def sudorule_enable(
+        self,
+        a_cn,
+        **kwargs
+    ):
+        """
+        Enable a Sudo Rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        """
+        _args = [a_cn]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudorule_enable', _args, _params)
+
+    def sudorule_find(
+        self,
+        a_criteria=None,
+        o_cn=None,
+        o_description=None,
+        o_ipaenabledflag=None,
+        o_usercategory=None,
+        o_hostcategory=None,
+        o_cmdcategory=None,
+        o_ipasudorunasusercategory=None,
+        o_ipasudorunasgroupcategory=None,
+        o_sudoorder=None,
+        o_externaluser=None,
+        o_externalhost=None,
+        o_ipasudorunasextuser=None,
+        o_ipasudorunasextgroup=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=True,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for Sudo Rule.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_cn: Rule name
+        :type  o_cn: str
+        :param o_description: Description
+        :type  o_description: str
+        :param o_ipaenabledflag: Enabled
+        :type  o_ipaenabledflag: Bool
+        :param o_usercategory: User category the rule applies to
+        :type  o_usercategory: str, valid values ['all']
+        :param o_hostcategory: Host category the rule applies to
+        :type  o_hostcategory: str, valid values ['all']
+        :param o_cmdcategory: Command category the rule applies to
+        :type  o_cmdcategory: str, valid values ['all']
+        :param o_ipasudorunasusercategory: RunAs User category the rule
+            applies to
+        :type  o_ipasudorunasusercategory: str, valid values ['all']
+        :param o_ipasudorunasgroupcategory: RunAs Group category the rule
+            applies to
+        :type  o_ipasudorunasgroupcategory: str, valid values ['all']
+        :param o_sudoorder: integer to order the Sudo rules
+        :type  o_sudoorder: int, min value 0, max value 2147483647
+        :param o_externaluser: External User the rule applies to (sudorule-
+            find only)
+        :type  o_externaluser: str
+        :param o_externalhost: External host
+        :type  o_externalhost: str
+        :param o_ipasudorunasextuser: External User the commands can run as
+            (sudorule-find only)
+        :type  o_ipasudorunasextuser: str
+        :param o_ipasudorunasextgroup: External Group the commands can run as
+            (sudorule-find only)
+        :type  o_ipasudorunasextgroup: str
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("sudorule-name")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipaenabledflag is not None:
+            _params['ipaenabledflag'] = o_ipaenabledflag
+        if o_usercategory is not None:
+            _params['usercategory'] = o_usercategory
+        if o_hostcategory is not None:
+            _params['hostcategory'] = o_hostcategory
+        if o_cmdcategory is not None:
+            _params['cmdcategory'] = o_cmdcategory
+        if o_ipasudorunasusercategory is not None:
+            _params['ipasudorunasusercategory'] = o_ipasudorunasusercategory
+        if o_ipasudorunasgroupcategory is not None:
+            _params['ipasudorunasgroupcategory'] = o_ipasudorunasgroupcategory
+        if o_sudoorder is not None:
+            _params['sudoorder'] = o_sudoorder
+        if o_externaluser is not None:
+            _params['externaluser'] = o_externaluser
+        if o_externalhost is not None:
+            _params['externalhost'] = o_externalhost
+        if o_ipasudorunasextuser is not None:
+            _params['ipasudorunasextuser'] = o_ipasudorunasextuser
+        if o_ipasudorunasextgroup is not None:
+            _params['ipasudorunasextgroup'] = o_ipasudorunasextgroup
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudorule_find', _args, _params)
+
+    def sudorule_mod(
+        self,
+        a_cn,
+        o_description=None,
+        o_ipaenabledflag=None,
+        o_usercategory=None,
+        o_hostcategory=None,
+        o_cmdcategory=None,
+        o_ipasudorunasusercategory=None,
+        o_ipasudorunasgroupcategory=None,
+        o_sudoorder=None,
+        o_externaluser=None,
+        o_externalhost=None,
+        o_ipasudorunasextuser=None,
+        o_ipasudorunasextgroup=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_rename=None,
+        **kwargs
+    ):
+        """
+        Modify Sudo Rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_description: Description
+        :type  o_description: str
+        :param o_ipaenabledflag: Enabled
+        :type  o_ipaenabledflag: Bool
+        :param o_usercategory: User category the rule applies to
+        :type  o_usercategory: str, valid values ['all']
+        :param o_hostcategory: Host category the rule applies to
+        :type  o_hostcategory: str, valid values ['all']
+        :param o_cmdcategory: Command category the rule applies to
+        :type  o_cmdcategory: str, valid values ['all']
+        :param o_ipasudorunasusercategory: RunAs User category the rule
+            applies to
+        :type  o_ipasudorunasusercategory: str, valid values ['all']
+        :param o_ipasudorunasgroupcategory: RunAs Group category the rule
+            applies to
+        :type  o_ipasudorunasgroupcategory: str, valid values ['all']
+        :param o_sudoorder: integer to order the Sudo rules
+        :type  o_sudoorder: int, min value 0, max value 2147483647
+        :param o_externaluser: External User the rule applies to (sudorule-
+            find only)
+        :type  o_externaluser: str
+        :param o_externalhost: External host
+        :type  o_externalhost: str
+        :param o_ipasudorunasextuser: External User the commands can run as
+            (sudorule-find only)
+        :type  o_ipasudorunasextuser: str
+        :param o_ipasudorunasextgroup: External Group the commands can run as
+            (sudorule-find only)
+        :type  o_ipasudorunasextgroup: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_rename: Rename the sudo rule object
+        :type  o_rename: str
+        """
+        _args = [a_cn]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipaenabledflag is not None:
+            _params['ipaenabledflag'] = o_ipaenabledflag
+        if o_usercategory is not None:
+            _params['usercategory'] = o_usercategory
+        if o_hostcategory is not None:
+            _params['hostcategory'] = o_hostcategory
+        if o_cmdcategory is not None:
+            _params['cmdcategory'] = o_cmdcategory
+        if o_ipasudorunasusercategory is not None:
+            _params['ipasudorunasusercategory'] = o_ipasudorunasusercategory
+        if o_ipasudorunasgroupcategory is not None:
+            _params['ipasudorunasgroupcategory'] = o_ipasudorunasgroupcategory
+        if o_sudoorder is not None:
+            _params['sudoorder'] = o_sudoorder
+        if o_externaluser is not None:
+            _params['externaluser'] = o_externaluser
+        if o_externalhost is not None:
+            _params['externalhost'] = o_externalhost
+        if o_ipasudorunasextuser is not None:
+            _params['ipasudorunasextuser'] = o_ipasudorunasextuser
+        if o_ipasudorunasextgroup is not None:
+            _params['ipasudorunasextgroup'] = o_ipasudorunasextgroup
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if o_rename is not None:
+            _params['rename'] = o_rename
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudorule_mod', _args, _params)
+
+    def sudorule_remove_allow_command(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_sudocmd=None,
+        o_sudocmdgroup=None,
+        **kwargs
+    ):
+        """
+        Remove commands and sudo command groups affected by Sudo Rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_sudocmd: sudo commands to remove
+        :type  o_sudocmd: str
+        :param o_sudocmdgroup: sudo command groups to remove
+        :type  o_sudocmdgroup: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_sudocmd is not None:
+            _params['sudocmd'] = o_sudocmd
+        if o_sudocmdgroup is not None:
+            _params['sudocmdgroup'] = o_sudocmdgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudorule_remove_allow_command', _args, _params)
+
+    def sudorule_remove_deny_command(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_sudocmd=None,
+        o_sudocmdgroup=None,
+        **kwargs
+    ):
+        """
+        Remove commands and sudo command groups affected by Sudo Rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_sudocmd: sudo commands to remove
+        :type  o_sudocmd: str
+        :param o_sudocmdgroup: sudo command groups to remove
+        :type  o_sudocmdgroup: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_sudocmd is not None:
+            _params['sudocmd'] = o_sudocmd
+        if o_sudocmdgroup is not None:
+            _params['sudocmdgroup'] = o_sudocmdgroup
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudorule_remove_deny_command', _args, _params)
+
+    def sudorule_remove_host(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_host=None,
+        o_hostgroup=None,
+        o_hostmask=None,
+        **kwargs
+    ):
+        """
+        Remove hosts and hostgroups affected by Sudo Rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_host: hosts to remove
+        :type  o_host: str
+        :param o_hostgroup: host groups to remove
+        :type  o_hostgroup: str
+        :param o_hostmask: host masks of allowed hosts
+        :type  o_hostmask: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_host is not None:
+            _params['host'] = o_host
+        if o_hostgroup is not None:
+            _params['hostgroup'] = o_hostgroup
+        if o_hostmask is not None:
+            _params['hostmask'] = o_hostmask
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudorule_remove_host', _args, _params)
+
+    def sudorule_remove_option(
+        self,
+        a_cn,
+        o_ipasudoopt,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Remove an option from Sudo Rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_ipasudoopt: Sudo Option
+        :type  o_ipasudoopt: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'ipasudoopt': o_ipasudoopt,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudorule_remove_option', _args, _params)
+
+    def sudorule_remove_runasgroup(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_group=None,
+        **kwargs
+    ):
+        """
+        Remove group for Sudo to execute as.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_group: groups to remove
+        :type  o_group: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_group is not None:
+            _params['group'] = o_group
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudorule_remove_runasgroup', _args, _params)
+
+    def sudorule_remove_runasuser(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        **kwargs
+    ):
+        """
+        Remove users and groups for Sudo to execute as.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to remove
+        :type  o_user: str
+        :param o_group: groups to remove
+        :type  o_group: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudorule_remove_runasuser', _args, _params)
+
+    def sudorule_remove_user(
+        self,
+        a_cn,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        **kwargs
+    ):
+        """
+        Remove users and groups affected by Sudo Rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to remove
+        :type  o_user: str
+        :param o_group: groups to remove
+        :type  o_group: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudorule_remove_user', _args, _params)
+
+    def sudorule_show(
+        self,
+        a_cn,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Display Sudo Rule.
+
+
+        :param a_cn: Rule name
+        :type  a_cn: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('sudorule_show', _args, _params)
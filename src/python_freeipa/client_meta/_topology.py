@@ -0,0 +1,614 @@
+class Commands(object):
+
+    def topologysegment_add(
+        self,
+        a_topologysuffixcn,
+        a_cn,
+        o_iparepltoposegmentleftnode,
+        o_iparepltoposegmentrightnode,
+        o_iparepltoposegmentdirection='both',
+        o_nsds5replicastripattrs=None,
+        o_nsds5replicatedattributelist=None,
+        o_nsds5replicatedattributelisttotal=None,
+        o_nsds5replicatimeout=None,
+        o_nsds5replicaenabled=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Add a new segment.
+
+
+        :param a_topologysuffixcn: Suffix name
+        :type  a_topologysuffixcn: str
+        :param a_cn: Arbitrary string identifying the segment
+        :type  a_cn: str
+        :param o_iparepltoposegmentleftnode: Left replication node - an IPA
+            server
+        :type  o_iparepltoposegmentleftnode: str
+        :param o_iparepltoposegmentrightnode: Right replication node - an IPA
+            server
+        :type  o_iparepltoposegmentrightnode: str
+        :param o_iparepltoposegmentdirection: Direction of replication between
+            left and right replication node
+        :type  o_iparepltoposegmentdirection: str, valid values ['both', 'left-right', 'right-left']
+        :param o_nsds5replicastripattrs: A space separated list of attributes
+            which are removed from replication updates.
+        :type  o_nsds5replicastripattrs: str
+        :param o_nsds5replicatedattributelist: Attributes that are not
+            replicated to a consumer server during a fractional update. E.g.,
+            `(objectclass=*) $ EXCLUDE accountlockout memberof
+        :type  o_nsds5replicatedattributelist: str
+        :param o_nsds5replicatedattributelisttotal: Attributes that are not
+            replicated to a consumer server during a total update. E.g.
+            (objectclass=*) $ EXCLUDE accountlockout
+        :type  o_nsds5replicatedattributelisttotal: str
+        :param o_nsds5replicatimeout: Number of seconds outbound LDAP
+            operations waits for a response from the remote replica before timing
+            out and failing
+        :type  o_nsds5replicatimeout: int, min value 0, max value 2147483647
+        :param o_nsds5replicaenabled: Whether a replication agreement is
+            active, meaning whether replication is occurring per that agreement
+        :type  o_nsds5replicaenabled: str, valid values ['on', 'off']
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_topologysuffixcn, a_cn]
+        _params = {
+            'iparepltoposegmentleftnode': o_iparepltoposegmentleftnode,
+            'iparepltoposegmentrightnode': o_iparepltoposegmentrightnode,
+            'iparepltoposegmentdirection': o_iparepltoposegmentdirection,
+            'all': o_all,
+            'raw': o_raw,
+        }
+        if o_nsds5replicastripattrs is not None:
+            _params['nsds5replicastripattrs'] = o_nsds5replicastripattrs
+        if o_nsds5replicatedattributelist is not None:
+            _params['nsds5replicatedattributelist'] = o_nsds5replicatedattributelist
+        if o_nsds5replicatedattributelisttotal is not None:
+            _params['nsds5replicatedattributelisttotal'] = o_nsds5replicatedattributelisttotal
+        if o_nsds5replicatimeout is not None:
+            _params['nsds5replicatimeout'] = o_nsds5replicatimeout
+        if o_nsds5replicaenabled is not None:
+            _params['nsds5replicaenabled'] = o_nsds5replicaenabled
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('topologysegment_add', _args, _params)
+
+    def topologysegment_del(
+        self,
+        a_topologysuffixcn,
+        a_cn,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete a segment.
+
+
+        :param a_topologysuffixcn: Suffix name
+        :type  a_topologysuffixcn: str
+        :param a_cn: Arbitrary string identifying the segment
+        :type  a_cn: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_topologysuffixcn, a_cn]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('topologysegment_del', _args, _params)
+
+    def topologysegment_find(
+        self,
+        a_topologysuffixcn,
+        a_criteria=None,
+        o_cn=None,
+        o_iparepltoposegmentleftnode=None,
+        o_iparepltoposegmentrightnode=None,
+        o_iparepltoposegmentdirection=None,
+        o_nsds5replicastripattrs=None,
+        o_nsds5replicatedattributelist=None,
+        o_nsds5replicatedattributelisttotal=None,
+        o_nsds5replicatimeout=None,
+        o_nsds5replicaenabled=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for topology segments.
+
+
+        :param a_topologysuffixcn: Suffix name
+        :type  a_topologysuffixcn: str
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_cn: Arbitrary string identifying the segment
+        :type  o_cn: str
+        :param o_iparepltoposegmentleftnode: Left replication node - an IPA
+            server
+        :type  o_iparepltoposegmentleftnode: str
+        :param o_iparepltoposegmentrightnode: Right replication node - an IPA
+            server
+        :type  o_iparepltoposegmentrightnode: str
+        :param o_iparepltoposegmentdirection: Direction of replication between
+            left and right replication node
+        :type  o_iparepltoposegmentdirection: str, valid values ['both', 'left-right', 'right-left']
+        :param o_nsds5replicastripattrs: A space separated list of attributes
+            which are removed from replication updates.
+        :type  o_nsds5replicastripattrs: str
+        :param o_nsds5replicatedattributelist: Attributes that are not
+            replicated to a consumer server during a fractional update. E.g.,
+            `(objectclass=*) $ EXCLUDE accountlockout memberof
+        :type  o_nsds5replicatedattributelist: str
+        :param o_nsds5replicatedattributelisttotal: Attributes that are not
+            replicated to a consumer server during a total update. E.g.
+            (objectclass=*) $ EXCLUDE accountlockout
+        :type  o_nsds5replicatedattributelisttotal: str
+        :param o_nsds5replicatimeout: Number of seconds outbound LDAP
+            operations waits for a response from the remote replica before timing
+            out and failing
+        :type  o_nsds5replicatimeout: int, min value 0, max value 2147483647
+        :param o_nsds5replicaenabled: Whether a replication agreement is
+            active, meaning whether replication is occurring per that agreement
+        :type  o_nsds5replicaenabled: str, valid values ['on', 'off']
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("name")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_topologysuffixcn, a_criteria]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_iparepltoposegmentleftnode is not None:
+            _params['iparepltoposegmentleftnode'] = o_iparepltoposegmentleftnode
+        if o_iparepltoposegmentrightnode is not None:
+            _params['iparepltoposegmentrightnode'] = o_iparepltoposegmentrightnode
+        if o_iparepltoposegmentdirection is not None:
+            _params['iparepltoposegmentdirection'] = o_iparepltoposegmentdirection
+        if o_nsds5replicastripattrs is not None:
+            _params['nsds5replicastripattrs'] = o_nsds5replicastripattrs
+        if o_nsds5replicatedattributelist is not None:
+            _params['nsds5replicatedattributelist'] = o_nsds5replicatedattributelist
+        if o_nsds5replicatedattributelisttotal is not None:
+            _params['nsds5replicatedattributelisttotal'] = o_nsds5replicatedattributelisttotal
+        if o_nsds5replicatimeout is not None:
+            _params['nsds5replicatimeout'] = o_nsds5replicatimeout
+        if o_nsds5replicaenabled is not None:
+            _params['nsds5replicaenabled'] = o_nsds5replicaenabled
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('topologysegment_find', _args, _params)
+
+    def topologysegment_mod(
+        self,
+        a_topologysuffixcn,
+        a_cn,
+        o_nsds5replicastripattrs=None,
+        o_nsds5replicatedattributelist=None,
+        o_nsds5replicatedattributelisttotal=None,
+        o_nsds5replicatimeout=None,
+        o_nsds5replicaenabled=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Modify a segment.
+
+
+        :param a_topologysuffixcn: Suffix name
+        :type  a_topologysuffixcn: str
+        :param a_cn: Arbitrary string identifying the segment
+        :type  a_cn: str
+        :param o_nsds5replicastripattrs: A space separated list of attributes
+            which are removed from replication updates.
+        :type  o_nsds5replicastripattrs: str
+        :param o_nsds5replicatedattributelist: Attributes that are not
+            replicated to a consumer server during a fractional update. E.g.,
+            `(objectclass=*) $ EXCLUDE accountlockout memberof
+        :type  o_nsds5replicatedattributelist: str
+        :param o_nsds5replicatedattributelisttotal: Attributes that are not
+            replicated to a consumer server during a total update. E.g.
+            (objectclass=*) $ EXCLUDE accountlockout
+        :type  o_nsds5replicatedattributelisttotal: str
+        :param o_nsds5replicatimeout: Number of seconds outbound LDAP
+            operations waits for a response from the remote replica before timing
+            out and failing
+        :type  o_nsds5replicatimeout: int, min value 0, max value 2147483647
+        :param o_nsds5replicaenabled: Whether a replication agreement is
+            active, meaning whether replication is occurring per that agreement
+        :type  o_nsds5replicaenabled: str, valid values ['on', 'off']
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_topologysuffixcn, a_cn]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if o_nsds5replicastripattrs is not None:
+            _params['nsds5replicastripattrs'] = o_nsds5replicastripattrs
+        if o_nsds5replicatedattributelist is not None:
+            _params['nsds5replicatedattributelist'] = o_nsds5replicatedattributelist
+        if o_nsds5replicatedattributelisttotal is not None:
+            _params['nsds5replicatedattributelisttotal'] = o_nsds5replicatedattributelisttotal
+        if o_nsds5replicatimeout is not None:
+            _params['nsds5replicatimeout'] = o_nsds5replicatimeout
+        if o_nsds5replicaenabled is not None:
+            _params['nsds5replicaenabled'] = o_nsds5replicaenabled
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('topologysegment_mod', _args, _params)
+
+    def topologysegment_reinitialize(
+        self,
+        a_topologysuffixcn,
+        a_cn,
+        o_left=False,
+        o_right=False,
+        o_stop=False,
+        **kwargs
+    ):
+        """
+        Request a full re-initialization of the node retrieving data from the other node.
+
+
+        :param a_topologysuffixcn: Suffix name
+        :type  a_topologysuffixcn: str
+        :param a_cn: Arbitrary string identifying the segment
+        :type  a_cn: str
+        :param o_left: Initialize left node
+        :type  o_left: bool
+        :param o_right: Initialize right node
+        :type  o_right: bool
+        :param o_stop: Stop already started refresh of chosen node(s)
+        :type  o_stop: bool
+        """
+        _args = [a_topologysuffixcn, a_cn]
+        _params = {}
+        if o_left is not None:
+            _params['left'] = o_left
+        if o_right is not None:
+            _params['right'] = o_right
+        if o_stop is not None:
+            _params['stop'] = o_stop
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('topologysegment_reinitialize', _args, _params)
+
+    def topologysegment_show(
+        self,
+        a_topologysuffixcn,
+        a_cn,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display a segment.
+
+
+        :param a_topologysuffixcn: Suffix name
+        :type  a_topologysuffixcn: str
+        :param a_cn: Arbitrary string identifying the segment
+        :type  a_cn: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_topologysuffixcn, a_cn]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('topologysegment_show', _args, _params)
+
+    def topologysuffix_add(
+        self,
+        a_cn,
+        o_iparepltopoconfroot,
+        o_setattr=None,
+        o_addattr=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Add a new topology suffix to be managed.
+
+
+        :param a_cn: Suffix name
+        :type  a_cn: str
+        :param o_iparepltopoconfroot: Managed LDAP suffix DN
+        :type  o_iparepltopoconfroot: DNParam
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'iparepltopoconfroot': o_iparepltopoconfroot,
+            'all': o_all,
+            'raw': o_raw,
+        }
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('topologysuffix_add', _args, _params)
+
+    def topologysuffix_del(
+        self,
+        a_cn,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete a topology suffix.
+
+
+        :param a_cn: Suffix name
+        :type  a_cn: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_cn]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('topologysuffix_del', _args, _params)
+
+    def topologysuffix_find(
+        self,
+        a_criteria=None,
+        o_cn=None,
+        o_iparepltopoconfroot=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for topology suffixes.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_cn: Suffix name
+        :type  o_cn: str
+        :param o_iparepltopoconfroot: Managed LDAP suffix DN
+        :type  o_iparepltopoconfroot: DNParam
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("name")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_iparepltopoconfroot is not None:
+            _params['iparepltopoconfroot'] = o_iparepltopoconfroot
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('topologysuffix_find', _args, _params)
+
+    def topologysuffix_mod(
+        self,
+        a_cn,
+        o_iparepltopoconfroot=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Modify a topology suffix.
+
+
+        :param a_cn: Suffix name
+        :type  a_cn: str
+        :param o_iparepltopoconfroot: Managed LDAP suffix DN
+        :type  o_iparepltopoconfroot: DNParam
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if o_iparepltopoconfroot is not None:
+            _params['iparepltopoconfroot'] = o_iparepltopoconfroot
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('topologysuffix_mod', _args, _params)
+
+    def topologysuffix_show(
+        self,
+        a_cn,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Show managed suffix.
+
+
+        :param a_cn: Suffix name
+        :type  a_cn: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('topologysuffix_show', _args, _params)
+
+    def topologysuffix_verify(
+        self,
+        a_cn,
+        **kwargs
+    ):
+        """
+        Verify replication topology for suffix.
+
+        Checks done:
+          1. check if a topology is not disconnected. In other words if there are
+             replication paths between all servers.
+          2. check if servers don't have more than the recommended number of
+             replication agreements
+
+
+        :param a_cn: Suffix name
+        :type  a_cn: str
+        """
+        _args = [a_cn]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('topologysuffix_verify', _args, _params)
@@ -0,0 +1,730 @@
+class Commands(object):
+
+    def trust_add(
+        self,
+        a_cn,
+        o_setattr=None,
+        o_addattr=None,
+        o_trust_type='ad',
+        o_realm_admin=None,
+        o_realm_passwd=None,
+        o_realm_server=None,
+        o_trust_secret=None,
+        o_base_id=None,
+        o_range_size=None,
+        o_range_type=None,
+        o_bidirectional=None,
+        o_external=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Add new trust to use.
+
+        This command establishes trust relationship to another domain
+        which becomes 'trusted'. As result, users of the trusted domain
+        may access resources of this domain.
+
+        Only trusts to Active Directory domains are supported right now.
+
+        The command can be safely run multiple times against the same domain,
+        this will cause change to trust relationship credentials on both
+        sides.
+
+        Note that if the command was previously run with a specific range type,
+        or with automatic detection of the range type, and you want to configure a
+        different range type, you may need to delete first the ID range using
+        ipa idrange-del before retrying the command with the desired range type.
+
+
+        :param a_cn: Realm name
+        :type  a_cn: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_trust_type: Trust type (ad for Active Directory, default)
+        :type  o_trust_type: str, valid values ['ad']
+        :param o_realm_admin: Active Directory domain administrator
+        :type  o_realm_admin: str
+        :param o_realm_passwd: Active Directory domain administrator's
+            password
+        :type  o_realm_passwd: Password
+        :param o_realm_server: Domain controller for the Active Directory
+            domain (optional)
+        :type  o_realm_server: str
+        :param o_trust_secret: Shared secret for the trust
+        :type  o_trust_secret: Password
+        :param o_base_id: First Posix ID of the range reserved for the trusted
+            domain
+        :type  o_base_id: int, min value -2147483648, max value 2147483647
+        :param o_range_size: Size of the ID range reserved for the trusted
+            domain
+        :type  o_range_size: int, min value -2147483648, max value 2147483647
+        :param o_range_type: Type of trusted domain ID range, one of allowed
+            values
+        :type  o_range_type: str, valid values ['ipa-ad-trust', 'ipa-ad-trust-posix']
+        :param o_bidirectional: Establish bi-directional trust. By default
+            trust is inbound one-way only.
+        :type  o_bidirectional: Bool
+        :param o_external: Establish external trust to a domain in another
+            forest. The trust is not transitive beyond the domain.
+        :type  o_external: Bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'trust_type': o_trust_type, 'all': o_all, 'raw': o_raw}
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_realm_admin is not None:
+            _params['realm_admin'] = o_realm_admin
+        if o_realm_passwd is not None:
+            _params['realm_passwd'] = o_realm_passwd
+        if o_realm_server is not None:
+            _params['realm_server'] = o_realm_server
+        if o_trust_secret is not None:
+            _params['trust_secret'] = o_trust_secret
+        if o_base_id is not None:
+            _params['base_id'] = o_base_id
+        if o_range_size is not None:
+            _params['range_size'] = o_range_size
+        if o_range_type is not None:
+            _params['range_type'] = o_range_type
+        if o_bidirectional is not None:
+            _params['bidirectional'] = o_bidirectional
+        if o_external is not None:
+            _params['external'] = o_external
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('trust_add', _args, _params)
+
+    def trust_del(
+        self,
+        a_cn,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Delete a trust.
+
+
+        :param a_cn: Realm name
+        :type  a_cn: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_cn]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('trust_del', _args, _params)
+
+    def trust_fetch_domains(
+        self,
+        a_cn,
+        o_rights=False,
+        o_realm_admin=None,
+        o_realm_passwd=None,
+        o_realm_server=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Refresh list of the domains associated with the trust
+
+
+        :param a_cn: Realm name
+        :type  a_cn: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_realm_admin: Active Directory domain administrator
+        :type  o_realm_admin: str
+        :param o_realm_passwd: Active Directory domain administrator's
+            password
+        :type  o_realm_passwd: Password
+        :param o_realm_server: Domain controller for the Active Directory
+            domain (optional)
+        :type  o_realm_server: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if o_realm_admin is not None:
+            _params['realm_admin'] = o_realm_admin
+        if o_realm_passwd is not None:
+            _params['realm_passwd'] = o_realm_passwd
+        if o_realm_server is not None:
+            _params['realm_server'] = o_realm_server
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('trust_fetch_domains', _args, _params)
+
+    def trust_find(
+        self,
+        a_criteria=None,
+        o_cn=None,
+        o_ipantflatname=None,
+        o_ipanttrusteddomainsid=None,
+        o_ipantsidblacklistincoming=None,
+        o_ipantsidblacklistoutgoing=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for trusts.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_cn: Realm name
+        :type  o_cn: str
+        :param o_ipantflatname: Domain NetBIOS name
+        :type  o_ipantflatname: str
+        :param o_ipanttrusteddomainsid: Domain Security Identifier
+        :type  o_ipanttrusteddomainsid: str
+        :param o_ipantsidblacklistincoming: SID blacklist incoming
+        :type  o_ipantsidblacklistincoming: str
+        :param o_ipantsidblacklistoutgoing: SID blacklist outgoing
+        :type  o_ipantsidblacklistoutgoing: str
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("realm")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_ipantflatname is not None:
+            _params['ipantflatname'] = o_ipantflatname
+        if o_ipanttrusteddomainsid is not None:
+            _params['ipanttrusteddomainsid'] = o_ipanttrusteddomainsid
+        if o_ipantsidblacklistincoming is not None:
+            _params['ipantsidblacklistincoming'] = o_ipantsidblacklistincoming
+        if o_ipantsidblacklistoutgoing is not None:
+            _params['ipantsidblacklistoutgoing'] = o_ipantsidblacklistoutgoing
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('trust_find', _args, _params)
+
+    def trust_mod(
+        self,
+        a_cn,
+        o_ipantsidblacklistincoming=None,
+        o_ipantsidblacklistoutgoing=None,
+        o_ipantadditionalsuffixes=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Modify a trust (for future use).
+
+        Currently only the default option to modify the LDAP attributes is
+        available. More specific options will be added in coming releases.
+
+
+        :param a_cn: Realm name
+        :type  a_cn: str
+        :param o_ipantsidblacklistincoming: SID blacklist incoming
+        :type  o_ipantsidblacklistincoming: str
+        :param o_ipantsidblacklistoutgoing: SID blacklist outgoing
+        :type  o_ipantsidblacklistoutgoing: str
+        :param o_ipantadditionalsuffixes: UPN suffixes
+        :type  o_ipantadditionalsuffixes: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if o_ipantsidblacklistincoming is not None:
+            _params['ipantsidblacklistincoming'] = o_ipantsidblacklistincoming
+        if o_ipantsidblacklistoutgoing is not None:
+            _params['ipantsidblacklistoutgoing'] = o_ipantsidblacklistoutgoing
+        if o_ipantadditionalsuffixes is not None:
+            _params['ipantadditionalsuffixes'] = o_ipantadditionalsuffixes
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('trust_mod', _args, _params)
+
+    def trust_resolve(
+        self,
+        o_sids,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Resolve security identifiers of users and groups in trusted domains
+
+
+        :param o_sids: Security Identifiers (SIDs)
+        :type  o_sids: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = []
+        _params = {'sids': o_sids, 'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('trust_resolve', _args, _params)
+
+    def trust_show(
+        self,
+        a_cn,
+        o_rights=False,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Display information about a trust.
+
+
+        :param a_cn: Realm name
+        :type  a_cn: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'rights': o_rights, 'all': o_all, 'raw': o_raw}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('trust_show', _args, _params)
+
+    def trustconfig_mod(
+        self,
+        o_ipantfallbackprimarygroup=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_trust_type='ad',
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Modify global trust configuration.
+
+
+        :param o_ipantfallbackprimarygroup: Fallback primary group
+        :type  o_ipantfallbackprimarygroup: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_trust_type: Trust type (ad for Active Directory, default)
+        :type  o_trust_type: str, valid values ['ad']
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = []
+        _params = {
+            'rights': o_rights,
+            'trust_type': o_trust_type,
+            'all': o_all,
+            'raw': o_raw,
+        }
+        if o_ipantfallbackprimarygroup is not None:
+            _params['ipantfallbackprimarygroup'] = o_ipantfallbackprimarygroup
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('trustconfig_mod', _args, _params)
+
+    def trustconfig_show(
+        self,
+        o_rights=False,
+        o_trust_type='ad',
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Show global trust configuration.
+
+
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_trust_type: Trust type (ad for Active Directory, default)
+        :type  o_trust_type: str, valid values ['ad']
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = []
+        _params = {
+            'rights': o_rights,
+            'trust_type': o_trust_type,
+            'all': o_all,
+            'raw': o_raw,
+        }
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('trustconfig_show', _args, _params)
+
+    def trustdomain_add(
+        self,
+        a_trustcn,
+        a_cn,
+        o_ipantflatname=None,
+        o_ipanttrusteddomainsid=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_trust_type='ad',
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Allow access from the trusted domain
+
+
+        :param a_trustcn: Realm name
+        :type  a_trustcn: str
+        :param a_cn: Domain name
+        :type  a_cn: str
+        :param o_ipantflatname: Domain NetBIOS name
+        :type  o_ipantflatname: str
+        :param o_ipanttrusteddomainsid: Domain Security Identifier
+        :type  o_ipanttrusteddomainsid: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_trust_type: Trust type (ad for Active Directory, default)
+        :type  o_trust_type: str, valid values ['ad']
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_trustcn, a_cn]
+        _params = {'trust_type': o_trust_type, 'all': o_all, 'raw': o_raw}
+        if o_ipantflatname is not None:
+            _params['ipantflatname'] = o_ipantflatname
+        if o_ipanttrusteddomainsid is not None:
+            _params['ipanttrusteddomainsid'] = o_ipanttrusteddomainsid
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('trustdomain_add', _args, _params)
+
+    def trustdomain_del(
+        self,
+        a_trustcn,
+        a_cn,
+        o_continue=False,
+        **kwargs
+    ):
+        """
+        Remove information about the domain associated with the trust.
+
+
+        :param a_trustcn: Realm name
+        :type  a_trustcn: str
+        :param a_cn: Domain name
+        :type  a_cn: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        """
+        _args = [a_trustcn, a_cn]
+        _params = {'continue': o_continue}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('trustdomain_del', _args, _params)
+
+    def trustdomain_disable(
+        self,
+        a_trustcn,
+        a_cn,
+        **kwargs
+    ):
+        """
+        Disable use of IPA resources by the domain of the trust
+
+
+        :param a_trustcn: Realm name
+        :type  a_trustcn: str
+        :param a_cn: Domain name
+        :type  a_cn: str
+        """
+        _args = [a_trustcn, a_cn]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('trustdomain_disable', _args, _params)
+
+    def trustdomain_enable(
+        self,
+        a_trustcn,
+        a_cn,
+        **kwargs
+    ):
+        """
+        Allow use of IPA resources by the domain of the trust
+
+
+        :param a_trustcn: Realm name
+        :type  a_trustcn: str
+        :param a_cn: Domain name
+        :type  a_cn: str
+        """
+        _args = [a_trustcn, a_cn]
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('trustdomain_enable', _args, _params)
+
+    def trustdomain_find(
+        self,
+        a_trustcn,
+        a_criteria=None,
+        o_cn=None,
+        o_ipantflatname=None,
+        o_ipanttrusteddomainsid=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_all=True,
+        o_raw=False,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search domains of the trust
+
+
+        :param a_trustcn: Realm name
+        :type  a_trustcn: str
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_cn: Domain name
+        :type  o_cn: str
+        :param o_ipantflatname: Domain NetBIOS name
+        :type  o_ipantflatname: str
+        :param o_ipanttrusteddomainsid: Domain Security Identifier
+        :type  o_ipanttrusteddomainsid: str
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("domain")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_trustcn, a_criteria]
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_ipantflatname is not None:
+            _params['ipantflatname'] = o_ipantflatname
+        if o_ipanttrusteddomainsid is not None:
+            _params['ipanttrusteddomainsid'] = o_ipanttrusteddomainsid
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('trustdomain_find', _args, _params)
+
+    def trustdomain_mod(
+        self,
+        a_trustcn,
+        a_cn,
+        o_ipantflatname=None,
+        o_ipanttrusteddomainsid=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_trust_type='ad',
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Modify trustdomain of the trust
+
+
+        :param a_trustcn: Realm name
+        :type  a_trustcn: str
+        :param a_cn: Domain name
+        :type  a_cn: str
+        :param o_ipantflatname: Domain NetBIOS name
+        :type  o_ipantflatname: str
+        :param o_ipanttrusteddomainsid: Domain Security Identifier
+        :type  o_ipanttrusteddomainsid: str
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_trust_type: Trust type (ad for Active Directory, default)
+        :type  o_trust_type: str, valid values ['ad']
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_trustcn, a_cn]
+        _params = {
+            'rights': o_rights,
+            'trust_type': o_trust_type,
+            'all': o_all,
+            'raw': o_raw,
+        }
+        if o_ipantflatname is not None:
+            _params['ipantflatname'] = o_ipantflatname
+        if o_ipanttrusteddomainsid is not None:
+            _params['ipanttrusteddomainsid'] = o_ipanttrusteddomainsid
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('trustdomain_mod', _args, _params)
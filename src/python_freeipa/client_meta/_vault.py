@@ -0,0 +1,920 @@
+class Commands(object):
+
+    def vault_add_internal(
+        self,
+        a_cn,
+        o_description=None,
+        o_ipavaulttype='symmetric',
+        o_ipavaultsalt=None,
+        o_ipavaultpublickey=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_service=None,
+        o_shared=False,
+        o_username=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Add a vault.
+
+
+        :param a_cn: Vault name
+        :type  a_cn: str
+        :param o_description: Vault description
+        :type  o_description: str
+        :param o_ipavaulttype: Vault type
+        :type  o_ipavaulttype: str, valid values ['standard', 'symmetric', 'asymmetric']
+        :param o_ipavaultsalt: Vault salt
+        :type  o_ipavaultsalt: Bytes
+        :param o_ipavaultpublickey: Vault public key
+        :type  o_ipavaultpublickey: Bytes
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_service: Service name of the service vault
+        :type  o_service: Principal
+        :param o_shared: Shared vault
+        :type  o_shared: bool
+        :param o_username: Username of the user vault
+        :type  o_username: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipavaulttype is not None:
+            _params['ipavaulttype'] = o_ipavaulttype
+        if o_ipavaultsalt is not None:
+            _params['ipavaultsalt'] = o_ipavaultsalt
+        if o_ipavaultpublickey is not None:
+            _params['ipavaultpublickey'] = o_ipavaultpublickey
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_service is not None:
+            _params['service'] = o_service
+        if o_shared is not None:
+            _params['shared'] = o_shared
+        if o_username is not None:
+            _params['username'] = o_username
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('vault_add_internal', _args, _params)
+
+    def vault_add_member(
+        self,
+        a_cn,
+        o_service=None,
+        o_shared=False,
+        o_username=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        o_services=None,
+        **kwargs
+    ):
+        """
+        Add members to a vault.
+
+
+        :param a_cn: Vault name
+        :type  a_cn: str
+        :param o_service: Service name of the service vault
+        :type  o_service: Principal
+        :param o_shared: Shared vault
+        :type  o_shared: bool
+        :param o_username: Username of the user vault
+        :type  o_username: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to add
+        :type  o_user: str
+        :param o_group: groups to add
+        :type  o_group: str
+        :param o_services: services to add
+        :type  o_services: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_service is not None:
+            _params['service'] = o_service
+        if o_shared is not None:
+            _params['shared'] = o_shared
+        if o_username is not None:
+            _params['username'] = o_username
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if o_services is not None:
+            _params['services'] = o_services
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('vault_add_member', _args, _params)
+
+    def vault_add_owner(
+        self,
+        a_cn,
+        o_service=None,
+        o_shared=False,
+        o_username=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        o_services=None,
+        **kwargs
+    ):
+        """
+        Add owners to a vault.
+
+
+        :param a_cn: Vault name
+        :type  a_cn: str
+        :param o_service: Service name of the service vault
+        :type  o_service: Principal
+        :param o_shared: Shared vault
+        :type  o_shared: bool
+        :param o_username: Username of the user vault
+        :type  o_username: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to add
+        :type  o_user: str
+        :param o_group: groups to add
+        :type  o_group: str
+        :param o_services: services to add
+        :type  o_services: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_service is not None:
+            _params['service'] = o_service
+        if o_shared is not None:
+            _params['shared'] = o_shared
+        if o_username is not None:
+            _params['username'] = o_username
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if o_services is not None:
+            _params['services'] = o_services
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('vault_add_owner', _args, _params)
+
+    def vault_archive_internal(
+        self,
+        a_cn,
+        o_session_key,
+        o_vault_data,
+        o_nonce,
+        o_service=None,
+        o_shared=False,
+        o_username=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Archive data into a vault.
+
+
+        :param a_cn: Vault name
+        :type  a_cn: str
+        :param o_service: Service name of the service vault
+        :type  o_service: Principal
+        :param o_shared: Shared vault
+        :type  o_shared: bool
+        :param o_username: Username of the user vault
+        :type  o_username: str
+        :param o_session_key: Session key wrapped with transport certificate
+        :type  o_session_key: Bytes
+        :param o_vault_data: Vault data encrypted with session key
+        :type  o_vault_data: Bytes
+        :param o_nonce: Nonce
+        :type  o_nonce: Bytes
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'session_key': o_session_key,
+            'vault_data': o_vault_data,
+            'nonce': o_nonce,
+            'all': o_all,
+            'raw': o_raw,
+        }
+        if o_service is not None:
+            _params['service'] = o_service
+        if o_shared is not None:
+            _params['shared'] = o_shared
+        if o_username is not None:
+            _params['username'] = o_username
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('vault_archive_internal', _args, _params)
+
+    def vault_del(
+        self,
+        a_cn,
+        o_continue=False,
+        o_service=None,
+        o_shared=False,
+        o_username=None,
+        **kwargs
+    ):
+        """
+        Delete a vault.
+
+
+        :param a_cn: Vault name
+        :type  a_cn: str
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        :param o_service: Service name of the service vault
+        :type  o_service: Principal
+        :param o_shared: Shared vault
+        :type  o_shared: bool
+        :param o_username: Username of the user vault
+        :type  o_username: str
+        """
+        _args = [a_cn]
+        _params = {'continue': o_continue}
+        if o_service is not None:
+            _params['service'] = o_service
+        if o_shared is not None:
+            _params['shared'] = o_shared
+        if o_username is not None:
+            _params['username'] = o_username
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('vault_del', _args, _params)
+
+    def vault_find(
+        self,
+        a_criteria=None,
+        o_cn=None,
+        o_description=None,
+        o_ipavaulttype=None,
+        o_timelimit=None,
+        o_sizelimit=None,
+        o_service=None,
+        o_shared=False,
+        o_username=None,
+        o_services=False,
+        o_users=False,
+        o_all=True,
+        o_raw=False,
+        o_no_members=True,
+        o_pkey_only=False,
+        **kwargs
+    ):
+        """
+        Search for vaults.
+
+
+        :param a_criteria: A string searched in all relevant object attributes
+        :type  a_criteria: str
+        :param o_cn: Vault name
+        :type  o_cn: str
+        :param o_description: Vault description
+        :type  o_description: str
+        :param o_ipavaulttype: Vault type
+        :type  o_ipavaulttype: str, valid values ['standard', 'symmetric', 'asymmetric']
+        :param o_timelimit: Time limit of search in seconds (0 is unlimited)
+        :type  o_timelimit: int, min value 0, max value 2147483647
+        :param o_sizelimit: Maximum number of entries returned (0 is
+            unlimited)
+        :type  o_sizelimit: int, min value 0, max value 2147483647
+        :param o_service: Service name of the service vault
+        :type  o_service: Principal
+        :param o_shared: Shared vault
+        :type  o_shared: bool
+        :param o_username: Username of the user vault
+        :type  o_username: str
+        :param o_services: List all service vaults
+        :type  o_services: bool
+        :param o_users: List all user vaults
+        :type  o_users: bool
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_pkey_only: Results should contain primary key attribute only
+            ("name")
+        :type  o_pkey_only: bool
+        """
+        _args = [a_criteria]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_cn is not None:
+            _params['cn'] = o_cn
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipavaulttype is not None:
+            _params['ipavaulttype'] = o_ipavaulttype
+        if o_timelimit is not None:
+            _params['timelimit'] = o_timelimit
+        if o_sizelimit is not None:
+            _params['sizelimit'] = o_sizelimit
+        if o_service is not None:
+            _params['service'] = o_service
+        if o_shared is not None:
+            _params['shared'] = o_shared
+        if o_username is not None:
+            _params['username'] = o_username
+        if o_services is not None:
+            _params['services'] = o_services
+        if o_users is not None:
+            _params['users'] = o_users
+        if o_pkey_only is not None:
+            _params['pkey_only'] = o_pkey_only
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('vault_find', _args, _params)
+
+    def vault_mod_internal(
+        self,
+        a_cn,
+        o_description=None,
+        o_ipavaulttype=None,
+        o_ipavaultsalt=None,
+        o_ipavaultpublickey=None,
+        o_setattr=None,
+        o_addattr=None,
+        o_delattr=None,
+        o_rights=False,
+        o_service=None,
+        o_shared=False,
+        o_username=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Modify a vault.
+
+
+        :param a_cn: Vault name
+        :type  a_cn: str
+        :param o_description: Vault description
+        :type  o_description: str
+        :param o_ipavaulttype: Vault type
+        :type  o_ipavaulttype: str, valid values ['standard', 'symmetric', 'asymmetric']
+        :param o_ipavaultsalt: Vault salt
+        :type  o_ipavaultsalt: Bytes
+        :param o_ipavaultpublickey: Vault public key
+        :type  o_ipavaultpublickey: Bytes
+        :param o_setattr: Set an attribute to a name/value pair. Format is
+            attr=value. For multi-valued attributes, the command replaces the
+            values already present.
+        :type  o_setattr: str
+        :param o_addattr: Add an attribute/value pair. Format is attr=value.
+            The attribute must be part of the schema.
+        :type  o_addattr: str
+        :param o_delattr: Delete an attribute/value pair. The option will be
+            evaluated last, after all sets and adds.
+        :type  o_delattr: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_service: Service name of the service vault
+        :type  o_service: Principal
+        :param o_shared: Shared vault
+        :type  o_shared: bool
+        :param o_username: Username of the user vault
+        :type  o_username: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_description is not None:
+            _params['description'] = o_description
+        if o_ipavaulttype is not None:
+            _params['ipavaulttype'] = o_ipavaulttype
+        if o_ipavaultsalt is not None:
+            _params['ipavaultsalt'] = o_ipavaultsalt
+        if o_ipavaultpublickey is not None:
+            _params['ipavaultpublickey'] = o_ipavaultpublickey
+        if o_setattr is not None:
+            _params['setattr'] = o_setattr
+        if o_addattr is not None:
+            _params['addattr'] = o_addattr
+        if o_delattr is not None:
+            _params['delattr'] = o_delattr
+        if o_service is not None:
+            _params['service'] = o_service
+        if o_shared is not None:
+            _params['shared'] = o_shared
+        if o_username is not None:
+            _params['username'] = o_username
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('vault_mod_internal', _args, _params)
+
+    def vault_remove_member(
+        self,
+        a_cn,
+        o_service=None,
+        o_shared=False,
+        o_username=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        o_services=None,
+        **kwargs
+    ):
+        """
+        Remove members from a vault.
+
+
+        :param a_cn: Vault name
+        :type  a_cn: str
+        :param o_service: Service name of the service vault
+        :type  o_service: Principal
+        :param o_shared: Shared vault
+        :type  o_shared: bool
+        :param o_username: Username of the user vault
+        :type  o_username: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to remove
+        :type  o_user: str
+        :param o_group: groups to remove
+        :type  o_group: str
+        :param o_services: services to remove
+        :type  o_services: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_service is not None:
+            _params['service'] = o_service
+        if o_shared is not None:
+            _params['shared'] = o_shared
+        if o_username is not None:
+            _params['username'] = o_username
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if o_services is not None:
+            _params['services'] = o_services
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('vault_remove_member', _args, _params)
+
+    def vault_remove_owner(
+        self,
+        a_cn,
+        o_service=None,
+        o_shared=False,
+        o_username=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        o_services=None,
+        **kwargs
+    ):
+        """
+        Remove owners from a vault.
+
+
+        :param a_cn: Vault name
+        :type  a_cn: str
+        :param o_service: Service name of the service vault
+        :type  o_service: Principal
+        :param o_shared: Shared vault
+        :type  o_shared: bool
+        :param o_username: Username of the user vault
+        :type  o_username: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to remove
+        :type  o_user: str
+        :param o_group: groups to remove
+        :type  o_group: str
+        :param o_services: services to remove
+        :type  o_services: str
+        """
+        _args = [a_cn]
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_service is not None:
+            _params['service'] = o_service
+        if o_shared is not None:
+            _params['shared'] = o_shared
+        if o_username is not None:
+            _params['username'] = o_username
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if o_services is not None:
+            _params['services'] = o_services
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('vault_remove_owner', _args, _params)
+
+    def vault_retrieve_internal(
+        self,
+        a_cn,
+        o_session_key,
+        o_service=None,
+        o_shared=False,
+        o_username=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Retrieve data from a vault.
+
+
+        :param a_cn: Vault name
+        :type  a_cn: str
+        :param o_service: Service name of the service vault
+        :type  o_service: Principal
+        :param o_shared: Shared vault
+        :type  o_shared: bool
+        :param o_username: Username of the user vault
+        :type  o_username: str
+        :param o_session_key: Session key wrapped with transport certificate
+        :type  o_session_key: Bytes
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = [a_cn]
+        _params = {'session_key': o_session_key, 'all': o_all, 'raw': o_raw}
+        if o_service is not None:
+            _params['service'] = o_service
+        if o_shared is not None:
+            _params['shared'] = o_shared
+        if o_username is not None:
+            _params['username'] = o_username
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('vault_retrieve_internal', _args, _params)
+
+    def vault_show(
+        self,
+        a_cn,
+        o_rights=False,
+        o_service=None,
+        o_shared=False,
+        o_username=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Display information about a vault.
+
+
+        :param a_cn: Vault name
+        :type  a_cn: str
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_service: Service name of the service vault
+        :type  o_service: Principal
+        :param o_shared: Shared vault
+        :type  o_shared: bool
+        :param o_username: Username of the user vault
+        :type  o_username: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = [a_cn]
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_service is not None:
+            _params['service'] = o_service
+        if o_shared is not None:
+            _params['shared'] = o_shared
+        if o_username is not None:
+            _params['username'] = o_username
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('vault_show', _args, _params)
+
+    def vaultconfig_show(
+        self,
+        o_transport_out=None,
+        o_all=True,
+        o_raw=False,
+        **kwargs
+    ):
+        """
+        Show vault configuration.
+
+
+        :param o_transport_out: Output file to store the transport certificate
+        :type  o_transport_out: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        """
+        _args = []
+        _params = {'all': o_all, 'raw': o_raw}
+        if o_transport_out is not None:
+            _params['transport_out'] = o_transport_out
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('vaultconfig_show', _args, _params)
+
+    def vaultcontainer_add_owner(
+        self,
+        o_service=None,
+        o_shared=False,
+        o_username=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        o_services=None,
+        **kwargs
+    ):
+        """
+        Add owners to a vault container.
+
+
+        :param o_service: Service name of the service vault
+        :type  o_service: Principal
+        :param o_shared: Shared vault
+        :type  o_shared: bool
+        :param o_username: Username of the user vault
+        :type  o_username: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to add
+        :type  o_user: str
+        :param o_group: groups to add
+        :type  o_group: str
+        :param o_services: services to add
+        :type  o_services: str
+        """
+        _args = []
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_service is not None:
+            _params['service'] = o_service
+        if o_shared is not None:
+            _params['shared'] = o_shared
+        if o_username is not None:
+            _params['username'] = o_username
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if o_services is not None:
+            _params['services'] = o_services
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('vaultcontainer_add_owner', _args, _params)
+
+    def vaultcontainer_del(
+        self,
+        o_continue=False,
+        o_service=None,
+        o_shared=False,
+        o_username=None,
+        **kwargs
+    ):
+        """
+        Delete a vault container.
+
+
+        :param o_continue: Continuous mode: Don't stop on errors.
+        :type  o_continue: bool
+        :param o_service: Service name of the service vault
+        :type  o_service: Principal
+        :param o_shared: Shared vault
+        :type  o_shared: bool
+        :param o_username: Username of the user vault
+        :type  o_username: str
+        """
+        _args = []
+        _params = {'continue': o_continue}
+        if o_service is not None:
+            _params['service'] = o_service
+        if o_shared is not None:
+            _params['shared'] = o_shared
+        if o_username is not None:
+            _params['username'] = o_username
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('vaultcontainer_del', _args, _params)
+
+    def vaultcontainer_remove_owner(
+        self,
+        o_service=None,
+        o_shared=False,
+        o_username=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        o_user=None,
+        o_group=None,
+        o_services=None,
+        **kwargs
+    ):
+        """
+        Remove owners from a vault container.
+
+
+        :param o_service: Service name of the service vault
+        :type  o_service: Principal
+        :param o_shared: Shared vault
+        :type  o_shared: bool
+        :param o_username: Username of the user vault
+        :type  o_username: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        :param o_user: users to remove
+        :type  o_user: str
+        :param o_group: groups to remove
+        :type  o_group: str
+        :param o_services: services to remove
+        :type  o_services: str
+        """
+        _args = []
+        _params = {'all': o_all, 'raw': o_raw, 'no_members': o_no_members}
+        if o_service is not None:
+            _params['service'] = o_service
+        if o_shared is not None:
+            _params['shared'] = o_shared
+        if o_username is not None:
+            _params['username'] = o_username
+        if o_user is not None:
+            _params['user'] = o_user
+        if o_group is not None:
+            _params['group'] = o_group
+        if o_services is not None:
+            _params['services'] = o_services
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('vaultcontainer_remove_owner', _args, _params)
+
+    def vaultcontainer_show(
+        self,
+        o_rights=False,
+        o_service=None,
+        o_shared=False,
+        o_username=None,
+        o_all=True,
+        o_raw=False,
+        o_no_members=False,
+        **kwargs
+    ):
+        """
+        Display information about a vault container.
+
+
+        :param o_rights: Display the access rights of this entry (requires
+            --all). See ipa man page for details.
+        :type  o_rights: bool
+        :param o_service: Service name of the service vault
+        :type  o_service: Principal
+        :param o_shared: Shared vault
+        :type  o_shared: bool
+        :param o_username: Username of the user vault
+        :type  o_username: str
+        :param o_all: Retrieve and print all attributes from the server.
+            Affects command output.
+        :type  o_all: bool
+        :param o_raw: Print entries as stored on the server. Only affects
+            output format.
+        :type  o_raw: bool
+        :param o_no_members: Suppress processing of membership attributes.
+        :type  o_no_members: bool
+        """
+        _args = []
+        _params = {
+            'rights': o_rights,
+            'all': o_all,
+            'raw': o_raw,
+            'no_members': o_no_members,
+        }
+        if o_service is not None:
+            _params['service'] = o_service
+        if o_shared is not None:
+            _params['shared'] = o_shared
+        if o_username is not None:
+            _params['username'] = o_username
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('vaultcontainer_show', _args, _params)
@@ -0,0 +1,17 @@
+class Commands(object):
+
+    def whoami(
+        self,
+        **kwargs
+    ):
+        """
+        Describe currently authenticated identity.
+
+
+        """
+        _args = []
+        _params = {}
+        if kwargs:
+            _params.update(kwargs)
+
+        return self._request('whoami', _args, _params)
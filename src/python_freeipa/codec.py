@@ -0,0 +1,169 @@
+"""JSON codecs used to encode requests and decode responses."""
+
+import base64
+import datetime
+import json
+import re
+
+try:
+    import orjson
+except ImportError as e:
+    # Will raise if the user explicitly asks for the orjson codec.
+    orjson = e
+
+try:
+    import ujson
+except ImportError as e:
+    # Will raise if the user explicitly asks for the ujson codec.
+    ujson = e
+
+# Format of the ``{'__datetime__': ...}`` wire encoding, always in UTC.
+DATETIME_FORMAT = '%Y%m%d%H%M%SZ'
+
+# Runs of digits of numbers that may not fit in 64 bits, such as the 128-bit
+# serial numbers of certificates, which orjson decodes as floats.
+_WIDE_NUMBER = re.compile(rb'\d{19}')
+
+
+def wire_default(value):
+    """
+    Encode the values JSON has no type for using FreeIPA's wire encodings.
+
+    ``datetime`` values become ``{'__datetime__': ...}``, ``bytes`` values become
+    ``{'__base64__': ...}`` and sets become lists.
+    """
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(datetime.timezone.utc)
+        return {'__datetime__': value.strftime(DATETIME_FORMAT)}
+    if isinstance(value, (bytes, bytearray)):
+        return {'__base64__': base64.b64encode(value).decode('ascii')}
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(
+        'Object of type {0} is not JSON serializable'.format(type(value).__name__)
+    )
+
+
+def decode_datetime(value):
+    """
+    Decode a ``{'__datetime__': ...}`` value into a naive UTC ``datetime``.
+    """
+    return datetime.datetime.strptime(value['__datetime__'], DATETIME_FORMAT)
+
+
+def decode_base64(value):
+    """
+    Decode a ``{'__base64__': ...}`` value into ``bytes``.
+    """
+    return base64.b64decode(value['__base64__'])
+
+
+def decode_wire(value):
+    """
+    Recursively replace the wire encoded values of a decoded response by
+    ``datetime`` and ``bytes`` values.
+    """
+    if isinstance(value, dict):
+        if len(value) == 1:
+            if '__datetime__' in value:
+                return decode_datetime(value)
+            if '__base64__' in value:
+                return decode_base64(value)
+        return {key: decode_wire(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [decode_wire(item) for item in value]
+    return value
+
+
+class JSONCodec(object):
+    """Codec based on the standard library ``json`` module."""
+
+    name = 'json'
+
+    def dumps(self, value):
+        """
+        Serialize a request payload.
+
+        :rtype: str or bytes
+        """
+        return json.dumps(value, default=wire_default)
+
+    def loads(self, data):
+        """
+        Deserialize a response body.
+
+        :param data: the response body
+        :type data: str or bytes
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Codec based on `orjson <https://pypi.org/project/orjson/>`_.
+
+    orjson only handles 64-bit integers: payloads with wider ones go through
+    the standard library ``json`` module instead.
+    """
+
+    name = 'orjson'
+
+    def __init__(self):
+        if isinstance(orjson, ImportError):
+            raise orjson
+
+    def dumps(self, value):
+        # Datetimes must go through wire_default instead of orjson's ISO format.
+        try:
+            return orjson.dumps(
+                value, default=wire_default, option=orjson.OPT_PASSTHROUGH_DATETIME
+            )
+        except TypeError:
+            # Integers wider than 64 bits, other unserializable values raise
+            # again.
+            return super(OrjsonCodec, self).dumps(value)
+
+    def loads(self, data):
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        if _WIDE_NUMBER.search(data):
+            return super(OrjsonCodec, self).loads(data)
+        return orjson.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+    """Codec based on `ujson <https://pypi.org/project/ujson/>`_."""
+
+    name = 'ujson'
+
+    def __init__(self):
+        if isinstance(ujson, ImportError):
+            raise ujson
+
+    def dumps(self, value):
+        return ujson.dumps(value, default=wire_default)
+
+    def loads(self, data):
+        return ujson.loads(data)
+
+
+codecs = {
+    'json': JSONCodec,
+    'orjson': OrjsonCodec,
+    'ujson': UjsonCodec,
+}
+
+
+def get_codec(codec=None):
+    """
+    Returns a codec instance.
+
+    :param codec: a codec instance, the name of a codec, or None for the
+                  standard library ``json`` module
+    :type codec: ``JSONCodec``, str or None
+    :rtype: ``JSONCodec``
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    return codecs[codec or 'json']()
@@ -0,0 +1,552 @@
+"""Columnar export of the entries of ``*_find`` results."""
+
+import array
+import calendar
+import datetime
+
+from python_freeipa.codec import decode_base64, decode_datetime
+
+# Attributes whose values are decimal strings on the wire, exported as integers.
+INTEGER_ATTRIBUTES = frozenset(
+    [
+        'uidnumber',
+        'gidnumber',
+        'ipantsecurityidentifier_rid',
+        'krbmaxticketlife',
+        'krbmaxrenewableage',
+        'krbpwdmindiffchars',
+        'krbpwdminlength',
+        'krbpwdmaxfailure',
+        'krbpwdfailurecountinterval',
+        'krbpwdlockoutduration',
+        'krbpwdhistorylength',
+        'krbminpwdlife',
+        'krbmaxpwdlife',
+        'ipabaseid',
+        'ipaidrangesize',
+        'ipabaserid',
+        'ipasecondarybaserid',
+        'idnssoaserial',
+        'idnssoarefresh',
+        'idnssoaretry',
+        'idnssoaexpire',
+        'idnssoaminimum',
+        'dnsttl',
+        'serial_number',
+    ]
+)
+
+# Kinds of columns.
+INTEGER = 'int'
+BOOLEAN = 'bool'
+TIMESTAMP = 'timestamp'
+CATEGORY = 'category'
+STRING = 'string'
+BINARY = 'binary'
+LIST = 'list'
+OBJECT = 'object'
+
+# Typecode of the 64 bit integers of ``array.array``.
+_INT64 = 'q'
+# Typecode of the codes of dictionary-encoded columns.
+_CODE = 'i'
+
+
+def _timestamp(value):
+    # Microseconds since the epoch of a ``{'__datetime__': ...}`` value.
+    dt = decode_datetime(value)
+    return calendar.timegm(dt.utctimetuple()) * 1000000 + dt.microsecond
+
+
+def _kind_of(name, value):
+    if value.__class__ is bool:
+        return BOOLEAN
+    if value.__class__ is int or name in INTEGER_ATTRIBUTES:
+        return INTEGER
+    if value.__class__ is dict:
+        if '__datetime__' in value:
+            return TIMESTAMP
+        if '__base64__' in value:
+            return BINARY
+        return OBJECT
+    if value.__class__ is str:
+        return CATEGORY
+    return OBJECT
+
+
+def _decode(value):
+    # Python value of a wire value of an object or list column.
+    if value.__class__ is dict:
+        if '__datetime__' in value:
+            return decode_datetime(value)
+        if '__base64__' in value:
+            return decode_base64(value)
+    return value
+
+
+class Column(object):
+    """
+    Values of one attribute of entries, in typed buffers.
+
+    Depending on ``kind``, the values are stored in:
+
+    * ``int``: ``data``, an ``array.array`` of 64 bit integers;
+    * ``bool``: ``data``, a ``bytearray`` of 0 and 1;
+    * ``timestamp``: ``data``, an ``array.array`` of 64 bit integers, in
+      microseconds since the epoch, UTC;
+    * ``category``: ``data``, an ``array.array`` of 32 bit indexes of the
+      values in ``dictionary``, -1 for missing values;
+    * ``string``, ``binary``, ``list`` and ``object``: ``data``, a list of
+      values, None for missing values. The values of ``list`` columns are the
+      tuples of the values of multi-valued attributes.
+
+    ``int``, ``bool`` and ``timestamp`` columns also have ``valid``, a
+    ``bytearray`` with 1 for each present value and 0 for each missing value.
+    """
+
+    __slots__ = ('name', 'kind', 'data', 'valid', 'dictionary', '_codes', 'length')
+
+    def __init__(self, name, kind, length=0):
+        self.name = name
+        self.kind = kind
+        self.data = None
+        self.valid = None
+        self.dictionary = None
+        self._codes = None
+        self.length = 0
+        self._reset(kind)
+        self._pad(length)
+
+    def _reset(self, kind):
+        self.kind = kind
+        self.valid = None
+        self.dictionary = None
+        self._codes = None
+        if kind in (INTEGER, TIMESTAMP):
+            self.data = array.array(_INT64)
+            self.valid = bytearray()
+        elif kind == BOOLEAN:
+            self.data = bytearray()
+            self.valid = bytearray()
+        elif kind == CATEGORY:
+            self.data = array.array(_CODE)
+            self.dictionary = []
+            self._codes = {}
+        else:
+            self.data = []
+
+    def __len__(self):
+        return self.length
+
+    def __repr__(self):
+        return '<Column {0} {1} [{2}]>'.format(self.name, self.kind, self.length)
+
+    @property
+    def null_count(self):
+        """Number of missing values."""
+        if self.valid is not None:
+            return self.valid.count(0)
+        if self.kind == CATEGORY:
+            return self.data.count(-1)
+        return self.data.count(None)
+
+    def _pad(self, length):
+        # Appends missing values up to length.
+        missing = length - self.length
+        if missing <= 0:
+            return
+        if self.kind == CATEGORY:
+            self.data.extend(array.array(_CODE, [-1]) * missing)
+        elif self.valid is not None:
+            if self.kind == BOOLEAN:
+                self.data.extend(bytes(missing))
+            else:
+                self.data.extend(array.array(_INT64, [0]) * missing)
+            self.valid.extend(bytes(missing))
+        else:
+            self.data.extend([None] * missing)
+        self.length = length
+
+    def _convert(self, kind):
+        # Stores the values so far in a column of another kind.
+        values = self.to_pylist()
+        self._reset(kind)
+        if kind == LIST:
+            values = [None if value is None else (value,) for value in values]
+        self.data.extend(values)
+
+    def append(self, row, value):
+        """
+        Sets the value of the entry at index row, after the last one set.
+
+        :param value: value of the attribute on the wire, a list of values of
+                      multi-valued attributes
+        """
+        self._pad(row)
+        if value.__class__ is list:
+            if len(value) == 1 and self.kind != LIST:
+                value = value[0]
+            elif value:
+                if self.kind != LIST:
+                    self._convert(LIST)
+                self.data.append(tuple(_decode(item) for item in value))
+                self.length += 1
+                return
+            else:
+                value = None
+        if value is None:
+            self._pad(row + 1)
+            return
+        kind = self.kind
+        try:
+            if kind == CATEGORY:
+                code = self._codes.get(value)
+                if code is None:
+                    if value.__class__ is not str:
+                        raise TypeError(value)
+                    code = self._codes[value] = len(self.dictionary)
+                    self.dictionary.append(value)
+                self.data.append(code)
+            elif kind == INTEGER:
+                self.data.append(int(value))
+                self.valid.append(1)
+            elif kind == TIMESTAMP:
+                self.data.append(_timestamp(value))
+                self.valid.append(1)
+            elif kind == BOOLEAN:
+                if value.__class__ is not bool:
+                    raise TypeError(value)
+                self.data.append(value)
+                self.valid.append(1)
+            elif kind == LIST:
+                self.data.append((_decode(value),))
+            else:
+                self.data.append(_decode(value))
+        except (TypeError, ValueError, KeyError, OverflowError):
+            # Values the kind of the column cannot hold, e.g. a non-decimal
+            # ``uidnumber``, turn the column into a column of objects.
+            self._convert(OBJECT)
+            self.data.append(_decode(value))
+        self.length += 1
+
+    def to_pylist(self):
+        """
+        Returns the values of the column as Python objects, None for missing
+        values. Timestamps are UTC ``datetime`` values.
+
+        :rtype: list
+        """
+        kind = self.kind
+        if kind == CATEGORY:
+            dictionary = self.dictionary + [None]
+            return [dictionary[code] for code in self.data]
+        if kind == INTEGER:
+            return [
+                value if valid else None for value, valid in zip(self.data, self.valid)
+            ]
+        if kind == BOOLEAN:
+            return [
+                bool(value) if valid else None
+                for value, valid in zip(self.data, self.valid)
+            ]
+        if kind == TIMESTAMP:
+            epoch = datetime.datetime(1970, 1, 1)
+            return [
+                epoch + datetime.timedelta(microseconds=value) if valid else None
+                for value, valid in zip(self.data, self.valid)
+            ]
+        return list(self.data)
+
+    def _decode_dictionary(self):
+        # Stores the values of a category column in a string column.
+        self.data = self.to_pylist()
+        self.kind = STRING
+        self.dictionary = None
+        self._codes = None
+
+
+class Columns(object):
+    """
+    Entries of a ``*_find`` result, as one ``Column`` per attribute.
+
+    Columns are built entry by entry, so that entries streamed with
+    ``Client.stream`` are never held in memory as dicts. Integers, booleans and
+    timestamps are stored in typed buffers, and strings with few distinct
+    values are dictionary-encoded, so that the columns are converted to NumPy,
+    pandas or Arrow without a Python loop over their values::
+
+        columns = client.to_columns('user_find', params={'all': True})
+        frame = columns.to_dataframe()
+        frame.groupby('loginshell')['uidnumber'].max()
+    """
+
+    def __init__(
+        self, entries=(), fields=None, types=None, max_cardinality=0.5, finish=True
+    ):
+        """
+        :param entries: entries of a ``*_find`` result, or the result
+        :type entries: iterable of dict, or dict
+        :param fields: names of the attributes exported, all of them if None
+        :type fields: iterable of str or None
+        :param types: kinds of columns by attribute name, e.g.
+                      ``{'employeenumber': 'int'}``, inferred from the first value
+                      of the other attributes
+        :type types: dict or None
+        :param max_cardinality: ratio of distinct values to entries above which
+                                strings are not dictionary-encoded
+        :type max_cardinality: float
+        :param finish: False to append more entries before calling ``finish``
+        :type finish: bool
+        """
+        self.fields = None if fields is None else tuple(fields)
+        self.types = dict(types or {})
+        self.max_cardinality = max_cardinality
+        self.num_rows = 0
+        self._columns = {}
+        self.extend(entries)
+        if finish:
+            self.finish()
+
+    def extend(self, entries):
+        """
+        Appends entries, a ``*_find`` result or an iterable of its entries.
+        """
+        if isinstance(entries, dict):
+            entries = entries['result']
+        columns = self._columns
+        types = self.types
+        fields = None if self.fields is None else frozenset(self.fields)
+        row = self.num_rows
+        for entry in entries:
+            for name, value in entry.items():
+                column = columns.get(name)
+                if column is None:
+                    if fields is not None and name not in fields:
+                        continue
+                    if value.__class__ is list:
+                        if not value:
+                            continue
+                        kind = LIST if len(value) > 1 else None
+                        first = value[0]
+                    else:
+                        kind = None
+                        first = value
+                    if kind is None:
+                        kind = types.get(name) or _kind_of(name, first)
+                    column = columns[name] = Column(name, kind, row)
+                column.append(row, value)
+            row += 1
+        self.num_rows = row
+
+    def finish(self):
+        """
+        Completes the columns once all entries are appended: pads missing values
+        and decodes the dictionaries of strings with too many distinct values.
+        Fields absent from all entries get columns of missing values.
+        """
+        for name in self.fields or ():
+            if name not in self._columns:
+                self._columns[name] = Column(name, self.types.get(name, OBJECT))
+        for column in self._columns.values():
+            column._pad(self.num_rows)
+            if (
+                column.kind == CATEGORY
+                and self.types.get(column.name) != CATEGORY
+                and len(column.dictionary) > self.max_cardinality * self.num_rows
+            ):
+                column._decode_dictionary()
+        return self
+
+    @property
+    def column_names(self):
+        """Names of the columns, in the order of ``fields`` or of appearance."""
+        if self.fields is None:
+            return list(self._columns)
+        return [name for name in self.fields if name in self._columns]
+
+    def __len__(self):
+        return self.num_rows
+
+    def __getitem__(self, name):
+        return self._columns[name]
+
+    def __contains__(self, name):
+        return name in self._columns
+
+    def __iter__(self):
+        return iter(self.column_names)
+
+    def __repr__(self):
+        return '<Columns {0} rows {1}>'.format(self.num_rows, self.column_names)
+
+    def to_pydict(self):
+        """
+        Returns the values of each column as Python objects.
+
+        :rtype: dict of str and list
+        """
+        return {name: self._columns[name].to_pylist() for name in self.column_names}
+
+    def to_numpy(self):
+        """
+        Returns the columns as NumPy arrays, without copying the buffers of
+        ``int`` and ``timestamp`` columns. Columns with missing values are
+        masked arrays, ``category`` columns are arrays of objects.
+
+        In order to use this method, the package `numpy
+        <https://pypi.org/project/numpy/>`_ must be installed.
+
+        :rtype: dict of str and ``numpy.ndarray``
+        """
+        import numpy
+
+        arrays = {}
+        for name in self.column_names:
+            column = self._columns[name]
+            kind = column.kind
+            if kind in (INTEGER, TIMESTAMP, BOOLEAN):
+                if kind == BOOLEAN:
+                    values = numpy.frombuffer(column.data, dtype=numpy.uint8)
+                    values = values.astype(bool)
+                else:
+                    values = numpy.frombuffer(column.data, dtype=numpy.int64)
+                    if kind == TIMESTAMP:
+                        values = values.view('datetime64[us]')
+                if column.null_count:
+                    valid = numpy.frombuffer(column.valid, dtype=numpy.uint8)
+                    values = numpy.ma.MaskedArray(values, mask=valid == 0)
+            elif kind == CATEGORY:
+                dictionary = numpy.empty(len(column.dictionary) + 1, dtype=object)
+                dictionary[:-1] = column.dictionary
+                values = dictionary[numpy.frombuffer(column.data, dtype=numpy.int32)]
+            else:
+                values = numpy.empty(len(column.data), dtype=object)
+                values[:] = column.data
+            arrays[name] = values
+        return arrays
+
+    def to_dataframe(self):
+        """
+        Returns the columns as a pandas ``DataFrame``. ``int`` and ``bool``
+        columns have the nullable ``Int64`` and ``boolean`` dtypes,
+        ``timestamp`` columns are in UTC and ``category`` columns are
+        ``Categorical``.
+
+        In order to use this method, the package `pandas
+        <https://pypi.org/project/pandas/>`_ must be installed.
+
+        :rtype: ``pandas.DataFrame``
+        """
+        import numpy
+        import pandas
+
+        data = {}
+        for name in self.column_names:
+            column = self._columns[name]
+            kind = column.kind
+            if kind in (INTEGER, TIMESTAMP, BOOLEAN):
+                mask = numpy.frombuffer(column.valid, dtype=numpy.uint8) == 0
+                if kind == INTEGER:
+                    values = pandas.arrays.IntegerArray(
+                        numpy.frombuffer(column.data, dtype=numpy.int64), mask
+                    )
+                elif kind == BOOLEAN:
+                    values = pandas.arrays.BooleanArray(
+                        numpy.frombuffer(column.data, dtype=numpy.uint8) == 1, mask
+                    )
+                else:
+                    values = numpy.frombuffer(column.data, dtype=numpy.int64)
+                    values = values.view('datetime64[us]').copy()
+                    values[mask] = numpy.datetime64('NaT')
+                    values = pandas.DatetimeIndex(values).tz_localize('UTC')
+            elif kind == CATEGORY:
+                values = pandas.Categorical.from_codes(
+                    numpy.frombuffer(column.data, dtype=numpy.int32),
+                    categories=column.dictionary,
+                )
+            else:
+                values = column.data
+            data[name] = pandas.Series(values, name=name)
+        return pandas.DataFrame(data, columns=self.column_names)
+
+    to_pandas = to_dataframe
+
+    def to_arrow(self):
+        """
+        Returns the columns as an Arrow ``Table``, without copying the buffers
+        of ``int`` and ``timestamp`` columns without missing values.
+        ``category`` columns are dictionary arrays.
+
+        In order to use this method, the package `pyarrow
+        <https://pypi.org/project/pyarrow/>`_ must be installed.
+
+        :rtype: ``pyarrow.Table``
+        """
+        import pyarrow
+
+        arrays = []
+        for name in self.column_names:
+            column = self._columns[name]
+            kind = column.kind
+            if kind in (INTEGER, TIMESTAMP):
+                if kind == INTEGER:
+                    arrow_type = pyarrow.int64()
+                else:
+                    arrow_type = pyarrow.timestamp('us', tz='UTC')
+                if column.null_count:
+                    values = pyarrow.array(
+                        [
+                            value if valid else None
+                            for value, valid in zip(column.data, column.valid)
+                        ],
+                        type=pyarrow.int64(),
+                    ).cast(arrow_type)
+                else:
+                    values = pyarrow.Array.from_buffers(
+                        arrow_type,
+                        column.length,
+                        [None, pyarrow.py_buffer(column.data)],
+                    )
+            elif kind == BOOLEAN:
+                values = pyarrow.array(column.to_pylist(), type=pyarrow.bool_())
+            elif kind == CATEGORY:
+                if column.null_count:
+                    indices = pyarrow.array(
+                        [None if code == -1 else code for code in column.data],
+                        type=pyarrow.int32(),
+                    )
+                else:
+                    indices = pyarrow.Array.from_buffers(
+                        pyarrow.int32(),
+                        column.length,
+                        [None, pyarrow.py_buffer(column.data)],
+                    )
+                values = pyarrow.DictionaryArray.from_arrays(
+                    indices, pyarrow.array(column.dictionary, type=pyarrow.string())
+                )
+            elif kind == LIST:
+                values = pyarrow.array(
+                    [None if value is None else list(value) for value in column.data]
+                )
+            else:
+                values = pyarrow.array(column.data)
+            arrays.append(values)
+        return pyarrow.Table.from_arrays(arrays, names=self.column_names)
+
+
+def to_columns(entries, fields=None, types=None, max_cardinality=0.5):
+    """
+    Returns the columns of the entries of a ``*_find`` result, see ``Columns``.
+
+    :param entries: entries of a ``*_find`` result, or the result
+    :type entries: iterable of dict, or dict
+    :param fields: names of the attributes exported, all of them if None
+    :type fields: iterable of str or None
+    :param types: kinds of columns by attribute name
+    :type types: dict or None
+    :param max_cardinality: ratio of distinct values to entries above which
+                            strings are not dictionary-encoded
+    :type max_cardinality: float
+    :rtype: ``Columns``
+    """
+    return Columns(entries, fields, types, max_cardinality)
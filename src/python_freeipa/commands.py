@@ -0,0 +1,77 @@
+"""Classification of FreeIPA commands."""
+
+# Commands that never modify the directory, besides the ones matching a suffix.
+READ_ONLY_COMMANDS = frozenset(
+    [
+        'env',
+        'i18n_messages',
+        'json_metadata',
+        'ping',
+        'plugins',
+        'schema',
+        'whoami',
+    ]
+)
+
+READ_ONLY_SUFFIXES = ('_show', '_find', '_status')
+
+
+def is_read_only(method, args=None):
+    """
+    Returns True if the command does not modify the directory.
+
+    A ``batch`` is read-only if all of its calls are.
+
+    :param method: RPC method name
+    :type method: str
+    :param args: positional arguments of the call, used for ``batch``
+    :type args: list or None
+    """
+    if method == 'batch':
+        return bool(args) and all(
+            is_read_only(call['method'], call['params'][0]) for call in args
+        )
+    return method in READ_ONLY_COMMANDS or method.endswith(READ_ONLY_SUFFIXES)
+
+
+# Commands that keep the server busy for long, whatever their arguments.
+EXPENSIVE_COMMANDS = frozenset(
+    [
+        'automember_rebuild',
+        'cert_request',
+        'dns_update_system_records',
+        'migrate_ds',
+        'topologysuffix_verify',
+        'trust_add',
+        'trust_fetch_domains',
+    ]
+)
+
+READ = 'read'
+WRITE = 'write'
+EXPENSIVE = 'expensive'
+
+
+def command_class(method, args=None):
+    """
+    Returns the class of a command: ``expensive`` for ``EXPENSIVE_COMMANDS``,
+    ``read`` for read-only commands, ``write`` otherwise.
+
+    A ``batch`` has the most costly class of its calls.
+
+    :param method: RPC method name
+    :type method: str
+    :param args: positional arguments of the call, used for ``batch``
+    :type args: list or None
+    """
+    if method == 'batch':
+        classes = set(
+            command_class(call['method'], call['params'][0]) for call in args or ()
+        )
+        for kind in (EXPENSIVE, WRITE):
+            if kind in classes:
+                return kind
+        return READ if classes else WRITE
+    if method in EXPENSIVE_COMMANDS:
+        return EXPENSIVE
+    return READ if is_read_only(method) else WRITE
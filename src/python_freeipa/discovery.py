@@ -0,0 +1,144 @@
+"""Discovery of IPA servers through DNS SRV records, with caching."""
+
+import collections
+import threading
+import time
+
+from python_freeipa.exceptions import FreeIPAError
+
+# Same fields as the records returned by srvlookup.
+SRV = collections.namedtuple('SRV', ['host', 'port', 'priority', 'weight', 'hostname'])
+
+DEFAULT_TTL = 300
+NEGATIVE_TTL = 30
+
+
+class DiscoveryCache(object):
+    """
+    Cache of the IPA servers discovered for a domain.
+
+    Results are kept as long as the TTL of their SRV records, when it is known,
+    and failed discoveries for a shorter time. A cache can be shared by all the
+    clients of a process, see ``default_cache``.
+    """
+
+    def __init__(self, default_ttl=DEFAULT_TTL, negative_ttl=NEGATIVE_TTL):
+        """
+        :param default_ttl: seconds results are kept when their TTL is unknown
+        :type default_ttl: int
+        :param negative_ttl: seconds failed discoveries are kept
+        :type negative_ttl: int
+        """
+        self._default_ttl = default_ttl
+        self._negative_ttl = negative_ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, domain):
+        """
+        Returns the IPA servers of domain, sorted by priority and weight.
+
+        If domain has no ``_ldap._tcp`` SRV records, its parent domains are tried
+        from the nearest one.
+
+        :param domain: domain to discover the servers of
+        :type domain: str
+        :rtype: list of ``SRV``
+        :raises FreeIPAError: if no server could be found
+        """
+        now = time.time()
+        entry = self._entries.get(domain)
+        if entry is None or entry[0] <= now:
+            with self._lock:
+                entry = self._entries.get(domain)
+                if entry is None or entry[0] <= now:
+                    entry = self._discover(domain)
+                    self._entries[domain] = entry
+        servers = entry[1]
+        if servers is None:
+            raise FreeIPAError(
+                entry[2] or 'could not find any IPA Server using DNS lookup'
+            )
+        return servers
+
+    def refresh(self, domain=None):
+        """
+        Forgets the servers discovered for domain, or for all domains if None.
+        """
+        with self._lock:
+            if domain is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(domain, None)
+
+    def _discover(self, domain):
+        """
+        Returns the expiry and servers of domain, and the error of the lookup.
+        Servers are None if there is none, the error is None if the DNS servers
+        answered.
+        """
+        _domain = domain
+        while True:
+            try:
+                result = self._query(_domain)
+            except FreeIPAError as err:
+                # The DNS servers of parent domains are most likely as unreachable.
+                return time.time() + self._negative_ttl, None, str(err)
+            if result is not None:
+                servers, ttl = result
+                return time.time() + ttl, servers, None
+            try:
+                _domain = _domain.split('.', 1)[1]
+            except IndexError:
+                return time.time() + self._negative_ttl, None, None
+
+    def _query(self, domain):
+        """
+        Returns the servers of domain and the TTL of their records, None if there
+        is none.
+
+        :raises FreeIPAError: if the DNS servers could not answer, e.g. timed out
+        """
+        # Imported on use, since they are slow to import and unused with a host.
+        try:
+            import dns.exception as dns_exception
+            import dns.resolver as dns_resolver
+        except ImportError:
+            # The TTL of the records is then unknown, srvlookup is used instead.
+            dns_resolver = None
+        if dns_resolver is not None:
+            name = '_ldap._tcp.{0}'.format(domain)
+            try:
+                resolve = getattr(dns_resolver, 'resolve', None) or dns_resolver.query
+                answer = resolve(name, 'SRV')
+            except (
+                dns_resolver.NXDOMAIN,
+                dns_resolver.NoAnswer,
+                dns_resolver.NoNameservers,
+            ):
+                return None
+            except dns_exception.DNSException as err:
+                raise FreeIPAError('DNS lookup of {0} failed: {1}'.format(name, err))
+            servers = [
+                SRV(
+                    host=record.target.to_text(omit_final_dot=True),
+                    port=record.port,
+                    priority=record.priority,
+                    weight=record.weight,
+                    hostname=record.target.to_text(omit_final_dot=True),
+                )
+                for record in answer
+            ]
+            servers.sort(key=lambda server: (server.priority, -server.weight))
+            return servers, answer.rrset.ttl
+
+        import srvlookup
+
+        try:
+            return srvlookup.lookup('ldap', 'tcp', domain), self._default_ttl
+        except srvlookup.SRVQueryFailure:
+            return None
+
+
+# Cache shared by the clients that do not get their own.
+default_cache = DiscoveryCache()
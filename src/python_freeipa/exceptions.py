@@ -5,6 +5,9 @@ class FreeIPAError(Exception):
     """Base exception class for FreeIPA client."""
 
     message = 'An unknown exception occurred.'
+    # Name and data of the error in JSON RPC responses.
+    name = None
+    data = None
 
     def __init__(self, message=None, code=None):
         """Initialize exception class with optional message and code."""
@@ -94,6 +97,19 @@ class UnknownOption(BadRequest):
     """Raised when a command is called with unknown options."""
 
 
+class DeadlineExceeded(FreeIPAError):
+    """Raised when a call is not sent because its deadline passed."""
+
+
+class MemberFailed(FreeIPAError):
+    """Raised when members could not be added to or removed from an entry."""
+
+    def __init__(self, message=None, code=None, failed=None):
+        super(MemberFailed, self).__init__(message, code)
+        # Member type -> list of [name, reason]
+        self.failed = failed or {}
+
+
 error_codes = {
     1201: InvalidSessionPassword,
     1202: PasswordExpired,
@@ -114,7 +130,10 @@ def parse_error(error):
     message = error['message']
     code = error['code']
     exception_class = error_codes.get(code, BadRequest)
-    raise exception_class(message, code)
+    exception = exception_class(message, code)
+    exception.name = error.get('name')
+    exception.data = error.get('data')
+    raise exception
 
 
 def parse_group_management_error(data):
@@ -0,0 +1,240 @@
+"""Fan-out of one command over many keys, in concurrent ``batch`` requests."""
+
+import concurrent.futures
+import time
+
+from python_freeipa.exceptions import DeadlineExceeded, FreeIPAError
+from python_freeipa.retry import TRANSIENT_CODES
+
+
+class MapResult(object):
+    """
+    Outcome of the call of a ``Client.map`` for one key.
+    """
+
+    __slots__ = ('key', 'index', '_result', '_exception')
+
+    def __init__(self, key, index, result=None, exception=None):
+        self.key = key
+        self.index = index
+        self._result = result
+        self._exception = exception
+
+    def __repr__(self):
+        state = 'failed' if self._exception is not None else 'done'
+        return '<MapResult {0!r} {1}>'.format(self.key, state)
+
+    def result(self):
+        """
+        Returns the result of the call.
+
+        :raises FreeIPAError: the error of the call
+        """
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def exception(self):
+        """
+        Returns the error of the call, None if it succeeded.
+        """
+        return self._exception
+
+
+def is_overload(err):
+    """
+    Returns True if err suggests that the server is overloaded: errors of the
+    transport, deadlines and transient codes of ``python_freeipa.retry``.
+    """
+    if isinstance(err, DeadlineExceeded):
+        return True
+    if isinstance(err, FreeIPAError):
+        return getattr(err, 'code', None) in TRANSIENT_CODES
+    return True
+
+
+class AdaptiveConcurrency(object):
+    """
+    Number of requests sent at once, adapted to the latency of the server.
+
+    As in TCP congestion control, the limit grows by one after each round of
+    ``limit`` requests answered within ``tolerance`` times the lowest latency
+    observed, and is multiplied by ``backoff`` when the smoothed latency grows
+    beyond it or a request fails with an overload error, at most once per round
+    of the requests sent before the previous decrease.
+    """
+
+    def __init__(self, initial=2, minimum=1, maximum=10, tolerance=2.0, backoff=0.5):
+        """
+        :param initial: number of requests sent at once at first
+        :type initial: int
+        :param minimum: lowest limit
+        :type minimum: int
+        :param maximum: highest limit, the size of the connection pool
+        :type maximum: int
+        :param tolerance: ratio of the smoothed latency to the lowest latency
+                          above which the limit decreases
+        :type tolerance: float
+        :param backoff: factor of the limit when it decreases
+        :type backoff: float
+        """
+        if minimum < 1 or maximum < minimum:
+            raise ValueError('limits must satisfy 1 <= minimum <= maximum')
+        self.minimum = minimum
+        self.maximum = maximum
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self._limit = float(min(max(initial, minimum), maximum))
+        self._min_latency = None
+        self._latency = None
+        self._since_decrease = 0
+        self._round = 0
+
+    @property
+    def limit(self):
+        """Current number of requests sent at once."""
+        return int(self._limit)
+
+    @property
+    def latency(self):
+        """Smoothed latency of the requests, in seconds, None before any."""
+        return self._latency
+
+    def _decrease(self):
+        # The requests sent before a decrease are answered as slowly, the limit
+        # only decreases again once as many requests were answered since.
+        if self._since_decrease >= self._round:
+            self._round = self.limit
+            self._limit = max(self.minimum, self._limit * self.backoff)
+            self._since_decrease = 0
+
+    def record(self, latency, overloaded=False):
+        """
+        Records a request answered after latency seconds.
+
+        :param overloaded: True if the request failed with an overload error
+        :type overloaded: bool
+        """
+        self._since_decrease += 1
+        if overloaded:
+            self._decrease()
+            return
+        if self._min_latency is None or latency < self._min_latency:
+            self._min_latency = latency
+        if self._latency is None:
+            self._latency = latency
+        else:
+            self._latency += 0.2 * (latency - self._latency)
+        if self._latency > self.tolerance * self._min_latency:
+            self._decrease()
+        else:
+            self._limit = min(self.maximum, self._limit + 1 / self.limit)
+
+
+def _args(key):
+    if isinstance(key, (list, tuple)):
+        return list(key)
+    return [key]
+
+
+def _run_chunk(client, method, chunk, params):
+    # Sends the calls of a chunk as one batch request, returns the outcomes.
+    start = time.monotonic()
+    batch = client.batched(max_size=None)
+    futures = [batch._request(method, _args(key), dict(params)) for _, key in chunk]
+    try:
+        batch.flush()
+    except Exception:
+        # The error is stored in the result of every call.
+        pass
+    results = []
+    for (index, key), future in zip(chunk, futures):
+        exception = future.exception()
+        result = None if exception is not None else future.result()
+        results.append(MapResult(key, index, result, exception))
+    # Latency per call, so that smaller chunks compare with full ones.
+    return results, (time.monotonic() - start) / len(chunk)
+
+
+def fan_out(
+    client, method, keys, params=None, chunk_size=100, concurrency=None, ordered=True
+):
+    """
+    Calls method for each key, in ``batch`` requests of chunk_size calls sent
+    concurrently by a pool of threads.
+
+    :param client: client sending the requests, shared by the threads
+    :type client: ``Client``
+    :param method: RPC method name, e.g. ``host_show``
+    :type method: str
+    :param keys: first argument of each call, or list of its arguments
+    :type keys: iterable
+    :param params: named parameters of each call
+    :type params: dict or None
+    :param chunk_size: number of calls per ``batch`` request
+    :type chunk_size: int
+    :param concurrency: number of requests sent at once, adapted to the latency
+                        of the server if None
+    :type concurrency: int, ``AdaptiveConcurrency`` or None
+    :param ordered: False to yield the results as they complete rather than in
+                    the order of the keys
+    :type ordered: bool
+    :return: generator of ``MapResult``
+    """
+    params = dict(params or {})
+    if concurrency is None:
+        concurrency = AdaptiveConcurrency(maximum=client._pool_maxsize)
+    if isinstance(concurrency, int):
+        limit = None
+        max_workers = concurrency
+    else:
+        limit = concurrency
+        max_workers = limit.maximum
+
+    indexed = list(enumerate(keys))
+    chunks = [
+        indexed[start : start + chunk_size]
+        for start in range(0, len(indexed), chunk_size)
+    ]
+    chunks.reverse()
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    running = set()
+    # Results of completed chunks waiting for the ones before them, by index
+    # of their first key.
+    completed = {}
+    next_index = 0
+    try:
+        while chunks or running:
+            allowed = max_workers if limit is None else limit.limit
+            while chunks and len(running) < allowed:
+                running.add(
+                    executor.submit(_run_chunk, client, method, chunks.pop(), params)
+                )
+            done, running = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                results, latency = future.result()
+                if limit is not None:
+                    limit.record(
+                        latency,
+                        any(
+                            result.exception() is not None
+                            and is_overload(result.exception())
+                            for result in results
+                        ),
+                    )
+                if not ordered:
+                    for result in results:
+                        yield result
+                    continue
+                completed[results[0].index] = results
+            while next_index in completed:
+                results = completed.pop(next_index)
+                next_index += len(results)
+                for result in results:
+                    yield result
+    finally:
+        for future in running:
+            future.cancel()
+        executor.shutdown(wait=True)
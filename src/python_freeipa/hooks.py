@@ -0,0 +1,229 @@
+"""Events emitted around the requests of a client, for tracing and metrics."""
+
+import logging
+import threading
+import time
+
+REQUEST = 'request'
+RESPONSE = 'response'
+ERROR = 'error'
+EVENTS = (REQUEST, RESPONSE, ERROR)
+
+log = logging.getLogger(__name__)
+
+
+def _size(body):
+    """
+    Returns the size in bytes of a body, encoded as UTF-8 if it is a str.
+    """
+    if isinstance(body, str):
+        return len(body.encode('utf-8'))
+    return len(body)
+
+
+class CallEvent(object):
+    """
+    A JSON RPC request, passed to the subscribers of each of its events.
+
+    The same instance is passed to the ``request`` event, sent before the request,
+    then to the ``response`` or ``error`` event, so that subscribers can keep
+    state in ``context``, keyed by themselves.
+
+    :ivar kind: name of the event being emitted
+    :ivar method: command, ``batch`` for batches
+    :ivar host: server the request was last sent to
+    :ivar batch_size: number of calls of a ``batch``, None for other commands
+    :ivar bytes_sent: size of the request body
+    :ivar bytes_received: size of the response body, None before the response
+    :ivar start: ``time.time()`` when the request was built
+    :ivar duration: wall time of the request in seconds, None before the response
+    :ivar retries: number of times the request was sent again, after a failover or
+                   after logging in again
+    :ivar status: HTTP status code of the response, None before the response
+    :ivar error: exception the request failed with, for ``error`` events
+    :ivar context: state of the subscribers
+    """
+
+    __slots__ = (
+        'kind',
+        'method',
+        'host',
+        'batch_size',
+        'bytes_sent',
+        'bytes_received',
+        'start',
+        'duration',
+        'retries',
+        'status',
+        'error',
+        'context',
+        '_start',
+    )
+
+    def __init__(self, method, host, args, data):
+        self.kind = REQUEST
+        self.method = method
+        self.host = host
+        self.batch_size = len(args or ()) if method == 'batch' else None
+        self.bytes_sent = _size(data)
+        self.bytes_received = None
+        self.start = time.time()
+        self.duration = None
+        self.retries = 0
+        self.status = None
+        self.error = None
+        self.context = {}
+        self._start = time.perf_counter()
+
+    def __repr__(self):
+        return '<CallEvent {0} {1} on {2}>'.format(self.kind, self.method, self.host)
+
+
+class Hooks(object):
+    """
+    Subscribers to the events of the requests of one or more clients.
+
+    Subscribers are callables taking a ``CallEvent``. They are called in the
+    thread, or the event loop, making the request, so they must be quick; their
+    exceptions are logged and never fail the request. Clients only check whether
+    there are subscribers when nobody listens, so hooks cost nothing until used::
+
+        def trace(event):
+            if event.kind != 'request':
+                print(event.method, event.host, event.duration, event.status)
+
+        client.hooks.subscribe(trace)
+    """
+
+    def __init__(self):
+        # Replaced rather than modified, so that they can be iterated without a
+        # lock while other threads subscribe.
+        self._subscribers = {kind: () for kind in EVENTS}
+        self._active = False
+        self._lock = threading.Lock()
+
+    def __bool__(self):
+        return self._active
+
+    def subscribe(self, callback, events=EVENTS):
+        """
+        Calls callback with the events of the given kinds.
+
+        :param callback: function taking a ``CallEvent``
+        :type callback: callable
+        :param events: kinds of events, among ``request``, ``response``, ``error``
+        :type events: iterable of str
+        """
+        with self._lock:
+            for kind in events:
+                if kind not in self._subscribers:
+                    raise ValueError('unknown event {0!r}'.format(kind))
+                self._subscribers[kind] += (callback,)
+            self._active = True
+
+    def unsubscribe(self, callback):
+        """
+        Stops calling callback.
+        """
+        with self._lock:
+            for kind, callbacks in self._subscribers.items():
+                self._subscribers[kind] = tuple(
+                    subscriber for subscriber in callbacks if subscriber != callback
+                )
+            self._active = any(self._subscribers.values())
+
+    def emit(self, kind, event):
+        event.kind = kind
+        for callback in self._subscribers[kind]:
+            try:
+                callback(event)
+            except Exception:
+                log.exception('Hook {0!r} failed on {1!r}'.format(callback, event))
+
+    def start(self, method, host, args, data):
+        """
+        Emits the ``request`` event of a request, and returns it.
+
+        :param data: serialized body of the request
+        :type data: bytes or str
+        :rtype: ``CallEvent``
+        """
+        event = CallEvent(method, host, args, data)
+        self.emit(REQUEST, event)
+        return event
+
+    def finish(self, event, status=None, content=None, error=None):
+        """
+        Emits the ``response`` event of a request, or its ``error`` event if error
+        is set.
+
+        :param status: HTTP status code of the response, if any
+        :type status: int or None
+        :param content: body of the response, if any
+        :type content: bytes, str or None
+        :param error: exception the request failed with
+        :type error: Exception or None
+        """
+        event.duration = time.perf_counter() - event._start
+        event.status = status
+        if content is not None:
+            event.bytes_received = _size(content)
+        event.error = error
+        self.emit(RESPONSE if error is None else ERROR, event)
+
+
+class OpenTelemetryHook(object):
+    """
+    Subscriber recording each request as an OpenTelemetry client span.
+
+    Spans are named ``freeipa <method>`` and follow the RPC semantic conventions
+    (``rpc.system``, ``rpc.method``, ``server.address``). In order to use this
+    class, the package `opentelemetry-api
+    <https://pypi.org/project/opentelemetry-api/>`_ must be installed::
+
+        client.hooks.subscribe(OpenTelemetryHook())
+    """
+
+    def __init__(self, tracer=None):
+        """
+        :param tracer: tracer creating the spans, the one of the global tracer
+                       provider for ``python_freeipa`` by default
+        :type tracer: ``opentelemetry.trace.Tracer`` or None
+        """
+        from opentelemetry import trace
+
+        self._trace = trace
+        self._tracer = tracer or trace.get_tracer('python_freeipa')
+
+    def __call__(self, event):
+        if event.kind == REQUEST:
+            event.context[self] = self._tracer.start_span(
+                'freeipa {0}'.format(event.method),
+                kind=self._trace.SpanKind.CLIENT,
+                start_time=int(event.start * 1e9),
+                attributes={
+                    'rpc.system': 'jsonrpc',
+                    'rpc.method': event.method,
+                    'server.address': event.host,
+                },
+            )
+            return
+        span = event.context.pop(self, None)
+        if span is None:
+            return
+        attributes = {
+            'server.address': event.host,
+            'http.request.body.size': event.bytes_sent,
+            'freeipa.retries': event.retries,
+        }
+        if event.batch_size is not None:
+            attributes['freeipa.batch_size'] = event.batch_size
+        if event.status is not None:
+            attributes['http.response.status_code'] = event.status
+        if event.bytes_received is not None:
+            attributes['http.response.body.size'] = event.bytes_received
+        span.set_attributes(attributes)
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        span.end()
@@ -0,0 +1,182 @@
+"""Health tracking and selection of IPA servers."""
+
+import random
+import threading
+import time
+
+
+class HostState(object):
+    """Health and latency of one IPA server."""
+
+    def __init__(self, hostname, priority=0, weight=0):
+        self.hostname = hostname
+        self.priority = priority
+        self.weight = weight
+        self.latency = None
+        self.failures = 0
+        self.ejected_until = None
+        self.probing = False
+
+    def __repr__(self):
+        return (
+            '<HostState {0} priority={1} weight={2} latency={3} failures={4}>'.format(
+                self.hostname, self.priority, self.weight, self.latency, self.failures
+            )
+        )
+
+    @property
+    def healthy(self):
+        return self.ejected_until is None
+
+
+class HostPool(object):
+    """
+    Set of IPA servers with their health, used for failover and load balancing.
+
+    Servers failing a request are ejected for a backoff period, doubled on every
+    consecutive failure. Once the backoff expired, a server is health-probed
+    before it is used again.
+    """
+
+    def __init__(
+        self, servers, probe=None, backoff=1.0, max_backoff=300.0, latency_decay=0.3
+    ):
+        """
+        :param servers: hostnames, or SRV records with ``hostname``, ``priority``
+                        and ``weight`` attributes, in order of preference
+        :type servers: list
+        :param probe: callable taking a hostname, returning True if it is healthy
+        :type probe: callable or None
+        :param backoff: seconds a server is ejected after its first failure
+        :type backoff: float
+        :param max_backoff: maximum seconds a server is ejected
+        :type max_backoff: float
+        :param latency_decay: weight of the last request in the latency average
+        :type latency_decay: float
+        """
+        self.servers = servers
+        self._hosts = []
+        for server in servers:
+            if isinstance(server, str):
+                self._hosts.append(HostState(server))
+            else:
+                self._hosts.append(
+                    HostState(server.hostname, server.priority, server.weight)
+                )
+        self._by_name = {host.hostname: host for host in self._hosts}
+        self._probe = probe
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._latency_decay = latency_decay
+        self._lock = threading.Lock()
+
+    def __contains__(self, hostname):
+        return hostname in self._by_name
+
+    @property
+    def hosts(self):
+        return list(self._hosts)
+
+    def ordered(self):
+        """
+        Returns all hostnames, healthy ones first, in order of preference.
+        """
+        return [host.hostname for host in self._hosts if host.healthy] + [
+            host.hostname for host in self._hosts if not host.healthy
+        ]
+
+    def is_healthy(self, hostname):
+        host = self._by_name.get(hostname)
+        return host is None or host.healthy
+
+    def select(self, exclude=()):
+        """
+        Returns a healthy hostname, None if there is none.
+
+        Hosts of the best SRV priority are picked at random, proportionally to
+        their SRV weight and inversely to their measured latency.
+
+        :param exclude: hostnames not to return
+        :type exclude: collection
+        """
+        self._probe_due(exclude)
+        candidates = [
+            host
+            for host in self._hosts
+            if host.healthy and host.hostname not in exclude
+        ]
+        if not candidates:
+            return None
+        priority = min(host.priority for host in candidates)
+        candidates = [host for host in candidates if host.priority == priority]
+
+        latencies = [host.latency for host in candidates if host.latency is not None]
+        default_latency = sum(latencies) / len(latencies) if latencies else 1.0
+        scores = [
+            max(host.weight, 1) / max(host.latency or default_latency, 0.001)
+            for host in candidates
+        ]
+        point = random.uniform(0, sum(scores))
+        for host, score in zip(candidates, scores):
+            point -= score
+            if point <= 0:
+                return host.hostname
+        return candidates[-1].hostname
+
+    def report_success(self, hostname, latency):
+        """
+        Records a successful request to hostname that took latency seconds.
+        """
+        host = self._by_name.get(hostname)
+        if host is None:
+            return
+        with self._lock:
+            if host.latency is None:
+                host.latency = latency
+            else:
+                host.latency += self._latency_decay * (latency - host.latency)
+            host.failures = 0
+            host.ejected_until = None
+
+    def report_failure(self, hostname):
+        """
+        Records a failed request to hostname, and ejects it.
+        """
+        host = self._by_name.get(hostname)
+        if host is None:
+            return
+        with self._lock:
+            host.failures += 1
+            backoff = min(self._backoff * 2 ** (host.failures - 1), self._max_backoff)
+            host.ejected_until = time.time() + backoff
+
+    def _probe_due(self, exclude):
+        """
+        Health-probe the ejected hosts whose backoff expired.
+
+        Only one thread probes a given host, the others keep ignoring it.
+        """
+        now = time.time()
+        due = []
+        with self._lock:
+            for host in self._hosts:
+                if (
+                    not host.healthy
+                    and not host.probing
+                    and host.ejected_until <= now
+                    and host.hostname not in exclude
+                ):
+                    host.probing = True
+                    due.append(host)
+        for host in due:
+            try:
+                healthy = self._probe is None or self._probe(host.hostname)
+            except Exception:
+                healthy = False
+            with self._lock:
+                host.probing = False
+            if healthy:
+                with self._lock:
+                    host.ejected_until = None
+            else:
+                self.report_failure(host.hostname)
@@ -0,0 +1,72 @@
+"""Loading of the generated command methods on first use."""
+
+import importlib
+
+
+class CommandLoader(type):
+    """
+    Metaclass resolving the command methods missing from a class.
+
+    Accessing a command on the class, as ``Batch`` and ``dir`` do, loads it as
+    accessing it on an instance does.
+    """
+
+    def __getattr__(cls, name):
+        function = cls._load_command(name)
+        if function is None:
+            raise AttributeError(
+                "type object '{0}' has no attribute '{1}'".format(cls.__name__, name)
+            )
+        return function
+
+    def __dir__(cls):
+        return sorted(set(super(CommandLoader, cls).__dir__()) | cls._commands())
+
+
+class LazyCommands(object, metaclass=CommandLoader):
+    """
+    Base class of clients whose command methods are loaded on first use.
+
+    ``_command_modules`` maps the name of each command to the module defining
+    it, relative to the package of the class, as a method of a ``Commands``
+    class. All the methods of that module are added to the class at once, so
+    that they are then found by regular attribute lookups.
+    """
+
+    _command_modules = {}
+
+    def __getattr__(self, name):
+        function = type(self)._load_command(name)
+        if function is None:
+            raise AttributeError(
+                "'{0}' object has no attribute '{1}'".format(type(self).__name__, name)
+            )
+        return function.__get__(self, type(self))
+
+    def __dir__(self):
+        return sorted(set(super(LazyCommands, self).__dir__()) | self._commands())
+
+    @classmethod
+    def _commands(cls):
+        return set(cls._command_modules)
+
+    @classmethod
+    def _load_command(cls, name):
+        """
+        Adds the methods of the module defining command name to the class that
+        lists it, and returns the function of the command, None if name is not
+        a command.
+        """
+        if name.startswith('_'):
+            return None
+        for owner in cls.__mro__:
+            module_name = vars(owner).get('_command_modules', {}).get(name)
+            if module_name is not None:
+                break
+        else:
+            return None
+        module = importlib.import_module('.' + module_name, owner.__module__)
+        for command, function in vars(module.Commands).items():
+            if not command.startswith('_'):
+                setattr(owner, command, function)
+        return vars(owner)[name]
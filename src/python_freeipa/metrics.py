@@ -0,0 +1,345 @@
+"""Aggregated metrics of the requests of clients, exportable to Prometheus."""
+
+import bisect
+import collections
+import threading
+import weakref
+
+from python_freeipa.hooks import ERROR, RESPONSE
+
+# Upper bounds of the latency buckets, in seconds.
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.25,
+    0.5,
+    0.75,
+    1.0,
+    2.5,
+    5.0,
+    7.5,
+    10.0,
+    30.0,
+    60.0,
+)
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class Histogram(object):
+    """
+    Counts of observed values by bucket, as a Prometheus histogram.
+    """
+
+    __slots__ = ('buckets', 'counts', 'count', 'sum')
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        # The last count is for values above the last bucket.
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def merge(self, other):
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.count += other.count
+        self.sum += other.sum
+
+    def quantile(self, q):
+        """
+        Returns an estimate of the q-quantile of the observed values, by linear
+        interpolation within its bucket as Prometheus does, None without values.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            if count and cumulative + count >= rank:
+                if index == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self.buckets[-1]
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labels(**labels):
+    pairs = ['{0}="{1}"'.format(name, _escape(value)) for name, value in labels.items()]
+    return '{' + ','.join(pairs) + '}'
+
+
+def _format(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(value)
+
+
+class Metrics(object):
+    """
+    Latency, error, re-login, connection pool and cache metrics of clients.
+
+    Requests are recorded through the hooks of the attached clients, the state
+    of their pools, caches and sessions is read when the metrics are exported::
+
+        metrics = Metrics()
+        metrics.attach(client)
+        ...
+        print(metrics.quantiles(method='user_show'))
+        print(metrics.to_prometheus())
+
+    Attached clients are only weakly referenced.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """
+        :param buckets: upper bounds of the latency histogram buckets, in seconds
+        :type buckets: sequence of float
+        """
+        self._buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # (method, host) -> Histogram
+        self._latencies = {}
+        # (method, host, error class) -> count
+        self._errors = collections.Counter()
+        # (method, host) -> count
+        self._bytes_sent = collections.Counter()
+        self._bytes_received = collections.Counter()
+        self._retries = collections.Counter()
+        self._clients = weakref.WeakSet()
+
+    def attach(self, client):
+        """
+        Records the requests of client.
+        """
+        client.hooks.subscribe(self, events=(RESPONSE, ERROR))
+        self._clients.add(client)
+
+    def detach(self, client):
+        """
+        Stops recording the requests of client.
+        """
+        client.hooks.unsubscribe(self)
+        self._clients.discard(client)
+
+    def __call__(self, event):
+        key = (event.method, event.host)
+        with self._lock:
+            histogram = self._latencies.get(key)
+            if histogram is None:
+                histogram = self._latencies[key] = Histogram(self._buckets)
+            histogram.observe(event.duration)
+            self._bytes_sent[key] += event.bytes_sent
+            if event.bytes_received:
+                self._bytes_received[key] += event.bytes_received
+            if event.retries:
+                self._retries[key] += event.retries
+            if event.error is not None:
+                self._errors[key + (type(event.error).__name__,)] += 1
+
+    def reset(self):
+        """
+        Forgets the recorded requests.
+        """
+        with self._lock:
+            self._latencies.clear()
+            self._errors.clear()
+            self._bytes_sent.clear()
+            self._bytes_received.clear()
+            self._retries.clear()
+
+    def histogram(self, method=None, host=None):
+        """
+        Returns the latency histogram of the requests of method to host, merged
+        over all methods or hosts if None.
+
+        :rtype: ``Histogram``
+        """
+        merged = Histogram(self._buckets)
+        with self._lock:
+            for (key_method, key_host), histogram in self._latencies.items():
+                if method in (None, key_method) and host in (None, key_host):
+                    merged.merge(histogram)
+        return merged
+
+    def quantiles(self, method=None, host=None, quantiles=QUANTILES):
+        """
+        Returns latency quantiles of the requests of method to host, in seconds.
+
+        :return: estimate of each quantile, None without requests
+        :rtype: dict
+        """
+        histogram = self.histogram(method, host)
+        return {q: histogram.quantile(q) for q in quantiles}
+
+    def errors(self):
+        """
+        Returns the number of failed requests by method, host and exception class
+        name, e.g. ``('user_show', 'ipa1.example.test', 'NotFound')``.
+
+        :rtype: dict
+        """
+        with self._lock:
+            return dict(self._errors)
+
+    def relogins(self):
+        """
+        Returns the number of times attached clients logged in again, by host.
+        """
+        relogins = collections.Counter()
+        for client in list(self._clients):
+            relogins.update(client.relogins)
+        return dict(relogins)
+
+    def pool_stats(self):
+        """
+        Returns the connection pool state of the attached clients, by host.
+
+        :return: ``maxsize``, ``in_use``, ``idle``, ``opened`` and ``requests``
+                 summed over the clients, by host
+        :rtype: dict of dict
+        """
+        stats = {}
+        for client in list(self._clients):
+            for pool in client.pool_stats():
+                totals = stats.setdefault(pool['host'], collections.Counter())
+                totals.update(
+                    {key: value for key, value in pool.items() if key != 'host'}
+                )
+        return {host: dict(totals) for host, totals in stats.items()}
+
+    def cache_stats(self):
+        """
+        Returns the counters of the result caches of the attached clients, summed
+        over the distinct caches.
+
+        :rtype: dict
+        """
+        caches = {}
+        for client in list(self._clients):
+            if client.result_cache is not None:
+                caches[id(client.result_cache)] = client.result_cache
+        totals = collections.Counter()
+        for cache in caches.values():
+            stats = cache.stats()
+            stats.pop('hit_rate')
+            totals.update(stats)
+        lookups = totals['hits'] + totals['misses']
+        totals = dict(totals)
+        totals['hit_rate'] = totals['hits'] / lookups if lookups else 0.0
+        return totals
+
+    def to_prometheus(self, prefix='freeipa'):
+        """
+        Returns the metrics in the Prometheus text exposition format.
+
+        :param prefix: prefix of the metric names
+        :type prefix: str
+        :rtype: str
+        """
+        lines = []
+
+        def family(name, kind, help_text):
+            lines.append('# HELP {0}_{1} {2}'.format(prefix, name, help_text))
+            lines.append('# TYPE {0}_{1} {2}'.format(prefix, name, kind))
+
+        def sample(name, labels, value):
+            lines.append('{0}_{1}{2} {3}'.format(prefix, name, labels, _format(value)))
+
+        with self._lock:
+            latencies = sorted(self._latencies.items())
+            counters = [
+                (name, sorted(counter.items()))
+                for name, counter in (
+                    ('request_bytes_total', self._bytes_sent),
+                    ('response_bytes_total', self._bytes_received),
+                    ('retries_total', self._retries),
+                )
+            ]
+            errors = sorted(self._errors.items())
+
+        family(
+            'request_duration_seconds',
+            'histogram',
+            'Wall time of JSON RPC requests, retries included.',
+        )
+        for (method, host), histogram in latencies:
+            cumulative = 0
+            for bound, count in zip(
+                histogram.buckets + (float('inf'),), histogram.counts
+            ):
+                cumulative += count
+                sample(
+                    'request_duration_seconds_bucket',
+                    _labels(method=method, host=host, le=_format(float(bound))),
+                    cumulative,
+                )
+            labels = _labels(method=method, host=host)
+            sample('request_duration_seconds_sum', labels, histogram.sum)
+            sample('request_duration_seconds_count', labels, histogram.count)
+
+        help_texts = {
+            'request_bytes_total': 'Bytes of the JSON RPC request bodies.',
+            'response_bytes_total': 'Bytes of the JSON RPC response bodies.',
+            'retries_total': 'Requests sent again after a failover or a re-login.',
+        }
+        for name, items in counters:
+            family(name, 'counter', help_texts[name])
+            for (method, host), value in items:
+                sample(name, _labels(method=method, host=host), value)
+
+        family('errors_total', 'counter', 'Failed requests by exception class.')
+        for (method, host, error), value in errors:
+            sample(
+                'errors_total', _labels(method=method, host=host, error=error), value
+            )
+
+        family('relogins_total', 'counter', 'Logins after a session expired.')
+        for host, value in sorted(self.relogins().items()):
+            sample('relogins_total', _labels(host=host), value)
+
+        pools = sorted(self.pool_stats().items())
+        for name, key, kind, help_text in (
+            ('pool_connections_max', 'maxsize', 'gauge', 'Size of the pools.'),
+            ('pool_connections_in_use', 'in_use', 'gauge', 'Checked out connections.'),
+            ('pool_connections_idle', 'idle', 'gauge', 'Idle open connections.'),
+            (
+                'pool_connections_opened_total',
+                'opened',
+                'counter',
+                'Connections opened.',
+            ),
+            ('pool_requests_total', 'requests', 'counter', 'Requests sent.'),
+        ):
+            family(name, kind, help_text)
+            for host, stats in pools:
+                sample(name, _labels(host=host), stats[key])
+
+        cache = self.cache_stats()
+        for name, key, kind, help_text in (
+            ('cache_hits_total', 'hits', 'counter', 'Results read from the cache.'),
+            ('cache_misses_total', 'misses', 'counter', 'Results not in the cache.'),
+            ('cache_evictions_total', 'evictions', 'counter', 'Evicted results.'),
+            ('cache_entries', 'entries', 'gauge', 'Cached results.'),
+            ('cache_size_bytes', 'size', 'gauge', 'Memory used by the cache.'),
+        ):
+            family(name, kind, help_text)
+            sample(name, '', cache.get(key, 0))
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,82 @@
+"""Paging of ``*_find`` results, shared by the synchronous and asynchronous clients."""
+
+from python_freeipa.exceptions import NotFound
+
+# Options of ``iter_find`` sent to ``<obj>_show`` rather than ``<obj>_find``.
+SHOW_OPTIONS = ('all', 'raw', 'rights', 'no_members', 'fields')
+
+
+class FindPager(object):
+    """
+    Calls of an ``iter_find``, independent of the transport: the ``<obj>_find``
+    call enumerating the primary keys, then the ``<obj>_show`` calls of each
+    page of keys. The client sends them and feeds the results back.
+    """
+
+    def __init__(self, obj, args, criteria=None, page_size=100, pkey=None, params=None):
+        """
+        See ``Client.iter_find`` for the parameters.
+        """
+        self.obj = obj
+        self.args = list(args)
+        self.page_size = page_size
+        self.pkey = pkey
+        params = dict(params or {})
+        self.show_params = {'all': True}
+        for name in SHOW_OPTIONS:
+            if name in params:
+                self.show_params[name] = params.pop(name)
+        params['pkey_only'] = True
+        params.setdefault('sizelimit', 0)
+        self.find_params = params
+        self.find_args = list(args)
+        if criteria is not None:
+            self.find_args.append(criteria)
+
+    @property
+    def find_method(self):
+        """Name of the command enumerating the primary keys."""
+        return '{0}_find'.format(self.obj)
+
+    def keys(self, found, log):
+        """
+        Returns the primary keys of the result of the ``<obj>_find`` call.
+        """
+        if found.get('truncated'):
+            log.warning(
+                '{0}_find results were truncated by the server size limit'.format(
+                    self.obj
+                )
+            )
+        keys = []
+        pkey = self.pkey
+        for entry in found['result']:
+            if pkey is None:
+                pkey = [name for name in entry if name != 'dn'][0]
+            value = entry[pkey]
+            keys.append(value[0] if isinstance(value, list) else value)
+        return keys
+
+    def pages(self, keys):
+        """
+        Returns the ``<obj>_show`` calls of each page of keys.
+
+        :return: generator of lists of method, arguments and parameters
+        """
+        show = '{0}_show'.format(self.obj)
+        for start in range(0, len(keys), self.page_size):
+            yield [
+                (show, self.args + [key], dict(self.show_params))
+                for key in keys[start : start + self.page_size]
+            ]
+
+    @staticmethod
+    def entries(results):
+        """
+        Returns the entries of the ``BatchResult`` of the calls of a page,
+        skipping the ones deleted since they were enumerated.
+        """
+        for result in results:
+            if isinstance(result.exception(), NotFound):
+                continue
+            yield result.result()['result']
@@ -0,0 +1,240 @@
+"""Projection of the results of ``*_show`` and ``*_find`` commands on a few fields."""
+
+# Attributes that ``*_show`` and ``*_find`` return without ``all``, by object.
+# Only attributes returned by all supported server versions are listed, others
+# are fetched with ``all``.
+DEFAULT_ATTRIBUTES = {
+    'user': frozenset(
+        [
+            'uid',
+            'givenname',
+            'sn',
+            'homedirectory',
+            'loginshell',
+            'uidnumber',
+            'gidnumber',
+            'mail',
+            'ou',
+            'telephonenumber',
+            'title',
+            'nsaccountlock',
+            'ipauserauthtype',
+            'userclass',
+            'krbprincipalname',
+            'krbprincipalexpiration',
+        ]
+    ),
+    'group': frozenset(['cn', 'description', 'gidnumber']),
+    'hostgroup': frozenset(['cn', 'description']),
+    'host': frozenset(
+        [
+            'fqdn',
+            'description',
+            'l',
+            'nshostlocation',
+            'nshardwareplatform',
+            'nsosversion',
+            'krbprincipalname',
+            'macaddress',
+            'userclass',
+        ]
+    ),
+    'service': frozenset(['krbcanonicalname', 'krbprincipalname']),
+    'dnszone': frozenset(
+        [
+            'idnsname',
+            'idnszoneactive',
+            'idnssoamname',
+            'idnssoarname',
+            'idnssoaserial',
+            'idnssoarefresh',
+            'idnssoaretry',
+            'idnssoaexpire',
+            'idnssoaminimum',
+        ]
+    ),
+    'dnsrecord': frozenset(['idnsname']),
+}
+DEFAULT_ATTRIBUTES['stageuser'] = DEFAULT_ATTRIBUTES['user']
+
+# Attribute returned by ``*_find`` with ``pkey_only``, by object.
+PRIMARY_KEYS = {
+    'user': 'uid',
+    'stageuser': 'uid',
+    'group': 'cn',
+    'hostgroup': 'cn',
+    'host': 'fqdn',
+    'dnszone': 'idnsname',
+    'dnsrecord': 'idnsname',
+    'netgroup': 'cn',
+    'role': 'cn',
+    'hbacrule': 'cn',
+    'sudorule': 'cn',
+}
+
+# Objects whose ``*_show`` and ``*_find`` commands take ``no_members``.
+MEMBER_OBJECTS = frozenset(
+    [
+        'caacl',
+        'cert',
+        'group',
+        'hbacrule',
+        'hbacsvc',
+        'hbacsvcgroup',
+        'host',
+        'hostgroup',
+        'netgroup',
+        'otptoken',
+        'permission',
+        'privilege',
+        'role',
+        'selinuxusermap',
+        'server',
+        'service',
+        'servicedelegationrule',
+        'stageuser',
+        'sudocmd',
+        'sudocmdgroup',
+        'sudorule',
+        'user',
+        'vault',
+        'vaultcontainer',
+    ]
+)
+
+# ``*_find`` commands not taking ``pkey_only``.
+NO_PKEY_ONLY = frozenset(['automountkey_find', 'server_role_find'])
+
+# Prefixes of the membership attributes, only computed without ``no_members``.
+MEMBER_PREFIXES = (
+    'member_',
+    'memberof_',
+    'memberindirect_',
+    'memberofindirect_',
+    'managedby_',
+)
+
+# Field selecting all the attributes and memberships of entries.
+ALL_FIELDS = '*'
+
+# Options of ``*_show`` and ``*_find`` commands by client profile.
+PROFILES = {
+    'default': None,
+    # Entries with their default attributes only, and without memberships.
+    'bulk': {'all': False, 'no_members': True},
+}
+
+
+def is_projectable(method):
+    """
+    Returns True if the entries returned by method can be projected.
+    """
+    return method.endswith(('_show', '_find'))
+
+
+def _field_names(fields):
+    if isinstance(fields, str):
+        return (fields,)
+    return tuple(fields)
+
+
+def _takes_option(method, name):
+    obj, _, command = method.rpartition('_')
+    if name == 'no_members':
+        return obj in MEMBER_OBJECTS
+    if name == 'pkey_only':
+        return command == 'find' and method not in NO_PKEY_ONLY
+    return True
+
+
+def _set_options(method, params, options):
+    # Options are only sent to commands taking them, the server rejects the
+    # others. The generated methods always marshal the ones they take.
+    for name, value in options.items():
+        if name in params or _takes_option(method, name):
+            params[name] = value
+
+
+def project(method, params, fields):
+    """
+    Returns the parameters of a call of method returning fields with the
+    cheapest ``all``, ``no_members`` and ``pkey_only`` options.
+
+    Without ``all``, the server skips the attributes outside of the default ones
+    of the object. With ``no_members``, it does not compute the memberships and
+    indirect memberships of the entries. With ``pkey_only``, ``*_find`` only
+    returns primary keys.
+
+    :param params: named parameters of the call, not modified
+    :type params: dict or None
+    :param fields: names of the attributes needed, ``*`` for all of them
+    :type fields: str or iterable of str
+    :rtype: dict
+    """
+    params = dict(params or {})
+    params.pop('fields', None)
+    if not is_projectable(method):
+        return params
+    fields = frozenset(_field_names(fields))
+    if ALL_FIELDS in fields:
+        _set_options(
+            method, params, {'all': True, 'no_members': False, 'pkey_only': False}
+        )
+        return params
+    obj, _, command = method.rpartition('_')
+    attributes = frozenset(
+        field for field in fields if not field.startswith(MEMBER_PREFIXES)
+    )
+    options = {
+        'all': not attributes <= DEFAULT_ATTRIBUTES.get(obj, frozenset()),
+        'no_members': attributes == fields,
+        'pkey_only': False,
+    }
+    pkey = PRIMARY_KEYS.get(obj)
+    if command == 'find' and pkey is not None and fields <= {pkey}:
+        options.update({'all': False, 'pkey_only': True})
+    _set_options(method, params, options)
+    return params
+
+
+def apply_profile(method, params, profile):
+    """
+    Returns the parameters of a call of method with the options of a client
+    profile, see ``PROFILES``.
+
+    :param params: named parameters of the call, not modified
+    :type params: dict or None
+    :param profile: options of the profile
+    :type profile: dict
+    :rtype: dict
+    """
+    params = dict(params or {})
+    if is_projectable(method):
+        _set_options(method, params, profile)
+    return params
+
+
+def trim(result, fields):
+    """
+    Returns a copy of the result of a ``*_show`` or ``*_find`` command whose
+    entries only have the given fields.
+
+    :param result: result of the command
+    :type result: dict
+    :param fields: names of the attributes kept, ``*`` for all of them
+    :type fields: str or iterable of str
+    :rtype: dict
+    """
+    fields = _field_names(fields)
+    if ALL_FIELDS in fields:
+        return result
+    entries = result.get('result')
+    if isinstance(entries, dict):
+        entries = {name: entries[name] for name in fields if name in entries}
+    elif isinstance(entries, list):
+        entries = [
+            {name: entry[name] for name in fields if name in entry} for entry in entries
+        ]
+    else:
+        return result
+    return dict(result, result=entries)
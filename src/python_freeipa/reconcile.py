@@ -0,0 +1,425 @@
+"""Reconciliation of the entries of a server with a desired state."""
+
+import collections
+
+from python_freeipa.exceptions import MemberFailed, NotFound
+from python_freeipa.projection import MEMBER_PREFIXES, PRIMARY_KEYS
+
+# Actions of operations, in the order they are applied: members are added once
+# all entries exist, and removed before entries are deleted.
+ADD = 'add'
+MOD = 'mod'
+REMOVE_MEMBER = 'remove_member'
+ADD_MEMBER = 'add_member'
+DEL = 'del'
+PHASES = (ADD, MOD, REMOVE_MEMBER, ADD_MEMBER, DEL)
+
+SYMBOLS = {ADD: '+', MOD: '~', REMOVE_MEMBER: '-', ADD_MEMBER: '+', DEL: '-'}
+
+# Built-in entries never deleted by pruning, by object type.
+PROTECTED = {
+    'user': frozenset(['admin']),
+    'group': frozenset(['admins', 'editors', 'ipausers', 'trust admins']),
+    'hostgroup': frozenset(['ipaservers']),
+}
+
+# Prefix of the membership attributes of desired entries, e.g. ``member_user``.
+MEMBER_PREFIX = 'member_'
+
+
+def _text(value):
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    return str(value)
+
+
+def _values(value):
+    # Values of an attribute, compared regardless of their order and type.
+    if value is None:
+        return frozenset()
+    if not isinstance(value, (list, tuple, set, frozenset)):
+        value = [value]
+    return frozenset(_text(item) for item in value)
+
+
+def _names(value):
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return list(value)
+
+
+class Operation(object):
+    """
+    Call of a ``Plan``, with the changes it makes.
+    """
+
+    __slots__ = ('action', 'obj', 'key', 'params', 'changes', 'error')
+
+    def __init__(self, action, obj, key, params=None, changes=None):
+        self.action = action
+        self.obj = obj
+        self.key = key
+        self.params = params or {}
+        # Attribute -> (current value, desired value) of ``add`` and ``mod``.
+        self.changes = changes or {}
+        # Error of the call once applied, None if it succeeded.
+        self.error = None
+
+    @property
+    def method(self):
+        """RPC method name of the call, e.g. ``group_add_member``."""
+        return '{0}_{1}'.format(self.obj, self.action)
+
+    @property
+    def args(self):
+        return [self.key]
+
+    def __repr__(self):
+        return '<Operation {0} {1!r}>'.format(self.method, self.key)
+
+    def __str__(self):
+        lines = ['{0} {1} {2}'.format(SYMBOLS[self.action], self.method, self.key)]
+        if self.action in (ADD, MOD):
+            for name, (before, after) in sorted(self.changes.items()):
+                if self.action == ADD:
+                    lines.append('    {0}: {1!r}'.format(name, after))
+                else:
+                    lines.append('    {0}: {1!r} -> {2!r}'.format(name, before, after))
+        elif self.action in (ADD_MEMBER, REMOVE_MEMBER):
+            for name, members in sorted(self.params.items()):
+                lines.append('    {0}: {1}'.format(name, ', '.join(members)))
+        if self.error is not None:
+            lines.append('    ! {0}'.format(self.error))
+        return '\n'.join(lines)
+
+
+class Plan(object):
+    """
+    Operations bringing a server to a desired state, in the order they are
+    applied. ``str(plan)`` describes them, for dry runs.
+    """
+
+    def __init__(self, operations=()):
+        self.operations = list(operations)
+
+    def __iter__(self):
+        return iter(self.operations)
+
+    def __len__(self):
+        return len(self.operations)
+
+    def __bool__(self):
+        return bool(self.operations)
+
+    def __repr__(self):
+        return '<Plan {0}>'.format(self.summary())
+
+    def __str__(self):
+        return '\n'.join([str(operation) for operation in self] + [self.summary()])
+
+    def counts(self):
+        """
+        Returns the number of operations by action.
+
+        :rtype: dict
+        """
+        return dict(collections.Counter(operation.action for operation in self))
+
+    def summary(self):
+        counts = self.counts()
+        return (
+            '{0} to add, {1} to change, {2} membership changes, {3} to delete'.format(
+                counts.get(ADD, 0),
+                counts.get(MOD, 0),
+                counts.get(ADD_MEMBER, 0) + counts.get(REMOVE_MEMBER, 0),
+                counts.get(DEL, 0),
+            )
+        )
+
+    def errors(self):
+        """
+        Returns the operations that failed once applied.
+
+        :rtype: list of ``Operation``
+        """
+        return [operation for operation in self if operation.error is not None]
+
+
+class Reconciler(object):
+    """
+    Computes and applies the operations bringing the entries of a server to a
+    desired state, given by object type and primary key::
+
+        desired = {
+            'user': {
+                'alice': {'givenname': 'Alice', 'sn': 'Liddell', 'mail': 'a@example.test'},
+            },
+            'group': {
+                'staff': {'description': 'Staff', 'member_user': ['alice']},
+            },
+        }
+        reconciler = Reconciler(client)
+        plan = reconciler.plan(desired)
+        print(plan)
+        reconciler.apply(plan)
+
+    Only the attributes given for an entry are compared, regardless of the
+    order of their values, and None removes an attribute. Memberships given as
+    ``member_<type>`` attributes are authoritative for that type: missing
+    members are added and other members removed. Primary keys and member names
+    are compared case-insensitively.
+
+    The existing entries are enumerated with one ``*_find`` call with
+    ``pkey_only`` per object type, and the attributes compared are fetched
+    either by ``*_show`` calls of the desired entries, sent in batches, or by
+    a single ``*_find`` call projected on them when most entries are desired.
+    Operations are sent in ``batch`` requests, only for the entries and
+    attributes that differ, so that nothing is written when the server is in
+    sync.
+    """
+
+    def __init__(self, client, prune=(), keep=None, batch_size=100, show_ratio=0.5):
+        """
+        :param client: client of the server
+        :type client: ``ClientMeta``
+        :param prune: object types whose entries missing from the desired state
+                      are deleted, e.g. ``['group']``
+        :type prune: iterable of str
+        :param keep: primary keys of the entries never deleted by pruning, by
+                     object type, ``PROTECTED`` by default
+        :type keep: dict or None
+        :param batch_size: number of calls per ``batch`` request
+        :type batch_size: int
+        :param show_ratio: ratio of the desired entries to the existing ones
+                           above which the attributes of all entries are fetched
+                           by one ``*_find`` call rather than ``*_show`` calls
+        :type show_ratio: float
+        """
+        self.client = client
+        self.prune = frozenset(prune)
+        if keep is None:
+            keep = PROTECTED
+        self.keep = {
+            obj: frozenset(key.lower() for key in keys) for obj, keys in keep.items()
+        }
+        self.batch_size = batch_size
+        self.show_ratio = show_ratio
+
+    def _find(self, obj, params):
+        params = dict(params, sizelimit=0)
+        result = self.client._request('{0}_find'.format(obj), [], params)
+        if result.get('truncated'):
+            self.client.log.warning(
+                '{0}_find results were truncated by the server size limit'.format(obj)
+            )
+        return result['result']
+
+    def fetch(self, obj, entries):
+        """
+        Returns the existing entries of an object type, and the current
+        attributes of the desired ones.
+
+        :param obj: object type, e.g. ``user``
+        :type obj: str
+        :param entries: desired entries by primary key
+        :type entries: dict
+        :return: primary keys of the existing entries by lowercase key, and
+                 the entries holding the desired attributes by lowercase key
+        :rtype: tuple of two dicts
+        """
+        pkey = PRIMARY_KEYS.get(obj)
+        if pkey is None:
+            raise ValueError('Unknown primary key of {0} entries'.format(obj))
+        existing = {}
+        for entry in self._find(obj, {'pkey_only': True}):
+            key = _names(entry[pkey])[0]
+            existing[key.lower()] = key
+
+        fields = sorted(
+            set(name for attributes in entries.values() for name in attributes or ())
+        )
+        wanted = [key for key in entries if key.lower() in existing]
+        current = {}
+        if not fields or not wanted:
+            return existing, current
+        if len(wanted) > self.show_ratio * len(existing):
+            for entry in self._find(obj, {'fields': [pkey] + fields}):
+                current[_names(entry[pkey])[0].lower()] = entry
+            return existing, current
+        results = self.client.map(
+            '{0}_show'.format(obj),
+            wanted,
+            chunk_size=self.batch_size,
+            fields=[pkey] + fields,
+        )
+        for result in results:
+            if isinstance(result.exception(), NotFound):
+                # Deleted since it was enumerated.
+                existing.pop(result.key.lower(), None)
+                continue
+            current[result.key.lower()] = result.result()['result']
+        return existing, current
+
+    def _entry_operations(self, obj, key, attributes, exists, entry):
+        operations = []
+        values = {}
+        members = {}
+        for name, value in attributes.items():
+            if name.startswith(MEMBER_PREFIX):
+                members[name[len(MEMBER_PREFIX) :]] = _names(value)
+            elif name.startswith(MEMBER_PREFIXES):
+                raise ValueError(
+                    'Only member_* memberships can be reconciled, not {0}'.format(name)
+                )
+            else:
+                values[name] = value
+
+        if not exists:
+            changes = {
+                name: (None, value)
+                for name, value in values.items()
+                if value is not None
+            }
+            params = {name: after for name, (_, after) in changes.items()}
+            operations.append(Operation(ADD, obj, key, params, changes))
+        else:
+            changes = {
+                name: (entry.get(name), value)
+                for name, value in values.items()
+                if _values(value) != _values(entry.get(name))
+            }
+            if changes:
+                params = {name: after for name, (_, after) in changes.items()}
+                operations.append(Operation(MOD, obj, key, params, changes))
+
+        added = {}
+        removed = {}
+        for member_type, names in sorted(members.items()):
+            current = {
+                name.lower(): name
+                for name in _names(entry.get(MEMBER_PREFIX + member_type))
+            }
+            desired = {name.lower(): name for name in names}
+            missing = [desired[name] for name in desired if name not in current]
+            extra = [current[name] for name in current if name not in desired]
+            if missing:
+                added[member_type] = missing
+            if extra:
+                removed[member_type] = extra
+        if removed:
+            operations.append(Operation(REMOVE_MEMBER, obj, key, removed))
+        if added:
+            operations.append(Operation(ADD_MEMBER, obj, key, added))
+        return operations
+
+    def plan(self, desired):
+        """
+        Returns the operations bringing the server to the desired state, without
+        applying them.
+
+        :param desired: attributes of the desired entries, by object type and
+                        primary key
+        :type desired: dict of str and dict
+        :rtype: ``Plan``
+        """
+        operations = []
+        for obj, entries in desired.items():
+            entries = {key: attributes or {} for key, attributes in entries.items()}
+            existing, current = self.fetch(obj, entries)
+            for key, attributes in entries.items():
+                operations.extend(
+                    self._entry_operations(
+                        obj,
+                        key,
+                        attributes,
+                        key.lower() in existing,
+                        current.get(key.lower(), {}),
+                    )
+                )
+            if obj in self.prune:
+                kept = set(key.lower() for key in entries)
+                kept.update(self.keep.get(obj, ()))
+                for name in sorted(set(existing) - kept):
+                    operations.append(Operation(DEL, obj, existing[name]))
+        operations.sort(key=lambda operation: PHASES.index(operation.action))
+        return Plan(operations)
+
+    def apply(self, plan):
+        """
+        Sends the operations of plan in ``batch`` requests, one action after
+        the other, and stores the error of each failed operation in its
+        ``error``, see ``Plan.errors``.
+
+        :type plan: ``Plan``
+        :return: plan
+        :rtype: ``Plan``
+        :raises FreeIPAError: if a ``batch`` request fails, in which case the
+                              following actions are not applied
+        """
+        for action in PHASES:
+            operations = [operation for operation in plan if operation.action == action]
+            for start in range(0, len(operations), self.batch_size):
+                self._send(operations[start : start + self.batch_size])
+        return plan
+
+    def _send(self, operations):
+        batch = self.client.batched(max_size=None)
+        futures = [
+            batch._request(operation.method, operation.args, dict(operation.params))
+            for operation in operations
+        ]
+        try:
+            batch.flush()
+        finally:
+            for operation, future in zip(operations, futures):
+                if future.done():
+                    operation.error = future.exception()
+        for operation, future in zip(operations, futures):
+            if operation.error is None and operation.action in (
+                ADD_MEMBER,
+                REMOVE_MEMBER,
+            ):
+                operation.error = _member_error(future.result())
+
+    def reconcile(self, desired, dry_run=False):
+        """
+        Brings the server to the desired state, see ``plan`` and ``apply``.
+
+        :param dry_run: True to only return the plan, without applying it
+        :type dry_run: bool
+        :rtype: ``Plan``
+        """
+        plan = self.plan(desired)
+        if dry_run:
+            return plan
+        return self.apply(plan)
+
+
+def _member_error(result):
+    # Members are not added or removed one by one, failures are reported in
+    # the result rather than as errors.
+    failed = {}
+    for member_types in (result.get('failed') or {}).values():
+        for member_type, members in member_types.items():
+            if members:
+                failed[member_type] = members
+    if not failed:
+        return None
+    message = '; '.join(
+        '{0}: {1}'.format(name, reason)
+        for members in failed.values()
+        for name, reason in members
+    )
+    return MemberFailed(message, failed=failed)
+
+
+def reconcile(client, desired, prune=(), dry_run=False, **kwargs):
+    """
+    Brings the server of client to the desired state, see ``Reconciler``.
+
+    :return: the operations applied, or to apply with ``dry_run``
+    :rtype: ``Plan``
+    """
+    return Reconciler(client, prune=prune, **kwargs).reconcile(desired, dry_run)
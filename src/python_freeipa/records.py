@@ -0,0 +1,254 @@
+"""Compact records of the entries returned by ``*_show`` and ``*_find`` commands."""
+
+import importlib
+import keyword
+import re
+import sys
+
+from python_freeipa.codec import decode_wire
+
+# Attributes of the entries of all objects, returned with ``all``.
+BASE_ATTRIBUTES = ('dn', 'objectclass')
+
+
+def attribute_name(name):
+    """
+    Returns the Python name of the attribute name of an entry, e.g.
+    ``usercertificate_binary`` for ``usercertificate;binary``.
+    """
+    name = re.sub(r'\W', '_', name)
+    if keyword.iskeyword(name) or name[:1].isdigit():
+        name += '_'
+    return name
+
+
+def _is_wire(value):
+    if value.__class__ is dict:
+        return True
+    return value.__class__ is tuple and bool(value) and value[0].__class__ is dict
+
+
+class _Field(object):
+    """
+    Attribute of a record, stored in a slot and decoded on first access.
+    """
+
+    __slots__ = ('name', 'slot')
+
+    def __init__(self, name, slot):
+        self.name = name
+        self.slot = slot
+
+    def __get__(self, record, owner=None):
+        if record is None:
+            return self
+        try:
+            value = self.slot.__get__(record, owner)
+        except AttributeError:
+            return None
+        if _is_wire(value):
+            if value.__class__ is tuple:
+                value = tuple(decode_wire(item) for item in value)
+            else:
+                value = decode_wire(value)
+            self.slot.__set__(record, value)
+        return value
+
+    def __set__(self, record, value):
+        self.slot.__set__(record, value)
+
+    def __delete__(self, record):
+        self.slot.__delete__(record)
+
+
+class Record(object):
+    """
+    Entry of an object, with one slot per attribute rather than a dict.
+
+    Attributes absent from the entry read as None. The values of single-valued
+    attributes are unwrapped from their one-item lists, the values of the others
+    are stored as tuples, which are smaller than lists. The values of enumerated
+    attributes such as ``objectclass`` or memberships are interned, and
+    ``__base64__`` and ``__datetime__`` values are only decoded into ``bytes``
+    and ``datetime`` when read. Attributes unknown to the class are kept in
+    ``extra``.
+
+    Classes of records are created by ``record_class``.
+    """
+
+    __slots__ = ('_extra',)
+
+    object_name = None
+    attributes = ()
+    single = frozenset()
+    interned = frozenset()
+    _slot_names = {}
+    _fields = {}
+
+    @classmethod
+    def from_entry(cls, entry):
+        """
+        Returns the record of an entry of a ``*_show`` or ``*_find`` result.
+
+        :type entry: dict
+        """
+        record = cls.__new__(cls)
+        slot_names = cls._slot_names
+        single = cls.single
+        interned = cls.interned
+        extra = None
+        for name, value in entry.items():
+            slot = slot_names.get(name)
+            if slot is None:
+                if extra is None:
+                    extra = {}
+                extra[name] = value
+                continue
+            if value.__class__ is list or value.__class__ is tuple:
+                if len(value) == 1 and name in single:
+                    value = value[0]
+                    if value.__class__ is str and name in interned:
+                        value = sys.intern(value)
+                elif name in interned:
+                    value = tuple(
+                        sys.intern(item) if item.__class__ is str else item
+                        for item in value
+                    )
+                else:
+                    value = tuple(value)
+            elif value.__class__ is str and name in interned:
+                value = sys.intern(value)
+            object.__setattr__(record, slot, value)
+        record._extra = extra
+        return record
+
+    @property
+    def extra(self):
+        """Attributes of the entry unknown to the class of the record."""
+        return self._extra or {}
+
+    def get(self, name, default=None):
+        """
+        Returns the value of the attribute name of the entry, as named by the
+        server.
+        """
+        field = self._fields.get(name)
+        if field is None:
+            return self.extra.get(name, default)
+        value = field.__get__(self)
+        return default if value is None else value
+
+    def __getitem__(self, name):
+        value = self.get(name)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+    def to_dict(self):
+        """
+        Returns the attributes of the entry as a dict, keyed by their name on the
+        server, with the values of the record and lists of the multiple values.
+        """
+        result = {}
+        for name in self.attributes:
+            value = self.get(name)
+            if value is not None:
+                result[name] = list(value) if value.__class__ is tuple else value
+        result.update(self.extra)
+        return result
+
+    def __eq__(self, other):
+        if not isinstance(other, Record):
+            return NotImplemented
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        pkey = self.attributes[len(BASE_ATTRIBUTES)] if self.attributes else None
+        return '<{0} {1}>'.format(type(self).__name__, self.get(pkey) if pkey else '')
+
+    def __reduce__(self):
+        return _restore, (type(self).object_name, self.to_dict())
+
+
+def _restore(object_name, entry):
+    return record_class(object_name).from_entry(entry)
+
+
+def record_class(
+    name_or_object, object_name=None, attributes=(), single=(), interned=()
+):
+    """
+    Returns the record class of an object, or creates one.
+
+    With only an object name, e.g. ``record_class('user')``, returns the class
+    generated from the schema of the server along with ``ClientMeta``.
+
+    :param name_or_object: name of the class to create, or of the object
+    :type name_or_object: str
+    :param object_name: name of the object of the class to create
+    :type object_name: str or None
+    :param attributes: names of the attributes of the entries, primary key first
+    :type attributes: iterable of str
+    :param single: names of the single-valued attributes
+    :type single: iterable of str
+    :param interned: names of the attributes whose values are interned
+    :type interned: iterable of str
+    :raises KeyError: if no class was generated for the object
+    :rtype: type
+    """
+    if object_name is None:
+        records = importlib.import_module('python_freeipa.client_meta._records')
+        return records.RECORDS[name_or_object]
+    attributes = BASE_ATTRIBUTES + tuple(
+        name for name in attributes if name not in BASE_ATTRIBUTES
+    )
+    slot_names = {name: '_' + attribute_name(name) for name in attributes}
+    namespace = {
+        '__slots__': tuple(slot_names.values()),
+        'object_name': object_name,
+        'attributes': attributes,
+        'single': frozenset(single) | {'dn'},
+        'interned': frozenset(interned) | {'objectclass'},
+        '_slot_names': slot_names,
+    }
+    cls = type(name_or_object, (Record,), namespace)
+    cls._fields = {
+        name: _Field(name, cls.__dict__[slot]) for name, slot in slot_names.items()
+    }
+    for name, field in cls._fields.items():
+        # Attributes named like a method of records are only read with get().
+        if not hasattr(Record, attribute_name(name)):
+            setattr(cls, attribute_name(name), field)
+    return cls
+
+
+def to_records(result, record_type):
+    """
+    Returns the records of the entries of a ``*_find`` result, or the record of
+    the entry of a ``*_show`` result::
+
+        users = to_records(client.user_find(o_sizelimit=0), 'user')
+        print(users[0].uid, users[0].memberof_group)
+
+    :param result: result of a ``*_show`` or ``*_find`` command
+    :type result: dict
+    :param record_type: record class, or name of the object
+    :type record_type: type or str
+    :rtype: list of ``Record`` or ``Record``
+    """
+    if isinstance(record_type, str):
+        record_type = record_class(record_type)
+    entries = result['result']
+    if isinstance(entries, dict):
+        return record_type.from_entry(entries)
+    from_entry = record_type.from_entry
+    return [from_entry(entry) for entry in entries]
@@ -0,0 +1,256 @@
+"""Retries of failed requests, with backoff, a retry budget and deadlines."""
+
+import asyncio
+import contextlib
+import random
+import threading
+import time
+
+import requests
+import urllib3
+
+from python_freeipa.commands import is_read_only
+from python_freeipa.exceptions import DeadlineExceeded, FreeIPAError
+
+# HTTP statuses of the IPA httpd or a proxy while a replica restarts, and the
+# LDAP timeout error of the server.
+TRANSIENT_CODES = (502, 503, 504, 4211)
+
+# Deadline of the enclosing ``deadline`` contexts, by thread.
+_local = threading.local()
+
+
+@contextlib.contextmanager
+def deadline(seconds):
+    """
+    Context in which the calls of any client of the current thread, retries
+    included, must complete within seconds, e.g.
+    ``with deadline(2): client.user_show('alice')``.
+
+    Nested deadlines can only shorten the enclosing one. Each request is sent
+    with a timeout no longer than the time left. The calls of ``AsyncClient``
+    ignore it, as all the tasks of a thread would share it, see
+    ``await_deadline``.
+    """
+    until = time.monotonic() + seconds
+    current = getattr(_local, 'until', None)
+    _local.until = until if current is None else min(current, until)
+    try:
+        yield
+    finally:
+        _local.until = current
+
+
+async def await_deadline(seconds, awaitable):
+    """
+    Awaits a call of an ``AsyncClient`` that must complete within seconds,
+    retries included, e.g. ``await await_deadline(2, client.user_show('alice'))``.
+
+    :raises DeadlineExceeded: if the call did not complete in time, it is then
+                              cancelled
+    """
+    try:
+        return await asyncio.wait_for(awaitable, seconds)
+    except asyncio.TimeoutError:
+        raise DeadlineExceeded('Deadline exceeded')
+
+
+def current_deadline(timeout=None, enclosing=True):
+    """
+    Returns the ``time.monotonic()`` deadline of a call starting now, the
+    earliest of the enclosing ``deadline`` context and timeout seconds from
+    now, None if there is neither.
+
+    :param enclosing: False to ignore the enclosing ``deadline`` context
+    :type enclosing: bool
+    """
+    until = getattr(_local, 'until', None) if enclosing else None
+    if timeout is not None:
+        own = time.monotonic() + timeout
+        until = own if until is None else min(until, own)
+    return until
+
+
+def time_left(until, timeout=None):
+    """
+    Returns the timeout of a request sent now: timeout, shortened to the time
+    left until the deadline if any.
+
+    :raises DeadlineExceeded: if the deadline passed
+    """
+    if until is None:
+        return timeout
+    left = until - time.monotonic()
+    if left <= 0:
+        raise DeadlineExceeded('Deadline exceeded')
+    return left if timeout is None else min(timeout, left)
+
+
+def is_connect_error(err):
+    """
+    Returns True if a request failed before it was sent.
+    """
+    if isinstance(err, requests.exceptions.ConnectTimeout):
+        return True
+    reason = getattr(err.args[0], 'reason', None) if err.args else None
+    # Also true of refused connections, NewConnectionError is a subclass.
+    return isinstance(reason, urllib3.exceptions.ConnectTimeoutError)
+
+
+class RetryBudget(object):
+    """
+    Limits retries to a fraction of the requests, so that retries do not
+    overload servers that are already failing.
+
+    As in gRPC retry throttling, the budget holds ``max_tokens`` tokens. Each
+    failed request takes one, each successful request gives ``token_ratio``
+    back, and retries are only allowed while more than half the tokens are
+    left.
+    """
+
+    def __init__(self, max_tokens=10, token_ratio=0.1):
+        """
+        :param max_tokens: size of the budget
+        :type max_tokens: float
+        :param token_ratio: tokens given back by a successful request
+        :type token_ratio: float
+        """
+        self.max_tokens = max_tokens
+        self.token_ratio = token_ratio
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self):
+        return self._tokens
+
+    def record_success(self):
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.token_ratio)
+
+    def record_failure(self):
+        """
+        Takes a token for a failed request, returns True if it may be retried.
+        """
+        with self._lock:
+            self._tokens = max(0, self._tokens - 1)
+            return self._tokens > self.max_tokens / 2
+
+
+class RetryPolicy(object):
+    """
+    Decides which failed calls are sent again, and when.
+
+    Connection errors, timeouts and responses with a transient code are retried
+    with exponential backoff and jitter, within the retry budget and the
+    deadline of the call. Calls that may have reached the server are only
+    retried if their command is safe to replay, as classified by
+    ``python_freeipa.commands.is_read_only``: ``*_show``, ``*_find``,
+    ``*_status``, ``ping``, ``whoami``... Other commands, such as ``*_add``,
+    ``*_mod`` or ``passwd``, are only retried if the request could not be sent.
+    """
+
+    def __init__(
+        self,
+        max_attempts=3,
+        backoff=0.1,
+        multiplier=2.0,
+        max_backoff=5.0,
+        jitter=1.0,
+        budget=None,
+        timeout=None,
+        transient_codes=TRANSIENT_CODES,
+        is_replayable=is_read_only,
+    ):
+        """
+        :param max_attempts: maximum number of times a call is sent
+        :type max_attempts: int
+        :param backoff: delay before the first retry, in seconds
+        :type backoff: float
+        :param multiplier: factor of the delay of each following retry
+        :type multiplier: float
+        :param max_backoff: maximum delay between retries, in seconds
+        :type max_backoff: float
+        :param jitter: fraction of each delay that is randomized, 1 for
+                       "full jitter" delays between 0 and the backoff
+        :type jitter: float
+        :param budget: budget shared by the calls using the policy, a default
+                       one if None, False for unlimited retries
+        :type budget: ``RetryBudget``, bool or None
+        :param timeout: default deadline of each call, retries included, in
+                        seconds
+        :type timeout: float or None
+        :param transient_codes: HTTP statuses and FreeIPA error codes retried
+        :type transient_codes: iterable of int
+        :param is_replayable: function of the method and arguments of a call,
+                              returning True if it is safe to send it twice
+        :type is_replayable: callable
+        """
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.multiplier = multiplier
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        if budget is None:
+            budget = RetryBudget()
+        self.budget = budget or None
+        self.timeout = timeout
+        self.transient_codes = frozenset(transient_codes)
+        self.is_replayable = is_replayable
+
+    def deadline(self, enclosing=True):
+        """
+        Returns the deadline of a call starting now, see ``current_deadline``.
+        """
+        return current_deadline(self.timeout, enclosing)
+
+    def delay(self, attempt):
+        """
+        Returns the delay before sending a call again after attempt failed.
+        """
+        delay = min(self.max_backoff, self.backoff * self.multiplier ** (attempt - 1))
+        return delay * (1 - self.jitter * random.random())
+
+    def is_transient(self, err, method, args, sent=True):
+        """
+        Returns True if a call failing with err may succeed if sent again.
+
+        :param err: ``FreeIPAError``, or error of the transport
+        :type err: Exception
+        :param sent: False if the request could not be sent
+        :type sent: bool
+        """
+        if not sent:
+            return True
+        if isinstance(err, FreeIPAError) and (
+            isinstance(err, DeadlineExceeded) or err.code not in self.transient_codes
+        ):
+            return False
+        return self.is_replayable(method, args if isinstance(args, list) else None)
+
+    def retry_delay(self, err, method, args, attempt, until=None, sent=True):
+        """
+        Returns the delay before sending a call again after attempt failed with
+        err, None if it must not be retried.
+
+        :param err: ``FreeIPAError``, or error of the transport
+        :type err: Exception
+        :param until: ``time.monotonic()`` deadline of the call
+        :type until: float or None
+        :param sent: False if the request could not be sent
+        :type sent: bool
+        """
+        if attempt >= self.max_attempts or not self.is_transient(
+            err, method, args, sent
+        ):
+            return None
+        if self.budget is not None and not self.budget.record_failure():
+            return None
+        delay = self.delay(attempt)
+        if until is not None and time.monotonic() + delay >= until:
+            return None
+        return delay
+
+    def record_success(self):
+        if self.budget is not None:
+            self.budget.record_success()
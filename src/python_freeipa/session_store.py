@@ -0,0 +1,143 @@
+"""Stores of FreeIPA session cookies, to reuse sessions across clients."""
+
+import json
+import os
+import tempfile
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows, file stores are then only locked per process.
+    fcntl = None
+
+# Default lifetime of a session, matching the default ``session_auth_duration``
+# of FreeIPA, used when the server does not send the expiry of the cookie.
+DEFAULT_SESSION_TTL = 20 * 60
+
+
+class SessionStore(object):
+    """
+    Base class of session stores.
+
+    Sessions are keyed by host and principal, and are only returned until they
+    expire.
+    """
+
+    def __init__(self, ttl=DEFAULT_SESSION_TTL):
+        """
+        :param ttl: lifetime in seconds of sessions whose expiry is unknown
+        :type ttl: int
+        """
+        self._ttl = ttl
+
+    @staticmethod
+    def _key(host, principal):
+        return '{0} {1}'.format(host, principal)
+
+    def get(self, host, principal):
+        """
+        Returns the saved session cookie of principal on host, None if there is no
+        valid one.
+        """
+        entry = self._load().get(self._key(host, principal))
+        if entry is None or entry['expires'] <= time.time():
+            return None
+        return entry['value']
+
+    def set(self, host, principal, value, expires=None):
+        """
+        Saves the session cookie of principal on host.
+
+        :param expires: expiry of the session as a POSIX timestamp, None to use
+                        the lifetime of the store
+        :type expires: int or None
+        """
+        if expires is None:
+            expires = time.time() + self._ttl
+        key = self._key(host, principal)
+
+        def update(entries):
+            entries[key] = {'value': value, 'expires': expires}
+
+        self._update(update)
+
+    def delete(self, host, principal):
+        """
+        Forgets the session of principal on host, if any.
+        """
+        key = self._key(host, principal)
+        self._update(lambda entries: entries.pop(key, None))
+
+    def _load(self):
+        raise NotImplementedError
+
+    def _update(self, function):
+        raise NotImplementedError
+
+
+class MemorySessionStore(SessionStore):
+    """
+    Session store kept in memory, to share sessions between the clients of a process.
+    """
+
+    def __init__(self, ttl=DEFAULT_SESSION_TTL):
+        super(MemorySessionStore, self).__init__(ttl=ttl)
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _load(self):
+        return self._entries
+
+    def _update(self, function):
+        with self._lock:
+            function(self._entries)
+
+
+class FileSessionStore(SessionStore):
+    """
+    Session store kept in a JSON file, to share sessions between processes.
+
+    The file is only readable by its owner, since it holds credentials, and is
+    replaced atomically on every update.
+    """
+
+    def __init__(self, path, ttl=DEFAULT_SESSION_TTL):
+        """
+        :param path: path of the JSON file
+        :type path: str
+        :param ttl: lifetime in seconds of sessions whose expiry is unknown
+        :type ttl: int
+        """
+        super(FileSessionStore, self).__init__(ttl=ttl)
+        self._path = path
+        self._lock = threading.Lock()
+
+    def _load(self):
+        try:
+            with open(self._path) as store_file:
+                return json.load(store_file)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def _update(self, function):
+        with self._lock, open(self._path + '.lock', 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            now = time.time()
+            entries = {
+                key: entry
+                for key, entry in self._load().items()
+                if entry['expires'] > now
+            }
+            function(entries)
+            directory = os.path.dirname(os.path.abspath(self._path))
+            fd, temp_path = tempfile.mkstemp(dir=directory)
+            try:
+                with os.fdopen(fd, 'w') as store_file:
+                    json.dump(entries, store_file)
+                os.replace(temp_path, self._path)
+            except Exception:
+                os.unlink(temp_path)
+                raise
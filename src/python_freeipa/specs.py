@@ -0,0 +1,140 @@
+"""Specifications of FreeIPA commands, used to marshal their parameters."""
+
+
+class CommandSpec(object):
+    """
+    Names and requirements of the arguments and options of a command.
+
+    Calls take the arguments positionally or as ``a_<name>`` keywords, and the
+    options as ``o_<name>`` keywords, as the methods of ``ClientMeta`` do. Other
+    keywords are sent as options unchanged.
+    """
+
+    __slots__ = ('name', 'doc', 'args', 'options', 'required', '_arg_keys')
+
+    def __init__(self, name, args=(), options=(), required=(), doc=None):
+        """
+        :param name: name of the command
+        :type name: str
+        :param args: names of the positional arguments, in order
+        :type args: list of str
+        :param options: names of the options
+        :type options: list of str
+        :param required: names of the required arguments and options
+        :type required: list of str
+        :param doc: documentation of the command
+        :type doc: str or None
+        """
+        self.name = name
+        self.doc = doc
+        self.args = tuple(args)
+        self.options = frozenset(options)
+        self.required = frozenset(required)
+        self._arg_keys = tuple('a_' + arg for arg in self.args)
+
+    @classmethod
+    def from_metadata(cls, name, metadata):
+        """
+        Returns the spec of a command from its ``json_metadata`` description.
+        """
+        args, options, required = [], [], []
+        for params, names in (
+            (metadata.get('takes_args', ()), args),
+            (metadata.get('takes_options', ()), options),
+        ):
+            for param in params:
+                # Parameters of some old plugins are only described by name.
+                if not isinstance(param, dict):
+                    param = {'name': str(param).rstrip('?*+'), 'required': False}
+                if param['name'] == 'version':
+                    continue
+                names.append(param['name'])
+                if param.get('required') and 'default' not in param:
+                    required.append(param['name'])
+        return cls(name, args, options, required, doc=metadata.get('doc'))
+
+    @classmethod
+    def from_schema(cls, command):
+        """
+        Returns the spec of a command from its description in the result of the
+        ``schema`` command, whose parameters are positional arguments or options.
+        """
+        args, options, required = [], [], []
+        for param in command.get('params', ()):
+            if param['name'] == 'version':
+                continue
+            names = args if param.get('positional') else options
+            names.append(param['name'])
+            if param.get('required') and 'default' not in param:
+                required.append(param['name'])
+        name = command['name'].split('/')[0]
+        return cls(name, args, options, required, doc=command.get('doc'))
+
+    def to_dict(self):
+        return {
+            'args': list(self.args),
+            'options': sorted(self.options),
+            'required': sorted(self.required),
+            'doc': self.doc,
+        }
+
+    @classmethod
+    def from_dict(cls, name, value):
+        return cls(
+            name, value['args'], value['options'], value['required'], value['doc']
+        )
+
+    def marshal(self, args, kwargs):
+        """
+        Returns the JSON RPC arguments and options of a call.
+
+        Options set to None are not sent, and ``all`` defaults to True.
+
+        :param args: positional arguments of the call
+        :type args: tuple
+        :param kwargs: keyword arguments of the call
+        :type kwargs: dict
+        :rtype: tuple of list and dict
+        :raises TypeError: if a required argument or option is missing, or an
+                           argument is given twice
+        """
+        if len(args) > len(self.args):
+            raise TypeError(
+                '{0}() takes at most {1} positional arguments ({2} given)'.format(
+                    self.name, len(self.args), len(args)
+                )
+            )
+        _args = list(args)
+        _params = {'all': True} if 'all' in self.options else {}
+        for key, value in kwargs.items():
+            if key.startswith('o_') and key[2:] in self.options:
+                if value is not None:
+                    _params[key[2:]] = value
+            elif key.startswith('a_') and key in self._arg_keys:
+                continue
+            else:
+                _params[key] = value
+
+        for index in range(len(args), len(self.args)):
+            key = self._arg_keys[index]
+            if key in kwargs:
+                _args.append(kwargs[key])
+            elif self.args[index] in self.required:
+                raise TypeError(
+                    "{0}() missing required argument '{1}'".format(self.name, key)
+                )
+            else:
+                _args.append(None)
+        for key in self._arg_keys[: len(args)]:
+            if key in kwargs:
+                raise TypeError(
+                    "{0}() got multiple values for argument '{1}'".format(
+                        self.name, key
+                    )
+                )
+        for option in self.required.intersection(self.options):
+            if _params.get(option) is None:
+                raise TypeError(
+                    "{0}() missing required option 'o_{1}'".format(self.name, option)
+                )
+        return _args, _params
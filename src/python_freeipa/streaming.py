@@ -0,0 +1,188 @@
+"""Incremental parsing of FreeIPA JSON RPC responses."""
+
+import codecs
+import json
+
+from python_freeipa.exceptions import FreeIPAError, parse_error
+
+_WHITESPACE = ' \t\n\r'
+
+# Parser states.
+_TOP_START = 'top_start'
+_TOP_KEY = 'top_key'
+_TOP_VALUE = 'top_value'
+_TOP_NEXT = 'top_next'
+_RESULT_KEY = 'result_key'
+_RESULT_VALUE = 'result_value'
+_RESULT_NEXT = 'result_next'
+_ENTRY = 'entry'
+_ENTRY_NEXT = 'entry_next'
+_DONE = 'done'
+
+
+class ResultStreamParser(object):
+    """
+    Push parser yielding the entries of ``result['result']`` of a response.
+
+    The body is fed in chunks of bytes. Only one entry at a time is decoded into
+    Python objects, the other members of the response (``count``, ``summary``,
+    ``truncated``, ...) are collected in ``meta``. A ``result['result']`` that is
+    not a list, e.g. the entry returned by a ``*_show`` command, is yielded as a
+    single entry. A non-null ``error`` is raised through ``parse_error``.
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._pos = 0
+        self._state = _TOP_START
+        self._key = None
+        self.meta = {}
+
+    def feed(self, chunk):
+        """
+        Parse a chunk of the body.
+
+        :param chunk: next bytes of the body
+        :type chunk: bytes
+        :return: the entries completed by this chunk
+        :rtype: list
+        """
+        self._buffer = self._buffer[self._pos :] + self._text_decoder.decode(chunk)
+        self._pos = 0
+        return self._parse(final=False)
+
+    def close(self):
+        """
+        Parse the end of the body.
+
+        :return: the remaining entries
+        :rtype: list
+        :raises FreeIPAError: if the body is incomplete
+        """
+        self._buffer = self._buffer[self._pos :] + self._text_decoder.decode(
+            b'', final=True
+        )
+        self._pos = 0
+        entries = self._parse(final=True)
+        if self._state != _DONE:
+            raise FreeIPAError('Incomplete JSON RPC response')
+        return entries
+
+    def _skip_whitespace(self):
+        buffer, pos = self._buffer, self._pos
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return buffer[pos] if pos < len(buffer) else None
+
+    def _expect(self, char):
+        if self._buffer[self._pos] != char:
+            raise FreeIPAError(
+                'Malformed JSON RPC response: expected {0!r} at {1!r}'.format(
+                    char, self._buffer[self._pos : self._pos + 20]
+                )
+            )
+        self._pos += 1
+
+    def _value(self, final):
+        """
+        Decode the value at the current position, None if it is incomplete.
+        """
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except ValueError:
+            if final:
+                raise FreeIPAError('Malformed JSON RPC response')
+            return None
+        # A number at the end of the buffer may continue in the next chunk.
+        if end == len(self._buffer) and not final:
+            return None
+        self._pos = end
+        return (value,)
+
+    def _key_value(self, final):
+        """
+        Decode the ``"key":`` at the current position, None if it is incomplete.
+        """
+        start = self._pos
+        decoded = self._value(final)
+        if decoded is None:
+            return None
+        if self._skip_whitespace() is None:
+            self._pos = start
+            return None
+        self._expect(':')
+        return decoded[0]
+
+    def _parse(self, final):
+        entries = []
+        while self._state != _DONE:
+            char = self._skip_whitespace()
+            if char is None:
+                break
+            state = self._state
+
+            if state == _TOP_START:
+                self._expect('{')
+                self._state = _TOP_KEY
+            elif state in (_TOP_KEY, _RESULT_KEY):
+                if char == '}':
+                    self._pos += 1
+                    self._state = _DONE if state == _TOP_KEY else _TOP_NEXT
+                    continue
+                key = self._key_value(final)
+                if key is None:
+                    break
+                self._key = key
+                self._state = _TOP_VALUE if state == _TOP_KEY else _RESULT_VALUE
+            elif state == _TOP_VALUE:
+                if self._key == 'result' and char == '{':
+                    self._pos += 1
+                    self._state = _RESULT_KEY
+                    continue
+                decoded = self._value(final)
+                if decoded is None:
+                    break
+                if self._key == 'error' and decoded[0]:
+                    parse_error(decoded[0])
+                self._state = _TOP_NEXT
+            elif state == _RESULT_VALUE:
+                if self._key == 'result' and char == '[':
+                    self._pos += 1
+                    self._state = _ENTRY
+                    continue
+                decoded = self._value(final)
+                if decoded is None:
+                    break
+                if self._key == 'result':
+                    entries.append(decoded[0])
+                else:
+                    self.meta[self._key] = decoded[0]
+                self._state = _RESULT_NEXT
+            elif state == _ENTRY:
+                if char == ']':
+                    self._pos += 1
+                    self._state = _RESULT_NEXT
+                    continue
+                decoded = self._value(final)
+                if decoded is None:
+                    break
+                entries.append(decoded[0])
+                self._state = _ENTRY_NEXT
+            elif state == _ENTRY_NEXT:
+                if char == ',':
+                    self._pos += 1
+                    self._state = _ENTRY
+                else:
+                    self._expect(']')
+                    self._state = _RESULT_NEXT
+            elif state in (_TOP_NEXT, _RESULT_NEXT):
+                if char == ',':
+                    self._pos += 1
+                    self._state = _TOP_KEY if state == _TOP_NEXT else _RESULT_KEY
+                else:
+                    self._expect('}')
+                    self._state = _DONE if state == _TOP_NEXT else _TOP_NEXT
+        return entries
@@ -0,0 +1,731 @@
+"""In-memory stand-in for a FreeIPA server, to test and benchmark clients offline."""
+
+import collections
+import http.client
+import itertools
+import json
+import random
+import threading
+import time
+import urllib.parse
+import uuid
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from python_freeipa.exceptions import BadRequest, error_codes
+from python_freeipa.projection import DEFAULT_ATTRIBUTES, MEMBER_PREFIXES
+
+API_VERSION = '2.235'
+
+# Primary key attribute and attributes matched by the criteria of ``*_find``, by
+# object type. DNS records are also keyed by the name of their zone.
+OBJECTS = {
+    'user': ('uid', ('uid', 'givenname', 'sn', 'cn', 'mail')),
+    'group': ('cn', ('cn', 'description')),
+    'host': ('fqdn', ('fqdn', 'description')),
+    'dnszone': ('idnsname', ('idnsname',)),
+    'dnsrecord': ('idnsname', ('idnsname',)),
+}
+
+LABELS = {
+    'user': 'user',
+    'group': 'group',
+    'host': 'host',
+    'dnszone': 'DNS zone',
+    'dnsrecord': 'DNS resource record',
+}
+
+# Options changing the output of commands rather than describing entries.
+CONTROL_OPTIONS = frozenset(
+    [
+        'all',
+        'raw',
+        'version',
+        'rights',
+        'no_members',
+        'pkey_only',
+        'sizelimit',
+        'timelimit',
+        'continue',
+        'setattr',
+        'addattr',
+        'delattr',
+        'userpassword',
+        'random',
+        'force',
+    ]
+)
+
+USER_OBJECT_CLASSES = (
+    'top',
+    'person',
+    'organizationalperson',
+    'inetorgperson',
+    'inetuser',
+    'posixaccount',
+    'krbprincipalaux',
+    'krbticketpolicyaux',
+    'ipaobject',
+    'ipasshuser',
+    'ipaSshGroupOfPubKeys',
+    'mepOriginEntry',
+)
+
+# Boolean options are flags of the commands, except for these attributes.
+BOOLEAN_ATTRIBUTES = frozenset(['nsaccountlock'])
+
+# Faults of the transport rather than of a command.
+TRANSPORT_FAULTS = ('reset', 'connect_timeout')
+
+
+class CommandError(Exception):
+    """Error of a command, returned in the ``error`` of its JSON RPC response."""
+
+    def __init__(self, code, message, name=None):
+        super(CommandError, self).__init__(message)
+        self.code = code
+        self.message = message
+        self.name = name or error_codes.get(code, BadRequest).__name__
+
+    def to_dict(self):
+        return {'code': self.code, 'message': self.message, 'name': self.name}
+
+
+def _is_attribute(name, value):
+    """
+    Returns True if the option name describes an attribute of entries.
+    """
+    if name in CONTROL_OPTIONS:
+        return False
+    return name in BOOLEAN_ATTRIBUTES or not isinstance(value, bool)
+
+
+def _values(value):
+    if isinstance(value, (list, tuple)):
+        return [str(item) for item in value]
+    return [str(value)]
+
+
+class _OriginalResponse(object):
+    """
+    Headers of a response, where ``requests`` looks for the cookies it sets.
+    """
+
+    def __init__(self, headers):
+        self.msg = http.client.HTTPMessage()
+        for name, value in headers.items():
+            self.msg[name] = value
+
+    def info(self):
+        return self.msg
+
+
+class _Raw(object):
+    def __init__(self, headers):
+        self._original_response = _OriginalResponse(headers)
+
+    def release_conn(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakeIPA(object):
+    """
+    In-memory FreeIPA server, plugged into clients in place of their transport.
+
+    It serves ``/ipa/session/login_password`` and ``/ipa/session/json`` on any
+    host, with the ``ping``, ``batch``, ``user_*``, ``group_*``, ``host_*``,
+    ``dnszone_*`` and ``dnsrecord_*`` commands, keeping all the hosts in sync.
+    Responses can be delayed, and faults injected, to exercise pooling, retries,
+    batching and failover without a real server::
+
+        server = FakeIPA(latency=0.005)
+        client = ClientMeta('ipa.example.test')
+        server.install(client)
+        client.login('admin', 'Secret123')
+        server.inject(4001, method='user_show')
+        server.inject('reset', host='ipa.example.test', count=None)
+
+    ``*_find`` results are truncated to ``sizelimit`` entries, or to
+    ``search_limit`` when it is not given, as the search records limit of a
+    real server does. ``sizelimit=0`` lifts that limit, but not ``hard_limit``,
+    the size limit of the directory server. Without ``all``, entries only have
+    the attributes of ``python_freeipa.projection.DEFAULT_ATTRIBUTES``, and
+    without their memberships with ``no_members``.
+    """
+
+    def __init__(
+        self,
+        latency=0.0,
+        search_limit=100,
+        hard_limit=None,
+        admin_password='Secret123',
+        require_login=True,
+        realm='EXAMPLE.TEST',
+    ):
+        """
+        :param latency: seconds each response is delayed by, or the bounds of a
+                        random delay
+        :type latency: float or tuple of two floats
+        :param search_limit: number of ``*_find`` entries returned when
+                             ``sizelimit`` is not given
+        :type search_limit: int
+        :param hard_limit: maximum number of ``*_find`` entries ever returned
+        :type hard_limit: int or None
+        :param admin_password: password of the ``admin`` user
+        :type admin_password: str
+        :param require_login: if False, JSON RPC requests are served without a
+                              session
+        :type require_login: bool
+        :param realm: Kerberos realm of the principals of new entries
+        :type realm: str
+        """
+        self.latency = latency
+        self.search_limit = search_limit
+        self.hard_limit = hard_limit
+        self.require_login = require_login
+        self.realm = realm
+        self.calls = collections.Counter()
+        self.requests = collections.Counter()
+        self._lock = threading.RLock()
+        self._entries = {obj: {} for obj in OBJECTS}
+        self._passwords = {}
+        self._sessions = set()
+        self._faults = []
+        self._ids = itertools.count(1000)
+        self._call({'method': 'group_add', 'params': [['admins'], {}]})
+        self._call({'method': 'group_add', 'params': [['ipausers'], {}]})
+        self.add_user('admin', admin_password, sn='Administrator', cn='Administrator')
+        self._call(
+            {'method': 'group_add_member', 'params': [['admins'], {'user': 'admin'}]}
+        )
+
+    def install(self, client):
+        """
+        Sends all the HTTPS requests of client to this server.
+
+        :param client: client to plug in, ``Client`` or a subclass
+        """
+        client._session.mount('https://', FakeIPAAdapter(self))
+
+    def add_user(self, uid, password=None, **attributes):
+        """
+        Adds a user directly, without going through a client.
+        """
+        attributes.setdefault('givenname', uid)
+        attributes.setdefault('sn', uid)
+        if password is not None:
+            attributes['userpassword'] = password
+        return self._call({'method': 'user_add', 'params': [[uid], attributes]})
+
+    def add_users(self, count, prefix='user'):
+        """
+        Adds count users named ``<prefix><number>``, to fill the server.
+        """
+        for number in range(count):
+            self.add_user('{0}{1}'.format(prefix, number))
+
+    def inject(self, fault, method=None, host=None, count=1, rate=1.0):
+        """
+        Makes requests fail.
+
+        :param fault: HTTP status code such as 401 or 503, JSON RPC error code
+                      such as 4001 or 4002, ``'reset'`` for a connection reset
+                      after the request was sent, or ``'connect_timeout'`` for a
+                      request that could not be sent
+        :type fault: int or str
+        :param method: command affected, all by default. Error codes also apply
+                       to the calls of a ``batch``, and ``login_password``
+                       matches password logins.
+        :type method: str or None
+        :param host: host affected, all by default
+        :type host: str or None
+        :param count: number of requests to fail, None for all
+        :type count: int or None
+        :param rate: probability that a matching request fails
+        :type rate: float
+        """
+        if not isinstance(fault, int) and fault not in TRANSPORT_FAULTS:
+            raise ValueError('unknown fault {0!r}'.format(fault))
+        with self._lock:
+            self._faults.append(
+                {
+                    'fault': fault,
+                    'method': method,
+                    'host': host,
+                    'count': count,
+                    'rate': rate,
+                }
+            )
+
+    def clear_faults(self):
+        with self._lock:
+            del self._faults[:]
+
+    def expire_sessions(self):
+        """
+        Invalidates all the sessions, so that clients have to log in again.
+        """
+        with self._lock:
+            self._sessions.clear()
+
+    def handle(self, host, path, headers, body):
+        """
+        Serves an HTTP request.
+
+        :return: status code, headers and body of the response
+        :rtype: tuple of int, dict and bytes
+        :raises requests.exceptions.ConnectionError: on injected resets
+        """
+        self._delay()
+        if path == '/ipa/session/login_password':
+            method, call = 'login_password', None
+        elif path == '/ipa/session/json':
+            call = json.loads(body)
+            method = call.get('method')
+        else:
+            return 404, {}, b'Not Found'
+
+        with self._lock:
+            self.requests[host] += 1
+            fault = self._fault(method, host, transport=True)
+            if fault == 'reset':
+                raise requests.exceptions.ConnectionError(
+                    'Connection reset by peer (injected)'
+                )
+            elif fault == 'connect_timeout':
+                raise requests.exceptions.ConnectTimeout(
+                    'Connection to {0} timed out (injected)'.format(host)
+                )
+            elif fault is not None:
+                if fault == 401:
+                    return 401, {}, b'Unauthorized'
+                return fault, {}, http.client.responses.get(fault, '').encode()
+
+            if call is None:
+                return self._login(body)
+            if self.require_login and self._session(headers) not in self._sessions:
+                return 401, {}, b'Unauthorized'
+            self.calls[method] += 1
+            response = {'error': None, 'id': call.get('id'), 'principal': None}
+            try:
+                response['result'] = self._call(call)
+            except CommandError as err:
+                response['result'] = None
+                response['error'] = err.to_dict()
+        return 200, {'Content-Type': 'application/json'}, json.dumps(response).encode()
+
+    def _delay(self):
+        latency = self.latency
+        if isinstance(latency, (tuple, list)):
+            latency = random.uniform(*latency)
+        if latency:
+            time.sleep(latency)
+
+    def _fault(self, method, host, transport):
+        """
+        Returns the fault injected into a request, None if it must succeed.
+
+        :param transport: if True, returns HTTP and transport faults, otherwise
+                          JSON RPC error codes
+        """
+        for fault in self._faults:
+            is_error_code = isinstance(fault['fault'], int) and fault['fault'] >= 1000
+            if (
+                is_error_code == transport
+                or fault['method'] not in (None, method)
+                or fault['host'] not in (None, host)
+                or fault['count'] == 0
+                or random.random() >= fault['rate']
+            ):
+                continue
+            if fault['count'] is not None:
+                fault['count'] -= 1
+            return fault['fault']
+        return None
+
+    @staticmethod
+    def _session(headers):
+        cookie = headers.get('Cookie') or ''
+        for part in cookie.split(';'):
+            name, _, value = part.strip().partition('=')
+            if name == 'ipa_session':
+                return value
+        return None
+
+    def _login(self, body):
+        form = urllib.parse.parse_qs(body.decode())
+        user = form.get('user', [''])[0]
+        password = form.get('password', [''])[0]
+        entry = self._entries['user'].get((user.lower(),))
+        if entry is None or self._passwords.get(user.lower()) != password:
+            reason = 'invalid-password'
+        elif entry['nsaccountlock'] == ['True']:
+            reason = 'user-locked'
+        else:
+            session = 'MagBearerToken={0}'.format(uuid.uuid4().hex)
+            self._sessions.add(session)
+            cookie = 'ipa_session={0}; path=/ipa; httponly; secure'.format(session)
+            return 200, {'Set-Cookie': cookie}, b''
+        return 401, {'X-IPA-Rejection-Reason': reason}, b'Unauthorized'
+
+    def _call(self, call):
+        """
+        Runs a JSON RPC call, returns its result or raises its ``CommandError``.
+        """
+        method = call['method']
+        params = call.get('params') or [[], {}]
+        args, options = (list(params) + [[], {}])[:2]
+        if not isinstance(args, list):
+            args = [args]
+        with self._lock:
+            fault = self._fault(method, None, transport=False)
+            if fault is not None:
+                raise CommandError(fault, 'Injected error of {0}'.format(method))
+            if method == 'batch':
+                return self._batch(args)
+            elif method == 'ping':
+                return {
+                    'summary': 'IPA server version 4.9.0. API version {0}'.format(
+                        API_VERSION
+                    )
+                }
+            obj, _, action = method.partition('_')
+            handler = getattr(self, '_{0}'.format(action), None)
+            if obj not in OBJECTS or handler is None:
+                raise CommandError(905, 'unknown command {0!r}'.format(method))
+            return handler(obj, args, options)
+
+    def _batch(self, calls):
+        results = []
+        for call in calls:
+            self.calls[call['method']] += 1
+            try:
+                result = dict(self._call(call))
+                result['error'] = None
+            except CommandError as err:
+                result = {
+                    'error': err.message,
+                    'error_code': err.code,
+                    'error_name': err.name,
+                    'error_kw': {},
+                }
+            results.append(result)
+        return {'count': len(results), 'results': results}
+
+    def _key(self, obj, args, value=None):
+        """
+        Returns the key of an entry, and the parent keys in its arguments.
+        """
+        parents = [str(arg).lower() for arg in args[:-1]] if obj == 'dnsrecord' else []
+        if obj == 'dnsrecord' and not parents:
+            raise CommandError(3007, "'dnszoneidnsname' is required")
+        if obj == 'dnsrecord' and (parents[0],) not in self._entries['dnszone']:
+            raise CommandError(
+                4001, '{0}: DNS zone not found'.format(args[0]), 'NotFound'
+            )
+        if value is None:
+            value = args[-1]
+        return tuple(parents + [str(value).lower()])
+
+    def _get(self, obj, key):
+        entry = self._entries[obj].get(key)
+        if entry is None:
+            raise CommandError(4001, '{0}: {1} not found'.format(key[-1], LABELS[obj]))
+        return entry
+
+    def _output(self, obj, entry, options):
+        pkey = OBJECTS[obj][0]
+        if options.get('pkey_only'):
+            return {pkey: list(entry[pkey])}
+        output = {}
+        defaults = None
+        if not options.get('all') and not options.get('raw'):
+            defaults = DEFAULT_ATTRIBUTES[obj] | {pkey}
+        for attribute, values in entry.items():
+            if attribute.startswith(MEMBER_PREFIXES):
+                if options.get('no_members'):
+                    continue
+            elif defaults is not None and attribute not in defaults:
+                continue
+            output[attribute] = list(values)
+        if 'nsaccountlock' in output:
+            output['nsaccountlock'] = output['nsaccountlock'] == ['True']
+        return output
+
+    def _defaults(self, obj, key, options):
+        pkey = OBJECTS[obj][0]
+        entry = {pkey: [key[-1]]}
+        if obj == 'user':
+            uid = key[-1]
+            entry['cn'] = [
+                '{0} {1}'.format(options.get('givenname'), options.get('sn'))
+            ]
+            entry['uidnumber'] = entry['gidnumber'] = [str(next(self._ids))]
+            entry['homedirectory'] = ['/home/{0}'.format(uid)]
+            entry['krbprincipalname'] = ['{0}@{1}'.format(uid, self.realm)]
+            entry['nsaccountlock'] = ['False']
+            entry['objectclass'] = list(USER_OBJECT_CLASSES)
+            entry['ipauniqueid'] = [str(uuid.uuid4())]
+        elif obj == 'group' and not options.get('nonposix'):
+            entry['gidnumber'] = [str(next(self._ids))]
+        elif obj == 'host':
+            entry['krbprincipalname'] = ['host/{0}@{1}'.format(key[-1], self.realm)]
+        return entry
+
+    def _apply(self, entry, options):
+        """
+        Applies the attributes of options to entry, returns True if it changed.
+        """
+        before = {attribute: list(values) for attribute, values in entry.items()}
+        for attribute, value in options.items():
+            if not _is_attribute(attribute, value):
+                continue
+            if value is None or value == '' or value == []:
+                entry.pop(attribute, None)
+            else:
+                entry[attribute] = _values(value)
+        for option in ('setattr', 'addattr', 'delattr'):
+            for item in _values(options.get(option) or []):
+                attribute, _, value = item.partition('=')
+                attribute = attribute.lower()
+                values = entry.setdefault(attribute, [])
+                if option == 'setattr':
+                    values[:] = [value] if value else []
+                elif option == 'addattr':
+                    values.append(value)
+                elif value in values:
+                    values.remove(value)
+                if not values:
+                    del entry[attribute]
+        return entry != before
+
+    def _add(self, obj, args, options):
+        key = self._key(obj, args)
+        entries = self._entries[obj]
+        if key in entries:
+            if obj != 'dnsrecord':
+                raise CommandError(
+                    4002,
+                    '{0} with name "{1}" already exists'.format(LABELS[obj], key[-1]),
+                )
+            entry = entries[key]
+            for attribute, value in options.items():
+                if _is_attribute(attribute, value) and value is not None:
+                    entry.setdefault(attribute, []).extend(_values(value))
+        else:
+            entry = entries[key] = self._defaults(obj, key, options)
+            self._apply(entry, options)
+        if obj == 'user':
+            if options.get('userpassword') is not None:
+                self._passwords[key[-1]] = str(options['userpassword'])
+            self._add_member('group', ['ipausers'], {'user': key[-1]})
+        return {
+            'result': self._output(obj, entry, options),
+            'value': key[-1],
+            'summary': 'Added {0} "{1}"'.format(LABELS[obj], key[-1]),
+        }
+
+    def _show(self, obj, args, options):
+        key = self._key(obj, args)
+        return {
+            'result': self._output(obj, self._get(obj, key), options),
+            'value': key[-1],
+            'summary': None,
+        }
+
+    def _find(self, obj, args, options):
+        criteria = None
+        if obj == 'dnsrecord':
+            parents = self._key(obj, args[:1] + [''])[:-1]
+            criteria = args[1] if len(args) > 1 else None
+        else:
+            parents = ()
+            criteria = args[0] if args else None
+        pkey, searched = OBJECTS[obj]
+        filters = [
+            (attribute, [value.lower() for value in _values(value)])
+            for attribute, value in options.items()
+            if _is_attribute(attribute, value) and value is not None
+        ]
+        found = []
+        for key in sorted(self._entries[obj]):
+            if tuple(key[:-1]) != tuple(parents):
+                continue
+            entry = self._entries[obj][key]
+            if criteria and not any(
+                str(criteria).lower() in value.lower()
+                for attribute in searched
+                for value in entry.get(attribute, ())
+            ):
+                continue
+            if any(
+                not set(wanted).intersection(
+                    value.lower() for value in entry.get(attribute, ())
+                )
+                for attribute, wanted in filters
+            ):
+                continue
+            found.append(entry)
+
+        limit = options.get('sizelimit')
+        if limit is None:
+            limit = self.search_limit
+        if self.hard_limit is not None and (not limit or limit > self.hard_limit):
+            limit = self.hard_limit
+        truncated = bool(limit) and len(found) > limit
+        if truncated:
+            found = found[:limit]
+        return {
+            'count': len(found),
+            'result': [self._output(obj, entry, options) for entry in found],
+            'summary': '{0} {1}{2} matched'.format(
+                len(found), LABELS[obj], '' if len(found) == 1 else 's'
+            ),
+            'truncated': truncated,
+        }
+
+    def _mod(self, obj, args, options):
+        key = self._key(obj, args)
+        entry = self._get(obj, key)
+        if not self._apply(entry, options):
+            raise CommandError(4202, 'no modifications to be performed')
+        return {
+            'result': self._output(obj, entry, options),
+            'value': key[-1],
+            'summary': 'Modified {0} "{1}"'.format(LABELS[obj], key[-1]),
+        }
+
+    def _del(self, obj, args, options):
+        keys = [self._key(obj, args, value) for value in _values(args[-1])]
+        entries = self._entries[obj]
+        failed = [key[-1] for key in keys if key not in entries]
+        if not options.get('continue'):
+            for key in keys:
+                self._get(obj, key)
+        for key in keys:
+            if entries.pop(key, None) is None:
+                continue
+            if obj == 'dnszone':
+                for record in list(self._entries['dnsrecord']):
+                    if record[0] == key[-1]:
+                        del self._entries['dnsrecord'][record]
+            for other in itertools.chain.from_iterable(
+                entries.values() for entries in self._entries.values()
+            ):
+                for attribute in ('member_' + obj, 'memberof_' + obj):
+                    if key[-1] in other.get(attribute, ()):
+                        other[attribute].remove(key[-1])
+                        if not other[attribute]:
+                            del other[attribute]
+        return {
+            'result': {'failed': failed},
+            'value': [key[-1] for key in keys],
+            'summary': 'Deleted {0} "{1}"'.format(
+                LABELS[obj], ','.join(key[-1] for key in keys)
+            ),
+        }
+
+    def _add_member(self, obj, args, options, remove=False):
+        if obj != 'group':
+            raise CommandError(905, 'unknown command {0!r}'.format(obj + '_add_member'))
+        key = self._key(obj, args)
+        group = self._get(obj, key)
+        completed = 0
+        failed = {'member': {'user': [], 'group': []}}
+        for member_type in ('user', 'group'):
+            for name in _values(options.get(member_type) or []):
+                name = name.lower()
+                member = self._entries[member_type].get((name,))
+                members = group.setdefault('member_' + member_type, [])
+                if member is None:
+                    failed['member'][member_type].append([name, 'no such entry'])
+                elif remove and name not in members:
+                    failed['member'][member_type].append(
+                        [name, 'This entry is not a member']
+                    )
+                elif not remove and name in members:
+                    failed['member'][member_type].append(
+                        [name, 'This entry is already a member']
+                    )
+                else:
+                    memberof = member.setdefault('memberof_group', [])
+                    if remove:
+                        members.remove(name)
+                        memberof.remove(key[-1])
+                    else:
+                        members.append(name)
+                        memberof.append(key[-1])
+                    completed += 1
+                for entry, attribute in (
+                    (group, 'member_' + member_type),
+                    (member or {}, 'memberof_group'),
+                ):
+                    if attribute in entry and not entry[attribute]:
+                        del entry[attribute]
+        return {
+            'completed': completed,
+            'failed': failed,
+            'result': self._output(obj, group, options),
+        }
+
+    def _remove_member(self, obj, args, options):
+        return self._add_member(obj, args, options, remove=True)
+
+    def _disable(self, obj, args, options, enable=False):
+        if obj != 'user':
+            raise CommandError(905, 'unknown command {0!r}'.format(obj + '_disable'))
+        key = self._key(obj, args)
+        entry = self._get(obj, key)
+        if (entry['nsaccountlock'] == ['False']) == enable:
+            if enable:
+                raise CommandError(4009, 'This entry is already enabled')
+            raise CommandError(4010, 'This entry is already disabled')
+        entry['nsaccountlock'] = ['False' if enable else 'True']
+        return {
+            'result': True,
+            'value': key[-1],
+            'summary': '{0} user account "{1}"'.format(
+                'Enabled' if enable else 'Disabled', key[-1]
+            ),
+        }
+
+    def _enable(self, obj, args, options):
+        return self._disable(obj, args, options, enable=True)
+
+
+class FakeIPAAdapter(requests.adapters.BaseAdapter):
+    """
+    Transport adapter of ``requests`` sending requests to a ``FakeIPA``.
+    """
+
+    def __init__(self, server):
+        super(FakeIPAAdapter, self).__init__()
+        self.server = server
+
+    def send(self, request, stream=False, timeout=None, **kwargs):
+        url = urllib.parse.urlsplit(request.url)
+        body = request.body or b''
+        if isinstance(body, str):
+            body = body.encode()
+        status, headers, content = self.server.handle(
+            url.netloc, url.path, request.headers, body
+        )
+        response = requests.Response()
+        response.status_code = status
+        response.reason = http.client.responses.get(status, '')
+        response.headers = CaseInsensitiveDict(headers)
+        response.raw = _Raw(headers)
+        response._content = content
+        response._content_consumed = True
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        requests.cookies.extract_cookies_to_jar(response.cookies, request, response.raw)
+        return response
+
+    def close(self):
+        pass
@@ -1,9 +1,52 @@
+import asyncio
+import collections
+import datetime
+import http.cookies
+import importlib.util
 import json
+import os
+import pickle
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
 import unittest
+import unittest.mock
 
+import requests
 import responses
 
+import python_freeipa
+from python_freeipa import AsyncClientMeta
 from python_freeipa import ClientLegacy as Client
+from python_freeipa import ClientMeta
+from python_freeipa.cache import MISSING, ResultCache
+from python_freeipa.client_dynamic import ClientDynamic
+from python_freeipa.codec import JSONCodec, decode_wire, get_codec
+from python_freeipa.columns import Columns, to_columns
+from python_freeipa.commands import command_class
+from python_freeipa.discovery import SRV, DiscoveryCache
+from python_freeipa.exceptions import (
+    DeadlineExceeded,
+    DuplicateEntry,
+    FreeIPAError,
+    NotFound,
+    Unauthorized,
+    UserLocked,
+)
+from python_freeipa.fanout import AdaptiveConcurrency
+from python_freeipa.hooks import CallEvent, Hooks, OpenTelemetryHook
+from python_freeipa.hosts import HostPool
+from python_freeipa.metrics import Histogram, Metrics
+from python_freeipa.reconcile import Reconciler, reconcile
+from python_freeipa.records import record_class, to_records
+from python_freeipa.retry import RetryBudget, RetryPolicy, await_deadline, deadline
+from python_freeipa.session_store import FileSessionStore, MemorySessionStore
+from python_freeipa.streaming import ResultStreamParser
+from python_freeipa.testing import FakeIPA
+from python_freeipa.throttle import Limit, Throttle, TokenBucket
 
 
 class UsersTest(unittest.TestCase):
@@ -110,3 +153,1796 @@ class UsersTest(unittest.TestCase):
 
         self.assertEqual(1, len(responses.calls))
         self.assertEqual(json.loads(responses.calls[0].request.body), request_json)
+
+
+class BatchTest(unittest.TestCase):
+    def setUp(self):
+        self.client = ClientMeta('ipa.demo1.freeipa.org')
+        self.client._current_host = 'ipa.demo1.freeipa.org'
+        self.url = 'https://ipa.demo1.freeipa.org/ipa/session/json'
+
+    @responses.activate
+    def test_calls_are_coalesced(self):
+        response_json = {
+            'error': None,
+            'result': {
+                'count': 2,
+                'results': [
+                    {'error': None, 'result': {'uid': ['alice']}, 'value': 'alice'},
+                    {
+                        'error': 'bob: user not found',
+                        'error_code': 4001,
+                        'error_name': 'NotFound',
+                    },
+                ],
+            },
+        }
+        responses.add(responses.POST, self.url, json=response_json, status=200)
+
+        with self.client.batched() as batch:
+            alice = batch.user_show('alice')
+            bob = batch.user_show('bob')
+            self.assertFalse(alice.done())
+
+        self.assertEqual(1, len(responses.calls))
+        request = json.loads(responses.calls[0].request.body)
+        self.assertEqual(request['method'], 'batch')
+        self.assertEqual(
+            [call['method'] for call in request['params'][0]],
+            ['user_show', 'user_show'],
+        )
+        self.assertEqual(
+            alice.result(), {'result': {'uid': ['alice']}, 'value': 'alice'}
+        )
+        self.assertIsInstance(bob.exception(), NotFound)
+        self.assertRaises(NotFound, bob.result)
+
+    @responses.activate
+    def test_flush_on_max_size(self):
+        response_json = {
+            'error': None,
+            'result': {'count': 1, 'results': [{'error': None, 'result': True}]},
+        }
+        responses.add(responses.POST, self.url, json=response_json, status=200)
+
+        with self.client.batched(max_size=1) as batch:
+            batch.user_disable('alice')
+            batch.user_disable('bob')
+            self.assertEqual(2, len(responses.calls))
+        self.assertEqual(2, len(responses.calls))
+
+    @responses.activate
+    def test_missing_results(self):
+        response_json = {
+            'error': None,
+            'result': {'count': 1, 'results': [{'error': None, 'result': True}]},
+        }
+        responses.add(responses.POST, self.url, json=response_json, status=200)
+
+        with self.client.batched() as batch:
+            alice = batch.user_disable('alice')
+            bob = batch.user_disable('bob')
+
+        self.assertEqual(alice.result(), {'result': True})
+        self.assertTrue(bob.done())
+        self.assertIsInstance(bob.exception(), FreeIPAError)
+
+
+class FakeAsyncResponse(object):
+    def __init__(self, status, body, headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def text(self):
+        return self._body
+
+
+class FakeCookieJar(object):
+    def __init__(self):
+        self.cookies = http.cookies.SimpleCookie()
+
+    def __iter__(self):
+        return iter(self.cookies.values())
+
+    def update_cookies(self, cookies):
+        self.cookies.update(cookies)
+
+
+class FakeAsyncSession(object):
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+        self.cookie_jar = FakeCookieJar()
+
+    def post(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class AsyncClientTest(unittest.TestCase):
+    def run_async(self, coroutine):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coroutine)
+        finally:
+            loop.close()
+
+    def test_generated_methods_are_coroutines(self):
+        body = json.dumps({'error': None, 'result': {'result': {'uid': ['alice']}}})
+        session = FakeAsyncSession(FakeAsyncResponse(200, body))
+        client = AsyncClientMeta('ipa.demo1.freeipa.org', session=session)
+        client._current_host = 'ipa.demo1.freeipa.org'
+
+        result = self.run_async(client.user_show('alice'))
+
+        self.assertEqual(result, {'result': {'uid': ['alice']}})
+        url, kwargs = session.calls[0]
+        self.assertEqual(url, 'https://ipa.demo1.freeipa.org/ipa/session/json')
+        self.assertEqual(json.loads(kwargs['data'])['method'], 'user_show')
+
+    def test_errors_are_mapped(self):
+        body = json.dumps(
+            {
+                'error': {'code': 4001, 'message': 'alice: user not found'},
+                'result': None,
+            }
+        )
+        session = FakeAsyncSession(
+            FakeAsyncResponse(200, body),
+            FakeAsyncResponse(
+                401, 'denied', headers={'X-IPA-Rejection-Reason': 'user-locked'}
+            ),
+        )
+        client = AsyncClientMeta('ipa.demo1.freeipa.org', session=session)
+        client._current_host = 'ipa.demo1.freeipa.org'
+
+        self.assertRaises(NotFound, self.run_async, client.user_show('alice'))
+        self.assertRaises(
+            UserLocked, self.run_async, client.login('alice', 'Secret123')
+        )
+
+    def test_batched(self):
+        body = json.dumps(
+            {
+                'error': None,
+                'result': {
+                    'count': 2,
+                    'results': [
+                        {'error': None, 'result': {'uid': ['alice']}},
+                        {'error': 'bob: user not found', 'error_code': 4001},
+                    ],
+                },
+            }
+        )
+        session = FakeAsyncSession(FakeAsyncResponse(200, body))
+        client = AsyncClientMeta('ipa.demo1.freeipa.org', session=session)
+        client._current_host = 'ipa.demo1.freeipa.org'
+
+        async def run():
+            async with client.batched() as batch:
+                alice = batch.user_show('alice')
+                bob = batch.user_show('bob')
+                with self.assertRaises(FreeIPAError):
+                    alice.result()
+            return alice, bob
+
+        alice, bob = self.run_async(run())
+        self.assertEqual(alice.result(), {'result': {'uid': ['alice']}})
+        self.assertIsInstance(bob.exception(), NotFound)
+        calls = json.loads(session.calls[0][1]['data'])['params'][0]
+        self.assertEqual([call['method'] for call in calls], ['user_show', 'user_show'])
+        with self.assertRaises(TypeError):
+            with client.batched():
+                pass
+
+    def test_iter_find(self):
+        found = json.dumps(
+            {'error': None, 'result': {'result': [{'uid': ['alice']}], 'count': 1}}
+        )
+        shown = json.dumps(
+            {
+                'error': None,
+                'result': {
+                    'count': 1,
+                    'results': [{'error': None, 'result': {'uid': ['alice']}}],
+                },
+            }
+        )
+        session = FakeAsyncSession(
+            FakeAsyncResponse(200, found), FakeAsyncResponse(200, shown)
+        )
+        client = AsyncClientMeta('ipa.demo1.freeipa.org', session=session)
+        client._current_host = 'ipa.demo1.freeipa.org'
+
+        async def run():
+            return [entry async for entry in client.iter_find('user')]
+
+        self.assertEqual(self.run_async(run()), [{'uid': ['alice']}])
+        with self.assertRaises(TypeError):
+            client.stream('user_find')
+
+    def test_session_store(self):
+        store = MemorySessionStore()
+        store.set('ipa.demo1.freeipa.org', 'admin', 'stored')
+        logout = json.dumps({'error': None, 'result': None})
+        session = FakeAsyncSession(FakeAsyncResponse(200, logout))
+        client = AsyncClientMeta(
+            'ipa.demo1.freeipa.org', session=session, session_store=store
+        )
+
+        self.run_async(client.login('admin', 'Secret123'))
+        self.assertEqual(session.calls, [])
+        self.assertEqual(session.cookie_jar.cookies['ipa_session'].value, 'stored')
+        self.run_async(client.logout())
+        self.assertIsNone(store.get('ipa.demo1.freeipa.org', 'admin'))
+
+        # The session obtained by a login is stored.
+        session = FakeAsyncSession(FakeAsyncResponse(200, ''))
+        session.cookie_jar.update_cookies(
+            http.cookies.SimpleCookie(
+                'ipa_session=obtained; Domain=ipa.demo1.freeipa.org; Max-Age=60'
+            )
+        )
+        client = AsyncClientMeta(
+            'ipa.demo1.freeipa.org', session=session, session_store=store
+        )
+        self.run_async(client.login('admin', 'Secret123'))
+        self.assertEqual(
+            session.calls[0][0],
+            'https://ipa.demo1.freeipa.org/ipa/session/login_password',
+        )
+        self.assertEqual(store.get('ipa.demo1.freeipa.org', 'admin'), 'obtained')
+
+    def test_read_fails_over(self):
+        body = json.dumps({'error': None, 'result': {'result': {'uid': ['alice']}}})
+        session = FakeAsyncSession(
+            ConnectionRefusedError('Connection refused'), FakeAsyncResponse(200, body)
+        )
+        client = AsyncClientMeta(dns_discovery='demo1.freeipa.org', session=session)
+        client._host_pool = HostPool(
+            ['ipa1.demo1.freeipa.org', 'ipa2.demo1.freeipa.org']
+        )
+        client._current_host = 'ipa1.demo1.freeipa.org'
+
+        result = self.run_async(client.user_show('alice'))
+
+        self.assertEqual(result, {'result': {'uid': ['alice']}})
+        self.assertEqual(
+            [url for url, _ in session.calls],
+            [
+                'https://ipa1.demo1.freeipa.org/ipa/session/json',
+                'https://ipa2.demo1.freeipa.org/ipa/session/json',
+            ],
+        )
+        self.assertEqual(client.current_host, 'ipa2.demo1.freeipa.org')
+        self.assertFalse(client._host_pool.is_healthy('ipa1.demo1.freeipa.org'))
+
+    def test_deadlines(self):
+        body = json.dumps({'error': None, 'result': {'result': {'uid': ['alice']}}})
+        session = FakeAsyncSession(FakeAsyncResponse(200, body))
+        client = AsyncClientMeta('ipa.demo1.freeipa.org', session=session)
+        client._current_host = 'ipa.demo1.freeipa.org'
+        client._retry_policy = RetryPolicy()
+
+        # The deadline context of the thread does not apply to its tasks.
+        with deadline(0):
+            result = self.run_async(client.user_show('alice'))
+        self.assertEqual(result, {'result': {'uid': ['alice']}})
+        self.assertRaises(
+            DeadlineExceeded, self.run_async, await_deadline(0.01, asyncio.sleep(1))
+        )
+
+    def test_sync_only_methods(self):
+        client = AsyncClientMeta('ipa.demo1.freeipa.org', session=FakeAsyncSession())
+        self.assertRaises(TypeError, client.stream, 'user_find')
+        self.assertRaises(TypeError, client.to_columns, 'user_find', fields=['uid'])
+        self.assertRaises(TypeError, client.map, 'user_show', ['alice'])
+
+
+class TransportTest(unittest.TestCase):
+    def test_pool_options(self):
+        client = ClientMeta(
+            'ipa.demo1.freeipa.org', pool_maxsize=64, pool_block=True, keep_alive=False
+        )
+        adapter = client._session.get_adapter('https://ipa.demo1.freeipa.org/ipa')
+        self.assertEqual(adapter._pool_maxsize, 64)
+        self.assertTrue(adapter._pool_block)
+        self.assertEqual(client._session.headers['Connection'], 'close')
+
+    @responses.activate
+    def test_host_is_published_after_login(self):
+        responses.add(
+            responses.POST,
+            'https://ipa.demo1.freeipa.org/ipa/session/login_password',
+            status=200,
+        )
+        client = ClientMeta('ipa.demo1.freeipa.org')
+        self.assertIsNone(client.current_host)
+        client.login('admin', 'Secret123')
+        self.assertEqual(client.current_host, 'ipa.demo1.freeipa.org')
+
+
+class IterFindTest(unittest.TestCase):
+    @responses.activate
+    def test_pages_through_entries(self):
+        url = 'https://ipa.demo1.freeipa.org/ipa/session/json'
+        find_json = {
+            'error': None,
+            'result': {
+                'count': 3,
+                'truncated': False,
+                'result': [
+                    {'dn': 'uid=alice', 'uid': ['alice']},
+                    {'dn': 'uid=bob', 'uid': ['bob']},
+                    {'dn': 'uid=carol', 'uid': ['carol']},
+                ],
+            },
+        }
+        responses.add(responses.POST, url, json=find_json, status=200)
+        for results in (
+            [
+                {'error': None, 'result': {'uid': ['alice']}},
+                {'error': 'bob: user not found', 'error_code': 4001},
+            ],
+            [{'error': None, 'result': {'uid': ['carol']}}],
+        ):
+            responses.add(
+                responses.POST,
+                url,
+                json={'error': None, 'result': {'results': results}},
+                status=200,
+            )
+        client = ClientMeta('ipa.demo1.freeipa.org')
+        client._current_host = 'ipa.demo1.freeipa.org'
+
+        entries = list(client.iter_find('user', page_size=2, mail='*@example.org'))
+
+        self.assertEqual(entries, [{'uid': ['alice']}, {'uid': ['carol']}])
+        self.assertEqual(3, len(responses.calls))
+        find = json.loads(responses.calls[0].request.body)
+        self.assertEqual(find['method'], 'user_find')
+        self.assertTrue(find['params'][1]['pkey_only'])
+        self.assertEqual(find['params'][1]['mail'], '*@example.org')
+        batch = json.loads(responses.calls[1].request.body)
+        self.assertEqual(
+            batch['params'][0][0]['params'],
+            [['alice'], {'all': True, 'version': '2.235'}],
+        )
+
+
+class StreamingTest(unittest.TestCase):
+    body = json.dumps(
+        {
+            'error': None,
+            'id': None,
+            'result': {
+                'count': 2,
+                'result': [
+                    {'uid': ['alice'], 'cn': ['Alice å']},
+                    {'uid': ['bob'], 'uidnumber': ['1120000017']},
+                ],
+                'summary': '2 users matched',
+                'truncated': False,
+            },
+            'version': '4.4.2',
+        },
+        ensure_ascii=False,
+    ).encode('utf-8')
+
+    def test_parser_in_small_chunks(self):
+        parser = ResultStreamParser()
+        entries = []
+        for start in range(0, len(self.body), 3):
+            entries.extend(parser.feed(self.body[start : start + 3]))
+        entries.extend(parser.close())
+
+        self.assertEqual(entries, json.loads(self.body)['result']['result'])
+        self.assertEqual(parser.meta['count'], 2)
+        self.assertFalse(parser.meta['truncated'])
+
+    def test_parser_maps_errors(self):
+        parser = ResultStreamParser()
+        body = b'{"result": null, "error": {"code": 4001, "message": "not found"}}'
+        self.assertRaises(NotFound, parser.feed, body)
+
+    @responses.activate
+    def test_stream_request(self):
+        url = 'https://ipa.demo1.freeipa.org/ipa/session/json'
+        responses.add(responses.POST, url, body=self.body, status=200)
+        client = ClientMeta('ipa.demo1.freeipa.org')
+        client._current_host = 'ipa.demo1.freeipa.org'
+
+        entries = client.stream('user_find', params={'all': True}, chunk_size=16)
+
+        self.assertEqual([entry['uid'] for entry in entries], [['alice'], ['bob']])
+        self.assertEqual(
+            json.loads(responses.calls[0].request.body)['method'], 'user_find'
+        )
+
+
+class CodecTest(unittest.TestCase):
+    value = {
+        'krbpasswordexpiration': datetime.datetime(2030, 1, 2, 3, 4, 5),
+        'usercertificate': b'\x30\x82',
+    }
+    wire = {
+        'krbpasswordexpiration': {'__datetime__': '20300102030405Z'},
+        'usercertificate': {'__base64__': 'MII='},
+    }
+
+    def test_wire_encodings(self):
+        for name in ('json', 'orjson'):
+            codec = get_codec(name)
+            self.assertEqual(codec.loads(codec.dumps(self.value)), self.wire)
+        self.assertEqual(decode_wire(self.wire), self.value)
+
+    @responses.activate
+    def test_wide_integers(self):
+        serial = 2**127 + 12345
+        self.assertEqual(get_codec().name, 'json')
+        for name in ('json', 'orjson'):
+            codec = get_codec(name)
+            value = {'serial_number': serial, 'count': 1}
+            self.assertEqual(codec.loads(codec.dumps(value)), value)
+
+        url = 'https://ipa.demo1.freeipa.org/ipa/session/json'
+        body = '{"error": null, "result": {"result": {"serial_number": %d}}}' % serial
+        responses.add(responses.POST, url, body=body)
+        client = ClientMeta('ipa.demo1.freeipa.org', codec='orjson')
+        client._current_host = 'ipa.demo1.freeipa.org'
+        result = client.cert_show(serial)
+        self.assertEqual(result['result']['serial_number'], serial)
+        self.assertEqual(
+            json.loads(responses.calls[0].request.body)['params'][0], [serial]
+        )
+
+    @responses.activate
+    def test_client_codec(self):
+        url = 'https://ipa.demo1.freeipa.org/ipa/session/json'
+        responses.add(responses.POST, url, json={'error': None, 'result': {}})
+        client = ClientMeta('ipa.demo1.freeipa.org', codec='json')
+        client._current_host = 'ipa.demo1.freeipa.org'
+        self.assertIsInstance(client._codec, JSONCodec)
+
+        client.user_mod(
+            'alice', o_krbpasswordexpiration=self.value['krbpasswordexpiration']
+        )
+
+        params = json.loads(responses.calls[0].request.body)['params'][1]
+        self.assertEqual(
+            params['krbpasswordexpiration'], self.wire['krbpasswordexpiration']
+        )
+
+
+class SessionStoreTest(unittest.TestCase):
+    login_url = 'https://ipa.demo1.freeipa.org/ipa/session/login_password'
+    url = 'https://ipa.demo1.freeipa.org/ipa/session/json'
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.store = FileSessionStore(os.path.join(directory, 'sessions.json'))
+
+    def add_login(self, session):
+        responses.add(
+            responses.POST,
+            self.login_url,
+            status=200,
+            headers={
+                'Set-Cookie': 'ipa_session={0}; Path=/ipa; Secure'.format(session)
+            },
+        )
+
+    @responses.activate
+    def test_session_is_reused(self):
+        self.add_login('first')
+        ClientMeta('ipa.demo1.freeipa.org', session_store=self.store).login(
+            'admin', 'Secret123'
+        )
+        responses.add(responses.POST, self.url, json={'error': None, 'result': {}})
+
+        client = ClientMeta('ipa.demo1.freeipa.org', session_store=self.store)
+        client.login('admin', 'Secret123')
+        client.ping()
+
+        self.assertEqual(
+            [call.request.url for call in responses.calls], [self.login_url, self.url]
+        )
+        self.assertIn('ipa_session=first', responses.calls[1].request.headers['Cookie'])
+
+    @responses.activate
+    def test_relogin_on_rejected_session(self):
+        self.store.set('ipa.demo1.freeipa.org', 'admin', 'expired')
+        responses.add(responses.POST, self.url, status=401)
+        self.add_login('second')
+        responses.add(responses.POST, self.url, json={'error': None, 'result': {}})
+
+        client = ClientMeta('ipa.demo1.freeipa.org', session_store=self.store)
+        client.login('admin', 'Secret123')
+        self.assertEqual(client.ping(), {})
+
+        self.assertEqual(
+            [call.request.url for call in responses.calls],
+            [self.url, self.login_url, self.url],
+        )
+        self.assertEqual(self.store.get('ipa.demo1.freeipa.org', 'admin'), 'second')
+
+
+class ReauthenticationTest(unittest.TestCase):
+    login_url = 'https://ipa.demo1.freeipa.org/ipa/session/login_password'
+    url = 'https://ipa.demo1.freeipa.org/ipa/session/json'
+
+    def setUp(self):
+        self.logins = []
+        self.valid_session = None
+        self.lock = threading.Lock()
+
+    def login_callback(self, request):
+        with self.lock:
+            self.logins.append(request)
+            self.valid_session = 'session{0}'.format(len(self.logins))
+        cookie = 'ipa_session={0}; Path=/ipa; Secure'.format(self.valid_session)
+        return 200, {'Set-Cookie': cookie}, ''
+
+    def json_callback(self, request):
+        expected = 'ipa_session={0}'.format(self.valid_session)
+        if expected not in request.headers.get('Cookie', ''):
+            return 401, {}, ''
+        return 200, {}, json.dumps({'error': None, 'result': {'summary': 'pong'}})
+
+    @responses.activate
+    def test_single_relogin_for_concurrent_requests(self):
+        responses.add_callback(responses.POST, self.login_url, self.login_callback)
+        responses.add_callback(responses.POST, self.url, self.json_callback)
+        client = ClientMeta('ipa.demo1.freeipa.org')
+        client.login('admin', 'Secret123')
+        self.valid_session = 'expired'
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(client.ping()))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, [{'summary': 'pong'}] * 8)
+        self.assertEqual(len(self.logins), 2)
+
+    @responses.activate
+    def test_no_relogin_when_disabled(self):
+        responses.add_callback(responses.POST, self.login_url, self.login_callback)
+        responses.add_callback(responses.POST, self.url, self.json_callback)
+        client = ClientMeta('ipa.demo1.freeipa.org', reauthenticate=False)
+        client.login('admin', 'Secret123')
+        self.valid_session = 'expired'
+
+        self.assertRaises(Unauthorized, client.ping)
+        self.assertEqual(len(self.logins), 1)
+
+
+class FailoverTest(unittest.TestCase):
+    def setUp(self):
+        self.client = ClientMeta(dns_discovery='demo1.freeipa.org')
+        self.client._host_pool = HostPool(
+            ['ipa1.demo1.freeipa.org', 'ipa2.demo1.freeipa.org']
+        )
+        self.client._current_host = 'ipa1.demo1.freeipa.org'
+        responses.add(
+            responses.POST,
+            'https://ipa1.demo1.freeipa.org/ipa/session/json',
+            body=requests.exceptions.ConnectionError('Connection reset by peer'),
+        )
+        responses.add(
+            responses.POST,
+            'https://ipa2.demo1.freeipa.org/ipa/session/json',
+            json={'error': None, 'result': {'result': {'uid': ['alice']}}},
+        )
+
+    @responses.activate
+    def test_read_fails_over(self):
+        self.assertEqual(self.client.user_show('alice'), {'result': {'uid': ['alice']}})
+        self.assertEqual(self.client.current_host, 'ipa2.demo1.freeipa.org')
+        self.assertFalse(self.client._host_pool.is_healthy('ipa1.demo1.freeipa.org'))
+
+        self.client.user_show('alice')
+        self.assertEqual(
+            [call.request.url for call in responses.calls],
+            [
+                'https://ipa1.demo1.freeipa.org/ipa/session/json',
+                'https://ipa2.demo1.freeipa.org/ipa/session/json',
+                'https://ipa2.demo1.freeipa.org/ipa/session/json',
+            ],
+        )
+
+    @responses.activate
+    def test_write_is_not_replayed(self):
+        self.assertRaises(
+            requests.exceptions.ConnectionError, self.client.user_disable, 'alice'
+        )
+        self.assertEqual(1, len(responses.calls))
+        self.assertFalse(self.client._host_pool.is_healthy('ipa1.demo1.freeipa.org'))
+
+    def test_selection_prefers_priority_and_latency(self):
+        record = collections.namedtuple('SRV', 'hostname priority weight')
+        pool = HostPool(
+            [record('slow', 0, 100), record('fast', 0, 100), record('backup', 10, 100)]
+        )
+        pool.report_success('slow', 2.0)
+        pool.report_success('fast', 0.01)
+        picks = collections.Counter(pool.select() for _ in range(200))
+        self.assertNotIn('backup', picks)
+        self.assertGreater(picks['fast'], picks['slow'])
+
+
+class FakeDiscoveryCache(DiscoveryCache):
+    def __init__(self, records, **kwargs):
+        super(FakeDiscoveryCache, self).__init__(**kwargs)
+        self.records = records
+        self.queries = []
+
+    def _query(self, domain):
+        self.queries.append(domain)
+        result = self.records.get(domain)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class DiscoveryCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.server = SRV('ipa.demo1.freeipa.org', 389, 0, 100, 'ipa.demo1.freeipa.org')
+        self.cache = FakeDiscoveryCache({'demo1.freeipa.org': ([self.server], 60)})
+
+    def test_lookup_is_cached(self):
+        client = ClientMeta(
+            dns_discovery='host.demo1.freeipa.org', discovery_cache=self.cache
+        )
+        self.assertEqual(client.dns_discovered, [self.server])
+        self.assertEqual(client.dns_discovered, [self.server])
+        self.assertEqual(
+            self.cache.queries, ['host.demo1.freeipa.org', 'demo1.freeipa.org']
+        )
+
+        client.refresh_discovery()
+        client.dns_discovered
+        self.assertEqual(len(self.cache.queries), 4)
+
+    def test_expired_lookup_is_repeated(self):
+        self.cache.records['demo1.freeipa.org'] = ([self.server], 0)
+        self.cache.lookup('demo1.freeipa.org')
+        self.cache.lookup('demo1.freeipa.org')
+        self.assertEqual(len(self.cache.queries), 2)
+
+    def test_failed_lookup_is_cached(self):
+        self.assertRaises(FreeIPAError, self.cache.lookup, 'example.org')
+        self.assertRaises(FreeIPAError, self.cache.lookup, 'example.org')
+        self.assertEqual(self.cache.queries, ['example.org', 'org'])
+
+    def test_unreachable_dns_is_cached(self):
+        self.cache.records['host.example.org'] = FreeIPAError('timed out')
+        for _ in range(2):
+            with self.assertRaises(FreeIPAError) as context:
+                self.cache.lookup('host.example.org')
+            self.assertEqual(str(context.exception), 'timed out')
+        self.assertEqual(self.cache.queries, ['host.example.org'])
+
+    @unittest.skipUnless(importlib.util.find_spec('dns'), 'dnspython is not installed')
+    def test_resolver_timeout(self):
+        import dns.exception
+        import dns.resolver
+
+        cache = DiscoveryCache()
+        with unittest.mock.patch.object(
+            dns.resolver, 'resolve', side_effect=dns.exception.Timeout(), create=True
+        ) as resolve:
+            self.assertRaises(FreeIPAError, cache.lookup, 'demo1.freeipa.org')
+            self.assertRaises(FreeIPAError, cache.lookup, 'demo1.freeipa.org')
+        self.assertEqual(resolve.call_count, 1)
+
+
+class ResultCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.client = ClientMeta('ipa.demo1.freeipa.org', result_cache=True)
+        self.client._current_host = 'ipa.demo1.freeipa.org'
+        responses.add(
+            responses.POST,
+            'https://ipa.demo1.freeipa.org/ipa/session/json',
+            json={'error': None, 'result': {'result': {'uid': ['alice']}}},
+        )
+
+    @responses.activate
+    def test_show_is_cached(self):
+        self.client.user_show('alice')
+        self.assertEqual(self.client.user_show('alice'), {'result': {'uid': ['alice']}})
+        self.client.user_show('alice', o_all=False)
+        self.assertEqual(2, len(responses.calls))
+        stats = self.client.result_cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 2))
+
+    @responses.activate
+    def test_writes_invalidate(self):
+        self.client.user_show('alice')
+        self.client.group_show('admins')
+        self.client.user_mod('alice', o_title='Engineer')
+        self.client.user_show('alice')
+        self.client.group_show('admins')
+        self.assertEqual(4, len(responses.calls))
+
+        self.client.group_add_member(a_cn='admins', o_user='alice')
+        self.client.user_show('alice')
+        self.client.group_show('admins')
+        self.assertEqual(7, len(responses.calls))
+
+    def test_member_types_are_invalidated(self):
+        cache = ResultCache()
+        for method in ('user_show', 'host_show', 'all_show'):
+            cache.set(cache.key(method, ['alice']), method, {'cn': ['alice']})
+        cache.invalidate(
+            'group_add_member', ['admins'], {'user': ['alice'], 'all': True}
+        )
+        self.assertIs(cache.get(cache.key('user_show', ['alice'])), MISSING)
+        # Only the parameters naming member types invalidate other types.
+        self.assertIsNot(cache.get(cache.key('host_show', ['alice'])), MISSING)
+        self.assertIsNot(cache.get(cache.key('all_show', ['alice'])), MISSING)
+
+    def test_lru_eviction(self):
+        cache = ResultCache(max_entries=2)
+        for name in ('alice', 'bob'):
+            cache.set(cache.key('user_show', [name]), 'user_show', {'uid': [name]})
+        cache.get(cache.key('user_show', ['alice']))
+        cache.set(cache.key('user_show', ['carol']), 'user_show', {'uid': ['carol']})
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get(cache.key('user_show', 'alice')), {'uid': ['alice']})
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+
+class LazyCommandsTest(unittest.TestCase):
+    def test_import_is_lazy(self):
+        code = (
+            'import sys, python_freeipa\n'
+            'print(sorted(m for m in sys.modules if m.startswith('
+            '("python_freeipa.client_meta.", '
+            '"gssapi", "requests_gssapi", "srvlookup"))))\n'
+            'python_freeipa.ClientMeta.user_show\n'
+            'print(sorted(m for m in sys.modules if m.startswith('
+            '"python_freeipa.client_meta.")))\n'
+        )
+        src = os.path.dirname(os.path.dirname(python_freeipa.__file__))
+        env = dict(os.environ, PYTHONPATH=src)
+        output = subprocess.check_output([sys.executable, '-c', code], env=env)
+        self.assertEqual(
+            output.decode().splitlines(), ['[]', "['python_freeipa.client_meta._user']"]
+        )
+
+    def test_commands_are_resolved(self):
+        client = ClientMeta('ipa.demo1.freeipa.org')
+        self.assertIn('group_show', dir(client))
+        self.assertTrue(callable(client.group_show))
+        self.assertIn('group_show', vars(ClientMeta))
+        self.assertRaises(AttributeError, getattr, client, 'group_frobnicate')
+        self.assertFalse(hasattr(ClientMeta, 'group_frobnicate'))
+
+
+class ClientDynamicTest(unittest.TestCase):
+    metadata = {
+        'commands': {
+            'user_show': {
+                'doc': 'Display information about a user.',
+                'takes_args': [{'name': 'uid', 'required': True}],
+                'takes_options': [
+                    {'name': 'all', 'required': False},
+                    {'name': 'rights', 'required': False},
+                    {'name': 'version', 'required': False},
+                ],
+            }
+        }
+    }
+    schema = {
+        'commands': [
+            {
+                'name': 'user_show',
+                'full_name': 'user_show/1',
+                'doc': 'Display information about a user.',
+                'params': [
+                    {'name': 'uid', 'positional': True, 'required': True},
+                    {'name': 'all', 'default': True},
+                    {'name': 'rights'},
+                    {'name': 'version'},
+                ],
+            }
+        ]
+    }
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path)
+        self.methods = []
+        self.fingerprint = 'abc123'
+        responses.add_callback(
+            responses.POST,
+            'https://ipa.demo1.freeipa.org/ipa/session/json',
+            callback=self.respond,
+        )
+
+    def respond(self, request):
+        call = json.loads(request.body)
+        self.methods.append(call['method'])
+        known = call['params'][1].get('known_fingerprints', [])
+        if call['method'] == 'schema' and self.fingerprint in known:
+            error = {
+                'code': 4024,
+                'name': 'SchemaUpToDate',
+                'message': 'Schema is up to date',
+                'data': {'fingerprint': self.fingerprint, 'ttl': 3600},
+            }
+            return 200, {}, json.dumps({'error': error, 'result': None})
+        result = {
+            'schema': dict(self.schema, fingerprint=self.fingerprint, ttl=3600),
+            'env': {'result': {'api_version': '2.251'}},
+            'json_metadata': self.metadata,
+            'user_show': {'result': {'uid': ['alice']}},
+        }[call['method']]
+        return 200, {}, json.dumps({'error': None, 'result': result})
+
+    def client(self):
+        client = ClientDynamic('ipa.demo1.freeipa.org', schema_cache=self.path)
+        client._current_host = 'ipa.demo1.freeipa.org'
+        return client
+
+    @responses.activate
+    def test_commands_from_schema(self):
+        client = self.client()
+        self.assertEqual(client.user_show('alice'), {'result': {'uid': ['alice']}})
+        # The commands come with the schema, which is only fetched once.
+        self.assertEqual(self.methods, ['schema', 'env', 'user_show'])
+        call = json.loads(responses.calls[-1].request.body)
+        self.assertEqual(call['params'], [['alice'], {'all': True, 'version': '2.251'}])
+        self.assertRaises(TypeError, client.user_show)
+        self.assertRaises(AttributeError, getattr, client, 'user_frobnicate')
+
+    @responses.activate
+    def test_commands_from_metadata(self):
+        # Servers whose schema response has no commands.
+        self.schema = {}
+        client = self.client()
+        self.assertEqual(client.user_show('alice'), {'result': {'uid': ['alice']}})
+        self.assertEqual(self.methods, ['schema', 'env', 'json_metadata', 'user_show'])
+        self.assertEqual(client.commands['user_show'].args, ('uid',))
+
+    @responses.activate
+    def test_schema_is_cached(self):
+        self.client().user_show('alice')
+        del self.methods[:]
+        self.client().user_show(a_uid='alice', o_rights=True)
+        self.assertEqual(self.methods, ['user_show'])
+
+        os.remove(os.path.join(self.path, 'servers.json'))
+        self.client().user_show('alice')
+        self.assertEqual(self.methods, ['user_show', 'schema', 'user_show'])
+
+
+class FakeIPATest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeIPA(search_limit=5)
+        self.client = ClientMeta('ipa.example.test')
+        self.server.install(self.client)
+        self.client.login('admin', 'Secret123')
+
+    def test_commands(self):
+        self.client.user_add('alice', o_givenname='Alice', o_sn='L', o_cn='Alice L')
+        self.assertRaises(
+            DuplicateEntry,
+            self.client.user_add,
+            'alice',
+            o_givenname='Alice',
+            o_sn='L',
+            o_cn='Alice L',
+        )
+        self.client.group_add_member('admins', o_user=['alice'])
+        user = self.client.user_show('alice')['result']
+        self.assertEqual(user['memberof_group'], ['ipausers', 'admins'])
+        self.client.user_del('alice')
+        self.assertRaises(NotFound, self.client.user_show, 'alice')
+        self.assertEqual(self.server.calls['user_show'], 2)
+
+    def test_find_is_truncated(self):
+        self.server.add_users(10)
+        found = self.client.user_find()
+        self.assertEqual((found['count'], found['truncated']), (5, True))
+        found = self.client.user_find(o_sizelimit=0)
+        self.assertEqual((found['count'], found['truncated']), (11, False))
+
+    def test_batch_errors(self):
+        with self.client.batched() as batch:
+            admin = batch.user_show('admin')
+            missing = batch.user_show('nobody')
+        self.assertEqual(admin.result()['value'], 'admin')
+        self.assertIsInstance(missing.exception(), NotFound)
+
+    def test_injected_faults(self):
+        self.server.inject(401)
+        self.assertIn('summary', self.client.ping())
+        self.assertEqual(self.server.requests['ipa.example.test'], 4)
+
+        self.server.inject(4002, method='user_show')
+        self.assertRaises(DuplicateEntry, self.client.user_show, 'admin')
+        self.client.user_show('admin')
+
+        self.server.inject('reset')
+        self.assertRaises(requests.exceptions.ConnectionError, self.client.ping)
+
+    def test_failover(self):
+        client = ClientMeta(dns_discovery='example.test')
+        client._host_pool = HostPool(['ipa1.example.test', 'ipa2.example.test'])
+        client._current_host = 'ipa1.example.test'
+        self.server.install(client)
+        self.server.require_login = False
+        self.server.inject('reset', host='ipa1.example.test', count=None)
+        self.assertEqual(client.user_show('admin')['value'], 'admin')
+        self.assertEqual(client.current_host, 'ipa2.example.test')
+
+
+class HooksTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeIPA()
+        self.events = []
+        self.client = ClientMeta('ipa.example.test')
+        self.server.install(self.client)
+        self.client.login('admin', 'Secret123')
+
+    def record(self, event):
+        self.events.append(
+            (event.kind, event.method, event.status, event.retries, event.batch_size)
+        )
+
+    def test_events(self):
+        self.assertFalse(self.client.hooks)
+        self.client.hooks.subscribe(self.record)
+        self.client.user_show('admin')
+        self.assertRaises(NotFound, self.client.user_show, 'nobody')
+        self.server.inject(401)
+        with self.client.batched() as batch:
+            batch.ping()
+            batch.ping()
+        self.assertEqual(
+            self.events,
+            [
+                ('request', 'user_show', None, 0, None),
+                ('response', 'user_show', 200, 0, None),
+                ('request', 'user_show', None, 0, None),
+                ('error', 'user_show', 200, 0, None),
+                ('request', 'batch', None, 0, 2),
+                ('response', 'batch', 200, 1, 2),
+            ],
+        )
+
+    def test_sizes_are_in_bytes(self):
+        body = '{"params": [["eve"], {"givenname": "Ève"}]}'
+        event = CallEvent('user_add', 'ipa.example.test', ['eve'], body)
+        self.assertEqual(event.bytes_sent, len(body) + 1)
+        self.client.hooks.finish(event, 200, 'Ève')
+        self.assertEqual(event.bytes_received, 4)
+        event = CallEvent('user_add', 'ipa.example.test', ['eve'], body.encode())
+        self.assertEqual(event.bytes_sent, len(body) + 1)
+
+    def test_failing_subscriber(self):
+        def fail(event):
+            raise RuntimeError(event.kind)
+
+        self.client.hooks.subscribe(fail, events=['response'])
+        self.client.hooks.subscribe(self.record, events=['response'])
+        with self.assertLogs('python_freeipa.hooks', 'ERROR'):
+            self.assertIn('summary', self.client.ping())
+        self.assertEqual(self.events, [('response', 'ping', 200, 0, None)])
+
+        self.client.hooks.unsubscribe(fail)
+        self.client.hooks.unsubscribe(self.record)
+        self.assertFalse(self.client.hooks)
+
+    def test_shared_hooks(self):
+        hooks = Hooks()
+        hooks.subscribe(self.record, events=['error'])
+        client = ClientMeta('ipa.example.test', hooks=hooks)
+        self.server.install(client)
+        self.server.inject('reset')
+        self.assertRaises(requests.exceptions.ConnectionError, client.ping)
+        self.assertEqual(self.events, [('error', 'ping', None, 0, None)])
+
+    @unittest.skipUnless(
+        importlib.util.find_spec('opentelemetry'), 'opentelemetry is not installed'
+    )
+    def test_opentelemetry_spans(self):
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+            InMemorySpanExporter,
+        )
+
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        self.client.hooks.subscribe(OpenTelemetryHook(provider.get_tracer('test')))
+        self.client.user_show('admin')
+        (span,) = exporter.get_finished_spans()
+        self.assertEqual(span.name, 'freeipa user_show')
+        self.assertEqual(span.attributes['http.response.status_code'], 200)
+
+
+class MetricsTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeIPA()
+        self.client = ClientMeta('ipa.example.test', result_cache=True)
+        self.server.install(self.client)
+        self.client.login('admin', 'Secret123')
+        self.metrics = Metrics()
+        self.metrics.attach(self.client)
+
+    def test_histogram_quantiles(self):
+        histogram = Histogram(buckets=(0.1, 0.2, 0.4))
+        for value in [0.05] * 50 + [0.15] * 40 + [0.3] * 9 + [1.0]:
+            histogram.observe(value)
+        self.assertAlmostEqual(histogram.quantile(0.5), 0.1)
+        self.assertAlmostEqual(histogram.quantile(0.95), 0.2 + 0.2 * 5 / 9)
+        self.assertEqual(histogram.quantile(0.999), 0.4)
+        self.assertIsNone(Histogram().quantile(0.5))
+
+    def test_requests_are_recorded(self):
+        for _ in range(3):
+            self.client.user_show('admin')
+        self.assertRaises(NotFound, self.client.user_show, 'nobody')
+        self.server.expire_sessions()
+        self.client.ping()
+
+        self.assertEqual(self.metrics.histogram('user_show').count, 2)
+        self.assertIsNotNone(self.metrics.quantiles(host='ipa.example.test')[0.99])
+        self.assertEqual(
+            self.metrics.errors(), {('user_show', 'ipa.example.test', 'NotFound'): 1}
+        )
+        self.assertEqual(self.metrics.relogins(), {'ipa.example.test': 1})
+        cache = self.metrics.cache_stats()
+        self.assertEqual((cache['hits'], cache['misses']), (2, 2))
+
+        text = self.metrics.to_prometheus()
+        self.assertIn(
+            'freeipa_request_duration_seconds_count'
+            '{method="user_show",host="ipa.example.test"} 2\n',
+            text,
+        )
+        self.assertIn(
+            'freeipa_errors_total'
+            '{method="user_show",host="ipa.example.test",error="NotFound"} 1\n',
+            text,
+        )
+        self.assertIn('freeipa_relogins_total{host="ipa.example.test"} 1\n', text)
+        self.assertIn('freeipa_cache_hits_total 2\n', text)
+
+        self.metrics.detach(self.client)
+        self.client.ping()
+        self.assertEqual(self.metrics.histogram('ping').count, 1)
+
+    def test_pool_stats(self):
+        client = ClientMeta('ipa.example.test', pool_maxsize=4)
+        adapter = client._session.get_adapter('https://ipa.example.test')
+        adapter.poolmanager.connection_from_host('ipa.example.test', 443, 'https')
+        self.metrics.attach(client)
+        self.assertEqual(
+            self.metrics.pool_stats(),
+            {
+                'ipa.example.test': {
+                    'maxsize': 4,
+                    'in_use': 0,
+                    'idle': 0,
+                    'opened': 0,
+                    'requests': 0,
+                }
+            },
+        )
+
+
+class RetryTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeIPA()
+        self.client = ClientMeta(
+            'ipa.example.test', retry_policy=RetryPolicy(backoff=0, budget=False)
+        )
+        self.server.install(self.client)
+        self.client.login('admin', 'Secret123')
+
+    def test_read_only_calls_are_retried(self):
+        requests_sent = self.server.requests['ipa.example.test']
+        self.server.inject(503, method='user_show', count=2)
+        self.assertEqual(self.client.user_show('admin')['value'], 'admin')
+        self.assertEqual(self.server.requests['ipa.example.test'], requests_sent + 3)
+
+        self.server.inject(503, method='user_show', count=3)
+        with self.assertRaises(FreeIPAError) as context:
+            self.client.user_show('admin')
+        self.assertEqual(context.exception.code, 503)
+
+    def test_writes_are_only_retried_if_not_sent(self):
+        self.server.inject(503, method='user_add')
+        self.assertRaises(
+            FreeIPAError, self.client.user_add, 'alice', 'Alice', 'L', 'Alice L'
+        )
+        self.assertEqual(self.server.calls['user_add'], 0)
+        self.server.inject('connect_timeout', method='user_add')
+        self.client.user_add('alice', 'Alice', 'L', 'Alice L')
+        self.assertEqual(self.server.calls['user_add'], 1)
+
+    def test_permanent_errors_are_not_retried(self):
+        self.assertRaises(NotFound, self.client.user_show, 'nobody')
+        self.assertEqual(self.server.calls['user_show'], 1)
+
+    def test_budget(self):
+        budget = RetryBudget(max_tokens=4, token_ratio=0.5)
+        self.client._retry_policy = RetryPolicy(backoff=0, budget=budget)
+        self.server.inject(503, method='user_show')
+        self.client.user_show('admin')
+        self.assertEqual(budget.tokens, 3.5)
+        self.server.inject(503, method='user_show', count=2)
+        self.assertRaises(FreeIPAError, self.client.user_show, 'admin')
+        self.assertEqual(budget.tokens, 1.5)
+
+    def test_deadline(self):
+        self.server.latency = 0.05
+        self.server.inject(503, method='user_show', count=None)
+        self.client._retry_policy = RetryPolicy(backoff=0.02, jitter=0)
+        with deadline(0.1):
+            self.assertRaises(FreeIPAError, self.client.user_show, 'admin')
+            self.assertLess(self.server.calls['user_show'], 3)
+        with deadline(0):
+            self.assertRaises(DeadlineExceeded, self.client.ping)
+
+
+class ThrottleTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeIPA(latency=0.02)
+        self.throttle = Throttle(
+            {'read': Limit(max_in_flight=2), 'expensive': Limit(rate=1, burst=1)}
+        )
+        self.client = ClientMeta(
+            'ipa.example.test', pool_maxsize=8, throttle=self.throttle
+        )
+        self.server.install(self.client)
+        self.client.login('admin', 'Secret123')
+
+    def test_command_classes(self):
+        self.assertEqual(command_class('user_show', ['alice']), 'read')
+        self.assertEqual(command_class('user_add', ['alice']), 'write')
+        self.assertEqual(command_class('automember_rebuild'), 'expensive')
+        calls = [
+            {'method': 'user_show', 'params': [['alice'], {}]},
+            {'method': 'user_mod', 'params': [['alice'], {}]},
+        ]
+        self.assertEqual(command_class('batch', calls[:1]), 'read')
+        self.assertEqual(command_class('batch', calls), 'write')
+
+    def test_token_bucket(self):
+        bucket = TokenBucket(rate=100, burst=2)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertAlmostEqual(bucket.reserve(), 0.01, places=3)
+        self.assertAlmostEqual(bucket.reserve(), 0.02, places=3)
+
+    def test_max_in_flight(self):
+        handle = self.server.handle
+        lock = threading.Lock()
+        in_flight = [0, 0]
+
+        def tracked_handle(*args):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            try:
+                return handle(*args)
+            finally:
+                with lock:
+                    in_flight[0] -= 1
+
+        self.server.handle = tracked_handle
+        threads = [
+            threading.Thread(target=self.client.user_show, args=('admin',))
+            for _ in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(in_flight[1], 2)
+        stats = self.throttle.stats()[('ipa.example.test', 'read')]
+        self.assertEqual((stats['in_flight'], stats['requests']), (0, 6))
+        self.assertGreater(stats['throttled'], 0)
+
+    def test_rate_limit_and_deadline(self):
+        self.server.latency = 0
+        self.client.user_add('alice', 'Alice', 'L', 'Alice L')
+        self.assertRaises(FreeIPAError, self.client.automember_rebuild)
+        with deadline(0.1):
+            self.assertRaises(DeadlineExceeded, self.client.automember_rebuild)
+            # Other classes of commands are not held back.
+            self.client.user_mod('alice', o_title='Engineer')
+        self.assertNotIn(('ipa.example.test', 'write'), self.throttle.stats())
+
+    def test_slot_timeout_keeps_token(self):
+        throttle = Throttle({'write': Limit(rate=1, burst=2, max_in_flight=1)})
+
+        def soon():
+            return time.monotonic() + 0.05
+
+        with throttle.limit('ipa.example.test', 'write'):
+            with self.assertRaises(DeadlineExceeded):
+                with throttle.limit('ipa.example.test', 'write', soon()):
+                    pass
+        # The second token of the burst is still available.
+        with throttle.limit('ipa.example.test', 'write', soon()):
+            pass
+
+        async def requests():
+            throttle = Throttle({'write': Limit(rate=1, burst=2, max_in_flight=1)})
+            async with throttle.limit_async('ipa.example.test', 'write'):
+                with self.assertRaises(DeadlineExceeded):
+                    async with throttle.limit_async(
+                        'ipa.example.test', 'write', soon()
+                    ):
+                        pass
+            async with throttle.limit_async('ipa.example.test', 'write', soon()):
+                pass
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(requests())
+        finally:
+            loop.close()
+
+    def test_async(self):
+        throttle = Throttle({'read': Limit(max_in_flight=1)})
+        in_flight = [0, 0]
+
+        async def request():
+            async with throttle.limit_async('ipa.example.test', 'read'):
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+                await asyncio.sleep(0.01)
+                in_flight[0] -= 1
+
+        async def requests():
+            await asyncio.gather(*[request() for _ in range(3)])
+            # Classes without a limit are not throttled.
+            async with throttle.limit_async('ipa.example.test', 'write'):
+                pass
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(requests())
+        finally:
+            loop.close()
+        self.assertEqual(in_flight[1], 1)
+        self.assertEqual(throttle.stats()[('ipa.example.test', 'read')]['throttled'], 2)
+
+
+def sent_options(server, method):
+    """
+    Records the options of the calls of method that server receives, batch
+    calls included, in the returned list.
+    """
+    sent = []
+    handle = server.handle
+
+    def recording_handle(host, path, headers, body):
+        call = json.loads(body)
+        calls = [call]
+        if call['method'] == 'batch':
+            calls = call['params'][0]
+        for call in calls:
+            if call['method'] == method:
+                options = dict(call['params'][1])
+                options.pop('version', None)
+                sent.append(options)
+        return handle(host, path, headers, body)
+
+    server.handle = recording_handle
+    return sent
+
+
+class ProjectionTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeIPA(require_login=False)
+        self.server.add_users(3)
+        self.client = ClientMeta('ipa.example.test')
+        self.server.install(self.client)
+        self.client.group_add_member('admins', o_user=['user0'])
+
+    def test_cheapest_options(self):
+        sent = sent_options(self.server, 'user_find')
+        found = self.client.user_find(fields=['uid', 'homedirectory'])
+        self.assertEqual(
+            (sent[-1]['all'], sent[-1]['no_members'], sent[-1]['pkey_only']),
+            (False, True, False),
+        )
+        self.assertNotIn('fields', sent[-1])
+        self.assertEqual(
+            found['result'][1], {'uid': ['user0'], 'homedirectory': ['/home/user0']}
+        )
+
+        self.client.user_find(fields=['uid'])
+        self.assertTrue(sent[-1]['pkey_only'])
+        found = self.client.user_find(o_uid='user0', fields=['cn', 'memberof_group'])
+        self.assertEqual((sent[-1]['all'], sent[-1]['no_members']), (True, False))
+        self.assertEqual(
+            found['result'][0],
+            {'cn': ['user0 user0'], 'memberof_group': ['ipausers', 'admins']},
+        )
+
+    def test_show_and_batch(self):
+        user = self.client.user_show('user0', fields='uid')['result']
+        self.assertEqual(user, {'uid': ['user0']})
+        self.assertIn('cn', self.client.user_show('user0', fields='*')['result'])
+        with self.client.batched() as batch:
+            result = batch.user_show('user1', fields=['uid', 'memberof_group'])
+        self.assertEqual(
+            result.result()['result'],
+            {'uid': ['user1'], 'memberof_group': ['ipausers']},
+        )
+        entries = list(self.client.iter_find('user', fields=['uid']))
+        self.assertEqual(entries[1], {'uid': ['user0']})
+
+    def test_raw_request_and_batch(self):
+        sent = sent_options(self.server, 'user_find')
+        self.client._request('user_find', [], {'fields': ['uid', 'homedirectory']})
+        self.assertEqual(
+            sent[-1], {'all': False, 'no_members': True, 'pkey_only': False}
+        )
+        self.client._request('user_find', [], {'fields': ['uid']})
+        self.assertEqual(
+            sent[-1], {'all': False, 'no_members': True, 'pkey_only': True}
+        )
+        with self.client.batched() as batch:
+            batch._request('user_find', [], {'fields': ['uid', 'memberof_group']})
+        self.assertEqual(
+            sent[-1], {'all': False, 'no_members': False, 'pkey_only': False}
+        )
+
+        sent = sent_options(self.server, 'user_show')
+        with self.client.batched() as batch:
+            batch._request('user_show', ['user0'], {'fields': ['uid']})
+        self.assertEqual(sent[-1], {'all': False, 'no_members': True})
+        # Options not taken by a command are not sent.
+        self.client._request('dnszone_add', ['example.test'], {})
+        self.client._request(
+            'dnsrecord_add', ['example.test', 'www'], {'arecord': '192.0.2.1'}
+        )
+        sent = sent_options(self.server, 'dnsrecord_show')
+        self.client._request(
+            'dnsrecord_show', ['example.test', 'www'], {'fields': 'idnsname'}
+        )
+        self.assertEqual(sent[-1], {'all': False})
+
+    def test_bulk_profile(self):
+        client = ClientMeta('ipa.example.test', profile='bulk')
+        self.server.install(client)
+        user = client.user_show('user0')['result']
+        self.assertNotIn('cn', user)
+        self.assertNotIn('memberof_group', user)
+        self.assertIn('cn', client.user_show('user0', fields=['cn'])['result'])
+        sent = sent_options(self.server, 'group_find')
+        client._request('group_find', [], {})
+        self.assertEqual(sent[-1], {'all': False, 'no_members': True})
+        self.assertRaises(ValueError, ClientMeta, 'ipa.example.test', profile='fast')
+
+
+class RecordsTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeIPA(require_login=False)
+        self.server.add_users(3)
+        self.client = ClientMeta('ipa.example.test')
+        self.server.install(self.client)
+
+    def test_find_results(self):
+        users = to_records(
+            self.client.user_find(o_sizelimit=0, o_no_members=False), 'user'
+        )
+        self.assertEqual(
+            [user.uid for user in users], ['admin', 'user0', 'user1', 'user2']
+        )
+        user = users[1]
+        self.assertEqual(user.uidnumber, user['uidnumber'])
+        self.assertEqual(user.homedirectory, '/home/user0')
+        self.assertEqual((user.givenname, user.cn), ('user0', 'user0 user0'))
+        self.assertIs(user.objectclass[0], users[2].objectclass[0])
+        self.assertIsNone(user.mail)
+        self.assertIs(user.memberof_group[0], users[2].memberof_group[0])
+        self.assertEqual(user.to_dict()['memberof_group'], ['ipausers'])
+        self.assertFalse(hasattr(user, '__dict__'))
+
+        record = to_records(self.client.user_show('user1'), record_class('user'))
+        self.assertEqual(record, users[2])
+        self.assertEqual(pickle.loads(pickle.dumps(record)), record)
+
+    def test_wire_values_are_decoded_lazily(self):
+        record_type = record_class(
+            'TokenRecord', 'token', ['id', 'expiry', 'key'], single=['id', 'expiry']
+        )
+        record = record_type.from_entry(
+            {
+                'id': ['t1'],
+                'expiry': [{'__datetime__': '20300101000000Z'}],
+                'key': [{'__base64__': 'AAE='}],
+                'owner': ['alice'],
+            }
+        )
+        self.assertEqual(
+            record_type.expiry.slot.__get__(record), {'__datetime__': '20300101000000Z'}
+        )
+        self.assertEqual(record.expiry, datetime.datetime(2030, 1, 1))
+        self.assertIsInstance(
+            record_type.expiry.slot.__get__(record), datetime.datetime
+        )
+        self.assertEqual(record.key, (b'\x00\x01',))
+        self.assertEqual(record.extra, {'owner': ['alice']})
+        self.assertIn('owner', record)
+
+
+class ColumnsTest(unittest.TestCase):
+    entries = [
+        {
+            'uid': ['alice'],
+            'uidnumber': ['1001'],
+            'loginshell': ['/bin/bash'],
+            'nsaccountlock': False,
+            'krbpasswordexpiration': [{'__datetime__': '20300101000000Z'}],
+        },
+        {
+            'uid': ['bob'],
+            'uidnumber': ['1002'],
+            'loginshell': ['/bin/bash'],
+            'nsaccountlock': True,
+            'mail': ['bob@example.test', 'robert@example.test'],
+        },
+        {'uid': ['carol'], 'loginshell': ['/bin/sh'], 'mail': ['carol@example.test']},
+        {'uid': ['dave'], 'uidnumber': ['1004'], 'loginshell': ['/bin/bash']},
+    ]
+
+    def test_typed_columns(self):
+        columns = to_columns({'result': self.entries})
+        self.assertEqual(len(columns), 4)
+        self.assertEqual(
+            columns.column_names,
+            [
+                'uid',
+                'uidnumber',
+                'loginshell',
+                'nsaccountlock',
+                'krbpasswordexpiration',
+                'mail',
+            ],
+        )
+        uidnumber = columns['uidnumber']
+        self.assertEqual(uidnumber.kind, 'int')
+        self.assertEqual(list(uidnumber.data), [1001, 1002, 0, 1004])
+        self.assertEqual(bytes(uidnumber.valid), b'\x01\x01\x00\x01')
+        self.assertEqual(uidnumber.null_count, 1)
+        self.assertEqual(columns['nsaccountlock'].kind, 'bool')
+        expiration = columns['krbpasswordexpiration']
+        self.assertEqual(expiration.kind, 'timestamp')
+        self.assertEqual(expiration.data[0], 1893456000 * 1000000)
+
+        self.assertEqual(
+            columns.to_pydict(),
+            {
+                'uid': ['alice', 'bob', 'carol', 'dave'],
+                'uidnumber': [1001, 1002, None, 1004],
+                'loginshell': ['/bin/bash', '/bin/bash', '/bin/sh', '/bin/bash'],
+                'nsaccountlock': [False, True, None, None],
+                'krbpasswordexpiration': [
+                    datetime.datetime(2030, 1, 1),
+                    None,
+                    None,
+                    None,
+                ],
+                'mail': [
+                    None,
+                    ('bob@example.test', 'robert@example.test'),
+                    ('carol@example.test',),
+                    None,
+                ],
+            },
+        )
+
+    def test_dictionary_encoding(self):
+        columns = to_columns(self.entries)
+        shells = columns['loginshell']
+        self.assertEqual(shells.kind, 'category')
+        self.assertEqual(shells.dictionary, ['/bin/bash', '/bin/sh'])
+        self.assertEqual(list(shells.data), [0, 0, 1, 0])
+        # Primary keys are distinct, they are not worth a dictionary.
+        self.assertEqual(columns['uid'].kind, 'string')
+        self.assertEqual(columns['mail'].kind, 'list')
+
+        columns = to_columns(self.entries, max_cardinality=1)
+        self.assertEqual(columns['uid'].kind, 'category')
+
+    def test_fields_and_types(self):
+        columns = Columns(
+            self.entries + [{'uid': ['erin'], 'uidnumber': ['not a number']}],
+            fields=['uidnumber', 'uid', 'employeenumber'],
+            types={'uid': 'list'},
+        )
+        self.assertEqual(columns.column_names, ['uidnumber', 'uid', 'employeenumber'])
+        # Values the kind of a column cannot hold turn it into objects.
+        self.assertEqual(columns['uidnumber'].kind, 'object')
+        self.assertEqual(
+            columns['uidnumber'].to_pylist(), [1001, 1002, None, 1004, 'not a number']
+        )
+        self.assertEqual(columns['uid'].to_pylist()[0], ('alice',))
+        self.assertEqual(columns['employeenumber'].to_pylist(), [None] * 5)
+
+        columns = Columns(fields=['uid'], finish=False)
+        columns.extend(self.entries[:2])
+        columns.extend(self.entries[2:])
+        columns.finish()
+        self.assertEqual(
+            columns.to_pydict(), {'uid': ['alice', 'bob', 'carol', 'dave']}
+        )
+
+    def test_client_streams_columns(self):
+        server = FakeIPA(require_login=False)
+        server.add_users(10)
+        client = ClientMeta('ipa.example.test')
+        server.install(client)
+        sent = sent_options(server, 'user_find')
+
+        columns = client.to_columns('user_find', fields=['uid', 'uidnumber', 'sn'])
+        self.assertEqual(
+            sent[-1], {'all': False, 'no_members': True, 'pkey_only': False}
+        )
+        self.assertEqual(len(columns), 11)
+        self.assertEqual(columns.column_names, ['uid', 'uidnumber', 'sn'])
+        self.assertEqual(columns['uidnumber'].kind, 'int')
+        self.assertEqual(
+            columns.to_pydict()['uid'], ['admin'] + ['user%d' % n for n in range(10)]
+        )
+
+        columns = client.to_columns('user_find', params={'all': True})
+        self.assertEqual(columns['nsaccountlock'].kind, 'bool')
+        self.assertEqual(columns['objectclass'].kind, 'list')
+
+        columns = client.to_columns('user_find', fields='uid')
+        self.assertEqual(
+            sent[-1], {'all': False, 'no_members': True, 'pkey_only': True}
+        )
+        self.assertEqual(len(columns), 11)
+        sent = sent_options(server, 'user_show')
+        columns = client.to_columns('user_show', ['user0'], fields=['uid', 'cn'])
+        self.assertEqual(sent[-1], {'all': True, 'no_members': True})
+        self.assertEqual(columns.to_pydict(), {'uid': ['user0'], 'cn': ['user0 user0']})
+
+    @unittest.skipUnless(importlib.util.find_spec('numpy'), 'numpy is not installed')
+    def test_numpy(self):
+        arrays = to_columns(self.entries).to_numpy()
+        self.assertEqual(arrays['uidnumber'].dtype.name, 'int64')
+        self.assertEqual(arrays['uidnumber'].sum(), 3007)
+        self.assertEqual(
+            list(arrays['loginshell']),
+            ['/bin/bash', '/bin/bash', '/bin/sh', '/bin/bash'],
+        )
+
+    @unittest.skipUnless(importlib.util.find_spec('pandas'), 'pandas is not installed')
+    def test_dataframe(self):
+        frame = to_columns(self.entries).to_dataframe()
+        self.assertEqual(str(frame['uidnumber'].dtype), 'Int64')
+        self.assertEqual(str(frame['loginshell'].dtype), 'category')
+        self.assertEqual(str(frame['nsaccountlock'].dtype), 'boolean')
+        self.assertEqual(frame['uidnumber'].max(), 1004)
+        self.assertEqual(frame['krbpasswordexpiration'][0].year, 2030)
+        self.assertTrue(frame['krbpasswordexpiration'].isna()[1])
+
+    @unittest.skipUnless(
+        importlib.util.find_spec('pyarrow'), 'pyarrow is not installed'
+    )
+    def test_arrow(self):
+        table = to_columns(self.entries).to_arrow()
+        self.assertEqual(table.num_rows, 4)
+        self.assertEqual(str(table.schema.field('uidnumber').type), 'int64')
+        self.assertEqual(
+            table.column('uidnumber').to_pylist(), [1001, 1002, None, 1004]
+        )
+        self.assertTrue(
+            str(table.schema.field('loginshell').type).startswith('dictionary')
+        )
+        self.assertEqual(
+            table.column('uid').to_pylist(), ['alice', 'bob', 'carol', 'dave']
+        )
+
+
+class MapTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeIPA(require_login=False)
+        self.server.add_users(50)
+        self.client = ClientMeta('ipa.example.test')
+        self.server.install(self.client)
+        self.keys = ['user%d' % n for n in range(50)]
+
+    def test_results_in_order(self):
+        results = list(
+            self.client.map('user_show', self.keys + ['nobody'], chunk_size=10)
+        )
+        self.assertEqual([result.key for result in results], self.keys + ['nobody'])
+        self.assertEqual(self.server.calls['batch'], 6)
+        self.assertEqual(self.server.calls['user_show'], 51)
+        self.assertEqual(results[3].result()['result']['uid'], ['user3'])
+        self.assertIsNone(results[3].exception())
+        self.assertIsInstance(results[-1].exception(), NotFound)
+        with self.assertRaises(NotFound):
+            results[-1].result()
+
+    def test_results_as_completed(self):
+        sent = sent_options(self.server, 'user_show')
+        results = self.client.map(
+            'user_show',
+            self.keys,
+            chunk_size=7,
+            concurrency=4,
+            ordered=False,
+            fields=['uid'],
+        )
+        entries = {result.key: result.result()['result'] for result in results}
+        self.assertEqual(set(entries), set(self.keys))
+        self.assertEqual(entries['user7'], {'uid': ['user7']})
+        self.assertEqual(len(sent), 50)
+        self.assertTrue(
+            all(options == {'all': False, 'no_members': True} for options in sent)
+        )
+
+    def test_failed_batches(self):
+        self.server.inject(503, method='batch', count=1)
+        results = list(
+            self.client.map('user_show', self.keys, chunk_size=10, concurrency=1)
+        )
+        self.assertTrue(all(result.exception() for result in results[:10]))
+        self.assertFalse(any(result.exception() for result in results[10:]))
+
+    def test_stopping_early(self):
+        results = self.client.map('user_show', self.keys, chunk_size=5, concurrency=1)
+        self.assertEqual(next(results).key, 'user0')
+        results.close()
+        self.assertLess(self.server.calls['batch'], 10)
+
+    def test_adaptive_concurrency(self):
+        limit = AdaptiveConcurrency(initial=2, maximum=4)
+        for _ in range(10):
+            limit.record(0.01)
+        self.assertEqual(limit.limit, 4)
+        # Latency grows beyond the tolerance, the limit halves once per round.
+        for _ in range(4):
+            limit.record(0.1)
+        self.assertEqual(limit.limit, 2)
+        limit.record(0.1, overloaded=True)
+        self.assertEqual(limit.limit, 1)
+        for _ in range(4):
+            limit.record(0.1, overloaded=True)
+        self.assertEqual(limit.limit, 1)
+        with self.assertRaises(ValueError):
+            AdaptiveConcurrency(minimum=0)
+
+
+class ReconcileTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeIPA(require_login=False)
+        self.server.add_users(10)
+        self.server.add_user('leaver')
+        self.client = ClientMeta('ipa.example.test')
+        self.server.install(self.client)
+        self.client.group_add('staff', o_description='Staff')
+        self.client.group_add('old')
+        self.client.group_add_member('staff', o_user=['user1', 'leaver'])
+        self.desired = {
+            'user': {
+                'user1': {'givenname': 'user1', 'mail': ['user1@example.test']},
+                'alice': {'givenname': 'Alice', 'sn': 'Liddell'},
+            },
+            'group': {
+                'staff': {'description': 'Staff', 'member_user': ['User1', 'alice']},
+                'ops': {'description': 'Ops'},
+            },
+        }
+
+    def test_plan_is_minimal(self):
+        self.server.calls.clear()
+        plan = Reconciler(self.client, prune=['group']).plan(self.desired)
+        self.assertEqual(
+            [(operation.method, operation.key) for operation in plan],
+            [
+                ('user_add', 'alice'),
+                ('group_add', 'ops'),
+                ('user_mod', 'user1'),
+                ('group_remove_member', 'staff'),
+                ('group_add_member', 'staff'),
+                ('group_del', 'old'),
+            ],
+        )
+        self.assertEqual(plan.operations[2].params, {'mail': ['user1@example.test']})
+        self.assertEqual(plan.operations[3].params, {'user': ['leaver']})
+        self.assertEqual(plan.operations[4].params, {'user': ['alice']})
+        # Nothing is written while planning.
+        self.assertEqual(
+            dict(self.server.calls),
+            {
+                'user_find': 1,
+                'user_show': 1,
+                'group_find': 1,
+                'group_show': 1,
+                'batch': 2,
+            },
+        )
+        self.assertEqual(
+            str(plan).splitlines()[-1],
+            '2 to add, 1 to change, 2 membership changes, 1 to delete',
+        )
+        self.assertIn("    mail: None -> ['user1@example.test']", str(plan))
+
+    def test_options_sent(self):
+        user_find = sent_options(self.server, 'user_find')
+        user_show = sent_options(self.server, 'user_show')
+        group_show = sent_options(self.server, 'group_show')
+        Reconciler(self.client).plan(self.desired)
+        self.assertEqual(user_find, [{'sizelimit': 0, 'pkey_only': True}])
+        self.assertEqual(user_show, [{'all': False, 'no_members': True}])
+        # Memberships are only computed when they are reconciled.
+        self.assertEqual(group_show, [{'all': False, 'no_members': False}])
+
+        group_find = sent_options(self.server, 'group_find')
+        Reconciler(self.client, show_ratio=0).plan(self.desired)
+        self.assertEqual(
+            group_find,
+            [
+                {'sizelimit': 0, 'pkey_only': True},
+                {'sizelimit': 0, 'all': False, 'no_members': False, 'pkey_only': False},
+            ],
+        )
+
+    def test_apply(self):
+        plan = reconcile(self.client, self.desired, prune=['group'])
+        self.assertEqual(plan.errors(), [])
+        staff = self.client.group_show('staff')['result']
+        self.assertEqual(sorted(staff['member_user']), ['alice', 'user1'])
+        with self.assertRaises(NotFound):
+            self.client.group_show('old')
+        self.client.group_show('ipausers')
+
+        self.server.calls.clear()
+        self.assertFalse(reconcile(self.client, self.desired, prune=['group']))
+        # Nothing is written once the server is in sync.
+        self.assertEqual(
+            [
+                method
+                for method in self.server.calls
+                if not method.endswith(('_find', '_show')) and method != 'batch'
+            ],
+            [],
+        )
+
+    def test_dry_run_and_errors(self):
+        self.desired['group']['staff']['member_user'].append('nobody')
+        plan = reconcile(self.client, self.desired, dry_run=True)
+        self.assertEqual(self.server.calls['user_add'], 0)
+        self.assertEqual(plan.errors(), [])
+
+        Reconciler(self.client).apply(plan)
+        (failed,) = plan.errors()
+        self.assertEqual(failed.method, 'group_add_member')
+        self.assertEqual(failed.error.failed, {'user': [['nobody', 'no such entry']]})
+        self.assertIn('! nobody: no such entry', str(failed))
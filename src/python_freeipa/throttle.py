@@ -0,0 +1,300 @@
+"""Client-side rate limits and concurrency caps of the requests to each server."""
+
+import asyncio
+import contextlib
+import threading
+import time
+
+from python_freeipa.commands import command_class
+from python_freeipa.exceptions import DeadlineExceeded
+from python_freeipa.retry import time_left
+
+
+class Limit(object):
+    """
+    Limits of the requests of one class of commands to one server.
+    """
+
+    def __init__(self, rate=None, burst=None, max_in_flight=None):
+        """
+        :param rate: requests per second, None for no rate limit
+        :type rate: float or None
+        :param burst: requests that can be sent at once after an idle period,
+                      ``rate`` (at least 1) by default
+        :type burst: int or None
+        :param max_in_flight: requests sent and not yet answered, None for no cap
+        :type max_in_flight: int or None
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError('rate must be positive')
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError('max_in_flight must be at least 1')
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, rate or 0)
+        self.max_in_flight = max_in_flight
+
+    def __repr__(self):
+        return '<Limit rate={0} burst={1} max_in_flight={2}>'.format(
+            self.rate, self.burst, self.max_in_flight
+        )
+
+
+class TokenBucket(object):
+    """
+    Token bucket filled with ``rate`` tokens per second, up to ``burst``.
+
+    Tokens are reserved rather than waited for, so that the caller sleeps the
+    way it likes, ``time.sleep`` or ``asyncio.sleep``, and waiting callers are
+    served in order.
+    """
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, until=None):
+        """
+        Takes a token, returns the delay in seconds before it is available.
+
+        :param until: ``time.monotonic()`` deadline of the request
+        :type until: float or None
+        :raises DeadlineExceeded: if the token is not available before the
+                                  deadline, in which case it is not taken
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            delay = max(0.0, (1 - self._tokens) / self.rate)
+            if until is not None and now + delay > until:
+                raise DeadlineExceeded('Deadline exceeded waiting for the rate limit')
+            self._tokens -= 1
+            return delay
+
+
+class _Unthrottled(object):
+    """
+    Context of the requests that are not throttled, synchronous or not.
+    """
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    async def __aenter__(self):
+        return None
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+UNTHROTTLED = _Unthrottled()
+
+
+class _AsyncLimit(object):
+    """
+    Asynchronous context of a request, entered once the gate lets it be sent.
+    """
+
+    def __init__(self, gate, until):
+        self.gate = gate
+        self.until = until
+
+    async def __aenter__(self):
+        await self.gate.enter_async(self.until)
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.gate.exit_async()
+        return False
+
+
+class _Gate(object):
+    """
+    Rate limit and concurrency cap of one class of commands to one server.
+    """
+
+    def __init__(self, limit):
+        self.bucket = None
+        if limit.rate is not None:
+            self.bucket = TokenBucket(limit.rate, limit.burst)
+        self.max_in_flight = limit.max_in_flight
+        self.semaphore = None
+        if limit.max_in_flight is not None:
+            self.semaphore = threading.BoundedSemaphore(limit.max_in_flight)
+        # The asyncio semaphore is created on first use, within the event loop.
+        self.async_semaphore = None
+        self.in_flight = 0
+        self.requests = 0
+        self.throttled = 0
+        self.waited = 0.0
+        self._lock = threading.Lock()
+
+    def _entered(self, start, throttled):
+        with self._lock:
+            self.in_flight += 1
+            self.requests += 1
+            if throttled:
+                self.throttled += 1
+                self.waited += time.monotonic() - start
+
+    def _exited(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def enter(self, until):
+        start = time.monotonic()
+        throttled = False
+        # The slot is taken before the token, which would be lost if the slot
+        # was not available before the deadline.
+        if self.semaphore is not None and not self.semaphore.acquire(blocking=False):
+            throttled = True
+            if not self.semaphore.acquire(timeout=time_left(until)):
+                raise DeadlineExceeded('Deadline exceeded waiting for a request slot')
+        try:
+            delay = self.bucket.reserve(until) if self.bucket is not None else 0
+            if delay:
+                time.sleep(delay)
+        except BaseException:
+            if self.semaphore is not None:
+                self.semaphore.release()
+            raise
+        self._entered(start, throttled or bool(delay))
+
+    def exit(self):
+        self._exited()
+        if self.semaphore is not None:
+            self.semaphore.release()
+
+    async def enter_async(self, until):
+        start = time.monotonic()
+        throttled = False
+        # See enter for the order of the slot and the token.
+        if self.max_in_flight is not None:
+            if self.async_semaphore is None:
+                self.async_semaphore = asyncio.Semaphore(self.max_in_flight)
+            if self.async_semaphore.locked():
+                throttled = True
+            try:
+                await asyncio.wait_for(self.async_semaphore.acquire(), time_left(until))
+            except asyncio.TimeoutError:
+                raise DeadlineExceeded('Deadline exceeded waiting for a request slot')
+        try:
+            delay = self.bucket.reserve(until) if self.bucket is not None else 0
+            if delay:
+                await asyncio.sleep(delay)
+        except BaseException:
+            if self.async_semaphore is not None:
+                self.async_semaphore.release()
+            raise
+        self._entered(start, throttled or bool(delay))
+
+    def exit_async(self):
+        self._exited()
+        if self.async_semaphore is not None:
+            self.async_semaphore.release()
+
+
+class Throttle(object):
+    """
+    Rate limits and concurrency caps of the requests to each server, by class
+    of command, so that bursts of calls do not saturate the directory server
+    behind IPA.
+
+    Each server gets its own token bucket and in-flight cap for each class of
+    command. Commands are classified by ``python_freeipa.commands.command_class``
+    as ``read``, ``write`` or ``expensive`` (``automember_rebuild``,
+    ``cert_request``...), and calls of classes without a limit are not
+    throttled::
+
+        throttle = Throttle({
+            'read': Limit(rate=200, max_in_flight=16),
+            'write': Limit(rate=20, burst=5, max_in_flight=4),
+            'expensive': Limit(max_in_flight=1),
+        })
+        client = ClientMeta('ipa.example.test', throttle=throttle)
+
+    Share one throttle between the clients of all workers of a process to cap
+    their total load. The caps of threads and of asyncio tasks are counted
+    separately, and the ones of asyncio tasks must all run in one event loop.
+    """
+
+    def __init__(self, limits=None, classify=command_class):
+        """
+        :param limits: limits by class of command
+        :type limits: dict of str and ``Limit``
+        :param classify: function of the method and arguments of a call,
+                         returning its class
+        :type classify: callable
+        """
+        self.limits = dict(limits or {})
+        self.classify = classify
+        # (host, class) -> _Gate
+        self._gates = {}
+        self._lock = threading.Lock()
+
+    def _gate(self, host, kind):
+        gate = self._gates.get((host, kind))
+        if gate is None:
+            limit = self.limits.get(kind)
+            if limit is None:
+                return None
+            with self._lock:
+                gate = self._gates.setdefault((host, kind), _Gate(limit))
+        return gate
+
+    @contextlib.contextmanager
+    def limit(self, host, kind, until=None):
+        """
+        Context of a request of class kind to host, entered once the request can
+        be sent without exceeding the limits.
+
+        :param until: ``time.monotonic()`` deadline of the request
+        :type until: float or None
+        :raises DeadlineExceeded: if the request cannot be sent before the
+                                  deadline
+        """
+        gate = self._gate(host, kind)
+        if gate is None:
+            yield
+            return
+        gate.enter(until)
+        try:
+            yield
+        finally:
+            gate.exit()
+
+    def limit_async(self, host, kind, until=None):
+        """
+        Asynchronous version of ``limit``, used with ``async with``.
+        """
+        gate = self._gate(host, kind)
+        if gate is None:
+            return UNTHROTTLED
+        return _AsyncLimit(gate, until)
+
+    def stats(self):
+        """
+        Returns the state of the limits of each server and class of command.
+
+        :return: ``in_flight`` requests, total ``requests``, number of requests
+                 ``throttled`` and seconds they ``waited``, by host and class
+        :rtype: dict of tuple and dict
+        """
+        with self._lock:
+            gates = list(self._gates.items())
+        return {
+            key: {
+                'in_flight': gate.in_flight,
+                'requests': gate.requests,
+                'throttled': gate.throttled,
+                'waited': gate.waited,
+            }
+            for key, gate in gates
+        }